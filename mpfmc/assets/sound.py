@@ -1,12 +1,13 @@
 # pylint: disable=too-many-lines
 """Contains sound-related asset classes used by the audio system"""
 
+import itertools
 import logging
 import sys
 import uuid
 import weakref
 from enum import Enum, unique
-from typing import Optional, Union
+from typing import List, Optional, Union
 
 
 from mpf.core.assets import AssetPool
@@ -42,6 +43,7 @@ class SoundPool(AssetPool):
         self._simultaneous_limit = None
         self._stealing_method = SoundStealingMethod.oldest
         self._key = None
+        self._instance_settings = dict()
         self.log = logging.getLogger('SoundPool')
 
         config.setdefault('track', None)
@@ -138,6 +140,15 @@ class SoundPool(AssetPool):
 
         return self._stealing_method
 
+    def get_instance_settings(self, sound: "SoundAsset") -> "SoundInstanceSettings":
+        """Return the default settings shared by the instances of a sound played from the pool"""
+        try:
+            return self._instance_settings[sound.id]
+        except KeyError:
+            settings = SoundInstanceSettings(self, sound)
+            self._instance_settings[sound.id] = settings
+            return settings
+
     def play(self, context=None, settings=None):
         """
         Plays the sound pool on the track specified in the settings.
@@ -240,6 +251,7 @@ class SoundAsset(McAsset):
         self._container = None  # holds the actual sound samples in memory
         self._ducking = None
         self._key = None
+        self._instance_settings = None
         self.log = logging.getLogger('SoundAsset')
 
         config.setdefault('track', None)
@@ -537,6 +549,13 @@ class SoundAsset(McAsset):
         """Return the unique key value for this sound"""
         return self._key
 
+    @property
+    def instance_settings(self) -> "SoundInstanceSettings":
+        """The default settings shared by the instances of this sound"""
+        if self._instance_settings is None:
+            self._instance_settings = SoundInstanceSettings(self, self)
+        return self._instance_settings
+
     def create_instance(self, context: Optional[str] = None, settings: Optional[dict] = None) -> "SoundInstance":
         """Creates a new SoundInstance."""
         return SoundInstance(self, context, settings)
@@ -594,7 +613,8 @@ class SoundAsset(McAsset):
                 self._container = self.machine.sound_system.audio_interface.load_sound_file_for_streaming(self.file)
             else:
                 self.log.debug("Sound %s loading to memory", self.name)
-                self._container = self.machine.sound_system.audio_interface.load_sound_file_to_memory(self.file)
+                self._container = self.machine.sound_system.audio_interface.load_sound_file_to_memory(
+                    self.machine.sound_system.normalized_sounds.get_file_name(self.file))
 
         except AudioException as exception:
             self.log.error("Load sound %s failed due to an exception - %s",
@@ -686,19 +706,119 @@ class SoundInstanceStatus(Enum):
     finished = 3
 
 
+class SoundInstanceSettings:
+    """The playback settings of a sound instance (the settings which may be overridden
+    when the sound is played).
+
+    The default settings of a sound are created once and are shared by reference by all
+    the instances of the sound which do not override any setting, so they must never be
+    modified. An instance which overrides settings gets its own copy.
+    """
+
+    __slots__ = ["track", "key", "simultaneous_limit", "stealing_method", "loops", "volume", "pan",
+                 "priority", "start_at", "fade_in", "fade_out", "about_to_finish_time", "max_queue_time",
+                 "events_when_played", "events_when_stopped", "events_when_looping",
+                 "events_when_about_to_finish", "mode_end_action"]
+
+    def __init__(self, sound: Union[SoundAsset, SoundPool], sound_asset: SoundAsset) -> None:    # noqa
+        """Create the default settings of a sound asset (optionally played from a sound pool)."""
+        # Track, key and the simultaneous limit come from the SoundAsset or SoundPool class
+        self.track = sound.track
+        self.key = sound.key
+        self.simultaneous_limit = sound.simultaneous_limit
+        self.stealing_method = sound.stealing_method
+
+        # All other settings come from the sound asset
+        self.loops = sound_asset.loops
+        self.volume = sound_asset.volume
+        self.pan = 0
+        self.priority = sound_asset.priority
+        self.start_at = sound_asset.start_at
+        self.fade_in = sound_asset.fade_in
+        self.fade_out = sound_asset.fade_out
+        self.about_to_finish_time = sound_asset.about_to_finish_time
+        self.max_queue_time = sound_asset.max_queue_time
+        self.events_when_played = sound_asset.events_when_played
+        self.events_when_stopped = sound_asset.events_when_stopped
+        self.events_when_looping = sound_asset.events_when_looping
+        self.events_when_about_to_finish = sound_asset.events_when_about_to_finish
+        self.mode_end_action = sound_asset.mode_end_action
+
+    def copy(self) -> "SoundInstanceSettings":
+        """Return a copy of the settings (used to override settings)."""
+        settings = SoundInstanceSettings.__new__(SoundInstanceSettings)
+        for name in SoundInstanceSettings.__slots__:
+            setattr(settings, name, getattr(self, name))
+        return settings
+
+    def override(self, settings: dict) -> "SoundInstanceSettings":
+        """Return the settings with the overridden values in a settings dictionary applied.
+
+        The settings themselves are returned (and not copied) if no value is overridden.
+        """
+        overrides = dict()
+
+        # TODO: Implement parameter validation for overridden parameters
+        for name in ('track', 'loops', 'volume', 'pan', 'priority', 'start_at', 'fade_in', 'fade_out'):
+            if settings.get(name):
+                overrides[name] = settings[name]
+
+        for name in ('about_to_finish_time', 'max_queue_time'):
+            if settings.get(name, -1) != -1:
+                overrides[name] = settings[name]
+
+        for name in ('events_when_played', 'events_when_stopped', 'events_when_looping',
+                     'events_when_about_to_finish'):
+            if settings.get(name, ['use_sound_setting']) != ['use_sound_setting']:
+                overrides[name] = settings[name]
+
+        if settings.get('mode_end_action', 'use_sound_setting') != 'use_sound_setting':
+            action = str(settings['mode_end_action']).lower()
+            if action == 'stop':
+                overrides['mode_end_action'] = ModeEndAction.stop
+            elif action == 'stop_looping':
+                overrides['mode_end_action'] = ModeEndAction.stop_looping
+
+        if settings.get('key', 'use_sound_setting') != 'use_sound_setting':
+            overrides['key'] = settings['key']
+
+        if not overrides:
+            return self
+
+        instance_settings = self.copy()
+        for name, value in overrides.items():
+            setattr(instance_settings, name, value)
+        return instance_settings
+
+
 # pylint: disable=too-many-public-methods
 class SoundInstance:
     """An instance of a playing sound asset. This class is essentially a wrapper container
     for sound assets that contains all the overridden parameter values for playback."""
 
+    __slots__ = ["mc", "_pool", "_id", "_timestamp", "_context", "_status", "_played", "_loop_count",
+                 "_finished_handlers", "_sound_id", "_sound", "_settings", "_exp_time"]
+
+    log = logging.getLogger('SoundInstance')
+
+    # Source of the unique instance ids (a reused instance gets a new id every time)
+    _next_id = itertools.count(1)
+
     def __init__(self, sound: Union[SoundAsset, SoundPool],     # noqa
                  context: Optional[str] = None, settings: Optional[dict] = None):
         """Construct sound instance."""
+        self._pool = None
+        self._init(sound, context, settings)
+
+    def _init(self, sound: Union[SoundAsset, SoundPool],     # noqa
+              context: Optional[str] = None, settings: Optional[dict] = None):
+        """Initialize the sound instance (also used when a pooled instance is reused)."""
         if sound is None:
             raise ValueError("Cannot create sound instance: sound parameter is None")
 
         # pylint: disable=invalid-name
         self.mc = sound.machine
+        self._id = next(SoundInstance._next_id)
         self._timestamp = self.mc.clock.get_time()
 
         if context and isinstance(context, str):
@@ -707,102 +827,26 @@ class SoundInstance:
             self._context = None
 
         self._status = SoundInstanceStatus.pending
-        self._pan = 0
         self._played = False
         self._loop_count = 0
-        self._registered_finished_handlers = list()
-        self.log = logging.getLogger('SoundInstance')
+        self._finished_handlers = None
         self._sound_id = sound.id
+        self._exp_time = None
 
         # The underlying sound must be accessed differently for SoundAsset objects
         # (just use the object itself) and SoundPool object (retrieve the next
-        # SoundAsset object in the pool).
+        # SoundAsset object in the pool). The default settings are shared by all
+        # instances of the sound.
         if isinstance(sound, SoundAsset):
             self._sound = sound
+            self._settings = sound.instance_settings
         elif isinstance(sound, SoundPool):
             self._sound = sound.sound
-
-        # Simultaneous limit comes from the SoundAsset or SoundPool class and may not
-        # be overridden
-        self._simultaneous_limit = sound.simultaneous_limit
-        self._stealing_method = sound.stealing_method
-        self._markers = self._sound.markers
-        self._exp_time = None
-
-        # Assign default values from parent sound for parameters that can be overridden
-        self._track = sound.track
-        self._loops = self._sound.loops
-        self._volume = self._sound.volume
-        self._priority = self._sound.priority
-        self._start_at = self._sound.start_at
-        self._fade_in = self._sound.fade_in
-        self._fade_out = self._sound.fade_out
-        self._about_to_finish_time = self._sound.about_to_finish_time
-        self._max_queue_time = self._sound.max_queue_time
-        self._events_when_played = self._sound.events_when_played
-        self._events_when_stopped = self._sound.events_when_stopped
-        self._events_when_looping = self._sound.events_when_looping
-        self._events_when_about_to_finish = self._sound.events_when_about_to_finish
-        self._mode_end_action = self._sound.mode_end_action
-        self._key = sound.key
-
-        if settings is None:
-            settings = dict()
-
-        # TODO: Implement parameter validation for overridden parameters
+            self._settings = sound.get_instance_settings(self._sound)
 
         # Assign any overridden parameter values
-        if settings.get('track'):
-            self._track = settings['track']
-
-        if settings.get('loops'):
-            self._loops = settings['loops']
-
-        if settings.get('volume'):
-            self._volume = settings['volume']
-
-        if settings.get('pan'):
-            self._pan = settings['pan']
-
-        if settings.get('priority'):
-            self._priority = settings['priority']
-
-        if settings.get('start_at'):
-            self._start_at = settings['start_at']
-
-        if settings.get('fade_in'):
-            self._fade_in = settings['fade_in']
-
-        if settings.get('fade_out'):
-            self._fade_out = settings['fade_out']
-
-        if settings.get('about_to_finish_time', -1) != -1:
-            self._about_to_finish_time = settings['about_to_finish_time']
-
-        if settings.get('max_queue_time', -1) != -1:
-            self._max_queue_time = settings['max_queue_time']
-
-        if settings.get('events_when_played', ['use_sound_setting']) != ['use_sound_setting']:
-            self._events_when_played = settings['events_when_played']
-
-        if settings.get('events_when_stopped', ['use_sound_setting']) != ['use_sound_setting']:
-            self._events_when_stopped = settings['events_when_stopped']
-
-        if settings.get('events_when_looping', ['use_sound_setting']) != ['use_sound_setting']:
-            self._events_when_looping = settings['events_when_looping']
-
-        if settings.get('events_when_about_to_finish', ['use_sound_setting']) != ['use_sound_setting']:
-            self._events_when_about_to_finish = settings['events_when_about_to_finish']
-
-        if settings.get('mode_end_action', 'use_sound_setting') != 'use_sound_setting':
-            action = str(settings['mode_end_action']).lower()
-            if action == 'stop':
-                self._mode_end_action = ModeEndAction.stop
-            elif action == 'stop_looping':
-                self._mode_end_action = ModeEndAction.stop_looping
-
-        if settings.get('key', 'use_sound_setting') != 'use_sound_setting':
-            self._key = settings['key']
+        if settings:
+            self._settings = self._settings.override(settings)
 
     def __repr__(self):
         """String that's returned if someone prints this object"""
@@ -829,14 +873,15 @@ class SoundInstance:
     @property
     def id(self):
         """
-        The id property contains a unique identifier for the sound reference(based on the Python
-        id() function).  This id is used in the audio interface to uniquely identify a sound
-        instance (rather than the name) due to the hassle of passing strings between Python and
-        Cython.
+        The id property contains a unique identifier for the sound reference.  This id is used
+        in the audio interface to uniquely identify a sound instance (rather than the name) due
+        to the hassle of passing strings between Python and Cython.  Ids are never reused, so
+        notifications for an instance that has finished cannot be mistaken for a later sound
+        that reuses the same (pooled) instance object.
         Return:
             An integer uniquely identifying the sound reference
         """
-        return id(self)
+        return self._id
 
     @property
     def timestamp(self):
@@ -887,43 +932,43 @@ class SoundInstance:
     @property
     def track(self):
         """The audio track name on which to play the sound"""
-        return self._track
+        return self._settings.track
 
     @property
     def volume(self):
         """Return the volume of the sound (float 0.0 to 1.0)"""
-        return self._volume
+        return self._settings.volume
 
     @property
     def pan(self):
         """Return the pan setting of the sound (float -1.0 to 1.0)"""
-        return self._pan
+        return self._settings.pan
 
     @property
     def priority(self):
         """Return the priority of the sound"""
-        return self._priority
+        return self._settings.priority
 
     @property
     def max_queue_time(self):
         """Return the maximum time a sound may be queued before
         playing or being discarded"""
-        return self._max_queue_time
+        return self._settings.max_queue_time
 
     @property
     def start_at(self):
         """Return the start at time for the sound (in seconds)"""
-        return self._start_at
+        return self._settings.start_at
 
     @property
     def fade_in(self):
         """Return the fade in time for the sound (in seconds)"""
-        return self._fade_in
+        return self._settings.fade_in
 
     @property
     def fade_out(self):
         """Return the fade out time for the sound (in seconds)"""
-        return self._fade_out
+        return self._settings.fade_out
 
     @property
     def about_to_finish_time(self):
@@ -931,67 +976,67 @@ class SoundInstance:
         Return the time before the end when an about to finish marker will be generated (in seconds).
         If set to None, no about to finish marker will be generated.
         """
-        return self._about_to_finish_time
+        return self._settings.about_to_finish_time
 
     @property
     def loops(self):
         """Return the looping setting for the sound.
         0 - do not loop, -1 loop infinitely, >= 1 the number of
         times to loop."""
-        return self._loops
+        return self._settings.loops
 
     @property
     def simultaneous_limit(self):
         """Return the maximum number of instances of the sound that may be
         played simultaneously"""
-        return self._simultaneous_limit
+        return self._settings.simultaneous_limit
 
     @property
     def stealing_method(self):
         """Return the method used when stealing a sound instance (when a new sound
         instance is requested but the maximum number of instances has currently
         been reached)."""
-        return self._stealing_method
+        return self._settings.stealing_method
 
     @property
     def events_when_played(self):
         """Return the list of events that are posted when the sound is played"""
-        return self._events_when_played
+        return self._settings.events_when_played
 
     @property
     def events_when_stopped(self):
         """Return the list of events that are posted when the sound is stopped"""
-        return self._events_when_stopped
+        return self._settings.events_when_stopped
 
     @property
     def events_when_looping(self):
         """Return the list of events that are posted when the sound begins a new loop"""
-        return self._events_when_looping
+        return self._settings.events_when_looping
 
     @property
     def events_when_about_to_finish(self):
         """Return the list of events that are posted when the sound is about to finish"""
-        return self._events_when_about_to_finish
+        return self._settings.events_when_about_to_finish
 
     @property
     def mode_end_action(self):
         """Return the action to take when the owning mode (context) ends"""
-        return self._mode_end_action
+        return self._settings.mode_end_action
 
     @property
     def stop_on_mode_end(self):
         """Return whether or not the sound should stop immediately upon mode end"""
-        return self._mode_end_action == ModeEndAction.stop
+        return self._settings.mode_end_action == ModeEndAction.stop
 
     @property
     def markers(self):
         """Return the list of marker dictionary objects for the sound"""
-        return self._markers
+        return self._sound.markers
 
     @property
     def marker_count(self):
         """Return the number of markers specified for the sound"""
-        return len(self._markers)
+        return len(self._sound.markers)
 
     @property
     def container(self):
@@ -1011,7 +1056,7 @@ class SoundInstance:
     @property
     def key(self):
         """Return the unique key value for this sound instance"""
-        return self._key
+        return self._settings.key
 
     @property
     def queued(self):
@@ -1109,7 +1154,7 @@ class SoundInstance:
         """Notifies the sound instance that the specified marker has just been reached
         during playback and triggers any corresponding actions."""
         try:
-            marker = self._markers[marker_id]
+            marker = self._sound.markers[marker_id]
         except ValueError:
             self.log.warning("An invalid marker ID was received: %d", marker_id)
             return
@@ -1148,8 +1193,11 @@ class SoundInstance:
 
         # A 'handler' in our case is a tuple with 4 elements:
         # the handler method, priority, dict of kwargs, & uuid key
+        # (the handler list is only created once a handler is registered)
+        if self._finished_handlers is None:
+            self._finished_handlers = list()
 
-        self._registered_finished_handlers.append((handler, priority, kwargs, key))
+        self._finished_handlers.append((handler, priority, kwargs, key))
         try:
             self.log.debug("Registered %s as a finished handler for sound '%s', priority: %s, "
                            "kwargs: %s",
@@ -1160,7 +1208,7 @@ class SoundInstance:
         # Sort the handlers for this event based on priority. We do it now
         # so the list is pre-sorted so we don't have to do that with each
         # event post.
-        self._registered_finished_handlers.sort(key=lambda x: x[1], reverse=True)
+        self._finished_handlers.sort(key=lambda x: x[1], reverse=True)
 
         return key
 
@@ -1170,9 +1218,12 @@ class SoundInstance:
         Args:
             key: The key of the handler you want to remove
         """
-        for handler in self._registered_finished_handlers:
+        if self._finished_handlers is None:
+            return
+
+        for handler in list(self._finished_handlers):
             if handler[3] == key:
-                self._registered_finished_handlers.remove(handler)
+                self._finished_handlers.remove(handler)
                 self.log.debug("Removing finished handler method %s from sound %s",
                                (str(handler[0]).split(' '))[2], self.name)
 
@@ -1181,11 +1232,18 @@ class SoundInstance:
         self._status = SoundInstanceStatus.finished
 
         # Call any registered finished handlers
-        for handler in self._registered_finished_handlers:
-            merged_kwargs = dict(list(handler[2].items()))
-            merged_kwargs['sound_instance'] = self
+        if self._finished_handlers is not None:
+            for handler in self._finished_handlers:
+                merged_kwargs = dict(list(handler[2].items()))
+                merged_kwargs['sound_instance'] = self
+
+                handler[0](**merged_kwargs)
 
-            handler[0](**merged_kwargs)
+        # Return the instance to its pool (it is only reused once nothing references it anymore)
+        pool = self._pool
+        if pool is not None:
+            self._pool = None
+            pool.release(self)
 
     @property
     def status(self):
@@ -1208,11 +1266,92 @@ class SoundInstance:
         return self._loop_count
 
 
+def _refcount(items: list, index: int) -> int:
+    return sys.getrefcount(items[index])
+
+
+# The reference count of an object which is only referenced by a list
+_UNREFERENCED_REFCOUNT = _refcount([object()], 0)
+
+
+class SoundInstancePool:
+    """Free list of sound instances which are reused once they have finished.
+
+    Busy tracks create a sound instance for every sound that is played. A finished
+    instance is retired to the pool and is only reused for a later sound once nothing
+    else references it anymore (posted events, the sound queue, config players and
+    playlists may keep finished instances around for a while). Retired instances which
+    are still referenced once the pool holds max_retired of them are simply dropped.
+    """
+
+    __slots__ = ["size", "max_retired", "_free", "_retired", "created", "reused", "dropped"]
+
+    def __init__(self, size: int = 32, max_retired: int = 256) -> None:
+        self.size = size
+        self.max_retired = max_retired
+        self._free = list()         # type: List[SoundInstance]
+        self._retired = list()      # type: List[SoundInstance]
+        self.created = 0
+        self.reused = 0
+        self.dropped = 0
+
+    def acquire(self, sound: Union[SoundAsset, SoundPool],     # noqa
+                context: Optional[str] = None, settings: Optional[dict] = None) -> SoundInstance:
+        """Return a sound instance of a sound (a reused instance if one is available)."""
+        if not self._free and self._retired:
+            self._collect()
+
+        if self._free:
+            sound_instance = self._free.pop()
+            sound_instance._init(sound, context, settings)    # pylint: disable-msg=protected-access
+            self.reused += 1
+        else:
+            sound_instance = SoundInstance(sound, context, settings)
+            self.created += 1
+
+        sound_instance._pool = self    # pylint: disable-msg=protected-access
+        return sound_instance
+
+    def release(self, sound_instance: SoundInstance) -> None:
+        """Retire a finished sound instance."""
+        self._retired.append(sound_instance)
+        if len(self._retired) > self.max_retired:
+            self._collect()
+            if len(self._retired) > self.max_retired:
+                self.dropped += len(self._retired) - self.max_retired
+                del self._retired[:len(self._retired) - self.max_retired]
+
+    def _collect(self) -> None:
+        """Move the retired instances which are no longer referenced to the free list."""
+        retired = self._retired
+        self._retired = list()
+        for index in range(len(retired)):
+            if _refcount(retired, index) > _UNREFERENCED_REFCOUNT:
+                self._retired.append(retired[index])
+            elif len(self._free) < self.size:
+                self._free.append(retired[index])
+
+    def clear(self) -> None:
+        """Remove all instances from the pool."""
+        self._free.clear()
+        self._retired.clear()
+
+    def get_stats(self) -> dict:
+        """Return pool statistics."""
+        return dict(free=len(self._free),
+                    retired=len(self._retired),
+                    created=self.created,
+                    reused=self.reused,
+                    dropped=self.dropped)
+
+
 class DuckingSettings:
     """ DuckingSettings contains the parameters needed to control audio ducking
     for a sound.
     """
 
+    __slots__ = ["_targets", "_track_bit_mask", "_delay", "_attack", "_attenuation", "_release_point", "_release"]
+
     def __init__(self, mc, config):
         """
         Constructor
@@ -0,0 +1,76 @@
+import statistics
+import time
+
+from kivy.graphics.opengl import glFinish
+
+from mpfmc.tests.MpfMcTestCase import MpfMcTestCase
+
+
+class MpfMcBenchmarkCase(MpfMcTestCase):
+
+    """Measures the per-frame cost of scripted scenarios on virtual time.
+
+    A scenario is a list of (time, action) tuples. Actions are event names
+    (which are posted) or callables (which are called) and run at the
+    beginning of the first frame at or after their time. The virtual clock
+    advances exactly one frame per step so every run processes the same
+    frames regardless of the machine's speed and only the time spent per
+    frame is measured.
+    """
+
+    def _output(self, what, stats):
+        print("{}: {} frames. CPU time {:.3f}ms per frame. Frame time mean {:.3f}ms, "
+              "median {:.3f}ms, p95 {:.3f}ms, max {:.3f}ms".format(
+                  what, stats['frames'], stats['cpu_per_frame'] * 1000, stats['mean'] * 1000,
+                  stats['median'] * 1000, stats['p95'] * 1000, stats['max'] * 1000))
+
+    @staticmethod
+    def _skip_draw(*args):
+        # stops the on_draw dispatch before the window draws its canvas
+        del args
+        return True
+
+    def run_scenario(self, name, script, duration, draw=True):
+        """Run a scripted scenario for duration (virtual) seconds and return frame statistics.
+
+        With draw the window is drawn by the event loop whenever its canvas
+        changed (as in a real run) and the time until the GPU finished the
+        frame is included. Without draw the window is never drawn.
+        """
+        from kivy.core.window import Window
+        script = sorted(script, key=lambda entry: entry[0])
+        if not draw:
+            Window.fbind('on_draw', self._skip_draw)
+        start = self.clock.current_time
+        end = start + duration
+
+        frame_times = list()
+        cpu_start = time.process_time()
+        while self.clock.current_time < end:
+            frame_start = time.perf_counter()
+            while script and start + script[0][0] <= self.clock.current_time:
+                action = script.pop(0)[1]
+                if callable(action):
+                    action()
+                else:
+                    self.mc.events.post(action)
+
+            # the event loop draws the window during the step
+            self.clock.step()
+            if draw:
+                glFinish()
+            frame_times.append(time.perf_counter() - frame_start)
+        cpu_time = time.process_time() - cpu_start
+
+        if not draw:
+            Window.funbind('on_draw', self._skip_draw)
+
+        frame_times.sort()
+        stats = dict(frames=len(frame_times),
+                     cpu_per_frame=cpu_time / len(frame_times),
+                     mean=statistics.mean(frame_times),
+                     median=statistics.median(frame_times),
+                     p95=frame_times[int(len(frame_times) * .95)],
+                     max=frame_times[-1])
+        self._output(name, stats)
+        return stats
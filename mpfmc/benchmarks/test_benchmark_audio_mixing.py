@@ -0,0 +1,21 @@
+import unittest
+
+try:
+    from mpfmc.core.audio.track import benchmark_mix_bus
+except ImportError:
+    benchmark_mix_bus = None
+
+
+@unittest.skipIf(benchmark_mix_bus is None, "Audio library is not available")
+class BenchmarkAudioMixing(unittest.TestCase):
+
+    def _output(self, track_count, buffer_samples, duration):
+        print("Mixing {} tracks ({} samples): {:.5f}ms per buffer ({:.2f}% of the buffer duration at 44.1kHz)".format(
+            track_count, buffer_samples, 1000 * duration, 100 * duration / (buffer_samples / 44100)))
+
+    def testMixBus(self):
+        for buffer_samples in (1024, 2048):
+            for track_count in (8, 16, 32):
+                duration = benchmark_mix_bus(track_count, buffer_samples=buffer_samples, channels=2,
+                                             iterations=1000)
+                self._output(track_count, buffer_samples, duration)
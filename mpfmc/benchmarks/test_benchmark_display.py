@@ -0,0 +1,64 @@
+import time
+
+from kivy.graphics.opengl import glFinish
+
+from mpfmc.tests.MpfMcTestCase import MpfMcTestCase
+
+
+class BenchmarkDisplay(MpfMcTestCase):
+
+    def get_machine_path(self):
+        return 'benchmarks/machine_files/display/'
+
+    def get_config_file(self):
+        return 'config.yaml'
+
+    def _output(self, what, cpu_time, draw_time, num):
+        print("{}: CPU time {:.5f}ms per frame. Draw time (until glFinish) {:.5f}ms per frame".format(
+            what,
+            (1000 * cpu_time / num),
+            (1000 * draw_time / num)
+        ))
+
+    @staticmethod
+    def _skip_draw(*args):
+        # stops the on_draw dispatch before the window draws its canvas
+        del args
+        return True
+
+    def _render(self, slide, frames):
+        """Show a DMD slide at 60fps and return the CPU time and the time to draw the window."""
+        from kivy.core.window import Window
+        self.mc.events.post(slide)
+        self.advance_time()
+
+        cpu_time = 0
+        draw_time = 0
+        for _ in range(frames):
+            # the event loop would draw the window as well. only time the draw below.
+            Window.fbind('on_draw', self._skip_draw)
+            start = time.process_time()
+            self.advance_time(1 / 60)
+            cpu_time += time.process_time() - start
+            Window.funbind('on_draw', self._skip_draw)
+
+            # glFinish waits until the GPU rendered the frame
+            start = time.perf_counter()
+            Window.dispatch('on_draw')
+            glFinish()
+            draw_time += time.perf_counter() - start
+
+        return cpu_time, draw_time
+
+    def testColorDmdSizes(self):
+        self.mc.events.post('dmd_slide')
+        self.advance_time()
+
+        frames = 300
+        for native_resolution in (False, True):
+            self.mc.machine_config['mpf-mc']['display_native_resolution'] = native_resolution
+            for width in (256, 640, 1280, 1920):
+                cpu_time, draw_time = self._render('dmd_{}'.format(width), frames)
+                self._output("{}x{} color DMD ({} resolution)".format(
+                    width, width // 4, "native" if native_resolution else "output"),
+                    cpu_time, draw_time, frames)
@@ -0,0 +1,23 @@
+from mpfmc.benchmarks.MpfMcBenchmarkCase import MpfMcBenchmarkCase
+
+
+class BenchmarkScenario(MpfMcBenchmarkCase):
+
+    def get_machine_path(self):
+        return 'benchmarks/machine_files/scenario/'
+
+    def get_config_file(self):
+        return 'config.yaml'
+
+    def _set_score(self, score):
+        return lambda: self.mc.set_machine_var('score', score)
+
+    def testAttractMode(self):
+        self.run_scenario("Attract mode", [(0, 'show_attract')], 10)
+
+    def testGame(self):
+        script = [(0, 'show_attract'), (2, 'show_game')]
+        # a score update every 100ms and a jackpot every 5s
+        script.extend((2 + i / 10, self._set_score(i * 1000)) for i in range(200))
+        script.extend((5 + i * 5, 'show_jackpot') for i in range(4))
+        self.run_scenario("Game", script, 22)
@@ -0,0 +1,89 @@
+import time
+import tracemalloc
+
+from mpfmc.tests.MpfMcTestCase import MpfMcTestCase
+
+try:
+    from mpfmc.core.audio import SoundSystem
+    from mpfmc.assets.sound import SoundInstance, SoundInstancePool
+except ImportError:
+    SoundSystem = None
+    SoundInstance = None
+    SoundInstancePool = None
+
+
+class BenchmarkSoundInstances(MpfMcTestCase):
+
+    def get_machine_path(self):
+        return 'tests/machine_files/audio'
+
+    def get_config_file(self):
+        return 'test_audio.yaml'
+
+    def setUp(self):
+        super().setUp()
+        if SoundSystem is None or self.mc.sound_system is None or self.mc.sound_system.audio_interface is None:
+            self.skipTest("Sound system is not enabled")
+
+    def _output(self, what, start, end, num, allocated):
+        print("{}: Duration {:.5f}ms per sound. CPU time {:.5f}s. {:.0f} bytes allocated per sound".format(
+            what,
+            (1000 * (end - start) / num),
+            end - start,
+            allocated / num
+        ))
+
+    def testAllocateSoundInstances(self):
+        sound = self.mc.sounds['210871_synthping']
+        settings = {'volume': 0.25, 'priority': 0, 'max_queue_time': None}
+        num = 20000
+
+        tracemalloc.start()
+        start = time.process_time()
+        instances = [SoundInstance(sound, 'mode1') for _ in range(num)]
+        end = time.process_time()
+        allocated = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        self._output("Sound instances (shared settings)", start, end, num, allocated)
+        del instances
+
+        tracemalloc.start()
+        start = time.process_time()
+        instances = [SoundInstance(sound, 'mode1', settings) for _ in range(num)]
+        end = time.process_time()
+        allocated = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        self._output("Sound instances (overridden settings)", start, end, num, allocated)
+        del instances
+
+        pool = SoundInstancePool()
+        tracemalloc.start()
+        start = time.process_time()
+        for _ in range(num):
+            pool.acquire(sound, 'mode1', settings).set_canceled()
+        end = time.process_time()
+        allocated = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        self._output("Pooled sound instances (overridden settings)", start, end, num, allocated)
+        print("Sound instance pool: {}".format(pool.get_stats()))
+
+    def testRapidFireSoundPlayer(self):
+        track = self.mc.sound_system.audio_interface.get_track_by_name("sfx")
+        self.advance_time(1)
+
+        # Three sounds per frame at 60fps (the sfx track plays 8 sounds simultaneously
+        # and replaces the oldest instance once the simultaneous limit is reached)
+        frames = 600
+        tracemalloc.start()
+        start = time.process_time()
+        for _ in range(frames):
+            self.mc.events.post('play_sound_synthping')
+            self.mc.events.post('play_sound_drum_group')
+            self.mc.events.post('play_sound_synthping')
+            self.advance_time(1 / 60)
+        end = time.process_time()
+        allocated = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        self._output("Rapid-fire sound_player events", start, end, 3 * frames, allocated)
+        print("Sound instance pool: {}".format(track.get_sound_instance_pool_stats()))
@@ -0,0 +1,48 @@
+import time
+
+from mpfmc.tests.MpfMcTestCase import MpfMcTestCase
+from mpfmc.uix.glyph_cache import GlyphCache
+
+
+class BenchmarkText(MpfMcTestCase):
+
+    def get_machine_path(self):
+        return 'benchmarks/machine_files/text/'
+
+    def get_config_file(self):
+        return 'config.yaml'
+
+    def _output(self, what, start, end, num):
+        print("{}: Duration {:.5f}ms per frame. CPU time {:.5f}s".format(
+            what,
+            (1000 * (end - start) / num),
+            end - start
+        ))
+
+    def _rolling_score(self, frames):
+        """Roll a score counter at 60fps and return the CPU time used."""
+        self.mc.player.score = 0
+        self.mc.events.post('score_counter')
+        self.advance_time()
+
+        start = time.process_time()
+        for _ in range(frames):
+            self.mc.player.score += 1370
+            self.advance_time(1 / 60)
+        return start, time.process_time()
+
+    def testRollingScore(self):
+        self.mc.game_start()
+        self.mc.add_player(1)
+        self.mc.player_start_turn(1)
+        self.advance_time()
+
+        frames = 600
+        self.mc.glyph_cache = None
+        start, end = self._rolling_score(frames)
+        self._output("Rolling score with label texture", start, end, frames)
+
+        self.mc.glyph_cache = GlyphCache()
+        start, end = self._rolling_score(frames)
+        self._output("Rolling score with glyph cache", start, end, frames)
+        print("Glyph cache: {}".format(self.mc.glyph_cache.get_stats()))
@@ -0,0 +1,123 @@
+"""Normalizes the sound assets of a machine to the output format of the audio engine."""
+
+import argparse
+import os
+import sys
+
+
+class Command:
+
+    """Transcodes all sound assets to WAV files in the exact output format of the audio engine.
+
+    The normalized files are written to the normalized sounds folder (build/sounds by default)
+    and are loaded by the media controller in place of the source files without any conversion.
+    """
+
+    def __init__(self, mpf_path, machine_path, args):
+        """Build normalized sound files."""
+        del mpf_path
+
+        # Need to have these in here because we don't want them to load when
+        # the module is loaded as an mpf.command
+        from mpf.core.file_manager import FileManager
+        from mpf.core.utility_functions import Util
+        from mpfmc.core.audio import AudioInterface, AudioException, DEFAULT_SAMPLE_RATE, \
+            DEFAULT_AUDIO_CHANNELS, DEFAULT_AUDIO_BUFFER_SAMPLE_SIZE, DEFAULT_NORMALIZED_SOUNDS_PATH
+        from mpfmc.core.audio.sound_normalizer import NormalizedSoundCache
+
+        parser = argparse.ArgumentParser(description='Normalizes the sound assets of a machine to the '
+                                                     'output format of the audio engine')
+
+        parser.add_argument("-c",
+                            action="store", dest="configfile",
+                            default="config", metavar='config_file(s)',
+                            help="The name of a config file to load. Default is "
+                                 "config.yaml. Multiple files can be used via a comma-"
+                                 "separated list (no spaces between)")
+
+        parser.add_argument("-f",
+                            action="store_true", dest="force", default=False,
+                            help="Normalize all sound files (including the ones that "
+                                 "are already up to date)")
+
+        args = parser.parse_args(args)
+
+        # Read the sound system settings from the machine config files
+        sound_system_config = dict()
+        for config_file in Util.string_to_list(args.configfile):
+            if not config_file.endswith('.yaml'):
+                config_file += '.yaml'
+            config = FileManager.load(os.path.join(machine_path, 'config', config_file))
+            if config and config.get('sound_system'):
+                sound_system_config.update(config['sound_system'])
+
+        if not sound_system_config.get('enabled', True):
+            print("The sound system is disabled in the machine config. No sounds were normalized.")
+            return
+
+        rate = sound_system_config.get('frequency', DEFAULT_SAMPLE_RATE)
+        if rate == 'auto':
+            rate = DEFAULT_SAMPLE_RATE
+        buffer_samples = sound_system_config.get('buffer', DEFAULT_AUDIO_BUFFER_SAMPLE_SIZE)
+        if buffer_samples == 'auto' or not AudioInterface.power_of_two(buffer_samples):
+            buffer_samples = DEFAULT_AUDIO_BUFFER_SAMPLE_SIZE
+
+        # The audio interface is only used to transcode the files (no audio device is needed)
+        audio_interface = AudioInterface(rate=rate,
+                                         channels=sound_system_config.get('channels', DEFAULT_AUDIO_CHANNELS),
+                                         buffer_samples=buffer_samples,
+                                         offline=True)
+        audio_interface.enable()
+        settings = audio_interface.get_settings()
+
+        cache = NormalizedSoundCache(
+            machine_path,
+            os.path.join(machine_path, sound_system_config.get('normalized_sounds_path',
+                                                               DEFAULT_NORMALIZED_SOUNDS_PATH)),
+            settings['sample_rate'], settings['audio_channels'])
+
+        normalized = 0
+        skipped = 0
+        failed = 0
+        for source_file in self._find_sound_files(machine_path, audio_interface.supported_extensions()):
+            if not args.force and cache.is_up_to_date(source_file):
+                skipped += 1
+                continue
+
+            target_file = cache.target_file_name(source_file)
+            os.makedirs(os.path.dirname(target_file), exist_ok=True)
+
+            try:
+                samples = audio_interface.normalize_sound_file(source_file, target_file)
+            except AudioException as e:
+                print("Error: {}".format(e), file=sys.stderr)
+                failed += 1
+                continue
+
+            cache.add(source_file, target_file, samples)
+            normalized += 1
+            print("Normalized {} ({} samples)".format(os.path.relpath(source_file, machine_path), samples))
+
+        cache.save()
+        audio_interface.shutdown()
+
+        print("{} sound files normalized to {} Hz, {} channel(s) ({} up to date, {} failed)".format(
+            normalized, settings['sample_rate'], settings['audio_channels'], skipped, failed))
+
+    @staticmethod
+    def _find_sound_files(machine_path, extensions):
+        """Return the sound asset files of the machine and its modes."""
+        sound_paths = [os.path.join(machine_path, 'sounds')]
+        modes_path = os.path.join(machine_path, 'modes')
+        if os.path.isdir(modes_path):
+            sound_paths.extend(os.path.join(modes_path, mode, 'sounds') for mode in sorted(os.listdir(modes_path)))
+
+        for sound_path in sound_paths:
+            for path, _, files in sorted(os.walk(sound_path)):
+                for file_name in sorted(files):
+                    if os.path.splitext(file_name)[1][1:].lower() in extensions:
+                        yield os.path.join(path, file_name)
+
+
+def get_command():
+    return 'build_sounds', Command
@@ -146,6 +146,33 @@ class Command:
         parser.add_argument("--no-sound",
                             action="store_true", dest="no_sound", default=False)
 
+        parser.add_argument("--headless",
+                            action="store_true", dest="headless", default=False,
+                            help="Render all displays off-screen without a window "
+                                 "(using software GL). Can also be enabled with "
+                                 "the MPFMC_HEADLESS=1 environment variable")
+
+        parser.add_argument("--virtual-time",
+                            action="store_true", dest="virtual_time", default=False,
+                            help="Run on a simulated timeline which advances one "
+                                 "frame per loop as fast as possible. Can also be "
+                                 "enabled with the MPFMC_VIRTUAL_TIME=1 environment "
+                                 "variable")
+
+        parser.add_argument("--frame-trace",
+                            action="store", dest="frame_trace",
+                            metavar='file_name', default=None,
+                            help="Profile every frame and write a Chrome/Perfetto "
+                                 "trace to this file (relative to the machine "
+                                 "folder) on exit")
+
+        parser.add_argument("--event-report",
+                            action="store", dest="event_report",
+                            metavar='file_name', default=None,
+                            help="Profile all events and event handlers and "
+                                 "write a report to this file (relative to the "
+                                 "machine folder) on exit")
+
         args = parser.parse_args(args)
 
         args.configfile = Util.string_to_list(args.configfile)
@@ -201,7 +228,16 @@ class Command:
         # add the handler to the root logger
         logging.getLogger('').addHandler(console)
 
+        from mpfmc.core.headless import is_headless, enable_headless
+
+        if args.headless or is_headless():
+            # has to be done before the Kivy window is imported (by MpfMc)
+            enable_headless()
+
         from mpfmc.core.mc import MpfMc
+        from mpfmc.core.virtual_clock import is_virtual_time
+
+        args.virtual_time = args.virtual_time or is_virtual_time()
 
         logging.info("Loading MPF-MC controller")
 
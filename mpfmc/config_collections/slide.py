@@ -34,6 +34,8 @@ class SlideCollection(ConfigCollection):
 
         config = self.mc.config_validator.validate_config('slides', config)
         config = self.mc.transition_manager.validate_transitions(config)
+        self.mc.transition_manager.prewarm_transition(config['transition'])
+        self.mc.transition_manager.prewarm_transition(config['transition_out'])
 
         return config
 
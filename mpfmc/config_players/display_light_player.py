@@ -77,11 +77,18 @@ class McDisplayLightPlayer(BcpConfigPlayer):
 
     def _render_all(self, dt):
         del dt
+        profiler = self.machine.frame_profiler
+        if profiler:
+            start = profiler.start_phase()
         for context, instances in self.instances.items():
             for element, instance in instances.items():
                 if not element[5] or not element[6]:
                     continue
                 self._render(instance, element, context)
+                if profiler:
+                    profiler.count('fbo_draws')
+        if profiler:
+            profiler.end_phase('display_lights', start)
 
     # pylint: disable-msg=too-many-locals
     def _render(self, instance, element, context):
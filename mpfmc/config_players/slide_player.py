@@ -274,6 +274,8 @@ class McSlidePlayer(McConfigPlayer):
                     v['widgets'])
 
             self.machine.transition_manager.validate_transitions(v)
+            self.machine.transition_manager.prewarm_transition(v['transition'])
+            self.machine.transition_manager.prewarm_transition(v['transition_out'])
 
         return validated_dict
 
@@ -1,11 +1,13 @@
 """Audio module provides all the audio features (playing of sounds) for the media controller."""
 import logging
+import os
 
 from kivy.clock import Clock
 from mpf.core.case_insensitive_dict import CaseInsensitiveDict
 from mpf.core.utility_functions import Util
 from mpfmc.core.audio.audio_interface import AudioInterface
 from mpfmc.core.audio.audio_exception import AudioException
+from mpfmc.core.audio.sound_normalizer import NormalizedSoundCache
 
 __all__ = ('SoundSystem',
            'AudioInterface',
@@ -21,6 +23,13 @@ DEFAULT_AUDIO_CHANNELS = 1
 DEFAULT_MASTER_VOLUME = 0.5
 DEFAULT_TRACK_MAX_SIMULTANEOUS_SOUNDS = 1
 DEFAULT_TRACK_VOLUME = 0.5
+DEFAULT_STREAM_LEAD_TIME = '500ms'
+DEFAULT_STREAM_PREBUFFER_TIME = '250ms'
+DEFAULT_STREAM_DECODE_THREADS = 1
+DEFAULT_STREAM_MAX_PIPELINES = 16
+DEFAULT_AUDIO_OFFLINE = False
+DEFAULT_NORMALIZED_SOUNDS_PATH = os.path.join('build', 'sounds')
+DEFAULT_TELEMETRY_LOG_INTERVAL = '60s'
 
 
 # pylint: disable=too-many-instance-attributes
@@ -44,6 +53,8 @@ class SoundSystem:
         self.sound_events = dict()
         self.tracks = CaseInsensitiveDict()
         self.clock_event = None
+        self.telemetry_clock_event = None
+        self.normalized_sounds = None
 
         self.log.debug("Loading the Sound System")
 
@@ -83,12 +94,38 @@ class SoundSystem:
         if 'master_volume' not in self.config:
             self.config['master_volume'] = DEFAULT_MASTER_VOLUME
 
+        if 'stream_lead_time' not in self.config:
+            self.config['stream_lead_time'] = DEFAULT_STREAM_LEAD_TIME
+
+        if 'stream_prebuffer_time' not in self.config:
+            self.config['stream_prebuffer_time'] = DEFAULT_STREAM_PREBUFFER_TIME
+
+        if 'stream_decode_threads' not in self.config:
+            self.config['stream_decode_threads'] = DEFAULT_STREAM_DECODE_THREADS
+
+        if 'stream_max_pipelines' not in self.config:
+            self.config['stream_max_pipelines'] = DEFAULT_STREAM_MAX_PIPELINES
+
+        if 'offline' not in self.config:
+            self.config['offline'] = DEFAULT_AUDIO_OFFLINE
+
+        if 'normalized_sounds_path' not in self.config:
+            self.config['normalized_sounds_path'] = DEFAULT_NORMALIZED_SOUNDS_PATH
+
+        if 'telemetry_log_interval' not in self.config:
+            self.config['telemetry_log_interval'] = DEFAULT_TELEMETRY_LOG_INTERVAL
+
         # Initialize audio interface library (get audio output)
         try:
             self.audio_interface = AudioInterface(
                 rate=self.config['frequency'],
                 channels=self.config['channels'],
-                buffer_samples=self.config['buffer'])
+                buffer_samples=self.config['buffer'],
+                stream_lead_time=AudioInterface.string_to_secs(self.config['stream_lead_time']),
+                stream_prebuffer_time=AudioInterface.string_to_secs(self.config['stream_prebuffer_time']),
+                stream_decode_threads=self.config['stream_decode_threads'],
+                stream_max_pipelines=self.config['stream_max_pipelines'],
+                offline=self.config['offline'])
         except AudioException:
             self.log.error("Could not initialize the audio interface. "
                            "Audio features will not be available.")
@@ -110,10 +147,23 @@ class SoundSystem:
         # Establish machine tick function callback (will process internal audio events)
         self.clock_event = Clock.schedule_interval(self.tick, 0)
 
+        # Periodically log the audio engine telemetry (callback timing, underruns, track mix time)
+        telemetry_log_interval = AudioInterface.string_to_secs(self.config['telemetry_log_interval'])
+        if telemetry_log_interval > 0:
+            self.telemetry_clock_event = Clock.schedule_interval(self._log_telemetry, telemetry_log_interval)
+
         # Start audio engine processing
         self.audio_interface.enable()
         self._initialized = True
 
+        # Sound files normalized to the output format (by the build_sounds command) are loaded
+        # in place of the source files
+        settings = self.audio_interface.get_settings()
+        self.normalized_sounds = NormalizedSoundCache(
+            self.mc.machine_path,
+            os.path.join(self.mc.machine_path, self.config['normalized_sounds_path']),
+            settings['sample_rate'], settings['audio_channels'])
+
         self.mc.events.add_handler("master_volume_increase", self.master_volume_increase)
         self.mc.events.add_handler("master_volume_decrease", self.master_volume_decrease)
         self.mc.events.add_handler("shutdown", self.shutdown)
@@ -126,6 +176,9 @@ class SoundSystem:
     def shutdown(self, **kwargs):
         """Shuts down the audio interface"""
         del kwargs
+        if self.telemetry_clock_event:
+            self.telemetry_clock_event.cancel()
+            self.telemetry_clock_event = None
         if self.enabled:
             self.audio_interface.shutdown()
             self._initialized = False
@@ -253,3 +306,26 @@ class SoundSystem:
         """Clock callback function"""
         del dt
         self.audio_interface.process()
+
+    def get_status_report(self) -> dict:
+        """Return a summary of the audio engine telemetry (used in the BCP status_report)."""
+        telemetry = self.audio_interface.get_telemetry()
+        return dict(audio_load_p99=telemetry['load_p99'],
+                    audio_load_peak=telemetry['load_peak'],
+                    audio_overruns=telemetry['overruns'],
+                    audio_underruns=telemetry['underruns'],
+                    audio_stream_underruns=telemetry['stream_underruns'])
+
+    def _log_telemetry(self, dt):
+        """Log the audio engine telemetry."""
+        del dt
+        telemetry = self.audio_interface.get_telemetry()
+        self.log.info("Audio telemetry: %s callbacks (%sms), load p50/p95/p99/peak: %.0f%%/%.0f%%/%.0f%%/%.0f%%, "
+                      "overruns: %s, underruns: %s, stream underruns: %s, tracks: %s",
+                      telemetry['callbacks'], telemetry['buffer_period_ms'],
+                      100 * telemetry['load_p50'], 100 * telemetry['load_p95'],
+                      100 * telemetry['load_p99'], 100 * telemetry['load_peak'],
+                      telemetry['overruns'], telemetry['underruns'], telemetry['stream_underruns'],
+                      ", ".join("{} {:.3f}ms/{:.1f} voices".format(name, track['mix_time_ms'],
+                                                                   track['active_players_avg'])
+                                for name, track in telemetry['tracks'].items()))
@@ -12,8 +12,10 @@ from libc.string cimport memset, memcpy
 from cpython.mem cimport PyMem_Malloc, PyMem_Realloc, PyMem_Free
 cimport cpython.pycapsule as pycapsule
 
-from math import pow
+from math import pow, ceil
 import logging
+import os
+import wave
 
 from mpfmc.core.audio.sdl2 cimport *
 from mpfmc.core.audio.gstreamer cimport *
@@ -21,7 +23,9 @@ from mpfmc.core.audio.track cimport *
 from mpfmc.core.audio.track_standard cimport *
 from mpfmc.core.audio.track_sound_loop cimport *
 from mpfmc.core.audio.sound_file cimport *
+from mpfmc.core.audio.inline cimport bytes_to_bus_samples, xorshift32
 from mpfmc.core.audio.audio_exception import AudioException
+from mpfmc.core.audio.sound_normalizer import read_wav_format
 from mpfmc.core.audio.playlist_controller import PlaylistController
 
 
@@ -37,6 +41,10 @@ DEF MAX_MARKERS = 16
 # clicks
 DEF QUICK_FADE_DURATION_SECS = 0.05
 
+# The maximum amount of time to wait for a decoded streaming sample when rendering offline
+# (nanoseconds)
+DEF OFFLINE_STREAM_PULL_TIMEOUT = 1000000000
+
 
 # ---------------------------------------------------------------------------
 #    Global GStreamer helper functions
@@ -70,23 +78,45 @@ cdef class AudioInterface:
     """
     cdef list tracks
     cdef dict playlist_controllers
+    cdef object streaming_pipeline_pool
     cdef object mc
     cdef object log
+    cdef bint offline
+    cdef bint offline_enabled
+    cdef Uint64 rendered_samples
+    cdef object wav_sink
+    cdef Uint64 telemetry_callback_start
 
     cdef AudioCallbackData audio_callback_data
 
     def __cinit__(self, *args, **kw):
         pass
 
-    def __init__(self, rate=44100, channels=2, buffer_samples=4096):
+    def __init__(self, rate=44100, channels=2, buffer_samples=4096, stream_lead_time=0.5,
+                 stream_prebuffer_time=0.25, stream_decode_threads=1, stream_max_pipelines=16,
+                 offline=False):
         """
         Initializes the AudioInterface.
         Args:
             rate: The audio sample rate used in the library
             channels: The number of channels to use (1=mono, 2=stereo)
             buffer_samples: The audio buffer size to use (in number of samples, must be power of two)
+            stream_lead_time: The amount of audio (in seconds) to decode ahead of playback for
+                streaming sounds (at least one audio buffer)
+            stream_prebuffer_time: The amount of audio (in seconds) at the start of each streaming
+                sound to decode when the sound is loaded
+            stream_decode_threads: The number of threads used to decode streaming sounds
+            stream_max_pipelines: The maximum number of GStreamer pipelines used by streaming
+                sounds (pipelines are pooled and reused by streaming sounds)
+            offline: Whether or not to render audio offline (the audio callback is not called by
+                the audio device, audio is generated by calling render instead)
         """
         self.log = logging.getLogger("AudioInterface")
+        self.offline = offline
+        self.offline_enabled = False
+        self.rendered_samples = 0
+        self.wav_sink = None
+        self.telemetry_callback_start = 0
 
         # Initialize threading in the extension library and acquire the Python global interpreter lock
         PyEval_InitThreads()
@@ -112,6 +142,14 @@ cdef class AudioInterface:
             self.log.error('SDL_InitSubSystem error - %s' % SDL_GetError())
             raise AudioException('Unable to initialize SDL (SDL_InitSubSystem call failed: %s)' % SDL_GetError())
 
+        # When rendering offline the mixer is opened on the SDL dummy audio driver (no audio device
+        # is needed).  SDL_Mixer still converts loaded sounds to the output format, but the audio
+        # callback is only ever called by render.
+        if offline and SDL_AudioInit("dummy") < 0:
+            self.log.error('SDL_AudioInit error - %s' % SDL_GetError())
+            raise AudioException('Unable to initialize the SDL dummy audio driver for offline rendering '
+                                 '(SDL_AudioInit call failed: %s)' % SDL_GetError())
+
         # Initialize the SDL_Mixer library to establish the output audio format and encoding
         # (sample rate, bit depth, buffer size)
         if Mix_OpenAudio(rate, AUDIO_S16SYS, channels, buffer_samples):
@@ -163,6 +201,23 @@ cdef class AudioInterface:
         self.audio_callback_data.silence = 0
         self.audio_callback_data.track_count = 0
         self.audio_callback_data.tracks = <void**>PyMem_Malloc(MAX_TRACKS * sizeof(TrackState*))
+        self._create_mix_bus()
+        self.audio_callback_data.callback_count = 0
+        self.audio_callback_data.tracks_mixed = 0
+        self.audio_callback_data.tracks_skipped = 0
+        self.audio_callback_data.callback_load = 0.0
+        self.audio_callback_data.callback_load_peak = 0.0
+        self.audio_callback_data.last_callback_time = 0
+        self.audio_callback_data.dropouts = 0
+        self.audio_callback_data.overruns = 0
+        memset(self.audio_callback_data.load_histogram, 0, sizeof(self.audio_callback_data.load_histogram))
+        # Streams are never decoded less than one callback buffer ahead (the decoder would
+        # never fill the stream ring with a lead time of 0)
+        self.audio_callback_data.stream_lead_bytes = max(<Uint32>(stream_lead_time * self.audio_callback_data.seconds_to_bytes_factor),
+                                                         self.audio_callback_data.buffer_size)
+        self.audio_callback_data.stream_prebuffer_bytes = <Uint32>(stream_prebuffer_time * self.audio_callback_data.seconds_to_bytes_factor)
+        # Offline rendering fills the streams from the rendering thread (no decode worker threads)
+        self.audio_callback_data.stream_decoder = <void*>create_stream_decoder(0 if offline else stream_decode_threads)
         self.audio_callback_data.c_log_file = NULL
         # self.audio_callback_data.c_log_file = fopen("D:\\Temp\\Dev\\MPFMC_AudioLibrary.log", "wb")
         # fprintf(self.audio_callback_data.c_log_file, "---------------------------------------------------------------------------\r\n")
@@ -180,6 +235,8 @@ cdef class AudioInterface:
 
         self.tracks = list()
         self.playlist_controllers = dict()
+        self.streaming_pipeline_pool = StreamingPipelinePool(
+            pycapsule.PyCapsule_New(&self.audio_callback_data, NULL, NULL), stream_max_pipelines)
 
     def __del__(self):
         """Shut down the audio interface and clean up allocated memory"""
@@ -192,6 +249,15 @@ cdef class AudioInterface:
         PyMem_Free(self.audio_callback_data.tracks)
         self.audio_callback_data.tracks = NULL
 
+        PyMem_Free(self.audio_callback_data.mix_bus)
+        self.audio_callback_data.mix_bus = NULL
+        PyMem_Free(self.audio_callback_data.dither_table)
+        self.audio_callback_data.dither_table = NULL
+
+        free_stream_decoder(<StreamDecoder*>self.audio_callback_data.stream_decoder)
+        self.audio_callback_data.stream_decoder = NULL
+        self.streaming_pipeline_pool.clear()
+
         # Remove tracks
         self.tracks.clear()
 
@@ -199,6 +265,26 @@ cdef class AudioInterface:
         Mix_Quit()
         SDL_Quit()
 
+    cdef _create_mix_bus(self):
+        """Allocate the master mixing bus and generate the dither noise table used when the
+        bus is converted to the 16-bit output format."""
+        cdef Uint32 sample_count = bytes_to_bus_samples(self.audio_callback_data.buffer_size)
+        cdef Uint32 state = 0x9E3779B9
+        cdef Uint32 i
+
+        self.audio_callback_data.mix_bus = <float*>PyMem_Malloc(sample_count * sizeof(float))
+
+        # The dither table contains triangular (TPDF) noise of +/- 1 LSB.  It is stored twice
+        # in a row so a window of sample_count values can start at any offset in the first half
+        # (the window is moved randomly each callback to avoid a periodic noise pattern).
+        self.audio_callback_data.dither_table = <float*>PyMem_Malloc(2 * sample_count * sizeof(float))
+        self.audio_callback_data.dither_table_size = sample_count
+        for i in range(sample_count):
+            state = xorshift32(state)
+            self.audio_callback_data.dither_table[i] = (<int>(state & 0xFFFF) - <int>(state >> 16)) / 65536.0
+            self.audio_callback_data.dither_table[sample_count + i] = self.audio_callback_data.dither_table[i]
+        self.audio_callback_data.dither_state = xorshift32(state)
+
     def _initialize_gstreamer(self):
         """Initialize the GStreamer library"""
         if gst_is_initialized():
@@ -406,6 +492,114 @@ cdef class AudioInterface:
         else:
             return None
 
+    def get_stats(self):
+        """
+        Gets the audio callback statistics.
+        Returns:
+            A dictionary containing the number of audio callbacks, the callback load of the last
+            callback and the peak load (time spent in the callback as a fraction of the buffer
+            duration), the number of tracks mixed and skipped (idle) over all callbacks, the number
+            of dropouts (callbacks that started too late to refill the output buffer in time), the
+            number of streaming sound underruns (the decoder did not keep up with playback), the
+            number of notification messages dropped, the number of active players per track
+            during the last callback and the streaming pipeline pool statistics.
+        """
+        SDL_LockAudio()
+        stats = {'callbacks': self.audio_callback_data.callback_count,
+                 'load': round(self.audio_callback_data.callback_load, 4),
+                 'peak_load': round(self.audio_callback_data.callback_load_peak, 4),
+                 'tracks_mixed': self.audio_callback_data.tracks_mixed,
+                 'tracks_skipped': self.audio_callback_data.tracks_skipped,
+                 'dropouts': self.audio_callback_data.dropouts,
+                 'stream_underruns': get_stream_underruns(<StreamDecoder*>self.audio_callback_data.stream_decoder),
+                 'notifications_dropped': sum(track.notifications_dropped for track in self.tracks),
+                 'active_players': {(<Track>track).name: (<Track>track).state.active_player_count
+                                    for track in self.tracks}
+                 }
+        SDL_UnlockAudio()
+        stats['streaming_pipelines'] = self.streaming_pipeline_pool.get_stats()
+        return stats
+
+    def get_telemetry(self):
+        """
+        Gets the audio engine telemetry.  The telemetry counters are written by the audio thread
+        and sampled here without locking the audio callback (values may be one callback apart).
+        Returns:
+            A dictionary containing the buffer period (ms), the number of audio callbacks (since
+            the telemetry was reset), a histogram of the callback duration as a fraction of the
+            buffer period (number of callbacks per bucket, the last bucket counts all callbacks
+            that took twice the buffer period or longer), the 50th/95th/99th percentile and peak
+            callback load, the number of overruns (callbacks that took longer than the buffer
+            period), the number of underruns (output buffers that were not refilled in time and
+            streaming sound buffers the decoder did not fill in time) and the mix time and active
+            voice counts per track.
+        """
+        cdef AudioCallbackData *callback_data = &self.audio_callback_data
+        cdef TrackState *track_state
+        cdef Uint64 callbacks = callback_data.callback_count - self.telemetry_callback_start
+        cdef double ticks_to_ms = 1000.0 / SDL_GetPerformanceFrequency()
+
+        histogram = [callback_data.load_histogram[i] for i in range(CALLBACK_LOAD_HISTOGRAM_BUCKETS)]
+
+        tracks = dict()
+        for track in self.tracks:
+            track_state = (<Track>track).state
+            tracks[track.name] = {
+                'mix_time_ms': round(track_state.mix_ticks * ticks_to_ms / callbacks, 4) if callbacks else 0.0,
+                'mix_load': round(track_state.mix_load, 4),
+                'mix_load_peak': round(track_state.mix_load_peak, 4),
+                'active_players': track_state.active_player_count,
+                'active_players_avg': round(<double>track_state.active_player_total / callbacks, 2) if callbacks else 0.0,
+                'active_players_peak': track_state.active_player_peak,
+            }
+
+        return {'buffer_period_ms': round(1000.0 * callback_data.buffer_samples / callback_data.sample_rate, 3),
+                'callbacks': callbacks,
+                'load_histogram': histogram,
+                'load_histogram_bucket_size': 1.0 / CALLBACK_LOAD_HISTOGRAM_RESOLUTION,
+                'load_p50': AudioInterface._histogram_percentile(histogram, 0.5),
+                'load_p95': AudioInterface._histogram_percentile(histogram, 0.95),
+                'load_p99': AudioInterface._histogram_percentile(histogram, 0.99),
+                'load_peak': round(callback_data.callback_load_peak, 4),
+                'overruns': callback_data.overruns,
+                'underruns': callback_data.dropouts,
+                'stream_underruns': get_stream_underruns(<StreamDecoder*>callback_data.stream_decoder),
+                'tracks': tracks
+                }
+
+    @staticmethod
+    def _histogram_percentile(list histogram, float fraction):
+        """Returns the upper bound of the callback load histogram bucket containing a percentile"""
+        total = sum(histogram)
+        if total == 0:
+            return 0.0
+
+        threshold = fraction * total
+        count = 0
+        for bucket, bucket_count in enumerate(histogram):
+            count += bucket_count
+            if count >= threshold:
+                return round((bucket + 1) / CALLBACK_LOAD_HISTOGRAM_RESOLUTION, 4)
+
+        return round(len(histogram) / CALLBACK_LOAD_HISTOGRAM_RESOLUTION, 4)
+
+    def reset_telemetry(self):
+        """Resets the callback load histogram, peak loads and per-track telemetry counters"""
+        cdef TrackState *track_state
+
+        SDL_LockAudio()
+        memset(self.audio_callback_data.load_histogram, 0, sizeof(self.audio_callback_data.load_histogram))
+        self.audio_callback_data.overruns = 0
+        self.audio_callback_data.callback_load_peak = 0.0
+        self.telemetry_callback_start = self.audio_callback_data.callback_count
+        for track in self.tracks:
+            track_state = (<Track>track).state
+            track_state.mix_ticks = 0
+            track_state.mix_load_peak = 0.0
+            track_state.active_player_total = 0
+            track_state.active_player_peak = 0
+        SDL_UnlockAudio()
+
     cdef write_gst_log_message(self, message_type, message):
         """Write GStreamer log message to the mpfmc log"""
         # print(message_type, message)
@@ -418,6 +612,8 @@ cdef class AudioInterface:
 
     @property
     def enabled(self):
+        if self.offline:
+            return self.offline_enabled
         return Mix_GetMusicHookData() != NULL
 
     def enable(self):
@@ -425,7 +621,10 @@ cdef class AudioInterface:
         Enables audio playback (begins audio processing)
         """
         self.log.debug("Enabling audio playback")
-        Mix_HookMusic(self.audio_callback, &self.audio_callback_data)
+        if self.offline:
+            self.offline_enabled = True
+        else:
+            Mix_HookMusic(self.audio_callback, &self.audio_callback_data)
 
     def disable(self):
         """
@@ -433,15 +632,94 @@ cdef class AudioInterface:
         """
         self.log.debug("Disabling audio playback")
         self.stop_all_sounds()
-        Mix_HookMusic(NULL, NULL)
+        if self.offline:
+            self.offline_enabled = False
+        else:
+            Mix_HookMusic(NULL, NULL)
 
     def shutdown(self):
         """
         Shuts down the audio device
         """
         self.disable()
+        self.close_wav_sink()
         Mix_CloseAudio()
 
+    @property
+    def is_offline(self):
+        """Returns whether or not the audio interface renders audio offline"""
+        return self.offline
+
+    @property
+    def rendered_time(self):
+        """Returns the amount of audio (in seconds) rendered offline so far (the offline clock)"""
+        return self.rendered_samples / self.audio_callback_data.sample_rate
+
+    def render(self, float seconds):
+        """
+        Renders audio offline (as fast as possible) by calling the audio callback from a manual
+        clock.  The track processing that normally runs each tick (queued sounds, notifications)
+        is performed before each buffer.
+        Args:
+            seconds: The amount of audio to render (rounded up to a whole number of buffers)
+
+        Returns:
+            A bytes object containing the rendered audio in the output format.  The rendered audio
+            is also written to the WAV sink (if one is open).
+        """
+        cdef int buffer_count
+        cdef int buffer_num
+        cdef Uint32 buffer_size = self.audio_callback_data.buffer_size
+        cdef Uint8 *output_buffer
+
+        if not self.offline:
+            raise AudioException("Audio can only be rendered when the audio interface is offline")
+
+        buffer_count = <int>ceil(seconds * self.audio_callback_data.sample_rate / self.audio_callback_data.buffer_samples)
+        output = bytearray(buffer_count * buffer_size)
+        output_buffer = <Uint8*><char*>output
+
+        for buffer_num in range(buffer_count):
+            self.process()
+
+            if not self.offline_enabled:
+                continue
+
+            SDL_LockAudio()
+            # Callbacks are not called in real time so there can be no dropouts
+            self.audio_callback_data.last_callback_time = 0
+            with nogil:
+                fill_streams(<StreamDecoder*>self.audio_callback_data.stream_decoder, OFFLINE_STREAM_PULL_TIMEOUT)
+                AudioInterface.audio_callback(&self.audio_callback_data,
+                                              output_buffer + buffer_num * buffer_size,
+                                              buffer_size)
+            SDL_UnlockAudio()
+
+        self.rendered_samples += buffer_count * self.audio_callback_data.buffer_samples
+
+        if self.wav_sink is not None:
+            self.wav_sink.writeframes(output)
+
+        return bytes(output)
+
+    def open_wav_sink(self, str file_name not None):
+        """
+        Opens a WAV file that receives all audio rendered offline.
+        Args:
+            file_name: The name of the WAV file to write
+        """
+        self.close_wav_sink()
+        self.wav_sink = wave.open(file_name, 'wb')
+        self.wav_sink.setnchannels(self.audio_callback_data.channels)
+        self.wav_sink.setsampwidth(self.audio_callback_data.bytes_per_sample)
+        self.wav_sink.setframerate(self.audio_callback_data.sample_rate)
+
+    def close_wav_sink(self):
+        """Closes the WAV file sink (if one is open)"""
+        if self.wav_sink is not None:
+            self.wav_sink.close()
+            self.wav_sink = None
+
     @staticmethod
     def get_max_tracks():
         """ Returns the maximum number of tracks allowed. """
@@ -699,7 +977,71 @@ cdef class AudioInterface:
             A SoundMemoryFile wrapper object containing a pointer to the sound sample
             data in memory.  An exception is thrown if the sound is unable to be loaded.
         """
-        return SoundStreamingFile(file_name, pycapsule.PyCapsule_New(&self.audio_callback_data, NULL, NULL))
+        return SoundStreamingFile(file_name, pycapsule.PyCapsule_New(&self.audio_callback_data, NULL, NULL),
+                                  self.streaming_pipeline_pool)
+
+    def normalize_sound_file(self, str source_file_name, str target_file_name):
+        """
+        Transcodes a sound file to a WAV file in the exact output format of the audio interface
+        (sample rate, channels and sample format) using GStreamer.  Normalized files are loaded
+        without any conversion.  Used by the build_sounds command.
+        Args:
+            source_file_name: The sound file to transcode
+            target_file_name: The name of the WAV file to write
+
+        Returns:
+            The length of the normalized sound (in samples)
+        """
+        cdef GError *error = NULL
+        cdef GstElement *pipeline
+        cdef GstBus *bus
+        cdef GstMessage *message
+        cdef char *debug = NULL
+
+        if not os.path.isfile(source_file_name):
+            raise AudioException('Could not locate file ' + source_file_name)
+
+        # Pipeline structure: filesrc --> decodebin --> audioconvert --> audioresample --> wavenc --> filesink
+        pipeline_string = 'filesrc location="{}" ! decodebin ! audioconvert ! audioresample ! audio/x-raw,rate={},channels={},format=S16LE,layout=interleaved ! wavenc ! filesink location="{}"'.format(
+            source_file_name.replace('\\', '/'), self.audio_callback_data.sample_rate,
+            self.audio_callback_data.channels, target_file_name.replace('\\', '/'))
+
+        pipeline = gst_parse_launch(pipeline_string.encode('utf-8'), &error)
+        if error != NULL:
+            msg = 'Unable to create a GStreamer pipeline: code={} message={}'.format(error.code, <bytes>error.message)
+            raise AudioException(msg)
+
+        bus = gst_pipeline_get_bus(<GstPipeline*>pipeline)
+        gst_element_set_state(pipeline, GST_STATE_PLAYING)
+
+        # Wait until the whole file has been transcoded
+        with nogil:
+            message = gst_bus_timed_pop_filtered(bus, GST_CLOCK_TIME_NONE,
+                                                 <GstMessageType>(GST_MESSAGE_EOS | GST_MESSAGE_ERROR))
+
+        msg = None
+        if message == NULL:
+            msg = 'Unable to normalize {}'.format(source_file_name)
+        elif message.type == GST_MESSAGE_ERROR:
+            gst_message_parse_error(message, &error, &debug)
+            msg = 'Unable to normalize {}: {}'.format(source_file_name, <bytes>error.message)
+            g_error_free(error)
+
+        if message != NULL:
+            gst_message_unref(message)
+
+        gst_element_set_state(pipeline, GST_STATE_NULL)
+        gst_object_unref(bus)
+        gst_object_unref(pipeline)
+
+        if msg is not None:
+            raise AudioException(msg)
+
+        wav_format = read_wav_format(target_file_name)
+        if wav_format is None:
+            raise AudioException('Unable to normalize {} (no WAV file was written)'.format(source_file_name))
+
+        return wav_format.data_size // (self.audio_callback_data.bytes_per_sample * self.audio_callback_data.channels)
 
     def unload_sound_file(self, container not None):
         """
@@ -771,12 +1113,33 @@ cdef class AudioInterface:
         cdef Uint32 buffer_length = <Uint32> length
         cdef AudioCallbackData *callback_data = <AudioCallbackData*> data
         cdef TrackState *track
+        cdef Uint32 bus_samples
+        cdef bint bus_is_silent = True
+        cdef Uint64 start_time = SDL_GetPerformanceCounter()
+        cdef Uint64 track_start_time
+        cdef Uint64 track_ticks
+        cdef double ticks_to_load
+        cdef int histogram_bucket
 
         if callback_data == NULL:
             return
 
-        # Initialize master output buffer with silence as it arrives uninitialized
-        memset(output_buffer, 0, buffer_length)
+        # A callback that starts more than one and a half buffers after the previous one means the
+        # output buffer could not be refilled in time (the audio thread was blocked or starved)
+        if callback_data.last_callback_time != 0 and \
+                (start_time - callback_data.last_callback_time) * callback_data.sample_rate * 2 > \
+                SDL_GetPerformanceFrequency() * callback_data.buffer_samples * 3:
+            callback_data.dropouts += 1
+        callback_data.last_callback_time = start_time
+
+        # All mixing is performed on a 32-bit float bus (one float per 16-bit output sample). Samples
+        # are only clipped once, when the bus is converted to the output format.
+        bus_samples = bytes_to_bus_samples(buffer_length)
+        memset(callback_data.mix_bus, 0, bus_samples * sizeof(float))
+
+        # Converts performance counter ticks to a fraction of the buffer duration
+        ticks_to_load = (<double>callback_data.sample_rate * callback_data.channels /
+                         (<double>SDL_GetPerformanceFrequency() * bus_samples))
 
         # Note: There are three separate loops over the tracks that must remain separate due
         # to various track parameters than can be set for any track during each loop.  Difficult
@@ -787,35 +1150,86 @@ cdef class AudioInterface:
             track = <TrackState*>callback_data.tracks[track_num]
 
             track.active = False
-            memset(track.buffer, 0, buffer_length)
+            track.active_player_count = 0
 
-            track.ducking_is_active = False
-            for control_point in range(CONTROL_POINTS_PER_BUFFER):
-                g_array_set_val_uint8(track.ducking_control_points, control_point, SDL_MIX_MAXVOLUME)
+            # Idle tracks keep a silent buffer and untouched ducking control points from the previous
+            # callback so there is no need to clear them again.
+            if not track.buffer_is_silent:
+                memset(track.buffer, 0, bus_samples * sizeof(float))
+                track.buffer_is_silent = True
+
+            if track.ducking_is_active:
+                track.ducking_is_active = False
+                for control_point in range(CONTROL_POINTS_PER_BUFFER):
+                    g_array_set_val_uint8(track.ducking_control_points, control_point, SDL_MIX_MAXVOLUME)
 
         # Loop over tracks, mixing the playing sounds into the track's audio buffer
         for track_num in range(callback_data.track_count):
             track = <TrackState*>callback_data.tracks[track_num]
 
-            # No need to process/mix the track if the track is stopped or paused
+            # No need to process/mix the track if the track is stopped or paused (requests sent
+            # to the track are still applied so sounds can be stopped)
             if track.status == track_status_stopped or track.status == track_status_paused:
+                if track.request_callback_function != NULL:
+                    track.request_callback_function(track)
                 continue
 
             # Call the track's mix callback function (generates audio into track buffer)
             if track.mix_callback_function != NULL:
+                track_start_time = SDL_GetPerformanceCounter()
                 track.mix_callback_function(track, buffer_length, callback_data)
+                track_ticks = SDL_GetPerformanceCounter() - track_start_time
+                track.mix_ticks += track_ticks
+                track.mix_load = track_ticks * ticks_to_load
+                if track.mix_load > track.mix_load_peak:
+                    track.mix_load_peak = track.mix_load
+
+            track.active_player_total += track.active_player_count
+            if track.active_player_count > track.active_player_peak:
+                track.active_player_peak = track.active_player_count
 
-        # Loop over tracks again, applying ducking and mixing down tracks to the master output buffer
+            # Samples are only written to the track buffer when the track is active
+            if track.active:
+                track.buffer_is_silent = False
+
+        # Loop over tracks again, applying ducking and mixing down tracks to the master mixing bus
         for track_num in range(callback_data.track_count):
             track = <TrackState*>callback_data.tracks[track_num]
 
-            # Only mix the track to the master output and apply ducking if it is active
+            # Only mix the track to the master bus and apply ducking if it is active
             if track.active:
                 Track.mix_track_to_output(track,
                                           callback_data,
-                                          output_buffer,
+                                          callback_data.mix_bus,
                                           buffer_length)
-
-        # Apply master volume to output buffer
-        # Track.apply_volume(output_buffer, output_buffer, buffer_length, callback_data.master_volume)
-        SDL_MixAudioFormat(output_buffer, output_buffer, callback_data.format, buffer_length, callback_data.master_volume)
+                bus_is_silent = False
+                callback_data.tracks_mixed += 1
+            else:
+                callback_data.tracks_skipped += 1
+
+        if bus_is_silent:
+            # Nothing was mixed, skip the conversion (and do not add dither noise to silence)
+            memset(output_buffer, 0, buffer_length)
+        else:
+            # Apply master volume, dither and clip the master bus to the output buffer.  The master
+            # gain matches the previous SDL_MixAudioFormat(output, output, ...) master volume stage,
+            # which added the scaled output buffer to itself.
+            callback_data.dither_state = xorshift32(callback_data.dither_state)
+            Track.write_bus_to_output(output_buffer,
+                                      callback_data.mix_bus,
+                                      callback_data.dither_table + callback_data.dither_state % callback_data.dither_table_size,
+                                      bus_samples,
+                                      1.0 + <float>callback_data.master_volume / SDL_MIX_MAXVOLUME)
+
+        # Callback load is the fraction of the buffer duration spent generating the buffer
+        callback_data.callback_count += 1
+        callback_data.callback_load = (SDL_GetPerformanceCounter() - start_time) * ticks_to_load
+        if callback_data.callback_load > callback_data.callback_load_peak:
+            callback_data.callback_load_peak = callback_data.callback_load
+
+        # Callbacks that take longer than the buffer duration cannot keep up with the output
+        if callback_data.callback_load > 1.0:
+            callback_data.overruns += 1
+        histogram_bucket = min(<int>(callback_data.callback_load * CALLBACK_LOAD_HISTOGRAM_RESOLUTION),
+                               CALLBACK_LOAD_HISTOGRAM_BUCKETS - 1)
+        callback_data.load_histogram[histogram_bucket] += 1
@@ -48,9 +48,13 @@ cdef extern from 'gst/gst.h':
     ctypedef enum GstSeekFlags:
         GST_SEEK_FLAG_KEY_UNIT
         GST_SEEK_FLAG_FLUSH
+        GST_SEEK_FLAG_ACCURATE
 
     ctypedef enum GstStateChangeReturn:
-        pass
+        GST_STATE_CHANGE_FAILURE
+        GST_STATE_CHANGE_SUCCESS
+        GST_STATE_CHANGE_ASYNC
+        GST_STATE_CHANGE_NO_PREROLL
 
     ctypedef struct GError:
         int code
@@ -138,6 +142,10 @@ cdef extern from 'gst/gst.h':
             GstMessage *message, GError **gerror, char **debug)
     void gst_message_parse_info(
             GstMessage *message, GError **gerror, char **debug)
+    GstMessage *gst_bus_timed_pop_filtered(
+            GstBus *bus, GstClockTime timeout, GstMessageType types) nogil
+    void gst_message_unref(GstMessage *message)
+    GstClockTime GST_CLOCK_TIME_NONE
 
 
 # ---------------------------------------------------------------------------
@@ -195,8 +203,11 @@ cdef extern from 'gstreamer_helper.h':
     void g_gst_log_info(const_gchar *file, const_gchar *function, gint line, GObject *object, const_gchar *message) nogil
     void g_gst_log_debug(const_gchar *file, const_gchar *function, gint line, GObject *object, const_gchar *message) nogil
     gboolean g_object_get_bool(GstElement *element, char *name) nogil
+    void c_object_set_string(GstElement *element, char *name, char *value)
+    gulong c_connect_decoder_pad_added(GstElement *decoder, GstElement *convert)
     GstSample *c_appsink_pull_preroll(GstElement *appsink) nogil
     GstSample *c_appsink_pull_sample(GstElement *appsink) nogil
+    GstSample *c_appsink_try_pull_sample(GstElement *appsink, GstClockTime timeout) nogil
     gulong c_bus_connect_message(GstBus *bus,
             buscallback_t callback, void *userdata)
     void c_signal_disconnect(GstElement *appsink, gulong handler_id)
@@ -9,6 +9,31 @@ static gboolean g_object_get_bool(GstElement *element, char *name)
     return value;
 }
 
+static void c_object_set_string(GstElement *element, char *name, char *value)
+{
+    g_object_set(G_OBJECT(element), name, value, NULL);
+}
+
+static void c_on_decoder_pad_added(GstElement *decoder, GstPad *pad, GstElement *convert)
+{
+    /* Links the audio pad of a (re-)started decoder to the converter of a pooled pipeline */
+    GstPad *sink_pad = gst_element_get_static_pad(convert, "sink");
+    GstCaps *caps = gst_pad_query_caps(pad, NULL);
+
+    if (!gst_pad_is_linked(sink_pad) && caps != NULL && gst_caps_get_size(caps) > 0 &&
+            g_str_has_prefix(gst_structure_get_name(gst_caps_get_structure(caps, 0)), "audio/"))
+        gst_pad_link(pad, sink_pad);
+
+    if (caps != NULL)
+        gst_caps_unref(caps);
+    gst_object_unref(sink_pad);
+}
+
+static gulong c_connect_decoder_pad_added(GstElement *decoder, GstElement *convert)
+{
+    return g_signal_connect(decoder, "pad-added", G_CALLBACK(c_on_decoder_pad_added), convert);
+}
+
 static GstSample *c_appsink_pull_preroll(GstElement *appsink)
 {
 	GstSample *sample = NULL;
@@ -23,6 +48,13 @@ static GstSample *c_appsink_pull_sample(GstElement *appsink)
     return sample;
 }
 
+static GstSample *c_appsink_try_pull_sample(GstElement *appsink, GstClockTime timeout)
+{
+	GstSample *sample = NULL;
+	g_signal_emit_by_name(appsink, "try-pull-sample", timeout, &sample);
+    return sample;
+}
+
 typedef void (*appcallback_t)(void *, int, int, char *, int);
 typedef void (*buscallback_t)(void *, GstMessage *);
 typedef struct {
@@ -33,3 +33,42 @@ cdef inline float in_out_quad(float progress) nogil:
     p -= 1.0
     return -0.5 * (p * (p - 2.0) - 1.0)
 
+
+cdef inline Uint32 bytes_to_bus_samples(Uint32 byte_count) nogil:
+    """
+    Converts a position/length in 16-bit output buffer bytes to a position/length
+    in a floating point mixing buffer.
+    Args:
+        byte_count: Number of bytes in the 16-bit output format
+
+    Notes:
+        Mixing buffers hold one 32-bit float for every 16-bit output sample so all
+        buffer positions can continue to be tracked in output buffer bytes.
+    """
+    return byte_count >> 1
+
+cdef inline Uint32 xorshift32(Uint32 state) nogil:
+    """
+    Advances a xorshift pseudo random number generator (used to generate dither noise
+    without any locking or allocation in the audio thread).
+    Args:
+        state: The current (non-zero) generator state
+
+    Returns:
+        The next generator state/random value
+    """
+    state ^= state << 13
+    state ^= state >> 17
+    state ^= state << 5
+    return state
+
+cdef inline int lowest_set_bit_index(Uint32 mask) nogil:
+    """
+    Returns the index of the lowest bit set in a bit mask.
+    Args:
+        mask: The (non-zero) bit mask
+
+    Returns:
+        The zero-based index of the lowest set bit (-1 if no bit is set)
+    """
+    return SDL_MostSignificantBitIndex32(mask & (~mask + 1))
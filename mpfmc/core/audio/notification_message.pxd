@@ -1,3 +1,4 @@
+from libc.string cimport memset
 from mpfmc.core.audio.sdl2 cimport *
 from mpfmc.core.audio.gstreamer cimport *
 from mpfmc.core.audio.track cimport TrackState
@@ -45,16 +46,107 @@ ctypedef struct NotificationMessageContainer:
     NotificationMessageData data
 
 
+# ---------------------------------------------------------------------------
+#    Notification Message queue
+# ---------------------------------------------------------------------------
+
+# The number of slots in a track notification message queue (must be a power of two,
+# one slot is always left empty to tell a full queue from an empty one)
+cdef enum:
+    NOTIFICATION_MESSAGE_QUEUE_SIZE = 256
+
+ctypedef struct NotificationMessageQueue:
+    # Single-producer/single-consumer lock-free ring buffer of notification messages. Messages
+    # are written by the audio callback (or by the main thread while it holds the audio lock) and
+    # are read by the main thread without taking the audio lock.
+    NotificationMessageContainer messages[NOTIFICATION_MESSAGE_QUEUE_SIZE]
+    SDL_atomic_t write_index
+    SDL_atomic_t read_index
+    SDL_atomic_t dropped
+
+
 # ---------------------------------------------------------------------------
 #    Notification Message functions
 # ---------------------------------------------------------------------------
 
-cdef inline NotificationMessageContainer *_create_notification_message() nogil:
+cdef inline NotificationMessageQueue *create_notification_message_queue() nogil:
+    """
+    Creates a new (empty) notification message queue.
+    :return: A pointer to the new notification message queue.
+    """
+    return <NotificationMessageQueue*>g_slice_alloc0(sizeof(NotificationMessageQueue))
+
+cdef inline void free_notification_message_queue(NotificationMessageQueue *queue) nogil:
     """
-    Creates a new notification message.
-    :return: A pointer to the new notification message.
+    Frees a notification message queue.
+    Args:
+        queue: The notification message queue to free
+    """
+    if queue != NULL:
+        g_slice_free1(sizeof(NotificationMessageQueue), queue)
+
+cdef inline NotificationMessageContainer *_create_notification_message(TrackState *track) nogil:
+    """
+    Reserves the next free message in the track notification message queue.  The message is not
+    visible to the main thread until it is published with _send_notification_message.
+    :return: A pointer to the new notification message or NULL if the queue is full (in which
+        case the message is counted as dropped).
+    """
+    cdef NotificationMessageQueue *queue = <NotificationMessageQueue*>track.notification_messages
+    cdef int write_index
+
+    if queue == NULL:
+        return NULL
+
+    write_index = SDL_AtomicGet(&queue.write_index)
+    if ((write_index + 1) & (NOTIFICATION_MESSAGE_QUEUE_SIZE - 1)) == SDL_AtomicGet(&queue.read_index):
+        SDL_AtomicAdd(&queue.dropped, 1)
+        return NULL
+
+    memset(&queue.messages[write_index], 0, sizeof(NotificationMessageContainer))
+    return &queue.messages[write_index]
+
+cdef inline void _send_notification_message(TrackState *track) nogil:
+    """
+    Publishes the message reserved by _create_notification_message to the main thread.
+    Args:
+        track: The TrackState pointer
+    """
+    cdef NotificationMessageQueue *queue = <NotificationMessageQueue*>track.notification_messages
+    SDL_AtomicSet(&queue.write_index,
+                  (SDL_AtomicGet(&queue.write_index) + 1) & (NOTIFICATION_MESSAGE_QUEUE_SIZE - 1))
+
+cdef inline NotificationMessageContainer *get_next_notification_message(TrackState *track) nogil:
+    """
+    Returns the oldest unprocessed notification message of a track (main thread only).
+    Args:
+        track: The TrackState pointer
+
+    Returns:
+        A pointer to the message or NULL if there are no messages waiting.  The message must
+        be released with release_notification_message once it has been processed.
+    """
+    cdef NotificationMessageQueue *queue = <NotificationMessageQueue*>track.notification_messages
+    cdef int read_index
+
+    if queue == NULL:
+        return NULL
+
+    read_index = SDL_AtomicGet(&queue.read_index)
+    if read_index == SDL_AtomicGet(&queue.write_index):
+        return NULL
+
+    return &queue.messages[read_index]
+
+cdef inline void release_notification_message(TrackState *track) nogil:
+    """
+    Releases the message returned by get_next_notification_message so its slot can be reused.
+    Args:
+        track: The TrackState pointer
     """
-    return <NotificationMessageContainer*>g_slice_alloc0(sizeof(NotificationMessageContainer))
+    cdef NotificationMessageQueue *queue = <NotificationMessageQueue*>track.notification_messages
+    SDL_AtomicSet(&queue.read_index,
+                  (SDL_AtomicGet(&queue.read_index) + 1) & (NOTIFICATION_MESSAGE_QUEUE_SIZE - 1))
 
 cdef inline void send_sound_started_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,
                                                  TrackState *track) nogil:
@@ -66,14 +158,14 @@ cdef inline void send_sound_started_notification(int player, Uint64 sound_id, Ui
         sound_instance_id: The sound instance id
         track: The TrackState pointer
     """
-    cdef NotificationMessageContainer *notification_message = _create_notification_message()
+    cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
     if notification_message != NULL:
         notification_message.message = notification_sound_started
         notification_message.player = player
         notification_message.sound_id = sound_id
         notification_message.sound_instance_id = sound_instance_id
 
-        track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+        _send_notification_message(track)
 
 cdef inline void send_sound_stopped_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,
                                                  TrackState *track) nogil:
@@ -85,14 +177,14 @@ cdef inline void send_sound_stopped_notification(int player, Uint64 sound_id, Ui
         sound_instance_id: The sound instance id
         track: The TrackState pointer
     """
-    cdef NotificationMessageContainer *notification_message = _create_notification_message()
+    cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
     if notification_message != NULL:
         notification_message.message = notification_sound_stopped
         notification_message.player = player
         notification_message.sound_id = sound_id
         notification_message.sound_instance_id = sound_instance_id
 
-        track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+        _send_notification_message(track)
 
 cdef inline void send_sound_looping_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,
                                                  TrackState *track) nogil:
@@ -104,14 +196,14 @@ cdef inline void send_sound_looping_notification(int player, Uint64 sound_id, Ui
         sound_instance_id: The sound instance id
         track: The TrackState pointer
     """
-    cdef NotificationMessageContainer *notification_message = _create_notification_message()
+    cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
     if notification_message != NULL:
         notification_message.message = notification_sound_looping
         notification_message.player = player
         notification_message.sound_id = sound_id
         notification_message.sound_instance_id = sound_instance_id
 
-        track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+        _send_notification_message(track)
 
 cdef inline void send_sound_about_to_finish_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,
                                                          TrackState *track) nogil:
@@ -123,14 +215,14 @@ cdef inline void send_sound_about_to_finish_notification(int player, Uint64 soun
         sound_instance_id: The sound instance id
         track: The TrackState pointer
     """
-    cdef NotificationMessageContainer *notification_message = _create_notification_message()
+    cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
     if notification_message != NULL:
         notification_message.message = notification_sound_about_to_finish
         notification_message.player = player
         notification_message.sound_id = sound_id
         notification_message.sound_instance_id = sound_instance_id
 
-        track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+        _send_notification_message(track)
 
 cdef inline void send_sound_marker_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,
                                                 TrackState *track,
@@ -144,7 +236,7 @@ cdef inline void send_sound_marker_notification(int player, Uint64 sound_id, Uin
         track: The TrackState pointer
         marker_id: The id of the marker being sent for the specified sound
     """
-    cdef NotificationMessageContainer *notification_message = _create_notification_message()
+    cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
     if notification_message != NULL:
         notification_message.message = notification_sound_marker
         notification_message.player = player
@@ -152,7 +244,7 @@ cdef inline void send_sound_marker_notification(int player, Uint64 sound_id, Uin
         notification_message.sound_instance_id = sound_instance_id
         notification_message.data.marker.id = marker_id
 
-        track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+        _send_notification_message(track)
 
 cdef inline void send_track_stopped_notification(TrackState *track) nogil:
     """
@@ -160,10 +252,10 @@ cdef inline void send_track_stopped_notification(TrackState *track) nogil:
     Args:
         track: The TrackState pointer
     """
-    cdef NotificationMessageContainer *notification_message = _create_notification_message()
+    cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
     if notification_message != NULL:
         notification_message.message = notification_track_stopped
-        track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+        _send_notification_message(track)
 
 cdef inline void send_track_paused_notification(TrackState *track) nogil:
     """
@@ -171,10 +263,10 @@ cdef inline void send_track_paused_notification(TrackState *track) nogil:
     Args:
         track: The TrackState pointer
     """
-    cdef NotificationMessageContainer *notification_message = _create_notification_message()
+    cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
     if notification_message != NULL:
         notification_message.message = notification_track_paused
-        track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+        _send_notification_message(track)
 
 cdef inline void send_sound_loop_set_started_notification(int sound_loop_set_id, Uint64 sound_id, gpointer player, TrackState *track) nogil:
     """
@@ -185,7 +277,7 @@ cdef inline void send_sound_loop_set_started_notification(int sound_loop_set_id,
         player: A pointer to the sound loop player that was playing this sound loop set 
         track: The TrackState pointer
     """
-    cdef NotificationMessageContainer *notification_message = _create_notification_message()
+    cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
     if notification_message != NULL:
         notification_message.message = notification_sound_loop_set_started
         notification_message.player = 0
@@ -194,7 +286,7 @@ cdef inline void send_sound_loop_set_started_notification(int sound_loop_set_id,
         notification_message.data.sound_loop_set.id = sound_loop_set_id
         notification_message.data.sound_loop_set.player = player
 
-        track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+        _send_notification_message(track)
 
 cdef inline void send_sound_loop_set_stopped_notification(int sound_loop_set_id, Uint64 sound_id, gpointer player, TrackState *track) nogil:
     """
@@ -205,7 +297,7 @@ cdef inline void send_sound_loop_set_stopped_notification(int sound_loop_set_id,
         player: A pointer to the sound loop player that was playing this sound loop set 
         track: The TrackState pointer
     """
-    cdef NotificationMessageContainer *notification_message = _create_notification_message()
+    cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
     if notification_message != NULL:
         notification_message.message = notification_sound_loop_set_stopped
         notification_message.player = 0
@@ -214,7 +306,7 @@ cdef inline void send_sound_loop_set_stopped_notification(int sound_loop_set_id,
         notification_message.data.sound_loop_set.id = sound_loop_set_id
         notification_message.data.sound_loop_set.player = player
 
-        track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+        _send_notification_message(track)
 
 cdef inline void send_sound_loop_set_looping_notification(int sound_loop_set_id, Uint64 sound_id, gpointer player, TrackState *track) nogil:
     """
@@ -225,7 +317,7 @@ cdef inline void send_sound_loop_set_looping_notification(int sound_loop_set_id,
         player: A pointer to the sound loop player that was playing this sound loop set 
         track: The TrackState pointer
     """
-    cdef NotificationMessageContainer *notification_message = _create_notification_message()
+    cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
     if notification_message != NULL:
         notification_message.message = notification_sound_loop_set_looping
         notification_message.player = 0
@@ -234,5 +326,5 @@ cdef inline void send_sound_loop_set_looping_notification(int sound_loop_set_id,
         notification_message.data.sound_loop_set.id = sound_loop_set_id
         notification_message.data.sound_loop_set.player = player
 
-        track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+        _send_notification_message(track)
 
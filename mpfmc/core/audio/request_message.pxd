@@ -1,3 +1,11 @@
+from libc.string cimport memset
+from mpfmc.core.audio.sdl2 cimport *
+from mpfmc.core.audio.gstreamer cimport *
+from mpfmc.core.audio.sound_file cimport SoundSample
+from mpfmc.core.audio.track cimport TrackState
+from mpfmc.core.audio.track_standard cimport SoundSettings
+
+
 # ---------------------------------------------------------------------------
 #    Request Message types
 # ---------------------------------------------------------------------------
@@ -8,20 +16,14 @@ cdef enum RequestMessage:
     request_sound_replace = 3             # Request to play a sound that replaces a sound in progress
     request_sound_stop = 4                # Request to stop a sound that is playing
     request_sound_stop_looping = 5        # Request to stop looping a sound that is playing
+    request_sound_stop_all = 6            # Request to stop all sounds that are playing
+    request_sound_reset = 7               # Request to stop all sounds immediately (without notifications)
 
 
 ctypedef struct RequestMessageDataPlaySound:
-    SoundSample *sample
-    Uint8 volume
-    int loops
-    int priority
-    Uint32 start_at_position
-    Uint32 fade_in_duration
-    Uint32 fade_out_duration
-    int marker_count
-    GArray *markers
-    bint sound_has_ducking
-    DuckingSettings ducking_settings
+    # Fully prepared settings of the sound to play (the markers array belongs to the message
+    # slot, the ducking control points array is not used)
+    SoundSettings settings
 
 ctypedef struct RequestMessageDataStopSound:
     Uint32 fade_out_duration
@@ -39,3 +41,111 @@ ctypedef struct RequestMessageContainer:
     RequestMessageData data
 
 
+# ---------------------------------------------------------------------------
+#    Request Message queue
+# ---------------------------------------------------------------------------
+
+# The number of slots in a track request message queue (must be a power of two,
+# one slot is always left empty to tell a full queue from an empty one)
+cdef enum:
+    REQUEST_MESSAGE_QUEUE_SIZE = 64
+
+ctypedef struct RequestMessageQueue:
+    # Single-producer/single-consumer lock-free ring buffer of request messages. Messages are
+    # written by the main thread and applied by the audio callback at the start of a buffer
+    # (also while the track is stopped or paused), neither side takes the audio lock.  Only the
+    # audio callback reads messages from the queue.
+    RequestMessageContainer messages[REQUEST_MESSAGE_QUEUE_SIZE]
+    GArray *markers[REQUEST_MESSAGE_QUEUE_SIZE]     # Sound marker positions of play requests
+    SDL_atomic_t write_index
+    SDL_atomic_t read_index
+
+
+# ---------------------------------------------------------------------------
+#    Request Message functions
+# ---------------------------------------------------------------------------
+
+cdef inline RequestMessageQueue *create_request_message_queue() nogil:
+    """
+    Creates a new (empty) request message queue.
+    :return: A pointer to the new request message queue.
+    """
+    cdef RequestMessageQueue *queue = <RequestMessageQueue*>g_slice_alloc0(sizeof(RequestMessageQueue))
+    cdef int i
+    for i in range(REQUEST_MESSAGE_QUEUE_SIZE):
+        queue.markers[i] = g_array_new(False, False, sizeof(guint))
+    return queue
+
+cdef inline void free_request_message_queue(RequestMessageQueue *queue) nogil:
+    """
+    Frees a request message queue.
+    Args:
+        queue: The request message queue to free
+    """
+    cdef int i
+    if queue != NULL:
+        for i in range(REQUEST_MESSAGE_QUEUE_SIZE):
+            g_array_free(queue.markers[i], True)
+        g_slice_free1(sizeof(RequestMessageQueue), queue)
+
+cdef inline RequestMessageContainer *create_request_message(TrackState *track) nogil:
+    """
+    Reserves the next free message in the track request message queue (main thread only).  The
+    message is not visible to the audio callback until it is published with send_request_message.
+    :return: A pointer to the new request message or NULL if the queue is full.
+    """
+    cdef RequestMessageQueue *queue = <RequestMessageQueue*>track.request_messages
+    cdef int write_index
+
+    if queue == NULL:
+        return NULL
+
+    write_index = SDL_AtomicGet(&queue.write_index)
+    if ((write_index + 1) & (REQUEST_MESSAGE_QUEUE_SIZE - 1)) == SDL_AtomicGet(&queue.read_index):
+        return NULL
+
+    memset(&queue.messages[write_index], 0, sizeof(RequestMessageContainer))
+    queue.messages[write_index].data.play.settings.markers = queue.markers[write_index]
+    return &queue.messages[write_index]
+
+cdef inline void send_request_message(TrackState *track) nogil:
+    """
+    Publishes the message reserved by create_request_message to the audio callback.
+    Args:
+        track: The TrackState pointer
+    """
+    cdef RequestMessageQueue *queue = <RequestMessageQueue*>track.request_messages
+    SDL_AtomicSet(&queue.write_index,
+                  (SDL_AtomicGet(&queue.write_index) + 1) & (REQUEST_MESSAGE_QUEUE_SIZE - 1))
+
+cdef inline RequestMessageContainer *get_next_request_message(TrackState *track) nogil:
+    """
+    Returns the oldest request message of a track that has not been applied (audio callback only).
+    Args:
+        track: The TrackState pointer
+
+    Returns:
+        A pointer to the message or NULL if there are no messages waiting.  The message must
+        be released with release_request_message once it has been applied.
+    """
+    cdef RequestMessageQueue *queue = <RequestMessageQueue*>track.request_messages
+    cdef int read_index
+
+    if queue == NULL:
+        return NULL
+
+    read_index = SDL_AtomicGet(&queue.read_index)
+    if read_index == SDL_AtomicGet(&queue.write_index):
+        return NULL
+
+    return &queue.messages[read_index]
+
+cdef inline void release_request_message(TrackState *track) nogil:
+    """
+    Releases the message returned by get_next_request_message so its slot can be reused.
+    Args:
+        track: The TrackState pointer
+    """
+    cdef RequestMessageQueue *queue = <RequestMessageQueue*>track.request_messages
+    SDL_AtomicSet(&queue.read_index,
+                  (SDL_AtomicGet(&queue.read_index) + 1) & (REQUEST_MESSAGE_QUEUE_SIZE - 1))
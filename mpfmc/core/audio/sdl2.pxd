@@ -91,7 +91,7 @@ cdef extern from "SDL.h" nogil:
         pass
 
     ctypedef int (*SDLCALL)(void *)
-    SDL_Thread *SDL_CreateThread(SDLCALL, void *data)
+    SDL_Thread *SDL_CreateThread(SDLCALL fn, const char *name, void *data)
     void SDL_WaitThread(SDL_Thread *thread, int *status)
     Uint32 SDL_ThreadID()
 
@@ -112,6 +112,7 @@ cdef extern from "SDL.h" nogil:
     void SDL_Delay(int)
     int SDL_Init(int)
     int SDL_InitSubSystem(Uint32 flags)
+    int SDL_AudioInit(const char *driver_name)
     void SDL_Quit()
     void SDL_LockAudio()
     void SDL_UnlockAudio()
@@ -120,9 +121,22 @@ cdef extern from "SDL.h" nogil:
                                                 Uint32 len, int volume)
     SDL_AudioSpec* SDL_LoadWAV(const char* file, SDL_AudioSpec* spec, Uint8** audio_buf, Uint32* audio_len)
     void SDL_FreeWAV(Uint8* audio_buf)
+    void *SDL_malloc(size_t size)
     void SDL_free(void *ptr)
 
+    ctypedef struct SDL_atomic_t:
+        int value
+
+    int SDL_AtomicGet(SDL_atomic_t *a)
+    int SDL_AtomicSet(SDL_atomic_t *a, int v)
+    int SDL_AtomicAdd(SDL_atomic_t *a, int v)
+    SDL_bool SDL_AtomicCAS(SDL_atomic_t *a, int oldval, int newval)
+
     Uint32 SDL_GetTicks()
+    Uint64 SDL_GetPerformanceCounter()
+    Uint64 SDL_GetPerformanceFrequency()
+
+    int SDL_MostSignificantBitIndex32(Uint32 x)
 
     struct SDL_version:
         Uint8 major
@@ -248,6 +262,12 @@ cdef union Sample16:
 #    Audio Callback Data type
 # ---------------------------------------------------------------------------
 
+cdef enum:
+    # The callback load histogram has CALLBACK_LOAD_HISTOGRAM_RESOLUTION buckets per buffer
+    # period (5% each) up to twice the buffer period, the last bucket counts all longer callbacks
+    CALLBACK_LOAD_HISTOGRAM_RESOLUTION = 20
+    CALLBACK_LOAD_HISTOGRAM_BUCKETS = 41
+
 ctypedef struct AudioCallbackData:
     # A pointer to this struct is passed to the main audio callback function and
     # is the only way data is made available to the main audio thread.  Must not
@@ -265,4 +285,20 @@ ctypedef struct AudioCallbackData:
     Uint8 silence
     Uint8 track_count
     void **tracks
+    float *mix_bus
+    float *dither_table
+    Uint32 dither_table_size
+    Uint32 dither_state
+    Uint64 callback_count
+    Uint64 tracks_mixed
+    Uint64 tracks_skipped
+    float callback_load
+    float callback_load_peak
+    Uint64 last_callback_time
+    Uint64 dropouts
+    Uint64 overruns
+    Uint32 load_histogram[CALLBACK_LOAD_HISTOGRAM_BUCKETS]
+    Uint32 stream_lead_bytes
+    Uint32 stream_prebuffer_bytes
+    void *stream_decoder
     FILE *c_log_file
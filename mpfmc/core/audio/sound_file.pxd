@@ -6,6 +6,28 @@ ctypedef struct SampleMemory:
     gpointer data
     gsize size
 
+ctypedef struct StreamRingBuffer:
+    # Single-producer (decode worker)/single-consumer (audio callback) ring buffer of
+    # decoded PCM data.  The read and write positions are free running byte counters
+    # (the size is a power of two so they are mapped to the buffer using a mask).
+    Uint8 *data
+    Uint32 size
+    SDL_atomic_t write_pos
+    SDL_atomic_t read_pos
+    SDL_atomic_t end_pending
+    Uint32 end_pos
+
+cdef enum StreamResetStatus:
+    # Reset requests are carried out by the decode workers: the main thread requests a reset,
+    # a worker flushes and positions the stream and the audio callback then restarts reading.
+    # A sound whose pipeline was reassigned waits for a pipeline to be attached again before
+    # the reset is requested.
+    stream_reset_none = 0
+    stream_reset_requested = 1
+    stream_reset_applying = 2
+    stream_reset_ready = 3
+    stream_reset_attaching = 4
+
 ctypedef struct SampleStream:
     GstElement *pipeline
     GstElement *sink
@@ -14,7 +36,18 @@ ctypedef struct SampleStream:
     GstMapInfo map_info
     Uint32 map_buffer_pos
     gboolean map_contains_valid_sample_data
-    gint null_buffer_count
+    StreamRingBuffer ring
+    Uint32 lead_bytes
+    Uint8 *prebuffer
+    Uint32 prebuffer_size
+    gint64 prebuffer_end_time
+    SDL_atomic_t active
+    SDL_atomic_t busy
+    SDL_atomic_t loop
+    SDL_atomic_t eos
+    SDL_atomic_t reset
+    double reset_start_at
+    Uint64 underruns
 
 cdef enum SoundType:
     sound_type_memory = 0
@@ -29,6 +62,80 @@ ctypedef struct SoundSample:
     SoundSampleData data
     double duration
 
+cdef enum:
+    MAX_STREAM_DECODER_STREAMS = 64
+    MAX_STREAM_DECODER_THREADS = 4
+
+ctypedef struct StreamDecoder:
+    # Pool of decode worker threads that keep the ring buffers of all registered
+    # (active) streaming sounds filled to their lead time.
+    SDL_mutex *mutex
+    SampleStream *streams[MAX_STREAM_DECODER_STREAMS]
+    int stream_count
+    SDL_atomic_t running
+    SDL_Thread *threads[MAX_STREAM_DECODER_THREADS]
+    int thread_count
+
+
+# ---------------------------------------------------------------------------
+#    Stream decoder functions
+# ---------------------------------------------------------------------------
+cdef StreamDecoder *create_stream_decoder(int thread_count)
+cdef void free_stream_decoder(StreamDecoder *decoder)
+cdef bint register_stream(StreamDecoder *decoder, SampleStream *stream)
+cdef void unregister_stream(StreamDecoder *decoder, SampleStream *stream)
+cdef Uint64 get_stream_underruns(StreamDecoder *decoder)
+cdef void reset_stream(SampleStream *stream, double start_at, bint loop)
+cdef void fill_streams(StreamDecoder *decoder, GstClockTime timeout) nogil
+cdef bint fill_stream(SampleStream *stream, GstClockTime timeout) nogil
+cdef void apply_stream_reset(SampleStream *stream) nogil
+cdef int stream_decoder_thread(void *data) nogil
+
+cdef inline bint stream_needs_decoding(SampleStream *stream) nogil:
+    """Returns whether or not a decode worker needs to service a stream (fill it or carry out a reset)"""
+    cdef int reset = SDL_AtomicGet(&stream.reset)
+    return SDL_AtomicGet(&stream.active) and reset != stream_reset_attaching and \
+        (reset == stream_reset_requested or not SDL_AtomicGet(&stream.eos))
+
+cdef inline void stop_stream(SampleStream *stream) nogil:
+    """Stops decoding a stream (and cancels a start that waits for its pipeline to be attached)"""
+    SDL_AtomicCAS(&stream.reset, stream_reset_attaching, stream_reset_none)
+    SDL_AtomicSet(&stream.active, 0)
+
+cdef inline Uint32 stream_ring_readable(StreamRingBuffer *ring, Uint32 *contiguous) nogil:
+    """
+    Returns the number of bytes that can be read from a stream ring buffer.  Reading stops
+    at the end of stream marker (if one is pending).
+    Args:
+        ring: A pointer to the StreamRingBuffer
+        contiguous: Receives the number of readable bytes that are stored contiguously
+            (before the end of the ring buffer memory)
+
+    Returns:
+        The number of bytes that can be read
+    """
+    cdef Uint32 read_pos = <Uint32>SDL_AtomicGet(&ring.read_pos)
+    cdef Uint32 available = <Uint32>SDL_AtomicGet(&ring.write_pos) - read_pos
+    cdef Uint32 offset = read_pos & (ring.size - 1)
+
+    if SDL_AtomicGet(&ring.end_pending) and ring.end_pos - read_pos < available:
+        available = ring.end_pos - read_pos
+
+    contiguous[0] = min(available, ring.size - offset)
+    return available
+
+cdef inline Uint8 *stream_ring_read_pointer(StreamRingBuffer *ring) nogil:
+    """Returns a pointer to the next byte to read from a stream ring buffer"""
+    return ring.data + (<Uint32>SDL_AtomicGet(&ring.read_pos) & (ring.size - 1))
+
+cdef inline void stream_ring_consume(StreamRingBuffer *ring, Uint32 length) nogil:
+    """Marks the specified number of bytes in a stream ring buffer as read"""
+    SDL_AtomicAdd(&ring.read_pos, <int>length)
+
+cdef inline bint stream_ring_at_end(StreamRingBuffer *ring) nogil:
+    """Returns whether or not all data up to the end of stream marker has been read"""
+    return SDL_AtomicGet(&ring.end_pending) and <Uint32>SDL_AtomicGet(&ring.read_pos) == ring.end_pos
+
 
 cdef class SoundFile:
     """SoundFile is the base class for wrapper classes used to manage sound sample data."""
@@ -44,12 +151,48 @@ cdef class SoundMemoryFile(SoundFile):
     cdef bint _loaded_using_sdl
 
 
-cdef class SoundStreamingFile(SoundFile):
-    """SoundStreamingFile is a wrapper class to manage streaming sound sample data."""
+cdef class StreamingPipelinePool
+
+
+cdef class StreamingPipeline:
+    """StreamingPipeline is a wrapper class for a reusable GStreamer pipeline used to
+    decode streaming sounds."""
     cdef GstElement *pipeline
     cdef GstElement *source
     cdef GstElement *convert
-    cdef GstElement *resample
     cdef GstElement *sink
     cdef GstBus *bus
-    cdef gulong bus_message_handler_id
+    cdef gulong pad_added_handler_id
+    cdef tuple caps_key
+    cdef str uri
+    cdef object owner
+    cdef double last_used
+
+
+cdef class SoundStreamingFile(SoundFile):
+    """SoundStreamingFile is a wrapper class to manage streaming sound sample data."""
+    cdef StreamingPipelinePool pool
+    cdef StreamingPipeline pipeline
+    cdef bint registered
+    cdef bint is_loaded
+    cdef bint attaching
+    cdef object attach_thread
+
+
+cdef class StreamingPipelinePool:
+    """StreamingPipelinePool manages the GStreamer pipelines shared by streaming sounds."""
+    cdef AudioCallbackData *callback_data
+    cdef int max_pipelines
+    cdef int pipeline_count
+    cdef dict idle_pipelines
+    cdef list in_use
+    cdef object lock
+    cdef object log
+    cdef int constructed
+    cdef int reused
+    cdef int stolen
+    cdef int destroyed
+    cdef double construction_time
+
+    cdef _attach(self, StreamingPipeline pipeline, SoundStreamingFile owner)
+    cdef StreamingPipeline _reassign_pipeline(self, tuple caps_key)
@@ -1,12 +1,17 @@
 #!python
 #cython: embedsignature=True, language_level=3
 
+from libc.string cimport memcpy
+from libc.stdio cimport FILE, fopen, fread, fseek, fclose, SEEK_SET
 from cpython.mem cimport PyMem_Malloc, PyMem_Realloc, PyMem_Free
 cimport cpython.pycapsule as pycapsule
 import logging
 import os
+import threading
+import time
 
 from mpfmc.core.audio.audio_exception import AudioException
+from mpfmc.core.audio.sound_normalizer import read_wav_format, WAVE_FORMAT_PCM
 from mpfmc.core.audio.sdl2 cimport *
 from mpfmc.core.audio.gstreamer cimport *
 from mpfmc.core.audio.sound_file cimport *
@@ -81,6 +86,13 @@ cdef class SoundMemoryFile(SoundFile):
         if not os.path.isfile(self.file_name):
             raise AudioException('Could not locate file ' + self.file_name)
 
+        # Files that are already in the output format (such as the sound files normalized by the
+        # build_sounds command) are loaded without any conversion
+        if self._load_normalized_wav():
+            self.log.debug('Loaded file (no conversion): %s Sample duration: %s',
+                           self.file_name, self.sample.duration)
+            return
+
         # Load the audio file (will be converted to current sample output format)
         chunk = Mix_LoadWAV(self.file_name.encode('utf-8'))
         if chunk == NULL:
@@ -103,6 +115,59 @@ cdef class SoundMemoryFile(SoundFile):
         self.log.debug('Loaded file: %s Sample duration: %s',
                        self.file_name, self.sample.duration)
 
+    def _load_normalized_wav(self):
+        """
+        Loads the sample data of a WAV file with a straight read if the file is already in the
+        output format (sample rate, channels and 16-bit little endian samples).
+        Returns:
+            True if the file was loaded, False if the file is not in the output format
+        """
+        cdef Uint32 frame_bytes = self.callback_data.bytes_per_sample * self.callback_data.channels
+        cdef Uint32 size
+        cdef size_t bytes_read
+        cdef void *data
+        cdef FILE *wav_file
+
+        wav_format = read_wav_format(self.file_name)
+        if wav_format is None or wav_format.format_tag != WAVE_FORMAT_PCM or \
+                wav_format.sample_rate != self.callback_data.sample_rate or \
+                wav_format.channels != self.callback_data.channels or \
+                wav_format.bits_per_sample != self.callback_data.bytes_per_sample * 8 or \
+                not SDL_AUDIO_ISLITTLEENDIAN(self.callback_data.format):
+            return False
+
+        # Only whole sample frames are loaded
+        size = wav_format.data_size - wav_format.data_size % frame_bytes
+        if size == 0:
+            return False
+
+        # The sample memory is allocated with SDL_malloc as it is freed with SDL_free on unload
+        # (just like sample memory loaded by SDL_Mixer)
+        data = SDL_malloc(size)
+        if data == NULL:
+            raise AudioException('Unable to allocate memory for sound file ' + self.file_name)
+
+        file_name = self.file_name.encode('utf-8')
+        wav_file = fopen(file_name, "rb")
+        if wav_file == NULL:
+            SDL_free(data)
+            return False
+
+        bytes_read = 0
+        if fseek(wav_file, wav_format.data_offset, SEEK_SET) == 0:
+            with nogil:
+                bytes_read = fread(data, 1, size, wav_file)
+        fclose(wav_file)
+
+        if bytes_read != size:
+            SDL_free(data)
+            return False
+
+        self.sample.data.memory.data = <gpointer>data
+        self.sample.data.memory.size = <gsize>size
+        self.sample.duration = self.sample.data.memory.size / self.callback_data.seconds_to_bytes_factor
+        return True
+
     def unload(self):
         """Unloads the sample data from memory"""
         if self.sample.data.memory.data != NULL:
@@ -125,15 +190,24 @@ cdef class SoundStreamingFile(SoundFile):
 
     def __cinit__(self, *args, **kwargs):
         """C constructor"""
-        self.pipeline = NULL
-        self.bus = NULL
-        self.bus_message_handler_id = 0
+        self.pipeline = None
+        self.registered = False
+        self.is_loaded = False
+        self.attaching = False
+        self.attach_thread = None
+
+    def __init__(self, str file_name, object audio_callback_data, StreamingPipelinePool pipeline_pool=None):
+        cdef Uint32 ring_size = 1
 
-    def __init__(self, str file_name, object audio_callback_data):
         # IMPORTANT: Call super class init function
         super().__init__(file_name, audio_callback_data)
         self.log = logging.getLogger("SoundStreamingFile")
 
+        # Sounds loaded without a shared pool get a private pool holding a single pipeline
+        if pipeline_pool is None:
+            pipeline_pool = StreamingPipelinePool(audio_callback_data, 1)
+        self.pool = pipeline_pool
+
         self.sample.type = sound_type_streaming
         self.sample.data.stream = <SampleStream*>PyMem_Malloc(sizeof(SampleStream))
         self.sample.data.stream.pipeline = NULL
@@ -142,12 +216,40 @@ cdef class SoundStreamingFile(SoundFile):
         self.sample.data.stream.buffer = NULL
         self.sample.data.stream.map_contains_valid_sample_data = 0
         self.sample.data.stream.map_buffer_pos = 0
-        self.sample.data.stream.null_buffer_count = 0
+        self.sample.data.stream.lead_bytes = self.callback_data.stream_lead_bytes
+        self.sample.data.stream.prebuffer = NULL
+        self.sample.data.stream.prebuffer_size = 0
+        self.sample.data.stream.prebuffer_end_time = 0
+        self.sample.data.stream.underruns = 0
+        SDL_AtomicSet(&self.sample.data.stream.active, 0)
+        SDL_AtomicSet(&self.sample.data.stream.busy, 0)
+        SDL_AtomicSet(&self.sample.data.stream.loop, 0)
+        SDL_AtomicSet(&self.sample.data.stream.eos, 0)
+        SDL_AtomicSet(&self.sample.data.stream.reset, stream_reset_none)
+        self.sample.data.stream.reset_start_at = 0.0
+
+        # The ring buffer must hold the lead time (or the pre-rolled data if it is larger) plus
+        # some room for the decoder to write into while the audio callback is reading.
+        while ring_size < max(self.callback_data.stream_lead_bytes, self.callback_data.stream_prebuffer_bytes) + \
+                2 * self.callback_data.buffer_size:
+            ring_size <<= 1
+        self.sample.data.stream.ring.data = <Uint8*>PyMem_Malloc(ring_size)
+        self.sample.data.stream.ring.size = ring_size
+        self.sample.data.stream.ring.end_pos = 0
+        SDL_AtomicSet(&self.sample.data.stream.ring.write_pos, 0)
+        SDL_AtomicSet(&self.sample.data.stream.ring.read_pos, 0)
+        SDL_AtomicSet(&self.sample.data.stream.ring.end_pending, 0)
 
         self.load()
 
     def __dealloc__(self):
         if self.sample.data.stream != NULL:
+            if self.registered and self.callback_data.stream_decoder != NULL:
+                unregister_stream(<StreamDecoder*>self.callback_data.stream_decoder, self.sample.data.stream)
+                self.registered = False
+
+            PyMem_Free(self.sample.data.stream.ring.data)
+            PyMem_Free(self.sample.data.stream.prebuffer)
             PyMem_Free(self.sample.data.stream)
             self.sample.data.stream = NULL
 
@@ -167,93 +269,143 @@ cdef class SoundStreamingFile(SoundFile):
                     error.code, <bytes>error.message)
             raise AudioException(msg)
 
-    def _destroy_pipeline(self):
-        """Destroys the GStreamer pipeline"""
-        """Destroys the current pipeline"""
-        cdef GstState current_state, pending_state
-
-        if self.bus != NULL and self.bus_message_handler_id != 0:
-            c_signal_disconnect(<GstElement*>self.bus, self.bus_message_handler_id)
-            self.bus_message_handler_id = 0
+    def _attach_pipeline(self):
+        """Gets a pipeline from the pipeline pool and opens the sound file in it (the pipeline
+        is pre-rolled and ready to play when this function returns)."""
+        self.pool.acquire(self)
+
+        try:
+            self.pipeline.open('file:///' + self.file_name.replace('\\', '/'))
+        except AudioException:
+            self.pool.release(self)
+            raise
+
+    def _publish_pipeline(self):
+        """Stores the pointers to the pipeline and appsink in the SampleStream struct for use
+        in the audio library (the pipeline may be reassigned to another sound from now on
+        whenever this sound is not playing)."""
+        with self.pool.lock:
+            self.sample.data.stream.pipeline = self.pipeline.pipeline
+            self.sample.data.stream.sink = self.pipeline.sink
+
+    def _reattach_pipeline(self):
+        """Attaches a pipeline to the sound again and starts the stream requested by start_stream
+        (runs on its own thread as opening the sound file waits for GStreamer to pre-roll it)."""
+        cdef bint attached = True
+
+        try:
+            self._attach_pipeline()
+        except AudioException as exception:
+            self.log.error("Unable to play streaming sound %s: %s", self.file_name, str(exception))
+            attached = False
+
+        with self.pool.lock:
+            if attached:
+                self.sample.data.stream.pipeline = self.pipeline.pipeline
+                self.sample.data.stream.sink = self.pipeline.sink
+
+                # Request the reset unless the sound has been stopped in the meantime
+                SDL_AtomicSet(&self.sample.data.stream.active, 1)
+                if not SDL_AtomicCAS(&self.sample.data.stream.reset, stream_reset_attaching, stream_reset_requested):
+                    SDL_AtomicSet(&self.sample.data.stream.active, 0)
+            else:
+                # The audio callback ends the sound
+                SDL_AtomicSet(&self.sample.data.stream.reset, stream_reset_none)
+
+            self.attaching = False
+
+    def _detach_pipeline(self):
+        """Removes the pipeline from the stream (called by the pipeline pool while holding its lock)"""
+
+        # Stop the decode workers from filling the stream and wait for any fill in progress
+        SDL_AtomicSet(&self.sample.data.stream.active, 0)
+        with nogil:
+            while SDL_AtomicGet(&self.sample.data.stream.busy):
+                SDL_Delay(1)
 
-        if self.pipeline != NULL:
-            # the state changes are async. if we want to guarantee that the
-            # state is set to NULL, we need to query it. We also put a 5s
-            # timeout for safety, but normally, nobody should hit it.
-            with nogil:
-                gst_element_set_state(self.pipeline, GST_STATE_NULL)
-                gst_element_get_state(self.pipeline, &current_state,
-                        &pending_state, <GstClockTime>5e9)
-            gst_object_unref(self.pipeline)
+        # Done with the streaming buffer, release references to it
+        if self.sample.data.stream.map_contains_valid_sample_data:
+            gst_buffer_unmap(self.sample.data.stream.buffer, &self.sample.data.stream.map_info)
+            gst_sample_unref(self.sample.data.stream.sample)
 
-        if self.bus != NULL:
-            gst_object_unref(self.bus)
+            self.sample.data.stream.buffer = NULL
+            self.sample.data.stream.sample = NULL
+            self.sample.data.stream.map_buffer_pos = 0
+            self.sample.data.stream.map_contains_valid_sample_data = 0
 
-        self.bus = NULL
-        self.pipeline = NULL
+        self.sample.data.stream.pipeline = NULL
+        self.sample.data.stream.sink = NULL
+        self.pipeline = None
 
     def _construct_pipeline(self):
-        """Creates the GStreamer pipeline used to stream the sound data"""
-        cdef GError *error
-        cdef GstSample *sample
+        """Attaches a pooled GStreamer pipeline used to stream the sound data"""
         cdef gint64 duration = 0
 
         # Pipeline structure: uridecodebin --> audioconvert --> audioresample --> appsink
 
-        # If the pipeline has already been created, delete it
-        if self.pipeline != NULL:
-            self._destroy_pipeline()
+        # If a pipeline is already attached, return it to the pool
+        if self.pipeline is not None:
+            self.pool.release(self)
 
-        # Pipeline structure: uridecodebin --> audioconvert --> audioresample --> appsink
+        self._attach_pipeline()
 
-        # Create GStreamer pipeline with the specified caps (from a string)
-        file_path = 'file:///' + self.file_name.replace('\\', '/')
-        if SDL_AUDIO_ISLITTLEENDIAN(self.callback_data.format):
-            audio_format = "S16LE"
-        else:
-            audio_format = "S16BE"
-        pipeline_string = 'uridecodebin uri="{}" ! audioconvert ! audioresample ! appsink name=sink caps="audio/x-raw,rate={},channels={},format={},layout=interleaved" sync=true blocksize={}'.format(
-            file_path, str(self.callback_data.sample_rate), str(self.callback_data.channels), audio_format, self.callback_data.buffer_size)
+        # Get duration of audio file (in nanoseconds)
+        if not gst_element_query_duration(self.pipeline.sink, GST_FORMAT_TIME, &duration):
+            duration = 0
 
-        error = NULL
-        self.pipeline = gst_parse_launch(pipeline_string.encode('utf-8'), &error)
+        # Store duration in seconds
+        self.sample.duration = duration / GST_SECOND
 
-        if error != NULL:
-            msg = 'Unable to create a GStreamer pipeline: code={} message={}'.format(error.code, <bytes>error.message)
-            raise AudioException(msg)
+        self._preroll_stream()
 
-        # Get the pipeline bus (the bus allows applications to receive pipeline messages)
-        self.bus = gst_pipeline_get_bus(<GstPipeline*>self.pipeline)
-        if self.bus == NULL:
-            raise AudioException('Unable to get bus from the pipeline')
+        # The pipeline should now be ready to play.
+        self._publish_pipeline()
 
-        # Enable pipeline messages and callback message handler
-        #gst_bus_enable_sync_message_emission(self.bus)
-        #self.bus_message_handler_id = c_bus_connect_message(self.bus, _on_gst_bus_message, <void*>self.audio_interface)
+    def _preroll_stream(self):
+        """Decodes the beginning of the sound into the stream pre-roll buffer so playback from
+        the start of the sound can begin without waiting for the decoder."""
+        cdef Uint32 prebuffer_bytes = self.callback_data.stream_prebuffer_bytes
+        cdef Uint32 frame_bytes = self.callback_data.bytes_per_sample * self.callback_data.channels
+        cdef Uint32 size = 0
+        cdef Uint32 length
+        cdef GstElement *pipeline = self.pipeline.pipeline
+        cdef GstElement *sink = self.pipeline.sink
+        cdef GstSample *sample
+        cdef GstBuffer *buffer
+        cdef GstMapInfo map_info
 
-        # Get sink
-        self.sink = gst_bin_get_by_name(<GstBin*>self.pipeline, "sink")
+        PyMem_Free(self.sample.data.stream.prebuffer)
+        self.sample.data.stream.prebuffer = NULL
+        self.sample.data.stream.prebuffer_size = 0
+        self.sample.data.stream.prebuffer_end_time = 0
 
-        # Set to PAUSED to make the first frame arrive in the sink
-        ret = gst_element_set_state(self.pipeline, GST_STATE_PAUSED)
+        prebuffer_bytes -= prebuffer_bytes % frame_bytes
+        if prebuffer_bytes == 0:
+            return
 
-        # Get the preroll sample (forces the code to wait until the sample has been completely loaded
-        # which is necessary to retrieve the duration).
-        sample = c_appsink_pull_preroll(self.sink)
-        if sample != NULL:
-            gst_sample_unref(sample)
+        self.sample.data.stream.prebuffer = <Uint8*>PyMem_Malloc(prebuffer_bytes)
 
-        # Get duration of audio file (in nanoseconds)
-        if not gst_element_query_duration(self.sink, GST_FORMAT_TIME, &duration):
-            duration = 0
+        with nogil:
+            gst_element_set_state(pipeline, GST_STATE_PLAYING)
 
-        # Store duration in seconds
-        self.sample.duration = duration / GST_SECOND
+            while size < prebuffer_bytes:
+                sample = c_appsink_pull_sample(sink)
+                if sample == NULL:
+                    break
+
+                buffer = gst_sample_get_buffer(sample)
+                if gst_buffer_map(buffer, &map_info, GST_MAP_READ):
+                    length = min(<Uint32>map_info.size, prebuffer_bytes - size)
+                    memcpy(self.sample.data.stream.prebuffer + size, map_info.data, length)
+                    size += length
+                    gst_buffer_unmap(buffer, &map_info)
+
+                gst_sample_unref(sample)
+
+            gst_element_set_state(pipeline, GST_STATE_PAUSED)
 
-        # The pipeline should now be ready to play.  Store the pointers to the pipeline
-        # and appsink in the SampleStream struct for use in the application.
-        self.sample.data.stream.pipeline = self.pipeline
-        self.sample.data.stream.sink = self.sink
+        self.sample.data.stream.prebuffer_size = size
+        self.sample.data.stream.prebuffer_end_time = <gint64>(<double>size * GST_SECOND / self.callback_data.seconds_to_bytes_factor)
 
     def load(self):
         """Loads the sound into memory using GStreamer"""
@@ -263,6 +415,14 @@ cdef class SoundStreamingFile(SoundFile):
 
         self._gst_init()
         self._construct_pipeline()
+        self.is_loaded = True
+
+        if not self.registered and self.callback_data.stream_decoder != NULL:
+            self.registered = register_stream(<StreamDecoder*>self.callback_data.stream_decoder,
+                                              self.sample.data.stream)
+            if not self.registered:
+                self.log.error("Unable to register streaming sound %s with the stream decoder (the "
+                               "maximum number of streaming sounds has been reached)", self.file_name)
 
         self.log.debug('Loaded file: %s Sample duration: %s',
                        self.file_name, self.sample.duration)
@@ -270,21 +430,750 @@ cdef class SoundStreamingFile(SoundFile):
     def unload(self):
         """Unloads the sample data from memory"""
 
-        # Done with the streaming buffer, release references to it
-        if self.sample.data.stream.map_contains_valid_sample_data:
-            gst_buffer_unmap(self.sample.data.stream.buffer, &self.sample.data.stream.map_info)
-            gst_sample_unref(self.sample.data.stream.sample)
-
-            self.sample.data.stream.buffer = NULL
-            self.sample.data.stream.sample = NULL
-            self.sample.data.stream.map_buffer_pos = 0
-            self.sample.data.stream.map_contains_valid_sample_data = 0
+        # Wait for a pipeline that is being attached again
+        if self.attach_thread is not None:
+            self.attach_thread.join()
+            self.attach_thread = None
+
+        # Stop decoding into the stream ring buffer
+        if self.registered and self.callback_data.stream_decoder != NULL:
+            unregister_stream(<StreamDecoder*>self.callback_data.stream_decoder, self.sample.data.stream)
+            self.registered = False
+
+        self.is_loaded = False
+
+        PyMem_Free(self.sample.data.stream.prebuffer)
+        self.sample.data.stream.prebuffer = NULL
+        self.sample.data.stream.prebuffer_size = 0
+
+        # Return the streaming pipeline to the pool
+        self.pool.release(self)
+
+    def start_stream(self, double start_at, bint loop):
+        """
+        Prepares the stream to begin playback at the specified position.  If the pipeline of
+        the sound has been reassigned to another sound in the meantime, a pipeline is attached
+        again first.  This is done on a separate thread (the sound is silent until the pipeline
+        is ready) unless audio is rendered offline.
+        Args:
+            start_at: The position (in seconds) at which to start playback
+            loop: Whether or not the sound will loop at the end of the stream
+        """
+        cdef StreamDecoder *decoder = <StreamDecoder*>self.callback_data.stream_decoder
+
+        if not self.is_loaded:
+            return
 
-        # Cleanup the streaming pipeline
-        gst_element_set_state(self.pipeline, GST_STATE_NULL)
-        gst_object_unref(self.pipeline)
+        if self.pipeline is None and (decoder == NULL or decoder.thread_count == 0):
+            # Offline rendering does not run in real time, attach the pipeline right away
+            self.log.debug("Re-attaching a streaming pipeline to %s", self.file_name)
+            try:
+                self._attach_pipeline()
+            except AudioException as exception:
+                self.log.error("Unable to play streaming sound %s: %s", self.file_name, str(exception))
+                return
+
+            self._publish_pipeline()
+
+        # The pool lock prevents the pipeline from being reassigned before the stream is active
+        with self.pool.lock:
+            if self.pipeline is None or self.attaching:
+                # The stream is started once the pipeline has been attached
+                self.sample.data.stream.reset_start_at = start_at
+                SDL_AtomicSet(&self.sample.data.stream.loop, loop)
+                SDL_AtomicSet(&self.sample.data.stream.reset, stream_reset_attaching)
+                if self.attaching:
+                    return
+
+                self.log.debug("Re-attaching a streaming pipeline to %s", self.file_name)
+                self.attaching = True
+                self.attach_thread = threading.Thread(target=self._reattach_pipeline,
+                                                      name='StreamingPipelineAttach', daemon=True)
+                self.attach_thread.start()
+
+            elif self.sample.data.stream.pipeline != NULL:
+                reset_stream(self.sample.data.stream, start_at, loop)
 
     @property
     def loaded(self):
         """Returns whether or not the sound file data is loaded in memory"""
-        return self.sample.data.stream != NULL and self.sample.data.stream.pipeline != NULL and self.sample.data.stream.sink != NULL
+        return self.sample.data.stream != NULL and self.is_loaded
+
+    @property
+    def underruns(self):
+        """Returns the number of times playback of the stream ran out of decoded data"""
+        return self.sample.data.stream.underruns
+
+    @property
+    def prebuffer(self):
+        """Returns the pre-rolled data at the beginning of the sound (bytes)"""
+        if self.sample.data.stream.prebuffer == NULL:
+            return b''
+        return (<char*>self.sample.data.stream.prebuffer)[:self.sample.data.stream.prebuffer_size]
+
+    def get_stream_status(self):
+        """
+        Gets the decoding status of the stream.
+        Returns:
+            A dictionary containing whether or not the stream is active, is waiting for its
+            pipeline to be attached again, has a reset pending (not yet carried out by a decode
+            worker or picked up by the audio callback) and has reached the end of the sound, the
+            number of bytes decoded into and played from the ring buffer since the stream was
+            last reset and the ring buffer size.
+        """
+        cdef SampleStream *stream = self.sample.data.stream
+        return {'active': SDL_AtomicGet(&stream.active) != 0,
+                'attaching': self.attaching,
+                'reset_pending': SDL_AtomicGet(&stream.reset) != stream_reset_none,
+                'eos': SDL_AtomicGet(&stream.eos) != 0,
+                'decoded': <Uint32>SDL_AtomicGet(&stream.ring.write_pos),
+                'played': <Uint32>SDL_AtomicGet(&stream.ring.read_pos),
+                'ring_size': stream.ring.size
+                }
+
+
+# ---------------------------------------------------------------------------
+#    StreamingPipeline class
+# ---------------------------------------------------------------------------
+cdef class StreamingPipeline:
+    """StreamingPipeline is a wrapper class for a reusable GStreamer pipeline used to
+    decode streaming sounds.  The sound file played by the pipeline is changed by setting
+    the uri of the decoder, so a pipeline only needs to be constructed once."""
+
+    def __cinit__(self, *args, **kwargs):
+        """C constructor"""
+        self.pipeline = NULL
+        self.source = NULL
+        self.convert = NULL
+        self.sink = NULL
+        self.bus = NULL
+        self.pad_added_handler_id = 0
+
+    def __init__(self, tuple caps_key):
+        self.caps_key = caps_key
+        self.uri = None
+        self.owner = None
+        self.last_used = 0.0
+        self._construct()
+
+    def __dealloc__(self):
+        self._destroy()
+
+    def __repr__(self):
+        return '<StreamingPipeline({})>'.format(self.uri)
+
+    def _construct(self):
+        """Creates the GStreamer pipeline"""
+        cdef GError *error
+
+        # Pipeline structure: uridecodebin --> audioconvert --> audioresample --> appsink
+
+        # Create GStreamer pipeline with the specified caps (from a string).  The decoder is
+        # linked to the converter by a pad-added handler (rather than by the pipeline description)
+        # so the link is made again every time the decoder is started with a new uri.  The appsink
+        # is not synchronized to the clock: the decode workers pull samples as fast as needed to
+        # keep the stream ring buffer filled and the small appsink queue limits how far the
+        # pipeline decodes ahead of them.
+        sample_rate, channels, audio_format, buffer_size = self.caps_key
+        pipeline_string = 'uridecodebin name=source audioconvert name=convert ! audioresample ! appsink name=sink caps="audio/x-raw,rate={},channels={},format={},layout=interleaved" sync=false max-buffers=4 drop=false blocksize={}'.format(
+            sample_rate, channels, audio_format, buffer_size)
+
+        error = NULL
+        self.pipeline = gst_parse_launch(pipeline_string.encode('utf-8'), &error)
+
+        if error != NULL:
+            msg = 'Unable to create a GStreamer pipeline: code={} message={}'.format(error.code, <bytes>error.message)
+            raise AudioException(msg)
+
+        # Get the pipeline bus (the bus allows applications to receive pipeline messages)
+        self.bus = gst_pipeline_get_bus(<GstPipeline*>self.pipeline)
+        if self.bus == NULL:
+            raise AudioException('Unable to get bus from the pipeline')
+
+        self.source = gst_bin_get_by_name(<GstBin*>self.pipeline, "source")
+        self.convert = gst_bin_get_by_name(<GstBin*>self.pipeline, "convert")
+        self.sink = gst_bin_get_by_name(<GstBin*>self.pipeline, "sink")
+        if self.source == NULL or self.convert == NULL or self.sink == NULL:
+            raise AudioException('Unable to get elements from the pipeline')
+
+        self.pad_added_handler_id = c_connect_decoder_pad_added(self.source, self.convert)
+
+    def _destroy(self):
+        """Destroys the GStreamer pipeline"""
+        cdef GstState current_state, pending_state
+
+        if self.source != NULL and self.pad_added_handler_id != 0:
+            c_signal_disconnect(self.source, self.pad_added_handler_id)
+            self.pad_added_handler_id = 0
+
+        if self.pipeline != NULL:
+            # the state changes are async. if we want to guarantee that the
+            # state is set to NULL, we need to query it. We also put a 5s
+            # timeout for safety, but normally, nobody should hit it.
+            with nogil:
+                gst_element_set_state(self.pipeline, GST_STATE_NULL)
+                gst_element_get_state(self.pipeline, &current_state,
+                        &pending_state, <GstClockTime>5e9)
+
+        if self.source != NULL:
+            gst_object_unref(self.source)
+        if self.convert != NULL:
+            gst_object_unref(self.convert)
+        if self.sink != NULL:
+            gst_object_unref(self.sink)
+        if self.bus != NULL:
+            gst_object_unref(self.bus)
+        if self.pipeline != NULL:
+            gst_object_unref(self.pipeline)
+
+        self.source = NULL
+        self.convert = NULL
+        self.sink = NULL
+        self.bus = NULL
+        self.pipeline = NULL
+
+    def open(self, str uri):
+        """
+        Opens a sound file in the pipeline and pre-rolls it (waits until the first sample has
+        been decoded, which is necessary to retrieve the duration).
+        Args:
+            uri: The uri of the sound file
+        """
+        cdef GstSample *sample
+        cdef GstStateChangeReturn ret
+
+        if uri != self.uri:
+            # The decoder uri can only be changed while the pipeline is stopped (idle pipelines
+            # are kept in the READY state)
+            self.reset()
+            uri_bytes = uri.encode('utf-8')
+            c_object_set_string(self.source, "uri", uri_bytes)
+            self.uri = uri
+
+        # Set to PAUSED to make the first frame arrive in the sink
+        with nogil:
+            ret = gst_element_set_state(self.pipeline, GST_STATE_PAUSED)
+            sample = c_appsink_pull_preroll(self.sink)
+            if sample != NULL:
+                gst_sample_unref(sample)
+
+        if ret == GST_STATE_CHANGE_FAILURE:
+            self.reset()
+            raise AudioException('Unable to open {} in a GStreamer pipeline'.format(uri))
+
+    def reset(self):
+        """Stops the pipeline (the decoder is torn down, the pipeline elements are kept)"""
+        cdef GstState current_state, pending_state
+
+        with nogil:
+            gst_element_set_state(self.pipeline, GST_STATE_READY)
+            gst_element_get_state(self.pipeline, &current_state,
+                                  &pending_state, <GstClockTime>5e9)
+
+
+# ---------------------------------------------------------------------------
+#    StreamingPipelinePool class
+# ---------------------------------------------------------------------------
+cdef class StreamingPipelinePool:
+    """
+    StreamingPipelinePool manages the GStreamer pipelines shared by streaming sounds.
+
+    Notes:
+        Pipelines are returned to the pool when a streaming sound is unloaded and reused
+        (with a new uri) by the next streaming sound loaded with the same caps, which avoids
+        constructing a new pipeline for every sound.  The number of pipelines is limited: when
+        all pipelines are attached to loaded sounds, the pipeline of the least recently used
+        sound that is not playing is reassigned (that sound gets a pipeline again when it is
+        played).
+    """
+
+    def __init__(self, object audio_callback_data, int max_pipelines):
+        self.log = logging.getLogger("StreamingPipelinePool")
+        self.callback_data = <AudioCallbackData*>pycapsule.PyCapsule_GetPointer(audio_callback_data, NULL)
+        self.max_pipelines = max(1, max_pipelines)
+        self.pipeline_count = 0
+        self.idle_pipelines = dict()
+        self.in_use = list()
+        self.lock = threading.Lock()
+        self.constructed = 0
+        self.reused = 0
+        self.stolen = 0
+        self.destroyed = 0
+        self.construction_time = 0.0
+
+    def __repr__(self):
+        return '<StreamingPipelinePool({}/{} pipelines)>'.format(self.pipeline_count, self.max_pipelines)
+
+    def _get_caps_key(self):
+        """Returns the key identifying the caps of the pipelines needed for the current audio settings"""
+        if SDL_AUDIO_ISLITTLEENDIAN(self.callback_data.format):
+            audio_format = "S16LE"
+        else:
+            audio_format = "S16BE"
+
+        return (self.callback_data.sample_rate, self.callback_data.channels, audio_format,
+                self.callback_data.buffer_size)
+
+    def acquire(self, SoundStreamingFile owner not None):
+        """
+        Attaches a pipeline to a streaming sound (an idle pipeline with matching caps is reused,
+        otherwise a new pipeline is constructed if the maximum number of pipelines has not been
+        reached, otherwise the pipeline of a sound that is not playing is reassigned).
+        Args:
+            owner: The SoundStreamingFile that will use the pipeline
+        """
+        cdef StreamingPipeline pipeline = None
+        caps_key = self._get_caps_key()
+
+        with self.lock:
+            idle_pipelines = self.idle_pipelines.get(caps_key)
+            if idle_pipelines:
+                pipeline = idle_pipelines.pop()
+                self.reused += 1
+            elif self.pipeline_count < self.max_pipelines:
+                # Reserve the pipeline (it is constructed outside of the lock)
+                self.pipeline_count += 1
+            else:
+                pipeline = self._reassign_pipeline(caps_key)
+                if pipeline is None:
+                    raise AudioException('Unable to get a GStreamer pipeline for {} (all {} pipelines are '
+                                         'in use by playing sounds)'.format(owner.file_name, self.max_pipelines))
+                self.reused += 1
+                self.stolen += 1
+
+            if pipeline is not None:
+                self._attach(pipeline, owner)
+                return
+
+        start_time = time.perf_counter()
+        try:
+            pipeline = StreamingPipeline(caps_key)
+        except AudioException:
+            with self.lock:
+                self.pipeline_count -= 1
+            raise
+
+        with self.lock:
+            self.constructed += 1
+            self.construction_time += time.perf_counter() - start_time
+            self._attach(pipeline, owner)
+
+    def release(self, SoundStreamingFile owner not None):
+        """
+        Detaches the pipeline from a streaming sound and returns it to the pool.
+        Args:
+            owner: The SoundStreamingFile using the pipeline
+        """
+        cdef StreamingPipeline pipeline
+
+        with self.lock:
+            pipeline = owner.pipeline
+            if pipeline is None:
+                return
+
+            owner._detach_pipeline()
+            self.in_use.remove(pipeline)
+            pipeline.owner = None
+
+            if pipeline.caps_key != self._get_caps_key() or self.pipeline_count > self.max_pipelines:
+                self.pipeline_count -= 1
+                self.destroyed += 1
+                pipeline._destroy()
+            else:
+                pipeline.reset()
+                self.idle_pipelines.setdefault(pipeline.caps_key, list()).append(pipeline)
+
+    def clear(self):
+        """Destroys all idle pipelines"""
+        with self.lock:
+            for idle_pipelines in self.idle_pipelines.values():
+                for pipeline in idle_pipelines:
+                    (<StreamingPipeline>pipeline)._destroy()
+                    self.pipeline_count -= 1
+                    self.destroyed += 1
+            self.idle_pipelines.clear()
+
+    def get_stats(self):
+        """
+        Gets the pipeline pool statistics.
+        Returns:
+            A dictionary containing the number of pipelines (in total, in use and idle), the
+            maximum number of pipelines, the number of pipelines constructed, reused (including
+            the ones reassigned from a loaded sound that was not playing) and destroyed, the total
+            pipeline construction time and the construction time saved by reusing pipelines
+            (estimated using the average construction time).
+        """
+        with self.lock:
+            average_construction_time = self.construction_time / self.constructed if self.constructed else 0.0
+            return {'pipelines': self.pipeline_count,
+                    'in_use': len(self.in_use),
+                    'idle': sum(len(idle_pipelines) for idle_pipelines in self.idle_pipelines.values()),
+                    'max_pipelines': self.max_pipelines,
+                    'constructed': self.constructed,
+                    'reused': self.reused,
+                    'reassigned': self.stolen,
+                    'destroyed': self.destroyed,
+                    'construction_time': round(self.construction_time, 4),
+                    'construction_time_saved': round(self.reused * average_construction_time, 4)
+                    }
+
+    cdef _attach(self, StreamingPipeline pipeline, SoundStreamingFile owner):
+        """Attaches a pipeline to a streaming sound (the pool lock must be held)"""
+        pipeline.owner = owner
+        pipeline.last_used = time.perf_counter()
+        owner.pipeline = pipeline
+        self.in_use.append(pipeline)
+
+    cdef StreamingPipeline _reassign_pipeline(self, tuple caps_key):
+        """
+        Detaches the pipeline from the least recently used loaded sound that is not playing
+        (the pool lock must be held).
+
+        Returns:
+            The detached pipeline or None if all pipelines are in use by playing sounds
+        """
+        cdef StreamingPipeline candidate = None
+        cdef StreamingPipeline pipeline
+        cdef SoundStreamingFile owner
+
+        for pipeline in self.in_use:
+            owner = <SoundStreamingFile>pipeline.owner
+
+            # Pipelines of sounds that are still loading or are playing cannot be reassigned
+            if pipeline.caps_key != caps_key or not owner.is_loaded or \
+                    owner.sample.data.stream.pipeline == NULL or \
+                    SDL_AtomicGet(&owner.sample.data.stream.active):
+                continue
+
+            if candidate is None or pipeline.last_used < candidate.last_used:
+                candidate = pipeline
+
+        if candidate is None:
+            return None
+
+        owner = <SoundStreamingFile>candidate.owner
+        self.log.debug("Reassigning the streaming pipeline of %s", owner.file_name)
+        owner._detach_pipeline()
+        self.in_use.remove(candidate)
+        candidate.owner = None
+        candidate.reset()
+        return candidate
+
+
+# ---------------------------------------------------------------------------
+#    Stream decoder
+# ---------------------------------------------------------------------------
+
+# The maximum amount of time a decode worker waits for a decoded sample (nanoseconds)
+DEF STREAM_DECODER_PULL_TIMEOUT = 5000000
+
+cdef StreamDecoder *create_stream_decoder(int thread_count):
+    """
+    Creates a stream decoder and starts its decode worker threads.
+    Args:
+        thread_count: The number of decode worker threads to start (with no worker threads the
+            streams must be filled by calling fill_streams)
+
+    Returns:
+        A pointer to the new StreamDecoder struct
+    """
+    cdef StreamDecoder *decoder = <StreamDecoder*>PyMem_Malloc(sizeof(StreamDecoder))
+    cdef int i
+    decoder.mutex = SDL_CreateMutex()
+    decoder.stream_count = 0
+    decoder.thread_count = max(0, min(thread_count, MAX_STREAM_DECODER_THREADS))
+    SDL_AtomicSet(&decoder.running, 1)
+
+    for i in range(decoder.thread_count):
+        decoder.threads[i] = SDL_CreateThread(stream_decoder_thread, "StreamDecoder", <void*>decoder)
+
+    return decoder
+
+cdef void free_stream_decoder(StreamDecoder *decoder):
+    """Stops the decode worker threads and frees a stream decoder"""
+    cdef int i
+
+    if decoder == NULL:
+        return
+
+    SDL_AtomicSet(&decoder.running, 0)
+    with nogil:
+        for i in range(decoder.thread_count):
+            SDL_WaitThread(decoder.threads[i], NULL)
+
+    SDL_DestroyMutex(decoder.mutex)
+    PyMem_Free(decoder)
+
+cdef bint register_stream(StreamDecoder *decoder, SampleStream *stream):
+    """
+    Adds a stream to the set of streams serviced by the decode workers.
+
+    Returns:
+        True if the stream was registered, False if the maximum number of streams has been reached
+    """
+    cdef bint registered = False
+
+    SDL_LockMutex(decoder.mutex)
+    if decoder.stream_count < MAX_STREAM_DECODER_STREAMS:
+        decoder.streams[decoder.stream_count] = stream
+        decoder.stream_count += 1
+        registered = True
+    SDL_UnlockMutex(decoder.mutex)
+
+    return registered
+
+cdef void unregister_stream(StreamDecoder *decoder, SampleStream *stream):
+    """Removes a stream from the stream decoder (waits for a worker that is filling it to finish)"""
+    cdef int i
+
+    SDL_LockMutex(decoder.mutex)
+    for i in range(decoder.stream_count):
+        if decoder.streams[i] == stream:
+            decoder.stream_count -= 1
+            decoder.streams[i] = decoder.streams[decoder.stream_count]
+            break
+    SDL_UnlockMutex(decoder.mutex)
+
+    # Workers only claim streams while holding the mutex so no new claim can be made now
+    SDL_AtomicSet(&stream.active, 0)
+    with nogil:
+        while SDL_AtomicGet(&stream.busy):
+            SDL_Delay(1)
+
+cdef Uint64 get_stream_underruns(StreamDecoder *decoder):
+    """Returns the total number of underruns of all streams registered with a stream decoder"""
+    cdef Uint64 underruns = 0
+    cdef int i
+
+    if decoder == NULL:
+        return 0
+
+    SDL_LockMutex(decoder.mutex)
+    for i in range(decoder.stream_count):
+        underruns += decoder.streams[i].underruns
+    SDL_UnlockMutex(decoder.mutex)
+
+    return underruns
+
+cdef void reset_stream(SampleStream *stream, double start_at, bint loop):
+    """
+    Requests a stream to begin playback at the specified position.  The request is carried
+    out asynchronously by a decode worker (see apply_stream_reset) so this function never
+    waits for a fill in progress or for GStreamer to flush and seek.  Until the reset is ready
+    the audio callback outputs silence for the stream.
+    Args:
+        stream: A pointer to the SampleStream
+        start_at: The position (in seconds) at which to start playback
+        loop: Whether or not the sound will loop at the end of the stream
+    """
+    stream.reset_start_at = start_at
+    SDL_AtomicSet(&stream.loop, loop)
+    SDL_AtomicSet(&stream.reset, stream_reset_requested)
+    SDL_AtomicSet(&stream.active, 1)
+
+cdef void apply_stream_reset(SampleStream *stream) nogil:
+    """
+    Carries out a requested stream reset (called by the decode worker that claimed the stream).
+    The ring buffer is flushed and (when starting at the beginning of the sound) primed with the
+    pre-rolled data, then the pipeline is positioned where decoding needs to continue.  The
+    audio callback owns the ring read position, so it rewinds it once the reset is ready.
+    Args:
+        stream: A pointer to the SampleStream (claimed by the calling worker)
+    """
+    cdef double start_at
+    cdef gint64 seek_position
+    cdef GstSeekFlags seek_flags
+
+    while SDL_AtomicCAS(&stream.reset, stream_reset_requested, stream_reset_applying):
+        start_at = stream.reset_start_at
+
+        if stream.map_contains_valid_sample_data:
+            gst_buffer_unmap(stream.buffer, &stream.map_info)
+            gst_sample_unref(stream.sample)
+            stream.buffer = NULL
+            stream.sample = NULL
+            stream.map_buffer_pos = 0
+            stream.map_contains_valid_sample_data = 0
+
+        SDL_AtomicSet(&stream.ring.end_pending, 0)
+        SDL_AtomicSet(&stream.eos, 0)
+
+        if start_at <= 0.0 and stream.prebuffer != NULL and stream.prebuffer_size > 0:
+            memcpy(stream.ring.data, stream.prebuffer, stream.prebuffer_size)
+            SDL_AtomicSet(&stream.ring.write_pos, <int>stream.prebuffer_size)
+            seek_position = stream.prebuffer_end_time
+            seek_flags = <GstSeekFlags>(GST_SEEK_FLAG_FLUSH | GST_SEEK_FLAG_ACCURATE)
+        else:
+            SDL_AtomicSet(&stream.ring.write_pos, 0)
+            seek_position = <gint64>(start_at * GST_SECOND)
+            seek_flags = <GstSeekFlags>(GST_SEEK_FLAG_FLUSH | GST_SEEK_FLAG_KEY_UNIT)
+
+        gst_element_seek_simple(stream.pipeline, GST_FORMAT_TIME, seek_flags, seek_position)
+        gst_element_set_state(stream.pipeline, GST_STATE_PLAYING)
+
+        # A new reset may have been requested in the meantime (the loop then applies it again)
+        SDL_AtomicCAS(&stream.reset, stream_reset_applying, stream_reset_ready)
+
+cdef void fill_streams(StreamDecoder *decoder, GstClockTime timeout) nogil:
+    """
+    Fills the ring buffers of all active streams registered with a stream decoder from the
+    calling thread (used when rendering audio offline instead of the decode worker threads).
+    Args:
+        decoder: A pointer to the StreamDecoder
+        timeout: The maximum amount of time to wait for each decoded sample (nanoseconds)
+    """
+    cdef SampleStream *stream
+    cdef int i
+
+    if decoder == NULL:
+        return
+
+    SDL_LockMutex(decoder.mutex)
+    for i in range(decoder.stream_count):
+        stream = decoder.streams[i]
+        if stream_needs_decoding(stream) and SDL_AtomicCAS(&stream.busy, 0, 1):
+            fill_stream(stream, timeout)
+            SDL_AtomicSet(&stream.busy, 0)
+    SDL_UnlockMutex(decoder.mutex)
+
+cdef bint fill_stream(SampleStream *stream, GstClockTime timeout) nogil:
+    """
+    Decodes samples into a stream ring buffer until it holds the stream lead time (called by
+    the decode workers).  A pending reset of the stream is carried out first.
+    Args:
+        stream: A pointer to the SampleStream (claimed by the calling worker)
+        timeout: The maximum amount of time to wait for a decoded sample (nanoseconds)
+
+    Returns:
+        True if any samples were decoded, False otherwise
+    """
+    cdef bint did_work = False
+    cdef Uint32 write_pos
+    cdef Uint32 fill
+    cdef Uint32 offset
+    cdef Uint32 length
+    cdef Uint32 first_part
+    cdef Uint32 read_pos
+
+    while SDL_AtomicGet(&stream.active):
+        if SDL_AtomicGet(&stream.reset) == stream_reset_requested:
+            apply_stream_reset(stream)
+            did_work = True
+
+        if SDL_AtomicGet(&stream.eos):
+            break
+
+        # The audio callback has not rewound the read position of a reset stream yet
+        if SDL_AtomicGet(&stream.reset) == stream_reset_none:
+            read_pos = <Uint32>SDL_AtomicGet(&stream.ring.read_pos)
+        else:
+            read_pos = 0
+
+        write_pos = <Uint32>SDL_AtomicGet(&stream.ring.write_pos)
+        fill = write_pos - read_pos
+        if fill >= stream.lead_bytes or fill >= stream.ring.size:
+            break
+
+        if not stream.map_contains_valid_sample_data:
+            stream.sample = c_appsink_try_pull_sample(stream.sink, timeout)
+
+            if stream.sample == NULL:
+                if not g_object_get_bool(stream.sink, "eos"):
+                    break
+
+                # End of stream: mark the end position in the ring (only one end marker can be
+                # pending at a time, so wait until the audio callback has reached the previous one)
+                if SDL_AtomicGet(&stream.ring.end_pending):
+                    break
+
+                stream.ring.end_pos = write_pos
+                SDL_AtomicSet(&stream.ring.end_pending, 1)
+
+                if SDL_AtomicGet(&stream.loop):
+                    # Continue decoding from the beginning of the sound for the next loop
+                    gst_element_seek_simple(stream.pipeline, GST_FORMAT_TIME,
+                                            <GstSeekFlags>(GST_SEEK_FLAG_FLUSH | GST_SEEK_FLAG_KEY_UNIT), 0)
+                    did_work = True
+                    continue
+
+                SDL_AtomicSet(&stream.eos, 1)
+                break
+
+            stream.buffer = gst_sample_get_buffer(stream.sample)
+            if gst_buffer_map(stream.buffer, &stream.map_info, GST_MAP_READ):
+                stream.map_contains_valid_sample_data = 1
+                stream.map_buffer_pos = 0
+            else:
+                gst_sample_unref(stream.sample)
+                stream.sample = NULL
+                stream.buffer = NULL
+                continue
+
+        # Copy as much of the decoded sample as fits into the ring buffer (in up to two parts
+        # when the write wraps around the end of the ring buffer memory)
+        length = min(stream.ring.size - fill, <Uint32>stream.map_info.size - stream.map_buffer_pos)
+        offset = write_pos & (stream.ring.size - 1)
+        first_part = min(length, stream.ring.size - offset)
+        memcpy(stream.ring.data + offset, stream.map_info.data + stream.map_buffer_pos, first_part)
+        if length > first_part:
+            memcpy(stream.ring.data, stream.map_info.data + stream.map_buffer_pos + first_part, length - first_part)
+
+        SDL_AtomicAdd(&stream.ring.write_pos, <int>length)
+        stream.map_buffer_pos += length
+        did_work = True
+
+        if stream.map_buffer_pos >= stream.map_info.size:
+            gst_buffer_unmap(stream.buffer, &stream.map_info)
+            gst_sample_unref(stream.sample)
+            stream.buffer = NULL
+            stream.sample = NULL
+            stream.map_buffer_pos = 0
+            stream.map_contains_valid_sample_data = 0
+
+    return did_work
+
+cdef int stream_decoder_thread(void *data) nogil:
+    """
+    Decode worker thread function.  Repeatedly claims the next active stream that needs data
+    and fills its ring buffer up to the stream lead time.
+    Args:
+        data: A pointer to the StreamDecoder
+    """
+    cdef StreamDecoder *decoder = <StreamDecoder*>data
+    cdef SampleStream *stream
+    cdef SampleStream *candidate
+    cdef int next_index = 0
+    cdef int idle_streams = 0
+    cdef int i
+
+    while SDL_AtomicGet(&decoder.running):
+        stream = NULL
+
+        # Claim the next active stream (streams are claimed while holding the mutex so they
+        # cannot be unregistered while a worker is filling them)
+        SDL_LockMutex(decoder.mutex)
+        for i in range(decoder.stream_count):
+            candidate = decoder.streams[(next_index + i) % decoder.stream_count]
+            if stream_needs_decoding(candidate) and SDL_AtomicCAS(&candidate.busy, 0, 1):
+                stream = candidate
+                next_index = (next_index + i + 1) % decoder.stream_count
+                break
+        SDL_UnlockMutex(decoder.mutex)
+
+        if stream == NULL:
+            SDL_Delay(2)
+            continue
+
+        if fill_stream(stream, STREAM_DECODER_PULL_TIMEOUT):
+            idle_streams = 0
+        else:
+            idle_streams += 1
+
+        SDL_AtomicSet(&stream.busy, 0)
+
+        # Sleep when none of the streams needed any data
+        if idle_streams >= decoder.stream_count:
+            idle_streams = 0
+            SDL_Delay(2)
+
+    return 0
@@ -0,0 +1,155 @@
+"""Sound files normalized (transcoded) to the output format of the audio engine."""
+import json
+import logging
+import os
+import struct
+from collections import namedtuple
+from typing import Dict, Optional
+
+WAVE_FORMAT_PCM = 1
+
+WavFormat = namedtuple("WavFormat", ["format_tag", "channels", "sample_rate", "bits_per_sample",
+                                     "data_offset", "data_size"])
+
+
+def read_wav_format(file_name: str) -> Optional[WavFormat]:
+    """Return the format and the location of the sample data of a WAV file.
+
+    Returns None if the file is not a (readable) WAV file.
+    """
+    fmt = None
+    try:
+        with open(file_name, 'rb') as wav_file:
+            header = wav_file.read(12)
+            if len(header) < 12 or header[0:4] != b'RIFF' or header[8:12] != b'WAVE':
+                return None
+
+            while True:
+                chunk_header = wav_file.read(8)
+                if len(chunk_header) < 8:
+                    return None
+
+                chunk_id, chunk_size = struct.unpack('<4sI', chunk_header)
+                if chunk_id == b'fmt ':
+                    chunk = wav_file.read(chunk_size)
+                    if len(chunk) < 16:
+                        return None
+                    fmt = struct.unpack('<HHIIHH', chunk[0:16])
+                elif chunk_id == b'data':
+                    if fmt is None:
+                        return None
+                    data_offset = wav_file.tell()
+                    data_size = min(chunk_size, os.fstat(wav_file.fileno()).st_size - data_offset)
+                    return WavFormat(format_tag=fmt[0], channels=fmt[1], sample_rate=fmt[2],
+                                     bits_per_sample=fmt[5], data_offset=data_offset, data_size=data_size)
+                else:
+                    wav_file.seek(chunk_size, os.SEEK_CUR)
+
+                # Chunks are word aligned
+                if chunk_size & 1:
+                    wav_file.seek(1, os.SEEK_CUR)
+
+    except (OSError, struct.error):
+        return None
+
+
+class NormalizedSoundCache:
+
+    """Manifest of the sound files normalized by the build_sounds command.
+
+    The build_sounds command transcodes the sound assets of a machine to WAV
+    files in the exact output format (sample rate, channels and 16-bit
+    samples) of the audio engine. Those files are loaded with a straight read
+    instead of being converted when they are loaded. A normalized file is only
+    used while the source file is unchanged, the output format matches and the
+    normalized file still holds the number of samples it was written with.
+    """
+
+    MANIFEST_FILE_NAME = 'manifest.json'
+
+    def __init__(self, machine_path: str, build_path: str, sample_rate: int, channels: int) -> None:
+        self.log = logging.getLogger('NormalizedSoundCache')
+        self.machine_path = machine_path
+        self.build_path = build_path
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self._entries = dict()  # type: Dict[str, dict]
+        self.hits = 0
+        self.misses = 0
+        self.load()
+
+    def _key(self, source_file: str) -> str:
+        try:
+            return os.path.relpath(source_file, self.machine_path).replace('\\', '/')
+        except ValueError:
+            return os.path.abspath(source_file).replace('\\', '/')
+
+    def load(self) -> None:
+        """Load the manifest (if the sounds have been normalized)."""
+        try:
+            with open(os.path.join(self.build_path, self.MANIFEST_FILE_NAME)) as manifest_file:
+                self._entries = json.load(manifest_file)
+        except FileNotFoundError:
+            self._entries = dict()
+        except (OSError, ValueError) as e:
+            self.log.warning("Unable to read the normalized sound manifest: %s", e)
+            self._entries = dict()
+
+    def save(self) -> None:
+        """Write the manifest."""
+        os.makedirs(self.build_path, exist_ok=True)
+        with open(os.path.join(self.build_path, self.MANIFEST_FILE_NAME), 'w') as manifest_file:
+            json.dump(self._entries, manifest_file, indent=2, sort_keys=True)
+
+    def target_file_name(self, source_file: str) -> str:
+        """Return the name of the normalized file for a source file."""
+        key = self._key(source_file)
+        if os.path.isabs(key):
+            key = key.lstrip('/').replace(':', '')
+        return os.path.join(self.build_path, os.path.splitext(key)[0] + '.wav')
+
+    def is_up_to_date(self, source_file: str) -> bool:
+        """Return whether an up to date normalized file exists for a source file."""
+        entry = self._entries.get(self._key(source_file))
+        if not entry or entry['sample_rate'] != self.sample_rate or entry['channels'] != self.channels:
+            return False
+
+        try:
+            stat = os.stat(source_file)
+        except OSError:
+            return False
+
+        if stat.st_size != entry['source_size'] or stat.st_mtime != entry['source_mtime']:
+            return False
+
+        # The normalized file must be complete and in the output format
+        wav_format = read_wav_format(os.path.join(self.build_path, entry['file']))
+        return wav_format is not None and wav_format.format_tag == WAVE_FORMAT_PCM and \
+            wav_format.sample_rate == self.sample_rate and wav_format.channels == self.channels and \
+            wav_format.bits_per_sample == 16 and wav_format.data_size // (2 * self.channels) == entry['samples']
+
+    def add(self, source_file: str, normalized_file: str, samples: int) -> None:
+        """Record the normalized file of a source file (and its length in samples)."""
+        stat = os.stat(source_file)
+        self._entries[self._key(source_file)] = {
+            'file': os.path.relpath(normalized_file, self.build_path).replace('\\', '/'),
+            'source_size': stat.st_size,
+            'source_mtime': stat.st_mtime,
+            'sample_rate': self.sample_rate,
+            'channels': self.channels,
+            'samples': samples}
+
+    def get_file_name(self, source_file: str) -> str:
+        """Return the file to load for a sound file (the normalized file if it is up to date)."""
+        if not self.is_up_to_date(source_file):
+            self.misses += 1
+            return source_file
+
+        self.hits += 1
+        return os.path.join(self.build_path, self._entries[self._key(source_file)]['file'])
+
+    def get_stats(self) -> dict:
+        """Return cache statistics."""
+        return dict(entries=len(self._entries),
+                    hits=self.hits,
+                    misses=self.misses)
@@ -0,0 +1,153 @@
+"""Priority queue of sound instances waiting for a free sound player."""
+from heapq import heappush, heappop, heapify
+from typing import Dict, Iterator, List, Optional
+
+
+class SoundQueue:
+
+    """Priority heap of pending sound instances with lazy deletion.
+
+    Sound instances are ordered using their own comparison operator (highest
+    priority first, then by expiration time). Removed instances are only
+    marked as removed and stay in the heap until they reach the top (or until
+    the heap is compacted), so removing a sound instance does not require a
+    scan or a re-heapify of the queue. Live entries are indexed by sound id,
+    key and context so bulk removals only visit the affected instances.
+    """
+
+    __slots__ = ["_heap", "_entries", "_by_sound_id", "_by_key", "_by_context", "_sequence"]
+
+    def __init__(self) -> None:
+        self._heap = list()         # (sound_instance, sequence) tuples
+        self._entries = dict()      # type: Dict[int, int]
+        self._by_sound_id = dict()  # type: Dict[int, Dict[int, object]]
+        self._by_key = dict()       # type: Dict[object, Dict[int, object]]
+        self._by_context = dict()   # type: Dict[object, Dict[int, object]]
+        self._sequence = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, sound_instance) -> bool:
+        return sound_instance.id in self._entries
+
+    def __iter__(self) -> Iterator:
+        """Iterate over the sound instances in the queue (in no particular order)."""
+        for sound_instances in list(self._by_sound_id.values()):
+            yield from list(sound_instances.values())
+
+    def push(self, sound_instance) -> None:
+        """Add a sound instance to the queue (O(log n))."""
+        if sound_instance.id in self._entries:
+            self.remove(sound_instance)
+
+        # The sequence number identifies the live heap entry of the instance (an instance that
+        # is removed and queued again would otherwise also match its stale heap entry).
+        self._sequence += 1
+        self._entries[sound_instance.id] = self._sequence
+        heappush(self._heap, (sound_instance, self._sequence))
+
+        self._index(self._by_sound_id, sound_instance.sound_id, sound_instance)
+        self._index(self._by_key, sound_instance.key, sound_instance)
+        self._index(self._by_context, sound_instance.context, sound_instance)
+
+    def peek(self) -> Optional[object]:
+        """Return the sound instance at the front of the queue without removing it."""
+        self._discard_removed()
+        if not self._heap:
+            return None
+
+        return self._heap[0][0]
+
+    def pop(self) -> Optional[object]:
+        """Remove and return the sound instance at the front of the queue (O(log n))."""
+        self._discard_removed()
+        if not self._heap:
+            return None
+
+        sound_instance = heappop(self._heap)[0]
+        self._unindex(sound_instance)
+        return sound_instance
+
+    def remove(self, sound_instance) -> bool:
+        """Remove a sound instance from the queue (O(1)).
+
+        Returns True if the sound instance was in the queue.
+        """
+        if sound_instance.id not in self._entries:
+            return False
+
+        self._unindex(sound_instance)
+        self._compact()
+        return True
+
+    def remove_sound(self, sound_id: int) -> List:
+        """Remove all instances of a sound (or sound pool) and return them."""
+        return self._remove_bucket(self._by_sound_id, sound_id)
+
+    def remove_key(self, key) -> List:
+        """Remove all sound instances with a key and return them."""
+        return self._remove_bucket(self._by_key, key)
+
+    def remove_context(self, context) -> List:
+        """Remove all sound instances with a context and return them."""
+        return self._remove_bucket(self._by_context, context)
+
+    def contains_sound(self, sound_id: int) -> bool:
+        """Return whether an instance of a sound (or sound pool) is in the queue."""
+        return sound_id in self._by_sound_id
+
+    def clear(self) -> List:
+        """Remove all sound instances and return them."""
+        sound_instances = list(self)
+        self._heap = list()
+        self._entries.clear()
+        self._by_sound_id.clear()
+        self._by_key.clear()
+        self._by_context.clear()
+        return sound_instances
+
+    @staticmethod
+    def _index(index: Dict, value, sound_instance) -> None:
+        try:
+            index[value][sound_instance.id] = sound_instance
+        except KeyError:
+            index[value] = {sound_instance.id: sound_instance}
+
+    @staticmethod
+    def _unindex_value(index: Dict, value, sound_instance) -> None:
+        sound_instances = index.get(value)
+        if sound_instances is None:
+            return
+
+        sound_instances.pop(sound_instance.id, None)
+        if not sound_instances:
+            del index[value]
+
+    def _unindex(self, sound_instance) -> None:
+        del self._entries[sound_instance.id]
+        self._unindex_value(self._by_sound_id, sound_instance.sound_id, sound_instance)
+        self._unindex_value(self._by_key, sound_instance.key, sound_instance)
+        self._unindex_value(self._by_context, sound_instance.context, sound_instance)
+
+    def _remove_bucket(self, index: Dict, value) -> List:
+        sound_instances = list(index.get(value, {}).values())
+        for sound_instance in sound_instances:
+            self._unindex(sound_instance)
+
+        self._compact()
+        return sound_instances
+
+    def _discard_removed(self) -> None:
+        """Pop removed entries from the top of the heap."""
+        while self._heap:
+            sound_instance, sequence = self._heap[0]
+            if self._entries.get(sound_instance.id) == sequence:
+                return
+            heappop(self._heap)
+
+    def _compact(self) -> None:
+        """Rebuild the heap once most of its entries have been removed."""
+        if len(self._heap) > 32 and len(self._heap) > 2 * len(self._entries):
+            self._heap = [entry for entry in self._heap if self._entries.get(entry[0].id) == entry[1]]
+            heapify(self._heap)
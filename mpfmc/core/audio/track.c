@@ -1,14 +1,16 @@
-/* Generated by Cython 0.29.10 */
+/* Generated by Cython 0.29.37 */
 
+#ifndef PY_SSIZE_T_CLEAN
 #define PY_SSIZE_T_CLEAN
+#endif /* PY_SSIZE_T_CLEAN */
 #include "Python.h"
 #ifndef Py_PYTHON_H
     #error Python headers needed to compile C extensions, please install development version of Python.
 #elif PY_VERSION_HEX < 0x02060000 || (0x03000000 <= PY_VERSION_HEX && PY_VERSION_HEX < 0x03030000)
     #error Cython requires Python 2.6+ or Python 3.3+.
 #else
-#define CYTHON_ABI "0_29_10"
-#define CYTHON_HEX_VERSION 0x001D0AF0
+#define CYTHON_ABI "0_29_37"
+#define CYTHON_HEX_VERSION 0x001D25F0
 #define CYTHON_FUTURE_DIVISION 1
 #include <stddef.h>
 #ifndef offsetof
@@ -47,6 +49,7 @@
   #define CYTHON_COMPILING_IN_PYPY 1
   #define CYTHON_COMPILING_IN_PYSTON 0
   #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
   #undef CYTHON_USE_TYPE_SLOTS
   #define CYTHON_USE_TYPE_SLOTS 0
   #undef CYTHON_USE_PYTYPE_LOOKUP
@@ -75,18 +78,26 @@
   #define CYTHON_FAST_THREAD_STATE 0
   #undef CYTHON_FAST_PYCALL
   #define CYTHON_FAST_PYCALL 0
-  #undef CYTHON_PEP489_MULTI_PHASE_INIT
-  #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #if PY_VERSION_HEX < 0x03090000
+    #undef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #elif !defined(CYTHON_PEP489_MULTI_PHASE_INIT)
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
   #undef CYTHON_USE_TP_FINALIZE
-  #define CYTHON_USE_TP_FINALIZE 0
+  #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1 && PYPY_VERSION_NUM >= 0x07030C00)
   #undef CYTHON_USE_DICT_VERSIONS
   #define CYTHON_USE_DICT_VERSIONS 0
   #undef CYTHON_USE_EXC_INFO_STACK
   #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
 #elif defined(PYSTON_VERSION)
   #define CYTHON_COMPILING_IN_PYPY 0
   #define CYTHON_COMPILING_IN_PYSTON 1
   #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
   #ifndef CYTHON_USE_TYPE_SLOTS
     #define CYTHON_USE_TYPE_SLOTS 1
   #endif
@@ -124,10 +135,59 @@
   #define CYTHON_USE_DICT_VERSIONS 0
   #undef CYTHON_USE_EXC_INFO_STACK
   #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+#elif defined(PY_NOGIL)
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 1
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #ifndef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE 1
+  #endif
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
 #else
   #define CYTHON_COMPILING_IN_PYPY 0
   #define CYTHON_COMPILING_IN_PYSTON 0
   #define CYTHON_COMPILING_IN_CPYTHON 1
+  #define CYTHON_COMPILING_IN_NOGIL 0
   #ifndef CYTHON_USE_TYPE_SLOTS
     #define CYTHON_USE_TYPE_SLOTS 1
   #endif
@@ -147,7 +207,7 @@
     #undef CYTHON_USE_PYLONG_INTERNALS
     #define CYTHON_USE_PYLONG_INTERNALS 0
   #elif !defined(CYTHON_USE_PYLONG_INTERNALS)
-    #define CYTHON_USE_PYLONG_INTERNALS 1
+    #define CYTHON_USE_PYLONG_INTERNALS (PY_VERSION_HEX < 0x030C00A5)
   #endif
   #ifndef CYTHON_USE_PYLIST_INTERNALS
     #define CYTHON_USE_PYLIST_INTERNALS 1
@@ -155,7 +215,7 @@
   #ifndef CYTHON_USE_UNICODE_INTERNALS
     #define CYTHON_USE_UNICODE_INTERNALS 1
   #endif
-  #if PY_VERSION_HEX < 0x030300F0
+  #if PY_VERSION_HEX < 0x030300F0 || PY_VERSION_HEX >= 0x030B00A2
     #undef CYTHON_USE_UNICODE_WRITER
     #define CYTHON_USE_UNICODE_WRITER 0
   #elif !defined(CYTHON_USE_UNICODE_WRITER)
@@ -170,11 +230,14 @@
   #ifndef CYTHON_UNPACK_METHODS
     #define CYTHON_UNPACK_METHODS 1
   #endif
-  #ifndef CYTHON_FAST_THREAD_STATE
+  #if PY_VERSION_HEX >= 0x030B00A4
+    #undef CYTHON_FAST_THREAD_STATE
+    #define CYTHON_FAST_THREAD_STATE 0
+  #elif !defined(CYTHON_FAST_THREAD_STATE)
     #define CYTHON_FAST_THREAD_STATE 1
   #endif
   #ifndef CYTHON_FAST_PYCALL
-    #define CYTHON_FAST_PYCALL 1
+    #define CYTHON_FAST_PYCALL (PY_VERSION_HEX < 0x030A0000)
   #endif
   #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
     #define CYTHON_PEP489_MULTI_PHASE_INIT (PY_VERSION_HEX >= 0x03050000)
@@ -183,17 +246,25 @@
     #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1)
   #endif
   #ifndef CYTHON_USE_DICT_VERSIONS
-    #define CYTHON_USE_DICT_VERSIONS (PY_VERSION_HEX >= 0x030600B1)
+    #define CYTHON_USE_DICT_VERSIONS ((PY_VERSION_HEX >= 0x030600B1) && (PY_VERSION_HEX < 0x030C00A5))
   #endif
-  #ifndef CYTHON_USE_EXC_INFO_STACK
+  #if PY_VERSION_HEX >= 0x030B00A4
+    #undef CYTHON_USE_EXC_INFO_STACK
+    #define CYTHON_USE_EXC_INFO_STACK 0
+  #elif !defined(CYTHON_USE_EXC_INFO_STACK)
     #define CYTHON_USE_EXC_INFO_STACK (PY_VERSION_HEX >= 0x030700A3)
   #endif
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 1
+  #endif
 #endif
 #if !defined(CYTHON_FAST_PYCCALL)
 #define CYTHON_FAST_PYCCALL  (CYTHON_FAST_PYCALL && PY_VERSION_HEX >= 0x030600B1)
 #endif
 #if CYTHON_USE_PYLONG_INTERNALS
-  #include "longintrepr.h"
+  #if PY_MAJOR_VERSION < 3
+    #include "longintrepr.h"
+  #endif
   #undef SHIFT
   #undef BASE
   #undef MASK
@@ -298,9 +369,6 @@
   #endif
 #endif
 
-#if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX < 0x02070600 && !defined(Py_OptimizeFlag)
-  #define Py_OptimizeFlag 0
-#endif
 #define __PYX_BUILD_PY_SSIZE_T "n"
 #define CYTHON_FORMAT_SSIZE_T "z"
 #if PY_MAJOR_VERSION < 3
@@ -310,15 +378,79 @@
   #define __Pyx_DefaultClassType PyClass_Type
 #else
   #define __Pyx_BUILTIN_MODULE_NAME "builtins"
-#if PY_VERSION_HEX < 0x030800A4
-  #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
-          PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+  #define __Pyx_DefaultClassType PyType_Type
+#if PY_VERSION_HEX >= 0x030B00A1
+    static CYTHON_INLINE PyCodeObject* __Pyx_PyCode_New(int a, int k, int l, int s, int f,
+                                                    PyObject *code, PyObject *c, PyObject* n, PyObject *v,
+                                                    PyObject *fv, PyObject *cell, PyObject* fn,
+                                                    PyObject *name, int fline, PyObject *lnos) {
+        PyObject *kwds=NULL, *argcount=NULL, *posonlyargcount=NULL, *kwonlyargcount=NULL;
+        PyObject *nlocals=NULL, *stacksize=NULL, *flags=NULL, *replace=NULL, *call_result=NULL, *empty=NULL;
+        const char *fn_cstr=NULL;
+        const char *name_cstr=NULL;
+        PyCodeObject* co=NULL;
+        PyObject *type, *value, *traceback;
+        PyErr_Fetch(&type, &value, &traceback);
+        if (!(kwds=PyDict_New())) goto end;
+        if (!(argcount=PyLong_FromLong(a))) goto end;
+        if (PyDict_SetItemString(kwds, "co_argcount", argcount) != 0) goto end;
+        if (!(posonlyargcount=PyLong_FromLong(0))) goto end;
+        if (PyDict_SetItemString(kwds, "co_posonlyargcount", posonlyargcount) != 0) goto end;
+        if (!(kwonlyargcount=PyLong_FromLong(k))) goto end;
+        if (PyDict_SetItemString(kwds, "co_kwonlyargcount", kwonlyargcount) != 0) goto end;
+        if (!(nlocals=PyLong_FromLong(l))) goto end;
+        if (PyDict_SetItemString(kwds, "co_nlocals", nlocals) != 0) goto end;
+        if (!(stacksize=PyLong_FromLong(s))) goto end;
+        if (PyDict_SetItemString(kwds, "co_stacksize", stacksize) != 0) goto end;
+        if (!(flags=PyLong_FromLong(f))) goto end;
+        if (PyDict_SetItemString(kwds, "co_flags", flags) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_code", code) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_consts", c) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_names", n) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_varnames", v) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_freevars", fv) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_cellvars", cell) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_linetable", lnos) != 0) goto end;
+        if (!(fn_cstr=PyUnicode_AsUTF8AndSize(fn, NULL))) goto end;
+        if (!(name_cstr=PyUnicode_AsUTF8AndSize(name, NULL))) goto end;
+        if (!(co = PyCode_NewEmpty(fn_cstr, name_cstr, fline))) goto end;
+        if (!(replace = PyObject_GetAttrString((PyObject*)co, "replace"))) goto cleanup_code_too;
+        if (!(empty = PyTuple_New(0))) goto cleanup_code_too; // unfortunately __pyx_empty_tuple isn't available here
+        if (!(call_result = PyObject_Call(replace, empty, kwds))) goto cleanup_code_too;
+        Py_XDECREF((PyObject*)co);
+        co = (PyCodeObject*)call_result;
+        call_result = NULL;
+        if (0) {
+            cleanup_code_too:
+            Py_XDECREF((PyObject*)co);
+            co = NULL;
+        }
+        end:
+        Py_XDECREF(kwds);
+        Py_XDECREF(argcount);
+        Py_XDECREF(posonlyargcount);
+        Py_XDECREF(kwonlyargcount);
+        Py_XDECREF(nlocals);
+        Py_XDECREF(stacksize);
+        Py_XDECREF(replace);
+        Py_XDECREF(call_result);
+        Py_XDECREF(empty);
+        if (type) {
+            PyErr_Restore(type, value, traceback);
+        }
+        return co;
+    }
 #else
   #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
-          PyCode_New(a, 0, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+          PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
 #endif
   #define __Pyx_DefaultClassType PyType_Type
 #endif
+#if PY_VERSION_HEX >= 0x030900F0 && !CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyObject_GC_IsFinalized(o) PyObject_GC_IsFinalized(o)
+#else
+  #define __Pyx_PyObject_GC_IsFinalized(o) _PyGC_FINALIZED(o)
+#endif
 #ifndef Py_TPFLAGS_CHECKTYPES
   #define Py_TPFLAGS_CHECKTYPES 0
 #endif
@@ -426,8 +558,12 @@ static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
 #endif
 #if PY_VERSION_HEX > 0x03030000 && defined(PyUnicode_KIND)
   #define CYTHON_PEP393_ENABLED 1
-  #define __Pyx_PyUnicode_READY(op)       (likely(PyUnicode_IS_READY(op)) ?\
-                                              0 : _PyUnicode_Ready((PyObject *)(op)))
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_READY(op)       (0)
+  #else
+    #define __Pyx_PyUnicode_READY(op)       (likely(PyUnicode_IS_READY(op)) ?\
+                                                0 : _PyUnicode_Ready((PyObject *)(op)))
+  #endif
   #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_LENGTH(u)
   #define __Pyx_PyUnicode_READ_CHAR(u, i) PyUnicode_READ_CHAR(u, i)
   #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   PyUnicode_MAX_CHAR_VALUE(u)
@@ -435,7 +571,15 @@ static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
   #define __Pyx_PyUnicode_DATA(u)         PyUnicode_DATA(u)
   #define __Pyx_PyUnicode_READ(k, d, i)   PyUnicode_READ(k, d, i)
   #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  PyUnicode_WRITE(k, d, i, ch)
-  #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : PyUnicode_GET_SIZE(u)))
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_LENGTH(u))
+  #else
+    #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x03090000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : ((PyCompactUnicodeObject *)(u))->wstr_length))
+    #else
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : PyUnicode_GET_SIZE(u)))
+    #endif
+  #endif
 #else
   #define CYTHON_PEP393_ENABLED 0
   #define PyUnicode_1BYTE_KIND  1
@@ -484,8 +628,10 @@ static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
   #define PyString_Type                PyUnicode_Type
   #define PyString_Check               PyUnicode_Check
   #define PyString_CheckExact          PyUnicode_CheckExact
+#ifndef PyObject_Unicode
   #define PyObject_Unicode             PyObject_Str
 #endif
+#endif
 #if PY_MAJOR_VERSION >= 3
   #define __Pyx_PyBaseString_Check(obj) PyUnicode_Check(obj)
   #define __Pyx_PyBaseString_CheckExact(obj) PyUnicode_CheckExact(obj)
@@ -496,6 +642,13 @@ static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
 #ifndef PySet_CheckExact
   #define PySet_CheckExact(obj)        (Py_TYPE(obj) == &PySet_Type)
 #endif
+#if PY_VERSION_HEX >= 0x030900A4
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_SET_REFCNT(obj, refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SET_SIZE(obj, size)
+#else
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_REFCNT(obj) = (refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SIZE(obj) = (size)
+#endif
 #if CYTHON_ASSUME_SAFE_MACROS
   #define __Pyx_PySequence_SIZE(seq)  Py_SIZE(seq)
 #else
@@ -529,13 +682,13 @@ static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
 #if PY_VERSION_HEX < 0x030200A4
   typedef long Py_hash_t;
   #define __Pyx_PyInt_FromHash_t PyInt_FromLong
-  #define __Pyx_PyInt_AsHash_t   PyInt_AsLong
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsHash_t
 #else
   #define __Pyx_PyInt_FromHash_t PyInt_FromSsize_t
-  #define __Pyx_PyInt_AsHash_t   PyInt_AsSsize_t
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsSsize_t
 #endif
 #if PY_MAJOR_VERSION >= 3
-  #define __Pyx_PyMethod_New(func, self, klass) ((self) ? PyMethod_New(func, self) : (Py_INCREF(func), func))
+  #define __Pyx_PyMethod_New(func, self, klass) ((self) ? ((void)(klass), PyMethod_New(func, self)) : __Pyx_NewRef(func))
 #else
   #define __Pyx_PyMethod_New(func, self, klass) PyMethod_New(func, self, klass)
 #endif
@@ -557,8 +710,10 @@ static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
     } __Pyx_PyAsyncMethodsStruct;
 #endif
 
-#if defined(WIN32) || defined(MS_WINDOWS)
-  #define _USE_MATH_DEFINES
+#if defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)
+  #if !defined(_USE_MATH_DEFINES)
+    #define _USE_MATH_DEFINES
+  #endif
 #endif
 #include <math.h>
 #ifdef NAN
@@ -576,11 +731,10 @@ static CYTHON_INLINE float __PYX_NAN() {
 #define __Pyx_truncl truncl
 #endif
 
-
+#define __PYX_MARK_ERR_POS(f_index, lineno) \
+    { __pyx_filename = __pyx_f[f_index]; (void)__pyx_filename; __pyx_lineno = lineno; (void)__pyx_lineno; __pyx_clineno = __LINE__; (void)__pyx_clineno; }
 #define __PYX_ERR(f_index, lineno, Ln_error) \
-{ \
-  __pyx_filename = __pyx_f[f_index]; __pyx_lineno = lineno; __pyx_clineno = __LINE__; goto Ln_error; \
-}
+    { __PYX_MARK_ERR_POS(f_index, lineno) goto Ln_error; }
 
 #ifndef __PYX_EXTERN_C
   #ifdef __cplusplus
@@ -600,6 +754,7 @@ static CYTHON_INLINE float __PYX_NAN() {
 #include "gst/gst.h"
 #include "glib.h"
 #include "gstreamer_helper.h"
+#include <string.h>
 #ifdef _OPENMP
 #include <omp.h>
 #endif /* _OPENMP */
@@ -614,7 +769,7 @@ typedef struct {PyObject **p; const char *s; const Py_ssize_t n; const char* enc
 #define __PYX_DEFAULT_STRING_ENCODING_IS_ASCII 0
 #define __PYX_DEFAULT_STRING_ENCODING_IS_UTF8 1
 #define __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT (PY_MAJOR_VERSION >= 3 && __PYX_DEFAULT_STRING_ENCODING_IS_UTF8)
-#define __PYX_DEFAULT_STRING_ENCODING "utf-8"
+#define __PYX_DEFAULT_STRING_ENCODING "utf8"
 #define __Pyx_PyObject_FromString __Pyx_PyBytes_FromString
 #define __Pyx_PyObject_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
 #define __Pyx_uchar_cast(c) ((unsigned char)c)
@@ -696,6 +851,7 @@ static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x);
     (likely(PyTuple_CheckExact(obj)) ? __Pyx_NewRef(obj) : PySequence_Tuple(obj))
 static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject*);
 static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t);
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject*);
 #if CYTHON_ASSUME_SAFE_MACROS
 #define __pyx_PyFloat_AsDouble(x) (PyFloat_CheckExact(x) ? PyFloat_AS_DOUBLE(x) : PyFloat_AsDouble(x))
 #else
@@ -808,7 +964,7 @@ static const char *__pyx_filename;
 
 
 static const char *__pyx_f[] = {
-  "mpfmc\\core\\audio\\track.pyx",
+  "mpfmc/core/audio/track.pyx",
   "stringsource",
 };
 /* ForceInitThreads.proto */
@@ -831,7 +987,19 @@ union __pyx_t_5mpfmc_4core_5audio_4sdl2_Sample16;
 struct __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData;
 typedef struct __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData;
 
-/* "mpfmc/core/audio/sdl2.pxd":231
+/* "mpfmc/core/audio/sdl2.pxd":265
+ * # ---------------------------------------------------------------------------
+ * 
+ * cdef enum:             # <<<<<<<<<<<<<<
+ *     # The callback load histogram has CALLBACK_LOAD_HISTOGRAM_RESOLUTION buckets per buffer
+ *     # period (5% each) up to twice the buffer period, the last bucket counts all longer callbacks
+ */
+enum  {
+  __pyx_e_5mpfmc_4core_5audio_4sdl2_CALLBACK_LOAD_HISTOGRAM_RESOLUTION = 20,
+  __pyx_e_5mpfmc_4core_5audio_4sdl2_CALLBACK_LOAD_HISTOGRAM_BUCKETS = 41
+};
+
+/* "mpfmc/core/audio/sdl2.pxd":245
  * # specific data structures used in the MPF media controller audio library:
  * 
  * cdef struct Sample16Bytes:             # <<<<<<<<<<<<<<
@@ -843,7 +1011,7 @@ struct __pyx_t_5mpfmc_4core_5audio_4sdl2_Sample16Bytes {
   Uint8 byte1;
 };
 
-/* "mpfmc/core/audio/sdl2.pxd":238
+/* "mpfmc/core/audio/sdl2.pxd":252
  *     Uint8 byte1
  * 
  * cdef union Sample16:             # <<<<<<<<<<<<<<
@@ -855,8 +1023,8 @@ union __pyx_t_5mpfmc_4core_5audio_4sdl2_Sample16 {
   struct __pyx_t_5mpfmc_4core_5audio_4sdl2_Sample16Bytes bytes;
 };
 
-/* "mpfmc/core/audio/sdl2.pxd":251
- * # ---------------------------------------------------------------------------
+/* "mpfmc/core/audio/sdl2.pxd":271
+ *     CALLBACK_LOAD_HISTOGRAM_BUCKETS = 41
  * 
  * ctypedef struct AudioCallbackData:             # <<<<<<<<<<<<<<
  *     # A pointer to this struct is passed to the main audio callback function and
@@ -876,6 +1044,22 @@ struct __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData {
   Uint8 silence;
   Uint8 track_count;
   void **tracks;
+  float *mix_bus;
+  float *dither_table;
+  Uint32 dither_table_size;
+  Uint32 dither_state;
+  Uint64 callback_count;
+  Uint64 tracks_mixed;
+  Uint64 tracks_skipped;
+  float callback_load;
+  float callback_load_peak;
+  Uint64 last_callback_time;
+  Uint64 dropouts;
+  Uint64 overruns;
+  Uint32 load_histogram[__pyx_e_5mpfmc_4core_5audio_4sdl2_CALLBACK_LOAD_HISTOGRAM_BUCKETS];
+  Uint32 stream_lead_bytes;
+  Uint32 stream_prebuffer_bytes;
+  void *stream_decoder;
   FILE *c_log_file;
 };
 struct __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageDataLooping;
@@ -888,8 +1072,10 @@ union __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageData
 typedef union __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageData __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageData;
 struct __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer;
 typedef struct __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer;
+struct __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageQueue;
+typedef struct __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageQueue __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageQueue;
 
-/* "mpfmc/core/audio/notification_message.pxd":10
+/* "mpfmc/core/audio/notification_message.pxd":11
  * # ---------------------------------------------------------------------------
  * 
  * cdef enum NotificationMessage:             # <<<<<<<<<<<<<<
@@ -910,7 +1096,18 @@ enum __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessage {
   __pyx_e_5mpfmc_4core_5audio_20notification_message_notification_sound_loop_set_looping = 33
 };
 
-/* "mpfmc/core/audio/notification_message.pxd":23
+/* "mpfmc/core/audio/notification_message.pxd":55
+ * # The number of slots in a track notification message queue (must be a power of two,
+ * # one slot is always left empty to tell a full queue from an empty one)
+ * cdef enum:             # <<<<<<<<<<<<<<
+ *     NOTIFICATION_MESSAGE_QUEUE_SIZE = 256
+ * 
+ */
+enum  {
+  __pyx_e_5mpfmc_4core_5audio_20notification_message_NOTIFICATION_MESSAGE_QUEUE_SIZE = 0x100
+};
+
+/* "mpfmc/core/audio/notification_message.pxd":24
  *     notification_sound_loop_set_looping = 33  # Notification that a sound_loop_set is looping back to the beginning
  * 
  * ctypedef struct NotificationMessageDataLooping:             # <<<<<<<<<<<<<<
@@ -922,7 +1119,7 @@ struct __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageDat
   int loops_remaining;
 };
 
-/* "mpfmc/core/audio/notification_message.pxd":27
+/* "mpfmc/core/audio/notification_message.pxd":28
  *     int loops_remaining
  * 
  * ctypedef struct NotificationMessageDataMarker:             # <<<<<<<<<<<<<<
@@ -933,7 +1130,7 @@ struct __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageDat
   int id;
 };
 
-/* "mpfmc/core/audio/notification_message.pxd":30
+/* "mpfmc/core/audio/notification_message.pxd":31
  *     int id
  * 
  * ctypedef struct NotificationMessageSoundLoopSet:             # <<<<<<<<<<<<<<
@@ -945,7 +1142,7 @@ struct __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageSou
   gpointer player;
 };
 
-/* "mpfmc/core/audio/notification_message.pxd":35
+/* "mpfmc/core/audio/notification_message.pxd":36
  * 
  * 
  * ctypedef union NotificationMessageData:             # <<<<<<<<<<<<<<
@@ -958,7 +1155,7 @@ union __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageData
   __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageSoundLoopSet sound_loop_set;
 };
 
-/* "mpfmc/core/audio/notification_message.pxd":40
+/* "mpfmc/core/audio/notification_message.pxd":41
  *     NotificationMessageSoundLoopSet sound_loop_set
  * 
  * ctypedef struct NotificationMessageContainer:             # <<<<<<<<<<<<<<
@@ -972,6 +1169,20 @@ struct __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageCon
   int player;
   __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageData data;
 };
+
+/* "mpfmc/core/audio/notification_message.pxd":58
+ *     NOTIFICATION_MESSAGE_QUEUE_SIZE = 256
+ * 
+ * ctypedef struct NotificationMessageQueue:             # <<<<<<<<<<<<<<
+ *     # Single-producer/single-consumer lock-free ring buffer of notification messages. Messages
+ *     # are written by the audio callback (or by the main thread while it holds the audio lock) and
+ */
+struct __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageQueue {
+  __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer messages[__pyx_e_5mpfmc_4core_5audio_20notification_message_NOTIFICATION_MESSAGE_QUEUE_SIZE];
+  SDL_atomic_t write_index;
+  SDL_atomic_t read_index;
+  SDL_atomic_t dropped;
+};
 struct __pyx_t_5mpfmc_4core_5audio_5track_TrackState;
 typedef struct __pyx_t_5mpfmc_4core_5audio_5track_TrackState __pyx_t_5mpfmc_4core_5audio_5track_TrackState;
 
@@ -1033,6 +1244,7 @@ enum __pyx_t_5mpfmc_4core_5audio_5track_TrackStatus {
 struct __pyx_t_5mpfmc_4core_5audio_5track_TrackState {
   __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData *callback_data;
   void (*mix_callback_function)(__pyx_t_5mpfmc_4core_5audio_5track_TrackState *, Uint32, __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData *);
+  void (*request_callback_function)(__pyx_t_5mpfmc_4core_5audio_5track_TrackState *);
   void *type_state;
   enum __pyx_t_5mpfmc_4core_5audio_5track_TrackStatus status;
   int active;
@@ -1044,18 +1256,26 @@ struct __pyx_t_5mpfmc_4core_5audio_5track_TrackState {
   Uint32 fade_steps;
   Uint32 fade_steps_remaining;
   int buffer_size;
-  Uint8 *buffer;
-  GSList *notification_messages;
+  float *buffer;
+  int buffer_is_silent;
+  int active_player_count;
+  int active_player_peak;
+  Uint64 active_player_total;
+  Uint64 mix_ticks;
+  float mix_load;
+  float mix_load_peak;
+  void *notification_messages;
+  void *request_messages;
   int ducking_is_active;
   GArray *ducking_control_points;
 };
 
-/* "mpfmc/core/audio/track.pyx":23
+/* "mpfmc/core/audio/track.pxd":60
  * #    Track base class
  * # ---------------------------------------------------------------------------
  * cdef class Track:             # <<<<<<<<<<<<<<
- *     """
- *     Track base class
+ * 
+ *     cdef str _name
  */
 struct __pyx_obj_5mpfmc_4core_5audio_5track_Track {
   PyObject_HEAD
@@ -1073,11 +1293,21 @@ struct __pyx_obj_5mpfmc_4core_5audio_5track_Track {
 
 
 
+/* "mpfmc/core/audio/track.pyx":25
+ * #    Track base class
+ * # ---------------------------------------------------------------------------
+ * cdef class Track:             # <<<<<<<<<<<<<<
+ *     """
+ *     Track base class
+ */
+
 struct __pyx_vtabstruct_5mpfmc_4core_5audio_5track_Track {
   __pyx_t_5mpfmc_4core_5audio_5track_TrackState *(*get_state)(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *);
-  void (*mix_track_to_output)(__pyx_t_5mpfmc_4core_5audio_5track_TrackState *, __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData *, Uint8 *, Uint32);
-  void (*mix_audio)(Uint8 *, Uint8 const *, Uint32, int);
-  void (*mix_audio_stereo)(Uint8 *, Uint8 const *, Uint32, int, int);
+  void (*mix_track_to_output)(__pyx_t_5mpfmc_4core_5audio_5track_TrackState *, __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData *, float *, Uint32);
+  void (*mix_audio)(float *, Uint8 const *, Uint32, int);
+  void (*mix_audio_stereo)(float *, Uint8 const *, Uint32, int, int);
+  void (*mix_bus)(float *, float const *, Uint32, float);
+  void (*write_bus_to_output)(Uint8 *, float const *, float const *, Uint32, float);
   void (*apply_volume)(Uint8 *, Uint8 const *, Uint32, int);
   void (*apply_volume_stereo)(Uint8 *, Uint8 const *, Uint32, int, int);
 };
@@ -1206,18 +1436,18 @@ static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UIN
 
 /* GetModuleGlobalName.proto */
 #if CYTHON_USE_DICT_VERSIONS
-#define __Pyx_GetModuleGlobalName(var, name)  {\
+#define __Pyx_GetModuleGlobalName(var, name)  do {\
     static PY_UINT64_T __pyx_dict_version = 0;\
     static PyObject *__pyx_dict_cached_value = NULL;\
     (var) = (likely(__pyx_dict_version == __PYX_GET_DICT_VERSION(__pyx_d))) ?\
         (likely(__pyx_dict_cached_value) ? __Pyx_NewRef(__pyx_dict_cached_value) : __Pyx_GetBuiltinName(name)) :\
         __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
-}
-#define __Pyx_GetModuleGlobalNameUncached(var, name)  {\
+} while(0)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  do {\
     PY_UINT64_T __pyx_dict_version;\
     PyObject *__pyx_dict_cached_value;\
     (var) = __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
-}
+} while(0)
 static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value);
 #else
 #define __Pyx_GetModuleGlobalName(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
@@ -1237,7 +1467,7 @@ static CYTHON_INLINE PyObject *__Pyx_PyCFunction_FastCall(PyObject *func, PyObje
 #define __Pyx_PyFunction_FastCall(func, args, nargs)\
     __Pyx_PyFunction_FastCallDict((func), (args), (nargs), NULL)
 #if 1 || PY_VERSION_HEX < 0x030600B1
-static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, int nargs, PyObject *kwargs);
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs);
 #else
 #define __Pyx_PyFunction_FastCallDict(func, args, nargs, kwargs) _PyFunction_FastCallDict(func, args, nargs, kwargs)
 #endif
@@ -1246,13 +1476,21 @@ static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args,
 #ifndef Py_MEMBER_SIZE
 #define Py_MEMBER_SIZE(type, member) sizeof(((type *)0)->member)
 #endif
+#if CYTHON_FAST_PYCALL
   static size_t __pyx_pyframe_localsplus_offset = 0;
   #include "frameobject.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
   #define __Pxy_PyFrame_Initialize_Offsets()\
     ((void)__Pyx_BUILD_ASSERT_EXPR(sizeof(PyFrameObject) == offsetof(PyFrameObject, f_localsplus) + Py_MEMBER_SIZE(PyFrameObject, f_localsplus)),\
      (void)(__pyx_pyframe_localsplus_offset = ((size_t)PyFrame_Type.tp_basicsize) - Py_MEMBER_SIZE(PyFrameObject, f_localsplus)))
   #define __Pyx_PyFrame_GetLocalsplus(frame)\
     (assert(__pyx_pyframe_localsplus_offset), (PyObject **)(((char *)(frame)) + __pyx_pyframe_localsplus_offset))
+#endif // CYTHON_FAST_PYCALL
 #endif
 
 /* PyObjectCall.proto */
@@ -1312,7 +1550,7 @@ static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject
 /* RaiseException.proto */
 static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
 
-/* None.proto */
+/* DivInt[int].proto */
 static CYTHON_INLINE int __Pyx_div_int(int, int);
 
 /* UnaryNegOverflows.proto */
@@ -1324,6 +1562,13 @@ static void __Pyx_WriteUnraisable(const char *name, int clineno,
                                   int lineno, const char *filename,
                                   int full_traceback, int nogil);
 
+/* PyObjectCallNoArg.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func);
+#else
+#define __Pyx_PyObject_CallNoArg(func) __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL)
+#endif
+
 /* PyObject_GenericGetAttrNoDict.proto */
 #if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
 static CYTHON_INLINE PyObject* __Pyx_PyObject_GenericGetAttrNoDict(PyObject* obj, PyObject* attr_name);
@@ -1341,6 +1586,17 @@ static PyObject* __Pyx_PyObject_GenericGetAttr(PyObject* obj, PyObject* attr_nam
 /* SetVTable.proto */
 static int __Pyx_SetVtable(PyObject *dict, void *vtable);
 
+/* PyErrExceptionMatches.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_ExceptionMatches(err) __Pyx_PyErr_ExceptionMatchesInState(__pyx_tstate, err)
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err);
+#else
+#define __Pyx_PyErr_ExceptionMatches(err)  PyErr_ExceptionMatches(err)
+#endif
+
+/* PyObjectGetAttrStrNoError.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name);
+
 /* SetupReduce.proto */
 static int __Pyx_setup_reduce(PyObject* type_obj);
 
@@ -1373,11 +1629,22 @@ static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object);
 static void __Pyx_AddTraceback(const char *funcname, int c_line,
                                int py_line, const char *filename);
 
+/* GCCDiagnostics.proto */
+#if defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 6))
+#define __Pyx_HAS_GCC_DIAGNOSTIC
+#endif
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_Uint32(Uint32 value);
+
 /* CIntToPy.proto */
 static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value);
 
 /* CIntFromPy.proto */
-static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
+static CYTHON_INLINE Uint32 __Pyx_PyInt_As_Uint32(PyObject *);
 
 /* CIntToPy.proto */
 static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
@@ -1405,26 +1672,34 @@ static int __Pyx_check_binary_version(void);
 static int __Pyx_InitStrings(__Pyx_StringTabEntry *t);
 
 static __pyx_t_5mpfmc_4core_5audio_5track_TrackState *__pyx_f_5mpfmc_4core_5audio_5track_5Track_get_state(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self); /* proto*/
-static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_t_5mpfmc_4core_5audio_5track_TrackState *__pyx_v_track, __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData *__pyx_v_callback_data, Uint8 *__pyx_v_output_buffer, Uint32 __pyx_v_buffer_length); /* proto*/
-static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_audio(Uint8 *__pyx_v_output_buffer, Uint8 const *__pyx_v_input_buffer, Uint32 __pyx_v_buffer_length, int __pyx_v_volume); /* proto*/
-static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_audio_stereo(Uint8 *__pyx_v_output_buffer, Uint8 const *__pyx_v_input_buffer, Uint32 __pyx_v_buffer_length, int __pyx_v_volume_left, int __pyx_v_volume_right); /* proto*/
+static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_t_5mpfmc_4core_5audio_5track_TrackState *__pyx_v_track, __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData *__pyx_v_callback_data, float *__pyx_v_output_buffer, Uint32 __pyx_v_buffer_length); /* proto*/
+static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_audio(float *__pyx_v_output_buffer, Uint8 const *__pyx_v_input_buffer, Uint32 __pyx_v_buffer_length, int __pyx_v_volume); /* proto*/
+static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_audio_stereo(float *__pyx_v_output_buffer, Uint8 const *__pyx_v_input_buffer, Uint32 __pyx_v_buffer_length, int __pyx_v_volume_left, int __pyx_v_volume_right); /* proto*/
+static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_bus(float *__pyx_v_output_buffer, float const *__pyx_v_input_buffer, Uint32 __pyx_v_sample_count, float __pyx_v_gain); /* proto*/
+static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_write_bus_to_output(Uint8 *__pyx_v_output_buffer, float const *__pyx_v_bus, float const *__pyx_v_dither, Uint32 __pyx_v_sample_count, float __pyx_v_gain); /* proto*/
 static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_apply_volume(Uint8 *__pyx_v_output_buffer, Uint8 const *__pyx_v_input_buffer, Uint32 __pyx_v_buffer_length, int __pyx_v_volume); /* proto*/
 static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_apply_volume_stereo(Uint8 *__pyx_v_output_buffer, Uint8 const *__pyx_v_input_buffer, Uint32 __pyx_v_buffer_length, int __pyx_v_volume_left, int __pyx_v_volume_right); /* proto*/
 
-/* Module declarations from 'cpython.mem' */
-
-/* Module declarations from 'cpython.pycapsule' */
-
 /* Module declarations from 'mpfmc.core.audio.sdl2' */
 
 /* Module declarations from 'mpfmc.core.audio.gstreamer' */
 
+/* Module declarations from 'cpython.mem' */
+
+/* Module declarations from 'libc.string' */
+
+/* Module declarations from 'cpython.pycapsule' */
+
 /* Module declarations from 'mpfmc.core.audio.inline' */
 static CYTHON_INLINE Uint8 __pyx_f_5mpfmc_4core_5audio_6inline_lerpU8(float, Uint8, Uint8); /*proto*/
 static CYTHON_INLINE float __pyx_f_5mpfmc_4core_5audio_6inline_in_out_quad(float); /*proto*/
+static CYTHON_INLINE Uint32 __pyx_f_5mpfmc_4core_5audio_6inline_bytes_to_bus_samples(Uint32); /*proto*/
 
 /* Module declarations from 'mpfmc.core.audio.notification_message' */
-static CYTHON_INLINE __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message(void); /*proto*/
+static CYTHON_INLINE __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageQueue *__pyx_f_5mpfmc_4core_5audio_20notification_message_create_notification_message_queue(void); /*proto*/
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_free_notification_message_queue(__pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageQueue *); /*proto*/
+static CYTHON_INLINE __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message(__pyx_t_5mpfmc_4core_5audio_5track_TrackState *); /*proto*/
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message__send_notification_message(__pyx_t_5mpfmc_4core_5audio_5track_TrackState *); /*proto*/
 static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_send_track_stopped_notification(__pyx_t_5mpfmc_4core_5audio_5track_TrackState *); /*proto*/
 static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_send_track_paused_notification(__pyx_t_5mpfmc_4core_5audio_5track_TrackState *); /*proto*/
 
@@ -1437,46 +1712,70 @@ int __pyx_module_is_main_mpfmc__core__audio__track = 0;
 /* Implementation of 'mpfmc.core.audio.track' */
 static PyObject *__pyx_builtin_round;
 static PyObject *__pyx_builtin_NotImplementedError;
+static PyObject *__pyx_builtin_range;
 static PyObject *__pyx_builtin_TypeError;
+static const char __pyx_k_i[] = "i";
 static const char __pyx_k_mc[] = "mc";
+static const char __pyx_k_bus[] = "bus";
 static const char __pyx_k_main[] = "__main__";
 static const char __pyx_k_name[] = "name";
 static const char __pyx_k_test[] = "__test__";
+static const char __pyx_k_time[] = "time";
 static const char __pyx_k_Track[] = "Track";
 static const char __pyx_k_debug[] = "debug";
+static const char __pyx_k_range[] = "range";
 static const char __pyx_k_round[] = "round";
+static const char __pyx_k_start[] = "start";
 static const char __pyx_k_track[] = "track";
+static const char __pyx_k_dither[] = "dither";
 static const char __pyx_k_format[] = "format";
 static const char __pyx_k_import[] = "__import__";
 static const char __pyx_k_name_2[] = "__name__";
 static const char __pyx_k_number[] = "number";
+static const char __pyx_k_output[] = "output";
 static const char __pyx_k_reduce[] = "__reduce__";
+static const char __pyx_k_source[] = "source";
 static const char __pyx_k_volume[] = "volume";
 static const char __pyx_k_Track_2[] = "<Track.{}.{}>";
 static const char __pyx_k_logging[] = "logging";
 static const char __pyx_k_warning[] = "warning";
+static const char __pyx_k_channels[] = "channels";
+static const char __pyx_k_duration[] = "duration";
 static const char __pyx_k_getstate[] = "__getstate__";
 static const char __pyx_k_setstate[] = "__setstate__";
 static const char __pyx_k_TypeError[] = "TypeError";
 static const char __pyx_k_getLogger[] = "getLogger";
+static const char __pyx_k_iteration[] = "iteration";
 static const char __pyx_k_reduce_ex[] = "__reduce_ex__";
 static const char __pyx_k_track_num[] = "track_num";
+static const char __pyx_k_iterations[] = "iterations";
 static const char __pyx_k_pyx_vtable[] = "__pyx_vtable__";
 static const char __pyx_k_buffer_size[] = "buffer_size";
+static const char __pyx_k_track_count[] = "track_count";
 static const char __pyx_k_fade_seconds[] = "fade_seconds";
+static const char __pyx_k_perf_counter[] = "perf_counter";
+static const char __pyx_k_sample_count[] = "sample_count";
+static const char __pyx_k_buffer_length[] = "buffer_length";
+static const char __pyx_k_chunk_samples[] = "chunk_samples";
+static const char __pyx_k_control_point[] = "control_point";
 static const char __pyx_k_reduce_cython[] = "__reduce_cython__";
+static const char __pyx_k_track_buffers[] = "track_buffers";
+static const char __pyx_k_buffer_samples[] = "buffer_samples";
 static const char __pyx_k_fade_in_seconds[] = "fade_in_seconds";
 static const char __pyx_k_setstate_cython[] = "__setstate_cython__";
 static const char __pyx_k_fade_out_seconds[] = "fade_out_seconds";
+static const char __pyx_k_benchmark_mix_bus[] = "benchmark_mix_bus";
 static const char __pyx_k_cline_in_traceback[] = "cline_in_traceback";
 static const char __pyx_k_events_when_played[] = "events_when_played";
 static const char __pyx_k_NotImplementedError[] = "NotImplementedError";
 static const char __pyx_k_audio_callback_data[] = "audio_callback_data";
 static const char __pyx_k_post_mc_native_event[] = "post_mc_native_event";
+static const char __pyx_k_mpfmc_core_audio_track[] = "mpfmc.core.audio.track";
+static const char __pyx_k_mpfmc_core_audio_track_pyx[] = "mpfmc/core/audio/track.pyx";
 static const char __pyx_k_play_Applying_s_second_fade_in[] = "play - Applying %s second fade in";
 static const char __pyx_k_pause_Pause_sound_processing_on[] = "pause - Pause sound processing on track";
 static const char __pyx_k_stop_Applying_s_second_fade_out[] = "stop - Applying %s second fade out";
-static const char __pyx_k_Allocated_track_audio_buffer_d_b[] = "Allocated track audio buffer (%d bytes)";
+static const char __pyx_k_Allocated_track_audio_mixing_buf[] = "Allocated track audio mixing buffer (%d samples)";
 static const char __pyx_k_Must_be_overridden_in_derived_cl[] = "Must be overridden in derived class";
 static const char __pyx_k_no_default___reduce___due_to_non[] = "no default __reduce__ due to non-trivial __cinit__";
 static const char __pyx_k_pause_Action_may_only_be_used_wh[] = "pause - Action may only be used when a track is playing; action will be ignored.";
@@ -1487,7 +1786,7 @@ static const char __pyx_k_set_volume_Applying_s_second_fad[] = "set_volume - App
 static const char __pyx_k_set_volume_Interrupting_an_exist[] = "set_volume - Interrupting an existing fade on this track so start a new fade";
 static const char __pyx_k_stop_Action_may_only_be_used_whe[] = "stop - Action may only be used when a track is playing; action will be ignored.";
 static const char __pyx_k_stop_Stop_sound_processing_on_tr[] = "stop - Stop sound processing on track and clear state";
-static PyObject *__pyx_kp_u_Allocated_track_audio_buffer_d_b;
+static PyObject *__pyx_kp_u_Allocated_track_audio_mixing_buf;
 static PyObject *__pyx_kp_u_Must_be_overridden_in_derived_cl;
 static PyObject *__pyx_n_s_NotImplementedError;
 static PyObject *__pyx_n_s_Track;
@@ -1495,9 +1794,18 @@ static PyObject *__pyx_n_u_Track;
 static PyObject *__pyx_kp_u_Track_2;
 static PyObject *__pyx_n_s_TypeError;
 static PyObject *__pyx_n_s_audio_callback_data;
+static PyObject *__pyx_n_s_benchmark_mix_bus;
+static PyObject *__pyx_n_s_buffer_length;
+static PyObject *__pyx_n_s_buffer_samples;
 static PyObject *__pyx_n_s_buffer_size;
+static PyObject *__pyx_n_s_bus;
+static PyObject *__pyx_n_s_channels;
+static PyObject *__pyx_n_s_chunk_samples;
 static PyObject *__pyx_n_s_cline_in_traceback;
+static PyObject *__pyx_n_s_control_point;
 static PyObject *__pyx_n_s_debug;
+static PyObject *__pyx_n_s_dither;
+static PyObject *__pyx_n_s_duration;
 static PyObject *__pyx_n_s_events_when_played;
 static PyObject *__pyx_n_s_fade_in_seconds;
 static PyObject *__pyx_n_s_fade_out_seconds;
@@ -1505,35 +1813,49 @@ static PyObject *__pyx_n_s_fade_seconds;
 static PyObject *__pyx_n_s_format;
 static PyObject *__pyx_n_s_getLogger;
 static PyObject *__pyx_n_s_getstate;
+static PyObject *__pyx_n_s_i;
 static PyObject *__pyx_n_s_import;
+static PyObject *__pyx_n_s_iteration;
+static PyObject *__pyx_n_s_iterations;
 static PyObject *__pyx_n_s_logging;
 static PyObject *__pyx_n_s_main;
 static PyObject *__pyx_n_s_mc;
+static PyObject *__pyx_n_s_mpfmc_core_audio_track;
+static PyObject *__pyx_kp_s_mpfmc_core_audio_track_pyx;
 static PyObject *__pyx_n_s_name;
 static PyObject *__pyx_n_s_name_2;
 static PyObject *__pyx_kp_s_no_default___reduce___due_to_non;
 static PyObject *__pyx_n_s_number;
+static PyObject *__pyx_n_s_output;
 static PyObject *__pyx_kp_u_pause_Action_may_only_be_used_wh;
 static PyObject *__pyx_kp_u_pause_Applying_s_second_fade_out;
 static PyObject *__pyx_kp_u_pause_Pause_sound_processing_on;
+static PyObject *__pyx_n_s_perf_counter;
 static PyObject *__pyx_kp_u_play_Action_may_only_be_used_whe;
 static PyObject *__pyx_kp_u_play_Applying_s_second_fade_in;
 static PyObject *__pyx_kp_u_play_Begin_sound_processing_on_t;
 static PyObject *__pyx_n_s_post_mc_native_event;
 static PyObject *__pyx_n_s_pyx_vtable;
+static PyObject *__pyx_n_s_range;
 static PyObject *__pyx_n_s_reduce;
 static PyObject *__pyx_n_s_reduce_cython;
 static PyObject *__pyx_n_s_reduce_ex;
 static PyObject *__pyx_n_s_round;
+static PyObject *__pyx_n_s_sample_count;
 static PyObject *__pyx_kp_u_set_volume_Applying_s_second_fad;
 static PyObject *__pyx_kp_u_set_volume_Interrupting_an_exist;
 static PyObject *__pyx_n_s_setstate;
 static PyObject *__pyx_n_s_setstate_cython;
+static PyObject *__pyx_n_s_source;
+static PyObject *__pyx_n_s_start;
 static PyObject *__pyx_kp_u_stop_Action_may_only_be_used_whe;
 static PyObject *__pyx_kp_u_stop_Applying_s_second_fade_out;
 static PyObject *__pyx_kp_u_stop_Stop_sound_processing_on_tr;
 static PyObject *__pyx_n_s_test;
+static PyObject *__pyx_n_s_time;
 static PyObject *__pyx_n_s_track;
+static PyObject *__pyx_n_s_track_buffers;
+static PyObject *__pyx_n_s_track_count;
 static PyObject *__pyx_n_s_track_num;
 static PyObject *__pyx_n_s_volume;
 static PyObject *__pyx_n_s_warning;
@@ -1543,6 +1865,8 @@ static void __pyx_pf_5mpfmc_4core_5audio_5track_5Track_4__dealloc__(struct __pyx
 static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6__repr__(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_4name___get__(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6volume___get__(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_21notifications_dropped___get__(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_19active_player_count___get__(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_4type___get__(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6number___get__(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_19events_when_stopped___get__(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self); /* proto */
@@ -1563,14 +1887,18 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_18stop_all_sounds(CY
 static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_20process(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_22__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_24__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_benchmark_mix_bus(CYTHON_UNUSED PyObject *__pyx_self, int __pyx_v_track_count, int __pyx_v_buffer_samples, int __pyx_v_channels, int __pyx_v_iterations); /* proto */
 static PyObject *__pyx_tp_new_5mpfmc_4core_5audio_5track_Track(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_int_0;
 static PyObject *__pyx_int_2;
 static PyObject *__pyx_tuple_;
 static PyObject *__pyx_tuple__2;
 static PyObject *__pyx_tuple__3;
+static PyObject *__pyx_tuple__4;
+static PyObject *__pyx_codeobj__5;
 /* Late includes */
 
-/* "mpfmc/core/audio/track.pyx":28
+/* "mpfmc/core/audio/track.pyx":30
  *     """
  * 
  *     def __cinit__(self, *args, **kw):             # <<<<<<<<<<<<<<
@@ -1603,7 +1931,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track___cinit__(struct __pyx_obj
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__cinit__", 0);
 
-  /* "mpfmc/core/audio/track.pyx":30
+  /* "mpfmc/core/audio/track.pyx":32
  *     def __cinit__(self, *args, **kw):
  *         """C constructor"""
  *         self.state = NULL             # <<<<<<<<<<<<<<
@@ -1612,7 +1940,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track___cinit__(struct __pyx_obj
  */
   __pyx_v_self->state = NULL;
 
-  /* "mpfmc/core/audio/track.pyx":31
+  /* "mpfmc/core/audio/track.pyx":33
  *         """C constructor"""
  *         self.state = NULL
  *         self.device_id = 0             # <<<<<<<<<<<<<<
@@ -1621,7 +1949,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track___cinit__(struct __pyx_obj
  */
   __pyx_v_self->device_id = 0;
 
-  /* "mpfmc/core/audio/track.pyx":28
+  /* "mpfmc/core/audio/track.pyx":30
  *     """
  * 
  *     def __cinit__(self, *args, **kw):             # <<<<<<<<<<<<<<
@@ -1635,7 +1963,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track___cinit__(struct __pyx_obj
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":33
+/* "mpfmc/core/audio/track.pyx":35
  *         self.device_id = 0
  * 
  *     def __init__(self, object mc, object audio_callback_data, str name, int track_num, int buffer_size, float volume=1.0):             # <<<<<<<<<<<<<<
@@ -1646,7 +1974,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track___cinit__(struct __pyx_obj
 /* Python wrapper */
 static int __pyx_pw_5mpfmc_4core_5audio_5track_5Track_3__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
 static char __pyx_doc_5mpfmc_4core_5audio_5track_5Track_2__init__[] = "\n        Constructor\n        Args:\n            mc: The media controller app\n            audio_callback_data: The AudioCallbackData pointer wrapped in a PyCapsule object\n            name: The track name\n            track_num: The track number (corresponds to the SDL_Mixer channel number)\n            buffer_size: The length of the track audio buffer in bytes\n            volume: The track volume (0.0 to 1.0)\n        ";
-#if CYTHON_COMPILING_IN_CPYTHON
+#if CYTHON_UPDATE_DESCRIPTOR_DOC
 struct wrapperbase __pyx_wrapperbase_5mpfmc_4core_5audio_5track_5Track_2__init__;
 #endif
 static int __pyx_pw_5mpfmc_4core_5audio_5track_5Track_3__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
@@ -1656,6 +1984,9 @@ static int __pyx_pw_5mpfmc_4core_5audio_5track_5Track_3__init__(PyObject *__pyx_
   int __pyx_v_track_num;
   int __pyx_v_buffer_size;
   float __pyx_v_volume;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   int __pyx_r;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__init__ (wrapper)", 0);
@@ -1690,25 +2021,25 @@ static int __pyx_pw_5mpfmc_4core_5audio_5track_5Track_3__init__(PyObject *__pyx_
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_audio_callback_data)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 0, 5, 6, 1); __PYX_ERR(0, 33, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("__init__", 0, 5, 6, 1); __PYX_ERR(0, 35, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
         if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_name)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 0, 5, 6, 2); __PYX_ERR(0, 33, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("__init__", 0, 5, 6, 2); __PYX_ERR(0, 35, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  3:
         if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_track_num)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 0, 5, 6, 3); __PYX_ERR(0, 33, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("__init__", 0, 5, 6, 3); __PYX_ERR(0, 35, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  4:
         if (likely((values[4] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_buffer_size)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 0, 5, 6, 4); __PYX_ERR(0, 33, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("__init__", 0, 5, 6, 4); __PYX_ERR(0, 35, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  5:
@@ -1718,7 +2049,7 @@ static int __pyx_pw_5mpfmc_4core_5audio_5track_5Track_3__init__(PyObject *__pyx_
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 33, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 35, __pyx_L3_error)
       }
     } else {
       switch (PyTuple_GET_SIZE(__pyx_args)) {
@@ -1736,23 +2067,23 @@ static int __pyx_pw_5mpfmc_4core_5audio_5track_5Track_3__init__(PyObject *__pyx_
     __pyx_v_mc = values[0];
     __pyx_v_audio_callback_data = values[1];
     __pyx_v_name = ((PyObject*)values[2]);
-    __pyx_v_track_num = __Pyx_PyInt_As_int(values[3]); if (unlikely((__pyx_v_track_num == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 33, __pyx_L3_error)
-    __pyx_v_buffer_size = __Pyx_PyInt_As_int(values[4]); if (unlikely((__pyx_v_buffer_size == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 33, __pyx_L3_error)
+    __pyx_v_track_num = __Pyx_PyInt_As_int(values[3]); if (unlikely((__pyx_v_track_num == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 35, __pyx_L3_error)
+    __pyx_v_buffer_size = __Pyx_PyInt_As_int(values[4]); if (unlikely((__pyx_v_buffer_size == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 35, __pyx_L3_error)
     if (values[5]) {
-      __pyx_v_volume = __pyx_PyFloat_AsFloat(values[5]); if (unlikely((__pyx_v_volume == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 33, __pyx_L3_error)
+      __pyx_v_volume = __pyx_PyFloat_AsFloat(values[5]); if (unlikely((__pyx_v_volume == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 35, __pyx_L3_error)
     } else {
       __pyx_v_volume = ((float)1.0);
     }
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__init__", 0, 5, 6, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 33, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("__init__", 0, 5, 6, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 35, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("mpfmc.core.audio.track.Track.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return -1;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_name), (&PyUnicode_Type), 1, "name", 1))) __PYX_ERR(0, 33, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_name), (&PyUnicode_Type), 1, "name", 1))) __PYX_ERR(0, 35, __pyx_L1_error)
   __pyx_r = __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(((struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *)__pyx_v_self), __pyx_v_mc, __pyx_v_audio_callback_data, __pyx_v_name, __pyx_v_track_num, __pyx_v_buffer_size, __pyx_v_volume);
 
   /* function exit code */
@@ -1778,18 +2109,21 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
   long __pyx_t_8;
   float __pyx_t_9;
   float __pyx_t_10;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__init__", 0);
 
-  /* "mpfmc/core/audio/track.pyx":44
+  /* "mpfmc/core/audio/track.pyx":46
  *             volume: The track volume (0.0 to 1.0)
  *         """
  *         self.log = logging.getLogger("Track")             # <<<<<<<<<<<<<<
  *         self.mc = mc
  *         self._name = name
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_logging); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 44, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_logging); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 46, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_getLogger); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 44, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_getLogger); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 46, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_t_2 = NULL;
@@ -1804,7 +2138,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
   }
   __pyx_t_1 = (__pyx_t_2) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_2, __pyx_n_u_Track) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_n_u_Track);
   __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 44, __pyx_L1_error)
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 46, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_GIVEREF(__pyx_t_1);
@@ -1813,7 +2147,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
   __pyx_v_self->log = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/track.pyx":45
+  /* "mpfmc/core/audio/track.pyx":47
  *         """
  *         self.log = logging.getLogger("Track")
  *         self.mc = mc             # <<<<<<<<<<<<<<
@@ -1826,7 +2160,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
   __Pyx_DECREF(__pyx_v_self->mc);
   __pyx_v_self->mc = __pyx_v_mc;
 
-  /* "mpfmc/core/audio/track.pyx":46
+  /* "mpfmc/core/audio/track.pyx":48
  *         self.log = logging.getLogger("Track")
  *         self.mc = mc
  *         self._name = name             # <<<<<<<<<<<<<<
@@ -1839,7 +2173,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
   __Pyx_DECREF(__pyx_v_self->_name);
   __pyx_v_self->_name = __pyx_v_name;
 
-  /* "mpfmc/core/audio/track.pyx":47
+  /* "mpfmc/core/audio/track.pyx":49
  *         self.mc = mc
  *         self._name = name
  *         self._number = track_num             # <<<<<<<<<<<<<<
@@ -1848,7 +2182,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
  */
   __pyx_v_self->_number = __pyx_v_track_num;
 
-  /* "mpfmc/core/audio/track.pyx":48
+  /* "mpfmc/core/audio/track.pyx":50
  *         self._name = name
  *         self._number = track_num
  *         self._events_when_stopped = None             # <<<<<<<<<<<<<<
@@ -1861,7 +2195,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
   __Pyx_DECREF(__pyx_v_self->_events_when_stopped);
   __pyx_v_self->_events_when_stopped = ((PyObject*)Py_None);
 
-  /* "mpfmc/core/audio/track.pyx":49
+  /* "mpfmc/core/audio/track.pyx":51
  *         self._number = track_num
  *         self._events_when_stopped = None
  *         self._events_when_played = None             # <<<<<<<<<<<<<<
@@ -1874,7 +2208,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
   __Pyx_DECREF(__pyx_v_self->_events_when_played);
   __pyx_v_self->_events_when_played = ((PyObject*)Py_None);
 
-  /* "mpfmc/core/audio/track.pyx":50
+  /* "mpfmc/core/audio/track.pyx":52
  *         self._events_when_stopped = None
  *         self._events_when_played = None
  *         self._events_when_paused = None             # <<<<<<<<<<<<<<
@@ -1887,79 +2221,160 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
   __Pyx_DECREF(__pyx_v_self->_events_when_paused);
   __pyx_v_self->_events_when_paused = ((PyObject*)Py_None);
 
-  /* "mpfmc/core/audio/track.pyx":53
+  /* "mpfmc/core/audio/track.pyx":55
  * 
  *         # Allocate memory for the track state (common among all track types)
  *         self.state = <TrackState*> PyMem_Malloc(sizeof(TrackState))             # <<<<<<<<<<<<<<
  *         self.state.mix_callback_function = NULL
- *         self.state.type_state = NULL
+ *         self.state.request_callback_function = NULL
  */
   __pyx_v_self->state = ((__pyx_t_5mpfmc_4core_5audio_5track_TrackState *)PyMem_Malloc((sizeof(__pyx_t_5mpfmc_4core_5audio_5track_TrackState))));
 
-  /* "mpfmc/core/audio/track.pyx":54
+  /* "mpfmc/core/audio/track.pyx":56
  *         # Allocate memory for the track state (common among all track types)
  *         self.state = <TrackState*> PyMem_Malloc(sizeof(TrackState))
  *         self.state.mix_callback_function = NULL             # <<<<<<<<<<<<<<
+ *         self.state.request_callback_function = NULL
  *         self.state.type_state = NULL
- *         self.state.number = track_num
  */
   __pyx_v_self->state->mix_callback_function = NULL;
 
-  /* "mpfmc/core/audio/track.pyx":55
+  /* "mpfmc/core/audio/track.pyx":57
  *         self.state = <TrackState*> PyMem_Malloc(sizeof(TrackState))
  *         self.state.mix_callback_function = NULL
+ *         self.state.request_callback_function = NULL             # <<<<<<<<<<<<<<
+ *         self.state.type_state = NULL
+ *         self.state.number = track_num
+ */
+  __pyx_v_self->state->request_callback_function = NULL;
+
+  /* "mpfmc/core/audio/track.pyx":58
+ *         self.state.mix_callback_function = NULL
+ *         self.state.request_callback_function = NULL
  *         self.state.type_state = NULL             # <<<<<<<<<<<<<<
  *         self.state.number = track_num
- *         self.state.buffer = <Uint8 *>PyMem_Malloc(buffer_size)
+ *         # The track buffer is a floating point mixing buffer (one float per 16-bit output sample)
  */
   __pyx_v_self->state->type_state = NULL;
 
-  /* "mpfmc/core/audio/track.pyx":56
- *         self.state.mix_callback_function = NULL
+  /* "mpfmc/core/audio/track.pyx":59
+ *         self.state.request_callback_function = NULL
  *         self.state.type_state = NULL
  *         self.state.number = track_num             # <<<<<<<<<<<<<<
- *         self.state.buffer = <Uint8 *>PyMem_Malloc(buffer_size)
- *         self.state.buffer_size = buffer_size
+ *         # The track buffer is a floating point mixing buffer (one float per 16-bit output sample)
+ *         self.state.buffer = <float *>PyMem_Malloc(bytes_to_bus_samples(buffer_size) * sizeof(float))
  */
   __pyx_v_self->state->number = __pyx_v_track_num;
 
-  /* "mpfmc/core/audio/track.pyx":57
- *         self.state.type_state = NULL
+  /* "mpfmc/core/audio/track.pyx":61
  *         self.state.number = track_num
- *         self.state.buffer = <Uint8 *>PyMem_Malloc(buffer_size)             # <<<<<<<<<<<<<<
+ *         # The track buffer is a floating point mixing buffer (one float per 16-bit output sample)
+ *         self.state.buffer = <float *>PyMem_Malloc(bytes_to_bus_samples(buffer_size) * sizeof(float))             # <<<<<<<<<<<<<<
  *         self.state.buffer_size = buffer_size
- *         self.state.ducking_control_points = g_array_sized_new(False, True, sizeof(guint8), CONTROL_POINTS_PER_BUFFER)
+ *         self.state.buffer_is_silent = False
  */
-  __pyx_v_self->state->buffer = ((Uint8 *)PyMem_Malloc(__pyx_v_buffer_size));
+  __pyx_v_self->state->buffer = ((float *)PyMem_Malloc((__pyx_f_5mpfmc_4core_5audio_6inline_bytes_to_bus_samples(__pyx_v_buffer_size) * (sizeof(float)))));
 
-  /* "mpfmc/core/audio/track.pyx":58
- *         self.state.number = track_num
- *         self.state.buffer = <Uint8 *>PyMem_Malloc(buffer_size)
+  /* "mpfmc/core/audio/track.pyx":62
+ *         # The track buffer is a floating point mixing buffer (one float per 16-bit output sample)
+ *         self.state.buffer = <float *>PyMem_Malloc(bytes_to_bus_samples(buffer_size) * sizeof(float))
  *         self.state.buffer_size = buffer_size             # <<<<<<<<<<<<<<
- *         self.state.ducking_control_points = g_array_sized_new(False, True, sizeof(guint8), CONTROL_POINTS_PER_BUFFER)
- *         self.log.debug("Allocated track audio buffer (%d bytes)", buffer_size)
+ *         self.state.buffer_is_silent = False
+ *         self.state.active_player_count = 0
  */
   __pyx_v_self->state->buffer_size = __pyx_v_buffer_size;
 
-  /* "mpfmc/core/audio/track.pyx":59
- *         self.state.buffer = <Uint8 *>PyMem_Malloc(buffer_size)
+  /* "mpfmc/core/audio/track.pyx":63
+ *         self.state.buffer = <float *>PyMem_Malloc(bytes_to_bus_samples(buffer_size) * sizeof(float))
+ *         self.state.buffer_size = buffer_size
+ *         self.state.buffer_is_silent = False             # <<<<<<<<<<<<<<
+ *         self.state.active_player_count = 0
+ *         self.state.active_player_peak = 0
+ */
+  __pyx_v_self->state->buffer_is_silent = 0;
+
+  /* "mpfmc/core/audio/track.pyx":64
  *         self.state.buffer_size = buffer_size
+ *         self.state.buffer_is_silent = False
+ *         self.state.active_player_count = 0             # <<<<<<<<<<<<<<
+ *         self.state.active_player_peak = 0
+ *         self.state.active_player_total = 0
+ */
+  __pyx_v_self->state->active_player_count = 0;
+
+  /* "mpfmc/core/audio/track.pyx":65
+ *         self.state.buffer_is_silent = False
+ *         self.state.active_player_count = 0
+ *         self.state.active_player_peak = 0             # <<<<<<<<<<<<<<
+ *         self.state.active_player_total = 0
+ *         self.state.mix_ticks = 0
+ */
+  __pyx_v_self->state->active_player_peak = 0;
+
+  /* "mpfmc/core/audio/track.pyx":66
+ *         self.state.active_player_count = 0
+ *         self.state.active_player_peak = 0
+ *         self.state.active_player_total = 0             # <<<<<<<<<<<<<<
+ *         self.state.mix_ticks = 0
+ *         self.state.mix_load = 0.0
+ */
+  __pyx_v_self->state->active_player_total = 0;
+
+  /* "mpfmc/core/audio/track.pyx":67
+ *         self.state.active_player_peak = 0
+ *         self.state.active_player_total = 0
+ *         self.state.mix_ticks = 0             # <<<<<<<<<<<<<<
+ *         self.state.mix_load = 0.0
+ *         self.state.mix_load_peak = 0.0
+ */
+  __pyx_v_self->state->mix_ticks = 0;
+
+  /* "mpfmc/core/audio/track.pyx":68
+ *         self.state.active_player_total = 0
+ *         self.state.mix_ticks = 0
+ *         self.state.mix_load = 0.0             # <<<<<<<<<<<<<<
+ *         self.state.mix_load_peak = 0.0
+ * 
+ */
+  __pyx_v_self->state->mix_load = 0.0;
+
+  /* "mpfmc/core/audio/track.pyx":69
+ *         self.state.mix_ticks = 0
+ *         self.state.mix_load = 0.0
+ *         self.state.mix_load_peak = 0.0             # <<<<<<<<<<<<<<
+ * 
+ *         # Ducking control points are only reset by the audio callback when ducking was active, this
+ */
+  __pyx_v_self->state->mix_load_peak = 0.0;
+
+  /* "mpfmc/core/audio/track.pyx":73
+ *         # Ducking control points are only reset by the audio callback when ducking was active, this
+ *         # forces them to be initialized during the first callback
+ *         self.state.ducking_is_active = True             # <<<<<<<<<<<<<<
+ *         self.state.ducking_control_points = g_array_sized_new(False, True, sizeof(guint8), CONTROL_POINTS_PER_BUFFER)
+ *         self.log.debug("Allocated track audio mixing buffer (%d samples)", bytes_to_bus_samples(buffer_size))
+ */
+  __pyx_v_self->state->ducking_is_active = 1;
+
+  /* "mpfmc/core/audio/track.pyx":74
+ *         # forces them to be initialized during the first callback
+ *         self.state.ducking_is_active = True
  *         self.state.ducking_control_points = g_array_sized_new(False, True, sizeof(guint8), CONTROL_POINTS_PER_BUFFER)             # <<<<<<<<<<<<<<
- *         self.log.debug("Allocated track audio buffer (%d bytes)", buffer_size)
+ *         self.log.debug("Allocated track audio mixing buffer (%d samples)", bytes_to_bus_samples(buffer_size))
  * 
  */
   __pyx_v_self->state->ducking_control_points = g_array_sized_new(0, 1, (sizeof(guint8)), __pyx_e_5mpfmc_4core_5audio_5track_CONTROL_POINTS_PER_BUFFER);
 
-  /* "mpfmc/core/audio/track.pyx":60
- *         self.state.buffer_size = buffer_size
+  /* "mpfmc/core/audio/track.pyx":75
+ *         self.state.ducking_is_active = True
  *         self.state.ducking_control_points = g_array_sized_new(False, True, sizeof(guint8), CONTROL_POINTS_PER_BUFFER)
- *         self.log.debug("Allocated track audio buffer (%d bytes)", buffer_size)             # <<<<<<<<<<<<<<
+ *         self.log.debug("Allocated track audio mixing buffer (%d samples)", bytes_to_bus_samples(buffer_size))             # <<<<<<<<<<<<<<
  * 
  *         # The easiest way to pass a C pointer in a constructor is to wrap it in a PyCapsule
  */
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_debug); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 60, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_debug); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 75, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_buffer_size); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 60, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyInt_From_Uint32(__pyx_f_5mpfmc_4core_5audio_6inline_bytes_to_bus_samples(__pyx_v_buffer_size)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 75, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_t_4 = NULL;
   __pyx_t_5 = 0;
@@ -1975,8 +2390,8 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
   }
   #if CYTHON_FAST_PYCALL
   if (PyFunction_Check(__pyx_t_3)) {
-    PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_kp_u_Allocated_track_audio_buffer_d_b, __pyx_t_2};
-    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_5, 2+__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 60, __pyx_L1_error)
+    PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_kp_u_Allocated_track_audio_mixing_buf, __pyx_t_2};
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_5, 2+__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 75, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
@@ -1984,43 +2399,43 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
   #endif
   #if CYTHON_FAST_PYCCALL
   if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
-    PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_kp_u_Allocated_track_audio_buffer_d_b, __pyx_t_2};
-    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_5, 2+__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 60, __pyx_L1_error)
+    PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_kp_u_Allocated_track_audio_mixing_buf, __pyx_t_2};
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_5, 2+__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 75, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   } else
   #endif
   {
-    __pyx_t_6 = PyTuple_New(2+__pyx_t_5); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 60, __pyx_L1_error)
+    __pyx_t_6 = PyTuple_New(2+__pyx_t_5); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 75, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
     if (__pyx_t_4) {
       __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_4); __pyx_t_4 = NULL;
     }
-    __Pyx_INCREF(__pyx_kp_u_Allocated_track_audio_buffer_d_b);
-    __Pyx_GIVEREF(__pyx_kp_u_Allocated_track_audio_buffer_d_b);
-    PyTuple_SET_ITEM(__pyx_t_6, 0+__pyx_t_5, __pyx_kp_u_Allocated_track_audio_buffer_d_b);
+    __Pyx_INCREF(__pyx_kp_u_Allocated_track_audio_mixing_buf);
+    __Pyx_GIVEREF(__pyx_kp_u_Allocated_track_audio_mixing_buf);
+    PyTuple_SET_ITEM(__pyx_t_6, 0+__pyx_t_5, __pyx_kp_u_Allocated_track_audio_mixing_buf);
     __Pyx_GIVEREF(__pyx_t_2);
     PyTuple_SET_ITEM(__pyx_t_6, 1+__pyx_t_5, __pyx_t_2);
     __pyx_t_2 = 0;
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_6, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 60, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_6, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 75, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
   }
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/track.pyx":65
+  /* "mpfmc/core/audio/track.pyx":80
  *         # (see https://docs.python.org/3.4/c-api/capsule.html).  This basically wraps the
  *         # pointer in a Python object. It can be extracted using PyCapsule_GetPointer.
  *         self.state.callback_data = <AudioCallbackData*>pycapsule.PyCapsule_GetPointer(audio_callback_data, NULL)             # <<<<<<<<<<<<<<
  * 
  *         self.state.status = track_status_playing
  */
-  __pyx_t_7 = PyCapsule_GetPointer(__pyx_v_audio_callback_data, NULL); if (unlikely(__pyx_t_7 == ((void *)NULL) && PyErr_Occurred())) __PYX_ERR(0, 65, __pyx_L1_error)
+  __pyx_t_7 = PyCapsule_GetPointer(__pyx_v_audio_callback_data, NULL); if (unlikely(__pyx_t_7 == ((void *)NULL) && PyErr_Occurred())) __PYX_ERR(0, 80, __pyx_L1_error)
   __pyx_v_self->state->callback_data = ((__pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData *)__pyx_t_7);
 
-  /* "mpfmc/core/audio/track.pyx":67
+  /* "mpfmc/core/audio/track.pyx":82
  *         self.state.callback_data = <AudioCallbackData*>pycapsule.PyCapsule_GetPointer(audio_callback_data, NULL)
  * 
  *         self.state.status = track_status_playing             # <<<<<<<<<<<<<<
@@ -2029,7 +2444,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
  */
   __pyx_v_self->state->status = __pyx_e_5mpfmc_4core_5audio_5track_track_status_playing;
 
-  /* "mpfmc/core/audio/track.pyx":68
+  /* "mpfmc/core/audio/track.pyx":83
  * 
  *         self.state.status = track_status_playing
  *         self.state.fade_steps = 0             # <<<<<<<<<<<<<<
@@ -2038,7 +2453,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
  */
   __pyx_v_self->state->fade_steps = 0;
 
-  /* "mpfmc/core/audio/track.pyx":69
+  /* "mpfmc/core/audio/track.pyx":84
  *         self.state.status = track_status_playing
  *         self.state.fade_steps = 0
  *         self.state.fade_steps_remaining = 0             # <<<<<<<<<<<<<<
@@ -2047,7 +2462,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
  */
   __pyx_v_self->state->fade_steps_remaining = 0;
 
-  /* "mpfmc/core/audio/track.pyx":70
+  /* "mpfmc/core/audio/track.pyx":85
  *         self.state.fade_steps = 0
  *         self.state.fade_steps_remaining = 0
  *         new_volume = <Uint8>min(max(volume * SDL_MIX_MAXVOLUME, 0), SDL_MIX_MAXVOLUME)             # <<<<<<<<<<<<<<
@@ -2070,7 +2485,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
   }
   __pyx_v_new_volume = ((Uint8)__pyx_t_10);
 
-  /* "mpfmc/core/audio/track.pyx":71
+  /* "mpfmc/core/audio/track.pyx":86
  *         self.state.fade_steps_remaining = 0
  *         new_volume = <Uint8>min(max(volume * SDL_MIX_MAXVOLUME, 0), SDL_MIX_MAXVOLUME)
  *         self.state.volume = new_volume             # <<<<<<<<<<<<<<
@@ -2079,7 +2494,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
  */
   __pyx_v_self->state->volume = __pyx_v_new_volume;
 
-  /* "mpfmc/core/audio/track.pyx":72
+  /* "mpfmc/core/audio/track.pyx":87
  *         new_volume = <Uint8>min(max(volume * SDL_MIX_MAXVOLUME, 0), SDL_MIX_MAXVOLUME)
  *         self.state.volume = new_volume
  *         self.state.fade_volume_current = new_volume             # <<<<<<<<<<<<<<
@@ -2088,7 +2503,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
  */
   __pyx_v_self->state->fade_volume_current = __pyx_v_new_volume;
 
-  /* "mpfmc/core/audio/track.pyx":73
+  /* "mpfmc/core/audio/track.pyx":88
  *         self.state.volume = new_volume
  *         self.state.fade_volume_current = new_volume
  *         self.state.fade_volume_start = new_volume             # <<<<<<<<<<<<<<
@@ -2097,25 +2512,34 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
  */
   __pyx_v_self->state->fade_volume_start = __pyx_v_new_volume;
 
-  /* "mpfmc/core/audio/track.pyx":74
+  /* "mpfmc/core/audio/track.pyx":89
  *         self.state.fade_volume_current = new_volume
  *         self.state.fade_volume_start = new_volume
  *         self.state.fade_volume_target = new_volume             # <<<<<<<<<<<<<<
  * 
- *         self.state.notification_messages = NULL
+ *         # Notification messages are passed from the audio callback to the main thread through a
  */
   __pyx_v_self->state->fade_volume_target = __pyx_v_new_volume;
 
-  /* "mpfmc/core/audio/track.pyx":76
- *         self.state.fade_volume_target = new_volume
+  /* "mpfmc/core/audio/track.pyx":93
+ *         # Notification messages are passed from the audio callback to the main thread through a
+ *         # lock-free queue (request messages are only used by some track types)
+ *         self.state.notification_messages = <void*>create_notification_message_queue()             # <<<<<<<<<<<<<<
+ *         self.state.request_messages = NULL
  * 
- *         self.state.notification_messages = NULL             # <<<<<<<<<<<<<<
+ */
+  __pyx_v_self->state->notification_messages = ((void *)__pyx_f_5mpfmc_4core_5audio_20notification_message_create_notification_message_queue());
+
+  /* "mpfmc/core/audio/track.pyx":94
+ *         # lock-free queue (request messages are only used by some track types)
+ *         self.state.notification_messages = <void*>create_notification_message_queue()
+ *         self.state.request_messages = NULL             # <<<<<<<<<<<<<<
  * 
  *     def __dealloc__(self):
  */
-  __pyx_v_self->state->notification_messages = NULL;
+  __pyx_v_self->state->request_messages = NULL;
 
-  /* "mpfmc/core/audio/track.pyx":33
+  /* "mpfmc/core/audio/track.pyx":35
  *         self.device_id = 0
  * 
  *     def __init__(self, object mc, object audio_callback_data, str name, int track_num, int buffer_size, float volume=1.0):             # <<<<<<<<<<<<<<
@@ -2139,8 +2563,8 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":78
- *         self.state.notification_messages = NULL
+/* "mpfmc/core/audio/track.pyx":96
+ *         self.state.request_messages = NULL
  * 
  *     def __dealloc__(self):             # <<<<<<<<<<<<<<
  *         """Destructor"""
@@ -2162,35 +2586,53 @@ static void __pyx_pf_5mpfmc_4core_5audio_5track_5Track_4__dealloc__(struct __pyx
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__dealloc__", 0);
 
-  /* "mpfmc/core/audio/track.pyx":80
+  /* "mpfmc/core/audio/track.pyx":98
  *     def __dealloc__(self):
  *         """Destructor"""
  *         SDL_LockAudio()             # <<<<<<<<<<<<<<
  *         g_array_free(self.state.ducking_control_points, True)
- *         PyMem_Free(self.state)
+ *         free_notification_message_queue(<NotificationMessageQueue*>self.state.notification_messages)
  */
   SDL_LockAudio();
 
-  /* "mpfmc/core/audio/track.pyx":81
+  /* "mpfmc/core/audio/track.pyx":99
  *         """Destructor"""
  *         SDL_LockAudio()
  *         g_array_free(self.state.ducking_control_points, True)             # <<<<<<<<<<<<<<
- *         PyMem_Free(self.state)
- *         SDL_UnlockAudio()
+ *         free_notification_message_queue(<NotificationMessageQueue*>self.state.notification_messages)
+ *         PyMem_Free(self.state.buffer)
  */
   (void)(g_array_free(__pyx_v_self->state->ducking_control_points, 1));
 
-  /* "mpfmc/core/audio/track.pyx":82
+  /* "mpfmc/core/audio/track.pyx":100
  *         SDL_LockAudio()
  *         g_array_free(self.state.ducking_control_points, True)
+ *         free_notification_message_queue(<NotificationMessageQueue*>self.state.notification_messages)             # <<<<<<<<<<<<<<
+ *         PyMem_Free(self.state.buffer)
+ *         PyMem_Free(self.state)
+ */
+  __pyx_f_5mpfmc_4core_5audio_20notification_message_free_notification_message_queue(((__pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageQueue *)__pyx_v_self->state->notification_messages));
+
+  /* "mpfmc/core/audio/track.pyx":101
+ *         g_array_free(self.state.ducking_control_points, True)
+ *         free_notification_message_queue(<NotificationMessageQueue*>self.state.notification_messages)
+ *         PyMem_Free(self.state.buffer)             # <<<<<<<<<<<<<<
+ *         PyMem_Free(self.state)
+ *         SDL_UnlockAudio()
+ */
+  PyMem_Free(__pyx_v_self->state->buffer);
+
+  /* "mpfmc/core/audio/track.pyx":102
+ *         free_notification_message_queue(<NotificationMessageQueue*>self.state.notification_messages)
+ *         PyMem_Free(self.state.buffer)
  *         PyMem_Free(self.state)             # <<<<<<<<<<<<<<
  *         SDL_UnlockAudio()
  * 
  */
   PyMem_Free(__pyx_v_self->state);
 
-  /* "mpfmc/core/audio/track.pyx":83
- *         g_array_free(self.state.ducking_control_points, True)
+  /* "mpfmc/core/audio/track.pyx":103
+ *         PyMem_Free(self.state.buffer)
  *         PyMem_Free(self.state)
  *         SDL_UnlockAudio()             # <<<<<<<<<<<<<<
  * 
@@ -2198,8 +2640,8 @@ static void __pyx_pf_5mpfmc_4core_5audio_5track_5Track_4__dealloc__(struct __pyx
  */
   SDL_UnlockAudio();
 
-  /* "mpfmc/core/audio/track.pyx":78
- *         self.state.notification_messages = NULL
+  /* "mpfmc/core/audio/track.pyx":96
+ *         self.state.request_messages = NULL
  * 
  *     def __dealloc__(self):             # <<<<<<<<<<<<<<
  *         """Destructor"""
@@ -2210,7 +2652,7 @@ static void __pyx_pf_5mpfmc_4core_5audio_5track_5Track_4__dealloc__(struct __pyx
   __Pyx_RefNannyFinishContext();
 }
 
-/* "mpfmc/core/audio/track.pyx":85
+/* "mpfmc/core/audio/track.pyx":105
  *         SDL_UnlockAudio()
  * 
  *     def __repr__(self):             # <<<<<<<<<<<<<<
@@ -2241,9 +2683,12 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6__repr__(struct __p
   PyObject *__pyx_t_5 = NULL;
   int __pyx_t_6;
   PyObject *__pyx_t_7 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__repr__", 0);
 
-  /* "mpfmc/core/audio/track.pyx":86
+  /* "mpfmc/core/audio/track.pyx":106
  * 
  *     def __repr__(self):
  *         return '<Track.{}.{}>'.format(self.number, self.name)             # <<<<<<<<<<<<<<
@@ -2251,11 +2696,11 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6__repr__(struct __p
  *     cdef TrackState *get_state(self):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_Track_2, __pyx_n_s_format); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 86, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_Track_2, __pyx_n_s_format); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 106, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_number); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 86, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_number); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 106, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_name); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 86, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_name); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 106, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __pyx_t_5 = NULL;
   __pyx_t_6 = 0;
@@ -2272,7 +2717,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6__repr__(struct __p
   #if CYTHON_FAST_PYCALL
   if (PyFunction_Check(__pyx_t_2)) {
     PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_t_3, __pyx_t_4};
-    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 86, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 106, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -2282,7 +2727,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6__repr__(struct __p
   #if CYTHON_FAST_PYCCALL
   if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
     PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_t_3, __pyx_t_4};
-    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 86, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 106, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -2290,7 +2735,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6__repr__(struct __p
   } else
   #endif
   {
-    __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 86, __pyx_L1_error)
+    __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 106, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_7);
     if (__pyx_t_5) {
       __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_5); __pyx_t_5 = NULL;
@@ -2301,7 +2746,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6__repr__(struct __p
     PyTuple_SET_ITEM(__pyx_t_7, 1+__pyx_t_6, __pyx_t_4);
     __pyx_t_3 = 0;
     __pyx_t_4 = 0;
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_7, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 86, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_7, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 106, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
   }
@@ -2310,7 +2755,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6__repr__(struct __p
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "mpfmc/core/audio/track.pyx":85
+  /* "mpfmc/core/audio/track.pyx":105
  *         SDL_UnlockAudio()
  * 
  *     def __repr__(self):             # <<<<<<<<<<<<<<
@@ -2334,7 +2779,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6__repr__(struct __p
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":88
+/* "mpfmc/core/audio/track.pyx":108
  *         return '<Track.{}.{}>'.format(self.number, self.name)
  * 
  *     cdef TrackState *get_state(self):             # <<<<<<<<<<<<<<
@@ -2347,7 +2792,7 @@ static __pyx_t_5mpfmc_4core_5audio_5track_TrackState *__pyx_f_5mpfmc_4core_5audi
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("get_state", 0);
 
-  /* "mpfmc/core/audio/track.pyx":89
+  /* "mpfmc/core/audio/track.pyx":109
  * 
  *     cdef TrackState *get_state(self):
  *         return self.state             # <<<<<<<<<<<<<<
@@ -2357,7 +2802,7 @@ static __pyx_t_5mpfmc_4core_5audio_5track_TrackState *__pyx_f_5mpfmc_4core_5audi
   __pyx_r = __pyx_v_self->state;
   goto __pyx_L0;
 
-  /* "mpfmc/core/audio/track.pyx":88
+  /* "mpfmc/core/audio/track.pyx":108
  *         return '<Track.{}.{}>'.format(self.number, self.name)
  * 
  *     cdef TrackState *get_state(self):             # <<<<<<<<<<<<<<
@@ -2371,7 +2816,7 @@ static __pyx_t_5mpfmc_4core_5audio_5track_TrackState *__pyx_f_5mpfmc_4core_5audi
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":92
+/* "mpfmc/core/audio/track.pyx":112
  * 
  *     property name:
  *         def __get__(self):             # <<<<<<<<<<<<<<
@@ -2397,7 +2842,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_4name___get__(struct
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "mpfmc/core/audio/track.pyx":93
+  /* "mpfmc/core/audio/track.pyx":113
  *     property name:
  *         def __get__(self):
  *             return self._name             # <<<<<<<<<<<<<<
@@ -2409,7 +2854,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_4name___get__(struct
   __pyx_r = __pyx_v_self->_name;
   goto __pyx_L0;
 
-  /* "mpfmc/core/audio/track.pyx":92
+  /* "mpfmc/core/audio/track.pyx":112
  * 
  *     property name:
  *         def __get__(self):             # <<<<<<<<<<<<<<
@@ -2424,7 +2869,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_4name___get__(struct
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":96
+/* "mpfmc/core/audio/track.pyx":116
  * 
  *     property volume:
  *         def __get__(self):             # <<<<<<<<<<<<<<
@@ -2450,9 +2895,12 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6volume___get__(stru
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "mpfmc/core/audio/track.pyx":97
+  /* "mpfmc/core/audio/track.pyx":117
  *     property volume:
  *         def __get__(self):
  *             return round(self.state.volume / SDL_MIX_MAXVOLUME, 2)             # <<<<<<<<<<<<<<
@@ -2462,11 +2910,11 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6volume___get__(stru
   __Pyx_XDECREF(__pyx_r);
   if (unlikely(SDL_MIX_MAXVOLUME == 0)) {
     PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-    __PYX_ERR(0, 97, __pyx_L1_error)
+    __PYX_ERR(0, 117, __pyx_L1_error)
   }
-  __pyx_t_1 = PyFloat_FromDouble((((double)__pyx_v_self->state->volume) / ((double)SDL_MIX_MAXVOLUME))); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 97, __pyx_L1_error)
+  __pyx_t_1 = PyFloat_FromDouble((((double)__pyx_v_self->state->volume) / ((double)SDL_MIX_MAXVOLUME))); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 117, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 97, __pyx_L1_error)
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 117, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_1);
   PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_1);
@@ -2474,14 +2922,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6volume___get__(stru
   __Pyx_GIVEREF(__pyx_int_2);
   PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_int_2);
   __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_round, __pyx_t_2, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 97, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_round, __pyx_t_2, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 117, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "mpfmc/core/audio/track.pyx":96
+  /* "mpfmc/core/audio/track.pyx":116
  * 
  *     property volume:
  *         def __get__(self):             # <<<<<<<<<<<<<<
@@ -2501,47 +2949,276 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6volume___get__(stru
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":100
+/* "mpfmc/core/audio/track.pyx":120
  * 
  *     @property
- *     def type(self):             # <<<<<<<<<<<<<<
- *         raise NotImplementedError('Must be overridden in derived class')
- * 
+ *     def notifications_dropped(self):             # <<<<<<<<<<<<<<
+ *         """Return the number of notification messages dropped because the notification queue was full"""
+ *         if self.state == NULL or self.state.notification_messages == NULL:
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_4type_1__get__(PyObject *__pyx_v_self); /*proto*/
-static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_4type_1__get__(PyObject *__pyx_v_self) {
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_21notifications_dropped_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_21notifications_dropped_1__get__(PyObject *__pyx_v_self) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
-  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_5track_5Track_4type___get__(((struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *)__pyx_v_self));
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_5track_5Track_21notifications_dropped___get__(((struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_4type___get__(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self) {
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_21notifications_dropped___get__(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "mpfmc/core/audio/track.pyx":101
- *     @property
- *     def type(self):
- *         raise NotImplementedError('Must be overridden in derived class')             # <<<<<<<<<<<<<<
- * 
+  /* "mpfmc/core/audio/track.pyx":122
+ *     def notifications_dropped(self):
+ *         """Return the number of notification messages dropped because the notification queue was full"""
+ *         if self.state == NULL or self.state.notification_messages == NULL:             # <<<<<<<<<<<<<<
+ *             return 0
+ *         return SDL_AtomicGet(&(<NotificationMessageQueue*>self.state.notification_messages).dropped)
+ */
+  __pyx_t_2 = ((__pyx_v_self->state == NULL) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = ((__pyx_v_self->state->notification_messages == NULL) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "mpfmc/core/audio/track.pyx":123
+ *         """Return the number of notification messages dropped because the notification queue was full"""
+ *         if self.state == NULL or self.state.notification_messages == NULL:
+ *             return 0             # <<<<<<<<<<<<<<
+ *         return SDL_AtomicGet(&(<NotificationMessageQueue*>self.state.notification_messages).dropped)
+ * 
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_int_0);
+    __pyx_r = __pyx_int_0;
+    goto __pyx_L0;
+
+    /* "mpfmc/core/audio/track.pyx":122
+ *     def notifications_dropped(self):
+ *         """Return the number of notification messages dropped because the notification queue was full"""
+ *         if self.state == NULL or self.state.notification_messages == NULL:             # <<<<<<<<<<<<<<
+ *             return 0
+ *         return SDL_AtomicGet(&(<NotificationMessageQueue*>self.state.notification_messages).dropped)
+ */
+  }
+
+  /* "mpfmc/core/audio/track.pyx":124
+ *         if self.state == NULL or self.state.notification_messages == NULL:
+ *             return 0
+ *         return SDL_AtomicGet(&(<NotificationMessageQueue*>self.state.notification_messages).dropped)             # <<<<<<<<<<<<<<
+ * 
+ *     @property
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_3 = __Pyx_PyInt_From_int(SDL_AtomicGet((&((__pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageQueue *)__pyx_v_self->state->notification_messages)->dropped))); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 124, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_r = __pyx_t_3;
+  __pyx_t_3 = 0;
+  goto __pyx_L0;
+
+  /* "mpfmc/core/audio/track.pyx":120
+ * 
+ *     @property
+ *     def notifications_dropped(self):             # <<<<<<<<<<<<<<
+ *         """Return the number of notification messages dropped because the notification queue was full"""
+ *         if self.state == NULL or self.state.notification_messages == NULL:
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("mpfmc.core.audio.track.Track.notifications_dropped.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "mpfmc/core/audio/track.pyx":127
+ * 
+ *     @property
+ *     def active_player_count(self):             # <<<<<<<<<<<<<<
+ *         """Return the number of players that generated samples during the last audio callback"""
+ *         cdef int count = 0
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_19active_player_count_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_19active_player_count_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_5track_5Track_19active_player_count___get__(((struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_19active_player_count___get__(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self) {
+  int __pyx_v_count;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__get__", 0);
+
+  /* "mpfmc/core/audio/track.pyx":129
+ *     def active_player_count(self):
+ *         """Return the number of players that generated samples during the last audio callback"""
+ *         cdef int count = 0             # <<<<<<<<<<<<<<
+ *         if self.state != NULL:
+ *             SDL_LockAudio()
+ */
+  __pyx_v_count = 0;
+
+  /* "mpfmc/core/audio/track.pyx":130
+ *         """Return the number of players that generated samples during the last audio callback"""
+ *         cdef int count = 0
+ *         if self.state != NULL:             # <<<<<<<<<<<<<<
+ *             SDL_LockAudio()
+ *             count = self.state.active_player_count
+ */
+  __pyx_t_1 = ((__pyx_v_self->state != NULL) != 0);
+  if (__pyx_t_1) {
+
+    /* "mpfmc/core/audio/track.pyx":131
+ *         cdef int count = 0
+ *         if self.state != NULL:
+ *             SDL_LockAudio()             # <<<<<<<<<<<<<<
+ *             count = self.state.active_player_count
+ *             SDL_UnlockAudio()
+ */
+    SDL_LockAudio();
+
+    /* "mpfmc/core/audio/track.pyx":132
+ *         if self.state != NULL:
+ *             SDL_LockAudio()
+ *             count = self.state.active_player_count             # <<<<<<<<<<<<<<
+ *             SDL_UnlockAudio()
+ *         return count
+ */
+    __pyx_t_2 = __pyx_v_self->state->active_player_count;
+    __pyx_v_count = __pyx_t_2;
+
+    /* "mpfmc/core/audio/track.pyx":133
+ *             SDL_LockAudio()
+ *             count = self.state.active_player_count
+ *             SDL_UnlockAudio()             # <<<<<<<<<<<<<<
+ *         return count
+ * 
+ */
+    SDL_UnlockAudio();
+
+    /* "mpfmc/core/audio/track.pyx":130
+ *         """Return the number of players that generated samples during the last audio callback"""
+ *         cdef int count = 0
+ *         if self.state != NULL:             # <<<<<<<<<<<<<<
+ *             SDL_LockAudio()
+ *             count = self.state.active_player_count
+ */
+  }
+
+  /* "mpfmc/core/audio/track.pyx":134
+ *             count = self.state.active_player_count
+ *             SDL_UnlockAudio()
+ *         return count             # <<<<<<<<<<<<<<
+ * 
+ *     @property
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_count); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 134, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_r = __pyx_t_3;
+  __pyx_t_3 = 0;
+  goto __pyx_L0;
+
+  /* "mpfmc/core/audio/track.pyx":127
+ * 
+ *     @property
+ *     def active_player_count(self):             # <<<<<<<<<<<<<<
+ *         """Return the number of players that generated samples during the last audio callback"""
+ *         cdef int count = 0
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("mpfmc.core.audio.track.Track.active_player_count.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "mpfmc/core/audio/track.pyx":137
+ * 
+ *     @property
+ *     def type(self):             # <<<<<<<<<<<<<<
+ *         raise NotImplementedError('Must be overridden in derived class')
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_4type_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_4type_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_5track_5Track_4type___get__(((struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_4type___get__(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__get__", 0);
+
+  /* "mpfmc/core/audio/track.pyx":138
+ *     @property
+ *     def type(self):
+ *         raise NotImplementedError('Must be overridden in derived class')             # <<<<<<<<<<<<<<
+ * 
  *     @property
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_NotImplementedError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 101, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_NotImplementedError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 138, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_Raise(__pyx_t_1, 0, 0, 0);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __PYX_ERR(0, 101, __pyx_L1_error)
+  __PYX_ERR(0, 138, __pyx_L1_error)
 
-  /* "mpfmc/core/audio/track.pyx":100
+  /* "mpfmc/core/audio/track.pyx":137
  * 
  *     @property
  *     def type(self):             # <<<<<<<<<<<<<<
@@ -2559,7 +3236,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_4type___get__(CYTHON
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":104
+/* "mpfmc/core/audio/track.pyx":141
  * 
  *     @property
  *     def number(self):             # <<<<<<<<<<<<<<
@@ -2587,9 +3264,12 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6number___get__(stru
   int __pyx_t_1;
   int __pyx_t_2;
   PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "mpfmc/core/audio/track.pyx":106
+  /* "mpfmc/core/audio/track.pyx":143
  *     def number(self):
  *         """Return the track number"""
  *         cdef int number = -1             # <<<<<<<<<<<<<<
@@ -2598,7 +3278,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6number___get__(stru
  */
   __pyx_v_number = -1;
 
-  /* "mpfmc/core/audio/track.pyx":107
+  /* "mpfmc/core/audio/track.pyx":144
  *         """Return the track number"""
  *         cdef int number = -1
  *         if self.state != NULL:             # <<<<<<<<<<<<<<
@@ -2608,7 +3288,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6number___get__(stru
   __pyx_t_1 = ((__pyx_v_self->state != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/track.pyx":108
+    /* "mpfmc/core/audio/track.pyx":145
  *         cdef int number = -1
  *         if self.state != NULL:
  *             SDL_LockAudio()             # <<<<<<<<<<<<<<
@@ -2617,7 +3297,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6number___get__(stru
  */
     SDL_LockAudio();
 
-    /* "mpfmc/core/audio/track.pyx":109
+    /* "mpfmc/core/audio/track.pyx":146
  *         if self.state != NULL:
  *             SDL_LockAudio()
  *             number = self.state.number             # <<<<<<<<<<<<<<
@@ -2627,7 +3307,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6number___get__(stru
     __pyx_t_2 = __pyx_v_self->state->number;
     __pyx_v_number = __pyx_t_2;
 
-    /* "mpfmc/core/audio/track.pyx":110
+    /* "mpfmc/core/audio/track.pyx":147
  *             SDL_LockAudio()
  *             number = self.state.number
  *             SDL_UnlockAudio()             # <<<<<<<<<<<<<<
@@ -2636,7 +3316,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6number___get__(stru
  */
     SDL_UnlockAudio();
 
-    /* "mpfmc/core/audio/track.pyx":107
+    /* "mpfmc/core/audio/track.pyx":144
  *         """Return the track number"""
  *         cdef int number = -1
  *         if self.state != NULL:             # <<<<<<<<<<<<<<
@@ -2645,7 +3325,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6number___get__(stru
  */
   }
 
-  /* "mpfmc/core/audio/track.pyx":111
+  /* "mpfmc/core/audio/track.pyx":148
  *             number = self.state.number
  *             SDL_UnlockAudio()
  *         return number             # <<<<<<<<<<<<<<
@@ -2653,13 +3333,13 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6number___get__(stru
  *     @property
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_number); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 111, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_number); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 148, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __pyx_r = __pyx_t_3;
   __pyx_t_3 = 0;
   goto __pyx_L0;
 
-  /* "mpfmc/core/audio/track.pyx":104
+  /* "mpfmc/core/audio/track.pyx":141
  * 
  *     @property
  *     def number(self):             # <<<<<<<<<<<<<<
@@ -2678,7 +3358,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6number___get__(stru
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":114
+/* "mpfmc/core/audio/track.pyx":151
  * 
  *     @property
  *     def events_when_stopped(self):             # <<<<<<<<<<<<<<
@@ -2704,7 +3384,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_19events_when_stoppe
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "mpfmc/core/audio/track.pyx":116
+  /* "mpfmc/core/audio/track.pyx":153
  *     def events_when_stopped(self):
  *         """Return the list of events that are posted when the track is stopped"""
  *         return self._events_when_stopped             # <<<<<<<<<<<<<<
@@ -2716,7 +3396,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_19events_when_stoppe
   __pyx_r = __pyx_v_self->_events_when_stopped;
   goto __pyx_L0;
 
-  /* "mpfmc/core/audio/track.pyx":114
+  /* "mpfmc/core/audio/track.pyx":151
  * 
  *     @property
  *     def events_when_stopped(self):             # <<<<<<<<<<<<<<
@@ -2731,7 +3411,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_19events_when_stoppe
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":119
+/* "mpfmc/core/audio/track.pyx":156
  * 
  *     @events_when_stopped.setter
  *     def events_when_stopped(self, events):             # <<<<<<<<<<<<<<
@@ -2756,16 +3436,19 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_19events_when_stopped_2__s
   int __pyx_r;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
 
-  /* "mpfmc/core/audio/track.pyx":121
+  /* "mpfmc/core/audio/track.pyx":158
  *     def events_when_stopped(self, events):
  *         """Sets the list of events that are posted when the track is stopped"""
  *         self._events_when_stopped = events             # <<<<<<<<<<<<<<
  * 
  *     @property
  */
-  if (!(likely(PyList_CheckExact(__pyx_v_events))||((__pyx_v_events) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "list", Py_TYPE(__pyx_v_events)->tp_name), 0))) __PYX_ERR(0, 121, __pyx_L1_error)
+  if (!(likely(PyList_CheckExact(__pyx_v_events))||((__pyx_v_events) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "list", Py_TYPE(__pyx_v_events)->tp_name), 0))) __PYX_ERR(0, 158, __pyx_L1_error)
   __pyx_t_1 = __pyx_v_events;
   __Pyx_INCREF(__pyx_t_1);
   __Pyx_GIVEREF(__pyx_t_1);
@@ -2774,7 +3457,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_19events_when_stopped_2__s
   __pyx_v_self->_events_when_stopped = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/track.pyx":119
+  /* "mpfmc/core/audio/track.pyx":156
  * 
  *     @events_when_stopped.setter
  *     def events_when_stopped(self, events):             # <<<<<<<<<<<<<<
@@ -2794,7 +3477,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_19events_when_stopped_2__s
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":124
+/* "mpfmc/core/audio/track.pyx":161
  * 
  *     @property
  *     def events_when_played(self):             # <<<<<<<<<<<<<<
@@ -2820,7 +3503,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_18events_when_played
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "mpfmc/core/audio/track.pyx":126
+  /* "mpfmc/core/audio/track.pyx":163
  *     def events_when_played(self):
  *         """Return the list of events that are posted when the track is played"""
  *         return self._events_when_played             # <<<<<<<<<<<<<<
@@ -2832,7 +3515,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_18events_when_played
   __pyx_r = __pyx_v_self->_events_when_played;
   goto __pyx_L0;
 
-  /* "mpfmc/core/audio/track.pyx":124
+  /* "mpfmc/core/audio/track.pyx":161
  * 
  *     @property
  *     def events_when_played(self):             # <<<<<<<<<<<<<<
@@ -2847,7 +3530,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_18events_when_played
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":129
+/* "mpfmc/core/audio/track.pyx":166
  * 
  *     @events_when_played.setter
  *     def events_when_played(self, events):             # <<<<<<<<<<<<<<
@@ -2872,16 +3555,19 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_18events_when_played_2__se
   int __pyx_r;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
 
-  /* "mpfmc/core/audio/track.pyx":131
+  /* "mpfmc/core/audio/track.pyx":168
  *     def events_when_played(self, events):
  *         """Sets the list of events that are posted when the track is played"""
  *         self._events_when_played = events             # <<<<<<<<<<<<<<
  * 
  *     @property
  */
-  if (!(likely(PyList_CheckExact(__pyx_v_events))||((__pyx_v_events) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "list", Py_TYPE(__pyx_v_events)->tp_name), 0))) __PYX_ERR(0, 131, __pyx_L1_error)
+  if (!(likely(PyList_CheckExact(__pyx_v_events))||((__pyx_v_events) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "list", Py_TYPE(__pyx_v_events)->tp_name), 0))) __PYX_ERR(0, 168, __pyx_L1_error)
   __pyx_t_1 = __pyx_v_events;
   __Pyx_INCREF(__pyx_t_1);
   __Pyx_GIVEREF(__pyx_t_1);
@@ -2890,7 +3576,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_18events_when_played_2__se
   __pyx_v_self->_events_when_played = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/track.pyx":129
+  /* "mpfmc/core/audio/track.pyx":166
  * 
  *     @events_when_played.setter
  *     def events_when_played(self, events):             # <<<<<<<<<<<<<<
@@ -2910,7 +3596,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_18events_when_played_2__se
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":134
+/* "mpfmc/core/audio/track.pyx":171
  * 
  *     @property
  *     def events_when_paused(self):             # <<<<<<<<<<<<<<
@@ -2936,7 +3622,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_18events_when_paused
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "mpfmc/core/audio/track.pyx":136
+  /* "mpfmc/core/audio/track.pyx":173
  *     def events_when_paused(self):
  *         """Return the list of events that are posted when the track is paused"""
  *         return self._events_when_paused             # <<<<<<<<<<<<<<
@@ -2948,7 +3634,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_18events_when_paused
   __pyx_r = __pyx_v_self->_events_when_paused;
   goto __pyx_L0;
 
-  /* "mpfmc/core/audio/track.pyx":134
+  /* "mpfmc/core/audio/track.pyx":171
  * 
  *     @property
  *     def events_when_paused(self):             # <<<<<<<<<<<<<<
@@ -2963,7 +3649,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_18events_when_paused
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":139
+/* "mpfmc/core/audio/track.pyx":176
  * 
  *     @events_when_paused.setter
  *     def events_when_paused(self, events):             # <<<<<<<<<<<<<<
@@ -2988,16 +3674,19 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_18events_when_paused_2__se
   int __pyx_r;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
 
-  /* "mpfmc/core/audio/track.pyx":141
+  /* "mpfmc/core/audio/track.pyx":178
  *     def events_when_paused(self, events):
  *         """Sets the list of events that are posted when the track is paused"""
  *         self._events_when_paused = events             # <<<<<<<<<<<<<<
  * 
  *     @property
  */
-  if (!(likely(PyList_CheckExact(__pyx_v_events))||((__pyx_v_events) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "list", Py_TYPE(__pyx_v_events)->tp_name), 0))) __PYX_ERR(0, 141, __pyx_L1_error)
+  if (!(likely(PyList_CheckExact(__pyx_v_events))||((__pyx_v_events) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "list", Py_TYPE(__pyx_v_events)->tp_name), 0))) __PYX_ERR(0, 178, __pyx_L1_error)
   __pyx_t_1 = __pyx_v_events;
   __Pyx_INCREF(__pyx_t_1);
   __Pyx_GIVEREF(__pyx_t_1);
@@ -3006,7 +3695,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_18events_when_paused_2__se
   __pyx_v_self->_events_when_paused = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/track.pyx":139
+  /* "mpfmc/core/audio/track.pyx":176
  * 
  *     @events_when_paused.setter
  *     def events_when_paused(self, events):             # <<<<<<<<<<<<<<
@@ -3026,7 +3715,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_18events_when_paused_2__se
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":144
+/* "mpfmc/core/audio/track.pyx":181
  * 
  *     @property
  *     def supports_in_memory_sounds(self):             # <<<<<<<<<<<<<<
@@ -3051,22 +3740,25 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_25supports_in_memory
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "mpfmc/core/audio/track.pyx":146
+  /* "mpfmc/core/audio/track.pyx":183
  *     def supports_in_memory_sounds(self):
  *         """Return whether or not track supports in-memory sounds"""
  *         raise NotImplementedError('Must be overridden in derived class')             # <<<<<<<<<<<<<<
  * 
  *     @property
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_NotImplementedError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 146, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_NotImplementedError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 183, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_Raise(__pyx_t_1, 0, 0, 0);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __PYX_ERR(0, 146, __pyx_L1_error)
+  __PYX_ERR(0, 183, __pyx_L1_error)
 
-  /* "mpfmc/core/audio/track.pyx":144
+  /* "mpfmc/core/audio/track.pyx":181
  * 
  *     @property
  *     def supports_in_memory_sounds(self):             # <<<<<<<<<<<<<<
@@ -3084,7 +3776,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_25supports_in_memory
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":149
+/* "mpfmc/core/audio/track.pyx":186
  * 
  *     @property
  *     def supports_streaming_sounds(self):             # <<<<<<<<<<<<<<
@@ -3109,22 +3801,25 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_25supports_streaming
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "mpfmc/core/audio/track.pyx":151
+  /* "mpfmc/core/audio/track.pyx":188
  *     def supports_streaming_sounds(self):
  *         """Return whether or not track supports streaming sounds"""
  *         raise NotImplementedError('Must be overridden in derived class')             # <<<<<<<<<<<<<<
  * 
  *     @property
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_NotImplementedError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 151, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_NotImplementedError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 188, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_Raise(__pyx_t_1, 0, 0, 0);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __PYX_ERR(0, 151, __pyx_L1_error)
+  __PYX_ERR(0, 188, __pyx_L1_error)
 
-  /* "mpfmc/core/audio/track.pyx":149
+  /* "mpfmc/core/audio/track.pyx":186
  * 
  *     @property
  *     def supports_streaming_sounds(self):             # <<<<<<<<<<<<<<
@@ -3142,7 +3837,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_25supports_streaming
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":154
+/* "mpfmc/core/audio/track.pyx":191
  * 
  *     @property
  *     def fading(self):             # <<<<<<<<<<<<<<
@@ -3169,9 +3864,12 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6fading___get__(stru
   __Pyx_RefNannyDeclarations
   int __pyx_t_1;
   PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "mpfmc/core/audio/track.pyx":156
+  /* "mpfmc/core/audio/track.pyx":193
  *     def fading(self):
  *         """Return whether or not the track is currently fading"""
  *         cdef bint fading = False             # <<<<<<<<<<<<<<
@@ -3180,7 +3878,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6fading___get__(stru
  */
   __pyx_v_fading = 0;
 
-  /* "mpfmc/core/audio/track.pyx":157
+  /* "mpfmc/core/audio/track.pyx":194
  *         """Return whether or not the track is currently fading"""
  *         cdef bint fading = False
  *         if self.state != NULL:             # <<<<<<<<<<<<<<
@@ -3190,7 +3888,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6fading___get__(stru
   __pyx_t_1 = ((__pyx_v_self->state != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/track.pyx":158
+    /* "mpfmc/core/audio/track.pyx":195
  *         cdef bint fading = False
  *         if self.state != NULL:
  *             SDL_LockAudio()             # <<<<<<<<<<<<<<
@@ -3199,7 +3897,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6fading___get__(stru
  */
     SDL_LockAudio();
 
-    /* "mpfmc/core/audio/track.pyx":159
+    /* "mpfmc/core/audio/track.pyx":196
  *         if self.state != NULL:
  *             SDL_LockAudio()
  *             fading = self.state.fade_steps_remaining > 0             # <<<<<<<<<<<<<<
@@ -3208,7 +3906,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6fading___get__(stru
  */
     __pyx_v_fading = (__pyx_v_self->state->fade_steps_remaining > 0);
 
-    /* "mpfmc/core/audio/track.pyx":160
+    /* "mpfmc/core/audio/track.pyx":197
  *             SDL_LockAudio()
  *             fading = self.state.fade_steps_remaining > 0
  *             SDL_UnlockAudio()             # <<<<<<<<<<<<<<
@@ -3217,7 +3915,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6fading___get__(stru
  */
     SDL_UnlockAudio();
 
-    /* "mpfmc/core/audio/track.pyx":157
+    /* "mpfmc/core/audio/track.pyx":194
  *         """Return whether or not the track is currently fading"""
  *         cdef bint fading = False
  *         if self.state != NULL:             # <<<<<<<<<<<<<<
@@ -3226,7 +3924,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6fading___get__(stru
  */
   }
 
-  /* "mpfmc/core/audio/track.pyx":161
+  /* "mpfmc/core/audio/track.pyx":198
  *             fading = self.state.fade_steps_remaining > 0
  *             SDL_UnlockAudio()
  *         return fading             # <<<<<<<<<<<<<<
@@ -3234,13 +3932,13 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6fading___get__(stru
  *     def clear_context(self, context):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2 = __Pyx_PyBool_FromLong(__pyx_v_fading); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 161, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyBool_FromLong(__pyx_v_fading); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 198, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_r = __pyx_t_2;
   __pyx_t_2 = 0;
   goto __pyx_L0;
 
-  /* "mpfmc/core/audio/track.pyx":154
+  /* "mpfmc/core/audio/track.pyx":191
  * 
  *     @property
  *     def fading(self):             # <<<<<<<<<<<<<<
@@ -3259,7 +3957,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6fading___get__(stru
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":163
+/* "mpfmc/core/audio/track.pyx":200
  *         return fading
  * 
  *     def clear_context(self, context):             # <<<<<<<<<<<<<<
@@ -3285,22 +3983,25 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_8clear_context(CYTHO
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("clear_context", 0);
 
-  /* "mpfmc/core/audio/track.pyx":165
+  /* "mpfmc/core/audio/track.pyx":202
  *     def clear_context(self, context):
  *         """Stop all sounds played from the specified context."""
  *         raise NotImplementedError('Must be overridden in derived class')             # <<<<<<<<<<<<<<
  * 
  *     def set_volume(self, float volume, float fade_seconds = 0.0):
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_NotImplementedError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 165, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_NotImplementedError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 202, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_Raise(__pyx_t_1, 0, 0, 0);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __PYX_ERR(0, 165, __pyx_L1_error)
+  __PYX_ERR(0, 202, __pyx_L1_error)
 
-  /* "mpfmc/core/audio/track.pyx":163
+  /* "mpfmc/core/audio/track.pyx":200
  *         return fading
  * 
  *     def clear_context(self, context):             # <<<<<<<<<<<<<<
@@ -3318,7 +4019,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_8clear_context(CYTHO
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":167
+/* "mpfmc/core/audio/track.pyx":204
  *         raise NotImplementedError('Must be overridden in derived class')
  * 
  *     def set_volume(self, float volume, float fade_seconds = 0.0):             # <<<<<<<<<<<<<<
@@ -3332,6 +4033,9 @@ static char __pyx_doc_5mpfmc_4core_5audio_5track_5Track_10set_volume[] = "Track.
 static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_11set_volume(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   float __pyx_v_volume;
   float __pyx_v_fade_seconds;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("set_volume (wrapper)", 0);
@@ -3362,7 +4066,7 @@ static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_11set_volume(PyObjec
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "set_volume") < 0)) __PYX_ERR(0, 167, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "set_volume") < 0)) __PYX_ERR(0, 204, __pyx_L3_error)
       }
     } else {
       switch (PyTuple_GET_SIZE(__pyx_args)) {
@@ -3373,16 +4077,16 @@ static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_11set_volume(PyObjec
         default: goto __pyx_L5_argtuple_error;
       }
     }
-    __pyx_v_volume = __pyx_PyFloat_AsFloat(values[0]); if (unlikely((__pyx_v_volume == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 167, __pyx_L3_error)
+    __pyx_v_volume = __pyx_PyFloat_AsFloat(values[0]); if (unlikely((__pyx_v_volume == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 204, __pyx_L3_error)
     if (values[1]) {
-      __pyx_v_fade_seconds = __pyx_PyFloat_AsFloat(values[1]); if (unlikely((__pyx_v_fade_seconds == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 167, __pyx_L3_error)
+      __pyx_v_fade_seconds = __pyx_PyFloat_AsFloat(values[1]); if (unlikely((__pyx_v_fade_seconds == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 204, __pyx_L3_error)
     } else {
       __pyx_v_fade_seconds = ((float)0.0);
     }
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("set_volume", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 167, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("set_volume", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 204, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("mpfmc.core.audio.track.Track.set_volume", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
@@ -3411,9 +4115,12 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_10set_volume(struct
   PyObject *__pyx_t_10 = NULL;
   Uint32 __pyx_t_11;
   Uint8 __pyx_t_12;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("set_volume", 0);
 
-  /* "mpfmc/core/audio/track.pyx":169
+  /* "mpfmc/core/audio/track.pyx":206
  *     def set_volume(self, float volume, float fade_seconds = 0.0):
  *         """Sets the current track volume with an optional fade time"""
  *         cdef Uint8 new_volume = <Uint8>min(max(volume * SDL_MIX_MAXVOLUME, 0), SDL_MIX_MAXVOLUME)             # <<<<<<<<<<<<<<
@@ -3436,7 +4143,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_10set_volume(struct
   }
   __pyx_v_new_volume = ((Uint8)__pyx_t_4);
 
-  /* "mpfmc/core/audio/track.pyx":170
+  /* "mpfmc/core/audio/track.pyx":207
  *         """Sets the current track volume with an optional fade time"""
  *         cdef Uint8 new_volume = <Uint8>min(max(volume * SDL_MIX_MAXVOLUME, 0), SDL_MIX_MAXVOLUME)
  *         SDL_LockAudio()             # <<<<<<<<<<<<<<
@@ -3445,7 +4152,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_10set_volume(struct
  */
   SDL_LockAudio();
 
-  /* "mpfmc/core/audio/track.pyx":173
+  /* "mpfmc/core/audio/track.pyx":210
  * 
  *         # Fades require special logic
  *         if fade_seconds > 0:             # <<<<<<<<<<<<<<
@@ -3455,7 +4162,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_10set_volume(struct
   __pyx_t_5 = ((__pyx_v_fade_seconds > 0.0) != 0);
   if (__pyx_t_5) {
 
-    /* "mpfmc/core/audio/track.pyx":174
+    /* "mpfmc/core/audio/track.pyx":211
  *         # Fades require special logic
  *         if fade_seconds > 0:
  *             if self.state.status == track_status_stopping or self.state.status == track_status_pausing:             # <<<<<<<<<<<<<<
@@ -3466,7 +4173,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_10set_volume(struct
       case __pyx_e_5mpfmc_4core_5audio_5track_track_status_stopping:
       case __pyx_e_5mpfmc_4core_5audio_5track_track_status_pausing:
 
-      /* "mpfmc/core/audio/track.pyx":176
+      /* "mpfmc/core/audio/track.pyx":213
  *             if self.state.status == track_status_stopping or self.state.status == track_status_pausing:
  *                 # Fade is ignored if track is in the process of stopping or pausing
  *                 self.state.volume = new_volume             # <<<<<<<<<<<<<<
@@ -3475,7 +4182,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_10set_volume(struct
  */
       __pyx_v_self->state->volume = __pyx_v_new_volume;
 
-      /* "mpfmc/core/audio/track.pyx":174
+      /* "mpfmc/core/audio/track.pyx":211
  *         # Fades require special logic
  *         if fade_seconds > 0:
  *             if self.state.status == track_status_stopping or self.state.status == track_status_pausing:             # <<<<<<<<<<<<<<
@@ -3485,7 +4192,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_10set_volume(struct
       break;
       default:
 
-      /* "mpfmc/core/audio/track.pyx":181
+      /* "mpfmc/core/audio/track.pyx":218
  *                 # will be interrupted and a new fade will be calculated from the current
  *                 # point of the existing fade
  *                 if self.state.fade_steps_remaining > 0:             # <<<<<<<<<<<<<<
@@ -3495,14 +4202,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_10set_volume(struct
       __pyx_t_5 = ((__pyx_v_self->state->fade_steps_remaining > 0) != 0);
       if (__pyx_t_5) {
 
-        /* "mpfmc/core/audio/track.pyx":182
+        /* "mpfmc/core/audio/track.pyx":219
  *                 # point of the existing fade
  *                 if self.state.fade_steps_remaining > 0:
  *                     self.log.debug("set_volume - Interrupting an existing fade on this track so "             # <<<<<<<<<<<<<<
  *                                    "start a new fade")
  * 
  */
-        __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_debug); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 182, __pyx_L1_error)
+        __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_debug); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 219, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_7);
         __pyx_t_8 = NULL;
         if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_7))) {
@@ -3516,12 +4223,12 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_10set_volume(struct
         }
         __pyx_t_6 = (__pyx_t_8) ? __Pyx_PyObject_Call2Args(__pyx_t_7, __pyx_t_8, __pyx_kp_u_set_volume_Interrupting_an_exist) : __Pyx_PyObject_CallOneArg(__pyx_t_7, __pyx_kp_u_set_volume_Interrupting_an_exist);
         __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
-        if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 182, __pyx_L1_error)
+        if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 219, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_6);
         __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
         __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
 
-        /* "mpfmc/core/audio/track.pyx":181
+        /* "mpfmc/core/audio/track.pyx":218
  *                 # will be interrupted and a new fade will be calculated from the current
  *                 # point of the existing fade
  *                 if self.state.fade_steps_remaining > 0:             # <<<<<<<<<<<<<<
@@ -3530,18 +4237,18 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_10set_volume(struct
  */
       }
 
-      /* "mpfmc/core/audio/track.pyx":185
+      /* "mpfmc/core/audio/track.pyx":222
  *                                    "start a new fade")
  * 
  *                 self.log.debug("set_volume - Applying %s second fade to new volume level", str(fade_seconds))             # <<<<<<<<<<<<<<
  * 
  *                 # Calculate fade
  */
-      __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_debug); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 185, __pyx_L1_error)
+      __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_debug); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 222, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_7);
-      __pyx_t_8 = PyFloat_FromDouble(__pyx_v_fade_seconds); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 185, __pyx_L1_error)
+      __pyx_t_8 = PyFloat_FromDouble(__pyx_v_fade_seconds); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 222, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_8);
-      __pyx_t_9 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyUnicode_Type)), __pyx_t_8); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 185, __pyx_L1_error)
+      __pyx_t_9 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyUnicode_Type)), __pyx_t_8); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 222, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_9);
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
       __pyx_t_8 = NULL;
@@ -3559,7 +4266,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_10set_volume(struct
       #if CYTHON_FAST_PYCALL
       if (PyFunction_Check(__pyx_t_7)) {
         PyObject *__pyx_temp[3] = {__pyx_t_8, __pyx_kp_u_set_volume_Applying_s_second_fad, __pyx_t_9};
-        __pyx_t_6 = __Pyx_PyFunction_FastCall(__pyx_t_7, __pyx_temp+1-__pyx_t_1, 2+__pyx_t_1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 185, __pyx_L1_error)
+        __pyx_t_6 = __Pyx_PyFunction_FastCall(__pyx_t_7, __pyx_temp+1-__pyx_t_1, 2+__pyx_t_1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 222, __pyx_L1_error)
         __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
         __Pyx_GOTREF(__pyx_t_6);
         __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
@@ -3568,14 +4275,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_10set_volume(struct
       #if CYTHON_FAST_PYCCALL
       if (__Pyx_PyFastCFunction_Check(__pyx_t_7)) {
         PyObject *__pyx_temp[3] = {__pyx_t_8, __pyx_kp_u_set_volume_Applying_s_second_fad, __pyx_t_9};
-        __pyx_t_6 = __Pyx_PyCFunction_FastCall(__pyx_t_7, __pyx_temp+1-__pyx_t_1, 2+__pyx_t_1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 185, __pyx_L1_error)
+        __pyx_t_6 = __Pyx_PyCFunction_FastCall(__pyx_t_7, __pyx_temp+1-__pyx_t_1, 2+__pyx_t_1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 222, __pyx_L1_error)
         __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
         __Pyx_GOTREF(__pyx_t_6);
         __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
       } else
       #endif
       {
-        __pyx_t_10 = PyTuple_New(2+__pyx_t_1); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 185, __pyx_L1_error)
+        __pyx_t_10 = PyTuple_New(2+__pyx_t_1); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 222, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_10);
         if (__pyx_t_8) {
           __Pyx_GIVEREF(__pyx_t_8); PyTuple_SET_ITEM(__pyx_t_10, 0, __pyx_t_8); __pyx_t_8 = NULL;
@@ -3586,14 +4293,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_10set_volume(struct
         __Pyx_GIVEREF(__pyx_t_9);
         PyTuple_SET_ITEM(__pyx_t_10, 1+__pyx_t_1, __pyx_t_9);
         __pyx_t_9 = 0;
-        __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_7, __pyx_t_10, NULL); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 185, __pyx_L1_error)
+        __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_7, __pyx_t_10, NULL); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 222, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_6);
         __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
       }
       __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
       __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
 
-      /* "mpfmc/core/audio/track.pyx":188
+      /* "mpfmc/core/audio/track.pyx":225
  * 
  *                 # Calculate fade
  *                 self.state.fade_steps = <Uint32>(fade_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point             # <<<<<<<<<<<<<<
@@ -3603,11 +4310,11 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_10set_volume(struct
       __pyx_t_11 = ((Uint32)(__pyx_v_fade_seconds * __pyx_v_self->state->callback_data->seconds_to_bytes_factor));
       if (unlikely(__pyx_v_self->state->callback_data->bytes_per_control_point == 0)) {
         PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
-        __PYX_ERR(0, 188, __pyx_L1_error)
+        __PYX_ERR(0, 225, __pyx_L1_error)
       }
       __pyx_v_self->state->fade_steps = (__pyx_t_11 / __pyx_v_self->state->callback_data->bytes_per_control_point);
 
-      /* "mpfmc/core/audio/track.pyx":189
+      /* "mpfmc/core/audio/track.pyx":226
  *                 # Calculate fade
  *                 self.state.fade_steps = <Uint32>(fade_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point
  *                 self.state.fade_steps_remaining = self.state.fade_steps             # <<<<<<<<<<<<<<
@@ -3617,7 +4324,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_10set_volume(struct
       __pyx_t_11 = __pyx_v_self->state->fade_steps;
       __pyx_v_self->state->fade_steps_remaining = __pyx_t_11;
 
-      /* "mpfmc/core/audio/track.pyx":190
+      /* "mpfmc/core/audio/track.pyx":227
  *                 self.state.fade_steps = <Uint32>(fade_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point
  *                 self.state.fade_steps_remaining = self.state.fade_steps
  *                 self.state.fade_volume_start = self.state.fade_volume_current             # <<<<<<<<<<<<<<
@@ -3627,7 +4334,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_10set_volume(struct
       __pyx_t_12 = __pyx_v_self->state->fade_volume_current;
       __pyx_v_self->state->fade_volume_start = __pyx_t_12;
 
-      /* "mpfmc/core/audio/track.pyx":191
+      /* "mpfmc/core/audio/track.pyx":228
  *                 self.state.fade_steps_remaining = self.state.fade_steps
  *                 self.state.fade_volume_start = self.state.fade_volume_current
  *                 self.state.fade_volume_target = new_volume             # <<<<<<<<<<<<<<
@@ -3636,7 +4343,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_10set_volume(struct
  */
       __pyx_v_self->state->fade_volume_target = __pyx_v_new_volume;
 
-      /* "mpfmc/core/audio/track.pyx":192
+      /* "mpfmc/core/audio/track.pyx":229
  *                 self.state.fade_volume_start = self.state.fade_volume_current
  *                 self.state.fade_volume_target = new_volume
  *                 self.state.volume = new_volume             # <<<<<<<<<<<<<<
@@ -3647,7 +4354,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_10set_volume(struct
       break;
     }
 
-    /* "mpfmc/core/audio/track.pyx":173
+    /* "mpfmc/core/audio/track.pyx":210
  * 
  *         # Fades require special logic
  *         if fade_seconds > 0:             # <<<<<<<<<<<<<<
@@ -3657,7 +4364,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_10set_volume(struct
     goto __pyx_L3;
   }
 
-  /* "mpfmc/core/audio/track.pyx":194
+  /* "mpfmc/core/audio/track.pyx":231
  *                 self.state.volume = new_volume
  *         else:
  *             self.state.volume = new_volume             # <<<<<<<<<<<<<<
@@ -3667,7 +4374,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_10set_volume(struct
   /*else*/ {
     __pyx_v_self->state->volume = __pyx_v_new_volume;
 
-    /* "mpfmc/core/audio/track.pyx":195
+    /* "mpfmc/core/audio/track.pyx":232
  *         else:
  *             self.state.volume = new_volume
  *             self.state.fade_volume_current = new_volume             # <<<<<<<<<<<<<<
@@ -3676,7 +4383,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_10set_volume(struct
  */
     __pyx_v_self->state->fade_volume_current = __pyx_v_new_volume;
 
-    /* "mpfmc/core/audio/track.pyx":196
+    /* "mpfmc/core/audio/track.pyx":233
  *             self.state.volume = new_volume
  *             self.state.fade_volume_current = new_volume
  *             self.state.fade_volume_start = new_volume             # <<<<<<<<<<<<<<
@@ -3685,7 +4392,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_10set_volume(struct
  */
     __pyx_v_self->state->fade_volume_start = __pyx_v_new_volume;
 
-    /* "mpfmc/core/audio/track.pyx":197
+    /* "mpfmc/core/audio/track.pyx":234
  *             self.state.fade_volume_current = new_volume
  *             self.state.fade_volume_start = new_volume
  *             self.state.fade_volume_target = new_volume             # <<<<<<<<<<<<<<
@@ -3696,7 +4403,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_10set_volume(struct
   }
   __pyx_L3:;
 
-  /* "mpfmc/core/audio/track.pyx":199
+  /* "mpfmc/core/audio/track.pyx":236
  *             self.state.fade_volume_target = new_volume
  * 
  *         SDL_UnlockAudio()             # <<<<<<<<<<<<<<
@@ -3705,7 +4412,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_10set_volume(struct
  */
   SDL_UnlockAudio();
 
-  /* "mpfmc/core/audio/track.pyx":167
+  /* "mpfmc/core/audio/track.pyx":204
  *         raise NotImplementedError('Must be overridden in derived class')
  * 
  *     def set_volume(self, float volume, float fade_seconds = 0.0):             # <<<<<<<<<<<<<<
@@ -3730,7 +4437,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_10set_volume(struct
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":201
+/* "mpfmc/core/audio/track.pyx":238
  *         SDL_UnlockAudio()
  * 
  *     def play(self, float fade_in_seconds = 0.0):             # <<<<<<<<<<<<<<
@@ -3743,6 +4450,9 @@ static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_13play(PyObject *__p
 static char __pyx_doc_5mpfmc_4core_5audio_5track_5Track_12play[] = "Track.play(self, float fade_in_seconds=0.0)\n\n        Starts playing the track so it can begin processing sounds. Function has no effect if\n        the track is already playing.\n        Args:\n            fade_in_seconds: The number of seconds to fade in the track\n        ";
 static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_13play(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   float __pyx_v_fade_in_seconds;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("play (wrapper)", 0);
@@ -3767,7 +4477,7 @@ static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_13play(PyObject *__p
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "play") < 0)) __PYX_ERR(0, 201, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "play") < 0)) __PYX_ERR(0, 238, __pyx_L3_error)
       }
     } else {
       switch (PyTuple_GET_SIZE(__pyx_args)) {
@@ -3778,14 +4488,14 @@ static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_13play(PyObject *__p
       }
     }
     if (values[0]) {
-      __pyx_v_fade_in_seconds = __pyx_PyFloat_AsFloat(values[0]); if (unlikely((__pyx_v_fade_in_seconds == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 201, __pyx_L3_error)
+      __pyx_v_fade_in_seconds = __pyx_PyFloat_AsFloat(values[0]); if (unlikely((__pyx_v_fade_in_seconds == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 238, __pyx_L3_error)
     } else {
       __pyx_v_fade_in_seconds = ((float)0.0);
     }
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("play", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 201, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("play", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 238, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("mpfmc.core.audio.track.Track.play", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
@@ -3814,16 +4524,19 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(struct __pyx_
   int __pyx_t_10;
   Py_ssize_t __pyx_t_11;
   PyObject *(*__pyx_t_12)(PyObject *);
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("play", 0);
 
-  /* "mpfmc/core/audio/track.pyx":208
+  /* "mpfmc/core/audio/track.pyx":245
  *             fade_in_seconds: The number of seconds to fade in the track
  *         """
  *         self.log.debug("play - Begin sound processing on track")             # <<<<<<<<<<<<<<
  * 
  *         SDL_LockAudio()
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_debug); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 208, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_debug); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 245, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_t_3 = NULL;
   if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
@@ -3837,12 +4550,12 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(struct __pyx_
   }
   __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_kp_u_play_Begin_sound_processing_on_t) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_kp_u_play_Begin_sound_processing_on_t);
   __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 208, __pyx_L1_error)
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 245, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/track.pyx":210
+  /* "mpfmc/core/audio/track.pyx":247
  *         self.log.debug("play - Begin sound processing on track")
  * 
  *         SDL_LockAudio()             # <<<<<<<<<<<<<<
@@ -3851,7 +4564,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(struct __pyx_
  */
   SDL_LockAudio();
 
-  /* "mpfmc/core/audio/track.pyx":213
+  /* "mpfmc/core/audio/track.pyx":250
  * 
  *         # Play is only supported when a track is paused, stopped, or is in the process of stopping
  *         if self.state.status == track_status_paused or \             # <<<<<<<<<<<<<<
@@ -3862,7 +4575,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(struct __pyx_
     case __pyx_e_5mpfmc_4core_5audio_5track_track_status_paused:
     case __pyx_e_5mpfmc_4core_5audio_5track_track_status_stopped:
 
-    /* "mpfmc/core/audio/track.pyx":214
+    /* "mpfmc/core/audio/track.pyx":251
  *         # Play is only supported when a track is paused, stopped, or is in the process of stopping
  *         if self.state.status == track_status_paused or \
  *                         self.state.status == track_status_stopped or \             # <<<<<<<<<<<<<<
@@ -3871,7 +4584,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(struct __pyx_
  */
     case __pyx_e_5mpfmc_4core_5audio_5track_track_status_stopping:
 
-    /* "mpfmc/core/audio/track.pyx":216
+    /* "mpfmc/core/audio/track.pyx":253
  *                         self.state.status == track_status_stopped or \
  *                         self.state.status == track_status_stopping:
  *             if fade_in_seconds > 0:             # <<<<<<<<<<<<<<
@@ -3881,18 +4594,18 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(struct __pyx_
     __pyx_t_4 = ((__pyx_v_fade_in_seconds > 0.0) != 0);
     if (__pyx_t_4) {
 
-      /* "mpfmc/core/audio/track.pyx":218
+      /* "mpfmc/core/audio/track.pyx":255
  *             if fade_in_seconds > 0:
  *                 # Calculate fade data (steps and volume)
  *                 self.log.debug("play - Applying %s second fade in", str(fade_in_seconds))             # <<<<<<<<<<<<<<
  *                 self.state.fade_steps = <Uint32>(fade_in_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point
  *                 self.state.fade_steps_remaining = self.state.fade_steps
  */
-      __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_debug); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 218, __pyx_L1_error)
+      __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_debug); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 255, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_3 = PyFloat_FromDouble(__pyx_v_fade_in_seconds); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 218, __pyx_L1_error)
+      __pyx_t_3 = PyFloat_FromDouble(__pyx_v_fade_in_seconds); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 255, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_5 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyUnicode_Type)), __pyx_t_3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 218, __pyx_L1_error)
+      __pyx_t_5 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyUnicode_Type)), __pyx_t_3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 255, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_5);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       __pyx_t_3 = NULL;
@@ -3910,7 +4623,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(struct __pyx_
       #if CYTHON_FAST_PYCALL
       if (PyFunction_Check(__pyx_t_2)) {
         PyObject *__pyx_temp[3] = {__pyx_t_3, __pyx_kp_u_play_Applying_s_second_fade_in, __pyx_t_5};
-        __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 218, __pyx_L1_error)
+        __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 255, __pyx_L1_error)
         __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
         __Pyx_GOTREF(__pyx_t_1);
         __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
@@ -3919,14 +4632,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(struct __pyx_
       #if CYTHON_FAST_PYCCALL
       if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
         PyObject *__pyx_temp[3] = {__pyx_t_3, __pyx_kp_u_play_Applying_s_second_fade_in, __pyx_t_5};
-        __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 218, __pyx_L1_error)
+        __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 255, __pyx_L1_error)
         __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
         __Pyx_GOTREF(__pyx_t_1);
         __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
       } else
       #endif
       {
-        __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 218, __pyx_L1_error)
+        __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 255, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_7);
         if (__pyx_t_3) {
           __Pyx_GIVEREF(__pyx_t_3); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_3); __pyx_t_3 = NULL;
@@ -3937,14 +4650,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(struct __pyx_
         __Pyx_GIVEREF(__pyx_t_5);
         PyTuple_SET_ITEM(__pyx_t_7, 1+__pyx_t_6, __pyx_t_5);
         __pyx_t_5 = 0;
-        __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_7, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 218, __pyx_L1_error)
+        __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_7, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 255, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_1);
         __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
       }
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-      /* "mpfmc/core/audio/track.pyx":219
+      /* "mpfmc/core/audio/track.pyx":256
  *                 # Calculate fade data (steps and volume)
  *                 self.log.debug("play - Applying %s second fade in", str(fade_in_seconds))
  *                 self.state.fade_steps = <Uint32>(fade_in_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point             # <<<<<<<<<<<<<<
@@ -3954,11 +4667,11 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(struct __pyx_
       __pyx_t_8 = ((Uint32)(__pyx_v_fade_in_seconds * __pyx_v_self->state->callback_data->seconds_to_bytes_factor));
       if (unlikely(__pyx_v_self->state->callback_data->bytes_per_control_point == 0)) {
         PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
-        __PYX_ERR(0, 219, __pyx_L1_error)
+        __PYX_ERR(0, 256, __pyx_L1_error)
       }
       __pyx_v_self->state->fade_steps = (__pyx_t_8 / __pyx_v_self->state->callback_data->bytes_per_control_point);
 
-      /* "mpfmc/core/audio/track.pyx":220
+      /* "mpfmc/core/audio/track.pyx":257
  *                 self.log.debug("play - Applying %s second fade in", str(fade_in_seconds))
  *                 self.state.fade_steps = <Uint32>(fade_in_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point
  *                 self.state.fade_steps_remaining = self.state.fade_steps             # <<<<<<<<<<<<<<
@@ -3968,7 +4681,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(struct __pyx_
       __pyx_t_8 = __pyx_v_self->state->fade_steps;
       __pyx_v_self->state->fade_steps_remaining = __pyx_t_8;
 
-      /* "mpfmc/core/audio/track.pyx":221
+      /* "mpfmc/core/audio/track.pyx":258
  *                 self.state.fade_steps = <Uint32>(fade_in_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point
  *                 self.state.fade_steps_remaining = self.state.fade_steps
  *                 self.state.fade_volume_start = self.state.fade_volume_current             # <<<<<<<<<<<<<<
@@ -3978,7 +4691,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(struct __pyx_
       __pyx_t_9 = __pyx_v_self->state->fade_volume_current;
       __pyx_v_self->state->fade_volume_start = __pyx_t_9;
 
-      /* "mpfmc/core/audio/track.pyx":222
+      /* "mpfmc/core/audio/track.pyx":259
  *                 self.state.fade_steps_remaining = self.state.fade_steps
  *                 self.state.fade_volume_start = self.state.fade_volume_current
  *                 self.state.fade_volume_target = self.state.volume             # <<<<<<<<<<<<<<
@@ -3988,7 +4701,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(struct __pyx_
       __pyx_t_9 = __pyx_v_self->state->volume;
       __pyx_v_self->state->fade_volume_target = __pyx_t_9;
 
-      /* "mpfmc/core/audio/track.pyx":216
+      /* "mpfmc/core/audio/track.pyx":253
  *                         self.state.status == track_status_stopped or \
  *                         self.state.status == track_status_stopping:
  *             if fade_in_seconds > 0:             # <<<<<<<<<<<<<<
@@ -3998,7 +4711,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(struct __pyx_
       goto __pyx_L3;
     }
 
-    /* "mpfmc/core/audio/track.pyx":225
+    /* "mpfmc/core/audio/track.pyx":262
  *             else:
  *                 # No fade will occur, simply set volume
  *                 self.state.fade_steps = 0             # <<<<<<<<<<<<<<
@@ -4008,7 +4721,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(struct __pyx_
     /*else*/ {
       __pyx_v_self->state->fade_steps = 0;
 
-      /* "mpfmc/core/audio/track.pyx":226
+      /* "mpfmc/core/audio/track.pyx":263
  *                 # No fade will occur, simply set volume
  *                 self.state.fade_steps = 0
  *                 self.state.fade_steps_remaining = 0             # <<<<<<<<<<<<<<
@@ -4017,7 +4730,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(struct __pyx_
  */
       __pyx_v_self->state->fade_steps_remaining = 0;
 
-      /* "mpfmc/core/audio/track.pyx":227
+      /* "mpfmc/core/audio/track.pyx":264
  *                 self.state.fade_steps = 0
  *                 self.state.fade_steps_remaining = 0
  *                 self.state.fade_volume_current = self.state.volume             # <<<<<<<<<<<<<<
@@ -4027,7 +4740,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(struct __pyx_
       __pyx_t_9 = __pyx_v_self->state->volume;
       __pyx_v_self->state->fade_volume_current = __pyx_t_9;
 
-      /* "mpfmc/core/audio/track.pyx":228
+      /* "mpfmc/core/audio/track.pyx":265
  *                 self.state.fade_steps_remaining = 0
  *                 self.state.fade_volume_current = self.state.volume
  *                 self.state.fade_volume_start = self.state.volume             # <<<<<<<<<<<<<<
@@ -4037,7 +4750,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(struct __pyx_
       __pyx_t_9 = __pyx_v_self->state->volume;
       __pyx_v_self->state->fade_volume_start = __pyx_t_9;
 
-      /* "mpfmc/core/audio/track.pyx":229
+      /* "mpfmc/core/audio/track.pyx":266
  *                 self.state.fade_volume_current = self.state.volume
  *                 self.state.fade_volume_start = self.state.volume
  *                 self.state.fade_volume_target = self.state.volume             # <<<<<<<<<<<<<<
@@ -4049,7 +4762,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(struct __pyx_
     }
     __pyx_L3:;
 
-    /* "mpfmc/core/audio/track.pyx":231
+    /* "mpfmc/core/audio/track.pyx":268
  *                 self.state.fade_volume_target = self.state.volume
  * 
  *             self.state.status = track_status_playing             # <<<<<<<<<<<<<<
@@ -4058,36 +4771,36 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(struct __pyx_
  */
     __pyx_v_self->state->status = __pyx_e_5mpfmc_4core_5audio_5track_track_status_playing;
 
-    /* "mpfmc/core/audio/track.pyx":234
+    /* "mpfmc/core/audio/track.pyx":271
  * 
  *             # Trigger any events
  *             if self.events_when_played is not None:             # <<<<<<<<<<<<<<
  *                 for event in self.events_when_played:
  *                     self.mc.post_mc_native_event(event, track=self._name)
  */
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_events_when_played); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 234, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_events_when_played); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 271, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __pyx_t_4 = (__pyx_t_1 != Py_None);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     __pyx_t_10 = (__pyx_t_4 != 0);
     if (__pyx_t_10) {
 
-      /* "mpfmc/core/audio/track.pyx":235
+      /* "mpfmc/core/audio/track.pyx":272
  *             # Trigger any events
  *             if self.events_when_played is not None:
  *                 for event in self.events_when_played:             # <<<<<<<<<<<<<<
  *                     self.mc.post_mc_native_event(event, track=self._name)
  *         else:
  */
-      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_events_when_played); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 235, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_events_when_played); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 272, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
       if (likely(PyList_CheckExact(__pyx_t_1)) || PyTuple_CheckExact(__pyx_t_1)) {
         __pyx_t_2 = __pyx_t_1; __Pyx_INCREF(__pyx_t_2); __pyx_t_11 = 0;
         __pyx_t_12 = NULL;
       } else {
-        __pyx_t_11 = -1; __pyx_t_2 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 235, __pyx_L1_error)
+        __pyx_t_11 = -1; __pyx_t_2 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 272, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_2);
-        __pyx_t_12 = Py_TYPE(__pyx_t_2)->tp_iternext; if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 235, __pyx_L1_error)
+        __pyx_t_12 = Py_TYPE(__pyx_t_2)->tp_iternext; if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 272, __pyx_L1_error)
       }
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
       for (;;) {
@@ -4095,17 +4808,17 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(struct __pyx_
           if (likely(PyList_CheckExact(__pyx_t_2))) {
             if (__pyx_t_11 >= PyList_GET_SIZE(__pyx_t_2)) break;
             #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-            __pyx_t_1 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_11); __Pyx_INCREF(__pyx_t_1); __pyx_t_11++; if (unlikely(0 < 0)) __PYX_ERR(0, 235, __pyx_L1_error)
+            __pyx_t_1 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_11); __Pyx_INCREF(__pyx_t_1); __pyx_t_11++; if (unlikely(0 < 0)) __PYX_ERR(0, 272, __pyx_L1_error)
             #else
-            __pyx_t_1 = PySequence_ITEM(__pyx_t_2, __pyx_t_11); __pyx_t_11++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 235, __pyx_L1_error)
+            __pyx_t_1 = PySequence_ITEM(__pyx_t_2, __pyx_t_11); __pyx_t_11++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 272, __pyx_L1_error)
             __Pyx_GOTREF(__pyx_t_1);
             #endif
           } else {
             if (__pyx_t_11 >= PyTuple_GET_SIZE(__pyx_t_2)) break;
             #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-            __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_2, __pyx_t_11); __Pyx_INCREF(__pyx_t_1); __pyx_t_11++; if (unlikely(0 < 0)) __PYX_ERR(0, 235, __pyx_L1_error)
+            __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_2, __pyx_t_11); __Pyx_INCREF(__pyx_t_1); __pyx_t_11++; if (unlikely(0 < 0)) __PYX_ERR(0, 272, __pyx_L1_error)
             #else
-            __pyx_t_1 = PySequence_ITEM(__pyx_t_2, __pyx_t_11); __pyx_t_11++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 235, __pyx_L1_error)
+            __pyx_t_1 = PySequence_ITEM(__pyx_t_2, __pyx_t_11); __pyx_t_11++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 272, __pyx_L1_error)
             __Pyx_GOTREF(__pyx_t_1);
             #endif
           }
@@ -4115,7 +4828,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(struct __pyx_
             PyObject* exc_type = PyErr_Occurred();
             if (exc_type) {
               if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-              else __PYX_ERR(0, 235, __pyx_L1_error)
+              else __PYX_ERR(0, 272, __pyx_L1_error)
             }
             break;
           }
@@ -4124,31 +4837,31 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(struct __pyx_
         __Pyx_XDECREF_SET(__pyx_v_event, __pyx_t_1);
         __pyx_t_1 = 0;
 
-        /* "mpfmc/core/audio/track.pyx":236
+        /* "mpfmc/core/audio/track.pyx":273
  *             if self.events_when_played is not None:
  *                 for event in self.events_when_played:
  *                     self.mc.post_mc_native_event(event, track=self._name)             # <<<<<<<<<<<<<<
  *         else:
  *             self.log.warning("play - Action may only be used when a track is stopped or is in the process "
  */
-        __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->mc, __pyx_n_s_post_mc_native_event); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 236, __pyx_L1_error)
+        __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->mc, __pyx_n_s_post_mc_native_event); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 273, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_1);
-        __pyx_t_7 = PyTuple_New(1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 236, __pyx_L1_error)
+        __pyx_t_7 = PyTuple_New(1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 273, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_7);
         __Pyx_INCREF(__pyx_v_event);
         __Pyx_GIVEREF(__pyx_v_event);
         PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_v_event);
-        __pyx_t_5 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 236, __pyx_L1_error)
+        __pyx_t_5 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 273, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_5);
-        if (PyDict_SetItem(__pyx_t_5, __pyx_n_s_track, __pyx_v_self->_name) < 0) __PYX_ERR(0, 236, __pyx_L1_error)
-        __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_7, __pyx_t_5); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 236, __pyx_L1_error)
+        if (PyDict_SetItem(__pyx_t_5, __pyx_n_s_track, __pyx_v_self->_name) < 0) __PYX_ERR(0, 273, __pyx_L1_error)
+        __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_7, __pyx_t_5); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 273, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_3);
         __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
         __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
         __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
         __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-        /* "mpfmc/core/audio/track.pyx":235
+        /* "mpfmc/core/audio/track.pyx":272
  *             # Trigger any events
  *             if self.events_when_played is not None:
  *                 for event in self.events_when_played:             # <<<<<<<<<<<<<<
@@ -4158,7 +4871,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(struct __pyx_
       }
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-      /* "mpfmc/core/audio/track.pyx":234
+      /* "mpfmc/core/audio/track.pyx":271
  * 
  *             # Trigger any events
  *             if self.events_when_played is not None:             # <<<<<<<<<<<<<<
@@ -4167,7 +4880,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(struct __pyx_
  */
     }
 
-    /* "mpfmc/core/audio/track.pyx":213
+    /* "mpfmc/core/audio/track.pyx":250
  * 
  *         # Play is only supported when a track is paused, stopped, or is in the process of stopping
  *         if self.state.status == track_status_paused or \             # <<<<<<<<<<<<<<
@@ -4177,14 +4890,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(struct __pyx_
     break;
     default:
 
-    /* "mpfmc/core/audio/track.pyx":238
+    /* "mpfmc/core/audio/track.pyx":275
  *                     self.mc.post_mc_native_event(event, track=self._name)
  *         else:
  *             self.log.warning("play - Action may only be used when a track is stopped or is in the process "             # <<<<<<<<<<<<<<
  *                              "of stopping; action will be ignored.")
  * 
  */
-    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_warning); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 238, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_warning); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 275, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __pyx_t_5 = NULL;
     if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
@@ -4198,14 +4911,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(struct __pyx_
     }
     __pyx_t_2 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_5, __pyx_kp_u_play_Action_may_only_be_used_whe) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_u_play_Action_may_only_be_used_whe);
     __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 238, __pyx_L1_error)
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 275, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     break;
   }
 
-  /* "mpfmc/core/audio/track.pyx":241
+  /* "mpfmc/core/audio/track.pyx":278
  *                              "of stopping; action will be ignored.")
  * 
  *         SDL_UnlockAudio()             # <<<<<<<<<<<<<<
@@ -4214,7 +4927,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(struct __pyx_
  */
   SDL_UnlockAudio();
 
-  /* "mpfmc/core/audio/track.pyx":201
+  /* "mpfmc/core/audio/track.pyx":238
  *         SDL_UnlockAudio()
  * 
  *     def play(self, float fade_in_seconds = 0.0):             # <<<<<<<<<<<<<<
@@ -4240,7 +4953,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(struct __pyx_
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":243
+/* "mpfmc/core/audio/track.pyx":280
  *         SDL_UnlockAudio()
  * 
  *     def stop(self, float fade_out_seconds = 0.0):             # <<<<<<<<<<<<<<
@@ -4253,6 +4966,9 @@ static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_15stop(PyObject *__p
 static char __pyx_doc_5mpfmc_4core_5audio_5track_5Track_14stop[] = "Track.stop(self, float fade_out_seconds=0.0)\n\n        Stops the track and clears out any playing sounds. Function has no effect if the track is\n        already stopped.\n        Args:\n            fade_out_seconds: The number of seconds to fade out the track\n        ";
 static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_15stop(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   float __pyx_v_fade_out_seconds;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("stop (wrapper)", 0);
@@ -4277,7 +4993,7 @@ static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_15stop(PyObject *__p
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "stop") < 0)) __PYX_ERR(0, 243, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "stop") < 0)) __PYX_ERR(0, 280, __pyx_L3_error)
       }
     } else {
       switch (PyTuple_GET_SIZE(__pyx_args)) {
@@ -4288,14 +5004,14 @@ static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_15stop(PyObject *__p
       }
     }
     if (values[0]) {
-      __pyx_v_fade_out_seconds = __pyx_PyFloat_AsFloat(values[0]); if (unlikely((__pyx_v_fade_out_seconds == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 243, __pyx_L3_error)
+      __pyx_v_fade_out_seconds = __pyx_PyFloat_AsFloat(values[0]); if (unlikely((__pyx_v_fade_out_seconds == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 280, __pyx_L3_error)
     } else {
       __pyx_v_fade_out_seconds = ((float)0.0);
     }
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("stop", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 243, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("stop", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 280, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("mpfmc.core.audio.track.Track.stop", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
@@ -4320,16 +5036,19 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_14stop(struct __pyx_
   PyObject *__pyx_t_7 = NULL;
   Uint32 __pyx_t_8;
   Uint8 __pyx_t_9;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("stop", 0);
 
-  /* "mpfmc/core/audio/track.pyx":250
+  /* "mpfmc/core/audio/track.pyx":287
  *             fade_out_seconds: The number of seconds to fade out the track
  *         """
  *         self.log.debug("stop - Stop sound processing on track and clear state")             # <<<<<<<<<<<<<<
  * 
  *         SDL_LockAudio()
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_debug); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 250, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_debug); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 287, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_t_3 = NULL;
   if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
@@ -4343,12 +5062,12 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_14stop(struct __pyx_
   }
   __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_kp_u_stop_Stop_sound_processing_on_tr) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_kp_u_stop_Stop_sound_processing_on_tr);
   __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 250, __pyx_L1_error)
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 287, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/track.pyx":252
+  /* "mpfmc/core/audio/track.pyx":289
  *         self.log.debug("stop - Stop sound processing on track and clear state")
  * 
  *         SDL_LockAudio()             # <<<<<<<<<<<<<<
@@ -4357,7 +5076,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_14stop(struct __pyx_
  */
   SDL_LockAudio();
 
-  /* "mpfmc/core/audio/track.pyx":255
+  /* "mpfmc/core/audio/track.pyx":292
  * 
  *         # Stop is only supported when a track is playing
  *         if self.state.status in [track_status_playing, track_status_stopping, track_status_pausing]:             # <<<<<<<<<<<<<<
@@ -4369,7 +5088,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_14stop(struct __pyx_
     case __pyx_e_5mpfmc_4core_5audio_5track_track_status_stopping:
     case __pyx_e_5mpfmc_4core_5audio_5track_track_status_pausing:
 
-    /* "mpfmc/core/audio/track.pyx":257
+    /* "mpfmc/core/audio/track.pyx":294
  *         if self.state.status in [track_status_playing, track_status_stopping, track_status_pausing]:
  * 
  *             if fade_out_seconds > 0:             # <<<<<<<<<<<<<<
@@ -4379,18 +5098,18 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_14stop(struct __pyx_
     __pyx_t_4 = ((__pyx_v_fade_out_seconds > 0.0) != 0);
     if (__pyx_t_4) {
 
-      /* "mpfmc/core/audio/track.pyx":259
+      /* "mpfmc/core/audio/track.pyx":296
  *             if fade_out_seconds > 0:
  *                 # Calculate fade data (steps and volume)
  *                 self.log.debug("stop - Applying %s second fade out", str(fade_out_seconds))             # <<<<<<<<<<<<<<
  *                 self.state.fade_steps = <Uint32>(fade_out_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point
  *                 self.state.fade_steps_remaining = self.state.fade_steps
  */
-      __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_debug); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 259, __pyx_L1_error)
+      __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_debug); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 296, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_3 = PyFloat_FromDouble(__pyx_v_fade_out_seconds); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 259, __pyx_L1_error)
+      __pyx_t_3 = PyFloat_FromDouble(__pyx_v_fade_out_seconds); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 296, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_5 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyUnicode_Type)), __pyx_t_3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 259, __pyx_L1_error)
+      __pyx_t_5 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyUnicode_Type)), __pyx_t_3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 296, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_5);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       __pyx_t_3 = NULL;
@@ -4408,7 +5127,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_14stop(struct __pyx_
       #if CYTHON_FAST_PYCALL
       if (PyFunction_Check(__pyx_t_2)) {
         PyObject *__pyx_temp[3] = {__pyx_t_3, __pyx_kp_u_stop_Applying_s_second_fade_out, __pyx_t_5};
-        __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 259, __pyx_L1_error)
+        __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 296, __pyx_L1_error)
         __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
         __Pyx_GOTREF(__pyx_t_1);
         __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
@@ -4417,14 +5136,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_14stop(struct __pyx_
       #if CYTHON_FAST_PYCCALL
       if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
         PyObject *__pyx_temp[3] = {__pyx_t_3, __pyx_kp_u_stop_Applying_s_second_fade_out, __pyx_t_5};
-        __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 259, __pyx_L1_error)
+        __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 296, __pyx_L1_error)
         __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
         __Pyx_GOTREF(__pyx_t_1);
         __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
       } else
       #endif
       {
-        __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 259, __pyx_L1_error)
+        __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 296, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_7);
         if (__pyx_t_3) {
           __Pyx_GIVEREF(__pyx_t_3); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_3); __pyx_t_3 = NULL;
@@ -4435,14 +5154,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_14stop(struct __pyx_
         __Pyx_GIVEREF(__pyx_t_5);
         PyTuple_SET_ITEM(__pyx_t_7, 1+__pyx_t_6, __pyx_t_5);
         __pyx_t_5 = 0;
-        __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_7, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 259, __pyx_L1_error)
+        __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_7, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 296, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_1);
         __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
       }
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-      /* "mpfmc/core/audio/track.pyx":260
+      /* "mpfmc/core/audio/track.pyx":297
  *                 # Calculate fade data (steps and volume)
  *                 self.log.debug("stop - Applying %s second fade out", str(fade_out_seconds))
  *                 self.state.fade_steps = <Uint32>(fade_out_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point             # <<<<<<<<<<<<<<
@@ -4452,11 +5171,11 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_14stop(struct __pyx_
       __pyx_t_8 = ((Uint32)(__pyx_v_fade_out_seconds * __pyx_v_self->state->callback_data->seconds_to_bytes_factor));
       if (unlikely(__pyx_v_self->state->callback_data->bytes_per_control_point == 0)) {
         PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
-        __PYX_ERR(0, 260, __pyx_L1_error)
+        __PYX_ERR(0, 297, __pyx_L1_error)
       }
       __pyx_v_self->state->fade_steps = (__pyx_t_8 / __pyx_v_self->state->callback_data->bytes_per_control_point);
 
-      /* "mpfmc/core/audio/track.pyx":261
+      /* "mpfmc/core/audio/track.pyx":298
  *                 self.log.debug("stop - Applying %s second fade out", str(fade_out_seconds))
  *                 self.state.fade_steps = <Uint32>(fade_out_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point
  *                 self.state.fade_steps_remaining = self.state.fade_steps             # <<<<<<<<<<<<<<
@@ -4466,7 +5185,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_14stop(struct __pyx_
       __pyx_t_8 = __pyx_v_self->state->fade_steps;
       __pyx_v_self->state->fade_steps_remaining = __pyx_t_8;
 
-      /* "mpfmc/core/audio/track.pyx":262
+      /* "mpfmc/core/audio/track.pyx":299
  *                 self.state.fade_steps = <Uint32>(fade_out_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point
  *                 self.state.fade_steps_remaining = self.state.fade_steps
  *                 self.state.fade_volume_start = self.state.fade_volume_current             # <<<<<<<<<<<<<<
@@ -4476,7 +5195,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_14stop(struct __pyx_
       __pyx_t_9 = __pyx_v_self->state->fade_volume_current;
       __pyx_v_self->state->fade_volume_start = __pyx_t_9;
 
-      /* "mpfmc/core/audio/track.pyx":263
+      /* "mpfmc/core/audio/track.pyx":300
  *                 self.state.fade_steps_remaining = self.state.fade_steps
  *                 self.state.fade_volume_start = self.state.fade_volume_current
  *                 self.state.fade_volume_target = 0             # <<<<<<<<<<<<<<
@@ -4485,7 +5204,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_14stop(struct __pyx_
  */
       __pyx_v_self->state->fade_volume_target = 0;
 
-      /* "mpfmc/core/audio/track.pyx":264
+      /* "mpfmc/core/audio/track.pyx":301
  *                 self.state.fade_volume_start = self.state.fade_volume_current
  *                 self.state.fade_volume_target = 0
  *                 self.state.status = track_status_stopping             # <<<<<<<<<<<<<<
@@ -4494,7 +5213,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_14stop(struct __pyx_
  */
       __pyx_v_self->state->status = __pyx_e_5mpfmc_4core_5audio_5track_track_status_stopping;
 
-      /* "mpfmc/core/audio/track.pyx":257
+      /* "mpfmc/core/audio/track.pyx":294
  *         if self.state.status in [track_status_playing, track_status_stopping, track_status_pausing]:
  * 
  *             if fade_out_seconds > 0:             # <<<<<<<<<<<<<<
@@ -4504,7 +5223,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_14stop(struct __pyx_
       goto __pyx_L3;
     }
 
-    /* "mpfmc/core/audio/track.pyx":268
+    /* "mpfmc/core/audio/track.pyx":305
  *             else:
  *                 # No fade will occur, simply set volume
  *                 self.state.fade_steps = 0             # <<<<<<<<<<<<<<
@@ -4514,7 +5233,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_14stop(struct __pyx_
     /*else*/ {
       __pyx_v_self->state->fade_steps = 0;
 
-      /* "mpfmc/core/audio/track.pyx":269
+      /* "mpfmc/core/audio/track.pyx":306
  *                 # No fade will occur, simply set volume
  *                 self.state.fade_steps = 0
  *                 self.state.fade_steps_remaining = 0             # <<<<<<<<<<<<<<
@@ -4523,7 +5242,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_14stop(struct __pyx_
  */
       __pyx_v_self->state->fade_steps_remaining = 0;
 
-      /* "mpfmc/core/audio/track.pyx":270
+      /* "mpfmc/core/audio/track.pyx":307
  *                 self.state.fade_steps = 0
  *                 self.state.fade_steps_remaining = 0
  *                 self.state.fade_volume_current = 0             # <<<<<<<<<<<<<<
@@ -4532,7 +5251,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_14stop(struct __pyx_
  */
       __pyx_v_self->state->fade_volume_current = 0;
 
-      /* "mpfmc/core/audio/track.pyx":271
+      /* "mpfmc/core/audio/track.pyx":308
  *                 self.state.fade_steps_remaining = 0
  *                 self.state.fade_volume_current = 0
  *                 self.state.fade_volume_start = 0             # <<<<<<<<<<<<<<
@@ -4541,7 +5260,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_14stop(struct __pyx_
  */
       __pyx_v_self->state->fade_volume_start = 0;
 
-      /* "mpfmc/core/audio/track.pyx":272
+      /* "mpfmc/core/audio/track.pyx":309
  *                 self.state.fade_volume_current = 0
  *                 self.state.fade_volume_start = 0
  *                 self.state.fade_volume_target = 0             # <<<<<<<<<<<<<<
@@ -4550,7 +5269,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_14stop(struct __pyx_
  */
       __pyx_v_self->state->fade_volume_target = 0;
 
-      /* "mpfmc/core/audio/track.pyx":273
+      /* "mpfmc/core/audio/track.pyx":310
  *                 self.state.fade_volume_start = 0
  *                 self.state.fade_volume_target = 0
  *                 self.state.status = track_status_stopped             # <<<<<<<<<<<<<<
@@ -4559,7 +5278,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_14stop(struct __pyx_
  */
       __pyx_v_self->state->status = __pyx_e_5mpfmc_4core_5audio_5track_track_status_stopped;
 
-      /* "mpfmc/core/audio/track.pyx":274
+      /* "mpfmc/core/audio/track.pyx":311
  *                 self.state.fade_volume_target = 0
  *                 self.state.status = track_status_stopped
  *                 send_track_stopped_notification(self.state)             # <<<<<<<<<<<<<<
@@ -4570,7 +5289,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_14stop(struct __pyx_
     }
     __pyx_L3:;
 
-    /* "mpfmc/core/audio/track.pyx":255
+    /* "mpfmc/core/audio/track.pyx":292
  * 
  *         # Stop is only supported when a track is playing
  *         if self.state.status in [track_status_playing, track_status_stopping, track_status_pausing]:             # <<<<<<<<<<<<<<
@@ -4580,14 +5299,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_14stop(struct __pyx_
     break;
     default:
 
-    /* "mpfmc/core/audio/track.pyx":277
+    /* "mpfmc/core/audio/track.pyx":314
  * 
  *         else:
  *             self.log.warning("stop - Action may only be used when a track is playing; action "             # <<<<<<<<<<<<<<
  *                              "will be ignored.")
  * 
  */
-    __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_warning); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 277, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_warning); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 314, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_t_7 = NULL;
     if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
@@ -4601,14 +5320,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_14stop(struct __pyx_
     }
     __pyx_t_1 = (__pyx_t_7) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_7, __pyx_kp_u_stop_Action_may_only_be_used_whe) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_kp_u_stop_Action_may_only_be_used_whe);
     __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 277, __pyx_L1_error)
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 314, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     break;
   }
 
-  /* "mpfmc/core/audio/track.pyx":280
+  /* "mpfmc/core/audio/track.pyx":317
  *                              "will be ignored.")
  * 
  *         SDL_UnlockAudio()             # <<<<<<<<<<<<<<
@@ -4617,7 +5336,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_14stop(struct __pyx_
  */
   SDL_UnlockAudio();
 
-  /* "mpfmc/core/audio/track.pyx":243
+  /* "mpfmc/core/audio/track.pyx":280
  *         SDL_UnlockAudio()
  * 
  *     def stop(self, float fade_out_seconds = 0.0):             # <<<<<<<<<<<<<<
@@ -4642,7 +5361,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_14stop(struct __pyx_
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":282
+/* "mpfmc/core/audio/track.pyx":319
  *         SDL_UnlockAudio()
  * 
  *     def pause(self, float fade_out_seconds = 0.0):             # <<<<<<<<<<<<<<
@@ -4655,6 +5374,9 @@ static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_17pause(PyObject *__
 static char __pyx_doc_5mpfmc_4core_5audio_5track_5Track_16pause[] = "Track.pause(self, float fade_out_seconds=0.0)\n\n        Pauses the track. Sounds will continue from where they left off when the track is resumed.\n        Function has no effect unless the track is playing.\n        Args:\n            fade_out_seconds: The number of seconds to fade out the track\n        ";
 static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_17pause(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   float __pyx_v_fade_out_seconds;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("pause (wrapper)", 0);
@@ -4679,7 +5401,7 @@ static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_17pause(PyObject *__
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "pause") < 0)) __PYX_ERR(0, 282, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "pause") < 0)) __PYX_ERR(0, 319, __pyx_L3_error)
       }
     } else {
       switch (PyTuple_GET_SIZE(__pyx_args)) {
@@ -4690,14 +5412,14 @@ static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_17pause(PyObject *__
       }
     }
     if (values[0]) {
-      __pyx_v_fade_out_seconds = __pyx_PyFloat_AsFloat(values[0]); if (unlikely((__pyx_v_fade_out_seconds == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 282, __pyx_L3_error)
+      __pyx_v_fade_out_seconds = __pyx_PyFloat_AsFloat(values[0]); if (unlikely((__pyx_v_fade_out_seconds == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 319, __pyx_L3_error)
     } else {
       __pyx_v_fade_out_seconds = ((float)0.0);
     }
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("pause", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 282, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("pause", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 319, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("mpfmc.core.audio.track.Track.pause", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
@@ -4722,16 +5444,19 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_16pause(struct __pyx
   PyObject *__pyx_t_7 = NULL;
   Uint32 __pyx_t_8;
   Uint8 __pyx_t_9;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("pause", 0);
 
-  /* "mpfmc/core/audio/track.pyx":289
+  /* "mpfmc/core/audio/track.pyx":326
  *             fade_out_seconds: The number of seconds to fade out the track
  *         """
  *         self.log.debug("pause - Pause sound processing on track")             # <<<<<<<<<<<<<<
  * 
  *         SDL_LockAudio()
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_debug); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 289, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_debug); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 326, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_t_3 = NULL;
   if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
@@ -4745,12 +5470,12 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_16pause(struct __pyx
   }
   __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_kp_u_pause_Pause_sound_processing_on) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_kp_u_pause_Pause_sound_processing_on);
   __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 289, __pyx_L1_error)
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 326, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/track.pyx":291
+  /* "mpfmc/core/audio/track.pyx":328
  *         self.log.debug("pause - Pause sound processing on track")
  * 
  *         SDL_LockAudio()             # <<<<<<<<<<<<<<
@@ -4759,7 +5484,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_16pause(struct __pyx
  */
   SDL_LockAudio();
 
-  /* "mpfmc/core/audio/track.pyx":294
+  /* "mpfmc/core/audio/track.pyx":331
  * 
  *         # Stop is only supported when a track is playing
  *         if self.state.status in [track_status_playing, track_status_stopping, track_status_pausing]:             # <<<<<<<<<<<<<<
@@ -4771,7 +5496,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_16pause(struct __pyx
     case __pyx_e_5mpfmc_4core_5audio_5track_track_status_stopping:
     case __pyx_e_5mpfmc_4core_5audio_5track_track_status_pausing:
 
-    /* "mpfmc/core/audio/track.pyx":295
+    /* "mpfmc/core/audio/track.pyx":332
  *         # Stop is only supported when a track is playing
  *         if self.state.status in [track_status_playing, track_status_stopping, track_status_pausing]:
  *             if fade_out_seconds > 0:             # <<<<<<<<<<<<<<
@@ -4781,18 +5506,18 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_16pause(struct __pyx
     __pyx_t_4 = ((__pyx_v_fade_out_seconds > 0.0) != 0);
     if (__pyx_t_4) {
 
-      /* "mpfmc/core/audio/track.pyx":297
+      /* "mpfmc/core/audio/track.pyx":334
  *             if fade_out_seconds > 0:
  *                 # Calculate fade data (steps and volume)
  *                 self.log.debug("pause - Applying %s second fade out", str(fade_out_seconds))             # <<<<<<<<<<<<<<
  *                 self.state.fade_steps = <Uint32>(fade_out_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point
  *                 self.state.fade_steps_remaining = self.state.fade_steps
  */
-      __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_debug); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 297, __pyx_L1_error)
+      __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_debug); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 334, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_3 = PyFloat_FromDouble(__pyx_v_fade_out_seconds); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 297, __pyx_L1_error)
+      __pyx_t_3 = PyFloat_FromDouble(__pyx_v_fade_out_seconds); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 334, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_5 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyUnicode_Type)), __pyx_t_3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 297, __pyx_L1_error)
+      __pyx_t_5 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyUnicode_Type)), __pyx_t_3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 334, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_5);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       __pyx_t_3 = NULL;
@@ -4810,7 +5535,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_16pause(struct __pyx
       #if CYTHON_FAST_PYCALL
       if (PyFunction_Check(__pyx_t_2)) {
         PyObject *__pyx_temp[3] = {__pyx_t_3, __pyx_kp_u_pause_Applying_s_second_fade_out, __pyx_t_5};
-        __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 297, __pyx_L1_error)
+        __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 334, __pyx_L1_error)
         __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
         __Pyx_GOTREF(__pyx_t_1);
         __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
@@ -4819,14 +5544,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_16pause(struct __pyx
       #if CYTHON_FAST_PYCCALL
       if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
         PyObject *__pyx_temp[3] = {__pyx_t_3, __pyx_kp_u_pause_Applying_s_second_fade_out, __pyx_t_5};
-        __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 297, __pyx_L1_error)
+        __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 334, __pyx_L1_error)
         __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
         __Pyx_GOTREF(__pyx_t_1);
         __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
       } else
       #endif
       {
-        __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 297, __pyx_L1_error)
+        __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 334, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_7);
         if (__pyx_t_3) {
           __Pyx_GIVEREF(__pyx_t_3); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_3); __pyx_t_3 = NULL;
@@ -4837,14 +5562,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_16pause(struct __pyx
         __Pyx_GIVEREF(__pyx_t_5);
         PyTuple_SET_ITEM(__pyx_t_7, 1+__pyx_t_6, __pyx_t_5);
         __pyx_t_5 = 0;
-        __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_7, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 297, __pyx_L1_error)
+        __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_7, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 334, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_1);
         __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
       }
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-      /* "mpfmc/core/audio/track.pyx":298
+      /* "mpfmc/core/audio/track.pyx":335
  *                 # Calculate fade data (steps and volume)
  *                 self.log.debug("pause - Applying %s second fade out", str(fade_out_seconds))
  *                 self.state.fade_steps = <Uint32>(fade_out_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point             # <<<<<<<<<<<<<<
@@ -4854,11 +5579,11 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_16pause(struct __pyx
       __pyx_t_8 = ((Uint32)(__pyx_v_fade_out_seconds * __pyx_v_self->state->callback_data->seconds_to_bytes_factor));
       if (unlikely(__pyx_v_self->state->callback_data->bytes_per_control_point == 0)) {
         PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
-        __PYX_ERR(0, 298, __pyx_L1_error)
+        __PYX_ERR(0, 335, __pyx_L1_error)
       }
       __pyx_v_self->state->fade_steps = (__pyx_t_8 / __pyx_v_self->state->callback_data->bytes_per_control_point);
 
-      /* "mpfmc/core/audio/track.pyx":299
+      /* "mpfmc/core/audio/track.pyx":336
  *                 self.log.debug("pause - Applying %s second fade out", str(fade_out_seconds))
  *                 self.state.fade_steps = <Uint32>(fade_out_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point
  *                 self.state.fade_steps_remaining = self.state.fade_steps             # <<<<<<<<<<<<<<
@@ -4868,7 +5593,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_16pause(struct __pyx
       __pyx_t_8 = __pyx_v_self->state->fade_steps;
       __pyx_v_self->state->fade_steps_remaining = __pyx_t_8;
 
-      /* "mpfmc/core/audio/track.pyx":300
+      /* "mpfmc/core/audio/track.pyx":337
  *                 self.state.fade_steps = <Uint32>(fade_out_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point
  *                 self.state.fade_steps_remaining = self.state.fade_steps
  *                 self.state.fade_volume_start = self.state.fade_volume_current             # <<<<<<<<<<<<<<
@@ -4878,7 +5603,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_16pause(struct __pyx
       __pyx_t_9 = __pyx_v_self->state->fade_volume_current;
       __pyx_v_self->state->fade_volume_start = __pyx_t_9;
 
-      /* "mpfmc/core/audio/track.pyx":301
+      /* "mpfmc/core/audio/track.pyx":338
  *                 self.state.fade_steps_remaining = self.state.fade_steps
  *                 self.state.fade_volume_start = self.state.fade_volume_current
  *                 self.state.fade_volume_target = 0             # <<<<<<<<<<<<<<
@@ -4887,7 +5612,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_16pause(struct __pyx
  */
       __pyx_v_self->state->fade_volume_target = 0;
 
-      /* "mpfmc/core/audio/track.pyx":302
+      /* "mpfmc/core/audio/track.pyx":339
  *                 self.state.fade_volume_start = self.state.fade_volume_current
  *                 self.state.fade_volume_target = 0
  *                 self.state.status = track_status_pausing             # <<<<<<<<<<<<<<
@@ -4896,7 +5621,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_16pause(struct __pyx
  */
       __pyx_v_self->state->status = __pyx_e_5mpfmc_4core_5audio_5track_track_status_pausing;
 
-      /* "mpfmc/core/audio/track.pyx":295
+      /* "mpfmc/core/audio/track.pyx":332
  *         # Stop is only supported when a track is playing
  *         if self.state.status in [track_status_playing, track_status_stopping, track_status_pausing]:
  *             if fade_out_seconds > 0:             # <<<<<<<<<<<<<<
@@ -4906,7 +5631,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_16pause(struct __pyx
       goto __pyx_L3;
     }
 
-    /* "mpfmc/core/audio/track.pyx":305
+    /* "mpfmc/core/audio/track.pyx":342
  *             else:
  *                 # No fade will occur, simply set volume
  *                 self.state.fade_steps = 0             # <<<<<<<<<<<<<<
@@ -4916,7 +5641,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_16pause(struct __pyx
     /*else*/ {
       __pyx_v_self->state->fade_steps = 0;
 
-      /* "mpfmc/core/audio/track.pyx":306
+      /* "mpfmc/core/audio/track.pyx":343
  *                 # No fade will occur, simply set volume
  *                 self.state.fade_steps = 0
  *                 self.state.fade_steps_remaining = 0             # <<<<<<<<<<<<<<
@@ -4925,7 +5650,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_16pause(struct __pyx
  */
       __pyx_v_self->state->fade_steps_remaining = 0;
 
-      /* "mpfmc/core/audio/track.pyx":307
+      /* "mpfmc/core/audio/track.pyx":344
  *                 self.state.fade_steps = 0
  *                 self.state.fade_steps_remaining = 0
  *                 self.state.fade_volume_current = 0             # <<<<<<<<<<<<<<
@@ -4934,7 +5659,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_16pause(struct __pyx
  */
       __pyx_v_self->state->fade_volume_current = 0;
 
-      /* "mpfmc/core/audio/track.pyx":308
+      /* "mpfmc/core/audio/track.pyx":345
  *                 self.state.fade_steps_remaining = 0
  *                 self.state.fade_volume_current = 0
  *                 self.state.fade_volume_start = 0             # <<<<<<<<<<<<<<
@@ -4943,7 +5668,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_16pause(struct __pyx
  */
       __pyx_v_self->state->fade_volume_start = 0;
 
-      /* "mpfmc/core/audio/track.pyx":309
+      /* "mpfmc/core/audio/track.pyx":346
  *                 self.state.fade_volume_current = 0
  *                 self.state.fade_volume_start = 0
  *                 self.state.fade_volume_target = 0             # <<<<<<<<<<<<<<
@@ -4952,7 +5677,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_16pause(struct __pyx
  */
       __pyx_v_self->state->fade_volume_target = 0;
 
-      /* "mpfmc/core/audio/track.pyx":310
+      /* "mpfmc/core/audio/track.pyx":347
  *                 self.state.fade_volume_start = 0
  *                 self.state.fade_volume_target = 0
  *                 self.state.status = track_status_paused             # <<<<<<<<<<<<<<
@@ -4961,7 +5686,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_16pause(struct __pyx
  */
       __pyx_v_self->state->status = __pyx_e_5mpfmc_4core_5audio_5track_track_status_paused;
 
-      /* "mpfmc/core/audio/track.pyx":311
+      /* "mpfmc/core/audio/track.pyx":348
  *                 self.state.fade_volume_target = 0
  *                 self.state.status = track_status_paused
  *                 send_track_paused_notification(self.state)             # <<<<<<<<<<<<<<
@@ -4972,7 +5697,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_16pause(struct __pyx
     }
     __pyx_L3:;
 
-    /* "mpfmc/core/audio/track.pyx":294
+    /* "mpfmc/core/audio/track.pyx":331
  * 
  *         # Stop is only supported when a track is playing
  *         if self.state.status in [track_status_playing, track_status_stopping, track_status_pausing]:             # <<<<<<<<<<<<<<
@@ -4982,14 +5707,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_16pause(struct __pyx
     break;
     default:
 
-    /* "mpfmc/core/audio/track.pyx":314
+    /* "mpfmc/core/audio/track.pyx":351
  * 
  *         else:
  *             self.log.warning("pause - Action may only be used when a track is playing; action "             # <<<<<<<<<<<<<<
  *                              "will be ignored.")
  * 
  */
-    __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_warning); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 314, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_warning); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 351, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_t_7 = NULL;
     if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
@@ -5003,14 +5728,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_16pause(struct __pyx
     }
     __pyx_t_1 = (__pyx_t_7) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_7, __pyx_kp_u_pause_Action_may_only_be_used_wh) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_kp_u_pause_Action_may_only_be_used_wh);
     __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 314, __pyx_L1_error)
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 351, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     break;
   }
 
-  /* "mpfmc/core/audio/track.pyx":317
+  /* "mpfmc/core/audio/track.pyx":354
  *                              "will be ignored.")
  * 
  *         SDL_UnlockAudio()             # <<<<<<<<<<<<<<
@@ -5019,7 +5744,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_16pause(struct __pyx
  */
   SDL_UnlockAudio();
 
-  /* "mpfmc/core/audio/track.pyx":282
+  /* "mpfmc/core/audio/track.pyx":319
  *         SDL_UnlockAudio()
  * 
  *     def pause(self, float fade_out_seconds = 0.0):             # <<<<<<<<<<<<<<
@@ -5044,7 +5769,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_16pause(struct __pyx
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":319
+/* "mpfmc/core/audio/track.pyx":356
  *         SDL_UnlockAudio()
  * 
  *     def stop_all_sounds(self, float fade_out_seconds = 0.0):             # <<<<<<<<<<<<<<
@@ -5057,6 +5782,9 @@ static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_19stop_all_sounds(Py
 static char __pyx_doc_5mpfmc_4core_5audio_5track_5Track_18stop_all_sounds[] = "Track.stop_all_sounds(self, float fade_out_seconds=0.0)\n\n        Stops all playing sounds immediately on the track.\n        Args:\n            fade_out_seconds: The number of seconds to fade out the sounds before stopping\n        ";
 static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_19stop_all_sounds(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   CYTHON_UNUSED float __pyx_v_fade_out_seconds;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("stop_all_sounds (wrapper)", 0);
@@ -5081,7 +5809,7 @@ static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_19stop_all_sounds(Py
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "stop_all_sounds") < 0)) __PYX_ERR(0, 319, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "stop_all_sounds") < 0)) __PYX_ERR(0, 356, __pyx_L3_error)
       }
     } else {
       switch (PyTuple_GET_SIZE(__pyx_args)) {
@@ -5092,14 +5820,14 @@ static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_19stop_all_sounds(Py
       }
     }
     if (values[0]) {
-      __pyx_v_fade_out_seconds = __pyx_PyFloat_AsFloat(values[0]); if (unlikely((__pyx_v_fade_out_seconds == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 319, __pyx_L3_error)
+      __pyx_v_fade_out_seconds = __pyx_PyFloat_AsFloat(values[0]); if (unlikely((__pyx_v_fade_out_seconds == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 356, __pyx_L3_error)
     } else {
       __pyx_v_fade_out_seconds = ((float)0.0);
     }
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("stop_all_sounds", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 319, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("stop_all_sounds", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 356, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("mpfmc.core.audio.track.Track.stop_all_sounds", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
@@ -5116,22 +5844,25 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_18stop_all_sounds(CY
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("stop_all_sounds", 0);
 
-  /* "mpfmc/core/audio/track.pyx":325
+  /* "mpfmc/core/audio/track.pyx":362
  *             fade_out_seconds: The number of seconds to fade out the sounds before stopping
  *         """
  *         raise NotImplementedError('Must be overridden in derived class')             # <<<<<<<<<<<<<<
  * 
  *     def process(self):
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_NotImplementedError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 325, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_NotImplementedError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 362, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_Raise(__pyx_t_1, 0, 0, 0);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __PYX_ERR(0, 325, __pyx_L1_error)
+  __PYX_ERR(0, 362, __pyx_L1_error)
 
-  /* "mpfmc/core/audio/track.pyx":319
+  /* "mpfmc/core/audio/track.pyx":356
  *         SDL_UnlockAudio()
  * 
  *     def stop_all_sounds(self, float fade_out_seconds = 0.0):             # <<<<<<<<<<<<<<
@@ -5149,7 +5880,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_18stop_all_sounds(CY
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":327
+/* "mpfmc/core/audio/track.pyx":364
  *         raise NotImplementedError('Must be overridden in derived class')
  * 
  *     def process(self):             # <<<<<<<<<<<<<<
@@ -5175,22 +5906,25 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_20process(CYTHON_UNU
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("process", 0);
 
-  /* "mpfmc/core/audio/track.pyx":329
+  /* "mpfmc/core/audio/track.pyx":366
  *     def process(self):
  *         """Processes the track queue each tick."""
  *         raise NotImplementedError('Must be overridden in derived class')             # <<<<<<<<<<<<<<
  * 
  * 
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_NotImplementedError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 329, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_NotImplementedError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 366, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_Raise(__pyx_t_1, 0, 0, 0);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __PYX_ERR(0, 329, __pyx_L1_error)
+  __PYX_ERR(0, 366, __pyx_L1_error)
 
-  /* "mpfmc/core/audio/track.pyx":327
+  /* "mpfmc/core/audio/track.pyx":364
  *         raise NotImplementedError('Must be overridden in derived class')
  * 
  *     def process(self):             # <<<<<<<<<<<<<<
@@ -5208,16 +5942,16 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_20process(CYTHON_UNU
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":343
+/* "mpfmc/core/audio/track.pyx":380
  * 
  *     @staticmethod
  *     cdef void mix_track_to_output(TrackState *track, AudioCallbackData* callback_data,             # <<<<<<<<<<<<<<
- *                                   Uint8 *output_buffer, Uint32 buffer_length) nogil:
+ *                                   float *output_buffer, Uint32 buffer_length) nogil:
  *         """
  */
 
-static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_t_5mpfmc_4core_5audio_5track_TrackState *__pyx_v_track, __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData *__pyx_v_callback_data, Uint8 *__pyx_v_output_buffer, Uint32 __pyx_v_buffer_length) {
-  Uint8 *__pyx_v_track_buffer;
+static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_t_5mpfmc_4core_5audio_5track_TrackState *__pyx_v_track, __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData *__pyx_v_callback_data, float *__pyx_v_output_buffer, Uint32 __pyx_v_buffer_length) {
+  float *__pyx_v_track_buffer;
   Uint32 __pyx_v_output_buffer_bytes_remaining;
   Uint32 __pyx_v_current_chunk_bytes;
   Uint32 __pyx_v_buffer_pos;
@@ -5226,22 +5960,26 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
   Uint8 __pyx_v_track_volume;
   int __pyx_t_1;
   int __pyx_t_2;
-  Uint16 __pyx_t_3;
-  Uint32 __pyx_t_4;
+  float *__pyx_t_3;
+  Uint16 __pyx_t_4;
   Uint32 __pyx_t_5;
-  Uint8 __pyx_t_6;
-  int __pyx_t_7;
+  Uint32 __pyx_t_6;
+  Uint8 __pyx_t_7;
+  int __pyx_t_8;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
 
-  /* "mpfmc/core/audio/track.pyx":356
+  /* "mpfmc/core/audio/track.pyx":393
  * 
- *         cdef Uint8 *track_buffer
+ *         cdef float *track_buffer
  *         cdef Uint32 output_buffer_bytes_remaining = buffer_length             # <<<<<<<<<<<<<<
  *         cdef Uint32 current_chunk_bytes
  *         cdef Uint32 buffer_pos = 0
  */
   __pyx_v_output_buffer_bytes_remaining = __pyx_v_buffer_length;
 
-  /* "mpfmc/core/audio/track.pyx":358
+  /* "mpfmc/core/audio/track.pyx":395
  *         cdef Uint32 output_buffer_bytes_remaining = buffer_length
  *         cdef Uint32 current_chunk_bytes
  *         cdef Uint32 buffer_pos = 0             # <<<<<<<<<<<<<<
@@ -5250,7 +5988,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
  */
   __pyx_v_buffer_pos = 0;
 
-  /* "mpfmc/core/audio/track.pyx":359
+  /* "mpfmc/core/audio/track.pyx":396
  *         cdef Uint32 current_chunk_bytes
  *         cdef Uint32 buffer_pos = 0
  *         cdef Uint8 control_point = 0             # <<<<<<<<<<<<<<
@@ -5259,7 +5997,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
  */
   __pyx_v_control_point = 0;
 
-  /* "mpfmc/core/audio/track.pyx":363
+  /* "mpfmc/core/audio/track.pyx":400
  *         cdef Uint8 track_volume
  * 
  *         if track == NULL or track.status == track_status_stopped or track.status == track_status_paused:             # <<<<<<<<<<<<<<
@@ -5285,16 +6023,16 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
   __pyx_L4_bool_binop_done:;
   if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/track.pyx":364
+    /* "mpfmc/core/audio/track.pyx":401
  * 
  *         if track == NULL or track.status == track_status_stopped or track.status == track_status_paused:
  *             return             # <<<<<<<<<<<<<<
  * 
- *         track_buffer = <Uint8*>track.buffer
+ *         track_buffer = track.buffer
  */
     goto __pyx_L0;
 
-    /* "mpfmc/core/audio/track.pyx":363
+    /* "mpfmc/core/audio/track.pyx":400
  *         cdef Uint8 track_volume
  * 
  *         if track == NULL or track.status == track_status_stopped or track.status == track_status_paused:             # <<<<<<<<<<<<<<
@@ -5303,16 +6041,17 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
  */
   }
 
-  /* "mpfmc/core/audio/track.pyx":366
+  /* "mpfmc/core/audio/track.pyx":403
  *             return
  * 
- *         track_buffer = <Uint8*>track.buffer             # <<<<<<<<<<<<<<
+ *         track_buffer = track.buffer             # <<<<<<<<<<<<<<
  * 
  *         # Loop over output buffer at control rate
  */
-  __pyx_v_track_buffer = ((Uint8 *)__pyx_v_track->buffer);
+  __pyx_t_3 = __pyx_v_track->buffer;
+  __pyx_v_track_buffer = __pyx_t_3;
 
-  /* "mpfmc/core/audio/track.pyx":369
+  /* "mpfmc/core/audio/track.pyx":406
  * 
  *         # Loop over output buffer at control rate
  *         while output_buffer_bytes_remaining > 0:             # <<<<<<<<<<<<<<
@@ -5323,23 +6062,23 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
     __pyx_t_1 = ((__pyx_v_output_buffer_bytes_remaining > 0) != 0);
     if (!__pyx_t_1) break;
 
-    /* "mpfmc/core/audio/track.pyx":372
+    /* "mpfmc/core/audio/track.pyx":409
  * 
  *             # Determine the number of bytes to process in the current chunk
  *             current_chunk_bytes = min(output_buffer_bytes_remaining, callback_data.bytes_per_control_point)             # <<<<<<<<<<<<<<
  * 
  *             # Apply any ducking to the track
  */
-    __pyx_t_3 = __pyx_v_callback_data->bytes_per_control_point;
-    __pyx_t_4 = __pyx_v_output_buffer_bytes_remaining;
-    if (((__pyx_t_3 < __pyx_t_4) != 0)) {
-      __pyx_t_5 = __pyx_t_3;
+    __pyx_t_4 = __pyx_v_callback_data->bytes_per_control_point;
+    __pyx_t_5 = __pyx_v_output_buffer_bytes_remaining;
+    if (((__pyx_t_4 < __pyx_t_5) != 0)) {
+      __pyx_t_6 = __pyx_t_4;
     } else {
-      __pyx_t_5 = __pyx_t_4;
+      __pyx_t_6 = __pyx_t_5;
     }
-    __pyx_v_current_chunk_bytes = __pyx_t_5;
+    __pyx_v_current_chunk_bytes = __pyx_t_6;
 
-    /* "mpfmc/core/audio/track.pyx":375
+    /* "mpfmc/core/audio/track.pyx":412
  * 
  *             # Apply any ducking to the track
  *             if track.ducking_is_active and control_point < CONTROL_POINTS_PER_BUFFER:             # <<<<<<<<<<<<<<
@@ -5357,7 +6096,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
     __pyx_L9_bool_binop_done:;
     if (__pyx_t_1) {
 
-      /* "mpfmc/core/audio/track.pyx":376
+      /* "mpfmc/core/audio/track.pyx":413
  *             # Apply any ducking to the track
  *             if track.ducking_is_active and control_point < CONTROL_POINTS_PER_BUFFER:
  *                 ducking_volume = g_array_index_uint8(track.ducking_control_points, control_point)             # <<<<<<<<<<<<<<
@@ -5366,7 +6105,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
  */
       __pyx_v_ducking_volume = g_array_index_uint8(__pyx_v_track->ducking_control_points, __pyx_v_control_point);
 
-      /* "mpfmc/core/audio/track.pyx":375
+      /* "mpfmc/core/audio/track.pyx":412
  * 
  *             # Apply any ducking to the track
  *             if track.ducking_is_active and control_point < CONTROL_POINTS_PER_BUFFER:             # <<<<<<<<<<<<<<
@@ -5376,7 +6115,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
       goto __pyx_L8;
     }
 
-    /* "mpfmc/core/audio/track.pyx":378
+    /* "mpfmc/core/audio/track.pyx":415
  *                 ducking_volume = g_array_index_uint8(track.ducking_control_points, control_point)
  *             else:
  *                 ducking_volume = SDL_MIX_MAXVOLUME             # <<<<<<<<<<<<<<
@@ -5388,7 +6127,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
     }
     __pyx_L8:;
 
-    /* "mpfmc/core/audio/track.pyx":381
+    /* "mpfmc/core/audio/track.pyx":418
  * 
  *             # Calculate track volume (handle track fading)
  *             if track.fade_steps_remaining > 0:             # <<<<<<<<<<<<<<
@@ -5398,7 +6137,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
     __pyx_t_1 = ((__pyx_v_track->fade_steps_remaining > 0) != 0);
     if (__pyx_t_1) {
 
-      /* "mpfmc/core/audio/track.pyx":385
+      /* "mpfmc/core/audio/track.pyx":422
  *                 # because the fraction is going from 1 to 0 over the fade and not from a more
  *                 # traditional 0 to 1.  This saves a few calculation cycles and is for efficiency.
  *                 track.fade_volume_current = <Uint8> (lerpU8(in_out_quad(track.fade_steps_remaining / track.fade_steps),             # <<<<<<<<<<<<<<
@@ -5413,10 +6152,10 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
         #ifdef WITH_THREAD
         __Pyx_PyGILState_Release(__pyx_gilstate_save);
         #endif
-        __PYX_ERR(0, 385, __pyx_L1_error)
+        __PYX_ERR(0, 422, __pyx_L1_error)
       }
 
-      /* "mpfmc/core/audio/track.pyx":386
+      /* "mpfmc/core/audio/track.pyx":423
  *                 # traditional 0 to 1.  This saves a few calculation cycles and is for efficiency.
  *                 track.fade_volume_current = <Uint8> (lerpU8(in_out_quad(track.fade_steps_remaining / track.fade_steps),
  *                                                             track.fade_volume_target, track.fade_volume_start))             # <<<<<<<<<<<<<<
@@ -5425,7 +6164,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
  */
       __pyx_v_track->fade_volume_current = ((Uint8)__pyx_f_5mpfmc_4core_5audio_6inline_lerpU8(__pyx_f_5mpfmc_4core_5audio_6inline_in_out_quad((((double)__pyx_v_track->fade_steps_remaining) / ((double)__pyx_v_track->fade_steps))), __pyx_v_track->fade_volume_target, __pyx_v_track->fade_volume_start));
 
-      /* "mpfmc/core/audio/track.pyx":387
+      /* "mpfmc/core/audio/track.pyx":424
  *                 track.fade_volume_current = <Uint8> (lerpU8(in_out_quad(track.fade_steps_remaining / track.fade_steps),
  *                                                             track.fade_volume_target, track.fade_volume_start))
  *                 track.fade_steps_remaining -= 1             # <<<<<<<<<<<<<<
@@ -5434,7 +6173,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
  */
       __pyx_v_track->fade_steps_remaining = (__pyx_v_track->fade_steps_remaining - 1);
 
-      /* "mpfmc/core/audio/track.pyx":381
+      /* "mpfmc/core/audio/track.pyx":418
  * 
  *             # Calculate track volume (handle track fading)
  *             if track.fade_steps_remaining > 0:             # <<<<<<<<<<<<<<
@@ -5444,7 +6183,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
       goto __pyx_L11;
     }
 
-    /* "mpfmc/core/audio/track.pyx":389
+    /* "mpfmc/core/audio/track.pyx":426
  *                 track.fade_steps_remaining -= 1
  *             else:
  *                 track.fade_volume_current = track.fade_volume_target             # <<<<<<<<<<<<<<
@@ -5452,10 +6191,10 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
  *                     track.status = track_status_stopped
  */
     /*else*/ {
-      __pyx_t_6 = __pyx_v_track->fade_volume_target;
-      __pyx_v_track->fade_volume_current = __pyx_t_6;
+      __pyx_t_7 = __pyx_v_track->fade_volume_target;
+      __pyx_v_track->fade_volume_current = __pyx_t_7;
 
-      /* "mpfmc/core/audio/track.pyx":390
+      /* "mpfmc/core/audio/track.pyx":427
  *             else:
  *                 track.fade_volume_current = track.fade_volume_target
  *                 if track.status == track_status_stopping:             # <<<<<<<<<<<<<<
@@ -5465,7 +6204,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
       switch (__pyx_v_track->status) {
         case __pyx_e_5mpfmc_4core_5audio_5track_track_status_stopping:
 
-        /* "mpfmc/core/audio/track.pyx":391
+        /* "mpfmc/core/audio/track.pyx":428
  *                 track.fade_volume_current = track.fade_volume_target
  *                 if track.status == track_status_stopping:
  *                     track.status = track_status_stopped             # <<<<<<<<<<<<<<
@@ -5474,7 +6213,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
  */
         __pyx_v_track->status = __pyx_e_5mpfmc_4core_5audio_5track_track_status_stopped;
 
-        /* "mpfmc/core/audio/track.pyx":392
+        /* "mpfmc/core/audio/track.pyx":429
  *                 if track.status == track_status_stopping:
  *                     track.status = track_status_stopped
  *                     send_track_stopped_notification(track)             # <<<<<<<<<<<<<<
@@ -5483,7 +6222,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
  */
         __pyx_f_5mpfmc_4core_5audio_20notification_message_send_track_stopped_notification(__pyx_v_track);
 
-        /* "mpfmc/core/audio/track.pyx":390
+        /* "mpfmc/core/audio/track.pyx":427
  *             else:
  *                 track.fade_volume_current = track.fade_volume_target
  *                 if track.status == track_status_stopping:             # <<<<<<<<<<<<<<
@@ -5493,7 +6232,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
         break;
         case __pyx_e_5mpfmc_4core_5audio_5track_track_status_pausing:
 
-        /* "mpfmc/core/audio/track.pyx":394
+        /* "mpfmc/core/audio/track.pyx":431
  *                     send_track_stopped_notification(track)
  *                 elif track.status == track_status_pausing:
  *                     track.status = track_status_paused             # <<<<<<<<<<<<<<
@@ -5502,7 +6241,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
  */
         __pyx_v_track->status = __pyx_e_5mpfmc_4core_5audio_5track_track_status_paused;
 
-        /* "mpfmc/core/audio/track.pyx":395
+        /* "mpfmc/core/audio/track.pyx":432
  *                 elif track.status == track_status_pausing:
  *                     track.status = track_status_paused
  *                     send_track_paused_notification(track)             # <<<<<<<<<<<<<<
@@ -5511,7 +6250,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
  */
         __pyx_f_5mpfmc_4core_5audio_20notification_message_send_track_paused_notification(__pyx_v_track);
 
-        /* "mpfmc/core/audio/track.pyx":393
+        /* "mpfmc/core/audio/track.pyx":430
  *                     track.status = track_status_stopped
  *                     send_track_stopped_notification(track)
  *                 elif track.status == track_status_pausing:             # <<<<<<<<<<<<<<
@@ -5524,14 +6263,14 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
     }
     __pyx_L11:;
 
-    /* "mpfmc/core/audio/track.pyx":397
+    /* "mpfmc/core/audio/track.pyx":434
  *                     send_track_paused_notification(track)
  * 
  *             track_volume = ducking_volume * track.fade_volume_current // SDL_MIX_MAXVOLUME             # <<<<<<<<<<<<<<
  * 
- *             Track.mix_audio(output_buffer + buffer_pos, track_buffer + buffer_pos, current_chunk_bytes, track_volume)
+ *             Track.mix_bus(output_buffer + bytes_to_bus_samples(buffer_pos),
  */
-    __pyx_t_7 = (__pyx_v_ducking_volume * __pyx_v_track->fade_volume_current);
+    __pyx_t_8 = (__pyx_v_ducking_volume * __pyx_v_track->fade_volume_current);
     if (unlikely(SDL_MIX_MAXVOLUME == 0)) {
       #ifdef WITH_THREAD
       PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
@@ -5540,9 +6279,9 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
       #ifdef WITH_THREAD
       __Pyx_PyGILState_Release(__pyx_gilstate_save);
       #endif
-      __PYX_ERR(0, 397, __pyx_L1_error)
+      __PYX_ERR(0, 434, __pyx_L1_error)
     }
-    else if (sizeof(int) == sizeof(long) && (!(((int)-1) > 0)) && unlikely(SDL_MIX_MAXVOLUME == (int)-1)  && unlikely(UNARY_NEG_WOULD_OVERFLOW(__pyx_t_7))) {
+    else if (sizeof(int) == sizeof(long) && (!(((int)-1) > 0)) && unlikely(SDL_MIX_MAXVOLUME == (int)-1)  && unlikely(UNARY_NEG_WOULD_OVERFLOW(__pyx_t_8))) {
       #ifdef WITH_THREAD
       PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
       #endif
@@ -5550,21 +6289,39 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
       #ifdef WITH_THREAD
       __Pyx_PyGILState_Release(__pyx_gilstate_save);
       #endif
-      __PYX_ERR(0, 397, __pyx_L1_error)
+      __PYX_ERR(0, 434, __pyx_L1_error)
     }
-    __pyx_v_track_volume = __Pyx_div_int(__pyx_t_7, SDL_MIX_MAXVOLUME);
+    __pyx_v_track_volume = __Pyx_div_int(__pyx_t_8, SDL_MIX_MAXVOLUME);
 
-    /* "mpfmc/core/audio/track.pyx":399
- *             track_volume = ducking_volume * track.fade_volume_current // SDL_MIX_MAXVOLUME
- * 
- *             Track.mix_audio(output_buffer + buffer_pos, track_buffer + buffer_pos, current_chunk_bytes, track_volume)             # <<<<<<<<<<<<<<
+    /* "mpfmc/core/audio/track.pyx":439
+ *                           track_buffer + bytes_to_bus_samples(buffer_pos),
+ *                           bytes_to_bus_samples(current_chunk_bytes),
+ *                           <float>track_volume / SDL_MIX_MAXVOLUME)             # <<<<<<<<<<<<<<
  * 
  *             output_buffer_bytes_remaining -= current_chunk_bytes
  */
-    __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_audio((__pyx_v_output_buffer + __pyx_v_buffer_pos), (__pyx_v_track_buffer + __pyx_v_buffer_pos), __pyx_v_current_chunk_bytes, __pyx_v_track_volume);
+    if (unlikely(SDL_MIX_MAXVOLUME == 0)) {
+      #ifdef WITH_THREAD
+      PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+      #endif
+      PyErr_SetString(PyExc_ZeroDivisionError, "float division");
+      #ifdef WITH_THREAD
+      __Pyx_PyGILState_Release(__pyx_gilstate_save);
+      #endif
+      __PYX_ERR(0, 439, __pyx_L1_error)
+    }
+
+    /* "mpfmc/core/audio/track.pyx":436
+ *             track_volume = ducking_volume * track.fade_volume_current // SDL_MIX_MAXVOLUME
+ * 
+ *             Track.mix_bus(output_buffer + bytes_to_bus_samples(buffer_pos),             # <<<<<<<<<<<<<<
+ *                           track_buffer + bytes_to_bus_samples(buffer_pos),
+ *                           bytes_to_bus_samples(current_chunk_bytes),
+ */
+    __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_bus((__pyx_v_output_buffer + __pyx_f_5mpfmc_4core_5audio_6inline_bytes_to_bus_samples(__pyx_v_buffer_pos)), (__pyx_v_track_buffer + __pyx_f_5mpfmc_4core_5audio_6inline_bytes_to_bus_samples(__pyx_v_buffer_pos)), __pyx_f_5mpfmc_4core_5audio_6inline_bytes_to_bus_samples(__pyx_v_current_chunk_bytes), (((float)__pyx_v_track_volume) / ((float)SDL_MIX_MAXVOLUME)));
 
-    /* "mpfmc/core/audio/track.pyx":401
- *             Track.mix_audio(output_buffer + buffer_pos, track_buffer + buffer_pos, current_chunk_bytes, track_volume)
+    /* "mpfmc/core/audio/track.pyx":441
+ *                           <float>track_volume / SDL_MIX_MAXVOLUME)
  * 
  *             output_buffer_bytes_remaining -= current_chunk_bytes             # <<<<<<<<<<<<<<
  *             buffer_pos += current_chunk_bytes
@@ -5572,7 +6329,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
  */
     __pyx_v_output_buffer_bytes_remaining = (__pyx_v_output_buffer_bytes_remaining - __pyx_v_current_chunk_bytes);
 
-    /* "mpfmc/core/audio/track.pyx":402
+    /* "mpfmc/core/audio/track.pyx":442
  * 
  *             output_buffer_bytes_remaining -= current_chunk_bytes
  *             buffer_pos += current_chunk_bytes             # <<<<<<<<<<<<<<
@@ -5581,7 +6338,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
  */
     __pyx_v_buffer_pos = (__pyx_v_buffer_pos + __pyx_v_current_chunk_bytes);
 
-    /* "mpfmc/core/audio/track.pyx":403
+    /* "mpfmc/core/audio/track.pyx":443
  *             output_buffer_bytes_remaining -= current_chunk_bytes
  *             buffer_pos += current_chunk_bytes
  *             control_point += 1             # <<<<<<<<<<<<<<
@@ -5591,11 +6348,11 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
     __pyx_v_control_point = (__pyx_v_control_point + 1);
   }
 
-  /* "mpfmc/core/audio/track.pyx":343
+  /* "mpfmc/core/audio/track.pyx":380
  * 
  *     @staticmethod
  *     cdef void mix_track_to_output(TrackState *track, AudioCallbackData* callback_data,             # <<<<<<<<<<<<<<
- *                                   Uint8 *output_buffer, Uint32 buffer_length) nogil:
+ *                                   float *output_buffer, Uint32 buffer_length) nogil:
  *         """
  */
 
@@ -5606,212 +6363,93 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
   __pyx_L0:;
 }
 
-/* "mpfmc/core/audio/track.pyx":406
+/* "mpfmc/core/audio/track.pyx":446
  * 
  *     @staticmethod
- *     cdef void mix_audio(Uint8* output_buffer, const Uint8* input_buffer, Uint32 buffer_length, int volume) nogil:             # <<<<<<<<<<<<<<
+ *     cdef void mix_audio(float* output_buffer, const Uint8* input_buffer, Uint32 buffer_length, int volume) nogil:             # <<<<<<<<<<<<<<
  *         """
- *         Mixes input buffer samples into existing output buffer samples applying the specified volume setting.
- */
-
-static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_audio(Uint8 *__pyx_v_output_buffer, Uint8 const *__pyx_v_input_buffer, Uint32 __pyx_v_buffer_length, int __pyx_v_volume) {
-  union __pyx_t_5mpfmc_4core_5audio_4sdl2_Sample16 __pyx_v_input_sample;
-  union __pyx_t_5mpfmc_4core_5audio_4sdl2_Sample16 __pyx_v_output_sample;
-  int __pyx_v_temp_sample;
-  Uint32 __pyx_v_buffer_pos;
-  int __pyx_t_1;
-  int __pyx_t_2;
-  Uint8 __pyx_t_3;
-
-  /* "mpfmc/core/audio/track.pyx":419
- *         cdef Sample16 input_sample, output_sample
- *         cdef int temp_sample
- *         cdef Uint32 buffer_pos = 0             # <<<<<<<<<<<<<<
- * 
- *         while buffer_pos < buffer_length:
- */
-  __pyx_v_buffer_pos = 0;
-
-  /* "mpfmc/core/audio/track.pyx":421
- *         cdef Uint32 buffer_pos = 0
- * 
- *         while buffer_pos < buffer_length:             # <<<<<<<<<<<<<<
- * 
- *             # Get sample (2 bytes) from the input buffer and combine into 16-bit value
- */
-  while (1) {
-    __pyx_t_1 = ((__pyx_v_buffer_pos < __pyx_v_buffer_length) != 0);
-    if (!__pyx_t_1) break;
-
-    /* "mpfmc/core/audio/track.pyx":424
- * 
- *             # Get sample (2 bytes) from the input buffer and combine into 16-bit value
- *             input_sample.bytes.byte0 = input_buffer[buffer_pos]             # <<<<<<<<<<<<<<
- *             input_sample.bytes.byte1 = input_buffer[buffer_pos + 1]
- * 
- */
-    __pyx_v_input_sample.bytes.byte0 = (__pyx_v_input_buffer[__pyx_v_buffer_pos]);
-
-    /* "mpfmc/core/audio/track.pyx":425
- *             # Get sample (2 bytes) from the input buffer and combine into 16-bit value
- *             input_sample.bytes.byte0 = input_buffer[buffer_pos]
- *             input_sample.bytes.byte1 = input_buffer[buffer_pos + 1]             # <<<<<<<<<<<<<<
- * 
- *             # Get sample (2 bytes) from the output buffer and combine into 16-bit value
- */
-    __pyx_v_input_sample.bytes.byte1 = (__pyx_v_input_buffer[(__pyx_v_buffer_pos + 1)]);
-
-    /* "mpfmc/core/audio/track.pyx":428
- * 
- *             # Get sample (2 bytes) from the output buffer and combine into 16-bit value
- *             output_sample.bytes.byte0 = output_buffer[buffer_pos]             # <<<<<<<<<<<<<<
- *             output_sample.bytes.byte1 = output_buffer[buffer_pos + 1]
- * 
- */
-    __pyx_v_output_sample.bytes.byte0 = (__pyx_v_output_buffer[__pyx_v_buffer_pos]);
-
-    /* "mpfmc/core/audio/track.pyx":429
- *             # Get sample (2 bytes) from the output buffer and combine into 16-bit value
- *             output_sample.bytes.byte0 = output_buffer[buffer_pos]
- *             output_sample.bytes.byte1 = output_buffer[buffer_pos + 1]             # <<<<<<<<<<<<<<
- * 
- *             # Calculate the new output sample (mix the input sample multiplied by the volume with the existing output
- */
-    __pyx_v_output_sample.bytes.byte1 = (__pyx_v_output_buffer[(__pyx_v_buffer_pos + 1)]);
-
-    /* "mpfmc/core/audio/track.pyx":433
- *             # Calculate the new output sample (mix the input sample multiplied by the volume with the existing output
- *             # sample). The temporary output sample is a 32-bit value to avoid overflow.
- *             temp_sample = output_sample.value + ((input_sample.value * volume) // SDL_MIX_MAXVOLUME)             # <<<<<<<<<<<<<<
- * 
- *             # Clip the temp sample back to a 16-bit value (will cause distortion if samples
- */
-    __pyx_t_2 = (__pyx_v_input_sample.value * __pyx_v_volume);
-    if (unlikely(SDL_MIX_MAXVOLUME == 0)) {
-      #ifdef WITH_THREAD
-      PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
-      #endif
-      PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
-      #ifdef WITH_THREAD
-      __Pyx_PyGILState_Release(__pyx_gilstate_save);
-      #endif
-      __PYX_ERR(0, 433, __pyx_L1_error)
-    }
-    else if (sizeof(int) == sizeof(long) && (!(((int)-1) > 0)) && unlikely(SDL_MIX_MAXVOLUME == (int)-1)  && unlikely(UNARY_NEG_WOULD_OVERFLOW(__pyx_t_2))) {
-      #ifdef WITH_THREAD
-      PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
-      #endif
-      PyErr_SetString(PyExc_OverflowError, "value too large to perform division");
-      #ifdef WITH_THREAD
-      __Pyx_PyGILState_Release(__pyx_gilstate_save);
-      #endif
-      __PYX_ERR(0, 433, __pyx_L1_error)
-    }
-    __pyx_v_temp_sample = (__pyx_v_output_sample.value + __Pyx_div_int(__pyx_t_2, SDL_MIX_MAXVOLUME));
-
-    /* "mpfmc/core/audio/track.pyx":437
- *             # Clip the temp sample back to a 16-bit value (will cause distortion if samples
- *             # on channel are outside of the allowable 16-bit int range)
- *             if temp_sample > MAX_AUDIO_VALUE_S16:             # <<<<<<<<<<<<<<
- *                 temp_sample = MAX_AUDIO_VALUE_S16
- *             elif temp_sample < MIN_AUDIO_VALUE_S16:
- */
-    __pyx_t_1 = ((__pyx_v_temp_sample > 0x7FFF) != 0);
-    if (__pyx_t_1) {
-
-      /* "mpfmc/core/audio/track.pyx":438
- *             # on channel are outside of the allowable 16-bit int range)
- *             if temp_sample > MAX_AUDIO_VALUE_S16:
- *                 temp_sample = MAX_AUDIO_VALUE_S16             # <<<<<<<<<<<<<<
- *             elif temp_sample < MIN_AUDIO_VALUE_S16:
- *                 temp_sample = MIN_AUDIO_VALUE_S16
+ *         Mixes 16-bit input buffer samples into a floating point mixing buffer applying the specified
  */
-      __pyx_v_temp_sample = 0x7FFF;
 
-      /* "mpfmc/core/audio/track.pyx":437
- *             # Clip the temp sample back to a 16-bit value (will cause distortion if samples
- *             # on channel are outside of the allowable 16-bit int range)
- *             if temp_sample > MAX_AUDIO_VALUE_S16:             # <<<<<<<<<<<<<<
- *                 temp_sample = MAX_AUDIO_VALUE_S16
- *             elif temp_sample < MIN_AUDIO_VALUE_S16:
- */
-      goto __pyx_L5;
-    }
+static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_audio(float *__pyx_v_output_buffer, Uint8 const *__pyx_v_input_buffer, Uint32 __pyx_v_buffer_length, int __pyx_v_volume) {
+  Sint16 const *__pyx_v_input_samples;
+  Uint32 __pyx_v_sample_count;
+  float __pyx_v_gain;
+  Uint32 __pyx_v_i;
+  Uint32 __pyx_t_1;
+  Uint32 __pyx_t_2;
+  Uint32 __pyx_t_3;
+  Uint32 __pyx_t_4;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
 
-    /* "mpfmc/core/audio/track.pyx":439
- *             if temp_sample > MAX_AUDIO_VALUE_S16:
- *                 temp_sample = MAX_AUDIO_VALUE_S16
- *             elif temp_sample < MIN_AUDIO_VALUE_S16:             # <<<<<<<<<<<<<<
- *                 temp_sample = MIN_AUDIO_VALUE_S16
- * 
+  /* "mpfmc/core/audio/track.pyx":462
+ *             able to vectorize it.
+ *         """
+ *         cdef const Sint16* input_samples = <const Sint16*>input_buffer             # <<<<<<<<<<<<<<
+ *         cdef Uint32 sample_count = bytes_to_bus_samples(buffer_length)
+ *         cdef float gain = <float>volume / SDL_MIX_MAXVOLUME
  */
-    __pyx_t_1 = ((__pyx_v_temp_sample < -32768L) != 0);
-    if (__pyx_t_1) {
+  __pyx_v_input_samples = ((Sint16 const *)__pyx_v_input_buffer);
 
-      /* "mpfmc/core/audio/track.pyx":440
- *                 temp_sample = MAX_AUDIO_VALUE_S16
- *             elif temp_sample < MIN_AUDIO_VALUE_S16:
- *                 temp_sample = MIN_AUDIO_VALUE_S16             # <<<<<<<<<<<<<<
- * 
- *             # Write the new output sample back to the output buffer (from
+  /* "mpfmc/core/audio/track.pyx":463
+ *         """
+ *         cdef const Sint16* input_samples = <const Sint16*>input_buffer
+ *         cdef Uint32 sample_count = bytes_to_bus_samples(buffer_length)             # <<<<<<<<<<<<<<
+ *         cdef float gain = <float>volume / SDL_MIX_MAXVOLUME
+ *         cdef Uint32 i
  */
-      __pyx_v_temp_sample = -32768;
+  __pyx_v_sample_count = __pyx_f_5mpfmc_4core_5audio_6inline_bytes_to_bus_samples(__pyx_v_buffer_length);
 
-      /* "mpfmc/core/audio/track.pyx":439
- *             if temp_sample > MAX_AUDIO_VALUE_S16:
- *                 temp_sample = MAX_AUDIO_VALUE_S16
- *             elif temp_sample < MIN_AUDIO_VALUE_S16:             # <<<<<<<<<<<<<<
- *                 temp_sample = MIN_AUDIO_VALUE_S16
+  /* "mpfmc/core/audio/track.pyx":464
+ *         cdef const Sint16* input_samples = <const Sint16*>input_buffer
+ *         cdef Uint32 sample_count = bytes_to_bus_samples(buffer_length)
+ *         cdef float gain = <float>volume / SDL_MIX_MAXVOLUME             # <<<<<<<<<<<<<<
+ *         cdef Uint32 i
  * 
  */
-    }
-    __pyx_L5:;
-
-    /* "mpfmc/core/audio/track.pyx":444
- *             # Write the new output sample back to the output buffer (from
- *             # a 32-bit value back to a 16-bit value that we know is in 16-bit value range)
- *             output_sample.value = temp_sample             # <<<<<<<<<<<<<<
- *             output_buffer[buffer_pos] = output_sample.bytes.byte0
- *             output_buffer[buffer_pos + 1] = output_sample.bytes.byte1
- */
-    __pyx_v_output_sample.value = __pyx_v_temp_sample;
+  if (unlikely(SDL_MIX_MAXVOLUME == 0)) {
+    #ifdef WITH_THREAD
+    PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+    #endif
+    PyErr_SetString(PyExc_ZeroDivisionError, "float division");
+    #ifdef WITH_THREAD
+    __Pyx_PyGILState_Release(__pyx_gilstate_save);
+    #endif
+    __PYX_ERR(0, 464, __pyx_L1_error)
+  }
+  __pyx_v_gain = (((float)__pyx_v_volume) / ((float)SDL_MIX_MAXVOLUME));
 
-    /* "mpfmc/core/audio/track.pyx":445
- *             # a 32-bit value back to a 16-bit value that we know is in 16-bit value range)
- *             output_sample.value = temp_sample
- *             output_buffer[buffer_pos] = output_sample.bytes.byte0             # <<<<<<<<<<<<<<
- *             output_buffer[buffer_pos + 1] = output_sample.bytes.byte1
+  /* "mpfmc/core/audio/track.pyx":467
+ *         cdef Uint32 i
  * 
- */
-    __pyx_t_3 = __pyx_v_output_sample.bytes.byte0;
-    (__pyx_v_output_buffer[__pyx_v_buffer_pos]) = __pyx_t_3;
-
-    /* "mpfmc/core/audio/track.pyx":446
- *             output_sample.value = temp_sample
- *             output_buffer[buffer_pos] = output_sample.bytes.byte0
- *             output_buffer[buffer_pos + 1] = output_sample.bytes.byte1             # <<<<<<<<<<<<<<
+ *         for i in range(sample_count):             # <<<<<<<<<<<<<<
+ *             output_buffer[i] += input_samples[i] * gain
  * 
- *             buffer_pos += 2
  */
-    __pyx_t_3 = __pyx_v_output_sample.bytes.byte1;
-    (__pyx_v_output_buffer[(__pyx_v_buffer_pos + 1)]) = __pyx_t_3;
+  __pyx_t_1 = __pyx_v_sample_count;
+  __pyx_t_2 = __pyx_t_1;
+  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_i = __pyx_t_3;
 
-    /* "mpfmc/core/audio/track.pyx":448
- *             output_buffer[buffer_pos + 1] = output_sample.bytes.byte1
+    /* "mpfmc/core/audio/track.pyx":468
  * 
- *             buffer_pos += 2             # <<<<<<<<<<<<<<
+ *         for i in range(sample_count):
+ *             output_buffer[i] += input_samples[i] * gain             # <<<<<<<<<<<<<<
  * 
  *     @staticmethod
  */
-    __pyx_v_buffer_pos = (__pyx_v_buffer_pos + 2);
+    __pyx_t_4 = __pyx_v_i;
+    (__pyx_v_output_buffer[__pyx_t_4]) = ((__pyx_v_output_buffer[__pyx_t_4]) + ((__pyx_v_input_samples[__pyx_v_i]) * __pyx_v_gain));
   }
 
-  /* "mpfmc/core/audio/track.pyx":406
+  /* "mpfmc/core/audio/track.pyx":446
  * 
  *     @staticmethod
- *     cdef void mix_audio(Uint8* output_buffer, const Uint8* input_buffer, Uint32 buffer_length, int volume) nogil:             # <<<<<<<<<<<<<<
+ *     cdef void mix_audio(float* output_buffer, const Uint8* input_buffer, Uint32 buffer_length, int volume) nogil:             # <<<<<<<<<<<<<<
  *         """
- *         Mixes input buffer samples into existing output buffer samples applying the specified volume setting.
+ *         Mixes 16-bit input buffer samples into a floating point mixing buffer applying the specified
  */
 
   /* function exit code */
@@ -5821,384 +6459,276 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_audio(Uint8 *__pyx_v_o
   __pyx_L0:;
 }
 
-/* "mpfmc/core/audio/track.pyx":451
+/* "mpfmc/core/audio/track.pyx":471
  * 
  *     @staticmethod
- *     cdef void mix_audio_stereo(Uint8* output_buffer, const Uint8* input_buffer, Uint32 buffer_length,             # <<<<<<<<<<<<<<
+ *     cdef void mix_audio_stereo(float* output_buffer, const Uint8* input_buffer, Uint32 buffer_length,             # <<<<<<<<<<<<<<
  *                                int volume_left, int volume_right) nogil:
  *         """
  */
 
-static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_audio_stereo(Uint8 *__pyx_v_output_buffer, Uint8 const *__pyx_v_input_buffer, Uint32 __pyx_v_buffer_length, int __pyx_v_volume_left, int __pyx_v_volume_right) {
-  union __pyx_t_5mpfmc_4core_5audio_4sdl2_Sample16 __pyx_v_input_sample;
-  union __pyx_t_5mpfmc_4core_5audio_4sdl2_Sample16 __pyx_v_output_sample;
-  int __pyx_v_temp_sample;
-  Uint32 __pyx_v_buffer_pos;
-  int __pyx_t_1;
-  int __pyx_t_2;
-  Uint8 __pyx_t_3;
-
-  /* "mpfmc/core/audio/track.pyx":470
- *         cdef Sample16 input_sample, output_sample
- *         cdef int temp_sample
- *         cdef Uint32 buffer_pos = 0             # <<<<<<<<<<<<<<
- * 
- *         while buffer_pos < buffer_length:
- */
-  __pyx_v_buffer_pos = 0;
+static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_audio_stereo(float *__pyx_v_output_buffer, Uint8 const *__pyx_v_input_buffer, Uint32 __pyx_v_buffer_length, int __pyx_v_volume_left, int __pyx_v_volume_right) {
+  Sint16 const *__pyx_v_input_samples;
+  Uint32 __pyx_v_frame_count;
+  float __pyx_v_gain_left;
+  float __pyx_v_gain_right;
+  Uint32 __pyx_v_i;
+  Uint32 __pyx_t_1;
+  Uint32 __pyx_t_2;
+  Uint32 __pyx_t_3;
+  Uint32 __pyx_t_4;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
 
-  /* "mpfmc/core/audio/track.pyx":472
- *         cdef Uint32 buffer_pos = 0
+  /* "mpfmc/core/audio/track.pyx":488
  * 
- *         while buffer_pos < buffer_length:             # <<<<<<<<<<<<<<
- * 
- *             # Process left channel
+ *         """
+ *         cdef const Sint16* input_samples = <const Sint16*>input_buffer             # <<<<<<<<<<<<<<
+ *         cdef Uint32 frame_count = bytes_to_bus_samples(buffer_length) // 2
+ *         cdef float gain_left = <float>volume_left / SDL_MIX_MAXVOLUME
  */
-  while (1) {
-    __pyx_t_1 = ((__pyx_v_buffer_pos < __pyx_v_buffer_length) != 0);
-    if (!__pyx_t_1) break;
+  __pyx_v_input_samples = ((Sint16 const *)__pyx_v_input_buffer);
 
-    /* "mpfmc/core/audio/track.pyx":477
- * 
- *             # Get sample (2 bytes) from the input buffer and combine into 16-bit value
- *             input_sample.bytes.byte0 = input_buffer[buffer_pos]             # <<<<<<<<<<<<<<
- *             input_sample.bytes.byte1 = input_buffer[buffer_pos + 1]
- * 
+  /* "mpfmc/core/audio/track.pyx":489
+ *         """
+ *         cdef const Sint16* input_samples = <const Sint16*>input_buffer
+ *         cdef Uint32 frame_count = bytes_to_bus_samples(buffer_length) // 2             # <<<<<<<<<<<<<<
+ *         cdef float gain_left = <float>volume_left / SDL_MIX_MAXVOLUME
+ *         cdef float gain_right = <float>volume_right / SDL_MIX_MAXVOLUME
  */
-    __pyx_v_input_sample.bytes.byte0 = (__pyx_v_input_buffer[__pyx_v_buffer_pos]);
+  __pyx_v_frame_count = (__pyx_f_5mpfmc_4core_5audio_6inline_bytes_to_bus_samples(__pyx_v_buffer_length) / 2);
 
-    /* "mpfmc/core/audio/track.pyx":478
- *             # Get sample (2 bytes) from the input buffer and combine into 16-bit value
- *             input_sample.bytes.byte0 = input_buffer[buffer_pos]
- *             input_sample.bytes.byte1 = input_buffer[buffer_pos + 1]             # <<<<<<<<<<<<<<
- * 
- *             # Get sample (2 bytes) from the output buffer and combine into 16-bit value
+  /* "mpfmc/core/audio/track.pyx":490
+ *         cdef const Sint16* input_samples = <const Sint16*>input_buffer
+ *         cdef Uint32 frame_count = bytes_to_bus_samples(buffer_length) // 2
+ *         cdef float gain_left = <float>volume_left / SDL_MIX_MAXVOLUME             # <<<<<<<<<<<<<<
+ *         cdef float gain_right = <float>volume_right / SDL_MIX_MAXVOLUME
+ *         cdef Uint32 i
  */
-    __pyx_v_input_sample.bytes.byte1 = (__pyx_v_input_buffer[(__pyx_v_buffer_pos + 1)]);
+  if (unlikely(SDL_MIX_MAXVOLUME == 0)) {
+    #ifdef WITH_THREAD
+    PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+    #endif
+    PyErr_SetString(PyExc_ZeroDivisionError, "float division");
+    #ifdef WITH_THREAD
+    __Pyx_PyGILState_Release(__pyx_gilstate_save);
+    #endif
+    __PYX_ERR(0, 490, __pyx_L1_error)
+  }
+  __pyx_v_gain_left = (((float)__pyx_v_volume_left) / ((float)SDL_MIX_MAXVOLUME));
 
-    /* "mpfmc/core/audio/track.pyx":481
- * 
- *             # Get sample (2 bytes) from the output buffer and combine into 16-bit value
- *             output_sample.bytes.byte0 = output_buffer[buffer_pos]             # <<<<<<<<<<<<<<
- *             output_sample.bytes.byte1 = output_buffer[buffer_pos + 1]
+  /* "mpfmc/core/audio/track.pyx":491
+ *         cdef Uint32 frame_count = bytes_to_bus_samples(buffer_length) // 2
+ *         cdef float gain_left = <float>volume_left / SDL_MIX_MAXVOLUME
+ *         cdef float gain_right = <float>volume_right / SDL_MIX_MAXVOLUME             # <<<<<<<<<<<<<<
+ *         cdef Uint32 i
  * 
  */
-    __pyx_v_output_sample.bytes.byte0 = (__pyx_v_output_buffer[__pyx_v_buffer_pos]);
+  if (unlikely(SDL_MIX_MAXVOLUME == 0)) {
+    #ifdef WITH_THREAD
+    PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+    #endif
+    PyErr_SetString(PyExc_ZeroDivisionError, "float division");
+    #ifdef WITH_THREAD
+    __Pyx_PyGILState_Release(__pyx_gilstate_save);
+    #endif
+    __PYX_ERR(0, 491, __pyx_L1_error)
+  }
+  __pyx_v_gain_right = (((float)__pyx_v_volume_right) / ((float)SDL_MIX_MAXVOLUME));
 
-    /* "mpfmc/core/audio/track.pyx":482
- *             # Get sample (2 bytes) from the output buffer and combine into 16-bit value
- *             output_sample.bytes.byte0 = output_buffer[buffer_pos]
- *             output_sample.bytes.byte1 = output_buffer[buffer_pos + 1]             # <<<<<<<<<<<<<<
+  /* "mpfmc/core/audio/track.pyx":494
+ *         cdef Uint32 i
  * 
- *             # Calculate the new output sample (mix the input sample multiplied by the volume with the existing output
+ *         for i in range(frame_count):             # <<<<<<<<<<<<<<
+ *             output_buffer[2 * i] += input_samples[2 * i] * gain_left
+ *             output_buffer[2 * i + 1] += input_samples[2 * i + 1] * gain_right
  */
-    __pyx_v_output_sample.bytes.byte1 = (__pyx_v_output_buffer[(__pyx_v_buffer_pos + 1)]);
+  __pyx_t_1 = __pyx_v_frame_count;
+  __pyx_t_2 = __pyx_t_1;
+  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_i = __pyx_t_3;
 
-    /* "mpfmc/core/audio/track.pyx":486
- *             # Calculate the new output sample (mix the input sample multiplied by the volume with the existing output
- *             # sample). The temporary output sample is a 32-bit value to avoid overflow.
- *             temp_sample = output_sample.value + ((input_sample.value * volume_left) // SDL_MIX_MAXVOLUME)             # <<<<<<<<<<<<<<
+    /* "mpfmc/core/audio/track.pyx":495
  * 
- *             # Clip the temp sample back to a 16-bit value (will cause distortion if samples
- */
-    __pyx_t_2 = (__pyx_v_input_sample.value * __pyx_v_volume_left);
-    if (unlikely(SDL_MIX_MAXVOLUME == 0)) {
-      #ifdef WITH_THREAD
-      PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
-      #endif
-      PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
-      #ifdef WITH_THREAD
-      __Pyx_PyGILState_Release(__pyx_gilstate_save);
-      #endif
-      __PYX_ERR(0, 486, __pyx_L1_error)
-    }
-    else if (sizeof(int) == sizeof(long) && (!(((int)-1) > 0)) && unlikely(SDL_MIX_MAXVOLUME == (int)-1)  && unlikely(UNARY_NEG_WOULD_OVERFLOW(__pyx_t_2))) {
-      #ifdef WITH_THREAD
-      PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
-      #endif
-      PyErr_SetString(PyExc_OverflowError, "value too large to perform division");
-      #ifdef WITH_THREAD
-      __Pyx_PyGILState_Release(__pyx_gilstate_save);
-      #endif
-      __PYX_ERR(0, 486, __pyx_L1_error)
-    }
-    __pyx_v_temp_sample = (__pyx_v_output_sample.value + __Pyx_div_int(__pyx_t_2, SDL_MIX_MAXVOLUME));
-
-    /* "mpfmc/core/audio/track.pyx":490
- *             # Clip the temp sample back to a 16-bit value (will cause distortion if samples
- *             # on channel are outside of the allowable 16-bit int range)
- *             if temp_sample > MAX_AUDIO_VALUE_S16:             # <<<<<<<<<<<<<<
- *                 temp_sample = MAX_AUDIO_VALUE_S16
- *             elif temp_sample < MIN_AUDIO_VALUE_S16:
- */
-    __pyx_t_1 = ((__pyx_v_temp_sample > 0x7FFF) != 0);
-    if (__pyx_t_1) {
-
-      /* "mpfmc/core/audio/track.pyx":491
- *             # on channel are outside of the allowable 16-bit int range)
- *             if temp_sample > MAX_AUDIO_VALUE_S16:
- *                 temp_sample = MAX_AUDIO_VALUE_S16             # <<<<<<<<<<<<<<
- *             elif temp_sample < MIN_AUDIO_VALUE_S16:
- *                 temp_sample = MIN_AUDIO_VALUE_S16
- */
-      __pyx_v_temp_sample = 0x7FFF;
-
-      /* "mpfmc/core/audio/track.pyx":490
- *             # Clip the temp sample back to a 16-bit value (will cause distortion if samples
- *             # on channel are outside of the allowable 16-bit int range)
- *             if temp_sample > MAX_AUDIO_VALUE_S16:             # <<<<<<<<<<<<<<
- *                 temp_sample = MAX_AUDIO_VALUE_S16
- *             elif temp_sample < MIN_AUDIO_VALUE_S16:
- */
-      goto __pyx_L5;
-    }
-
-    /* "mpfmc/core/audio/track.pyx":492
- *             if temp_sample > MAX_AUDIO_VALUE_S16:
- *                 temp_sample = MAX_AUDIO_VALUE_S16
- *             elif temp_sample < MIN_AUDIO_VALUE_S16:             # <<<<<<<<<<<<<<
- *                 temp_sample = MIN_AUDIO_VALUE_S16
+ *         for i in range(frame_count):
+ *             output_buffer[2 * i] += input_samples[2 * i] * gain_left             # <<<<<<<<<<<<<<
+ *             output_buffer[2 * i + 1] += input_samples[2 * i + 1] * gain_right
  * 
  */
-    __pyx_t_1 = ((__pyx_v_temp_sample < -32768L) != 0);
-    if (__pyx_t_1) {
+    __pyx_t_4 = (2 * __pyx_v_i);
+    (__pyx_v_output_buffer[__pyx_t_4]) = ((__pyx_v_output_buffer[__pyx_t_4]) + ((__pyx_v_input_samples[(2 * __pyx_v_i)]) * __pyx_v_gain_left));
 
-      /* "mpfmc/core/audio/track.pyx":493
- *                 temp_sample = MAX_AUDIO_VALUE_S16
- *             elif temp_sample < MIN_AUDIO_VALUE_S16:
- *                 temp_sample = MIN_AUDIO_VALUE_S16             # <<<<<<<<<<<<<<
+    /* "mpfmc/core/audio/track.pyx":496
+ *         for i in range(frame_count):
+ *             output_buffer[2 * i] += input_samples[2 * i] * gain_left
+ *             output_buffer[2 * i + 1] += input_samples[2 * i + 1] * gain_right             # <<<<<<<<<<<<<<
  * 
- *             # Write the new output sample back to the output buffer (from
+ *     @staticmethod
  */
-      __pyx_v_temp_sample = -32768;
+    __pyx_t_4 = ((2 * __pyx_v_i) + 1);
+    (__pyx_v_output_buffer[__pyx_t_4]) = ((__pyx_v_output_buffer[__pyx_t_4]) + ((__pyx_v_input_samples[((2 * __pyx_v_i) + 1)]) * __pyx_v_gain_right));
+  }
 
-      /* "mpfmc/core/audio/track.pyx":492
- *             if temp_sample > MAX_AUDIO_VALUE_S16:
- *                 temp_sample = MAX_AUDIO_VALUE_S16
- *             elif temp_sample < MIN_AUDIO_VALUE_S16:             # <<<<<<<<<<<<<<
- *                 temp_sample = MIN_AUDIO_VALUE_S16
+  /* "mpfmc/core/audio/track.pyx":471
  * 
+ *     @staticmethod
+ *     cdef void mix_audio_stereo(float* output_buffer, const Uint8* input_buffer, Uint32 buffer_length,             # <<<<<<<<<<<<<<
+ *                                int volume_left, int volume_right) nogil:
+ *         """
  */
-    }
-    __pyx_L5:;
 
-    /* "mpfmc/core/audio/track.pyx":497
- *             # Write the new output sample back to the output buffer (from
- *             # a 32-bit value back to a 16-bit value that we know is in 16-bit value range)
- *             output_sample.value = temp_sample             # <<<<<<<<<<<<<<
- *             output_buffer[buffer_pos] = output_sample.bytes.byte0
- *             output_buffer[buffer_pos + 1] = output_sample.bytes.byte1
- */
-    __pyx_v_output_sample.value = __pyx_v_temp_sample;
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_WriteUnraisable("mpfmc.core.audio.track.Track.mix_audio_stereo", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 1);
+  __pyx_L0:;
+}
 
-    /* "mpfmc/core/audio/track.pyx":498
- *             # a 32-bit value back to a 16-bit value that we know is in 16-bit value range)
- *             output_sample.value = temp_sample
- *             output_buffer[buffer_pos] = output_sample.bytes.byte0             # <<<<<<<<<<<<<<
- *             output_buffer[buffer_pos + 1] = output_sample.bytes.byte1
+/* "mpfmc/core/audio/track.pyx":499
  * 
+ *     @staticmethod
+ *     cdef void mix_bus(float* output_buffer, const float* input_buffer, Uint32 sample_count, float gain) nogil:             # <<<<<<<<<<<<<<
+ *         """
+ *         Mixes one floating point mixing buffer into another applying the specified gain.
  */
-    __pyx_t_3 = __pyx_v_output_sample.bytes.byte0;
-    (__pyx_v_output_buffer[__pyx_v_buffer_pos]) = __pyx_t_3;
 
-    /* "mpfmc/core/audio/track.pyx":499
- *             output_sample.value = temp_sample
- *             output_buffer[buffer_pos] = output_sample.bytes.byte0
- *             output_buffer[buffer_pos + 1] = output_sample.bytes.byte1             # <<<<<<<<<<<<<<
- * 
- *             buffer_pos += 2
- */
-    __pyx_t_3 = __pyx_v_output_sample.bytes.byte1;
-    (__pyx_v_output_buffer[(__pyx_v_buffer_pos + 1)]) = __pyx_t_3;
+static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_bus(float *__pyx_v_output_buffer, float const *__pyx_v_input_buffer, Uint32 __pyx_v_sample_count, float __pyx_v_gain) {
+  Uint32 __pyx_v_i;
+  Uint32 __pyx_t_1;
+  Uint32 __pyx_t_2;
+  Uint32 __pyx_t_3;
+  Uint32 __pyx_t_4;
 
-    /* "mpfmc/core/audio/track.pyx":501
- *             output_buffer[buffer_pos + 1] = output_sample.bytes.byte1
+  /* "mpfmc/core/audio/track.pyx":511
+ *         cdef Uint32 i
  * 
- *             buffer_pos += 2             # <<<<<<<<<<<<<<
+ *         for i in range(sample_count):             # <<<<<<<<<<<<<<
+ *             output_buffer[i] += input_buffer[i] * gain
  * 
- *             # Process right channel
  */
-    __pyx_v_buffer_pos = (__pyx_v_buffer_pos + 2);
+  __pyx_t_1 = __pyx_v_sample_count;
+  __pyx_t_2 = __pyx_t_1;
+  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_i = __pyx_t_3;
 
-    /* "mpfmc/core/audio/track.pyx":506
+    /* "mpfmc/core/audio/track.pyx":512
  * 
- *             # Get sample (2 bytes) from the input buffer and combine into 16-bit value
- *             input_sample.bytes.byte0 = input_buffer[buffer_pos]             # <<<<<<<<<<<<<<
- *             input_sample.bytes.byte1 = input_buffer[buffer_pos + 1]
+ *         for i in range(sample_count):
+ *             output_buffer[i] += input_buffer[i] * gain             # <<<<<<<<<<<<<<
  * 
+ *     @staticmethod
  */
-    __pyx_v_input_sample.bytes.byte0 = (__pyx_v_input_buffer[__pyx_v_buffer_pos]);
-
-    /* "mpfmc/core/audio/track.pyx":507
- *             # Get sample (2 bytes) from the input buffer and combine into 16-bit value
- *             input_sample.bytes.byte0 = input_buffer[buffer_pos]
- *             input_sample.bytes.byte1 = input_buffer[buffer_pos + 1]             # <<<<<<<<<<<<<<
- * 
- *             # Get sample (2 bytes) from the output buffer and combine into 16-bit value
- */
-    __pyx_v_input_sample.bytes.byte1 = (__pyx_v_input_buffer[(__pyx_v_buffer_pos + 1)]);
+    __pyx_t_4 = __pyx_v_i;
+    (__pyx_v_output_buffer[__pyx_t_4]) = ((__pyx_v_output_buffer[__pyx_t_4]) + ((__pyx_v_input_buffer[__pyx_v_i]) * __pyx_v_gain));
+  }
 
-    /* "mpfmc/core/audio/track.pyx":510
- * 
- *             # Get sample (2 bytes) from the output buffer and combine into 16-bit value
- *             output_sample.bytes.byte0 = output_buffer[buffer_pos]             # <<<<<<<<<<<<<<
- *             output_sample.bytes.byte1 = output_buffer[buffer_pos + 1]
+  /* "mpfmc/core/audio/track.pyx":499
  * 
+ *     @staticmethod
+ *     cdef void mix_bus(float* output_buffer, const float* input_buffer, Uint32 sample_count, float gain) nogil:             # <<<<<<<<<<<<<<
+ *         """
+ *         Mixes one floating point mixing buffer into another applying the specified gain.
  */
-    __pyx_v_output_sample.bytes.byte0 = (__pyx_v_output_buffer[__pyx_v_buffer_pos]);
 
-    /* "mpfmc/core/audio/track.pyx":511
- *             # Get sample (2 bytes) from the output buffer and combine into 16-bit value
- *             output_sample.bytes.byte0 = output_buffer[buffer_pos]
- *             output_sample.bytes.byte1 = output_buffer[buffer_pos + 1]             # <<<<<<<<<<<<<<
- * 
- *             # Calculate the new output sample (mix the input sample multiplied by the volume with the existing output
- */
-    __pyx_v_output_sample.bytes.byte1 = (__pyx_v_output_buffer[(__pyx_v_buffer_pos + 1)]);
+  /* function exit code */
+}
 
-    /* "mpfmc/core/audio/track.pyx":515
- *             # Calculate the new output sample (mix the input sample multiplied by the volume with the existing output
- *             # sample). The temporary output sample is a 32-bit value to avoid overflow.
- *             temp_sample = output_sample.value + ((input_sample.value * volume_right) // SDL_MIX_MAXVOLUME)             # <<<<<<<<<<<<<<
+/* "mpfmc/core/audio/track.pyx":515
  * 
- *             # Clip the temp sample back to a 16-bit value (will cause distortion if samples
- */
-    __pyx_t_2 = (__pyx_v_input_sample.value * __pyx_v_volume_right);
-    if (unlikely(SDL_MIX_MAXVOLUME == 0)) {
-      #ifdef WITH_THREAD
-      PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
-      #endif
-      PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
-      #ifdef WITH_THREAD
-      __Pyx_PyGILState_Release(__pyx_gilstate_save);
-      #endif
-      __PYX_ERR(0, 515, __pyx_L1_error)
-    }
-    else if (sizeof(int) == sizeof(long) && (!(((int)-1) > 0)) && unlikely(SDL_MIX_MAXVOLUME == (int)-1)  && unlikely(UNARY_NEG_WOULD_OVERFLOW(__pyx_t_2))) {
-      #ifdef WITH_THREAD
-      PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
-      #endif
-      PyErr_SetString(PyExc_OverflowError, "value too large to perform division");
-      #ifdef WITH_THREAD
-      __Pyx_PyGILState_Release(__pyx_gilstate_save);
-      #endif
-      __PYX_ERR(0, 515, __pyx_L1_error)
-    }
-    __pyx_v_temp_sample = (__pyx_v_output_sample.value + __Pyx_div_int(__pyx_t_2, SDL_MIX_MAXVOLUME));
-
-    /* "mpfmc/core/audio/track.pyx":519
- *             # Clip the temp sample back to a 16-bit value (will cause distortion if samples
- *             # on channel are outside of the allowable 16-bit int range)
- *             if temp_sample > MAX_AUDIO_VALUE_S16:             # <<<<<<<<<<<<<<
- *                 temp_sample = MAX_AUDIO_VALUE_S16
- *             elif temp_sample < MIN_AUDIO_VALUE_S16:
+ *     @staticmethod
+ *     cdef void write_bus_to_output(Uint8* output_buffer, const float* bus, const float* dither,             # <<<<<<<<<<<<<<
+ *                                   Uint32 sample_count, float gain) nogil:
+ *         """
  */
-    __pyx_t_1 = ((__pyx_v_temp_sample > 0x7FFF) != 0);
-    if (__pyx_t_1) {
 
-      /* "mpfmc/core/audio/track.pyx":520
- *             # on channel are outside of the allowable 16-bit int range)
- *             if temp_sample > MAX_AUDIO_VALUE_S16:
- *                 temp_sample = MAX_AUDIO_VALUE_S16             # <<<<<<<<<<<<<<
- *             elif temp_sample < MIN_AUDIO_VALUE_S16:
- *                 temp_sample = MIN_AUDIO_VALUE_S16
- */
-      __pyx_v_temp_sample = 0x7FFF;
+static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_write_bus_to_output(Uint8 *__pyx_v_output_buffer, float const *__pyx_v_bus, float const *__pyx_v_dither, Uint32 __pyx_v_sample_count, float __pyx_v_gain) {
+  Sint16 *__pyx_v_output_samples;
+  float __pyx_v_sample;
+  Uint32 __pyx_v_i;
+  Uint32 __pyx_t_1;
+  Uint32 __pyx_t_2;
+  Uint32 __pyx_t_3;
+  float __pyx_t_4;
+  float __pyx_t_5;
+  float __pyx_t_6;
+  float __pyx_t_7;
 
-      /* "mpfmc/core/audio/track.pyx":519
- *             # Clip the temp sample back to a 16-bit value (will cause distortion if samples
- *             # on channel are outside of the allowable 16-bit int range)
- *             if temp_sample > MAX_AUDIO_VALUE_S16:             # <<<<<<<<<<<<<<
- *                 temp_sample = MAX_AUDIO_VALUE_S16
- *             elif temp_sample < MIN_AUDIO_VALUE_S16:
+  /* "mpfmc/core/audio/track.pyx":529
+ *             gain: Master gain to apply before clipping
+ *         """
+ *         cdef Sint16* output_samples = <Sint16*>output_buffer             # <<<<<<<<<<<<<<
+ *         cdef float sample
+ *         cdef Uint32 i
  */
-      goto __pyx_L6;
-    }
+  __pyx_v_output_samples = ((Sint16 *)__pyx_v_output_buffer);
 
-    /* "mpfmc/core/audio/track.pyx":521
- *             if temp_sample > MAX_AUDIO_VALUE_S16:
- *                 temp_sample = MAX_AUDIO_VALUE_S16
- *             elif temp_sample < MIN_AUDIO_VALUE_S16:             # <<<<<<<<<<<<<<
- *                 temp_sample = MIN_AUDIO_VALUE_S16
+  /* "mpfmc/core/audio/track.pyx":533
+ *         cdef Uint32 i
  * 
+ *         for i in range(sample_count):             # <<<<<<<<<<<<<<
+ *             sample = bus[i] * gain + dither[i]
+ *             sample = min(max(sample, <float>MIN_AUDIO_VALUE_S16), <float>MAX_AUDIO_VALUE_S16)
  */
-    __pyx_t_1 = ((__pyx_v_temp_sample < -32768L) != 0);
-    if (__pyx_t_1) {
+  __pyx_t_1 = __pyx_v_sample_count;
+  __pyx_t_2 = __pyx_t_1;
+  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_i = __pyx_t_3;
 
-      /* "mpfmc/core/audio/track.pyx":522
- *                 temp_sample = MAX_AUDIO_VALUE_S16
- *             elif temp_sample < MIN_AUDIO_VALUE_S16:
- *                 temp_sample = MIN_AUDIO_VALUE_S16             # <<<<<<<<<<<<<<
+    /* "mpfmc/core/audio/track.pyx":534
  * 
- *             # Write the new output sample back to the output buffer (from
+ *         for i in range(sample_count):
+ *             sample = bus[i] * gain + dither[i]             # <<<<<<<<<<<<<<
+ *             sample = min(max(sample, <float>MIN_AUDIO_VALUE_S16), <float>MAX_AUDIO_VALUE_S16)
+ *             output_samples[i] = <Sint16>sample
  */
-      __pyx_v_temp_sample = -32768;
+    __pyx_v_sample = (((__pyx_v_bus[__pyx_v_i]) * __pyx_v_gain) + (__pyx_v_dither[__pyx_v_i]));
 
-      /* "mpfmc/core/audio/track.pyx":521
- *             if temp_sample > MAX_AUDIO_VALUE_S16:
- *                 temp_sample = MAX_AUDIO_VALUE_S16
- *             elif temp_sample < MIN_AUDIO_VALUE_S16:             # <<<<<<<<<<<<<<
- *                 temp_sample = MIN_AUDIO_VALUE_S16
+    /* "mpfmc/core/audio/track.pyx":535
+ *         for i in range(sample_count):
+ *             sample = bus[i] * gain + dither[i]
+ *             sample = min(max(sample, <float>MIN_AUDIO_VALUE_S16), <float>MAX_AUDIO_VALUE_S16)             # <<<<<<<<<<<<<<
+ *             output_samples[i] = <Sint16>sample
  * 
  */
+    __pyx_t_4 = ((float)0x7FFF);
+    __pyx_t_5 = ((float)-32768L);
+    __pyx_t_6 = __pyx_v_sample;
+    if (((__pyx_t_5 > __pyx_t_6) != 0)) {
+      __pyx_t_7 = __pyx_t_5;
+    } else {
+      __pyx_t_7 = __pyx_t_6;
     }
-    __pyx_L6:;
-
-    /* "mpfmc/core/audio/track.pyx":526
- *             # Write the new output sample back to the output buffer (from
- *             # a 32-bit value back to a 16-bit value that we know is in 16-bit value range)
- *             output_sample.value = temp_sample             # <<<<<<<<<<<<<<
- *             output_buffer[buffer_pos] = output_sample.bytes.byte0
- *             output_buffer[buffer_pos + 1] = output_sample.bytes.byte1
- */
-    __pyx_v_output_sample.value = __pyx_v_temp_sample;
-
-    /* "mpfmc/core/audio/track.pyx":527
- *             # a 32-bit value back to a 16-bit value that we know is in 16-bit value range)
- *             output_sample.value = temp_sample
- *             output_buffer[buffer_pos] = output_sample.bytes.byte0             # <<<<<<<<<<<<<<
- *             output_buffer[buffer_pos + 1] = output_sample.bytes.byte1
- * 
- */
-    __pyx_t_3 = __pyx_v_output_sample.bytes.byte0;
-    (__pyx_v_output_buffer[__pyx_v_buffer_pos]) = __pyx_t_3;
-
-    /* "mpfmc/core/audio/track.pyx":528
- *             output_sample.value = temp_sample
- *             output_buffer[buffer_pos] = output_sample.bytes.byte0
- *             output_buffer[buffer_pos + 1] = output_sample.bytes.byte1             # <<<<<<<<<<<<<<
- * 
- *             buffer_pos += 2
- */
-    __pyx_t_3 = __pyx_v_output_sample.bytes.byte1;
-    (__pyx_v_output_buffer[(__pyx_v_buffer_pos + 1)]) = __pyx_t_3;
+    __pyx_t_5 = __pyx_t_7;
+    if (((__pyx_t_4 < __pyx_t_5) != 0)) {
+      __pyx_t_7 = __pyx_t_4;
+    } else {
+      __pyx_t_7 = __pyx_t_5;
+    }
+    __pyx_v_sample = __pyx_t_7;
 
-    /* "mpfmc/core/audio/track.pyx":530
- *             output_buffer[buffer_pos + 1] = output_sample.bytes.byte1
- * 
- *             buffer_pos += 2             # <<<<<<<<<<<<<<
+    /* "mpfmc/core/audio/track.pyx":536
+ *             sample = bus[i] * gain + dither[i]
+ *             sample = min(max(sample, <float>MIN_AUDIO_VALUE_S16), <float>MAX_AUDIO_VALUE_S16)
+ *             output_samples[i] = <Sint16>sample             # <<<<<<<<<<<<<<
  * 
  *     @staticmethod
  */
-    __pyx_v_buffer_pos = (__pyx_v_buffer_pos + 2);
+    (__pyx_v_output_samples[__pyx_v_i]) = ((Sint16)__pyx_v_sample);
   }
 
-  /* "mpfmc/core/audio/track.pyx":451
+  /* "mpfmc/core/audio/track.pyx":515
  * 
  *     @staticmethod
- *     cdef void mix_audio_stereo(Uint8* output_buffer, const Uint8* input_buffer, Uint32 buffer_length,             # <<<<<<<<<<<<<<
- *                                int volume_left, int volume_right) nogil:
+ *     cdef void write_bus_to_output(Uint8* output_buffer, const float* bus, const float* dither,             # <<<<<<<<<<<<<<
+ *                                   Uint32 sample_count, float gain) nogil:
  *         """
  */
 
   /* function exit code */
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_WriteUnraisable("mpfmc.core.audio.track.Track.mix_audio_stereo", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 1);
-  __pyx_L0:;
 }
 
-/* "mpfmc/core/audio/track.pyx":533
+/* "mpfmc/core/audio/track.pyx":539
  * 
  *     @staticmethod
  *     cdef void apply_volume(Uint8* output_buffer, const Uint8* input_buffer, Uint32 buffer_length, int volume) nogil:             # <<<<<<<<<<<<<<
@@ -6212,8 +6742,11 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_apply_volume(Uint8 *__pyx_
   Uint32 __pyx_v_buffer_pos;
   int __pyx_t_1;
   int __pyx_t_2;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
 
-  /* "mpfmc/core/audio/track.pyx":543
+  /* "mpfmc/core/audio/track.pyx":549
  * 
  *         """
  *         cdef Sint16* output_samples = <Sint16*>output_buffer             # <<<<<<<<<<<<<<
@@ -6222,7 +6755,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_apply_volume(Uint8 *__pyx_
  */
   __pyx_v_output_samples = ((Sint16 *)__pyx_v_output_buffer);
 
-  /* "mpfmc/core/audio/track.pyx":544
+  /* "mpfmc/core/audio/track.pyx":550
  *         """
  *         cdef Sint16* output_samples = <Sint16*>output_buffer
  *         cdef Sint16* input_samples = <Sint16*>input_buffer             # <<<<<<<<<<<<<<
@@ -6231,7 +6764,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_apply_volume(Uint8 *__pyx_
  */
   __pyx_v_input_samples = ((Sint16 *)__pyx_v_input_buffer);
 
-  /* "mpfmc/core/audio/track.pyx":545
+  /* "mpfmc/core/audio/track.pyx":551
  *         cdef Sint16* output_samples = <Sint16*>output_buffer
  *         cdef Sint16* input_samples = <Sint16*>input_buffer
  *         cdef Uint32 buffer_pos = 0             # <<<<<<<<<<<<<<
@@ -6240,7 +6773,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_apply_volume(Uint8 *__pyx_
  */
   __pyx_v_buffer_pos = 0;
 
-  /* "mpfmc/core/audio/track.pyx":549
+  /* "mpfmc/core/audio/track.pyx":555
  *         # We will be iterating over the audio buffers two bytes at a time (16-bit sample values) so
  *         # effectively the buffer is half the length since we are casting the buffer pointer to 16-bit
  *         buffer_length = buffer_length // 2             # <<<<<<<<<<<<<<
@@ -6249,7 +6782,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_apply_volume(Uint8 *__pyx_
  */
   __pyx_v_buffer_length = (__pyx_v_buffer_length / 2);
 
-  /* "mpfmc/core/audio/track.pyx":551
+  /* "mpfmc/core/audio/track.pyx":557
  *         buffer_length = buffer_length // 2
  * 
  *         while buffer_pos < buffer_length:             # <<<<<<<<<<<<<<
@@ -6260,7 +6793,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_apply_volume(Uint8 *__pyx_
     __pyx_t_1 = ((__pyx_v_buffer_pos < __pyx_v_buffer_length) != 0);
     if (!__pyx_t_1) break;
 
-    /* "mpfmc/core/audio/track.pyx":552
+    /* "mpfmc/core/audio/track.pyx":558
  * 
  *         while buffer_pos < buffer_length:
  *             output_samples[buffer_pos] = (input_samples[buffer_pos] * volume) // SDL_MIX_MAXVOLUME             # <<<<<<<<<<<<<<
@@ -6276,7 +6809,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_apply_volume(Uint8 *__pyx_
       #ifdef WITH_THREAD
       __Pyx_PyGILState_Release(__pyx_gilstate_save);
       #endif
-      __PYX_ERR(0, 552, __pyx_L1_error)
+      __PYX_ERR(0, 558, __pyx_L1_error)
     }
     else if (sizeof(int) == sizeof(long) && (!(((int)-1) > 0)) && unlikely(SDL_MIX_MAXVOLUME == (int)-1)  && unlikely(UNARY_NEG_WOULD_OVERFLOW(__pyx_t_2))) {
       #ifdef WITH_THREAD
@@ -6286,11 +6819,11 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_apply_volume(Uint8 *__pyx_
       #ifdef WITH_THREAD
       __Pyx_PyGILState_Release(__pyx_gilstate_save);
       #endif
-      __PYX_ERR(0, 552, __pyx_L1_error)
+      __PYX_ERR(0, 558, __pyx_L1_error)
     }
     (__pyx_v_output_samples[__pyx_v_buffer_pos]) = __Pyx_div_int(__pyx_t_2, SDL_MIX_MAXVOLUME);
 
-    /* "mpfmc/core/audio/track.pyx":553
+    /* "mpfmc/core/audio/track.pyx":559
  *         while buffer_pos < buffer_length:
  *             output_samples[buffer_pos] = (input_samples[buffer_pos] * volume) // SDL_MIX_MAXVOLUME
  *             buffer_pos += 1             # <<<<<<<<<<<<<<
@@ -6300,7 +6833,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_apply_volume(Uint8 *__pyx_
     __pyx_v_buffer_pos = (__pyx_v_buffer_pos + 1);
   }
 
-  /* "mpfmc/core/audio/track.pyx":533
+  /* "mpfmc/core/audio/track.pyx":539
  * 
  *     @staticmethod
  *     cdef void apply_volume(Uint8* output_buffer, const Uint8* input_buffer, Uint32 buffer_length, int volume) nogil:             # <<<<<<<<<<<<<<
@@ -6315,7 +6848,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_apply_volume(Uint8 *__pyx_
   __pyx_L0:;
 }
 
-/* "mpfmc/core/audio/track.pyx":556
+/* "mpfmc/core/audio/track.pyx":562
  * 
  *     @staticmethod
  *     cdef void apply_volume_stereo(Uint8* output_buffer, const Uint8* input_buffer, Uint32 buffer_length,             # <<<<<<<<<<<<<<
@@ -6329,8 +6862,11 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_apply_volume_stereo(Uint8
   Uint32 __pyx_v_buffer_pos;
   int __pyx_t_1;
   int __pyx_t_2;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
 
-  /* "mpfmc/core/audio/track.pyx":573
+  /* "mpfmc/core/audio/track.pyx":579
  * 
  *         """
  *         cdef Sint16* output_samples = <Sint16*>output_buffer             # <<<<<<<<<<<<<<
@@ -6339,7 +6875,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_apply_volume_stereo(Uint8
  */
   __pyx_v_output_samples = ((Sint16 *)__pyx_v_output_buffer);
 
-  /* "mpfmc/core/audio/track.pyx":574
+  /* "mpfmc/core/audio/track.pyx":580
  *         """
  *         cdef Sint16* output_samples = <Sint16*>output_buffer
  *         cdef Sint16* input_samples = <Sint16*>input_buffer             # <<<<<<<<<<<<<<
@@ -6348,7 +6884,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_apply_volume_stereo(Uint8
  */
   __pyx_v_input_samples = ((Sint16 *)__pyx_v_input_buffer);
 
-  /* "mpfmc/core/audio/track.pyx":575
+  /* "mpfmc/core/audio/track.pyx":581
  *         cdef Sint16* output_samples = <Sint16*>output_buffer
  *         cdef Sint16* input_samples = <Sint16*>input_buffer
  *         cdef Uint32 buffer_pos = 0             # <<<<<<<<<<<<<<
@@ -6357,7 +6893,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_apply_volume_stereo(Uint8
  */
   __pyx_v_buffer_pos = 0;
 
-  /* "mpfmc/core/audio/track.pyx":579
+  /* "mpfmc/core/audio/track.pyx":585
  *         # We will be iterating over the audio buffers two bytes at a time (16-bit sample values) so
  *         # effectively the buffer is half the length since we are casting the buffer pointer to 16-bit
  *         buffer_length = buffer_length // 2             # <<<<<<<<<<<<<<
@@ -6366,7 +6902,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_apply_volume_stereo(Uint8
  */
   __pyx_v_buffer_length = (__pyx_v_buffer_length / 2);
 
-  /* "mpfmc/core/audio/track.pyx":581
+  /* "mpfmc/core/audio/track.pyx":587
  *         buffer_length = buffer_length // 2
  * 
  *         while buffer_pos < buffer_length:             # <<<<<<<<<<<<<<
@@ -6377,7 +6913,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_apply_volume_stereo(Uint8
     __pyx_t_1 = ((__pyx_v_buffer_pos < __pyx_v_buffer_length) != 0);
     if (!__pyx_t_1) break;
 
-    /* "mpfmc/core/audio/track.pyx":582
+    /* "mpfmc/core/audio/track.pyx":588
  * 
  *         while buffer_pos < buffer_length:
  *             output_samples[buffer_pos] = (input_samples[buffer_pos] * volume_left) // SDL_MIX_MAXVOLUME             # <<<<<<<<<<<<<<
@@ -6393,7 +6929,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_apply_volume_stereo(Uint8
       #ifdef WITH_THREAD
       __Pyx_PyGILState_Release(__pyx_gilstate_save);
       #endif
-      __PYX_ERR(0, 582, __pyx_L1_error)
+      __PYX_ERR(0, 588, __pyx_L1_error)
     }
     else if (sizeof(int) == sizeof(long) && (!(((int)-1) > 0)) && unlikely(SDL_MIX_MAXVOLUME == (int)-1)  && unlikely(UNARY_NEG_WOULD_OVERFLOW(__pyx_t_2))) {
       #ifdef WITH_THREAD
@@ -6403,11 +6939,11 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_apply_volume_stereo(Uint8
       #ifdef WITH_THREAD
       __Pyx_PyGILState_Release(__pyx_gilstate_save);
       #endif
-      __PYX_ERR(0, 582, __pyx_L1_error)
+      __PYX_ERR(0, 588, __pyx_L1_error)
     }
     (__pyx_v_output_samples[__pyx_v_buffer_pos]) = __Pyx_div_int(__pyx_t_2, SDL_MIX_MAXVOLUME);
 
-    /* "mpfmc/core/audio/track.pyx":583
+    /* "mpfmc/core/audio/track.pyx":589
  *         while buffer_pos < buffer_length:
  *             output_samples[buffer_pos] = (input_samples[buffer_pos] * volume_left) // SDL_MIX_MAXVOLUME
  *             buffer_pos += 1             # <<<<<<<<<<<<<<
@@ -6416,11 +6952,12 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_apply_volume_stereo(Uint8
  */
     __pyx_v_buffer_pos = (__pyx_v_buffer_pos + 1);
 
-    /* "mpfmc/core/audio/track.pyx":585
+    /* "mpfmc/core/audio/track.pyx":591
  *             buffer_pos += 1
  * 
  *             output_samples[buffer_pos] = (input_samples[buffer_pos] * volume_right) // SDL_MIX_MAXVOLUME             # <<<<<<<<<<<<<<
  *             buffer_pos += 1
+ * 
  */
     __pyx_t_2 = ((__pyx_v_input_samples[__pyx_v_buffer_pos]) * __pyx_v_volume_right);
     if (unlikely(SDL_MIX_MAXVOLUME == 0)) {
@@ -6431,7 +6968,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_apply_volume_stereo(Uint8
       #ifdef WITH_THREAD
       __Pyx_PyGILState_Release(__pyx_gilstate_save);
       #endif
-      __PYX_ERR(0, 585, __pyx_L1_error)
+      __PYX_ERR(0, 591, __pyx_L1_error)
     }
     else if (sizeof(int) == sizeof(long) && (!(((int)-1) > 0)) && unlikely(SDL_MIX_MAXVOLUME == (int)-1)  && unlikely(UNARY_NEG_WOULD_OVERFLOW(__pyx_t_2))) {
       #ifdef WITH_THREAD
@@ -6441,19 +6978,21 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_apply_volume_stereo(Uint8
       #ifdef WITH_THREAD
       __Pyx_PyGILState_Release(__pyx_gilstate_save);
       #endif
-      __PYX_ERR(0, 585, __pyx_L1_error)
+      __PYX_ERR(0, 591, __pyx_L1_error)
     }
     (__pyx_v_output_samples[__pyx_v_buffer_pos]) = __Pyx_div_int(__pyx_t_2, SDL_MIX_MAXVOLUME);
 
-    /* "mpfmc/core/audio/track.pyx":586
+    /* "mpfmc/core/audio/track.pyx":592
  * 
  *             output_samples[buffer_pos] = (input_samples[buffer_pos] * volume_right) // SDL_MIX_MAXVOLUME
  *             buffer_pos += 1             # <<<<<<<<<<<<<<
+ * 
+ * 
  */
     __pyx_v_buffer_pos = (__pyx_v_buffer_pos + 1);
   }
 
-  /* "mpfmc/core/audio/track.pyx":556
+  /* "mpfmc/core/audio/track.pyx":562
  * 
  *     @staticmethod
  *     cdef void apply_volume_stereo(Uint8* output_buffer, const Uint8* input_buffer, Uint32 buffer_length,             # <<<<<<<<<<<<<<
@@ -6492,6 +7031,9 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_22__reduce_cython__(
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__reduce_cython__", 0);
 
   /* "(tree fragment)":2
@@ -6547,145 +7089,1166 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_24__setstate_cython_
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__setstate_cython__", 0);
 
-  /* "(tree fragment)":4
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
+  /* "(tree fragment)":4
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__3, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __PYX_ERR(1, 4, __pyx_L1_error)
+
+  /* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("mpfmc.core.audio.track.Track.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "mpfmc/core/audio/track.pyx":598
+ * #    Mixing benchmark
+ * # ---------------------------------------------------------------------------
+ * def benchmark_mix_bus(int track_count, int buffer_samples=2048, int channels=2, int iterations=1000):             # <<<<<<<<<<<<<<
+ *     """
+ *     Measures the mixing path of the audio callback without an audio device.
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_1benchmark_mix_bus(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5mpfmc_4core_5audio_5track_benchmark_mix_bus[] = "benchmark_mix_bus(int track_count, int buffer_samples=2048, int channels=2, int iterations=1000)\n\n    Measures the mixing path of the audio callback without an audio device.\n    Args:\n        track_count: The number of tracks to mix (not limited to the number of tracks\n            supported by the audio interface)\n        buffer_samples: The audio buffer size (in number of samples)\n        channels: The number of channels (1=mono, 2=stereo)\n        iterations: The number of audio buffers to mix\n\n    Returns:\n        The average time (in seconds) spent per audio buffer.\n\n    Notes:\n        Each track mixes one 16-bit source into its track buffer, the track buffer is mixed\n        into the master bus at control rate (as is done for ducking and fades) and the\n        master bus is clipped and written to a 16-bit output buffer.\n    ";
+static PyMethodDef __pyx_mdef_5mpfmc_4core_5audio_5track_1benchmark_mix_bus = {"benchmark_mix_bus", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_5mpfmc_4core_5audio_5track_1benchmark_mix_bus, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5mpfmc_4core_5audio_5track_benchmark_mix_bus};
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_1benchmark_mix_bus(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  int __pyx_v_track_count;
+  int __pyx_v_buffer_samples;
+  int __pyx_v_channels;
+  int __pyx_v_iterations;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("benchmark_mix_bus (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_track_count,&__pyx_n_s_buffer_samples,&__pyx_n_s_channels,&__pyx_n_s_iterations,0};
+    PyObject* values[4] = {0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_track_count)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_buffer_samples);
+          if (value) { values[1] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_channels);
+          if (value) { values[2] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_iterations);
+          if (value) { values[3] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "benchmark_mix_bus") < 0)) __PYX_ERR(0, 598, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_track_count = __Pyx_PyInt_As_int(values[0]); if (unlikely((__pyx_v_track_count == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 598, __pyx_L3_error)
+    if (values[1]) {
+      __pyx_v_buffer_samples = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_buffer_samples == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 598, __pyx_L3_error)
+    } else {
+      __pyx_v_buffer_samples = ((int)0x800);
+    }
+    if (values[2]) {
+      __pyx_v_channels = __Pyx_PyInt_As_int(values[2]); if (unlikely((__pyx_v_channels == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 598, __pyx_L3_error)
+    } else {
+      __pyx_v_channels = ((int)2);
+    }
+    if (values[3]) {
+      __pyx_v_iterations = __Pyx_PyInt_As_int(values[3]); if (unlikely((__pyx_v_iterations == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 598, __pyx_L3_error)
+    } else {
+      __pyx_v_iterations = ((int)0x3E8);
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("benchmark_mix_bus", 0, 1, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 598, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("mpfmc.core.audio.track.benchmark_mix_bus", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_5track_benchmark_mix_bus(__pyx_self, __pyx_v_track_count, __pyx_v_buffer_samples, __pyx_v_channels, __pyx_v_iterations);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_benchmark_mix_bus(CYTHON_UNUSED PyObject *__pyx_self, int __pyx_v_track_count, int __pyx_v_buffer_samples, int __pyx_v_channels, int __pyx_v_iterations) {
+  Uint32 __pyx_v_sample_count;
+  Uint32 __pyx_v_buffer_length;
+  Uint32 __pyx_v_chunk_samples;
+  Sint16 *__pyx_v_source;
+  Uint8 *__pyx_v_output;
+  float *__pyx_v_bus;
+  float *__pyx_v_dither;
+  float *__pyx_v_track_buffers;
+  Uint32 __pyx_v_i;
+  CYTHON_UNUSED int __pyx_v_iteration;
+  int __pyx_v_track_num;
+  int __pyx_v_control_point;
+  PyObject *__pyx_v_start = NULL;
+  PyObject *__pyx_v_duration = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  Uint32 __pyx_t_1;
+  Uint32 __pyx_t_2;
+  Uint32 __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_t_7;
+  int __pyx_t_8;
+  int __pyx_t_9;
+  int __pyx_t_10;
+  int __pyx_t_11;
+  int __pyx_t_12;
+  int __pyx_t_13;
+  int __pyx_t_14;
+  int __pyx_t_15;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("benchmark_mix_bus", 0);
+
+  /* "mpfmc/core/audio/track.pyx":616
+ *         master bus is clipped and written to a 16-bit output buffer.
+ *     """
+ *     cdef Uint32 sample_count = buffer_samples * channels             # <<<<<<<<<<<<<<
+ *     cdef Uint32 buffer_length = sample_count * 2
+ *     cdef Uint32 chunk_samples = sample_count // CONTROL_POINTS_PER_BUFFER
+ */
+  __pyx_v_sample_count = (__pyx_v_buffer_samples * __pyx_v_channels);
+
+  /* "mpfmc/core/audio/track.pyx":617
+ *     """
+ *     cdef Uint32 sample_count = buffer_samples * channels
+ *     cdef Uint32 buffer_length = sample_count * 2             # <<<<<<<<<<<<<<
+ *     cdef Uint32 chunk_samples = sample_count // CONTROL_POINTS_PER_BUFFER
+ *     cdef Sint16 *source = <Sint16*>PyMem_Malloc(buffer_length)
+ */
+  __pyx_v_buffer_length = (__pyx_v_sample_count * 2);
+
+  /* "mpfmc/core/audio/track.pyx":618
+ *     cdef Uint32 sample_count = buffer_samples * channels
+ *     cdef Uint32 buffer_length = sample_count * 2
+ *     cdef Uint32 chunk_samples = sample_count // CONTROL_POINTS_PER_BUFFER             # <<<<<<<<<<<<<<
+ *     cdef Sint16 *source = <Sint16*>PyMem_Malloc(buffer_length)
+ *     cdef Uint8 *output = <Uint8*>PyMem_Malloc(buffer_length)
+ */
+  if (unlikely(__pyx_e_5mpfmc_4core_5audio_5track_CONTROL_POINTS_PER_BUFFER == 0)) {
+    PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
+    __PYX_ERR(0, 618, __pyx_L1_error)
+  }
+  __pyx_v_chunk_samples = (__pyx_v_sample_count / __pyx_e_5mpfmc_4core_5audio_5track_CONTROL_POINTS_PER_BUFFER);
+
+  /* "mpfmc/core/audio/track.pyx":619
+ *     cdef Uint32 buffer_length = sample_count * 2
+ *     cdef Uint32 chunk_samples = sample_count // CONTROL_POINTS_PER_BUFFER
+ *     cdef Sint16 *source = <Sint16*>PyMem_Malloc(buffer_length)             # <<<<<<<<<<<<<<
+ *     cdef Uint8 *output = <Uint8*>PyMem_Malloc(buffer_length)
+ *     cdef float *bus = <float*>PyMem_Malloc(sample_count * sizeof(float))
+ */
+  __pyx_v_source = ((Sint16 *)PyMem_Malloc(__pyx_v_buffer_length));
+
+  /* "mpfmc/core/audio/track.pyx":620
+ *     cdef Uint32 chunk_samples = sample_count // CONTROL_POINTS_PER_BUFFER
+ *     cdef Sint16 *source = <Sint16*>PyMem_Malloc(buffer_length)
+ *     cdef Uint8 *output = <Uint8*>PyMem_Malloc(buffer_length)             # <<<<<<<<<<<<<<
+ *     cdef float *bus = <float*>PyMem_Malloc(sample_count * sizeof(float))
+ *     cdef float *dither = <float*>PyMem_Malloc(sample_count * sizeof(float))
+ */
+  __pyx_v_output = ((Uint8 *)PyMem_Malloc(__pyx_v_buffer_length));
+
+  /* "mpfmc/core/audio/track.pyx":621
+ *     cdef Sint16 *source = <Sint16*>PyMem_Malloc(buffer_length)
+ *     cdef Uint8 *output = <Uint8*>PyMem_Malloc(buffer_length)
+ *     cdef float *bus = <float*>PyMem_Malloc(sample_count * sizeof(float))             # <<<<<<<<<<<<<<
+ *     cdef float *dither = <float*>PyMem_Malloc(sample_count * sizeof(float))
+ *     cdef float *track_buffers = <float*>PyMem_Malloc(track_count * sample_count * sizeof(float))
+ */
+  __pyx_v_bus = ((float *)PyMem_Malloc((__pyx_v_sample_count * (sizeof(float)))));
+
+  /* "mpfmc/core/audio/track.pyx":622
+ *     cdef Uint8 *output = <Uint8*>PyMem_Malloc(buffer_length)
+ *     cdef float *bus = <float*>PyMem_Malloc(sample_count * sizeof(float))
+ *     cdef float *dither = <float*>PyMem_Malloc(sample_count * sizeof(float))             # <<<<<<<<<<<<<<
+ *     cdef float *track_buffers = <float*>PyMem_Malloc(track_count * sample_count * sizeof(float))
+ *     cdef Uint32 i
+ */
+  __pyx_v_dither = ((float *)PyMem_Malloc((__pyx_v_sample_count * (sizeof(float)))));
+
+  /* "mpfmc/core/audio/track.pyx":623
+ *     cdef float *bus = <float*>PyMem_Malloc(sample_count * sizeof(float))
+ *     cdef float *dither = <float*>PyMem_Malloc(sample_count * sizeof(float))
+ *     cdef float *track_buffers = <float*>PyMem_Malloc(track_count * sample_count * sizeof(float))             # <<<<<<<<<<<<<<
+ *     cdef Uint32 i
+ *     cdef int iteration, track_num, control_point
+ */
+  __pyx_v_track_buffers = ((float *)PyMem_Malloc(((__pyx_v_track_count * __pyx_v_sample_count) * (sizeof(float)))));
+
+  /* "mpfmc/core/audio/track.pyx":627
+ *     cdef int iteration, track_num, control_point
+ * 
+ *     for i in range(sample_count):             # <<<<<<<<<<<<<<
+ *         source[i] = <Sint16>(<int>((i * 97) % 16384) - 8192)
+ *         dither[i] = 0.0
+ */
+  __pyx_t_1 = __pyx_v_sample_count;
+  __pyx_t_2 = __pyx_t_1;
+  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_i = __pyx_t_3;
+
+    /* "mpfmc/core/audio/track.pyx":628
+ * 
+ *     for i in range(sample_count):
+ *         source[i] = <Sint16>(<int>((i * 97) % 16384) - 8192)             # <<<<<<<<<<<<<<
+ *         dither[i] = 0.0
+ * 
+ */
+    (__pyx_v_source[__pyx_v_i]) = ((Sint16)(((int)((__pyx_v_i * 97) % 0x4000)) - 0x2000));
+
+    /* "mpfmc/core/audio/track.pyx":629
+ *     for i in range(sample_count):
+ *         source[i] = <Sint16>(<int>((i * 97) % 16384) - 8192)
+ *         dither[i] = 0.0             # <<<<<<<<<<<<<<
+ * 
+ *     start = time.perf_counter()
+ */
+    (__pyx_v_dither[__pyx_v_i]) = 0.0;
+  }
+
+  /* "mpfmc/core/audio/track.pyx":631
+ *         dither[i] = 0.0
+ * 
+ *     start = time.perf_counter()             # <<<<<<<<<<<<<<
+ *     with nogil:
+ *         for iteration in range(iterations):
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_time); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 631, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_perf_counter); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 631, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = NULL;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_6))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_6);
+    if (likely(__pyx_t_5)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_6, function);
+    }
+  }
+  __pyx_t_4 = (__pyx_t_5) ? __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_t_5) : __Pyx_PyObject_CallNoArg(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 631, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_v_start = __pyx_t_4;
+  __pyx_t_4 = 0;
+
+  /* "mpfmc/core/audio/track.pyx":632
+ * 
+ *     start = time.perf_counter()
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for iteration in range(iterations):
+ *             memset(bus, 0, sample_count * sizeof(float))
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      #endif
+      /*try:*/ {
+
+        /* "mpfmc/core/audio/track.pyx":633
+ *     start = time.perf_counter()
+ *     with nogil:
+ *         for iteration in range(iterations):             # <<<<<<<<<<<<<<
+ *             memset(bus, 0, sample_count * sizeof(float))
+ *             for track_num in range(track_count):
+ */
+        __pyx_t_7 = __pyx_v_iterations;
+        __pyx_t_8 = __pyx_t_7;
+        for (__pyx_t_9 = 0; __pyx_t_9 < __pyx_t_8; __pyx_t_9+=1) {
+          __pyx_v_iteration = __pyx_t_9;
+
+          /* "mpfmc/core/audio/track.pyx":634
+ *     with nogil:
+ *         for iteration in range(iterations):
+ *             memset(bus, 0, sample_count * sizeof(float))             # <<<<<<<<<<<<<<
+ *             for track_num in range(track_count):
+ *                 memset(track_buffers + track_num * sample_count, 0, sample_count * sizeof(float))
+ */
+          (void)(memset(__pyx_v_bus, 0, (__pyx_v_sample_count * (sizeof(float)))));
+
+          /* "mpfmc/core/audio/track.pyx":635
+ *         for iteration in range(iterations):
+ *             memset(bus, 0, sample_count * sizeof(float))
+ *             for track_num in range(track_count):             # <<<<<<<<<<<<<<
+ *                 memset(track_buffers + track_num * sample_count, 0, sample_count * sizeof(float))
+ *                 Track.mix_audio(track_buffers + track_num * sample_count, <Uint8*>source, buffer_length, 96)
+ */
+          __pyx_t_10 = __pyx_v_track_count;
+          __pyx_t_11 = __pyx_t_10;
+          for (__pyx_t_12 = 0; __pyx_t_12 < __pyx_t_11; __pyx_t_12+=1) {
+            __pyx_v_track_num = __pyx_t_12;
+
+            /* "mpfmc/core/audio/track.pyx":636
+ *             memset(bus, 0, sample_count * sizeof(float))
+ *             for track_num in range(track_count):
+ *                 memset(track_buffers + track_num * sample_count, 0, sample_count * sizeof(float))             # <<<<<<<<<<<<<<
+ *                 Track.mix_audio(track_buffers + track_num * sample_count, <Uint8*>source, buffer_length, 96)
+ *                 for control_point in range(CONTROL_POINTS_PER_BUFFER):
+ */
+            (void)(memset((__pyx_v_track_buffers + (__pyx_v_track_num * __pyx_v_sample_count)), 0, (__pyx_v_sample_count * (sizeof(float)))));
+
+            /* "mpfmc/core/audio/track.pyx":637
+ *             for track_num in range(track_count):
+ *                 memset(track_buffers + track_num * sample_count, 0, sample_count * sizeof(float))
+ *                 Track.mix_audio(track_buffers + track_num * sample_count, <Uint8*>source, buffer_length, 96)             # <<<<<<<<<<<<<<
+ *                 for control_point in range(CONTROL_POINTS_PER_BUFFER):
+ *                     Track.mix_bus(bus + control_point * chunk_samples,
+ */
+            __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_audio((__pyx_v_track_buffers + (__pyx_v_track_num * __pyx_v_sample_count)), ((Uint8 *)__pyx_v_source), __pyx_v_buffer_length, 96);
+
+            /* "mpfmc/core/audio/track.pyx":638
+ *                 memset(track_buffers + track_num * sample_count, 0, sample_count * sizeof(float))
+ *                 Track.mix_audio(track_buffers + track_num * sample_count, <Uint8*>source, buffer_length, 96)
+ *                 for control_point in range(CONTROL_POINTS_PER_BUFFER):             # <<<<<<<<<<<<<<
+ *                     Track.mix_bus(bus + control_point * chunk_samples,
+ *                                   track_buffers + track_num * sample_count + control_point * chunk_samples,
+ */
+            __pyx_t_13 = __pyx_e_5mpfmc_4core_5audio_5track_CONTROL_POINTS_PER_BUFFER;
+            __pyx_t_14 = __pyx_t_13;
+            for (__pyx_t_15 = 0; __pyx_t_15 < __pyx_t_14; __pyx_t_15+=1) {
+              __pyx_v_control_point = __pyx_t_15;
+
+              /* "mpfmc/core/audio/track.pyx":639
+ *                 Track.mix_audio(track_buffers + track_num * sample_count, <Uint8*>source, buffer_length, 96)
+ *                 for control_point in range(CONTROL_POINTS_PER_BUFFER):
+ *                     Track.mix_bus(bus + control_point * chunk_samples,             # <<<<<<<<<<<<<<
+ *                                   track_buffers + track_num * sample_count + control_point * chunk_samples,
+ *                                   chunk_samples, 0.5)
+ */
+              __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_bus((__pyx_v_bus + (__pyx_v_control_point * __pyx_v_chunk_samples)), ((__pyx_v_track_buffers + (__pyx_v_track_num * __pyx_v_sample_count)) + (__pyx_v_control_point * __pyx_v_chunk_samples)), __pyx_v_chunk_samples, 0.5);
+            }
+          }
+
+          /* "mpfmc/core/audio/track.pyx":642
+ *                                   track_buffers + track_num * sample_count + control_point * chunk_samples,
+ *                                   chunk_samples, 0.5)
+ *             Track.write_bus_to_output(output, bus, dither, sample_count, 1.0)             # <<<<<<<<<<<<<<
+ *     duration = time.perf_counter() - start
+ * 
+ */
+          __pyx_f_5mpfmc_4core_5audio_5track_5Track_write_bus_to_output(__pyx_v_output, __pyx_v_bus, __pyx_v_dither, __pyx_v_sample_count, 1.0);
+        }
+      }
+
+      /* "mpfmc/core/audio/track.pyx":632
+ * 
+ *     start = time.perf_counter()
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for iteration in range(iterations):
+ *             memset(bus, 0, sample_count * sizeof(float))
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L7;
+        }
+        __pyx_L7:;
+      }
+  }
+
+  /* "mpfmc/core/audio/track.pyx":643
+ *                                   chunk_samples, 0.5)
+ *             Track.write_bus_to_output(output, bus, dither, sample_count, 1.0)
+ *     duration = time.perf_counter() - start             # <<<<<<<<<<<<<<
+ * 
+ *     PyMem_Free(source)
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_time); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 643, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_perf_counter); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 643, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_6 = NULL;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_5))) {
+    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_5);
+    if (likely(__pyx_t_6)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+      __Pyx_INCREF(__pyx_t_6);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_5, function);
+    }
+  }
+  __pyx_t_4 = (__pyx_t_6) ? __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_6) : __Pyx_PyObject_CallNoArg(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 643, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = PyNumber_Subtract(__pyx_t_4, __pyx_v_start); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 643, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_v_duration = __pyx_t_5;
+  __pyx_t_5 = 0;
+
+  /* "mpfmc/core/audio/track.pyx":645
+ *     duration = time.perf_counter() - start
+ * 
+ *     PyMem_Free(source)             # <<<<<<<<<<<<<<
+ *     PyMem_Free(output)
+ *     PyMem_Free(bus)
+ */
+  PyMem_Free(__pyx_v_source);
+
+  /* "mpfmc/core/audio/track.pyx":646
+ * 
+ *     PyMem_Free(source)
+ *     PyMem_Free(output)             # <<<<<<<<<<<<<<
+ *     PyMem_Free(bus)
+ *     PyMem_Free(dither)
+ */
+  PyMem_Free(__pyx_v_output);
+
+  /* "mpfmc/core/audio/track.pyx":647
+ *     PyMem_Free(source)
+ *     PyMem_Free(output)
+ *     PyMem_Free(bus)             # <<<<<<<<<<<<<<
+ *     PyMem_Free(dither)
+ *     PyMem_Free(track_buffers)
+ */
+  PyMem_Free(__pyx_v_bus);
+
+  /* "mpfmc/core/audio/track.pyx":648
+ *     PyMem_Free(output)
+ *     PyMem_Free(bus)
+ *     PyMem_Free(dither)             # <<<<<<<<<<<<<<
+ *     PyMem_Free(track_buffers)
+ * 
+ */
+  PyMem_Free(__pyx_v_dither);
+
+  /* "mpfmc/core/audio/track.pyx":649
+ *     PyMem_Free(bus)
+ *     PyMem_Free(dither)
+ *     PyMem_Free(track_buffers)             # <<<<<<<<<<<<<<
+ * 
+ *     return duration / iterations
+ */
+  PyMem_Free(__pyx_v_track_buffers);
+
+  /* "mpfmc/core/audio/track.pyx":651
+ *     PyMem_Free(track_buffers)
+ * 
+ *     return duration / iterations             # <<<<<<<<<<<<<<
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_v_iterations); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 651, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_4 = __Pyx_PyNumber_Divide(__pyx_v_duration, __pyx_t_5); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 651, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_r = __pyx_t_4;
+  __pyx_t_4 = 0;
+  goto __pyx_L0;
+
+  /* "mpfmc/core/audio/track.pyx":598
+ * #    Mixing benchmark
+ * # ---------------------------------------------------------------------------
+ * def benchmark_mix_bus(int track_count, int buffer_samples=2048, int channels=2, int iterations=1000):             # <<<<<<<<<<<<<<
+ *     """
+ *     Measures the mixing path of the audio callback without an audio device.
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("mpfmc.core.audio.track.benchmark_mix_bus", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_start);
+  __Pyx_XDECREF(__pyx_v_duration);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "mpfmc/core/audio/inline.pxd":7
+ * # ---------------------------------------------------------------------------
+ * 
+ * cdef inline Uint8 lerpU8(float progress, Uint8 a, Uint8 b) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Linearly interpolate between 2 8-bit values.
+ */
+
+static CYTHON_INLINE Uint8 __pyx_f_5mpfmc_4core_5audio_6inline_lerpU8(float __pyx_v_progress, Uint8 __pyx_v_a, Uint8 __pyx_v_b) {
+  Uint8 __pyx_r;
+
+  /* "mpfmc/core/audio/inline.pxd":18
+ *         New 8-bit value between the supplied values
+ *     """
+ *     return <Uint8> ((1.0 - progress) * a + progress * b)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline float in_out_quad(float progress) nogil:
+ */
+  __pyx_r = ((Uint8)(((1.0 - __pyx_v_progress) * __pyx_v_a) + (__pyx_v_progress * __pyx_v_b)));
+  goto __pyx_L0;
+
+  /* "mpfmc/core/audio/inline.pxd":7
+ * # ---------------------------------------------------------------------------
+ * 
+ * cdef inline Uint8 lerpU8(float progress, Uint8 a, Uint8 b) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Linearly interpolate between 2 8-bit values.
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "mpfmc/core/audio/inline.pxd":20
+ *     return <Uint8> ((1.0 - progress) * a + progress * b)
+ * 
+ * cdef inline float in_out_quad(float progress) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     A quadratic easing function used for smoother audio fading
+ */
+
+static CYTHON_INLINE float __pyx_f_5mpfmc_4core_5audio_6inline_in_out_quad(float __pyx_v_progress) {
+  float __pyx_v_p;
+  float __pyx_r;
+  int __pyx_t_1;
+
+  /* "mpfmc/core/audio/inline.pxd":30
+ *     """
+ *     cdef float p
+ *     p = progress * 2             # <<<<<<<<<<<<<<
+ *     if p < 1:
+ *         return 0.5 * p * p
+ */
+  __pyx_v_p = (__pyx_v_progress * 2.0);
+
+  /* "mpfmc/core/audio/inline.pxd":31
+ *     cdef float p
+ *     p = progress * 2
+ *     if p < 1:             # <<<<<<<<<<<<<<
+ *         return 0.5 * p * p
+ *     p -= 1.0
+ */
+  __pyx_t_1 = ((__pyx_v_p < 1.0) != 0);
+  if (__pyx_t_1) {
+
+    /* "mpfmc/core/audio/inline.pxd":32
+ *     p = progress * 2
+ *     if p < 1:
+ *         return 0.5 * p * p             # <<<<<<<<<<<<<<
+ *     p -= 1.0
+ *     return -0.5 * (p * (p - 2.0) - 1.0)
+ */
+    __pyx_r = ((0.5 * __pyx_v_p) * __pyx_v_p);
+    goto __pyx_L0;
+
+    /* "mpfmc/core/audio/inline.pxd":31
+ *     cdef float p
+ *     p = progress * 2
+ *     if p < 1:             # <<<<<<<<<<<<<<
+ *         return 0.5 * p * p
+ *     p -= 1.0
+ */
+  }
+
+  /* "mpfmc/core/audio/inline.pxd":33
+ *     if p < 1:
+ *         return 0.5 * p * p
+ *     p -= 1.0             # <<<<<<<<<<<<<<
+ *     return -0.5 * (p * (p - 2.0) - 1.0)
+ * 
+ */
+  __pyx_v_p = (__pyx_v_p - 1.0);
+
+  /* "mpfmc/core/audio/inline.pxd":34
+ *         return 0.5 * p * p
+ *     p -= 1.0
+ *     return -0.5 * (p * (p - 2.0) - 1.0)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = (-0.5 * ((__pyx_v_p * (__pyx_v_p - 2.0)) - 1.0));
+  goto __pyx_L0;
+
+  /* "mpfmc/core/audio/inline.pxd":20
+ *     return <Uint8> ((1.0 - progress) * a + progress * b)
+ * 
+ * cdef inline float in_out_quad(float progress) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     A quadratic easing function used for smoother audio fading
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "mpfmc/core/audio/inline.pxd":37
+ * 
+ * 
+ * cdef inline Uint32 bytes_to_bus_samples(Uint32 byte_count) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Converts a position/length in 16-bit output buffer bytes to a position/length
+ */
+
+static CYTHON_INLINE Uint32 __pyx_f_5mpfmc_4core_5audio_6inline_bytes_to_bus_samples(Uint32 __pyx_v_byte_count) {
+  Uint32 __pyx_r;
+
+  /* "mpfmc/core/audio/inline.pxd":48
+ *         buffer positions can continue to be tracked in output buffer bytes.
+ *     """
+ *     return byte_count >> 1             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline Uint32 xorshift32(Uint32 state) nogil:
+ */
+  __pyx_r = (__pyx_v_byte_count >> 1);
+  goto __pyx_L0;
+
+  /* "mpfmc/core/audio/inline.pxd":37
+ * 
+ * 
+ * cdef inline Uint32 bytes_to_bus_samples(Uint32 byte_count) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Converts a position/length in 16-bit output buffer bytes to a position/length
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "mpfmc/core/audio/inline.pxd":50
+ *     return byte_count >> 1
+ * 
+ * cdef inline Uint32 xorshift32(Uint32 state) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Advances a xorshift pseudo random number generator (used to generate dither noise
+ */
+
+static CYTHON_INLINE Uint32 __pyx_f_5mpfmc_4core_5audio_6inline_xorshift32(Uint32 __pyx_v_state) {
+  Uint32 __pyx_r;
+
+  /* "mpfmc/core/audio/inline.pxd":60
+ *         The next generator state/random value
+ *     """
+ *     state ^= state << 13             # <<<<<<<<<<<<<<
+ *     state ^= state >> 17
+ *     state ^= state << 5
+ */
+  __pyx_v_state = (__pyx_v_state ^ (__pyx_v_state << 13));
+
+  /* "mpfmc/core/audio/inline.pxd":61
+ *     """
+ *     state ^= state << 13
+ *     state ^= state >> 17             # <<<<<<<<<<<<<<
+ *     state ^= state << 5
+ *     return state
+ */
+  __pyx_v_state = (__pyx_v_state ^ (__pyx_v_state >> 17));
+
+  /* "mpfmc/core/audio/inline.pxd":62
+ *     state ^= state << 13
+ *     state ^= state >> 17
+ *     state ^= state << 5             # <<<<<<<<<<<<<<
+ *     return state
+ * 
+ */
+  __pyx_v_state = (__pyx_v_state ^ (__pyx_v_state << 5));
+
+  /* "mpfmc/core/audio/inline.pxd":63
+ *     state ^= state >> 17
+ *     state ^= state << 5
+ *     return state             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline int lowest_set_bit_index(Uint32 mask) nogil:
+ */
+  __pyx_r = __pyx_v_state;
+  goto __pyx_L0;
+
+  /* "mpfmc/core/audio/inline.pxd":50
+ *     return byte_count >> 1
+ * 
+ * cdef inline Uint32 xorshift32(Uint32 state) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Advances a xorshift pseudo random number generator (used to generate dither noise
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "mpfmc/core/audio/inline.pxd":65
+ *     return state
+ * 
+ * cdef inline int lowest_set_bit_index(Uint32 mask) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Returns the index of the lowest bit set in a bit mask.
+ */
+
+static CYTHON_INLINE int __pyx_f_5mpfmc_4core_5audio_6inline_lowest_set_bit_index(Uint32 __pyx_v_mask) {
+  int __pyx_r;
+
+  /* "mpfmc/core/audio/inline.pxd":74
+ *         The zero-based index of the lowest set bit (-1 if no bit is set)
+ *     """
+ *     return SDL_MostSignificantBitIndex32(mask & (~mask + 1))             # <<<<<<<<<<<<<<
+ */
+  __pyx_r = SDL_MostSignificantBitIndex32((__pyx_v_mask & ((~__pyx_v_mask) + 1)));
+  goto __pyx_L0;
+
+  /* "mpfmc/core/audio/inline.pxd":65
+ *     return state
+ * 
+ * cdef inline int lowest_set_bit_index(Uint32 mask) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Returns the index of the lowest bit set in a bit mask.
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "mpfmc/core/audio/notification_message.pxd":72
+ * # ---------------------------------------------------------------------------
+ * 
+ * cdef inline NotificationMessageQueue *create_notification_message_queue() nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Creates a new (empty) notification message queue.
+ */
+
+static CYTHON_INLINE __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageQueue *__pyx_f_5mpfmc_4core_5audio_20notification_message_create_notification_message_queue(void) {
+  __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageQueue *__pyx_r;
+
+  /* "mpfmc/core/audio/notification_message.pxd":77
+ *     :return: A pointer to the new notification message queue.
+ *     """
+ *     return <NotificationMessageQueue*>g_slice_alloc0(sizeof(NotificationMessageQueue))             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void free_notification_message_queue(NotificationMessageQueue *queue) nogil:
+ */
+  __pyx_r = ((__pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageQueue *)g_slice_alloc0((sizeof(__pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageQueue))));
+  goto __pyx_L0;
+
+  /* "mpfmc/core/audio/notification_message.pxd":72
+ * # ---------------------------------------------------------------------------
+ * 
+ * cdef inline NotificationMessageQueue *create_notification_message_queue() nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Creates a new (empty) notification message queue.
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "mpfmc/core/audio/notification_message.pxd":79
+ *     return <NotificationMessageQueue*>g_slice_alloc0(sizeof(NotificationMessageQueue))
+ * 
+ * cdef inline void free_notification_message_queue(NotificationMessageQueue *queue) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Frees a notification message queue.
+ */
+
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_free_notification_message_queue(__pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageQueue *__pyx_v_queue) {
+  int __pyx_t_1;
+
+  /* "mpfmc/core/audio/notification_message.pxd":85
+ *         queue: The notification message queue to free
+ *     """
+ *     if queue != NULL:             # <<<<<<<<<<<<<<
+ *         g_slice_free1(sizeof(NotificationMessageQueue), queue)
+ * 
+ */
+  __pyx_t_1 = ((__pyx_v_queue != NULL) != 0);
+  if (__pyx_t_1) {
+
+    /* "mpfmc/core/audio/notification_message.pxd":86
+ *     """
+ *     if queue != NULL:
+ *         g_slice_free1(sizeof(NotificationMessageQueue), queue)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline NotificationMessageContainer *_create_notification_message(TrackState *track) nogil:
+ */
+    g_slice_free1((sizeof(__pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageQueue)), __pyx_v_queue);
+
+    /* "mpfmc/core/audio/notification_message.pxd":85
+ *         queue: The notification message queue to free
+ *     """
+ *     if queue != NULL:             # <<<<<<<<<<<<<<
+ *         g_slice_free1(sizeof(NotificationMessageQueue), queue)
+ * 
+ */
+  }
+
+  /* "mpfmc/core/audio/notification_message.pxd":79
+ *     return <NotificationMessageQueue*>g_slice_alloc0(sizeof(NotificationMessageQueue))
+ * 
+ * cdef inline void free_notification_message_queue(NotificationMessageQueue *queue) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Frees a notification message queue.
+ */
+
+  /* function exit code */
+}
+
+/* "mpfmc/core/audio/notification_message.pxd":88
+ *         g_slice_free1(sizeof(NotificationMessageQueue), queue)
+ * 
+ * cdef inline NotificationMessageContainer *_create_notification_message(TrackState *track) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Reserves the next free message in the track notification message queue.  The message is not
+ */
+
+static CYTHON_INLINE __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message(__pyx_t_5mpfmc_4core_5audio_5track_TrackState *__pyx_v_track) {
+  __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageQueue *__pyx_v_queue;
+  int __pyx_v_write_index;
+  __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_r;
+  int __pyx_t_1;
+
+  /* "mpfmc/core/audio/notification_message.pxd":95
+ *         case the message is counted as dropped).
+ *     """
+ *     cdef NotificationMessageQueue *queue = <NotificationMessageQueue*>track.notification_messages             # <<<<<<<<<<<<<<
+ *     cdef int write_index
+ * 
+ */
+  __pyx_v_queue = ((__pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageQueue *)__pyx_v_track->notification_messages);
+
+  /* "mpfmc/core/audio/notification_message.pxd":98
+ *     cdef int write_index
+ * 
+ *     if queue == NULL:             # <<<<<<<<<<<<<<
+ *         return NULL
+ * 
+ */
+  __pyx_t_1 = ((__pyx_v_queue == NULL) != 0);
+  if (__pyx_t_1) {
+
+    /* "mpfmc/core/audio/notification_message.pxd":99
+ * 
+ *     if queue == NULL:
+ *         return NULL             # <<<<<<<<<<<<<<
+ * 
+ *     write_index = SDL_AtomicGet(&queue.write_index)
+ */
+    __pyx_r = NULL;
+    goto __pyx_L0;
+
+    /* "mpfmc/core/audio/notification_message.pxd":98
+ *     cdef int write_index
+ * 
+ *     if queue == NULL:             # <<<<<<<<<<<<<<
+ *         return NULL
+ * 
+ */
+  }
+
+  /* "mpfmc/core/audio/notification_message.pxd":101
+ *         return NULL
+ * 
+ *     write_index = SDL_AtomicGet(&queue.write_index)             # <<<<<<<<<<<<<<
+ *     if ((write_index + 1) & (NOTIFICATION_MESSAGE_QUEUE_SIZE - 1)) == SDL_AtomicGet(&queue.read_index):
+ *         SDL_AtomicAdd(&queue.dropped, 1)
+ */
+  __pyx_v_write_index = SDL_AtomicGet((&__pyx_v_queue->write_index));
+
+  /* "mpfmc/core/audio/notification_message.pxd":102
+ * 
+ *     write_index = SDL_AtomicGet(&queue.write_index)
+ *     if ((write_index + 1) & (NOTIFICATION_MESSAGE_QUEUE_SIZE - 1)) == SDL_AtomicGet(&queue.read_index):             # <<<<<<<<<<<<<<
+ *         SDL_AtomicAdd(&queue.dropped, 1)
+ *         return NULL
+ */
+  __pyx_t_1 = ((((__pyx_v_write_index + 1) & (__pyx_e_5mpfmc_4core_5audio_20notification_message_NOTIFICATION_MESSAGE_QUEUE_SIZE - 1)) == SDL_AtomicGet((&__pyx_v_queue->read_index))) != 0);
+  if (__pyx_t_1) {
+
+    /* "mpfmc/core/audio/notification_message.pxd":103
+ *     write_index = SDL_AtomicGet(&queue.write_index)
+ *     if ((write_index + 1) & (NOTIFICATION_MESSAGE_QUEUE_SIZE - 1)) == SDL_AtomicGet(&queue.read_index):
+ *         SDL_AtomicAdd(&queue.dropped, 1)             # <<<<<<<<<<<<<<
+ *         return NULL
+ * 
+ */
+    (void)(SDL_AtomicAdd((&__pyx_v_queue->dropped), 1));
+
+    /* "mpfmc/core/audio/notification_message.pxd":104
+ *     if ((write_index + 1) & (NOTIFICATION_MESSAGE_QUEUE_SIZE - 1)) == SDL_AtomicGet(&queue.read_index):
+ *         SDL_AtomicAdd(&queue.dropped, 1)
+ *         return NULL             # <<<<<<<<<<<<<<
+ * 
+ *     memset(&queue.messages[write_index], 0, sizeof(NotificationMessageContainer))
+ */
+    __pyx_r = NULL;
+    goto __pyx_L0;
+
+    /* "mpfmc/core/audio/notification_message.pxd":102
+ * 
+ *     write_index = SDL_AtomicGet(&queue.write_index)
+ *     if ((write_index + 1) & (NOTIFICATION_MESSAGE_QUEUE_SIZE - 1)) == SDL_AtomicGet(&queue.read_index):             # <<<<<<<<<<<<<<
+ *         SDL_AtomicAdd(&queue.dropped, 1)
+ *         return NULL
+ */
+  }
+
+  /* "mpfmc/core/audio/notification_message.pxd":106
+ *         return NULL
+ * 
+ *     memset(&queue.messages[write_index], 0, sizeof(NotificationMessageContainer))             # <<<<<<<<<<<<<<
+ *     return &queue.messages[write_index]
+ * 
+ */
+  (void)(memset((&(__pyx_v_queue->messages[__pyx_v_write_index])), 0, (sizeof(__pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer))));
+
+  /* "mpfmc/core/audio/notification_message.pxd":107
+ * 
+ *     memset(&queue.messages[write_index], 0, sizeof(NotificationMessageContainer))
+ *     return &queue.messages[write_index]             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void _send_notification_message(TrackState *track) nogil:
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__3, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __PYX_ERR(1, 4, __pyx_L1_error)
+  __pyx_r = (&(__pyx_v_queue->messages[__pyx_v_write_index]));
+  goto __pyx_L0;
 
-  /* "(tree fragment)":3
- * def __reduce_cython__(self):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+  /* "mpfmc/core/audio/notification_message.pxd":88
+ *         g_slice_free1(sizeof(NotificationMessageQueue), queue)
+ * 
+ * cdef inline NotificationMessageContainer *_create_notification_message(TrackState *track) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Reserves the next free message in the track notification message queue.  The message is not
  */
 
   /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("mpfmc.core.audio.track.Track.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
+  __pyx_L0:;
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/inline.pxd":7
- * # ---------------------------------------------------------------------------
+/* "mpfmc/core/audio/notification_message.pxd":109
+ *     return &queue.messages[write_index]
  * 
- * cdef inline Uint8 lerpU8(float progress, Uint8 a, Uint8 b) nogil:             # <<<<<<<<<<<<<<
+ * cdef inline void _send_notification_message(TrackState *track) nogil:             # <<<<<<<<<<<<<<
  *     """
- *     Linearly interpolate between 2 8-bit values.
+ *     Publishes the message reserved by _create_notification_message to the main thread.
  */
 
-static CYTHON_INLINE Uint8 __pyx_f_5mpfmc_4core_5audio_6inline_lerpU8(float __pyx_v_progress, Uint8 __pyx_v_a, Uint8 __pyx_v_b) {
-  Uint8 __pyx_r;
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message__send_notification_message(__pyx_t_5mpfmc_4core_5audio_5track_TrackState *__pyx_v_track) {
+  __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageQueue *__pyx_v_queue;
 
-  /* "mpfmc/core/audio/inline.pxd":18
- *         New 8-bit value between the supplied values
+  /* "mpfmc/core/audio/notification_message.pxd":115
+ *         track: The TrackState pointer
  *     """
- *     return <Uint8> ((1.0 - progress) * a + progress * b)             # <<<<<<<<<<<<<<
+ *     cdef NotificationMessageQueue *queue = <NotificationMessageQueue*>track.notification_messages             # <<<<<<<<<<<<<<
+ *     SDL_AtomicSet(&queue.write_index,
+ *                   (SDL_AtomicGet(&queue.write_index) + 1) & (NOTIFICATION_MESSAGE_QUEUE_SIZE - 1))
+ */
+  __pyx_v_queue = ((__pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageQueue *)__pyx_v_track->notification_messages);
+
+  /* "mpfmc/core/audio/notification_message.pxd":116
+ *     """
+ *     cdef NotificationMessageQueue *queue = <NotificationMessageQueue*>track.notification_messages
+ *     SDL_AtomicSet(&queue.write_index,             # <<<<<<<<<<<<<<
+ *                   (SDL_AtomicGet(&queue.write_index) + 1) & (NOTIFICATION_MESSAGE_QUEUE_SIZE - 1))
  * 
- * cdef inline float in_out_quad(float progress) nogil:
  */
-  __pyx_r = ((Uint8)(((1.0 - __pyx_v_progress) * __pyx_v_a) + (__pyx_v_progress * __pyx_v_b)));
-  goto __pyx_L0;
+  (void)(SDL_AtomicSet((&__pyx_v_queue->write_index), ((SDL_AtomicGet((&__pyx_v_queue->write_index)) + 1) & (__pyx_e_5mpfmc_4core_5audio_20notification_message_NOTIFICATION_MESSAGE_QUEUE_SIZE - 1))));
 
-  /* "mpfmc/core/audio/inline.pxd":7
- * # ---------------------------------------------------------------------------
+  /* "mpfmc/core/audio/notification_message.pxd":109
+ *     return &queue.messages[write_index]
  * 
- * cdef inline Uint8 lerpU8(float progress, Uint8 a, Uint8 b) nogil:             # <<<<<<<<<<<<<<
+ * cdef inline void _send_notification_message(TrackState *track) nogil:             # <<<<<<<<<<<<<<
  *     """
- *     Linearly interpolate between 2 8-bit values.
+ *     Publishes the message reserved by _create_notification_message to the main thread.
  */
 
   /* function exit code */
-  __pyx_L0:;
-  return __pyx_r;
 }
 
-/* "mpfmc/core/audio/inline.pxd":20
- *     return <Uint8> ((1.0 - progress) * a + progress * b)
+/* "mpfmc/core/audio/notification_message.pxd":119
+ *                   (SDL_AtomicGet(&queue.write_index) + 1) & (NOTIFICATION_MESSAGE_QUEUE_SIZE - 1))
  * 
- * cdef inline float in_out_quad(float progress) nogil:             # <<<<<<<<<<<<<<
+ * cdef inline NotificationMessageContainer *get_next_notification_message(TrackState *track) nogil:             # <<<<<<<<<<<<<<
  *     """
- *     A quadratic easing function used for smoother audio fading
+ *     Returns the oldest unprocessed notification message of a track (main thread only).
  */
 
-static CYTHON_INLINE float __pyx_f_5mpfmc_4core_5audio_6inline_in_out_quad(float __pyx_v_progress) {
-  float __pyx_v_p;
-  float __pyx_r;
+static CYTHON_INLINE __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_f_5mpfmc_4core_5audio_20notification_message_get_next_notification_message(__pyx_t_5mpfmc_4core_5audio_5track_TrackState *__pyx_v_track) {
+  __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageQueue *__pyx_v_queue;
+  int __pyx_v_read_index;
+  __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_r;
   int __pyx_t_1;
 
-  /* "mpfmc/core/audio/inline.pxd":30
+  /* "mpfmc/core/audio/notification_message.pxd":129
+ *         be released with release_notification_message once it has been processed.
  *     """
- *     cdef float p
- *     p = progress * 2             # <<<<<<<<<<<<<<
- *     if p < 1:
- *         return 0.5 * p * p
+ *     cdef NotificationMessageQueue *queue = <NotificationMessageQueue*>track.notification_messages             # <<<<<<<<<<<<<<
+ *     cdef int read_index
+ * 
  */
-  __pyx_v_p = (__pyx_v_progress * 2.0);
+  __pyx_v_queue = ((__pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageQueue *)__pyx_v_track->notification_messages);
 
-  /* "mpfmc/core/audio/inline.pxd":31
- *     cdef float p
- *     p = progress * 2
- *     if p < 1:             # <<<<<<<<<<<<<<
- *         return 0.5 * p * p
- *     p -= 1.0
+  /* "mpfmc/core/audio/notification_message.pxd":132
+ *     cdef int read_index
+ * 
+ *     if queue == NULL:             # <<<<<<<<<<<<<<
+ *         return NULL
+ * 
  */
-  __pyx_t_1 = ((__pyx_v_p < 1.0) != 0);
+  __pyx_t_1 = ((__pyx_v_queue == NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/inline.pxd":32
- *     p = progress * 2
- *     if p < 1:
- *         return 0.5 * p * p             # <<<<<<<<<<<<<<
- *     p -= 1.0
- *     return -0.5 * (p * (p - 2.0) - 1.0)
+    /* "mpfmc/core/audio/notification_message.pxd":133
+ * 
+ *     if queue == NULL:
+ *         return NULL             # <<<<<<<<<<<<<<
+ * 
+ *     read_index = SDL_AtomicGet(&queue.read_index)
  */
-    __pyx_r = ((0.5 * __pyx_v_p) * __pyx_v_p);
+    __pyx_r = NULL;
     goto __pyx_L0;
 
-    /* "mpfmc/core/audio/inline.pxd":31
- *     cdef float p
- *     p = progress * 2
- *     if p < 1:             # <<<<<<<<<<<<<<
- *         return 0.5 * p * p
- *     p -= 1.0
+    /* "mpfmc/core/audio/notification_message.pxd":132
+ *     cdef int read_index
+ * 
+ *     if queue == NULL:             # <<<<<<<<<<<<<<
+ *         return NULL
+ * 
  */
   }
 
-  /* "mpfmc/core/audio/inline.pxd":33
- *     if p < 1:
- *         return 0.5 * p * p
- *     p -= 1.0             # <<<<<<<<<<<<<<
- *     return -0.5 * (p * (p - 2.0) - 1.0)
+  /* "mpfmc/core/audio/notification_message.pxd":135
+ *         return NULL
  * 
+ *     read_index = SDL_AtomicGet(&queue.read_index)             # <<<<<<<<<<<<<<
+ *     if read_index == SDL_AtomicGet(&queue.write_index):
+ *         return NULL
  */
-  __pyx_v_p = (__pyx_v_p - 1.0);
+  __pyx_v_read_index = SDL_AtomicGet((&__pyx_v_queue->read_index));
 
-  /* "mpfmc/core/audio/inline.pxd":34
- *         return 0.5 * p * p
- *     p -= 1.0
- *     return -0.5 * (p * (p - 2.0) - 1.0)             # <<<<<<<<<<<<<<
+  /* "mpfmc/core/audio/notification_message.pxd":136
+ * 
+ *     read_index = SDL_AtomicGet(&queue.read_index)
+ *     if read_index == SDL_AtomicGet(&queue.write_index):             # <<<<<<<<<<<<<<
+ *         return NULL
  * 
  */
-  __pyx_r = (-0.5 * ((__pyx_v_p * (__pyx_v_p - 2.0)) - 1.0));
+  __pyx_t_1 = ((__pyx_v_read_index == SDL_AtomicGet((&__pyx_v_queue->write_index))) != 0);
+  if (__pyx_t_1) {
+
+    /* "mpfmc/core/audio/notification_message.pxd":137
+ *     read_index = SDL_AtomicGet(&queue.read_index)
+ *     if read_index == SDL_AtomicGet(&queue.write_index):
+ *         return NULL             # <<<<<<<<<<<<<<
+ * 
+ *     return &queue.messages[read_index]
+ */
+    __pyx_r = NULL;
+    goto __pyx_L0;
+
+    /* "mpfmc/core/audio/notification_message.pxd":136
+ * 
+ *     read_index = SDL_AtomicGet(&queue.read_index)
+ *     if read_index == SDL_AtomicGet(&queue.write_index):             # <<<<<<<<<<<<<<
+ *         return NULL
+ * 
+ */
+  }
+
+  /* "mpfmc/core/audio/notification_message.pxd":139
+ *         return NULL
+ * 
+ *     return &queue.messages[read_index]             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void release_notification_message(TrackState *track) nogil:
+ */
+  __pyx_r = (&(__pyx_v_queue->messages[__pyx_v_read_index]));
   goto __pyx_L0;
 
-  /* "mpfmc/core/audio/inline.pxd":20
- *     return <Uint8> ((1.0 - progress) * a + progress * b)
+  /* "mpfmc/core/audio/notification_message.pxd":119
+ *                   (SDL_AtomicGet(&queue.write_index) + 1) & (NOTIFICATION_MESSAGE_QUEUE_SIZE - 1))
  * 
- * cdef inline float in_out_quad(float progress) nogil:             # <<<<<<<<<<<<<<
+ * cdef inline NotificationMessageContainer *get_next_notification_message(TrackState *track) nogil:             # <<<<<<<<<<<<<<
  *     """
- *     A quadratic easing function used for smoother audio fading
+ *     Returns the oldest unprocessed notification message of a track (main thread only).
  */
 
   /* function exit code */
@@ -6693,42 +8256,48 @@ static CYTHON_INLINE float __pyx_f_5mpfmc_4core_5audio_6inline_in_out_quad(float
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/notification_message.pxd":52
- * # ---------------------------------------------------------------------------
+/* "mpfmc/core/audio/notification_message.pxd":141
+ *     return &queue.messages[read_index]
  * 
- * cdef inline NotificationMessageContainer *_create_notification_message() nogil:             # <<<<<<<<<<<<<<
+ * cdef inline void release_notification_message(TrackState *track) nogil:             # <<<<<<<<<<<<<<
  *     """
- *     Creates a new notification message.
+ *     Releases the message returned by get_next_notification_message so its slot can be reused.
  */
 
-static CYTHON_INLINE __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message(void) {
-  __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_r;
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_release_notification_message(__pyx_t_5mpfmc_4core_5audio_5track_TrackState *__pyx_v_track) {
+  __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageQueue *__pyx_v_queue;
+
+  /* "mpfmc/core/audio/notification_message.pxd":147
+ *         track: The TrackState pointer
+ *     """
+ *     cdef NotificationMessageQueue *queue = <NotificationMessageQueue*>track.notification_messages             # <<<<<<<<<<<<<<
+ *     SDL_AtomicSet(&queue.read_index,
+ *                   (SDL_AtomicGet(&queue.read_index) + 1) & (NOTIFICATION_MESSAGE_QUEUE_SIZE - 1))
+ */
+  __pyx_v_queue = ((__pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageQueue *)__pyx_v_track->notification_messages);
 
-  /* "mpfmc/core/audio/notification_message.pxd":57
- *     :return: A pointer to the new notification message.
+  /* "mpfmc/core/audio/notification_message.pxd":148
  *     """
- *     return <NotificationMessageContainer*>g_slice_alloc0(sizeof(NotificationMessageContainer))             # <<<<<<<<<<<<<<
+ *     cdef NotificationMessageQueue *queue = <NotificationMessageQueue*>track.notification_messages
+ *     SDL_AtomicSet(&queue.read_index,             # <<<<<<<<<<<<<<
+ *                   (SDL_AtomicGet(&queue.read_index) + 1) & (NOTIFICATION_MESSAGE_QUEUE_SIZE - 1))
  * 
- * cdef inline void send_sound_started_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,
  */
-  __pyx_r = ((__pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *)g_slice_alloc0((sizeof(__pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer))));
-  goto __pyx_L0;
+  (void)(SDL_AtomicSet((&__pyx_v_queue->read_index), ((SDL_AtomicGet((&__pyx_v_queue->read_index)) + 1) & (__pyx_e_5mpfmc_4core_5audio_20notification_message_NOTIFICATION_MESSAGE_QUEUE_SIZE - 1))));
 
-  /* "mpfmc/core/audio/notification_message.pxd":52
- * # ---------------------------------------------------------------------------
+  /* "mpfmc/core/audio/notification_message.pxd":141
+ *     return &queue.messages[read_index]
  * 
- * cdef inline NotificationMessageContainer *_create_notification_message() nogil:             # <<<<<<<<<<<<<<
+ * cdef inline void release_notification_message(TrackState *track) nogil:             # <<<<<<<<<<<<<<
  *     """
- *     Creates a new notification message.
+ *     Releases the message returned by get_next_notification_message so its slot can be reused.
  */
 
   /* function exit code */
-  __pyx_L0:;
-  return __pyx_r;
 }
 
-/* "mpfmc/core/audio/notification_message.pxd":59
- *     return <NotificationMessageContainer*>g_slice_alloc0(sizeof(NotificationMessageContainer))
+/* "mpfmc/core/audio/notification_message.pxd":151
+ *                   (SDL_AtomicGet(&queue.read_index) + 1) & (NOTIFICATION_MESSAGE_QUEUE_SIZE - 1))
  * 
  * cdef inline void send_sound_started_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,             # <<<<<<<<<<<<<<
  *                                                  TrackState *track) nogil:
@@ -6739,18 +8308,18 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
   __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_v_notification_message;
   int __pyx_t_1;
 
-  /* "mpfmc/core/audio/notification_message.pxd":69
+  /* "mpfmc/core/audio/notification_message.pxd":161
  *         track: The TrackState pointer
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()             # <<<<<<<<<<<<<<
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)             # <<<<<<<<<<<<<<
  *     if notification_message != NULL:
  *         notification_message.message = notification_sound_started
  */
-  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message();
+  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message(__pyx_v_track);
 
-  /* "mpfmc/core/audio/notification_message.pxd":70
+  /* "mpfmc/core/audio/notification_message.pxd":162
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:             # <<<<<<<<<<<<<<
  *         notification_message.message = notification_sound_started
  *         notification_message.player = player
@@ -6758,8 +8327,8 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
   __pyx_t_1 = ((__pyx_v_notification_message != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/notification_message.pxd":71
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+    /* "mpfmc/core/audio/notification_message.pxd":163
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:
  *         notification_message.message = notification_sound_started             # <<<<<<<<<<<<<<
  *         notification_message.player = player
@@ -6767,7 +8336,7 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->message = __pyx_e_5mpfmc_4core_5audio_20notification_message_notification_sound_started;
 
-    /* "mpfmc/core/audio/notification_message.pxd":72
+    /* "mpfmc/core/audio/notification_message.pxd":164
  *     if notification_message != NULL:
  *         notification_message.message = notification_sound_started
  *         notification_message.player = player             # <<<<<<<<<<<<<<
@@ -6776,7 +8345,7 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->player = __pyx_v_player;
 
-    /* "mpfmc/core/audio/notification_message.pxd":73
+    /* "mpfmc/core/audio/notification_message.pxd":165
  *         notification_message.message = notification_sound_started
  *         notification_message.player = player
  *         notification_message.sound_id = sound_id             # <<<<<<<<<<<<<<
@@ -6785,35 +8354,35 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->sound_id = __pyx_v_sound_id;
 
-    /* "mpfmc/core/audio/notification_message.pxd":74
+    /* "mpfmc/core/audio/notification_message.pxd":166
  *         notification_message.player = player
  *         notification_message.sound_id = sound_id
  *         notification_message.sound_instance_id = sound_instance_id             # <<<<<<<<<<<<<<
  * 
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+ *         _send_notification_message(track)
  */
     __pyx_v_notification_message->sound_instance_id = __pyx_v_sound_instance_id;
 
-    /* "mpfmc/core/audio/notification_message.pxd":76
+    /* "mpfmc/core/audio/notification_message.pxd":168
  *         notification_message.sound_instance_id = sound_instance_id
  * 
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)             # <<<<<<<<<<<<<<
+ *         _send_notification_message(track)             # <<<<<<<<<<<<<<
  * 
  * cdef inline void send_sound_stopped_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,
  */
-    __pyx_v_track->notification_messages = g_slist_prepend(__pyx_v_track->notification_messages, __pyx_v_notification_message);
+    __pyx_f_5mpfmc_4core_5audio_20notification_message__send_notification_message(__pyx_v_track);
 
-    /* "mpfmc/core/audio/notification_message.pxd":70
+    /* "mpfmc/core/audio/notification_message.pxd":162
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:             # <<<<<<<<<<<<<<
  *         notification_message.message = notification_sound_started
  *         notification_message.player = player
  */
   }
 
-  /* "mpfmc/core/audio/notification_message.pxd":59
- *     return <NotificationMessageContainer*>g_slice_alloc0(sizeof(NotificationMessageContainer))
+  /* "mpfmc/core/audio/notification_message.pxd":151
+ *                   (SDL_AtomicGet(&queue.read_index) + 1) & (NOTIFICATION_MESSAGE_QUEUE_SIZE - 1))
  * 
  * cdef inline void send_sound_started_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,             # <<<<<<<<<<<<<<
  *                                                  TrackState *track) nogil:
@@ -6823,8 +8392,8 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
   /* function exit code */
 }
 
-/* "mpfmc/core/audio/notification_message.pxd":78
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+/* "mpfmc/core/audio/notification_message.pxd":170
+ *         _send_notification_message(track)
  * 
  * cdef inline void send_sound_stopped_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,             # <<<<<<<<<<<<<<
  *                                                  TrackState *track) nogil:
@@ -6835,18 +8404,18 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
   __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_v_notification_message;
   int __pyx_t_1;
 
-  /* "mpfmc/core/audio/notification_message.pxd":88
+  /* "mpfmc/core/audio/notification_message.pxd":180
  *         track: The TrackState pointer
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()             # <<<<<<<<<<<<<<
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)             # <<<<<<<<<<<<<<
  *     if notification_message != NULL:
  *         notification_message.message = notification_sound_stopped
  */
-  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message();
+  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message(__pyx_v_track);
 
-  /* "mpfmc/core/audio/notification_message.pxd":89
+  /* "mpfmc/core/audio/notification_message.pxd":181
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:             # <<<<<<<<<<<<<<
  *         notification_message.message = notification_sound_stopped
  *         notification_message.player = player
@@ -6854,8 +8423,8 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
   __pyx_t_1 = ((__pyx_v_notification_message != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/notification_message.pxd":90
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+    /* "mpfmc/core/audio/notification_message.pxd":182
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:
  *         notification_message.message = notification_sound_stopped             # <<<<<<<<<<<<<<
  *         notification_message.player = player
@@ -6863,7 +8432,7 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->message = __pyx_e_5mpfmc_4core_5audio_20notification_message_notification_sound_stopped;
 
-    /* "mpfmc/core/audio/notification_message.pxd":91
+    /* "mpfmc/core/audio/notification_message.pxd":183
  *     if notification_message != NULL:
  *         notification_message.message = notification_sound_stopped
  *         notification_message.player = player             # <<<<<<<<<<<<<<
@@ -6872,7 +8441,7 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->player = __pyx_v_player;
 
-    /* "mpfmc/core/audio/notification_message.pxd":92
+    /* "mpfmc/core/audio/notification_message.pxd":184
  *         notification_message.message = notification_sound_stopped
  *         notification_message.player = player
  *         notification_message.sound_id = sound_id             # <<<<<<<<<<<<<<
@@ -6881,35 +8450,35 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->sound_id = __pyx_v_sound_id;
 
-    /* "mpfmc/core/audio/notification_message.pxd":93
+    /* "mpfmc/core/audio/notification_message.pxd":185
  *         notification_message.player = player
  *         notification_message.sound_id = sound_id
  *         notification_message.sound_instance_id = sound_instance_id             # <<<<<<<<<<<<<<
  * 
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+ *         _send_notification_message(track)
  */
     __pyx_v_notification_message->sound_instance_id = __pyx_v_sound_instance_id;
 
-    /* "mpfmc/core/audio/notification_message.pxd":95
+    /* "mpfmc/core/audio/notification_message.pxd":187
  *         notification_message.sound_instance_id = sound_instance_id
  * 
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)             # <<<<<<<<<<<<<<
+ *         _send_notification_message(track)             # <<<<<<<<<<<<<<
  * 
  * cdef inline void send_sound_looping_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,
  */
-    __pyx_v_track->notification_messages = g_slist_prepend(__pyx_v_track->notification_messages, __pyx_v_notification_message);
+    __pyx_f_5mpfmc_4core_5audio_20notification_message__send_notification_message(__pyx_v_track);
 
-    /* "mpfmc/core/audio/notification_message.pxd":89
+    /* "mpfmc/core/audio/notification_message.pxd":181
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:             # <<<<<<<<<<<<<<
  *         notification_message.message = notification_sound_stopped
  *         notification_message.player = player
  */
   }
 
-  /* "mpfmc/core/audio/notification_message.pxd":78
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+  /* "mpfmc/core/audio/notification_message.pxd":170
+ *         _send_notification_message(track)
  * 
  * cdef inline void send_sound_stopped_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,             # <<<<<<<<<<<<<<
  *                                                  TrackState *track) nogil:
@@ -6919,8 +8488,8 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
   /* function exit code */
 }
 
-/* "mpfmc/core/audio/notification_message.pxd":97
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+/* "mpfmc/core/audio/notification_message.pxd":189
+ *         _send_notification_message(track)
  * 
  * cdef inline void send_sound_looping_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,             # <<<<<<<<<<<<<<
  *                                                  TrackState *track) nogil:
@@ -6931,18 +8500,18 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
   __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_v_notification_message;
   int __pyx_t_1;
 
-  /* "mpfmc/core/audio/notification_message.pxd":107
+  /* "mpfmc/core/audio/notification_message.pxd":199
  *         track: The TrackState pointer
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()             # <<<<<<<<<<<<<<
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)             # <<<<<<<<<<<<<<
  *     if notification_message != NULL:
  *         notification_message.message = notification_sound_looping
  */
-  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message();
+  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message(__pyx_v_track);
 
-  /* "mpfmc/core/audio/notification_message.pxd":108
+  /* "mpfmc/core/audio/notification_message.pxd":200
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:             # <<<<<<<<<<<<<<
  *         notification_message.message = notification_sound_looping
  *         notification_message.player = player
@@ -6950,8 +8519,8 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
   __pyx_t_1 = ((__pyx_v_notification_message != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/notification_message.pxd":109
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+    /* "mpfmc/core/audio/notification_message.pxd":201
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:
  *         notification_message.message = notification_sound_looping             # <<<<<<<<<<<<<<
  *         notification_message.player = player
@@ -6959,7 +8528,7 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->message = __pyx_e_5mpfmc_4core_5audio_20notification_message_notification_sound_looping;
 
-    /* "mpfmc/core/audio/notification_message.pxd":110
+    /* "mpfmc/core/audio/notification_message.pxd":202
  *     if notification_message != NULL:
  *         notification_message.message = notification_sound_looping
  *         notification_message.player = player             # <<<<<<<<<<<<<<
@@ -6968,7 +8537,7 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->player = __pyx_v_player;
 
-    /* "mpfmc/core/audio/notification_message.pxd":111
+    /* "mpfmc/core/audio/notification_message.pxd":203
  *         notification_message.message = notification_sound_looping
  *         notification_message.player = player
  *         notification_message.sound_id = sound_id             # <<<<<<<<<<<<<<
@@ -6977,35 +8546,35 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->sound_id = __pyx_v_sound_id;
 
-    /* "mpfmc/core/audio/notification_message.pxd":112
+    /* "mpfmc/core/audio/notification_message.pxd":204
  *         notification_message.player = player
  *         notification_message.sound_id = sound_id
  *         notification_message.sound_instance_id = sound_instance_id             # <<<<<<<<<<<<<<
  * 
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+ *         _send_notification_message(track)
  */
     __pyx_v_notification_message->sound_instance_id = __pyx_v_sound_instance_id;
 
-    /* "mpfmc/core/audio/notification_message.pxd":114
+    /* "mpfmc/core/audio/notification_message.pxd":206
  *         notification_message.sound_instance_id = sound_instance_id
  * 
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)             # <<<<<<<<<<<<<<
+ *         _send_notification_message(track)             # <<<<<<<<<<<<<<
  * 
  * cdef inline void send_sound_about_to_finish_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,
  */
-    __pyx_v_track->notification_messages = g_slist_prepend(__pyx_v_track->notification_messages, __pyx_v_notification_message);
+    __pyx_f_5mpfmc_4core_5audio_20notification_message__send_notification_message(__pyx_v_track);
 
-    /* "mpfmc/core/audio/notification_message.pxd":108
+    /* "mpfmc/core/audio/notification_message.pxd":200
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:             # <<<<<<<<<<<<<<
  *         notification_message.message = notification_sound_looping
  *         notification_message.player = player
  */
   }
 
-  /* "mpfmc/core/audio/notification_message.pxd":97
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+  /* "mpfmc/core/audio/notification_message.pxd":189
+ *         _send_notification_message(track)
  * 
  * cdef inline void send_sound_looping_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,             # <<<<<<<<<<<<<<
  *                                                  TrackState *track) nogil:
@@ -7015,8 +8584,8 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
   /* function exit code */
 }
 
-/* "mpfmc/core/audio/notification_message.pxd":116
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+/* "mpfmc/core/audio/notification_message.pxd":208
+ *         _send_notification_message(track)
  * 
  * cdef inline void send_sound_about_to_finish_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,             # <<<<<<<<<<<<<<
  *                                                          TrackState *track) nogil:
@@ -7027,18 +8596,18 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
   __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_v_notification_message;
   int __pyx_t_1;
 
-  /* "mpfmc/core/audio/notification_message.pxd":126
+  /* "mpfmc/core/audio/notification_message.pxd":218
  *         track: The TrackState pointer
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()             # <<<<<<<<<<<<<<
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)             # <<<<<<<<<<<<<<
  *     if notification_message != NULL:
  *         notification_message.message = notification_sound_about_to_finish
  */
-  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message();
+  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message(__pyx_v_track);
 
-  /* "mpfmc/core/audio/notification_message.pxd":127
+  /* "mpfmc/core/audio/notification_message.pxd":219
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:             # <<<<<<<<<<<<<<
  *         notification_message.message = notification_sound_about_to_finish
  *         notification_message.player = player
@@ -7046,8 +8615,8 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
   __pyx_t_1 = ((__pyx_v_notification_message != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/notification_message.pxd":128
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+    /* "mpfmc/core/audio/notification_message.pxd":220
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:
  *         notification_message.message = notification_sound_about_to_finish             # <<<<<<<<<<<<<<
  *         notification_message.player = player
@@ -7055,7 +8624,7 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->message = __pyx_e_5mpfmc_4core_5audio_20notification_message_notification_sound_about_to_finish;
 
-    /* "mpfmc/core/audio/notification_message.pxd":129
+    /* "mpfmc/core/audio/notification_message.pxd":221
  *     if notification_message != NULL:
  *         notification_message.message = notification_sound_about_to_finish
  *         notification_message.player = player             # <<<<<<<<<<<<<<
@@ -7064,7 +8633,7 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->player = __pyx_v_player;
 
-    /* "mpfmc/core/audio/notification_message.pxd":130
+    /* "mpfmc/core/audio/notification_message.pxd":222
  *         notification_message.message = notification_sound_about_to_finish
  *         notification_message.player = player
  *         notification_message.sound_id = sound_id             # <<<<<<<<<<<<<<
@@ -7073,35 +8642,35 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->sound_id = __pyx_v_sound_id;
 
-    /* "mpfmc/core/audio/notification_message.pxd":131
+    /* "mpfmc/core/audio/notification_message.pxd":223
  *         notification_message.player = player
  *         notification_message.sound_id = sound_id
  *         notification_message.sound_instance_id = sound_instance_id             # <<<<<<<<<<<<<<
  * 
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+ *         _send_notification_message(track)
  */
     __pyx_v_notification_message->sound_instance_id = __pyx_v_sound_instance_id;
 
-    /* "mpfmc/core/audio/notification_message.pxd":133
+    /* "mpfmc/core/audio/notification_message.pxd":225
  *         notification_message.sound_instance_id = sound_instance_id
  * 
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)             # <<<<<<<<<<<<<<
+ *         _send_notification_message(track)             # <<<<<<<<<<<<<<
  * 
  * cdef inline void send_sound_marker_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,
  */
-    __pyx_v_track->notification_messages = g_slist_prepend(__pyx_v_track->notification_messages, __pyx_v_notification_message);
+    __pyx_f_5mpfmc_4core_5audio_20notification_message__send_notification_message(__pyx_v_track);
 
-    /* "mpfmc/core/audio/notification_message.pxd":127
+    /* "mpfmc/core/audio/notification_message.pxd":219
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:             # <<<<<<<<<<<<<<
  *         notification_message.message = notification_sound_about_to_finish
  *         notification_message.player = player
  */
   }
 
-  /* "mpfmc/core/audio/notification_message.pxd":116
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+  /* "mpfmc/core/audio/notification_message.pxd":208
+ *         _send_notification_message(track)
  * 
  * cdef inline void send_sound_about_to_finish_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,             # <<<<<<<<<<<<<<
  *                                                          TrackState *track) nogil:
@@ -7111,8 +8680,8 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
   /* function exit code */
 }
 
-/* "mpfmc/core/audio/notification_message.pxd":135
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+/* "mpfmc/core/audio/notification_message.pxd":227
+ *         _send_notification_message(track)
  * 
  * cdef inline void send_sound_marker_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,             # <<<<<<<<<<<<<<
  *                                                 TrackState *track,
@@ -7123,18 +8692,18 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
   __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_v_notification_message;
   int __pyx_t_1;
 
-  /* "mpfmc/core/audio/notification_message.pxd":147
+  /* "mpfmc/core/audio/notification_message.pxd":239
  *         marker_id: The id of the marker being sent for the specified sound
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()             # <<<<<<<<<<<<<<
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)             # <<<<<<<<<<<<<<
  *     if notification_message != NULL:
  *         notification_message.message = notification_sound_marker
  */
-  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message();
+  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message(__pyx_v_track);
 
-  /* "mpfmc/core/audio/notification_message.pxd":148
+  /* "mpfmc/core/audio/notification_message.pxd":240
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:             # <<<<<<<<<<<<<<
  *         notification_message.message = notification_sound_marker
  *         notification_message.player = player
@@ -7142,8 +8711,8 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
   __pyx_t_1 = ((__pyx_v_notification_message != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/notification_message.pxd":149
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+    /* "mpfmc/core/audio/notification_message.pxd":241
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:
  *         notification_message.message = notification_sound_marker             # <<<<<<<<<<<<<<
  *         notification_message.player = player
@@ -7151,7 +8720,7 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->message = __pyx_e_5mpfmc_4core_5audio_20notification_message_notification_sound_marker;
 
-    /* "mpfmc/core/audio/notification_message.pxd":150
+    /* "mpfmc/core/audio/notification_message.pxd":242
  *     if notification_message != NULL:
  *         notification_message.message = notification_sound_marker
  *         notification_message.player = player             # <<<<<<<<<<<<<<
@@ -7160,7 +8729,7 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->player = __pyx_v_player;
 
-    /* "mpfmc/core/audio/notification_message.pxd":151
+    /* "mpfmc/core/audio/notification_message.pxd":243
  *         notification_message.message = notification_sound_marker
  *         notification_message.player = player
  *         notification_message.sound_id = sound_id             # <<<<<<<<<<<<<<
@@ -7169,7 +8738,7 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->sound_id = __pyx_v_sound_id;
 
-    /* "mpfmc/core/audio/notification_message.pxd":152
+    /* "mpfmc/core/audio/notification_message.pxd":244
  *         notification_message.player = player
  *         notification_message.sound_id = sound_id
  *         notification_message.sound_instance_id = sound_instance_id             # <<<<<<<<<<<<<<
@@ -7178,35 +8747,35 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->sound_instance_id = __pyx_v_sound_instance_id;
 
-    /* "mpfmc/core/audio/notification_message.pxd":153
+    /* "mpfmc/core/audio/notification_message.pxd":245
  *         notification_message.sound_id = sound_id
  *         notification_message.sound_instance_id = sound_instance_id
  *         notification_message.data.marker.id = marker_id             # <<<<<<<<<<<<<<
  * 
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+ *         _send_notification_message(track)
  */
     __pyx_v_notification_message->data.marker.id = __pyx_v_marker_id;
 
-    /* "mpfmc/core/audio/notification_message.pxd":155
+    /* "mpfmc/core/audio/notification_message.pxd":247
  *         notification_message.data.marker.id = marker_id
  * 
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)             # <<<<<<<<<<<<<<
+ *         _send_notification_message(track)             # <<<<<<<<<<<<<<
  * 
  * cdef inline void send_track_stopped_notification(TrackState *track) nogil:
  */
-    __pyx_v_track->notification_messages = g_slist_prepend(__pyx_v_track->notification_messages, __pyx_v_notification_message);
+    __pyx_f_5mpfmc_4core_5audio_20notification_message__send_notification_message(__pyx_v_track);
 
-    /* "mpfmc/core/audio/notification_message.pxd":148
+    /* "mpfmc/core/audio/notification_message.pxd":240
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:             # <<<<<<<<<<<<<<
  *         notification_message.message = notification_sound_marker
  *         notification_message.player = player
  */
   }
 
-  /* "mpfmc/core/audio/notification_message.pxd":135
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+  /* "mpfmc/core/audio/notification_message.pxd":227
+ *         _send_notification_message(track)
  * 
  * cdef inline void send_sound_marker_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,             # <<<<<<<<<<<<<<
  *                                                 TrackState *track,
@@ -7216,8 +8785,8 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
   /* function exit code */
 }
 
-/* "mpfmc/core/audio/notification_message.pxd":157
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+/* "mpfmc/core/audio/notification_message.pxd":249
+ *         _send_notification_message(track)
  * 
  * cdef inline void send_track_stopped_notification(TrackState *track) nogil:             # <<<<<<<<<<<<<<
  *     """
@@ -7228,54 +8797,54 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
   __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_v_notification_message;
   int __pyx_t_1;
 
-  /* "mpfmc/core/audio/notification_message.pxd":163
+  /* "mpfmc/core/audio/notification_message.pxd":255
  *         track: The TrackState pointer
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()             # <<<<<<<<<<<<<<
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)             # <<<<<<<<<<<<<<
  *     if notification_message != NULL:
  *         notification_message.message = notification_track_stopped
  */
-  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message();
+  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message(__pyx_v_track);
 
-  /* "mpfmc/core/audio/notification_message.pxd":164
+  /* "mpfmc/core/audio/notification_message.pxd":256
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:             # <<<<<<<<<<<<<<
  *         notification_message.message = notification_track_stopped
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+ *         _send_notification_message(track)
  */
   __pyx_t_1 = ((__pyx_v_notification_message != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/notification_message.pxd":165
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+    /* "mpfmc/core/audio/notification_message.pxd":257
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:
  *         notification_message.message = notification_track_stopped             # <<<<<<<<<<<<<<
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+ *         _send_notification_message(track)
  * 
  */
     __pyx_v_notification_message->message = __pyx_e_5mpfmc_4core_5audio_20notification_message_notification_track_stopped;
 
-    /* "mpfmc/core/audio/notification_message.pxd":166
+    /* "mpfmc/core/audio/notification_message.pxd":258
  *     if notification_message != NULL:
  *         notification_message.message = notification_track_stopped
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)             # <<<<<<<<<<<<<<
+ *         _send_notification_message(track)             # <<<<<<<<<<<<<<
  * 
  * cdef inline void send_track_paused_notification(TrackState *track) nogil:
  */
-    __pyx_v_track->notification_messages = g_slist_prepend(__pyx_v_track->notification_messages, __pyx_v_notification_message);
+    __pyx_f_5mpfmc_4core_5audio_20notification_message__send_notification_message(__pyx_v_track);
 
-    /* "mpfmc/core/audio/notification_message.pxd":164
+    /* "mpfmc/core/audio/notification_message.pxd":256
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:             # <<<<<<<<<<<<<<
  *         notification_message.message = notification_track_stopped
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+ *         _send_notification_message(track)
  */
   }
 
-  /* "mpfmc/core/audio/notification_message.pxd":157
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+  /* "mpfmc/core/audio/notification_message.pxd":249
+ *         _send_notification_message(track)
  * 
  * cdef inline void send_track_stopped_notification(TrackState *track) nogil:             # <<<<<<<<<<<<<<
  *     """
@@ -7285,8 +8854,8 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
   /* function exit code */
 }
 
-/* "mpfmc/core/audio/notification_message.pxd":168
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+/* "mpfmc/core/audio/notification_message.pxd":260
+ *         _send_notification_message(track)
  * 
  * cdef inline void send_track_paused_notification(TrackState *track) nogil:             # <<<<<<<<<<<<<<
  *     """
@@ -7297,54 +8866,54 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
   __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_v_notification_message;
   int __pyx_t_1;
 
-  /* "mpfmc/core/audio/notification_message.pxd":174
+  /* "mpfmc/core/audio/notification_message.pxd":266
  *         track: The TrackState pointer
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()             # <<<<<<<<<<<<<<
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)             # <<<<<<<<<<<<<<
  *     if notification_message != NULL:
  *         notification_message.message = notification_track_paused
  */
-  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message();
+  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message(__pyx_v_track);
 
-  /* "mpfmc/core/audio/notification_message.pxd":175
+  /* "mpfmc/core/audio/notification_message.pxd":267
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:             # <<<<<<<<<<<<<<
  *         notification_message.message = notification_track_paused
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+ *         _send_notification_message(track)
  */
   __pyx_t_1 = ((__pyx_v_notification_message != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/notification_message.pxd":176
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+    /* "mpfmc/core/audio/notification_message.pxd":268
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:
  *         notification_message.message = notification_track_paused             # <<<<<<<<<<<<<<
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+ *         _send_notification_message(track)
  * 
  */
     __pyx_v_notification_message->message = __pyx_e_5mpfmc_4core_5audio_20notification_message_notification_track_paused;
 
-    /* "mpfmc/core/audio/notification_message.pxd":177
+    /* "mpfmc/core/audio/notification_message.pxd":269
  *     if notification_message != NULL:
  *         notification_message.message = notification_track_paused
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)             # <<<<<<<<<<<<<<
+ *         _send_notification_message(track)             # <<<<<<<<<<<<<<
  * 
  * cdef inline void send_sound_loop_set_started_notification(int sound_loop_set_id, Uint64 sound_id, gpointer player, TrackState *track) nogil:
  */
-    __pyx_v_track->notification_messages = g_slist_prepend(__pyx_v_track->notification_messages, __pyx_v_notification_message);
+    __pyx_f_5mpfmc_4core_5audio_20notification_message__send_notification_message(__pyx_v_track);
 
-    /* "mpfmc/core/audio/notification_message.pxd":175
+    /* "mpfmc/core/audio/notification_message.pxd":267
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:             # <<<<<<<<<<<<<<
  *         notification_message.message = notification_track_paused
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+ *         _send_notification_message(track)
  */
   }
 
-  /* "mpfmc/core/audio/notification_message.pxd":168
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+  /* "mpfmc/core/audio/notification_message.pxd":260
+ *         _send_notification_message(track)
  * 
  * cdef inline void send_track_paused_notification(TrackState *track) nogil:             # <<<<<<<<<<<<<<
  *     """
@@ -7354,8 +8923,8 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
   /* function exit code */
 }
 
-/* "mpfmc/core/audio/notification_message.pxd":179
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+/* "mpfmc/core/audio/notification_message.pxd":271
+ *         _send_notification_message(track)
  * 
  * cdef inline void send_sound_loop_set_started_notification(int sound_loop_set_id, Uint64 sound_id, gpointer player, TrackState *track) nogil:             # <<<<<<<<<<<<<<
  *     """
@@ -7366,18 +8935,18 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
   __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_v_notification_message;
   int __pyx_t_1;
 
-  /* "mpfmc/core/audio/notification_message.pxd":188
+  /* "mpfmc/core/audio/notification_message.pxd":280
  *         track: The TrackState pointer
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()             # <<<<<<<<<<<<<<
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)             # <<<<<<<<<<<<<<
  *     if notification_message != NULL:
  *         notification_message.message = notification_sound_loop_set_started
  */
-  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message();
+  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message(__pyx_v_track);
 
-  /* "mpfmc/core/audio/notification_message.pxd":189
+  /* "mpfmc/core/audio/notification_message.pxd":281
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:             # <<<<<<<<<<<<<<
  *         notification_message.message = notification_sound_loop_set_started
  *         notification_message.player = 0
@@ -7385,8 +8954,8 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
   __pyx_t_1 = ((__pyx_v_notification_message != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/notification_message.pxd":190
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+    /* "mpfmc/core/audio/notification_message.pxd":282
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:
  *         notification_message.message = notification_sound_loop_set_started             # <<<<<<<<<<<<<<
  *         notification_message.player = 0
@@ -7394,7 +8963,7 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->message = __pyx_e_5mpfmc_4core_5audio_20notification_message_notification_sound_loop_set_started;
 
-    /* "mpfmc/core/audio/notification_message.pxd":191
+    /* "mpfmc/core/audio/notification_message.pxd":283
  *     if notification_message != NULL:
  *         notification_message.message = notification_sound_loop_set_started
  *         notification_message.player = 0             # <<<<<<<<<<<<<<
@@ -7403,7 +8972,7 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->player = 0;
 
-    /* "mpfmc/core/audio/notification_message.pxd":192
+    /* "mpfmc/core/audio/notification_message.pxd":284
  *         notification_message.message = notification_sound_loop_set_started
  *         notification_message.player = 0
  *         notification_message.sound_id = sound_id             # <<<<<<<<<<<<<<
@@ -7412,7 +8981,7 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->sound_id = __pyx_v_sound_id;
 
-    /* "mpfmc/core/audio/notification_message.pxd":193
+    /* "mpfmc/core/audio/notification_message.pxd":285
  *         notification_message.player = 0
  *         notification_message.sound_id = sound_id
  *         notification_message.sound_instance_id = 0             # <<<<<<<<<<<<<<
@@ -7421,7 +8990,7 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->sound_instance_id = 0;
 
-    /* "mpfmc/core/audio/notification_message.pxd":194
+    /* "mpfmc/core/audio/notification_message.pxd":286
  *         notification_message.sound_id = sound_id
  *         notification_message.sound_instance_id = 0
  *         notification_message.data.sound_loop_set.id = sound_loop_set_id             # <<<<<<<<<<<<<<
@@ -7430,35 +8999,35 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->data.sound_loop_set.id = __pyx_v_sound_loop_set_id;
 
-    /* "mpfmc/core/audio/notification_message.pxd":195
+    /* "mpfmc/core/audio/notification_message.pxd":287
  *         notification_message.sound_instance_id = 0
  *         notification_message.data.sound_loop_set.id = sound_loop_set_id
  *         notification_message.data.sound_loop_set.player = player             # <<<<<<<<<<<<<<
  * 
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+ *         _send_notification_message(track)
  */
     __pyx_v_notification_message->data.sound_loop_set.player = __pyx_v_player;
 
-    /* "mpfmc/core/audio/notification_message.pxd":197
+    /* "mpfmc/core/audio/notification_message.pxd":289
  *         notification_message.data.sound_loop_set.player = player
  * 
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)             # <<<<<<<<<<<<<<
+ *         _send_notification_message(track)             # <<<<<<<<<<<<<<
  * 
  * cdef inline void send_sound_loop_set_stopped_notification(int sound_loop_set_id, Uint64 sound_id, gpointer player, TrackState *track) nogil:
  */
-    __pyx_v_track->notification_messages = g_slist_prepend(__pyx_v_track->notification_messages, __pyx_v_notification_message);
+    __pyx_f_5mpfmc_4core_5audio_20notification_message__send_notification_message(__pyx_v_track);
 
-    /* "mpfmc/core/audio/notification_message.pxd":189
+    /* "mpfmc/core/audio/notification_message.pxd":281
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:             # <<<<<<<<<<<<<<
  *         notification_message.message = notification_sound_loop_set_started
  *         notification_message.player = 0
  */
   }
 
-  /* "mpfmc/core/audio/notification_message.pxd":179
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+  /* "mpfmc/core/audio/notification_message.pxd":271
+ *         _send_notification_message(track)
  * 
  * cdef inline void send_sound_loop_set_started_notification(int sound_loop_set_id, Uint64 sound_id, gpointer player, TrackState *track) nogil:             # <<<<<<<<<<<<<<
  *     """
@@ -7468,8 +9037,8 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
   /* function exit code */
 }
 
-/* "mpfmc/core/audio/notification_message.pxd":199
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+/* "mpfmc/core/audio/notification_message.pxd":291
+ *         _send_notification_message(track)
  * 
  * cdef inline void send_sound_loop_set_stopped_notification(int sound_loop_set_id, Uint64 sound_id, gpointer player, TrackState *track) nogil:             # <<<<<<<<<<<<<<
  *     """
@@ -7480,18 +9049,18 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
   __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_v_notification_message;
   int __pyx_t_1;
 
-  /* "mpfmc/core/audio/notification_message.pxd":208
+  /* "mpfmc/core/audio/notification_message.pxd":300
  *         track: The TrackState pointer
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()             # <<<<<<<<<<<<<<
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)             # <<<<<<<<<<<<<<
  *     if notification_message != NULL:
  *         notification_message.message = notification_sound_loop_set_stopped
  */
-  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message();
+  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message(__pyx_v_track);
 
-  /* "mpfmc/core/audio/notification_message.pxd":209
+  /* "mpfmc/core/audio/notification_message.pxd":301
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:             # <<<<<<<<<<<<<<
  *         notification_message.message = notification_sound_loop_set_stopped
  *         notification_message.player = 0
@@ -7499,8 +9068,8 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
   __pyx_t_1 = ((__pyx_v_notification_message != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/notification_message.pxd":210
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+    /* "mpfmc/core/audio/notification_message.pxd":302
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:
  *         notification_message.message = notification_sound_loop_set_stopped             # <<<<<<<<<<<<<<
  *         notification_message.player = 0
@@ -7508,7 +9077,7 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->message = __pyx_e_5mpfmc_4core_5audio_20notification_message_notification_sound_loop_set_stopped;
 
-    /* "mpfmc/core/audio/notification_message.pxd":211
+    /* "mpfmc/core/audio/notification_message.pxd":303
  *     if notification_message != NULL:
  *         notification_message.message = notification_sound_loop_set_stopped
  *         notification_message.player = 0             # <<<<<<<<<<<<<<
@@ -7517,7 +9086,7 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->player = 0;
 
-    /* "mpfmc/core/audio/notification_message.pxd":212
+    /* "mpfmc/core/audio/notification_message.pxd":304
  *         notification_message.message = notification_sound_loop_set_stopped
  *         notification_message.player = 0
  *         notification_message.sound_id = sound_id             # <<<<<<<<<<<<<<
@@ -7526,7 +9095,7 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->sound_id = __pyx_v_sound_id;
 
-    /* "mpfmc/core/audio/notification_message.pxd":213
+    /* "mpfmc/core/audio/notification_message.pxd":305
  *         notification_message.player = 0
  *         notification_message.sound_id = sound_id
  *         notification_message.sound_instance_id = 0             # <<<<<<<<<<<<<<
@@ -7535,7 +9104,7 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->sound_instance_id = 0;
 
-    /* "mpfmc/core/audio/notification_message.pxd":214
+    /* "mpfmc/core/audio/notification_message.pxd":306
  *         notification_message.sound_id = sound_id
  *         notification_message.sound_instance_id = 0
  *         notification_message.data.sound_loop_set.id = sound_loop_set_id             # <<<<<<<<<<<<<<
@@ -7544,35 +9113,35 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->data.sound_loop_set.id = __pyx_v_sound_loop_set_id;
 
-    /* "mpfmc/core/audio/notification_message.pxd":215
+    /* "mpfmc/core/audio/notification_message.pxd":307
  *         notification_message.sound_instance_id = 0
  *         notification_message.data.sound_loop_set.id = sound_loop_set_id
  *         notification_message.data.sound_loop_set.player = player             # <<<<<<<<<<<<<<
  * 
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+ *         _send_notification_message(track)
  */
     __pyx_v_notification_message->data.sound_loop_set.player = __pyx_v_player;
 
-    /* "mpfmc/core/audio/notification_message.pxd":217
+    /* "mpfmc/core/audio/notification_message.pxd":309
  *         notification_message.data.sound_loop_set.player = player
  * 
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)             # <<<<<<<<<<<<<<
+ *         _send_notification_message(track)             # <<<<<<<<<<<<<<
  * 
  * cdef inline void send_sound_loop_set_looping_notification(int sound_loop_set_id, Uint64 sound_id, gpointer player, TrackState *track) nogil:
  */
-    __pyx_v_track->notification_messages = g_slist_prepend(__pyx_v_track->notification_messages, __pyx_v_notification_message);
+    __pyx_f_5mpfmc_4core_5audio_20notification_message__send_notification_message(__pyx_v_track);
 
-    /* "mpfmc/core/audio/notification_message.pxd":209
+    /* "mpfmc/core/audio/notification_message.pxd":301
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:             # <<<<<<<<<<<<<<
  *         notification_message.message = notification_sound_loop_set_stopped
  *         notification_message.player = 0
  */
   }
 
-  /* "mpfmc/core/audio/notification_message.pxd":199
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+  /* "mpfmc/core/audio/notification_message.pxd":291
+ *         _send_notification_message(track)
  * 
  * cdef inline void send_sound_loop_set_stopped_notification(int sound_loop_set_id, Uint64 sound_id, gpointer player, TrackState *track) nogil:             # <<<<<<<<<<<<<<
  *     """
@@ -7582,8 +9151,8 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
   /* function exit code */
 }
 
-/* "mpfmc/core/audio/notification_message.pxd":219
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+/* "mpfmc/core/audio/notification_message.pxd":311
+ *         _send_notification_message(track)
  * 
  * cdef inline void send_sound_loop_set_looping_notification(int sound_loop_set_id, Uint64 sound_id, gpointer player, TrackState *track) nogil:             # <<<<<<<<<<<<<<
  *     """
@@ -7594,18 +9163,18 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
   __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_v_notification_message;
   int __pyx_t_1;
 
-  /* "mpfmc/core/audio/notification_message.pxd":228
+  /* "mpfmc/core/audio/notification_message.pxd":320
  *         track: The TrackState pointer
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()             # <<<<<<<<<<<<<<
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)             # <<<<<<<<<<<<<<
  *     if notification_message != NULL:
  *         notification_message.message = notification_sound_loop_set_looping
  */
-  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message();
+  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message(__pyx_v_track);
 
-  /* "mpfmc/core/audio/notification_message.pxd":229
+  /* "mpfmc/core/audio/notification_message.pxd":321
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:             # <<<<<<<<<<<<<<
  *         notification_message.message = notification_sound_loop_set_looping
  *         notification_message.player = 0
@@ -7613,8 +9182,8 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
   __pyx_t_1 = ((__pyx_v_notification_message != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/notification_message.pxd":230
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+    /* "mpfmc/core/audio/notification_message.pxd":322
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:
  *         notification_message.message = notification_sound_loop_set_looping             # <<<<<<<<<<<<<<
  *         notification_message.player = 0
@@ -7622,7 +9191,7 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->message = __pyx_e_5mpfmc_4core_5audio_20notification_message_notification_sound_loop_set_looping;
 
-    /* "mpfmc/core/audio/notification_message.pxd":231
+    /* "mpfmc/core/audio/notification_message.pxd":323
  *     if notification_message != NULL:
  *         notification_message.message = notification_sound_loop_set_looping
  *         notification_message.player = 0             # <<<<<<<<<<<<<<
@@ -7631,7 +9200,7 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->player = 0;
 
-    /* "mpfmc/core/audio/notification_message.pxd":232
+    /* "mpfmc/core/audio/notification_message.pxd":324
  *         notification_message.message = notification_sound_loop_set_looping
  *         notification_message.player = 0
  *         notification_message.sound_id = sound_id             # <<<<<<<<<<<<<<
@@ -7640,7 +9209,7 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->sound_id = __pyx_v_sound_id;
 
-    /* "mpfmc/core/audio/notification_message.pxd":233
+    /* "mpfmc/core/audio/notification_message.pxd":325
  *         notification_message.player = 0
  *         notification_message.sound_id = sound_id
  *         notification_message.sound_instance_id = 0             # <<<<<<<<<<<<<<
@@ -7649,7 +9218,7 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->sound_instance_id = 0;
 
-    /* "mpfmc/core/audio/notification_message.pxd":234
+    /* "mpfmc/core/audio/notification_message.pxd":326
  *         notification_message.sound_id = sound_id
  *         notification_message.sound_instance_id = 0
  *         notification_message.data.sound_loop_set.id = sound_loop_set_id             # <<<<<<<<<<<<<<
@@ -7658,34 +9227,34 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->data.sound_loop_set.id = __pyx_v_sound_loop_set_id;
 
-    /* "mpfmc/core/audio/notification_message.pxd":235
+    /* "mpfmc/core/audio/notification_message.pxd":327
  *         notification_message.sound_instance_id = 0
  *         notification_message.data.sound_loop_set.id = sound_loop_set_id
  *         notification_message.data.sound_loop_set.player = player             # <<<<<<<<<<<<<<
  * 
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+ *         _send_notification_message(track)
  */
     __pyx_v_notification_message->data.sound_loop_set.player = __pyx_v_player;
 
-    /* "mpfmc/core/audio/notification_message.pxd":237
+    /* "mpfmc/core/audio/notification_message.pxd":329
  *         notification_message.data.sound_loop_set.player = player
  * 
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)             # <<<<<<<<<<<<<<
+ *         _send_notification_message(track)             # <<<<<<<<<<<<<<
  * 
  */
-    __pyx_v_track->notification_messages = g_slist_prepend(__pyx_v_track->notification_messages, __pyx_v_notification_message);
+    __pyx_f_5mpfmc_4core_5audio_20notification_message__send_notification_message(__pyx_v_track);
 
-    /* "mpfmc/core/audio/notification_message.pxd":229
+    /* "mpfmc/core/audio/notification_message.pxd":321
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:             # <<<<<<<<<<<<<<
  *         notification_message.message = notification_sound_loop_set_looping
  *         notification_message.player = 0
  */
   }
 
-  /* "mpfmc/core/audio/notification_message.pxd":219
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+  /* "mpfmc/core/audio/notification_message.pxd":311
+ *         _send_notification_message(track)
  * 
  * cdef inline void send_sound_loop_set_looping_notification(int sound_loop_set_id, Uint64 sound_id, gpointer player, TrackState *track) nogil:             # <<<<<<<<<<<<<<
  *     """
@@ -7723,7 +9292,7 @@ static PyObject *__pyx_tp_new_5mpfmc_4core_5audio_5track_Track(PyTypeObject *t,
 static void __pyx_tp_dealloc_5mpfmc_4core_5audio_5track_Track(PyObject *o) {
   struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *p = (struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *)o;
   #if CYTHON_USE_TP_FINALIZE
-  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && !_PyGC_FINALIZED(o)) {
+  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && !__Pyx_PyObject_GC_IsFinalized(o)) {
     if (PyObject_CallFinalizerFromDealloc(o)) return;
   }
   #endif
@@ -7731,9 +9300,9 @@ static void __pyx_tp_dealloc_5mpfmc_4core_5audio_5track_Track(PyObject *o) {
   {
     PyObject *etype, *eval, *etb;
     PyErr_Fetch(&etype, &eval, &etb);
-    ++Py_REFCNT(o);
+    __Pyx_SET_REFCNT(o, Py_REFCNT(o) + 1);
     __pyx_pw_5mpfmc_4core_5audio_5track_5Track_5__dealloc__(o);
-    --Py_REFCNT(o);
+    __Pyx_SET_REFCNT(o, Py_REFCNT(o) - 1);
     PyErr_Restore(etype, eval, etb);
   }
   Py_CLEAR(p->_name);
@@ -7795,6 +9364,14 @@ static PyObject *__pyx_getprop_5mpfmc_4core_5audio_5track_5Track_volume(PyObject
   return __pyx_pw_5mpfmc_4core_5audio_5track_5Track_6volume_1__get__(o);
 }
 
+static PyObject *__pyx_getprop_5mpfmc_4core_5audio_5track_5Track_notifications_dropped(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_5mpfmc_4core_5audio_5track_5Track_21notifications_dropped_1__get__(o);
+}
+
+static PyObject *__pyx_getprop_5mpfmc_4core_5audio_5track_5Track_active_player_count(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_5mpfmc_4core_5audio_5track_5Track_19active_player_count_1__get__(o);
+}
+
 static PyObject *__pyx_getprop_5mpfmc_4core_5audio_5track_5Track_type(PyObject *o, CYTHON_UNUSED void *x) {
   return __pyx_pw_5mpfmc_4core_5audio_5track_5Track_4type_1__get__(o);
 }
@@ -7873,6 +9450,8 @@ static PyMethodDef __pyx_methods_5mpfmc_4core_5audio_5track_Track[] = {
 static struct PyGetSetDef __pyx_getsets_5mpfmc_4core_5audio_5track_Track[] = {
   {(char *)"name", __pyx_getprop_5mpfmc_4core_5audio_5track_5Track_name, 0, (char *)0, 0},
   {(char *)"volume", __pyx_getprop_5mpfmc_4core_5audio_5track_5Track_volume, 0, (char *)0, 0},
+  {(char *)"notifications_dropped", __pyx_getprop_5mpfmc_4core_5audio_5track_5Track_notifications_dropped, 0, (char *)"Return the number of notification messages dropped because the notification queue was full", 0},
+  {(char *)"active_player_count", __pyx_getprop_5mpfmc_4core_5audio_5track_5Track_active_player_count, 0, (char *)"Return the number of players that generated samples during the last audio callback", 0},
   {(char *)"type", __pyx_getprop_5mpfmc_4core_5audio_5track_5Track_type, 0, (char *)0, 0},
   {(char *)"number", __pyx_getprop_5mpfmc_4core_5audio_5track_5Track_number, 0, (char *)"Return the track number", 0},
   {(char *)"events_when_stopped", __pyx_getprop_5mpfmc_4core_5audio_5track_5Track_events_when_stopped, __pyx_setprop_5mpfmc_4core_5audio_5track_5Track_events_when_stopped, (char *)"Return the list of events that are posted when the track is stopped", 0},
@@ -7890,7 +9469,12 @@ static PyTypeObject __pyx_type_5mpfmc_4core_5audio_5track_Track = {
   sizeof(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track), /*tp_basicsize*/
   0, /*tp_itemsize*/
   __pyx_tp_dealloc_5mpfmc_4core_5audio_5track_Track, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
   0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
   0, /*tp_getattr*/
   0, /*tp_setattr*/
   #if PY_MAJOR_VERSION < 3
@@ -7940,9 +9524,15 @@ static PyTypeObject __pyx_type_5mpfmc_4core_5audio_5track_Track = {
   #if PY_VERSION_HEX >= 0x030400a1
   0, /*tp_finalize*/
   #endif
-  #if PY_VERSION_HEX >= 0x030800b1
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
   0, /*tp_vectorcall*/
   #endif
+  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+  0, /*tp_print*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
 };
 
 static PyMethodDef __pyx_methods[] = {
@@ -7991,7 +9581,7 @@ static struct PyModuleDef __pyx_moduledef = {
 #endif
 
 static __Pyx_StringTabEntry __pyx_string_tab[] = {
-  {&__pyx_kp_u_Allocated_track_audio_buffer_d_b, __pyx_k_Allocated_track_audio_buffer_d_b, sizeof(__pyx_k_Allocated_track_audio_buffer_d_b), 0, 1, 0, 0},
+  {&__pyx_kp_u_Allocated_track_audio_mixing_buf, __pyx_k_Allocated_track_audio_mixing_buf, sizeof(__pyx_k_Allocated_track_audio_mixing_buf), 0, 1, 0, 0},
   {&__pyx_kp_u_Must_be_overridden_in_derived_cl, __pyx_k_Must_be_overridden_in_derived_cl, sizeof(__pyx_k_Must_be_overridden_in_derived_cl), 0, 1, 0, 0},
   {&__pyx_n_s_NotImplementedError, __pyx_k_NotImplementedError, sizeof(__pyx_k_NotImplementedError), 0, 0, 1, 1},
   {&__pyx_n_s_Track, __pyx_k_Track, sizeof(__pyx_k_Track), 0, 0, 1, 1},
@@ -7999,9 +9589,18 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_kp_u_Track_2, __pyx_k_Track_2, sizeof(__pyx_k_Track_2), 0, 1, 0, 0},
   {&__pyx_n_s_TypeError, __pyx_k_TypeError, sizeof(__pyx_k_TypeError), 0, 0, 1, 1},
   {&__pyx_n_s_audio_callback_data, __pyx_k_audio_callback_data, sizeof(__pyx_k_audio_callback_data), 0, 0, 1, 1},
+  {&__pyx_n_s_benchmark_mix_bus, __pyx_k_benchmark_mix_bus, sizeof(__pyx_k_benchmark_mix_bus), 0, 0, 1, 1},
+  {&__pyx_n_s_buffer_length, __pyx_k_buffer_length, sizeof(__pyx_k_buffer_length), 0, 0, 1, 1},
+  {&__pyx_n_s_buffer_samples, __pyx_k_buffer_samples, sizeof(__pyx_k_buffer_samples), 0, 0, 1, 1},
   {&__pyx_n_s_buffer_size, __pyx_k_buffer_size, sizeof(__pyx_k_buffer_size), 0, 0, 1, 1},
+  {&__pyx_n_s_bus, __pyx_k_bus, sizeof(__pyx_k_bus), 0, 0, 1, 1},
+  {&__pyx_n_s_channels, __pyx_k_channels, sizeof(__pyx_k_channels), 0, 0, 1, 1},
+  {&__pyx_n_s_chunk_samples, __pyx_k_chunk_samples, sizeof(__pyx_k_chunk_samples), 0, 0, 1, 1},
   {&__pyx_n_s_cline_in_traceback, __pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 0, 1, 1},
+  {&__pyx_n_s_control_point, __pyx_k_control_point, sizeof(__pyx_k_control_point), 0, 0, 1, 1},
   {&__pyx_n_s_debug, __pyx_k_debug, sizeof(__pyx_k_debug), 0, 0, 1, 1},
+  {&__pyx_n_s_dither, __pyx_k_dither, sizeof(__pyx_k_dither), 0, 0, 1, 1},
+  {&__pyx_n_s_duration, __pyx_k_duration, sizeof(__pyx_k_duration), 0, 0, 1, 1},
   {&__pyx_n_s_events_when_played, __pyx_k_events_when_played, sizeof(__pyx_k_events_when_played), 0, 0, 1, 1},
   {&__pyx_n_s_fade_in_seconds, __pyx_k_fade_in_seconds, sizeof(__pyx_k_fade_in_seconds), 0, 0, 1, 1},
   {&__pyx_n_s_fade_out_seconds, __pyx_k_fade_out_seconds, sizeof(__pyx_k_fade_out_seconds), 0, 0, 1, 1},
@@ -8009,43 +9608,58 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_format, __pyx_k_format, sizeof(__pyx_k_format), 0, 0, 1, 1},
   {&__pyx_n_s_getLogger, __pyx_k_getLogger, sizeof(__pyx_k_getLogger), 0, 0, 1, 1},
   {&__pyx_n_s_getstate, __pyx_k_getstate, sizeof(__pyx_k_getstate), 0, 0, 1, 1},
+  {&__pyx_n_s_i, __pyx_k_i, sizeof(__pyx_k_i), 0, 0, 1, 1},
   {&__pyx_n_s_import, __pyx_k_import, sizeof(__pyx_k_import), 0, 0, 1, 1},
+  {&__pyx_n_s_iteration, __pyx_k_iteration, sizeof(__pyx_k_iteration), 0, 0, 1, 1},
+  {&__pyx_n_s_iterations, __pyx_k_iterations, sizeof(__pyx_k_iterations), 0, 0, 1, 1},
   {&__pyx_n_s_logging, __pyx_k_logging, sizeof(__pyx_k_logging), 0, 0, 1, 1},
   {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
   {&__pyx_n_s_mc, __pyx_k_mc, sizeof(__pyx_k_mc), 0, 0, 1, 1},
+  {&__pyx_n_s_mpfmc_core_audio_track, __pyx_k_mpfmc_core_audio_track, sizeof(__pyx_k_mpfmc_core_audio_track), 0, 0, 1, 1},
+  {&__pyx_kp_s_mpfmc_core_audio_track_pyx, __pyx_k_mpfmc_core_audio_track_pyx, sizeof(__pyx_k_mpfmc_core_audio_track_pyx), 0, 0, 1, 0},
   {&__pyx_n_s_name, __pyx_k_name, sizeof(__pyx_k_name), 0, 0, 1, 1},
   {&__pyx_n_s_name_2, __pyx_k_name_2, sizeof(__pyx_k_name_2), 0, 0, 1, 1},
   {&__pyx_kp_s_no_default___reduce___due_to_non, __pyx_k_no_default___reduce___due_to_non, sizeof(__pyx_k_no_default___reduce___due_to_non), 0, 0, 1, 0},
   {&__pyx_n_s_number, __pyx_k_number, sizeof(__pyx_k_number), 0, 0, 1, 1},
+  {&__pyx_n_s_output, __pyx_k_output, sizeof(__pyx_k_output), 0, 0, 1, 1},
   {&__pyx_kp_u_pause_Action_may_only_be_used_wh, __pyx_k_pause_Action_may_only_be_used_wh, sizeof(__pyx_k_pause_Action_may_only_be_used_wh), 0, 1, 0, 0},
   {&__pyx_kp_u_pause_Applying_s_second_fade_out, __pyx_k_pause_Applying_s_second_fade_out, sizeof(__pyx_k_pause_Applying_s_second_fade_out), 0, 1, 0, 0},
   {&__pyx_kp_u_pause_Pause_sound_processing_on, __pyx_k_pause_Pause_sound_processing_on, sizeof(__pyx_k_pause_Pause_sound_processing_on), 0, 1, 0, 0},
+  {&__pyx_n_s_perf_counter, __pyx_k_perf_counter, sizeof(__pyx_k_perf_counter), 0, 0, 1, 1},
   {&__pyx_kp_u_play_Action_may_only_be_used_whe, __pyx_k_play_Action_may_only_be_used_whe, sizeof(__pyx_k_play_Action_may_only_be_used_whe), 0, 1, 0, 0},
   {&__pyx_kp_u_play_Applying_s_second_fade_in, __pyx_k_play_Applying_s_second_fade_in, sizeof(__pyx_k_play_Applying_s_second_fade_in), 0, 1, 0, 0},
   {&__pyx_kp_u_play_Begin_sound_processing_on_t, __pyx_k_play_Begin_sound_processing_on_t, sizeof(__pyx_k_play_Begin_sound_processing_on_t), 0, 1, 0, 0},
   {&__pyx_n_s_post_mc_native_event, __pyx_k_post_mc_native_event, sizeof(__pyx_k_post_mc_native_event), 0, 0, 1, 1},
   {&__pyx_n_s_pyx_vtable, __pyx_k_pyx_vtable, sizeof(__pyx_k_pyx_vtable), 0, 0, 1, 1},
+  {&__pyx_n_s_range, __pyx_k_range, sizeof(__pyx_k_range), 0, 0, 1, 1},
   {&__pyx_n_s_reduce, __pyx_k_reduce, sizeof(__pyx_k_reduce), 0, 0, 1, 1},
   {&__pyx_n_s_reduce_cython, __pyx_k_reduce_cython, sizeof(__pyx_k_reduce_cython), 0, 0, 1, 1},
   {&__pyx_n_s_reduce_ex, __pyx_k_reduce_ex, sizeof(__pyx_k_reduce_ex), 0, 0, 1, 1},
   {&__pyx_n_s_round, __pyx_k_round, sizeof(__pyx_k_round), 0, 0, 1, 1},
+  {&__pyx_n_s_sample_count, __pyx_k_sample_count, sizeof(__pyx_k_sample_count), 0, 0, 1, 1},
   {&__pyx_kp_u_set_volume_Applying_s_second_fad, __pyx_k_set_volume_Applying_s_second_fad, sizeof(__pyx_k_set_volume_Applying_s_second_fad), 0, 1, 0, 0},
   {&__pyx_kp_u_set_volume_Interrupting_an_exist, __pyx_k_set_volume_Interrupting_an_exist, sizeof(__pyx_k_set_volume_Interrupting_an_exist), 0, 1, 0, 0},
   {&__pyx_n_s_setstate, __pyx_k_setstate, sizeof(__pyx_k_setstate), 0, 0, 1, 1},
   {&__pyx_n_s_setstate_cython, __pyx_k_setstate_cython, sizeof(__pyx_k_setstate_cython), 0, 0, 1, 1},
+  {&__pyx_n_s_source, __pyx_k_source, sizeof(__pyx_k_source), 0, 0, 1, 1},
+  {&__pyx_n_s_start, __pyx_k_start, sizeof(__pyx_k_start), 0, 0, 1, 1},
   {&__pyx_kp_u_stop_Action_may_only_be_used_whe, __pyx_k_stop_Action_may_only_be_used_whe, sizeof(__pyx_k_stop_Action_may_only_be_used_whe), 0, 1, 0, 0},
   {&__pyx_kp_u_stop_Applying_s_second_fade_out, __pyx_k_stop_Applying_s_second_fade_out, sizeof(__pyx_k_stop_Applying_s_second_fade_out), 0, 1, 0, 0},
   {&__pyx_kp_u_stop_Stop_sound_processing_on_tr, __pyx_k_stop_Stop_sound_processing_on_tr, sizeof(__pyx_k_stop_Stop_sound_processing_on_tr), 0, 1, 0, 0},
   {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
+  {&__pyx_n_s_time, __pyx_k_time, sizeof(__pyx_k_time), 0, 0, 1, 1},
   {&__pyx_n_s_track, __pyx_k_track, sizeof(__pyx_k_track), 0, 0, 1, 1},
+  {&__pyx_n_s_track_buffers, __pyx_k_track_buffers, sizeof(__pyx_k_track_buffers), 0, 0, 1, 1},
+  {&__pyx_n_s_track_count, __pyx_k_track_count, sizeof(__pyx_k_track_count), 0, 0, 1, 1},
   {&__pyx_n_s_track_num, __pyx_k_track_num, sizeof(__pyx_k_track_num), 0, 0, 1, 1},
   {&__pyx_n_s_volume, __pyx_k_volume, sizeof(__pyx_k_volume), 0, 0, 1, 1},
   {&__pyx_n_s_warning, __pyx_k_warning, sizeof(__pyx_k_warning), 0, 0, 1, 1},
   {0, 0, 0, 0, 0, 0, 0}
 };
 static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
-  __pyx_builtin_round = __Pyx_GetBuiltinName(__pyx_n_s_round); if (!__pyx_builtin_round) __PYX_ERR(0, 97, __pyx_L1_error)
-  __pyx_builtin_NotImplementedError = __Pyx_GetBuiltinName(__pyx_n_s_NotImplementedError); if (!__pyx_builtin_NotImplementedError) __PYX_ERR(0, 101, __pyx_L1_error)
+  __pyx_builtin_round = __Pyx_GetBuiltinName(__pyx_n_s_round); if (!__pyx_builtin_round) __PYX_ERR(0, 117, __pyx_L1_error)
+  __pyx_builtin_NotImplementedError = __Pyx_GetBuiltinName(__pyx_n_s_NotImplementedError); if (!__pyx_builtin_NotImplementedError) __PYX_ERR(0, 138, __pyx_L1_error)
+  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 467, __pyx_L1_error)
   __pyx_builtin_TypeError = __Pyx_GetBuiltinName(__pyx_n_s_TypeError); if (!__pyx_builtin_TypeError) __PYX_ERR(1, 2, __pyx_L1_error)
   return 0;
   __pyx_L1_error:;
@@ -8056,14 +9670,14 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
 
-  /* "mpfmc/core/audio/track.pyx":101
+  /* "mpfmc/core/audio/track.pyx":138
  *     @property
  *     def type(self):
  *         raise NotImplementedError('Must be overridden in derived class')             # <<<<<<<<<<<<<<
  * 
  *     @property
  */
-  __pyx_tuple_ = PyTuple_Pack(1, __pyx_kp_u_Must_be_overridden_in_derived_cl); if (unlikely(!__pyx_tuple_)) __PYX_ERR(0, 101, __pyx_L1_error)
+  __pyx_tuple_ = PyTuple_Pack(1, __pyx_kp_u_Must_be_overridden_in_derived_cl); if (unlikely(!__pyx_tuple_)) __PYX_ERR(0, 138, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple_);
   __Pyx_GIVEREF(__pyx_tuple_);
 
@@ -8085,6 +9699,18 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
   __pyx_tuple__3 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__3)) __PYX_ERR(1, 4, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__3);
   __Pyx_GIVEREF(__pyx_tuple__3);
+
+  /* "mpfmc/core/audio/track.pyx":598
+ * #    Mixing benchmark
+ * # ---------------------------------------------------------------------------
+ * def benchmark_mix_bus(int track_count, int buffer_samples=2048, int channels=2, int iterations=1000):             # <<<<<<<<<<<<<<
+ *     """
+ *     Measures the mixing path of the audio callback without an audio device.
+ */
+  __pyx_tuple__4 = PyTuple_Pack(18, __pyx_n_s_track_count, __pyx_n_s_buffer_samples, __pyx_n_s_channels, __pyx_n_s_iterations, __pyx_n_s_sample_count, __pyx_n_s_buffer_length, __pyx_n_s_chunk_samples, __pyx_n_s_source, __pyx_n_s_output, __pyx_n_s_bus, __pyx_n_s_dither, __pyx_n_s_track_buffers, __pyx_n_s_i, __pyx_n_s_iteration, __pyx_n_s_track_num, __pyx_n_s_control_point, __pyx_n_s_start, __pyx_n_s_duration); if (unlikely(!__pyx_tuple__4)) __PYX_ERR(0, 598, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__4);
+  __Pyx_GIVEREF(__pyx_tuple__4);
+  __pyx_codeobj__5 = (PyObject*)__Pyx_PyCode_New(4, 0, 18, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__4, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_mpfmc_core_audio_track_pyx, __pyx_n_s_benchmark_mix_bus, 598, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__5)) __PYX_ERR(0, 598, __pyx_L1_error)
   __Pyx_RefNannyFinishContext();
   return 0;
   __pyx_L1_error:;
@@ -8093,7 +9719,8 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
 }
 
 static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void) {
-  if (__Pyx_InitStrings(__pyx_string_tab) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
+  if (__Pyx_InitStrings(__pyx_string_tab) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_0 = PyInt_FromLong(0); if (unlikely(!__pyx_int_0)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_int_2 = PyInt_FromLong(2); if (unlikely(!__pyx_int_2)) __PYX_ERR(0, 1, __pyx_L1_error)
   return 0;
   __pyx_L1_error:;
@@ -8134,25 +9761,30 @@ static int __Pyx_modinit_function_export_code(void) {
 
 static int __Pyx_modinit_type_init_code(void) {
   __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__Pyx_modinit_type_init_code", 0);
   /*--- Type init code ---*/
   __pyx_vtabptr_5mpfmc_4core_5audio_5track_Track = &__pyx_vtable_5mpfmc_4core_5audio_5track_Track;
   __pyx_vtable_5mpfmc_4core_5audio_5track_Track.get_state = (__pyx_t_5mpfmc_4core_5audio_5track_TrackState *(*)(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *))__pyx_f_5mpfmc_4core_5audio_5track_5Track_get_state;
-  __pyx_vtable_5mpfmc_4core_5audio_5track_Track.mix_track_to_output = (void (*)(__pyx_t_5mpfmc_4core_5audio_5track_TrackState *, __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData *, Uint8 *, Uint32))__pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output;
-  __pyx_vtable_5mpfmc_4core_5audio_5track_Track.mix_audio = (void (*)(Uint8 *, Uint8 const *, Uint32, int))__pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_audio;
-  __pyx_vtable_5mpfmc_4core_5audio_5track_Track.mix_audio_stereo = (void (*)(Uint8 *, Uint8 const *, Uint32, int, int))__pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_audio_stereo;
+  __pyx_vtable_5mpfmc_4core_5audio_5track_Track.mix_track_to_output = (void (*)(__pyx_t_5mpfmc_4core_5audio_5track_TrackState *, __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData *, float *, Uint32))__pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output;
+  __pyx_vtable_5mpfmc_4core_5audio_5track_Track.mix_audio = (void (*)(float *, Uint8 const *, Uint32, int))__pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_audio;
+  __pyx_vtable_5mpfmc_4core_5audio_5track_Track.mix_audio_stereo = (void (*)(float *, Uint8 const *, Uint32, int, int))__pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_audio_stereo;
+  __pyx_vtable_5mpfmc_4core_5audio_5track_Track.mix_bus = (void (*)(float *, float const *, Uint32, float))__pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_bus;
+  __pyx_vtable_5mpfmc_4core_5audio_5track_Track.write_bus_to_output = (void (*)(Uint8 *, float const *, float const *, Uint32, float))__pyx_f_5mpfmc_4core_5audio_5track_5Track_write_bus_to_output;
   __pyx_vtable_5mpfmc_4core_5audio_5track_Track.apply_volume = (void (*)(Uint8 *, Uint8 const *, Uint32, int))__pyx_f_5mpfmc_4core_5audio_5track_5Track_apply_volume;
   __pyx_vtable_5mpfmc_4core_5audio_5track_Track.apply_volume_stereo = (void (*)(Uint8 *, Uint8 const *, Uint32, int, int))__pyx_f_5mpfmc_4core_5audio_5track_5Track_apply_volume_stereo;
-  if (PyType_Ready(&__pyx_type_5mpfmc_4core_5audio_5track_Track) < 0) __PYX_ERR(0, 23, __pyx_L1_error)
+  if (PyType_Ready(&__pyx_type_5mpfmc_4core_5audio_5track_Track) < 0) __PYX_ERR(0, 25, __pyx_L1_error)
   #if PY_VERSION_HEX < 0x030800B1
   __pyx_type_5mpfmc_4core_5audio_5track_Track.tp_print = 0;
   #endif
   if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_5mpfmc_4core_5audio_5track_Track.tp_dictoffset && __pyx_type_5mpfmc_4core_5audio_5track_Track.tp_getattro == PyObject_GenericGetAttr)) {
     __pyx_type_5mpfmc_4core_5audio_5track_Track.tp_getattro = __Pyx_PyObject_GenericGetAttr;
   }
-  #if CYTHON_COMPILING_IN_CPYTHON
+  #if CYTHON_UPDATE_DESCRIPTOR_DOC
   {
-    PyObject *wrapper = PyObject_GetAttrString((PyObject *)&__pyx_type_5mpfmc_4core_5audio_5track_Track, "__init__"); if (unlikely(!wrapper)) __PYX_ERR(0, 23, __pyx_L1_error)
+    PyObject *wrapper = PyObject_GetAttrString((PyObject *)&__pyx_type_5mpfmc_4core_5audio_5track_Track, "__init__"); if (unlikely(!wrapper)) __PYX_ERR(0, 25, __pyx_L1_error)
     if (Py_TYPE(wrapper) == &PyWrapperDescr_Type) {
       __pyx_wrapperbase_5mpfmc_4core_5audio_5track_5Track_2__init__ = *((PyWrapperDescrObject *)wrapper)->d_base;
       __pyx_wrapperbase_5mpfmc_4core_5audio_5track_5Track_2__init__.doc = __pyx_doc_5mpfmc_4core_5audio_5track_5Track_2__init__;
@@ -8160,9 +9792,9 @@ static int __Pyx_modinit_type_init_code(void) {
     }
   }
   #endif
-  if (__Pyx_SetVtable(__pyx_type_5mpfmc_4core_5audio_5track_Track.tp_dict, __pyx_vtabptr_5mpfmc_4core_5audio_5track_Track) < 0) __PYX_ERR(0, 23, __pyx_L1_error)
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_Track, (PyObject *)&__pyx_type_5mpfmc_4core_5audio_5track_Track) < 0) __PYX_ERR(0, 23, __pyx_L1_error)
-  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_5mpfmc_4core_5audio_5track_Track) < 0) __PYX_ERR(0, 23, __pyx_L1_error)
+  if (__Pyx_SetVtable(__pyx_type_5mpfmc_4core_5audio_5track_Track.tp_dict, __pyx_vtabptr_5mpfmc_4core_5audio_5track_Track) < 0) __PYX_ERR(0, 25, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_Track, (PyObject *)&__pyx_type_5mpfmc_4core_5audio_5track_Track) < 0) __PYX_ERR(0, 25, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_5mpfmc_4core_5audio_5track_Track) < 0) __PYX_ERR(0, 25, __pyx_L1_error)
   __pyx_ptype_5mpfmc_4core_5audio_5track_Track = &__pyx_type_5mpfmc_4core_5audio_5track_Track;
   __Pyx_RefNannyFinishContext();
   return 0;
@@ -8196,17 +9828,19 @@ static int __Pyx_modinit_function_import_code(void) {
 }
 
 
-#if PY_MAJOR_VERSION < 3
-#ifdef CYTHON_NO_PYINIT_EXPORT
-#define __Pyx_PyMODINIT_FUNC void
-#else
+#ifndef CYTHON_NO_PYINIT_EXPORT
 #define __Pyx_PyMODINIT_FUNC PyMODINIT_FUNC
+#elif PY_MAJOR_VERSION < 3
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" void
+#else
+#define __Pyx_PyMODINIT_FUNC void
 #endif
 #else
-#ifdef CYTHON_NO_PYINIT_EXPORT
-#define __Pyx_PyMODINIT_FUNC PyObject *
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" PyObject *
 #else
-#define __Pyx_PyMODINIT_FUNC PyMODINIT_FUNC
+#define __Pyx_PyMODINIT_FUNC PyObject *
 #endif
 #endif
 
@@ -8288,6 +9922,9 @@ static CYTHON_SMALL_CODE int __pyx_pymod_exec_track(PyObject *__pyx_pyinit_modul
 #endif
 {
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannyDeclarations
   #if CYTHON_PEP489_MULTI_PHASE_INIT
   if (__pyx_m) {
@@ -8335,11 +9972,9 @@ if (!__Pyx_RefNanny) {
   #endif
   /*--- Library function declarations ---*/
   /*--- Threads initialization code ---*/
-  #if defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
-  #ifdef WITH_THREAD /* Python build with threading support? */
+  #if defined(WITH_THREAD) && PY_VERSION_HEX < 0x030700F0 && defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
   PyEval_InitThreads();
   #endif
-  #endif
   /*--- Module creation code ---*/
   #if CYTHON_PEP489_MULTI_PHASE_INIT
   __pyx_m = __pyx_pyinit_module;
@@ -8358,7 +9993,7 @@ if (!__Pyx_RefNanny) {
   Py_INCREF(__pyx_b);
   __pyx_cython_runtime = PyImport_AddModule((char *) "cython_runtime"); if (unlikely(!__pyx_cython_runtime)) __PYX_ERR(0, 1, __pyx_L1_error)
   Py_INCREF(__pyx_cython_runtime);
-  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
+  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   /*--- Initialize various global constants etc. ---*/
   if (__Pyx_InitGlobals() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   #if PY_MAJOR_VERSION < 3 && (__PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT)
@@ -8383,7 +10018,7 @@ if (!__Pyx_RefNanny) {
   (void)__Pyx_modinit_global_init_code();
   (void)__Pyx_modinit_variable_export_code();
   (void)__Pyx_modinit_function_export_code();
-  if (unlikely(__Pyx_modinit_type_init_code() != 0)) goto __pyx_L1_error;
+  if (unlikely(__Pyx_modinit_type_init_code() < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
   (void)__Pyx_modinit_type_import_code();
   (void)__Pyx_modinit_variable_import_code();
   (void)__Pyx_modinit_function_import_code();
@@ -8392,16 +10027,40 @@ if (!__Pyx_RefNanny) {
   if (__Pyx_patch_abc() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   #endif
 
-  /* "mpfmc/core/audio/track.pyx":6
- * from cpython.mem cimport PyMem_Malloc, PyMem_Realloc, PyMem_Free
+  /* "mpfmc/core/audio/track.pyx":7
+ * from libc.string cimport memset
  * cimport cpython.pycapsule as pycapsule
  * import logging             # <<<<<<<<<<<<<<
+ * import time
+ * 
+ */
+  __pyx_t_1 = __Pyx_Import(__pyx_n_s_logging, 0, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 7, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_logging, __pyx_t_1) < 0) __PYX_ERR(0, 7, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "mpfmc/core/audio/track.pyx":8
+ * cimport cpython.pycapsule as pycapsule
+ * import logging
+ * import time             # <<<<<<<<<<<<<<
  * 
  * from mpfmc.core.audio.sdl2 cimport *
  */
-  __pyx_t_1 = __Pyx_Import(__pyx_n_s_logging, 0, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 6, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_Import(__pyx_n_s_time, 0, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 8, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_time, __pyx_t_1) < 0) __PYX_ERR(0, 8, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "mpfmc/core/audio/track.pyx":598
+ * #    Mixing benchmark
+ * # ---------------------------------------------------------------------------
+ * def benchmark_mix_bus(int track_count, int buffer_samples=2048, int channels=2, int iterations=1000):             # <<<<<<<<<<<<<<
+ *     """
+ *     Measures the mixing path of the audio callback without an audio device.
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_5mpfmc_4core_5audio_5track_1benchmark_mix_bus, NULL, __pyx_n_s_mpfmc_core_audio_track); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 598, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_logging, __pyx_t_1) < 0) __PYX_ERR(0, 6, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_benchmark_mix_bus, __pyx_t_1) < 0) __PYX_ERR(0, 598, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
   /* "mpfmc/core/audio/track.pyx":1
@@ -8414,8 +10073,8 @@ if (!__Pyx_RefNanny) {
   if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_1) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/notification_message.pxd":219
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+  /* "mpfmc/core/audio/notification_message.pxd":311
+ *         _send_notification_message(track)
  * 
  * cdef inline void send_sound_loop_set_looping_notification(int sound_loop_set_id, Uint64 sound_id, gpointer player, TrackState *track) nogil:             # <<<<<<<<<<<<<<
  *     """
@@ -8594,7 +10253,7 @@ static int __Pyx_ParseOptionalKeywords(
         }
         name = first_kw_arg;
         #if PY_MAJOR_VERSION < 3
-        if (likely(PyString_CheckExact(key)) || likely(PyString_Check(key))) {
+        if (likely(PyString_Check(key))) {
             while (*name) {
                 if ((CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**name) == PyString_GET_SIZE(key))
                         && _PyString_Eq(**name, key)) {
@@ -8621,7 +10280,7 @@ static int __Pyx_ParseOptionalKeywords(
             while (*name) {
                 int cmp = (**name == key) ? 0 :
                 #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
-                    (PyUnicode_GET_SIZE(**name) != PyUnicode_GET_SIZE(key)) ? 1 :
+                    (__Pyx_PyUnicode_GET_LENGTH(**name) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
                 #endif
                     PyUnicode_Compare(**name, key);
                 if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
@@ -8637,7 +10296,7 @@ static int __Pyx_ParseOptionalKeywords(
                 while (argname != first_kw_arg) {
                     int cmp = (**argname == key) ? 0 :
                     #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
-                        (PyUnicode_GET_SIZE(**argname) != PyUnicode_GET_SIZE(key)) ? 1 :
+                        (__Pyx_PyUnicode_GET_LENGTH(**argname) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
                     #endif
                         PyUnicode_Compare(**argname, key);
                     if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
@@ -8810,7 +10469,7 @@ static PyObject* __Pyx_PyFunction_FastCallNoKw(PyCodeObject *co, PyObject **args
     return result;
 }
 #if 1 || PY_VERSION_HEX < 0x030600B1
-static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, int nargs, PyObject *kwargs) {
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs) {
     PyCodeObject *co = (PyCodeObject *)PyFunction_GET_CODE(func);
     PyObject *globals = PyFunction_GET_GLOBALS(func);
     PyObject *argdefs = PyFunction_GET_DEFAULTS(func);
@@ -8881,12 +10540,12 @@ static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args,
     }
 #if PY_MAJOR_VERSION >= 3
     result = PyEval_EvalCodeEx((PyObject*)co, globals, (PyObject *)NULL,
-                               args, nargs,
+                               args, (int)nargs,
                                k, (int)nk,
                                d, (int)nd, kwdefs, closure);
 #else
     result = PyEval_EvalCodeEx(co, globals, (PyObject *)NULL,
-                               args, nargs,
+                               args, (int)nargs,
                                k, (int)nk,
                                d, (int)nd, closure);
 #endif
@@ -8902,7 +10561,7 @@ done:
 #if CYTHON_COMPILING_IN_CPYTHON
 static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw) {
     PyObject *result;
-    ternaryfunc call = func->ob_type->tp_call;
+    ternaryfunc call = Py_TYPE(func)->tp_call;
     if (unlikely(!call))
         return PyObject_Call(func, arg, kw);
     if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
@@ -8989,7 +10648,7 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObjec
         if (likely(PyCFunction_GET_FLAGS(func) & METH_O)) {
             return __Pyx_PyObject_CallMethO(func, arg);
 #if CYTHON_FAST_PYCCALL
-        } else if (PyCFunction_GET_FLAGS(func) & METH_FASTCALL) {
+        } else if (__Pyx_PyFastCFunction_Check(func)) {
             return __Pyx_PyCFunction_FastCall(func, &arg, 1);
 #endif
         }
@@ -9168,13 +10827,7 @@ static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject
     }
     PyErr_SetObject(type, value);
     if (tb) {
-#if CYTHON_COMPILING_IN_PYPY
-        PyObject *tmp_type, *tmp_value, *tmp_tb;
-        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
-        Py_INCREF(tb);
-        PyErr_Restore(tmp_type, tmp_value, tb);
-        Py_XDECREF(tmp_tb);
-#else
+#if CYTHON_FAST_THREAD_STATE
         PyThreadState *tstate = __Pyx_PyThreadState_Current;
         PyObject* tmp_tb = tstate->curexc_traceback;
         if (tb != tmp_tb) {
@@ -9182,6 +10835,12 @@ static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject
             tstate->curexc_traceback = tb;
             Py_XDECREF(tmp_tb);
         }
+#else
+        PyObject *tmp_type, *tmp_value, *tmp_tb;
+        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
+        Py_INCREF(tb);
+        PyErr_Restore(tmp_type, tmp_value, tb);
+        Py_XDECREF(tmp_tb);
 #endif
     }
 bad:
@@ -9190,7 +10849,7 @@ bad:
 }
 #endif
 
-/* None */
+/* DivInt[int] */
 static CYTHON_INLINE int __Pyx_div_int(int a, int b) {
     int q = a / b;
     int r = a - q*b;
@@ -9209,9 +10868,7 @@ static void __Pyx_WriteUnraisable(const char *name, CYTHON_UNUSED int clineno,
     PyGILState_STATE state;
     if (nogil)
         state = PyGILState_Ensure();
-#ifdef _MSC_VER
-    else state = (PyGILState_STATE)-1;
-#endif
+    else state = (PyGILState_STATE)0;
 #endif
     __Pyx_PyThreadState_assign
     __Pyx_ErrFetch(&old_exc, &old_val, &old_tb);
@@ -9240,6 +10897,28 @@ static void __Pyx_WriteUnraisable(const char *name, CYTHON_UNUSED int clineno,
 #endif
 }
 
+/* PyObjectCallNoArg */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func) {
+#if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(func)) {
+        return __Pyx_PyFunction_FastCall(func, NULL, 0);
+    }
+#endif
+#if defined(__Pyx_CyFunction_USED) && defined(NDEBUG)
+    if (likely(PyCFunction_Check(func) || __Pyx_CyFunction_Check(func)))
+#else
+    if (likely(PyCFunction_Check(func)))
+#endif
+    {
+        if (likely(PyCFunction_GET_FLAGS(func) & METH_NOARGS)) {
+            return __Pyx_PyObject_CallMethO(func, NULL);
+        }
+    }
+    return __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL);
+}
+#endif
+
 /* PyObject_GenericGetAttrNoDict */
 #if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
 static PyObject *__Pyx_RaiseGenericGetAttributeError(PyTypeObject *tp, PyObject *attr_name) {
@@ -9308,6 +10987,53 @@ bad:
     return -1;
 }
 
+/* PyErrExceptionMatches */
+#if CYTHON_FAST_THREAD_STATE
+static int __Pyx_PyErr_ExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    n = PyTuple_GET_SIZE(tuple);
+#if PY_MAJOR_VERSION >= 3
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+#endif
+    for (i=0; i<n; i++) {
+        if (__Pyx_PyErr_GivenExceptionMatches(exc_type, PyTuple_GET_ITEM(tuple, i))) return 1;
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err) {
+    PyObject *exc_type = tstate->curexc_type;
+    if (exc_type == err) return 1;
+    if (unlikely(!exc_type)) return 0;
+    if (unlikely(PyTuple_Check(err)))
+        return __Pyx_PyErr_ExceptionMatchesTuple(exc_type, err);
+    return __Pyx_PyErr_GivenExceptionMatches(exc_type, err);
+}
+#endif
+
+/* PyObjectGetAttrStrNoError */
+static void __Pyx_PyObject_GetAttrStr_ClearAttributeError(void) {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    if (likely(__Pyx_PyErr_ExceptionMatches(PyExc_AttributeError)))
+        __Pyx_PyErr_Clear();
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name) {
+    PyObject *result;
+#if CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_TYPE_SLOTS && PY_VERSION_HEX >= 0x030700B1
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro == PyObject_GenericGetAttr)) {
+        return _PyObject_GenericGetAttrWithDict(obj, attr_name, NULL, 1);
+    }
+#endif
+    result = __Pyx_PyObject_GetAttrStr(obj, attr_name);
+    if (unlikely(!result)) {
+        __Pyx_PyObject_GetAttrStr_ClearAttributeError();
+    }
+    return result;
+}
+
 /* SetupReduce */
 static int __Pyx_setup_reduce_is_named(PyObject* meth, PyObject* name) {
   int ret;
@@ -9328,53 +11054,81 @@ static int __Pyx_setup_reduce_is_named(PyObject* meth, PyObject* name) {
 static int __Pyx_setup_reduce(PyObject* type_obj) {
     int ret = 0;
     PyObject *object_reduce = NULL;
+    PyObject *object_getstate = NULL;
     PyObject *object_reduce_ex = NULL;
     PyObject *reduce = NULL;
     PyObject *reduce_ex = NULL;
     PyObject *reduce_cython = NULL;
     PyObject *setstate = NULL;
     PyObject *setstate_cython = NULL;
+    PyObject *getstate = NULL;
+#if CYTHON_USE_PYTYPE_LOOKUP
+    getstate = _PyType_Lookup((PyTypeObject*)type_obj, __pyx_n_s_getstate);
+#else
+    getstate = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_getstate);
+    if (!getstate && PyErr_Occurred()) {
+        goto __PYX_BAD;
+    }
+#endif
+    if (getstate) {
 #if CYTHON_USE_PYTYPE_LOOKUP
-    if (_PyType_Lookup((PyTypeObject*)type_obj, __pyx_n_s_getstate)) goto GOOD;
+        object_getstate = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_getstate);
 #else
-    if (PyObject_HasAttr(type_obj, __pyx_n_s_getstate)) goto GOOD;
+        object_getstate = __Pyx_PyObject_GetAttrStrNoError((PyObject*)&PyBaseObject_Type, __pyx_n_s_getstate);
+        if (!object_getstate && PyErr_Occurred()) {
+            goto __PYX_BAD;
+        }
 #endif
+        if (object_getstate != getstate) {
+            goto __PYX_GOOD;
+        }
+    }
 #if CYTHON_USE_PYTYPE_LOOKUP
-    object_reduce_ex = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_reduce_ex); if (!object_reduce_ex) goto BAD;
+    object_reduce_ex = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_reduce_ex); if (!object_reduce_ex) goto __PYX_BAD;
 #else
-    object_reduce_ex = __Pyx_PyObject_GetAttrStr((PyObject*)&PyBaseObject_Type, __pyx_n_s_reduce_ex); if (!object_reduce_ex) goto BAD;
+    object_reduce_ex = __Pyx_PyObject_GetAttrStr((PyObject*)&PyBaseObject_Type, __pyx_n_s_reduce_ex); if (!object_reduce_ex) goto __PYX_BAD;
 #endif
-    reduce_ex = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce_ex); if (unlikely(!reduce_ex)) goto BAD;
+    reduce_ex = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce_ex); if (unlikely(!reduce_ex)) goto __PYX_BAD;
     if (reduce_ex == object_reduce_ex) {
 #if CYTHON_USE_PYTYPE_LOOKUP
-        object_reduce = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_reduce); if (!object_reduce) goto BAD;
+        object_reduce = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_reduce); if (!object_reduce) goto __PYX_BAD;
 #else
-        object_reduce = __Pyx_PyObject_GetAttrStr((PyObject*)&PyBaseObject_Type, __pyx_n_s_reduce); if (!object_reduce) goto BAD;
+        object_reduce = __Pyx_PyObject_GetAttrStr((PyObject*)&PyBaseObject_Type, __pyx_n_s_reduce); if (!object_reduce) goto __PYX_BAD;
 #endif
-        reduce = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce); if (unlikely(!reduce)) goto BAD;
+        reduce = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce); if (unlikely(!reduce)) goto __PYX_BAD;
         if (reduce == object_reduce || __Pyx_setup_reduce_is_named(reduce, __pyx_n_s_reduce_cython)) {
-            reduce_cython = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce_cython); if (unlikely(!reduce_cython)) goto BAD;
-            ret = PyDict_SetItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_reduce, reduce_cython); if (unlikely(ret < 0)) goto BAD;
-            ret = PyDict_DelItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_reduce_cython); if (unlikely(ret < 0)) goto BAD;
+            reduce_cython = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_reduce_cython);
+            if (likely(reduce_cython)) {
+                ret = PyDict_SetItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_reduce, reduce_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                ret = PyDict_DelItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_reduce_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+            } else if (reduce == object_reduce || PyErr_Occurred()) {
+                goto __PYX_BAD;
+            }
             setstate = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_setstate);
             if (!setstate) PyErr_Clear();
             if (!setstate || __Pyx_setup_reduce_is_named(setstate, __pyx_n_s_setstate_cython)) {
-                setstate_cython = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_setstate_cython); if (unlikely(!setstate_cython)) goto BAD;
-                ret = PyDict_SetItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_setstate, setstate_cython); if (unlikely(ret < 0)) goto BAD;
-                ret = PyDict_DelItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_setstate_cython); if (unlikely(ret < 0)) goto BAD;
+                setstate_cython = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_setstate_cython);
+                if (likely(setstate_cython)) {
+                    ret = PyDict_SetItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_setstate, setstate_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                    ret = PyDict_DelItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_setstate_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                } else if (!setstate || PyErr_Occurred()) {
+                    goto __PYX_BAD;
+                }
             }
             PyType_Modified((PyTypeObject*)type_obj);
         }
     }
-    goto GOOD;
-BAD:
+    goto __PYX_GOOD;
+__PYX_BAD:
     if (!PyErr_Occurred())
         PyErr_Format(PyExc_RuntimeError, "Unable to initialize pickling for %s", ((PyTypeObject*)type_obj)->tp_name);
     ret = -1;
-GOOD:
+__PYX_GOOD:
 #if !CYTHON_USE_PYTYPE_LOOKUP
     Py_XDECREF(object_reduce);
     Py_XDECREF(object_reduce_ex);
+    Py_XDECREF(object_getstate);
+    Py_XDECREF(getstate);
 #endif
     Py_XDECREF(reduce);
     Py_XDECREF(reduce_ex);
@@ -9414,7 +11168,7 @@ static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level) {
     {
         #if PY_MAJOR_VERSION >= 3
         if (level == -1) {
-            if (strchr(__Pyx_MODULE_NAME, '.')) {
+            if ((1) && (strchr(__Pyx_MODULE_NAME, '.'))) {
                 module = PyImport_ImportModuleLevelObject(
                     name, global_dict, empty_dict, list, 1);
                 if (!module) {
@@ -9451,7 +11205,7 @@ bad:
 
 /* CLineInTraceback */
 #ifndef CYTHON_CLINE_IN_TRACEBACK
-static int __Pyx_CLineForTraceback(PyThreadState *tstate, int c_line) {
+static int __Pyx_CLineForTraceback(CYTHON_UNUSED PyThreadState *tstate, int c_line) {
     PyObject *use_cline;
     PyObject *ptype, *pvalue, *ptraceback;
 #if CYTHON_COMPILING_IN_CPYTHON
@@ -9481,7 +11235,7 @@ static int __Pyx_CLineForTraceback(PyThreadState *tstate, int c_line) {
     }
     if (!use_cline) {
         c_line = 0;
-        PyObject_SetAttr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback, Py_False);
+        (void) PyObject_SetAttr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback, Py_False);
     }
     else if (use_cline == Py_False || (use_cline != Py_True && PyObject_Not(use_cline) != 0)) {
         c_line = 0;
@@ -9555,7 +11309,7 @@ static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object) {
     if (__pyx_code_cache.count == __pyx_code_cache.max_count) {
         int new_max = __pyx_code_cache.max_count + 64;
         entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Realloc(
-            __pyx_code_cache.entries, (size_t)new_max*sizeof(__Pyx_CodeObjectCacheEntry));
+            __pyx_code_cache.entries, ((size_t)new_max) * sizeof(__Pyx_CodeObjectCacheEntry));
         if (unlikely(!entries)) {
             return;
         }
@@ -9575,33 +11329,40 @@ static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object) {
 #include "compile.h"
 #include "frameobject.h"
 #include "traceback.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
 static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
             const char *funcname, int c_line,
             int py_line, const char *filename) {
-    PyCodeObject *py_code = 0;
-    PyObject *py_srcfile = 0;
-    PyObject *py_funcname = 0;
+    PyCodeObject *py_code = NULL;
+    PyObject *py_funcname = NULL;
     #if PY_MAJOR_VERSION < 3
+    PyObject *py_srcfile = NULL;
     py_srcfile = PyString_FromString(filename);
-    #else
-    py_srcfile = PyUnicode_FromString(filename);
-    #endif
     if (!py_srcfile) goto bad;
+    #endif
     if (c_line) {
         #if PY_MAJOR_VERSION < 3
         py_funcname = PyString_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
         #else
         py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        funcname = PyUnicode_AsUTF8(py_funcname);
+        if (!funcname) goto bad;
         #endif
     }
     else {
         #if PY_MAJOR_VERSION < 3
         py_funcname = PyString_FromString(funcname);
-        #else
-        py_funcname = PyUnicode_FromString(funcname);
+        if (!py_funcname) goto bad;
         #endif
     }
-    if (!py_funcname) goto bad;
+    #if PY_MAJOR_VERSION < 3
     py_code = __Pyx_PyCode_New(
         0,
         0,
@@ -9620,11 +11381,16 @@ static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
         __pyx_empty_bytes  /*PyObject *lnotab*/
     );
     Py_DECREF(py_srcfile);
-    Py_DECREF(py_funcname);
+    #else
+    py_code = PyCode_NewEmpty(filename, funcname, py_line);
+    #endif
+    Py_XDECREF(py_funcname);  // XDECREF since it's only set on Py3 if cline
     return py_code;
 bad:
-    Py_XDECREF(py_srcfile);
     Py_XDECREF(py_funcname);
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(py_srcfile);
+    #endif
     return NULL;
 }
 static void __Pyx_AddTraceback(const char *funcname, int c_line,
@@ -9632,14 +11398,24 @@ static void __Pyx_AddTraceback(const char *funcname, int c_line,
     PyCodeObject *py_code = 0;
     PyFrameObject *py_frame = 0;
     PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject *ptype, *pvalue, *ptraceback;
     if (c_line) {
         c_line = __Pyx_CLineForTraceback(tstate, c_line);
     }
     py_code = __pyx_find_code_object(c_line ? -c_line : py_line);
     if (!py_code) {
+        __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
         py_code = __Pyx_CreateCodeObjectForTraceback(
             funcname, c_line, py_line, filename);
-        if (!py_code) goto bad;
+        if (!py_code) {
+            /* If the code object creation fails, then we should clear the
+               fetched exception references and propagate the new exception */
+            Py_XDECREF(ptype);
+            Py_XDECREF(pvalue);
+            Py_XDECREF(ptraceback);
+            goto bad;
+        }
+        __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
         __pyx_insert_code_object(c_line ? -c_line : py_line, py_code);
     }
     py_frame = PyFrame_New(
@@ -9678,40 +11454,16 @@ bad:
         return (target_type) value;\
     }
 
-/* CIntToPy */
-static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
-    const int neg_one = (int) ((int) 0 - (int) 1), const_zero = (int) 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (is_unsigned) {
-        if (sizeof(int) < sizeof(long)) {
-            return PyInt_FromLong((long) value);
-        } else if (sizeof(int) <= sizeof(unsigned long)) {
-            return PyLong_FromUnsignedLong((unsigned long) value);
-#ifdef HAVE_LONG_LONG
-        } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
-            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
-#endif
-        }
-    } else {
-        if (sizeof(int) <= sizeof(long)) {
-            return PyInt_FromLong((long) value);
-#ifdef HAVE_LONG_LONG
-        } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
-            return PyLong_FromLongLong((PY_LONG_LONG) value);
-#endif
-        }
-    }
-    {
-        int one = 1; int little = (int)*(unsigned char *)&one;
-        unsigned char *bytes = (unsigned char *)&value;
-        return _PyLong_FromByteArray(bytes, sizeof(int),
-                                     little, !is_unsigned);
-    }
-}
-
 /* CIntFromPy */
 static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
-    const int neg_one = (int) ((int) 0 - (int) 1), const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
     const int is_unsigned = neg_one > const_zero;
 #if PY_MAJOR_VERSION < 3
     if (likely(PyInt_Check(x))) {
@@ -9762,7 +11514,7 @@ static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
                     break;
             }
 #endif
-#if CYTHON_COMPILING_IN_CPYTHON
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
             if (unlikely(Py_SIZE(x) < 0)) {
                 goto raise_neg_overflow;
             }
@@ -9898,9 +11650,288 @@ raise_neg_overflow:
     return (int) -1;
 }
 
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_Uint32(Uint32 value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const Uint32 neg_one = (Uint32) -1, const_zero = (Uint32) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(Uint32) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(Uint32) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(Uint32) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(Uint32) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(Uint32) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(Uint32),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(int) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(int) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(int) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(int),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntFromPy */
+static CYTHON_INLINE Uint32 __Pyx_PyInt_As_Uint32(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const Uint32 neg_one = (Uint32) -1, const_zero = (Uint32) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(Uint32) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(Uint32, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (Uint32) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (Uint32) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(Uint32, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(Uint32) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(Uint32, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(Uint32) >= 2 * PyLong_SHIFT) {
+                            return (Uint32) (((((Uint32)digits[1]) << PyLong_SHIFT) | (Uint32)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(Uint32) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(Uint32, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(Uint32) >= 3 * PyLong_SHIFT) {
+                            return (Uint32) (((((((Uint32)digits[2]) << PyLong_SHIFT) | (Uint32)digits[1]) << PyLong_SHIFT) | (Uint32)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(Uint32) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(Uint32, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(Uint32) >= 4 * PyLong_SHIFT) {
+                            return (Uint32) (((((((((Uint32)digits[3]) << PyLong_SHIFT) | (Uint32)digits[2]) << PyLong_SHIFT) | (Uint32)digits[1]) << PyLong_SHIFT) | (Uint32)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (Uint32) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(Uint32) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(Uint32, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(Uint32) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(Uint32, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (Uint32) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(Uint32, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(Uint32,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(Uint32) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(Uint32, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(Uint32) - 1 > 2 * PyLong_SHIFT) {
+                            return (Uint32) (((Uint32)-1)*(((((Uint32)digits[1]) << PyLong_SHIFT) | (Uint32)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(Uint32) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(Uint32, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(Uint32) - 1 > 2 * PyLong_SHIFT) {
+                            return (Uint32) ((((((Uint32)digits[1]) << PyLong_SHIFT) | (Uint32)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(Uint32) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(Uint32, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(Uint32) - 1 > 3 * PyLong_SHIFT) {
+                            return (Uint32) (((Uint32)-1)*(((((((Uint32)digits[2]) << PyLong_SHIFT) | (Uint32)digits[1]) << PyLong_SHIFT) | (Uint32)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(Uint32) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(Uint32, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(Uint32) - 1 > 3 * PyLong_SHIFT) {
+                            return (Uint32) ((((((((Uint32)digits[2]) << PyLong_SHIFT) | (Uint32)digits[1]) << PyLong_SHIFT) | (Uint32)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(Uint32) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(Uint32, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(Uint32) - 1 > 4 * PyLong_SHIFT) {
+                            return (Uint32) (((Uint32)-1)*(((((((((Uint32)digits[3]) << PyLong_SHIFT) | (Uint32)digits[2]) << PyLong_SHIFT) | (Uint32)digits[1]) << PyLong_SHIFT) | (Uint32)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(Uint32) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(Uint32, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(Uint32) - 1 > 4 * PyLong_SHIFT) {
+                            return (Uint32) ((((((((((Uint32)digits[3]) << PyLong_SHIFT) | (Uint32)digits[2]) << PyLong_SHIFT) | (Uint32)digits[1]) << PyLong_SHIFT) | (Uint32)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(Uint32) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(Uint32, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(Uint32) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(Uint32, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            Uint32 val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (Uint32) -1;
+        }
+    } else {
+        Uint32 val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (Uint32) -1;
+        val = __Pyx_PyInt_As_Uint32(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to Uint32");
+    return (Uint32) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to Uint32");
+    return (Uint32) -1;
+}
+
 /* CIntToPy */
 static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
-    const long neg_one = (long) ((long) 0 - (long) 1), const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
     const int is_unsigned = neg_one > const_zero;
     if (is_unsigned) {
         if (sizeof(long) < sizeof(long)) {
@@ -9931,7 +11962,14 @@ static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
 
 /* CIntFromPy */
 static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
-    const long neg_one = (long) ((long) 0 - (long) 1), const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
     const int is_unsigned = neg_one > const_zero;
 #if PY_MAJOR_VERSION < 3
     if (likely(PyInt_Check(x))) {
@@ -9982,7 +12020,7 @@ static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
                     break;
             }
 #endif
-#if CYTHON_COMPILING_IN_CPYTHON
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
             if (unlikely(Py_SIZE(x) < 0)) {
                 goto raise_neg_overflow;
             }
@@ -10220,11 +12258,33 @@ static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObj
 
 /* CheckBinaryVersion */
 static int __Pyx_check_binary_version(void) {
-    char ctversion[4], rtversion[4];
-    PyOS_snprintf(ctversion, 4, "%d.%d", PY_MAJOR_VERSION, PY_MINOR_VERSION);
-    PyOS_snprintf(rtversion, 4, "%s", Py_GetVersion());
-    if (ctversion[0] != rtversion[0] || ctversion[2] != rtversion[2]) {
+    char ctversion[5];
+    int same=1, i, found_dot;
+    const char* rt_from_call = Py_GetVersion();
+    PyOS_snprintf(ctversion, 5, "%d.%d", PY_MAJOR_VERSION, PY_MINOR_VERSION);
+    found_dot = 0;
+    for (i = 0; i < 4; i++) {
+        if (!ctversion[i]) {
+            same = (rt_from_call[i] < '0' || rt_from_call[i] > '9');
+            break;
+        }
+        if (rt_from_call[i] != ctversion[i]) {
+            same = 0;
+            break;
+        }
+    }
+    if (!same) {
+        char rtversion[5] = {'\0'};
         char message[200];
+        for (i=0; i<4; ++i) {
+            if (rt_from_call[i] == '.') {
+                if (found_dot) break;
+                found_dot = 1;
+            } else if (rt_from_call[i] < '0' || rt_from_call[i] > '9') {
+                break;
+            }
+            rtversion[i] = rt_from_call[i];
+        }
         PyOS_snprintf(message, sizeof(message),
                       "compiletime version %s of module '%.100s' "
                       "does not match runtime version %s",
@@ -10482,6 +12542,23 @@ static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
   Py_DECREF(x);
   return ival;
 }
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject* o) {
+  if (sizeof(Py_hash_t) == sizeof(Py_ssize_t)) {
+    return (Py_hash_t) __Pyx_PyIndex_AsSsize_t(o);
+#if PY_MAJOR_VERSION < 3
+  } else if (likely(PyInt_CheckExact(o))) {
+    return PyInt_AS_LONG(o);
+#endif
+  } else {
+    Py_ssize_t ival;
+    PyObject *x;
+    x = PyNumber_Index(o);
+    if (!x) return -1;
+    ival = PyInt_AsLong(x);
+    Py_DECREF(x);
+    return ival;
+  }
+}
 static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b) {
   return b ? __Pyx_NewRef(Py_True) : __Pyx_NewRef(Py_False);
 }
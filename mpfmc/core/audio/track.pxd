@@ -28,6 +28,7 @@ ctypedef struct TrackState:
     # Common track state variables (for all track types)
     AudioCallbackData *callback_data
     void (*mix_callback_function)(TrackState *track, Uint32 buffer_length, AudioCallbackData *callback_data) nogil
+    void (*request_callback_function)(TrackState *track) nogil
     void* type_state
     TrackStatus status
     bint active
@@ -39,8 +40,16 @@ ctypedef struct TrackState:
     Uint32 fade_steps
     Uint32 fade_steps_remaining
     int buffer_size
-    Uint8 *buffer
-    GSList *notification_messages
+    float *buffer
+    bint buffer_is_silent
+    int active_player_count
+    int active_player_peak
+    Uint64 active_player_total
+    Uint64 mix_ticks
+    float mix_load
+    float mix_load_peak
+    void *notification_messages
+    void *request_messages
     bint ducking_is_active
     GArray* ducking_control_points
 
@@ -72,15 +81,22 @@ cdef class Track:
     # ---------------------------------------------------------------------------
     @staticmethod
     cdef void mix_track_to_output(TrackState *track, AudioCallbackData* callback_data,
-                                  Uint8 *output_buffer, Uint32 buffer_length) nogil
+                                  float *output_buffer, Uint32 buffer_length) nogil
 
     @staticmethod
-    cdef void mix_audio(Uint8* output_buffer, const Uint8* input_buffer, Uint32 buffer_length, int volume) nogil
+    cdef void mix_audio(float* output_buffer, const Uint8* input_buffer, Uint32 buffer_length, int volume) nogil
 
     @staticmethod
-    cdef void mix_audio_stereo(Uint8* output_buffer, const Uint8* input_buffer, Uint32 buffer_length,
+    cdef void mix_audio_stereo(float* output_buffer, const Uint8* input_buffer, Uint32 buffer_length,
                                int volume_left, int volume_right) nogil
 
+    @staticmethod
+    cdef void mix_bus(float* output_buffer, const float* input_buffer, Uint32 sample_count, float gain) nogil
+
+    @staticmethod
+    cdef void write_bus_to_output(Uint8* output_buffer, const float* bus, const float* dither,
+                                  Uint32 sample_count, float gain) nogil
+
     @staticmethod
     cdef void apply_volume(Uint8* output_buffer, const Uint8* input_buffer, Uint32 buffer_length, int volume) nogil
 
@@ -2,12 +2,14 @@
 #cython: embedsignature=True, language_level=3
 
 from cpython.mem cimport PyMem_Malloc, PyMem_Realloc, PyMem_Free
+from libc.string cimport memset
 cimport cpython.pycapsule as pycapsule
 import logging
+import time
 
 from mpfmc.core.audio.sdl2 cimport *
 from mpfmc.core.audio.gstreamer cimport *
-from mpfmc.core.audio.inline cimport lerpU8, in_out_quad
+from mpfmc.core.audio.inline cimport lerpU8, in_out_quad, bytes_to_bus_samples
 from mpfmc.core.audio.notification_message cimport *
 from mpfmc.core.audio.track cimport *
 
@@ -52,12 +54,25 @@ cdef class Track:
         # Allocate memory for the track state (common among all track types)
         self.state = <TrackState*> PyMem_Malloc(sizeof(TrackState))
         self.state.mix_callback_function = NULL
+        self.state.request_callback_function = NULL
         self.state.type_state = NULL
         self.state.number = track_num
-        self.state.buffer = <Uint8 *>PyMem_Malloc(buffer_size)
+        # The track buffer is a floating point mixing buffer (one float per 16-bit output sample)
+        self.state.buffer = <float *>PyMem_Malloc(bytes_to_bus_samples(buffer_size) * sizeof(float))
         self.state.buffer_size = buffer_size
+        self.state.buffer_is_silent = False
+        self.state.active_player_count = 0
+        self.state.active_player_peak = 0
+        self.state.active_player_total = 0
+        self.state.mix_ticks = 0
+        self.state.mix_load = 0.0
+        self.state.mix_load_peak = 0.0
+
+        # Ducking control points are only reset by the audio callback when ducking was active, this
+        # forces them to be initialized during the first callback
+        self.state.ducking_is_active = True
         self.state.ducking_control_points = g_array_sized_new(False, True, sizeof(guint8), CONTROL_POINTS_PER_BUFFER)
-        self.log.debug("Allocated track audio buffer (%d bytes)", buffer_size)
+        self.log.debug("Allocated track audio mixing buffer (%d samples)", bytes_to_bus_samples(buffer_size))
 
         # The easiest way to pass a C pointer in a constructor is to wrap it in a PyCapsule
         # (see https://docs.python.org/3.4/c-api/capsule.html).  This basically wraps the
@@ -73,12 +88,17 @@ cdef class Track:
         self.state.fade_volume_start = new_volume
         self.state.fade_volume_target = new_volume
 
-        self.state.notification_messages = NULL
+        # Notification messages are passed from the audio callback to the main thread through a
+        # lock-free queue (request messages are only used by some track types)
+        self.state.notification_messages = <void*>create_notification_message_queue()
+        self.state.request_messages = NULL
 
     def __dealloc__(self):
         """Destructor"""
         SDL_LockAudio()
         g_array_free(self.state.ducking_control_points, True)
+        free_notification_message_queue(<NotificationMessageQueue*>self.state.notification_messages)
+        PyMem_Free(self.state.buffer)
         PyMem_Free(self.state)
         SDL_UnlockAudio()
 
@@ -96,6 +116,23 @@ cdef class Track:
         def __get__(self):
             return round(self.state.volume / SDL_MIX_MAXVOLUME, 2)
 
+    @property
+    def notifications_dropped(self):
+        """Return the number of notification messages dropped because the notification queue was full"""
+        if self.state == NULL or self.state.notification_messages == NULL:
+            return 0
+        return SDL_AtomicGet(&(<NotificationMessageQueue*>self.state.notification_messages).dropped)
+
+    @property
+    def active_player_count(self):
+        """Return the number of players that generated samples during the last audio callback"""
+        cdef int count = 0
+        if self.state != NULL:
+            SDL_LockAudio()
+            count = self.state.active_player_count
+            SDL_UnlockAudio()
+        return count
+
     @property
     def type(self):
         raise NotImplementedError('Must be overridden in derived class')
@@ -341,18 +378,18 @@ cdef class Track:
 
     @staticmethod
     cdef void mix_track_to_output(TrackState *track, AudioCallbackData* callback_data,
-                                  Uint8 *output_buffer, Uint32 buffer_length) nogil:
+                                  float *output_buffer, Uint32 buffer_length) nogil:
         """
-        Applies ducking and mixes a track buffer into the master audio output buffer.
+        Applies ducking and mixes a track buffer into the master mixing bus.
         Args:
             track: The track's state structure
             callback_data: The audio callback data structure
-            output_buffer: The master audio output buffer.
-            buffer_length: The audio buffer size to process.
+            output_buffer: The master mixing bus.
+            buffer_length: The audio buffer size to process (in output buffer bytes).
     
         """
 
-        cdef Uint8 *track_buffer
+        cdef float *track_buffer
         cdef Uint32 output_buffer_bytes_remaining = buffer_length
         cdef Uint32 current_chunk_bytes
         cdef Uint32 buffer_pos = 0
@@ -363,7 +400,7 @@ cdef class Track:
         if track == NULL or track.status == track_status_stopped or track.status == track_status_paused:
             return
 
-        track_buffer = <Uint8*>track.buffer
+        track_buffer = track.buffer
 
         # Loop over output buffer at control rate
         while output_buffer_bytes_remaining > 0:
@@ -396,68 +433,51 @@ cdef class Track:
 
             track_volume = ducking_volume * track.fade_volume_current // SDL_MIX_MAXVOLUME
 
-            Track.mix_audio(output_buffer + buffer_pos, track_buffer + buffer_pos, current_chunk_bytes, track_volume)
+            Track.mix_bus(output_buffer + bytes_to_bus_samples(buffer_pos),
+                          track_buffer + bytes_to_bus_samples(buffer_pos),
+                          bytes_to_bus_samples(current_chunk_bytes),
+                          <float>track_volume / SDL_MIX_MAXVOLUME)
 
             output_buffer_bytes_remaining -= current_chunk_bytes
             buffer_pos += current_chunk_bytes
             control_point += 1
 
     @staticmethod
-    cdef void mix_audio(Uint8* output_buffer, const Uint8* input_buffer, Uint32 buffer_length, int volume) nogil:
+    cdef void mix_audio(float* output_buffer, const Uint8* input_buffer, Uint32 buffer_length, int volume) nogil:
         """
-        Mixes input buffer samples into existing output buffer samples applying the specified volume setting.
+        Mixes 16-bit input buffer samples into a floating point mixing buffer applying the specified
+        volume setting.
         
         Args:
-            output_buffer: Output audio buffer
-            input_buffer: Input audio buffer
-            buffer_length: Length of audio buffers to process (input and output)
+            output_buffer: Output mixing buffer
+            input_buffer: Input audio buffer (16-bit samples)
+            buffer_length: Length of the input audio buffer to process (in bytes)
             volume: Volume level to apply to input buffer samples 
 
+        Notes:
+            No clipping is performed here, samples are only clipped once when the master mixing bus
+            is written to the output buffer.  The loop is kept free of branches so the compiler is
+            able to vectorize it.
         """
-        cdef Sample16 input_sample, output_sample
-        cdef int temp_sample
-        cdef Uint32 buffer_pos = 0
+        cdef const Sint16* input_samples = <const Sint16*>input_buffer
+        cdef Uint32 sample_count = bytes_to_bus_samples(buffer_length)
+        cdef float gain = <float>volume / SDL_MIX_MAXVOLUME
+        cdef Uint32 i
 
-        while buffer_pos < buffer_length:
-
-            # Get sample (2 bytes) from the input buffer and combine into 16-bit value
-            input_sample.bytes.byte0 = input_buffer[buffer_pos]
-            input_sample.bytes.byte1 = input_buffer[buffer_pos + 1]
-
-            # Get sample (2 bytes) from the output buffer and combine into 16-bit value
-            output_sample.bytes.byte0 = output_buffer[buffer_pos]
-            output_sample.bytes.byte1 = output_buffer[buffer_pos + 1]
-
-            # Calculate the new output sample (mix the input sample multiplied by the volume with the existing output
-            # sample). The temporary output sample is a 32-bit value to avoid overflow.
-            temp_sample = output_sample.value + ((input_sample.value * volume) // SDL_MIX_MAXVOLUME)
-
-            # Clip the temp sample back to a 16-bit value (will cause distortion if samples
-            # on channel are outside of the allowable 16-bit int range)
-            if temp_sample > MAX_AUDIO_VALUE_S16:
-                temp_sample = MAX_AUDIO_VALUE_S16
-            elif temp_sample < MIN_AUDIO_VALUE_S16:
-                temp_sample = MIN_AUDIO_VALUE_S16
-
-            # Write the new output sample back to the output buffer (from
-            # a 32-bit value back to a 16-bit value that we know is in 16-bit value range)
-            output_sample.value = temp_sample
-            output_buffer[buffer_pos] = output_sample.bytes.byte0
-            output_buffer[buffer_pos + 1] = output_sample.bytes.byte1
-
-            buffer_pos += 2
+        for i in range(sample_count):
+            output_buffer[i] += input_samples[i] * gain
 
     @staticmethod
-    cdef void mix_audio_stereo(Uint8* output_buffer, const Uint8* input_buffer, Uint32 buffer_length,
+    cdef void mix_audio_stereo(float* output_buffer, const Uint8* input_buffer, Uint32 buffer_length,
                                int volume_left, int volume_right) nogil:
         """
-        Mixes input buffer samples into existing output buffer samples applying the specified volume setting
-        to the left and right channels.
+        Mixes 16-bit input buffer samples into a floating point mixing buffer applying the specified
+        volume setting to the left and right channels.
         
         Args:
-            output_buffer: Output audio buffer
-            input_buffer: Input audio buffer
-            buffer_length: Length of audio buffers to process (input and output)
+            output_buffer: Output mixing buffer
+            input_buffer: Input audio buffer (16-bit samples)
+            buffer_length: Length of the input audio buffer to process (in bytes)
             volume_left: Volume level to apply to the input buffer left channel samples 
             volume_right: Volume level to apply to the input buffer right channel samples
             
@@ -465,69 +485,55 @@ cdef class Track:
             SDL audio buffers are in interleaved format with the left channel first in stereo buffers.
 
         """
-        cdef Sample16 input_sample, output_sample
-        cdef int temp_sample
-        cdef Uint32 buffer_pos = 0
+        cdef const Sint16* input_samples = <const Sint16*>input_buffer
+        cdef Uint32 frame_count = bytes_to_bus_samples(buffer_length) // 2
+        cdef float gain_left = <float>volume_left / SDL_MIX_MAXVOLUME
+        cdef float gain_right = <float>volume_right / SDL_MIX_MAXVOLUME
+        cdef Uint32 i
 
-        while buffer_pos < buffer_length:
+        for i in range(frame_count):
+            output_buffer[2 * i] += input_samples[2 * i] * gain_left
+            output_buffer[2 * i + 1] += input_samples[2 * i + 1] * gain_right
 
-            # Process left channel
-
-            # Get sample (2 bytes) from the input buffer and combine into 16-bit value
-            input_sample.bytes.byte0 = input_buffer[buffer_pos]
-            input_sample.bytes.byte1 = input_buffer[buffer_pos + 1]
-
-            # Get sample (2 bytes) from the output buffer and combine into 16-bit value
-            output_sample.bytes.byte0 = output_buffer[buffer_pos]
-            output_sample.bytes.byte1 = output_buffer[buffer_pos + 1]
-
-            # Calculate the new output sample (mix the input sample multiplied by the volume with the existing output
-            # sample). The temporary output sample is a 32-bit value to avoid overflow.
-            temp_sample = output_sample.value + ((input_sample.value * volume_left) // SDL_MIX_MAXVOLUME)
-
-            # Clip the temp sample back to a 16-bit value (will cause distortion if samples
-            # on channel are outside of the allowable 16-bit int range)
-            if temp_sample > MAX_AUDIO_VALUE_S16:
-                temp_sample = MAX_AUDIO_VALUE_S16
-            elif temp_sample < MIN_AUDIO_VALUE_S16:
-                temp_sample = MIN_AUDIO_VALUE_S16
-
-            # Write the new output sample back to the output buffer (from
-            # a 32-bit value back to a 16-bit value that we know is in 16-bit value range)
-            output_sample.value = temp_sample
-            output_buffer[buffer_pos] = output_sample.bytes.byte0
-            output_buffer[buffer_pos + 1] = output_sample.bytes.byte1
-
-            buffer_pos += 2
-
-            # Process right channel
-
-            # Get sample (2 bytes) from the input buffer and combine into 16-bit value
-            input_sample.bytes.byte0 = input_buffer[buffer_pos]
-            input_sample.bytes.byte1 = input_buffer[buffer_pos + 1]
+    @staticmethod
+    cdef void mix_bus(float* output_buffer, const float* input_buffer, Uint32 sample_count, float gain) nogil:
+        """
+        Mixes one floating point mixing buffer into another applying the specified gain.
 
-            # Get sample (2 bytes) from the output buffer and combine into 16-bit value
-            output_sample.bytes.byte0 = output_buffer[buffer_pos]
-            output_sample.bytes.byte1 = output_buffer[buffer_pos + 1]
+        Args:
+            output_buffer: Output mixing buffer
+            input_buffer: Input mixing buffer
+            sample_count: Number of samples to process
+            gain: Gain to apply to the input samples (0.0 to 1.0)
+        """
+        cdef Uint32 i
 
-            # Calculate the new output sample (mix the input sample multiplied by the volume with the existing output
-            # sample). The temporary output sample is a 32-bit value to avoid overflow.
-            temp_sample = output_sample.value + ((input_sample.value * volume_right) // SDL_MIX_MAXVOLUME)
+        for i in range(sample_count):
+            output_buffer[i] += input_buffer[i] * gain
 
-            # Clip the temp sample back to a 16-bit value (will cause distortion if samples
-            # on channel are outside of the allowable 16-bit int range)
-            if temp_sample > MAX_AUDIO_VALUE_S16:
-                temp_sample = MAX_AUDIO_VALUE_S16
-            elif temp_sample < MIN_AUDIO_VALUE_S16:
-                temp_sample = MIN_AUDIO_VALUE_S16
+    @staticmethod
+    cdef void write_bus_to_output(Uint8* output_buffer, const float* bus, const float* dither,
+                                  Uint32 sample_count, float gain) nogil:
+        """
+        Converts the master mixing bus to 16-bit output samples. This is the only place samples
+        are clipped.
 
-            # Write the new output sample back to the output buffer (from
-            # a 32-bit value back to a 16-bit value that we know is in 16-bit value range)
-            output_sample.value = temp_sample
-            output_buffer[buffer_pos] = output_sample.bytes.byte0
-            output_buffer[buffer_pos + 1] = output_sample.bytes.byte1
+        Args:
+            output_buffer: Output audio buffer (16-bit samples)
+            bus: The master mixing bus
+            dither: Dither noise to add to each sample (in 16-bit LSB units), must contain at least
+                sample_count values
+            sample_count: Number of samples to process
+            gain: Master gain to apply before clipping
+        """
+        cdef Sint16* output_samples = <Sint16*>output_buffer
+        cdef float sample
+        cdef Uint32 i
 
-            buffer_pos += 2
+        for i in range(sample_count):
+            sample = bus[i] * gain + dither[i]
+            sample = min(max(sample, <float>MIN_AUDIO_VALUE_S16), <float>MAX_AUDIO_VALUE_S16)
+            output_samples[i] = <Sint16>sample
 
     @staticmethod
     cdef void apply_volume(Uint8* output_buffer, const Uint8* input_buffer, Uint32 buffer_length, int volume) nogil:
@@ -584,3 +590,62 @@ cdef class Track:
 
             output_samples[buffer_pos] = (input_samples[buffer_pos] * volume_right) // SDL_MIX_MAXVOLUME
             buffer_pos += 1
+
+
+# ---------------------------------------------------------------------------
+#    Mixing benchmark
+# ---------------------------------------------------------------------------
+def benchmark_mix_bus(int track_count, int buffer_samples=2048, int channels=2, int iterations=1000):
+    """
+    Measures the mixing path of the audio callback without an audio device.
+    Args:
+        track_count: The number of tracks to mix (not limited to the number of tracks
+            supported by the audio interface)
+        buffer_samples: The audio buffer size (in number of samples)
+        channels: The number of channels (1=mono, 2=stereo)
+        iterations: The number of audio buffers to mix
+
+    Returns:
+        The average time (in seconds) spent per audio buffer.
+
+    Notes:
+        Each track mixes one 16-bit source into its track buffer, the track buffer is mixed
+        into the master bus at control rate (as is done for ducking and fades) and the
+        master bus is clipped and written to a 16-bit output buffer.
+    """
+    cdef Uint32 sample_count = buffer_samples * channels
+    cdef Uint32 buffer_length = sample_count * 2
+    cdef Uint32 chunk_samples = sample_count // CONTROL_POINTS_PER_BUFFER
+    cdef Sint16 *source = <Sint16*>PyMem_Malloc(buffer_length)
+    cdef Uint8 *output = <Uint8*>PyMem_Malloc(buffer_length)
+    cdef float *bus = <float*>PyMem_Malloc(sample_count * sizeof(float))
+    cdef float *dither = <float*>PyMem_Malloc(sample_count * sizeof(float))
+    cdef float *track_buffers = <float*>PyMem_Malloc(track_count * sample_count * sizeof(float))
+    cdef Uint32 i
+    cdef int iteration, track_num, control_point
+
+    for i in range(sample_count):
+        source[i] = <Sint16>(<int>((i * 97) % 16384) - 8192)
+        dither[i] = 0.0
+
+    start = time.perf_counter()
+    with nogil:
+        for iteration in range(iterations):
+            memset(bus, 0, sample_count * sizeof(float))
+            for track_num in range(track_count):
+                memset(track_buffers + track_num * sample_count, 0, sample_count * sizeof(float))
+                Track.mix_audio(track_buffers + track_num * sample_count, <Uint8*>source, buffer_length, 96)
+                for control_point in range(CONTROL_POINTS_PER_BUFFER):
+                    Track.mix_bus(bus + control_point * chunk_samples,
+                                  track_buffers + track_num * sample_count + control_point * chunk_samples,
+                                  chunk_samples, 0.5)
+            Track.write_bus_to_output(output, bus, dither, sample_count, 1.0)
+    duration = time.perf_counter() - start
+
+    PyMem_Free(source)
+    PyMem_Free(output)
+    PyMem_Free(bus)
+    PyMem_Free(dither)
+    PyMem_Free(track_buffers)
+
+    return duration / iterations
@@ -10,7 +10,7 @@ from math import ceil
 from mpfmc.core.audio.sdl2 cimport *
 from mpfmc.core.audio.gstreamer cimport *
 from mpfmc.core.audio.track cimport *
-from mpfmc.core.audio.inline cimport in_out_quad
+from mpfmc.core.audio.inline cimport in_out_quad, bytes_to_bus_samples
 from mpfmc.core.audio.notification_message cimport *
 from mpfmc.core.audio.track_sound_loop cimport *
 
@@ -165,25 +165,17 @@ cdef class TrackSoundLoop(Track):
 
     def process(self):
         """Processes track messages each tick."""
-
-        # Lock the mutex to ensure no audio data is changed during the playback processing
-        # (multi-threaded protection)
-        SDL_LockAudio()
-
-        # Process track notification messages
-        if self.state.notification_messages != NULL:
-            self.state.notification_messages = g_slist_reverse(self.state.notification_messages)
-            iterator = self.state.notification_messages
-            while iterator != NULL:
-                self.process_notification_message(<NotificationMessageContainer*>iterator.data)
-                g_slice_free1(sizeof(NotificationMessageContainer), iterator.data)
-                iterator = iterator.next
-
-            g_slist_free(self.state.notification_messages)
-            self.state.notification_messages = NULL
-
-        # Unlock the mutex since we are done accessing the audio data
-        SDL_UnlockAudio()
+        cdef NotificationMessageContainer *notification_message
+        cdef NotificationMessageContainer notification_message_copy
+
+        # Process track notification messages.  The notification queue is lock-free so the audio
+        # callback is never blocked while the notifications are processed (which posts events).
+        notification_message = get_next_notification_message(self.state)
+        while notification_message != NULL:
+            notification_message_copy = notification_message[0]
+            release_notification_message(self.state)
+            self.process_notification_message(cython.address(notification_message_copy))
+            notification_message = get_next_notification_message(self.state)
 
     cdef process_notification_message(self, NotificationMessageContainer *notification_message):
         """Process a notification message to this track"""
@@ -191,8 +183,6 @@ cdef class TrackSoundLoop(Track):
         if notification_message == NULL:
             return
 
-        SDL_LockAudio()
-
         # Check for track notification messages first (they do not need sound instance information)
         if notification_message.message in (notification_track_stopped, notification_track_paused):
             if notification_message.message == notification_track_stopped:
@@ -208,7 +198,6 @@ cdef class TrackSoundLoop(Track):
                         self.mc.post_mc_native_event(event, track=self._name)
                 pass
 
-            SDL_UnlockAudio()
             return
 
         self.log.debug("Processing notification message %d for sound instance (id: %d)",
@@ -221,7 +210,6 @@ cdef class TrackSoundLoop(Track):
                 self.log.warning("Received a notification message for a sound loop set (id: %d) "
                                  "that is no longer active. Notification will be discarded.",
                                  notification_message.data.sound_loop_set.id)
-                SDL_UnlockAudio()
                 return
 
             sound_loop_set_settings = self._active_sound_loop_sets[notification_message.data.sound_loop_set.id]
@@ -229,7 +217,6 @@ cdef class TrackSoundLoop(Track):
                 self.log.warning("Could not retrieve settings for a sound loop set (id: %d) "
                                  "Notification will be discarded.",
                                  notification_message.data.sound_loop_set.id)
-                SDL_UnlockAudio()
                 return
 
             if notification_message.message == notification_sound_loop_set_started:
@@ -245,11 +232,14 @@ cdef class TrackSoundLoop(Track):
                 self.log.debug("Removing sound_loop_set settings %d from active list", notification_message.data.sound_loop_set.id)
                 del self._active_sound_loop_sets[notification_message.data.sound_loop_set.id]
 
-                # Remove and delete sound loop set player used to play this set
+                # Remove and delete sound loop set player used to play this set (the player list
+                # is shared with the audio callback)
                 player = <SoundLoopSetPlayer*>notification_message.data.sound_loop_set.player
                 if player != NULL:
+                    SDL_LockAudio()
                     self._delete_player(player)
                     self.type_state.players = g_slist_remove(self.type_state.players, player)
+                    SDL_UnlockAudio()
 
             elif notification_message.message == notification_sound_loop_set_looping:
                 if sound_loop_set_settings['events_when_looping'] is not None:
@@ -262,7 +252,6 @@ cdef class TrackSoundLoop(Track):
                 self.log.warning("Received a notification message for a sound (id: %d) "
                                  "that does not exist. Notification will be discarded.",
                                  notification_message.sound_id)
-                SDL_UnlockAudio()
                 return
 
             # In a sound loop track, sound instances are not created when playing a loop sound.  The sound
@@ -278,8 +267,6 @@ cdef class TrackSoundLoop(Track):
                                                      sound_instance=sound,
                                                      marker_id=notification_message.data.marker.id)
 
-        SDL_UnlockAudio()
-
     def play_sound_loop_set(self, dict sound_loop_set not None, str context=None, dict player_settings=None):
         """
         Immediately play a sound loop set.
@@ -1065,6 +1052,11 @@ cdef class TrackSoundLoop(Track):
                     player.start_delay_samples_remaining -= buffer_length
                     track_buffer_pos = buffer_length
 
+            # Count players that will generate samples during this callback
+            if track_buffer_pos < buffer_length and player.status \
+                    in (player_playing, player_fading_in, player_fading_out):
+                track.active_player_count += 1
+
             # Loop over track buffer, filling samples for player (if applicable)
             while track_buffer_pos < buffer_length and player.status \
                     in (player_playing, player_fading_in, player_fading_out):
@@ -1164,11 +1156,10 @@ cdef Uint32 get_player_sound_samples(TrackState *track, SoundLoopSetPlayer *play
             return buffer_length
 
         # Get master layer samples
-        SDL_MixAudioFormat(track.buffer + track_buffer_pos,
-                           <Uint8*>player.master_sound_layer.sound.data.memory.data + player.sample_pos,
-                           track.callback_data.format,
-                           current_chunk_bytes,
-                           player_volume * player.master_sound_layer.volume // SDL_MIX_MAXVOLUME)
+        Track.mix_audio(track.buffer + bytes_to_bus_samples(track_buffer_pos),
+                        <Uint8*>player.master_sound_layer.sound.data.memory.data + player.sample_pos,
+                        current_chunk_bytes,
+                        player_volume * player.master_sound_layer.volume // SDL_MIX_MAXVOLUME)
 
         # Process markers (do any markers fall in the current chunk?)
         # Note: the current sample position has already been incremented when the sample data was received so
@@ -1220,11 +1211,10 @@ cdef Uint32 get_player_sound_samples(TrackState *track, SoundLoopSetPlayer *play
                                 layer_bytes_remaining = 0
 
                     if layer_sample_pos < layer.sound.data.memory.size:
-                        SDL_MixAudioFormat(track.buffer + track_buffer_pos + layer_track_buffer_pos_offset,
-                                           <Uint8*>layer.sound.data.memory.data + layer_sample_pos,
-                                           callback_data.format,
-                                           min(layer_chunk_bytes, layer.sound.data.memory.size - layer_sample_pos),
-                                           player_volume * layer_volume // SDL_MIX_MAXVOLUME)
+                        Track.mix_audio(track.buffer + bytes_to_bus_samples(track_buffer_pos + layer_track_buffer_pos_offset),
+                                        <Uint8*>layer.sound.data.memory.data + layer_sample_pos,
+                                        min(layer_chunk_bytes, layer.sound.data.memory.size - layer_sample_pos),
+                                        player_volume * layer_volume // SDL_MIX_MAXVOLUME)
 
                         # Process markers (do any markers fall in the current chunk?)
                         # Note: the current sample position has already been incremented when the sample data was received so
@@ -88,8 +88,17 @@ ctypedef struct SoundPlayer:
 # ---------------------------------------------------------------------------
 cdef class TrackStandard(Track):
 
-    cdef list _sound_queue
+    cdef object _sound_queue
+    cdef object _sound_instance_pool
     cdef dict _playing_instances_by_id
+    cdef list _player_instances
+    cdef list _player_next_instances
+    cdef Uint32 _idle_player_mask
+    cdef dict _players_by_sound_id
+    cdef dict _player_by_instance_id
+    cdef list _player_priority_heap
+    cdef object _pending_request_messages
+    cdef int _notifications_dropped
     cdef int _max_simultaneous_sounds
 
     # Track state needs to be stored in a C struct in order for them to be accessible in
@@ -102,26 +111,69 @@ cdef class TrackStandard(Track):
     cdef list _get_playing_sound_instances(self, Uint64 sound_id)
     cdef int _get_idle_sound_player(self)
     cdef process_notification_message(self, NotificationMessageContainer *notification_message)
+    cdef bint _sync_sound_players(self)
     cdef tuple _get_sound_player_with_lowest_priority(self)
     cdef bint _play_sound_on_sound_player(self, sound_instance, int player, bint force=?)
     cdef _set_player_sound_settings(self, SoundSettings *sound_settings, object sound_instance)
-    cdef _set_player_playing(self, SoundPlayer *player, object sound_instance)
-    cdef _set_player_replacing(self, SoundPlayer *player, object sound_instance)
     cdef int _get_player_playing_sound_instance(self, sound_instance)
+    cdef _set_player_instance(self, int player, object sound_instance)
+    cdef _set_player_next_instance(self, int player, object sound_instance)
+    cdef _push_player_priority(self, int player, int priority)
+    cdef list _get_players_playing_sound(self, Uint64 sound_id)
+    cdef _send_request_message(self, int message, object sound_instance=?, int player=?, Uint32 fade_out_steps=?)
+    cdef bint _write_request_message(self, int message, object sound_instance, int player, Uint32 fade_out_steps)
+    cdef _flush_request_messages(self)
 
     @staticmethod
     cdef void mix_playing_sounds(TrackState *track, Uint32 buffer_length, AudioCallbackData *callback_data) nogil
 
+    @staticmethod
+    cdef void apply_requests(TrackState *track) nogil
+
 # ---------------------------------------------------------------------------
 #    Global C functions designed to be called from the static audio callback
 #    function (these functions do not use the GIL).
 # ---------------------------------------------------------------------------
 
-cdef bint get_memory_sound_samples(SoundSettings *sound, Uint32 length, Uint8 *output_buffer, int channels,
+cdef void apply_request_messages(TrackState *track, TrackStandardState *standard_track) nogil
+cdef void stop_sound_player(TrackState *track, SoundPlayer *player) nogil
+cdef bint get_memory_sound_samples(SoundSettings *sound, Uint32 length, float *output_buffer, int channels,
                                    Uint8 volume, TrackState *track, int player_num) nogil
-cdef bint get_streaming_sound_samples(SoundSettings *sound, Uint32 length, Uint8 *output_buffer, int channels,
+cdef bint get_streaming_sound_samples(SoundSettings *sound, Uint32 length, float *output_buffer, int channels,
                                       Uint8 volume, TrackState *track, int player_num) nogil
 
+cdef inline void set_player_idle(SoundPlayer *player) nogil:
+    """
+    Sets a sound player to idle.
+    Args:
+        player: SoundPlayer pointer
+    """
+    player.status = player_idle
+
+    # A streaming sound no longer needs to be decoded (its pipeline may now be reassigned)
+    if player.current.sample != NULL and player.current.sample.type == sound_type_streaming:
+        stop_stream(player.current.sample.data.stream)
+
+cdef inline void copy_sound_settings(SoundSettings *dest, SoundSettings *source) nogil:
+    """
+    Copies the settings of a sound to play into the sound settings of a player (the marker
+    positions are copied into the markers array of the player).
+    Args:
+        dest: SoundSettings pointer of the player
+        source: SoundSettings pointer of the prepared sound settings
+    """
+    cdef GArray *markers = dest.markers
+    cdef GArray *ducking_control_points = dest.ducking_control_points
+    cdef int marker_id
+
+    dest[0] = source[0]
+    dest.markers = markers
+    dest.ducking_control_points = ducking_control_points
+
+    g_array_set_size(dest.markers, source.marker_count)
+    for marker_id in range(source.marker_count):
+        g_array_set_val_uint(dest.markers, marker_id, g_array_index_uint(source.markers, marker_id))
+
 cdef inline void end_of_sound_processing(SoundPlayer* player,
                                          TrackState *track) nogil:
     """
@@ -5,27 +5,26 @@ from cpython.mem cimport PyMem_Malloc, PyMem_Realloc, PyMem_Free
 import cython
 import logging
 import time
+from collections import deque
 from math import ceil
 from heapq import heappush, heappop, heapify
 
-from mpfmc.assets.sound import SoundInstance, SoundStealingMethod
+from mpfmc.assets.sound import SoundInstancePool, SoundStealingMethod
 from mpfmc.core.audio.sdl2 cimport *
 from mpfmc.core.audio.gstreamer cimport *
 from mpfmc.core.audio.track cimport *
-from mpfmc.core.audio.inline cimport lerpU8, in_out_quad
+from mpfmc.core.audio.inline cimport lerpU8, in_out_quad, bytes_to_bus_samples, lowest_set_bit_index
 from mpfmc.core.audio.notification_message cimport *
+from mpfmc.core.audio.request_message cimport *
 from mpfmc.core.audio.track_standard cimport *
 from mpfmc.core.audio.audio_exception import AudioException
+from mpfmc.core.audio.sound_queue import SoundQueue
 
 
 # ---------------------------------------------------------------------------
 #    Settings
 # ---------------------------------------------------------------------------
 
-# The maximum number of consecutive null buffers to receive while streaming before
-# terminating the sound (will cause drop outs)
-DEF CONSECUTIVE_NULL_STREAMING_BUFFER_LIMIT = 2
-
 
 # ---------------------------------------------------------------------------
 #    TrackStandard class
@@ -60,11 +59,28 @@ cdef class TrackStandard(Track):
         # Dictionary of SoundInstance class objects keyed by SoundInstance.id
         self._playing_instances_by_id = dict()
 
+        # Indexes of the sound players by sound id and sound instance id along with a min-heap
+        # of (sound priority, player) entries.  They are kept in sync with the sound player
+        # instances (see _set_player_instance), stale heap entries are discarded when used.
+        self._players_by_sound_id = dict()
+        self._player_by_instance_id = dict()
+        self._player_priority_heap = list()
+
+        # Requests that did not fit into the request message queue (sent in order once there is
+        # room again)
+        self._pending_request_messages = deque()
+        self._notifications_dropped = 0
+
         # Priority queue of SoundInstance objects waiting to be played
-        self._sound_queue = list()
+        self._sound_queue = SoundQueue()
+
+        # Finished SoundInstance objects are reused for later sounds
+        self._sound_instance_pool = SoundInstancePool()
 
         # Set track type specific settings
         self.state.mix_callback_function = TrackStandard.mix_playing_sounds
+        self.state.request_callback_function = TrackStandard.apply_requests
+        self.state.request_messages = <void*>create_request_message_queue()
 
         # Allocate memory for the specific track type state struct (TrackStandardState)
         self.type_state = <TrackStandardState*> PyMem_Malloc(sizeof(TrackStandardState))
@@ -85,7 +101,15 @@ cdef class TrackStandard(Track):
         # simultaneous sounds that can be played on the track.
         self.type_state.sound_players = <SoundPlayer*> PyMem_Malloc(self.type_state.sound_player_count * sizeof(SoundPlayer))
 
-        # Initialize sound player attributes
+        # The sound player states belong to the audio callback.  The main thread keeps its own
+        # view of the sound instance each player is playing (and the instance waiting to replace
+        # it), which is updated when requests are sent and from the notification messages of the
+        # audio callback, so the sound players never need to be locked.
+        self._player_instances = [None] * self.type_state.sound_player_count
+        self._player_next_instances = [None] * self.type_state.sound_player_count
+        self._idle_player_mask = (<Uint32>0xFFFFFFFF) >> (32 - self.type_state.sound_player_count)
+
+        # Initialize sound player attributes (all players start out idle)
         for i in range(self.type_state.sound_player_count):
             self.type_state.sound_players[i].status = player_idle
             self.type_state.sound_players[i].track_num = self.number
@@ -146,6 +170,10 @@ cdef class TrackStandard(Track):
             if self.state != NULL:
                 self.state.type_state = NULL
 
+        if self.state != NULL:
+            free_request_message_queue(<RequestMessageQueue*>self.state.request_messages)
+            self.state.request_messages = NULL
+
         SDL_UnlockAudio()
 
     def __repr__(self):
@@ -175,26 +203,115 @@ cdef class TrackStandard(Track):
         Returns the index of the first idle sound player on the track.  If all
         players are currently busy playing, -1 is returned.
         """
-        SDL_LockAudio()
+        if self._idle_player_mask == 0:
+            return -1
 
-        for index in range(self.type_state.sound_player_count):
-            if self.type_state.sound_players[index].status == player_idle:
-                SDL_UnlockAudio()
-                return index
+        return lowest_set_bit_index(self._idle_player_mask)
 
-        SDL_UnlockAudio()
-        return -1
+    cdef _set_player_instance(self, int player, object sound_instance):
+        """
+        Sets the sound instance a sound player is playing (or None when the player is idle) and
+        updates the sound player indexes.
+        Args:
+            player: The number of the sound player
+            sound_instance: The sound instance the player is playing or None
+        """
+        old_instance = self._player_instances[player]
+        if old_instance is sound_instance:
+            return
+
+        if old_instance is not None:
+            player_nums = self._players_by_sound_id[old_instance.sound_id]
+            player_nums.discard(player)
+            if not player_nums:
+                del self._players_by_sound_id[old_instance.sound_id]
+            if self._player_by_instance_id.get(old_instance.id) == player:
+                del self._player_by_instance_id[old_instance.id]
+
+        self._player_instances[player] = sound_instance
+
+        if sound_instance is None:
+            self._idle_player_mask |= (<Uint32>1) << player
+            return
+
+        self._idle_player_mask &= ~((<Uint32>1) << player)
+        self._player_by_instance_id[sound_instance.id] = player
+        try:
+            self._players_by_sound_id[sound_instance.sound_id].add(player)
+        except KeyError:
+            self._players_by_sound_id[sound_instance.sound_id] = {player}
+
+        self._push_player_priority(player, sound_instance.priority)
+
+    cdef _set_player_next_instance(self, int player, object sound_instance):
+        """
+        Sets the sound instance waiting to replace the sound instance a sound player is playing
+        (or None).
+        Args:
+            player: The number of the sound player
+            sound_instance: The sound instance that will be played next or None
+        """
+        old_instance = self._player_next_instances[player]
+        if old_instance is not None and self._player_by_instance_id.get(old_instance.id) == player:
+            del self._player_by_instance_id[old_instance.id]
+
+        self._player_next_instances[player] = sound_instance
+        if sound_instance is not None:
+            self._player_by_instance_id[sound_instance.id] = player
+            self._push_player_priority(player, sound_instance.priority)
+        elif old_instance is not None and self._player_instances[player] is not None:
+            self._push_player_priority(player, self._player_instances[player].priority)
+
+    cdef _push_player_priority(self, int player, int priority):
+        """
+        Adds a (sound priority, player) entry to the sound player priority heap.
+        Args:
+            player: The number of the sound player
+            priority: The priority of the sound the player is playing (or will play next)
+        """
+        heappush(self._player_priority_heap, (priority, player))
+
+        # Rebuild the heap once it is mostly made up of stale entries
+        if len(self._player_priority_heap) > 4 * self.type_state.sound_player_count:
+            self._player_priority_heap = list()
+            for player_num in range(self.type_state.sound_player_count):
+                sound_instance = self._player_next_instances[player_num]
+                if sound_instance is None:
+                    sound_instance = self._player_instances[player_num]
+                if sound_instance is not None:
+                    self._player_priority_heap.append((sound_instance.priority, player_num))
+            heapify(self._player_priority_heap)
 
     def process(self):
         """Processes the track queue each tick."""
 
         cdef bint keep_checking = True
         cdef int idle_sound_player
-        cdef GSList *iterator = NULL
-
-        # Lock the mutex to ensure no audio data is changed during the playback processing
-        # (multi-threaded protection)
-        SDL_LockAudio()
+        cdef int notifications_dropped
+        cdef NotificationMessageContainer *notification_message
+        cdef NotificationMessageContainer notification_message_copy
+
+        # Send the requests that did not fit into the request message queue earlier
+        self._flush_request_messages()
+
+        # Process track notification messages first so sound players that have finished are
+        # available again.  The notification queue is lock-free so the audio callback is never
+        # blocked while the notifications are processed (which posts events).  Each message is
+        # copied and released before it is processed as processing may add new notification
+        # messages to the queue.
+        notification_message = get_next_notification_message(self.state)
+        while notification_message != NULL:
+            notification_message_copy = notification_message[0]
+            release_notification_message(self.state)
+            self.process_notification_message(cython.address(notification_message_copy))
+            notification_message = get_next_notification_message(self.state)
+
+        # The sound players are only followed through the notifications, if any were dropped
+        # (the notification queue was full) the sound players must be synchronized again
+        notifications_dropped = self.notifications_dropped
+        if notifications_dropped != self._notifications_dropped and not self._pending_request_messages:
+            if self._sync_sound_players():
+                self._notifications_dropped = notifications_dropped
 
         while keep_checking:
             # See if there are now any idle sound players
@@ -211,29 +328,12 @@ cdef class TrackStandard(Track):
             else:
                 keep_checking = False
 
-        # Process track notification messages
-        if self.state.notification_messages != NULL:
-            self.state.notification_messages = g_slist_reverse(self.state.notification_messages)
-            iterator = self.state.notification_messages
-            while iterator != NULL:
-                self.process_notification_message(<NotificationMessageContainer*>iterator.data)
-                g_slice_free1(sizeof(NotificationMessageContainer), iterator.data)
-                iterator = iterator.next
-
-            g_slist_free(self.state.notification_messages)
-            self.state.notification_messages = NULL
-
-        # Unlock the mutex since we are done accessing the audio data
-        SDL_UnlockAudio()
-
     cdef process_notification_message(self, NotificationMessageContainer *notification_message):
         """Process a notification message to this track"""
 
         if notification_message == NULL:
             return
 
-        SDL_LockAudio()
-
         # Check for track notification messages first (they do not need sound instance information)
         if notification_message.message in (notification_track_stopped, notification_track_paused):
             if notification_message.message == notification_track_stopped:
@@ -250,12 +350,30 @@ cdef class TrackStandard(Track):
                         self.mc.post_mc_native_event(event, track=self._name)
                 pass
 
-            SDL_UnlockAudio()
             return
 
         self.log.debug("Processing notification message %d for sound instance (id: %d)",
                        notification_message.message, notification_message.sound_instance_id)
 
+        # Follow the sound instances played by the sound player
+        player = notification_message.player
+        if notification_message.message == notification_sound_stopped:
+            next_instance = self._player_next_instances[player]
+            if next_instance is not None and next_instance.id == notification_message.sound_instance_id:
+                # The sound instance that was waiting to replace the current sound was stopped
+                self._set_player_next_instance(player, None)
+            elif self._player_instances[player] is not None and \
+                    self._player_instances[player].id == notification_message.sound_instance_id:
+                # The player starts the waiting sound instance (if there is one) or is now idle
+                self._set_player_next_instance(player, None)
+                self._set_player_instance(player, next_instance)
+
+        elif notification_message.message == notification_sound_started:
+            next_instance = self._player_next_instances[player]
+            if next_instance is not None and next_instance.id == notification_message.sound_instance_id:
+                self._set_player_next_instance(player, None)
+                self._set_player_instance(player, next_instance)
+
         if notification_message.sound_instance_id not in self._playing_instances_by_id:
             self.log.warning("Received a notification message for a sound instance (id: %d) "
                              "that is no longer managed in the audio library. "
@@ -292,8 +410,50 @@ cdef class TrackStandard(Track):
         else:
             raise AudioException("Unknown notification message received on %s track", self.name)
 
+    cdef bint _sync_sound_players(self):
+        """
+        Synchronizes the sound instances of the sound players with the sound player states of the
+        audio callback.  This is only needed after notification messages have been dropped, the
+        audio lock is held while the sound player states are read.
+
+        Returns:
+            True if the sound players were synchronized, False if the audio callback has not
+            applied all requests yet (the sound players are synchronized later).
+        """
+        cdef RequestMessageQueue *queue = <RequestMessageQueue*>self.state.request_messages
+        cdef SoundPlayer *player
+        cdef list player_instance_ids = list()
+
+        SDL_LockAudio()
+        if SDL_AtomicGet(&queue.read_index) != SDL_AtomicGet(&queue.write_index):
+            SDL_UnlockAudio()
+            return False
+
+        for i in range(self.type_state.sound_player_count):
+            player = cython.address(self.type_state.sound_players[i])
+            if player.status == player_idle:
+                player_instance_ids.append((None, None))
+            elif player.status == player_replacing:
+                player_instance_ids.append((player.current.sound_instance_id, player.next.sound_instance_id))
+            else:
+                player_instance_ids.append((player.current.sound_instance_id, None))
         SDL_UnlockAudio()
 
+        self.log.warning("Notification messages were dropped, synchronizing the sound players")
+
+        for player_num, (instance_id, next_instance_id) in enumerate(player_instance_ids):
+            self._set_player_next_instance(player_num, None)
+            self._set_player_instance(player_num, self._playing_instances_by_id.get(instance_id))
+            self._set_player_next_instance(player_num, self._playing_instances_by_id.get(next_instance_id))
+
+        # Sound instances that are no longer played have stopped (their notification was dropped)
+        for sound_instance in list(self._playing_instances_by_id.values()):
+            if sound_instance.id not in self._player_by_instance_id:
+                sound_instance.set_stopped()
+                del self._playing_instances_by_id[sound_instance.id]
+
+        return True
+
     def _get_next_sound(self):
         """
         Returns the next sound in the priority queue ready for playback.
@@ -304,44 +464,32 @@ cdef class TrackStandard(Track):
         If the next sound in the queue has expired, it is discarded and the
         next sound that has not expired is returned.
         """
-        # We don't want to go through the entire sound queue more than once
-        # in this method so keep track of the entry ids of the items we've
-        # processed.  Once an item has been processed and retrieved again,
-        # we are done and return None.
-        cdef list sound_instances_retrieved_from_queue = list()
         while True:
-            # Return none if sound queue is empty
-            if len(self._sound_queue) == 0:
-                return None
-
             # Get the next item in the queue (sorted by priority and expiration time)
-            sound_instance = heappop(self._sound_queue)
+            sound_instance = self._sound_queue.peek()
 
-            # Check if we've already processed the sound instance during this call (if
-            # so, put it back in the queue and return)
-            if sound_instance in sound_instances_retrieved_from_queue:
-                heappush(self._sound_queue, sound_instance)
+            # Return none if sound queue is empty
+            if sound_instance is None:
                 return None
 
-            # Keep track of entries we've processed during this call
-            sound_instances_retrieved_from_queue.append(sound_instance)
-
-            # If the sound is still loading and not expired, put it back in the queue
+            # If the sound is still loading and not expired, leave it at the front of the queue
             if not sound_instance.sound.loaded and sound_instance.sound.loading and \
                     (sound_instance.exp_time is None or sound_instance.exp_time > time.time()):
-                heappush(self._sound_queue, sound_instance)
                 self.log.debug("Next pending sound in queue is still loading, "
-                               "re-queueing sound %s",
+                               "leaving sound %s in queue",
                                sound_instance)
+                return None
+
+            self._sound_queue.pop()
+
+            # Return the next sound from the priority queue if it has not expired
+            if sound_instance.exp_time is None or sound_instance.exp_time > time.time():
+                self.log.debug("Retrieving next pending sound from queue %s", sound_instance)
+                sound_instance.set_pending()  # Notify sound instance it is no longer queued
+                return sound_instance
             else:
-                # Return the next sound from the priority queue if it has not expired
-                if sound_instance.exp_time is None or sound_instance.exp_time > time.time():
-                    self.log.debug("Retrieving next pending sound from queue %s", sound_instance)
-                    sound_instance.set_pending()  # Notify sound instance it is no longer queued
-                    return sound_instance
-                else:
-                    self.log.debug("Discarding expired sound from queue %s", sound_instance)
-                    sound_instance.set_expired()  # Notify sound instance it has expired
+                self.log.debug("Discarding expired sound from queue %s", sound_instance)
+                sound_instance.set_expired()  # Notify sound instance it has expired
 
     def _remove_sound_from_queue(self, sound not None):
         """
@@ -350,13 +498,8 @@ cdef class TrackStandard(Track):
         Args:
             sound: The sound object to remove
         """
-        cdef list sound_queue_copy = self._sound_queue.copy()
-        for sound_instance in sound_queue_copy:
-            if sound_instance.sound_id == sound.id:
-                self._sound_queue.remove(sound_instance)
-                sound_instance.set_canceled()
-
-        heapify(self._sound_queue)
+        for sound_instance in self._sound_queue.remove_sound(sound.id):
+            sound_instance.set_canceled()
 
     def _remove_sound_instance_from_queue(self, sound_instance not None):
         """
@@ -364,78 +507,53 @@ cdef class TrackStandard(Track):
         Args:
             sound_instance: The sound instance object to remove
         """
-        try:
-            self._sound_queue.remove(sound_instance)
+        if self._sound_queue.remove(sound_instance):
             self.log.debug("Removing pending sound from queue %s", sound_instance)
             sound_instance.set_canceled()
-            heapify(self._sound_queue)
-        except ValueError:
-            pass
 
     def _remove_all_sounds_with_context_from_queue(self, context):
         """Removes all sounds with the specified context from the priority sound queue.
         """
-        for sound_instance in self._sound_queue.copy():
-            if sound_instance.context == context:
-                self.log.debug("Removing pending sound with context %s from queue %s", context, sound_instance)
-                sound_instance.set_canceled()
-                self._sound_queue.remove(sound_instance)
-
-        heapify(self._sound_queue)
+        for sound_instance in self._sound_queue.remove_context(context):
+            self.log.debug("Removing pending sound with context %s from queue %s", context, sound_instance)
+            sound_instance.set_canceled()
 
     def _remove_all_sounds_with_key_from_queue(self, key):
         """Removes all sounds with the specified key from the priority sound queue.
         """
-        for sound_instance in self._sound_queue.copy():
-            if sound_instance.key == key:
-                self.log.debug("Removing pending sound with key %s from queue %s", key, sound_instance)
-                sound_instance.set_canceled()
-                self._sound_queue.remove(sound_instance)
-
-        heapify(self._sound_queue)
+        for sound_instance in self._sound_queue.remove_key(key):
+            self.log.debug("Removing pending sound with key %s from queue %s", key, sound_instance)
+            sound_instance.set_canceled()
 
     def _remove_all_sounds_from_queue(self):
         """Removes all sounds from the priority sound queue.
         """
-        for sound_instance in self._sound_queue:
+        for sound_instance in self._sound_queue.clear():
             self.log.debug("Removing pending sound from queue %s", sound_instance)
             sound_instance.set_canceled()
 
-        self._sound_queue.clear()
+    cdef list _get_players_playing_sound(self, Uint64 sound_id):
+        """Return the numbers of the sound players currently playing the given sound id"""
+        player_nums = self._players_by_sound_id.get(sound_id)
+        if not player_nums:
+            return list()
+
+        return sorted(player_nums)
 
     cdef int _get_playing_sound_count(self, Uint64 sound_id):
         """Return the number of currently playing instances of the given sound id"""
-        cdef int count = 0
-        SDL_LockAudio()
-
-        for i in range(self.type_state.sound_player_count):
-            if self.type_state.sound_players[i].status != player_idle and \
-                            self.type_state.sound_players[i].current.sound_id == sound_id:
-                count += 1
-
-        SDL_UnlockAudio()
-        return count
+        return len(self._get_players_playing_sound(sound_id))
 
     cdef list _get_playing_sound_instances(self, Uint64 sound_id):
         """Return the list of currently playing instances of the given sound id"""
         cdef list instances = list()
-        cdef Uint64 instance_id
 
-        SDL_LockAudio()
-
-        for i in range(self.type_state.sound_player_count):
-            if self.type_state.sound_players[i].status != player_idle and \
-                            self.type_state.sound_players[i].current.sound_id == sound_id:
-
-                if self.type_state.sound_players[i].status == player_replacing:
-                    instance_id = self.type_state.sound_players[i].next.sound_instance_id
-                else:
-                    instance_id = self.type_state.sound_players[i].current.sound_instance_id
-
-                if instance_id in self._playing_instances_by_id:
-                    instances.append(self._playing_instances_by_id[instance_id])
+        for i in self._get_players_playing_sound(sound_id):
+            if self._player_next_instances[i] is not None:
+                instances.append(self._player_next_instances[i])
+            else:
+                instances.append(self._player_instances[i])
 
-        SDL_UnlockAudio()
         return instances
 
     def _get_oldest_playing_sound_instance(self, Uint64 sound_id):
@@ -479,11 +597,10 @@ cdef class TrackStandard(Track):
         """
         self.log.debug("play_sound - Processing sound '%s' for playback.", sound.name)
 
-        SDL_LockAudio()
-
-        # A try/else/finally block is used here to ensure SDL_UnlockAudio is always called
-        # before the function returns (since there are so many return branches it is easier
-        # to use than placing the SDL_UnlockAudio call before every return).
+        # The audio lock is not held here: the sound players are looked up in the sound instances
+        # the track keeps for them and the sound is passed to the audio callback in a play request
+        # (see _play_sound_on_sound_player), so the audio callback is never blocked by logging,
+        # sound instance setup or GStreamer calls.
         try:
 
             # Sound cannot be played if the track is stopped or paused
@@ -504,7 +621,7 @@ cdef class TrackStandard(Track):
                 if sound.stealing_method == SoundStealingMethod.oldest:
                     oldest_instance = self._get_oldest_playing_sound_instance(sound.id)
                     if oldest_instance is not None:
-                        sound_instance = SoundInstance(sound, context, settings)
+                        sound_instance = self._sound_instance_pool.acquire(sound, context, settings)
                         self._replace_sound_instance(oldest_instance, sound_instance)
                         self.log.debug("Sound %s has reached the maximum number of instances. "
                                        "Replacing oldest instance", sound.name)
@@ -513,7 +630,7 @@ cdef class TrackStandard(Track):
                 elif sound.stealing_method == SoundStealingMethod.newest:
                     newest_instance = self._get_newest_playing_sound_instance(sound.id)
                     if newest_instance is not None:
-                        sound_instance = SoundInstance(sound, context, settings)
+                        sound_instance = self._sound_instance_pool.acquire(sound, context, settings)
                         self._replace_sound_instance(newest_instance, sound_instance)
                         self.log.debug("Sound %s has reached the maximum number of instances. "
                                        "Replacing newest instance", sound.name)
@@ -525,7 +642,7 @@ cdef class TrackStandard(Track):
                                    "Sound will be skipped", sound.name)
                     return None
             else:
-                sound_instance = SoundInstance(sound, context, settings)
+                sound_instance = self._sound_instance_pool.acquire(sound, context, settings)
 
             if sound_instance.max_queue_time is None:
                 sound_instance.exp_time = None
@@ -606,10 +723,6 @@ cdef class TrackStandard(Track):
             # No exception occurred, return the newly created sound instance that will be played
             return sound_instance
 
-        finally:
-            # Always unlock the audio mutex before returning
-            SDL_UnlockAudio()
-
     def _replace_sound_instance(self, old_instance not None, sound_instance not None):
         """
         Replace a currently playing instance with another sound instance.
@@ -621,7 +734,6 @@ cdef class TrackStandard(Track):
         self.log.debug("replace_sound_instance - Preparing to replace existing sound with a new sound instance")
 
         # Find which player is currently playing the specified sound instance to replace
-        SDL_LockAudio()
         player = self._get_player_playing_sound_instance(old_instance)
 
         if player >= 0:
@@ -630,8 +742,6 @@ cdef class TrackStandard(Track):
             self.log.debug("replace_sound_instance - Could not locate specified sound instance to replace")
             sound_instance.set_canceled()
 
-        SDL_UnlockAudio()
-
     def _queue_sound(self, sound_instance not None):
         """Adds a sound to the queue to be played when a sound player becomes available.
 
@@ -642,7 +752,7 @@ cdef class TrackStandard(Track):
         queue based on its priority, so highest-priority sounds are played
         first.
         """
-        heappush(self._sound_queue, sound_instance)
+        self._sound_queue.push(sound_instance)
 
         # Notify sound instance it has been queued
         sound_instance.set_queued()
@@ -653,17 +763,8 @@ cdef class TrackStandard(Track):
 
         cdef list instances = list()
 
-        SDL_LockAudio()
-
-        for i in range(self.type_state.sound_player_count):
-            if self.type_state.sound_players[i].status != player_idle and self.type_state.sound_players[
-                i].current.sound_id == sound.id:
-
-                sound_instance_id = self.type_state.sound_players[i].current.sound_instance_id
-                if sound_instance_id in self._playing_instances_by_id:
-                    instances.append(self._playing_instances_by_id[sound_instance_id])
-
-        SDL_UnlockAudio()
+        for i in self._get_players_playing_sound(sound.id):
+            instances.append(self._player_instances[i])
 
         return instances
 
@@ -688,47 +789,32 @@ cdef class TrackStandard(Track):
             sound_instance: The SoundInstance to stop
             fade_out: Optional amount of time (seconds) to fade out before stopping
         """
-        cdef SoundPlayer *player
-
-        SDL_LockAudio()
+        cdef Uint32 fade_out_steps
+        cdef int player
 
         self.log.debug("Stopping sound %s and removing any pending instances from queue", sound_instance.name)
 
         if fade_out is None:
             fade_out = sound_instance.fade_out
 
-        for i in range(self.type_state.sound_player_count):
-            if self.type_state.sound_players[i].status != player_idle and self.type_state.sound_players[
-                i].current.sound_instance_id == sound_instance.id:
-
-                # Update player to stop playing sound
-                player = cython.address(self.type_state.sound_players[i])
+        fade_out_steps = fade_out * self.state.callback_data.seconds_to_bytes_factor // self.state.callback_data.bytes_per_control_point
 
-                # Calculate fade out (if necessary)
-                player.current.fade_steps_remaining = fade_out * self.state.callback_data.seconds_to_bytes_factor // self.state.callback_data.bytes_per_control_point
-                if player.current.fade_steps_remaining > 0:
-                    player.current.fade_out_steps = player.current.fade_steps_remaining
-                    player.current.fading_status = fading_status_fading_out
-                    player.status = player_stopping
-                else:
-                    # Sound will stop immediately - send sound stopped notification
-                    send_sound_stopped_notification(player.number, player.current.sound_id, player.current.sound_instance_id, self.state)
-                    player.status = player_idle
+        # The sound is stopped by the audio callback.  A sound that stops immediately releases its
+        # player right away so it can be reused by the next play request (the requests are applied
+        # in order so the sound has stopped by then).
+        player = self._player_by_instance_id.get(sound_instance.id, -1)
+        if player >= 0:
+            if fade_out_steps == 0:
+                next_instance = self._player_next_instances[player]
+                self._set_player_next_instance(player, None)
+                if next_instance is not sound_instance:
+                    self._set_player_instance(player, next_instance)
 
-                # Adjust ducking release (if necessary)
-                if player.current.sound_has_ducking:
-                    # player.current.ducking_settings.release_duration = min(sound_instance.ducking.release * self.state.callback_data.seconds_to_bytes_factor, request_message.data.stop.fade_out_duration)
-                    # player.current.ducking_settings.release_start_pos = player.current.sample_pos
-                    # TODO: Add more intelligent ducking release point calculation here:
-                    #       Take into consideration whether ducking is already in progress and when it was
-                    #       originally scheduled to finish.
-                    pass
+            self._send_request_message(request_sound_stop, sound_instance, player, fade_out_steps)
 
         # Remove any instances of the specified sound that are pending in the sound queue
         self._remove_sound_instance_from_queue(sound_instance)
 
-        SDL_UnlockAudio()
-
     def stop_sound_looping(self, sound not None):
         """
         Cancels looping for all instances of the specified sound on the track. Any queued instances
@@ -748,20 +834,71 @@ cdef class TrackStandard(Track):
         Args:
             sound_instance: The Sound to stop
         """
-
-        SDL_LockAudio()
-
-        for i in range(self.type_state.sound_player_count):
-            if self.type_state.sound_players[i].status != player_idle and self.type_state.sound_players[
-                i].current.sound_instance_id == sound_instance.id:
-                # Set sound's loops_remaining variable to zero
-                self.type_state.sound_players[i].current.loops_remaining = 0
+        cdef int player = self._player_by_instance_id.get(sound_instance.id, -1)
+        if player >= 0:
+            self._send_request_message(request_sound_stop_looping, sound_instance, player)
 
         # Remove any instances of the specified sound that are pending in the sound queue.
         if self.sound_instance_is_in_queue(sound_instance):
             self._remove_sound_instance_from_queue(sound_instance)
 
-        SDL_UnlockAudio()
+    cdef _send_request_message(self, int message, object sound_instance=None, int player=-1,
+                               Uint32 fade_out_steps=0):
+        """
+        Sends a request message to the audio callback.  The request is applied at the start of the
+        next audio buffer.  When the request message queue is full the request is sent (in order)
+        once the audio callback has made room in the queue.
+        Args:
+            message: The RequestMessage type
+            sound_instance: The sound instance the request applies to (if any)
+            player: The number of the sound player the request applies to (if any)
+            fade_out_steps: The number of control steps to fade out over (stop requests)
+        """
+        if self._pending_request_messages:
+            self._flush_request_messages()
+
+        if self._pending_request_messages or \
+                not self._write_request_message(message, sound_instance, player, fade_out_steps):
+            self.log.debug("Request message queue is full, request will be sent later")
+            self._pending_request_messages.append((message, sound_instance, player, fade_out_steps))
+
+    cdef bint _write_request_message(self, int message, object sound_instance, int player, Uint32 fade_out_steps):
+        """
+        Writes a request message to the request message queue.
+
+        Returns:
+            True if the request was sent, False if the request message queue is full.
+        """
+        cdef RequestMessageContainer *request_message = create_request_message(self.state)
+        if request_message == NULL:
+            return False
+
+        request_message.message = <RequestMessage>message
+        request_message.player = player
+        if sound_instance is not None:
+            request_message.sound_id = sound_instance.sound_id
+            request_message.sound_instance_id = sound_instance.id
+
+        if message == request_sound_play or message == request_sound_replace:
+            self._set_player_sound_settings(cython.address(request_message.data.play.settings), sound_instance)
+        else:
+            request_message.data.stop.fade_out_duration = fade_out_steps
+
+        send_request_message(self.state)
+        return True
+
+    cdef _flush_request_messages(self):
+        """Sends the requests that did not fit into the request message queue (in order)."""
+        cdef int message
+        cdef int player
+        cdef Uint32 fade_out_steps
+
+        while self._pending_request_messages:
+            message, sound_instance, player, fade_out_steps = self._pending_request_messages[0]
+            if not self._write_request_message(message, sound_instance, player, fade_out_steps):
+                return
+
+            self._pending_request_messages.popleft()
 
     def clear_context(self, context):
         """
@@ -779,8 +916,6 @@ cdef class TrackStandard(Track):
 
         self.log.debug("Clearing context %s", context)
 
-        SDL_LockAudio()
-
         # Clear any instances in the queue with the given context value
         self._remove_all_sounds_with_context_from_queue(context)
 
@@ -792,69 +927,46 @@ cdef class TrackStandard(Track):
                 else:
                     self.stop_sound_instance_looping(sound_instance)
 
-        SDL_UnlockAudio()
-
     def _reset_state(self):
         """Resets the track state (stops all sounds immediately and clears the queue)"""
-        SDL_LockAudio()
-
         self.log.debug("Resetting track state (sounds will be stopped and queue cleared")
 
+        # The audio callback silently stops the sound players (also while the track is stopped),
+        # the sound instances are stopped right away
+        self._send_request_message(request_sound_reset)
+
         for i in range(self.type_state.sound_player_count):
-            if self.type_state.sound_players[i].status != player_idle:
-                # Set stop sound event
-                send_sound_stopped_notification(i,
-                                                self.type_state.sound_players[i].current.sound_id,
-                                                self.type_state.sound_players[i].current.sound_instance_id,
-                                                self.state)
-                self.type_state.sound_players[i].status = player_idle
+            self._set_player_next_instance(i, None)
+            self._set_player_instance(i, None)
+        self._player_priority_heap.clear()
+
+        for sound_instance in list(self._playing_instances_by_id.values()):
+            sound_instance.set_stopped()
+        self._playing_instances_by_id.clear()
 
         # Remove all sounds that are pending in the sound queue.
         self._remove_all_sounds_from_queue()
 
-        SDL_UnlockAudio()
-
     def stop_all_sounds(self, float fade_out_seconds = 0.0):
         """
         Stops all playing sounds immediately on the track.
         Args:
             fade_out_seconds: The number of seconds to fade out the sounds before stopping
         """
-        SDL_LockAudio()
+        cdef Uint32 fade_out_steps = <Uint32>(fade_out_seconds * self.state.callback_data.seconds_to_bytes_factor // self.state.callback_data.bytes_per_control_point)
 
         self.log.debug("Stopping all sounds and removing any pending sounds from queue")
 
-        for i in range(self.type_state.sound_player_count):
-            if self.type_state.sound_players[i].status != player_idle:
-
-                # Update player to stop playing sound
-                player = cython.address(self.type_state.sound_players[i])
-
-                # Calculate fade out (if necessary)
-                player.current.fade_steps_remaining = <Uint32>(fade_out_seconds * self.state.callback_data.seconds_to_bytes_factor // self.state.callback_data.bytes_per_control_point)
-                if player.current.fade_steps_remaining > 0:
-                    player.current.fade_out_steps = player.current.fade_steps_remaining
-                    player.current.fading_status = fading_status_fading_out
-                    player.status = player_stopping
-                else:
-                    # Sound will stop immediately - send sound stopped notification
-                    send_sound_stopped_notification(player.number, player.current.sound_id, player.current.sound_instance_id, self.state)
-                    player.status = player_idle
-
-                # Adjust ducking release (if necessary)
-                if player.current.sound_has_ducking:
-                    # player.current.ducking_settings.release_duration = min(sound_instance.ducking.release * self.state.callback_data.seconds_to_bytes_factor, request_message.data.stop.fade_out_duration)
-                    # player.current.ducking_settings.release_start_pos = player.current.sample_pos
-                    # TODO: Add more intelligent ducking release point calculation here:
-                    #       Take into consideration whether ducking is already in progress and when it was
-                    #       originally scheduled to finish.
-                    pass
+        # Sounds that stop immediately release their players right away
+        self._send_request_message(request_sound_stop_all, None, -1, fade_out_steps)
+        if fade_out_steps == 0:
+            for i in range(self.type_state.sound_player_count):
+                self._set_player_next_instance(i, None)
+                self._set_player_instance(i, None)
 
         # Remove all sounds that are pending in the sound queue.
         self._remove_all_sounds_from_queue()
 
-        SDL_UnlockAudio()
-
     cdef tuple _get_sound_player_with_lowest_priority(self):
         """
         Retrieves the sound player currently with the lowest priority.
@@ -864,26 +976,31 @@ cdef class TrackStandard(Track):
             the sound playing on that player (or None if the player is idle).
 
         """
-        SDL_LockAudio()
+        cdef int priority
+        cdef int player_num
 
-        cdef int lowest_priority = 2147483647
-        cdef int sound_player = -1
-        cdef int i
+        if self._idle_player_mask != 0:
+            return lowest_set_bit_index(self._idle_player_mask), None
 
-        for i in range(self.type_state.sound_player_count):
-            if self.type_state.sound_players[i].status == player_idle:
-                SDL_UnlockAudio()
-                return i, None
-            elif self.type_state.sound_players[i].current.sound_priority < lowest_priority:
-                lowest_priority = self.type_state.sound_players[i].current.sound_priority
-                sound_player = i
+        # Every busy player has an entry for the priority of its sound (or the sound waiting to
+        # replace it) in the heap.  Entries for players that have since changed sounds are discarded.
+        while self._player_priority_heap:
+            priority, player_num = self._player_priority_heap[0]
+            sound_instance = self._player_next_instances[player_num]
+            if sound_instance is None:
+                sound_instance = self._player_instances[player_num]
+            if sound_instance is not None and sound_instance.priority == priority:
+                return player_num, priority
 
-        SDL_UnlockAudio()
-        return sound_player, lowest_priority
+            heappop(self._player_priority_heap)
+
+        return -1, 2147483647
 
     cdef bint _play_sound_on_sound_player(self, sound_instance, int player, bint force=False):
         """
-        Plays a sound using the specified sound player
+        Plays a sound using the specified sound player.  The sound settings are prepared (and a
+        streaming sound is positioned) without holding the audio lock and are then passed to the
+        audio callback in a play request.
 
         Args:
             sound_instance: The SoundInstance object to play
@@ -894,9 +1011,10 @@ cdef class TrackStandard(Track):
         Returns:
             True if sound instance was able to be played, False otherwise
         """
-        self.log.debug("_play_sound_on_sound_player: %s, %s, %s", str(sound_instance), str(player), str(force))
+        cdef SoundFile sound_container
+        cdef bint player_is_idle
 
-        SDL_LockAudio()
+        self.log.debug("_play_sound_on_sound_player: %s, %s, %s", str(sound_instance), str(player), str(force))
 
         # The sound cannot be played if the track is stopped or paused
         if self.state.status == track_status_stopped or self.state.status == track_status_paused:
@@ -904,45 +1022,49 @@ cdef class TrackStandard(Track):
                            "therefore the request to play sound %s will be canceled",
                            self.name, sound_instance.name)
             sound_instance.set_canceled()
-            SDL_UnlockAudio()
             return False
 
         if not sound_instance.sound.loaded:
             self.log.debug("Specified sound is not loaded, could not "
                            "play sound %s", sound_instance.name)
-            SDL_UnlockAudio()
             return False
 
         # Make sure the player in range
-        if player in range(self.type_state.sound_player_count):
-
-            # If the specified sound player is not idle do not play the sound if force is not set
-            if self.type_state.sound_players[player].status != player_idle and not force:
-                self.log.debug("All sound players are currently in use, "
-                               "could not play sound %s", sound_instance.name)
-                SDL_UnlockAudio()
-                return False
+        if player not in range(self.type_state.sound_player_count):
+            return False
 
-            # Add sound to the dictionary of active sound instances
-            self.log.debug("Adding sound instance %s to active sound dictionary", str(sound_instance))
-            self._playing_instances_by_id[sound_instance.id] = sound_instance
+        player_is_idle = self._player_instances[player] is None
 
-            # Check if sound player is idle
-            if self.type_state.sound_players[player].status == player_idle:
-                # Start the player playing the sound instance
-                self._set_player_playing(cython.address(self.type_state.sound_players[player]), sound_instance)
-            else:
-                # The player is currently busy playing another sound, force it to be replaced with the sound instance
-                self._set_player_replacing(cython.address(self.type_state.sound_players[player]), sound_instance)
+        # If the specified sound player is not idle do not play the sound if force is not set
+        if not player_is_idle and not force:
+            self.log.debug("All sound players are currently in use, "
+                           "could not play sound %s", sound_instance.name)
+            return False
 
-            self.log.debug("Sound %s is set to begin playback on standard track (loops=%d)",
-                           sound_instance.name, sound_instance.loops)
+        # Special handling is needed to start streaming for the specified sound at the correct location
+        # (the stream ring buffer is primed with the pre-rolled data and the decode workers continue
+        # decoding from there)
+        sound_container = sound_instance.container
+        if sound_container.sample.type == sound_type_streaming:
+            sound_container.start_stream(sound_instance.start_at, sound_instance.loops != 0)
+
+        # An idle player starts the sound right away, a busy player quickly fades out its current
+        # sound and plays the sound after that (the player may have finished its current sound by
+        # the time the request is applied, it then starts the sound right away as well)
+        if player_is_idle:
+            self._send_request_message(request_sound_play, sound_instance, player)
+            self._set_player_instance(player, sound_instance)
+        else:
+            self._send_request_message(request_sound_replace, sound_instance, player)
+            self._set_player_next_instance(player, sound_instance)
 
-            SDL_UnlockAudio()
-            return True
+        # Add sound to the dictionary of active sound instances
+        self.log.debug("Adding sound instance %s to active sound dictionary", str(sound_instance))
+        self._playing_instances_by_id[sound_instance.id] = sound_instance
 
-        SDL_UnlockAudio()
-        return False
+        self.log.debug("Sound %s is set to begin playback on standard track (loops=%d)",
+                       sound_instance.name, sound_instance.loops)
+        return True
 
     cdef _set_player_sound_settings(self, SoundSettings *sound_settings, object sound_instance):
         """
@@ -999,9 +1121,9 @@ cdef class TrackStandard(Track):
         sound_settings.marker_count = sound_instance.marker_count
         g_array_set_size(sound_settings.markers, sound_settings.marker_count)
         for index in range(sound_instance.marker_count):
-            g_array_insert_val_uint(sound_settings.markers,
-                                    index,
-                                    <guint>(sound_instance.markers[index]['time'] * self.state.callback_data.seconds_to_bytes_factor))
+            g_array_set_val_uint(sound_settings.markers,
+                                 index,
+                                 <guint>(sound_instance.markers[index]['time'] * self.state.callback_data.seconds_to_bytes_factor))
 
         # Set almost finished marker (calculate based on the end of the sound)
         if sound_instance.about_to_finish_time is None:
@@ -1037,58 +1159,6 @@ cdef class TrackStandard(Track):
             sound_settings.ducking_settings.release_duration = 0
             sound_settings.ducking_settings.release_start_pos = 0
 
-        # Special handling is needed to start streaming for the specified sound at the correct location
-        if sound_container.sample.type == sound_type_streaming:
-            # Seek to the specified start position
-            gst_element_seek_simple(sound_container.sample.data.stream.pipeline,
-                                    GST_FORMAT_TIME,
-                                    <GstSeekFlags>(GST_SEEK_FLAG_FLUSH | GST_SEEK_FLAG_KEY_UNIT),
-                                    sound_instance.start_at * GST_SECOND)
-            with nogil:
-                ret = gst_element_set_state(sound_container.sample.data.stream.pipeline, GST_STATE_PLAYING)
-
-    cdef _set_player_playing(self, SoundPlayer *player, object sound_instance):
-        """
-        Sets the player status and sound settings to begin playing the sound instance
-        Args:
-            player: A pointer to the SoundPlayer on which to play the sound
-            sound_instance: The sound instance to begin playing
-        """
-        if player == NULL or sound_instance is None:
-            return
-
-        # Setup the player to start playing the sound
-        player.status = player_playing
-        self._set_player_sound_settings(cython.address(player.current), sound_instance)
-
-        # Send sound started notification
-        send_sound_started_notification(player.number, player.current.sound_id, player.current.sound_instance_id, self.state)
-
-        self.log.debug("Sound %s is set to begin playback on playlist track (loops=%d)",
-                       sound_instance.name, sound_instance.loops)
-
-    cdef _set_player_replacing(self, SoundPlayer *player, object sound_instance):
-        """
-        Sets the player status and sound settings to replace the currently playing sound with the
-        sound instance.
-        Args:
-            player: A pointer to the SoundPlayer on which to replace the sound
-            sound_instance: The sound instance to begin playing
-        """
-        if player == NULL or sound_instance is None:
-            return
-
-        # Set current sound to fade out quickly
-        player.current.fade_out_steps = self.state.callback_data.quick_fade_steps
-        player.current.fade_steps_remaining = self.state.callback_data.quick_fade_steps
-        player.current.fading_status = fading_status_fading_out
-
-        # Set the next sound to play immediately after the current one fades out
-        player.status = player_replacing
-        self._set_player_sound_settings(cython.address(player.next), sound_instance)
-
-        # TODO: Figure out how to handle ducking when replacing an existing sound
-
     cdef int _get_player_playing_sound_instance(self, sound_instance):
         """
         Return the player currently playing the specified sound instance
@@ -1099,15 +1169,12 @@ cdef class TrackStandard(Track):
             The sound player number currently playing the specified sound instance or -1 if the
             sound instance is not currently playing.
         """
-        SDL_LockAudio()
+        cdef int player_num = self._player_by_instance_id.get(sound_instance.id, -1)
 
-        for i in range(self.type_state.sound_player_count):
-            if self.type_state.sound_players[i].status != player_idle and \
-                            self.type_state.sound_players[i].current.sound_instance_id == sound_instance.id:
-                SDL_UnlockAudio()
-                return i
+        # The instance may also be waiting to replace the sound instance of the player
+        if player_num >= 0 and self._player_instances[player_num] is sound_instance:
+            return player_num
 
-        SDL_UnlockAudio()
         return -1
 
     def get_playing_sound_instance_by_id(self, sound_instance_id):
@@ -1123,8 +1190,11 @@ cdef class TrackStandard(Track):
         Returns:
             A list of status dictionaries containing the current settings for each
             sound player.
+
+        Notes:
+            The sound players are read without taking the audio lock, the status is a snapshot
+            that does not include requests the audio callback has not applied yet.
         """
-        SDL_LockAudio()
         status = []
         for player in range(self.type_state.sound_player_count):
             status.append({
@@ -1151,8 +1221,6 @@ cdef class TrackStandard(Track):
                            self.type_state.sound_players[player].current.loops_remaining,
                            self.type_state.sound_players[player].current.sample_pos)
 
-        SDL_UnlockAudio()
-
         return status
 
     def get_sound_queue_count(self):
@@ -1163,6 +1231,15 @@ cdef class TrackStandard(Track):
         """
         return len(self._sound_queue)
 
+    def get_sound_instance_pool_stats(self):
+        """
+        Gets the statistics of the track sound instance pool.
+        Returns:
+            Dictionary of sound instance pool statistics (free, retired, created, reused
+            and dropped instances).
+        """
+        return self._sound_instance_pool.get_stats()
+
     def get_sound_players_in_use_count(self):
         """
         Gets the current count of sound players in use on the track.  Used for
@@ -1170,37 +1247,15 @@ cdef class TrackStandard(Track):
         Returns:
             Integer number of sound players currently in use on the track.
         """
-        players_in_use_count = 0
-        SDL_LockAudio()
-        for i in range(self.type_state.sound_player_count):
-            if self.type_state.sound_players[i].status != player_idle:
-                players_in_use_count += 1
-        SDL_UnlockAudio()
-        return players_in_use_count
+        return sum(1 for sound_instance in self._player_instances if sound_instance is not None)
 
     def sound_is_playing(self, sound not None):
         """Returns whether or not the specified sound is currently playing on the track"""
-        SDL_LockAudio()
-        for i in range(self.type_state.sound_player_count):
-            if self.type_state.sound_players[i].status != player_idle and \
-                            self.type_state.sound_players[i].current.sound_id == sound.id:
-                SDL_UnlockAudio()
-                return True
-
-        SDL_UnlockAudio()
-        return False
+        return len(self._get_players_playing_sound(sound.id)) > 0
 
     def sound_instance_is_playing(self, sound_instance not None):
         """Returns whether or not the specified sound instance is currently playing on the track"""
-        SDL_LockAudio()
-        for i in range(self.type_state.sound_player_count):
-            if self.type_state.sound_players[i].status != player_idle and \
-                            self.type_state.sound_players[i].current.sound_instance_id == sound_instance.id:
-                SDL_UnlockAudio()
-                return True
-
-        SDL_UnlockAudio()
-        return False
+        return self._get_player_playing_sound_instance(sound_instance) >= 0
 
     def sound_is_in_queue(self, sound not None):
         """Returns whether or not an instance of the specified sound is currently in the queue"""
@@ -1297,6 +1352,9 @@ cdef class TrackStandard(Track):
 
         standard_track = <TrackStandardState*>track.type_state
 
+        # Apply any requests sent from the main thread (requests are applied at buffer boundaries)
+        apply_request_messages(track, standard_track)
+
         # Setup local variables
         cdef Uint32 buffer_bytes_remaining
         cdef Uint32 current_chunk_bytes
@@ -1315,6 +1373,7 @@ cdef class TrackStandard(Track):
 
             # Set flag indicating there is at least some activity on the track (it is active)
             track.active = True
+            track.active_player_count += 1
 
             end_of_sound = False
             track_buffer_pos = 0
@@ -1342,11 +1401,11 @@ cdef class TrackStandard(Track):
                 # Copy samples for chunk to output buffer and apply volume
                 if player.current.sample.type == sound_type_memory:
                     end_of_sound = get_memory_sound_samples(cython.address(player.current), current_chunk_bytes,
-                                                            track.buffer + track_buffer_pos, callback_data.channels,
+                                                            track.buffer + bytes_to_bus_samples(track_buffer_pos), callback_data.channels,
                                                             volume, track, player_num)
                 elif player.current.sample.type == sound_type_streaming:
                     end_of_sound = get_streaming_sound_samples(cython.address(player.current), current_chunk_bytes,
-                                                               track.buffer + track_buffer_pos, callback_data.channels,
+                                                               track.buffer + bytes_to_bus_samples(track_buffer_pos), callback_data.channels,
                                                                volume, track, player_num)
 
                 # Process sound ducking (if applicable)
@@ -1462,6 +1521,9 @@ cdef class TrackStandard(Track):
                     # End of sound behavior depends upon player status
                     if player.status == player_replacing:
                         # Replacing the current sound with a new one: copy sound player settings from next sound to current
+                        if player.current.sample != player.next.sample and \
+                                player.current.sample.type == sound_type_streaming:
+                            stop_stream(player.current.sample.data.stream)
                         player.current.sample = player.next.sample
                         player.current.sample_pos = player.next.sample_pos
                         player.current.current_loop = player.next.current_loop
@@ -1507,7 +1569,7 @@ cdef class TrackStandard(Track):
                         player.status = player_playing
                         sound_finished = False
                     else:
-                        player.status = player_idle
+                        set_player_idle(player)
                         break
 
                 # Move to next chunk
@@ -1515,7 +1577,138 @@ cdef class TrackStandard(Track):
                 track_buffer_pos += current_chunk_bytes
                 control_point += 1
 
-cdef bint get_memory_sound_samples(SoundSettings *sound, Uint32 length, Uint8 *output_buffer, int channels,
+    @staticmethod
+    cdef void apply_requests(TrackState *track) nogil:
+        """
+        Applies the requests sent to a standard track while the track is stopped or paused (its
+        sounds are not mixed then).
+        Args:
+            track: A pointer to the TrackState data structure for the track
+        """
+        if track == NULL or track.type_state == NULL:
+            return
+
+        apply_request_messages(track, <TrackStandardState*>track.type_state)
+
+cdef void apply_request_messages(TrackState *track, TrackStandardState *standard_track) nogil:
+    """
+    Applies all request messages waiting in the track request message queue to the track sound
+    players (audio callback only).
+
+    Args:
+        track: A pointer to the TrackState struct for the current track
+        standard_track: A pointer to the TrackStandardState struct for the current track
+    """
+    cdef RequestMessageContainer *request_message
+    cdef SoundPlayer *player
+    cdef int player_num
+
+    request_message = get_next_request_message(track)
+    while request_message != NULL:
+        if request_message.message == request_sound_play or request_message.message == request_sound_replace:
+            player = cython.address(standard_track.sound_players[request_message.player])
+            if player.status == player_idle:
+                # Start playing the sound right away
+                player.status = player_playing
+                copy_sound_settings(cython.address(player.current), cython.address(request_message.data.play.settings))
+                send_sound_started_notification(player.number, player.current.sound_id,
+                                                player.current.sound_instance_id, track)
+            else:
+                # A sound that was already waiting to replace the current sound will not be played
+                if player.status == player_replacing:
+                    send_sound_stopped_notification(player.number, player.next.sound_id,
+                                                    player.next.sound_instance_id, track)
+
+                # Quickly fade out the current sound and play the sound after that
+                player.current.fade_out_steps = track.callback_data.quick_fade_steps
+                player.current.fade_steps_remaining = track.callback_data.quick_fade_steps
+                player.current.fading_status = fading_status_fading_out
+                player.status = player_replacing
+                copy_sound_settings(cython.address(player.next), cython.address(request_message.data.play.settings))
+
+        elif request_message.message == request_sound_stop_all or request_message.message == request_sound_reset:
+            for player_num in range(standard_track.sound_player_count):
+                player = cython.address(standard_track.sound_players[player_num])
+                if player.status == player_idle:
+                    continue
+
+                if request_message.message == request_sound_reset:
+                    set_player_idle(player)
+                    continue
+
+                # The sound waiting to replace the current sound will not be played (the current
+                # sound is already fading out quickly)
+                if player.status == player_replacing:
+                    send_sound_stopped_notification(player.number, player.next.sound_id,
+                                                    player.next.sound_instance_id, track)
+                    player.status = player_stopping
+                    if request_message.data.stop.fade_out_duration > 0:
+                        continue
+
+                if request_message.data.stop.fade_out_duration == 0:
+                    stop_sound_player(track, player)
+                else:
+                    player.current.fade_out_steps = request_message.data.stop.fade_out_duration
+                    player.current.fade_steps_remaining = request_message.data.stop.fade_out_duration
+                    player.current.fading_status = fading_status_fading_out
+                    player.status = player_stopping
+
+        else:
+            player = cython.address(standard_track.sound_players[request_message.player])
+
+            if player.status == player_replacing and player.next.sound_instance_id == request_message.sound_instance_id:
+                # The sound waiting to replace the current sound is stopped or stops looping
+                if request_message.message == request_sound_stop:
+                    send_sound_stopped_notification(player.number, player.next.sound_id,
+                                                    player.next.sound_instance_id, track)
+                    player.status = player_stopping
+
+                elif request_message.message == request_sound_stop_looping:
+                    player.next.loops_remaining = 0
+
+            elif player.status != player_idle and player.current.sound_instance_id == request_message.sound_instance_id:
+                if request_message.message == request_sound_stop:
+                    if request_message.data.stop.fade_out_duration == 0:
+                        stop_sound_player(track, player)
+                    elif player.status != player_replacing:
+                        # (a sound that is being replaced is already fading out)
+                        player.current.fade_out_steps = request_message.data.stop.fade_out_duration
+                        player.current.fade_steps_remaining = request_message.data.stop.fade_out_duration
+                        player.current.fading_status = fading_status_fading_out
+                        player.status = player_stopping
+
+                elif request_message.message == request_sound_stop_looping:
+                    player.current.loops_remaining = 0
+
+        release_request_message(track)
+        request_message = get_next_request_message(track)
+
+cdef void stop_sound_player(TrackState *track, SoundPlayer *player) nogil:
+    """
+    Stops the current sound of a sound player immediately.  A sound that is waiting to replace
+    the current sound starts playing right away, otherwise the player is now idle.
+
+    Args:
+        track: A pointer to the TrackState struct for the current track
+        player: A pointer to the SoundPlayer
+    """
+    send_sound_stopped_notification(player.number, player.current.sound_id,
+                                    player.current.sound_instance_id, track)
+
+    if player.status != player_replacing:
+        set_player_idle(player)
+        return
+
+    if player.current.sample != player.next.sample and \
+            player.current.sample.type == sound_type_streaming:
+        stop_stream(player.current.sample.data.stream)
+
+    copy_sound_settings(cython.address(player.current), cython.address(player.next))
+    player.status = player_playing
+    send_sound_started_notification(player.number, player.current.sound_id,
+                                    player.current.sound_instance_id, track)
+
+cdef bint get_memory_sound_samples(SoundSettings *sound, Uint32 length, float *output_buffer, int channels,
                                    Uint8 volume, TrackState *track, int player_num) nogil:
     """
     Retrieves the specified number of bytes from the source sound memory buffer and mixes them into
@@ -1524,7 +1717,7 @@ cdef bint get_memory_sound_samples(SoundSettings *sound, Uint32 length, Uint8 *o
     Args:
         sound: A pointer to a SoundSettings struct (contains all sound state and settings to play the sound)
         length: The number of samples to retrieve and place in the output buffer
-        output_buffer: The output buffer
+        output_buffer: The output (track mixing) buffer
         channels: The number of channels in the output buffer (1 = mono, 2 = stereo)
         volume: The volume to apply to the output buffer (fixed for the duration of this method)
         track: A pointer to the TrackState struct for the current track
@@ -1554,13 +1747,13 @@ cdef bint get_memory_sound_samples(SoundSettings *sound, Uint32 length, Uint8 *o
             # We are not consuming the entire streaming buffer.  There will still be buffer data remaining for the next call.
             if channels == 2 and False:
                 # disabled for now
-                Track.mix_audio_stereo(output_buffer + buffer_pos,
+                Track.mix_audio_stereo(output_buffer + bytes_to_bus_samples(buffer_pos),
                                        <Uint8*>sound.sample.data.memory.data + sound.sample_pos,
                                        samples_remaining_to_output,
                                        sound.volume_left,
                                        sound.volume_right)
             else:
-                SDL_MixAudioFormat(output_buffer + buffer_pos, <Uint8*>sound.sample.data.memory.data + sound.sample_pos, track.callback_data.format, samples_remaining_to_output, volume)
+                Track.mix_audio(output_buffer + bytes_to_bus_samples(buffer_pos), <Uint8*>sound.sample.data.memory.data + sound.sample_pos, samples_remaining_to_output, volume)
 
             # Update buffer position pointers
             sound.sample_pos += samples_remaining_to_output
@@ -1571,13 +1764,13 @@ cdef bint get_memory_sound_samples(SoundSettings *sound, Uint32 length, Uint8 *o
             # Entire sound buffer consumed. Mix in remaining samples
             if channels == 2 and False:
                 # disabled for now
-                Track.mix_audio_stereo(output_buffer + buffer_pos,
+                Track.mix_audio_stereo(output_buffer + bytes_to_bus_samples(buffer_pos),
                                        <Uint8*>sound.sample.data.memory.data + sound.sample_pos,
                                        samples_remaining_to_output,
                                        sound.volume_left,
                                        sound.volume_right)
             else:
-                SDL_MixAudioFormat(output_buffer + buffer_pos, <Uint8*>sound.sample.data.memory.data + sound.sample_pos, track.callback_data.format, samples_remaining_in_sound, volume)
+                Track.mix_audio(output_buffer + bytes_to_bus_samples(buffer_pos), <Uint8*>sound.sample.data.memory.data + sound.sample_pos, samples_remaining_in_sound, volume)
 
             # Update buffer position pointers/samples remaining to place in the output buffer
             samples_remaining_to_output -= samples_remaining_in_sound
@@ -1605,7 +1798,7 @@ cdef bint get_memory_sound_samples(SoundSettings *sound, Uint32 length, Uint8 *o
 
     return False
 
-cdef bint get_streaming_sound_samples(SoundSettings *sound, Uint32 length, Uint8 *output_buffer, int channels,
+cdef bint get_streaming_sound_samples(SoundSettings *sound, Uint32 length, float *output_buffer, int channels,
                                       Uint8 volume, TrackState *track, int player_num) nogil:
     """
     Retrieves the specified number of bytes from the source sound streaming buffer and mixes them
@@ -1614,7 +1807,7 @@ cdef bint get_streaming_sound_samples(SoundSettings *sound, Uint32 length, Uint8
     Args:
         sound: A pointer to a SoundSettings struct (contains all sound state and settings to play the sound)
         length: The number of samples to retrieve and place in the output buffer
-        output_buffer: The output buffer
+        output_buffer: The output (track mixing) buffer
         channels: The number of channels in the output buffer (1 = mono, 2 = stereo)
         volume: The volume to apply to the output buffer (fixed for the duration of this method)
         track: A pointer to the TrackState struct for the current track
@@ -1624,76 +1817,56 @@ cdef bint get_streaming_sound_samples(SoundSettings *sound, Uint32 length, Uint8
         True if sound is finished, False otherwise
 
     Notes:
-        The important thing to consider about retrieving samples from the streaming sound source
-        is the buffer size used by SDL2 (output) and GStreamer (input) may be very different. A
-        buffer is "pulled" synchronously from the streaming source and is held until it is
-        completely consumed.  At which point either the sound ends if the source reports is at the
-        end of stream (eos), or another buffer is pulled.
+        Streaming sounds are decoded ahead of time by the stream decode workers into a ring
+        buffer, so this function never waits on GStreamer.  If the ring buffer does not hold
+        enough data (the decoder has fallen behind) the rest of the output buffer is left silent
+        and an underrun is counted for the stream.  The output is silent as well while a stream
+        reset requested by start_stream has not been carried out by a decode worker yet (or the
+        pipeline of the sound is still being attached again).
     """
-    if sound == NULL or output_buffer == NULL or sound.sample.data.stream.pipeline == NULL:
+    if sound == NULL or output_buffer == NULL:
         return True
 
-    cdef Uint32 samples_remaining_to_output = length
-    cdef Uint32 samples_remaining_in_map
-    cdef Uint32 buffer_pos = 0
+    cdef SampleStream *stream = sound.sample.data.stream
 
-    while samples_remaining_to_output > 0:
+    # Waiting for the pipeline to be attached again (not an underrun)
+    if SDL_AtomicGet(&stream.reset) == stream_reset_attaching:
+        return False
 
-        # Copy any samples remaining in the streaming buffer
-        if sound.sample.data.stream.map_contains_valid_sample_data:
-            samples_remaining_in_map = sound.sample.data.stream.map_info.size - sound.sample.data.stream.map_buffer_pos
-
-            # Determine if we are consuming the entire buffer of streaming samples, or just a portion of it
-            if samples_remaining_to_output < samples_remaining_in_map:
-                # We are not consuming the entire streaming buffer.  There will still be buffer data remaining for the next call.
-                if channels == 2 and False:
-                    # disabled for now
-                    Track.mix_audio_stereo(output_buffer + buffer_pos,
-                                           sound.sample.data.stream.map_info.data + sound.sample.data.stream.map_buffer_pos,
-                                           samples_remaining_to_output,
-                                           sound.volume_left,
-                                           sound.volume_right)
-                else:
-                    SDL_MixAudioFormat(output_buffer + buffer_pos,
-                                       sound.sample.data.stream.map_info.data + sound.sample.data.stream.map_buffer_pos,
-                                       track.callback_data.format, samples_remaining_to_output, volume)
+    if stream.pipeline == NULL:
+        return True
 
-                # Update buffer position pointers
-                sound.sample.data.stream.map_buffer_pos += samples_remaining_to_output
-                sound.sample_pos += samples_remaining_to_output
+    cdef Uint32 samples_remaining_to_output = length
+    cdef Uint32 buffer_pos = 0
+    cdef Uint32 available
+    cdef Uint32 contiguous
+    cdef Uint32 chunk
+    cdef int reset = SDL_AtomicGet(&stream.reset)
+
+    if reset == stream_reset_ready:
+        # A decode worker has flushed and positioned the stream, start reading from the
+        # beginning of the ring buffer (the read position must be rewound before the reset
+        # is cleared)
+        SDL_AtomicSet(&stream.ring.read_pos, 0)
+        if not SDL_AtomicCAS(&stream.reset, stream_reset_ready, stream_reset_none):
+            return False
 
-                # Sound is not finished, but the output buffer has been filled
-                return False
-            else:
-                # Entire buffer of leftover samples consumed.  Free the buffer resources to prepare for next call
-                if channels == 2 and False:
-                    # disabled for now
-                    Track.mix_audio_stereo(output_buffer + buffer_pos,
-                                           sound.sample.data.stream.map_info.data + sound.sample.data.stream.map_buffer_pos,
-                                           samples_remaining_to_output,
-                                           sound.volume_left,
-                                           sound.volume_right)
-                else:
-                    SDL_MixAudioFormat(output_buffer + buffer_pos,
-                                       sound.sample.data.stream.map_info.data + sound.sample.data.stream.map_buffer_pos,
-                                       track.callback_data.format, samples_remaining_in_map, volume)
+    elif reset != stream_reset_none:
+        # Waiting for a decode worker to carry out the reset (not an underrun)
+        return False
 
-                # Update buffer position pointers/samples remaining to place in the output buffer
-                samples_remaining_to_output -= samples_remaining_in_map
-                sound.sample_pos += samples_remaining_in_map
-                buffer_pos += samples_remaining_in_map
+    # Let the decode workers know whether to continue decoding the next loop at the end of the stream
+    SDL_AtomicSet(&stream.loop, sound.loops_remaining != 0)
 
-                # Done with the streaming buffer, release references to it
-                gst_buffer_unmap(sound.sample.data.stream.buffer, &sound.sample.data.stream.map_info)
-                gst_sample_unref(sound.sample.data.stream.sample)
+    while samples_remaining_to_output > 0:
 
-                sound.sample.data.stream.buffer = NULL
-                sound.sample.data.stream.sample = NULL
-                sound.sample.data.stream.map_buffer_pos = 0
-                sound.sample.data.stream.map_contains_valid_sample_data = 0
+        available = stream_ring_readable(&stream.ring, &contiguous)
 
-        # Check for eos (end of stream)
-        if g_object_get_bool(sound.sample.data.stream.sink, "eos"):
+        if available == 0:
+            if not stream_ring_at_end(&stream.ring):
+                # The decoder has not kept up with playback
+                stream.underruns += 1
+                return False
 
             # At the end of the stream - check if sound should loop or end
             if sound.loops_remaining > 0:
@@ -1705,6 +1878,7 @@ cdef bint get_streaming_sound_samples(SoundSettings *sound, Uint32 length, Uint8
 
             elif sound.loops_remaining == 0:
                 # At the end and not looping, the sample has finished playing (return True for end of sound)
+                SDL_AtomicSet(&stream.active, 0)
                 return True
 
             else:
@@ -1713,30 +1887,21 @@ cdef bint get_streaming_sound_samples(SoundSettings *sound, Uint32 length, Uint8
                 sound.current_loop += 1
                 send_sound_looping_notification(player_num, sound.sound_id, sound.sound_instance_id, track)
 
-            # Seek back to the beginning of the sound's source file
-            gst_element_seek_simple(sound.sample.data.stream.pipeline, GST_FORMAT_TIME, <GstSeekFlags>(GST_SEEK_FLAG_FLUSH | GST_SEEK_FLAG_KEY_UNIT), 0)
-
-        # Retrieve the next buffer from the streaming pipeline
-        sound.sample.data.stream.sample = c_appsink_pull_sample(sound.sample.data.stream.sink)
-
-        if sound.sample.data.stream.sample == NULL:
-            sound.sample.data.stream.null_buffer_count += 1
-
-            # If we've received too many consecutive null buffers, end the sound
-            if sound.sample.data.stream.null_buffer_count > CONSECUTIVE_NULL_STREAMING_BUFFER_LIMIT:
-                return True
-        else:
-            sound.sample.data.stream.null_buffer_count = 0
-            sound.sample.data.stream.buffer = gst_sample_get_buffer(sound.sample.data.stream.sample)
-
-            if gst_buffer_map(sound.sample.data.stream.buffer, &sound.sample.data.stream.map_info, GST_MAP_READ):
-                sound.sample.data.stream.map_contains_valid_sample_data = 1
-                sound.sample.data.stream.map_buffer_pos = 0
-            else:
-                sound.sample.data.stream.map_contains_valid_sample_data = 0
-                sound.sample.data.stream.map_buffer_pos = 0
-                gst_sample_unref(sound.sample.data.stream.sample)
-                sound.sample.data.stream.sample = NULL
+            # The data for the next loop follows the end marker in the ring buffer
+            SDL_AtomicSet(&stream.ring.end_pending, 0)
+            SDL_AtomicSet(&stream.loop, sound.loops_remaining != 0)
+            continue
+
+        chunk = min(samples_remaining_to_output, contiguous)
+        Track.mix_audio(output_buffer + bytes_to_bus_samples(buffer_pos),
+                        stream_ring_read_pointer(&stream.ring),
+                        chunk, volume)
+        stream_ring_consume(&stream.ring, chunk)
+
+        # Update buffer position pointers/samples remaining to place in the output buffer
+        samples_remaining_to_output -= chunk
+        sound.sample_pos += chunk
+        buffer_pos += chunk
 
     # The sound has not finished playing, but the output buffer has been filled
     return False
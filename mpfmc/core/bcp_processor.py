@@ -129,11 +129,18 @@ class BcpProcessor:
     def _get_from_queue(self, dt):
         """Gets and processes all queued up incoming BCP commands."""
         del dt
+        profiler = self.mc.frame_profiler
+        if profiler:
+            start = profiler.start_phase()
+            profiler.set_counter('bcp_queue', self.receive_queue.qsize())
 
         while not self.receive_queue.empty():
             cmd, kwargs = self.receive_queue.get(False)
             self._process_command(cmd, **kwargs)
 
+        if profiler:
+            profiler.end_phase('bcp', start)
+
     def _process_command(self, bcp_command, **kwargs):
         if self.debug_log:
             if 'rawbytes' in kwargs:
@@ -159,10 +166,14 @@ class BcpProcessor:
         """Status request."""
         del kwargs
 
-        self.send("status_report",
-                  cpu=self.mc_process.cpu_percent(),
-                  rss=self.mc_process.memory_info().rss,
-                  vms=self.mc_process.memory_info().vms)
+        status = dict(cpu=self.mc_process.cpu_percent(),
+                      rss=self.mc_process.memory_info().rss,
+                      vms=self.mc_process.memory_info().vms)
+
+        if self.mc.sound_system and self.mc.sound_system.enabled:
+            status.update(self.mc.sound_system.get_status_report())
+
+        self.send("status_report", **status)
 
     def _bcp_hello(self, **kwargs):
         """Processes an incoming BCP 'hello' command."""
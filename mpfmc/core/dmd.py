@@ -1,7 +1,6 @@
 """DMD (hardware device)."""
 import struct
 
-from kivy.graphics.instructions import Callback
 from kivy.uix.effectwidget import EffectWidget
 
 from kivy.clock import Clock
@@ -12,6 +11,7 @@ from kivy.graphics.texture import Texture
 from mpfmc.effects.gain import GainEffect
 from mpfmc.effects.flip_vertical import FlipVerticalEffect
 from mpfmc.effects.gamma import GammaEffect
+from mpfmc.uix.effects import compile_effects
 
 MYPY = False
 if MYPY:   # pragma: no cover
@@ -35,7 +35,8 @@ class DmdBase:
 
         self.source = self.mc.displays[self.config['source_display']]
         self.prev_data = None
-        self._dirty = True
+        self._rendered_change_count = -1
+        self.frames_rendered = 0
 
         # put the widget canvas on a Fbo
         texture = Texture.create(size=self.source.size, colorfmt='rgb')
@@ -56,20 +57,15 @@ class DmdBase:
         if self.config['gamma'] != 1.0:
             effect_list.append(GammaEffect(gamma=self.config['gamma']))
 
-        self.effect_widget.effects = effect_list
+        self.effect_widget.effects = compile_effects(effect_list)
         self.effect_widget.size = self.source.size
 
         self.fbo.add(self.effect_widget.canvas)
 
-        with self.source.canvas:
-            self.callback = Callback(self._trigger_rendering)
+        self.source.enable_change_tracking()
 
         self._set_dmd_fps()
 
-    def _trigger_rendering(self, *args):
-        del args
-        self._dirty = True
-
     def _get_validated_config(self, config: dict) -> dict:
         raise NotImplementedError
 
@@ -107,12 +103,21 @@ class DmdBase:
         """Draw image for DMD and send it."""
         del args
         # run this at the end of the tick to make sure all kivy bind callbacks have executed
-        if self._dirty:
-            Clock.schedule_once(self._render, -1)
+        Clock.schedule_once(self._render, -1)
 
     def _render(self, dt):
         del dt
-        self._dirty = False
+        change_count = self.source.check_for_changes()
+        if change_count == self._rendered_change_count:
+            # nothing changed on the source display since the last render
+            return
+
+        self._rendered_change_count = change_count
+        self.frames_rendered += 1
+        profiler = self.mc.frame_profiler
+        if profiler:
+            start = profiler.start_phase()
+            profiler.count('fbo_draws')
         widget = self.source
         fbo = self.fbo
 
@@ -145,6 +150,9 @@ class DmdBase:
             self.prev_data = data
             self.send(data)
 
+        if profiler:
+            profiler.end_phase('dmd', start)
+
     def send(self, data: bytes) -> None:
         """Send data to DMD via BCP."""
         raise NotImplementedError
@@ -0,0 +1,192 @@
+"""Opt-in profiling of the events and event handlers of the MC event manager."""
+import functools
+import os
+import time
+from typing import Callable, Dict, List, Tuple
+
+from mpf.core.events import EventManager
+
+
+def _handler_name(handler: Callable) -> str:
+    """Return a name for a handler which is shared by all instances of a class."""
+    if isinstance(handler, functools.partial):
+        return _handler_name(handler.func)
+    name = getattr(handler, '__qualname__', None)
+    if name is None:
+        return repr(handler)
+    return '{}.{}'.format(getattr(handler, '__module__', ''), name)
+
+
+class EventProfiler:
+
+    """Collects post counts per event and call counts and times per handler.
+
+    Handlers are grouped by their qualified name, so the handlers of all text
+    widgets (for instance) add up to a single entry per event. Handler times
+    are inclusive, i.e. they contain the time of handlers which run nested
+    (e.g. for blocking posts).
+    """
+
+    def __init__(self) -> None:
+        self.posts = dict()             # type: Dict[str, int]
+        self.handlers = dict()          # type: Dict[Tuple[str, str], List]
+        self.max_handler_counts = dict()   # type: Dict[str, int]
+
+    def record_post(self, event: str) -> None:
+        """Count a post of an event."""
+        event = event.lower()
+        self.posts[event] = self.posts.get(event, 0) + 1
+
+    def record_handler_count(self, event: str, count: int) -> None:
+        """Remember the highest number of handlers registered for an event."""
+        event = event.lower()
+        if count > self.max_handler_counts.get(event, 0):
+            self.max_handler_counts[event] = count
+
+    def wrap(self, event: str, handler: Callable) -> "ProfiledHandler":
+        """Return a handler which times handler for event."""
+        key = (event.lower(), _handler_name(handler))
+        try:
+            stats = self.handlers[key]
+        except KeyError:
+            # calls, total time, max time
+            stats = self.handlers[key] = [0, 0.0, 0.0]
+        return ProfiledHandler(handler, stats)
+
+    def reset(self) -> None:
+        """Clear all recorded statistics."""
+        self.posts.clear()
+        self.max_handler_counts.clear()
+        for stats in self.handlers.values():
+            stats[:] = [0, 0.0, 0.0]
+
+    def get_report(self) -> dict:
+        """Return per-event and per-handler statistics sorted by the time spent in handlers."""
+        events = dict()     # type: Dict[str, dict]
+        for event, posts in self.posts.items():
+            events[event] = dict(posts=posts, handlers=self.max_handler_counts.get(event, 0),
+                                 calls=0, total_time=0.0, max_time=0.0)
+
+        handlers = list()
+        for (event, name), (calls, total_time, max_time) in self.handlers.items():
+            if not calls:
+                continue
+            handlers.append(dict(event=event, handler=name, calls=calls, total_time=total_time,
+                                 max_time=max_time))
+            entry = events.setdefault(event, dict(posts=0, handlers=self.max_handler_counts.get(event, 0),
+                                                  calls=0, total_time=0.0, max_time=0.0))
+            entry['calls'] += calls
+            entry['total_time'] += total_time
+            entry['max_time'] = max(entry['max_time'], max_time)
+
+        return dict(events=sorted(({'event': event, **stats} for event, stats in events.items()),
+                                  key=lambda entry: entry['total_time'], reverse=True),
+                    handlers=sorted(handlers, key=lambda entry: entry['total_time'], reverse=True))
+
+    def format_report(self, limit: int = 20) -> List[str]:
+        """Return the report as lines of text with the top limit events and handlers."""
+        report = self.get_report()
+        lines = ["Event profiler: {} posts of {} events, {} handler calls, {:.3f}ms in handlers".format(
+            sum(self.posts.values()), len(report['events']),
+            sum(entry['calls'] for entry in report['handlers']),
+            sum(entry['total_time'] for entry in report['handlers']) * 1000)]
+
+        lines.append("Events by handler time:")
+        lines.append("  {:<40} {:>8} {:>8} {:>8} {:>12} {:>10}".format(
+            "event", "posts", "handlers", "calls", "total ms", "max ms"))
+        for entry in report['events'][:limit]:
+            lines.append("  {:<40} {:>8} {:>8} {:>8} {:>12.3f} {:>10.3f}".format(
+                entry['event'], entry['posts'], entry['handlers'], entry['calls'],
+                entry['total_time'] * 1000, entry['max_time'] * 1000))
+
+        lines.append("Handlers by total time:")
+        lines.append("  {:<60} {:<30} {:>8} {:>12} {:>10} {:>10}".format(
+            "handler", "event", "calls", "total ms", "avg ms", "max ms"))
+        for entry in report['handlers'][:limit]:
+            lines.append("  {:<60} {:<30} {:>8} {:>12.3f} {:>10.3f} {:>10.3f}".format(
+                entry['handler'], entry['event'], entry['calls'], entry['total_time'] * 1000,
+                entry['total_time'] * 1000 / entry['calls'], entry['max_time'] * 1000))
+
+        return lines
+
+    def write_report(self, filename: str, limit: int = 1000) -> None:
+        """Write the report to a text file."""
+        directory = os.path.dirname(filename)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        with open(filename, 'w') as f:
+            f.write("\n".join(self.format_report(limit)))
+            f.write("\n")
+
+
+class ProfiledHandler:
+
+    """Event handler which measures the time of the wrapped handler.
+
+    Compares equal to the wrapped handler so the handler can still be removed
+    with remove_handler() and remove_handler_by_event().
+    """
+
+    def __init__(self, callback: Callable, stats: list) -> None:
+        functools.update_wrapper(self, callback)
+        self.callback = callback
+        self._stats = stats
+
+    def __call__(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return self.callback(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            stats = self._stats
+            stats[0] += 1
+            stats[1] += elapsed
+            if elapsed > stats[2]:
+                stats[2] = elapsed
+
+    def __eq__(self, other):
+        if isinstance(other, ProfiledHandler):
+            other = other.callback
+        return self.callback == other
+
+    def __hash__(self):
+        return hash(self.callback)
+
+    def __repr__(self):
+        return '<ProfiledHandler {!r}>'.format(self.callback)
+
+
+class ProfilingEventManager(EventManager):
+
+    """Event manager which records events and handler times in an EventProfiler."""
+
+    def __init__(self, machine, profiler: EventProfiler) -> None:
+        super().__init__(machine)
+        self.profiler = profiler
+
+    def add_handler(self, event, handler, *args, **kwargs):
+        """Register a handler which is timed by the profiler."""
+        key = super().add_handler(event, self.profiler.wrap(event, handler), *args, **kwargs)
+        self.profiler.record_handler_count(event, len(self.registered_handlers.get(event.lower(), ())))
+        return key
+
+    def post(self, event, *args, **kwargs):
+        """Count the event and post it."""
+        self.profiler.record_post(event)
+        super().post(event, *args, **kwargs)
+
+    def post_boolean(self, event, *args, **kwargs):
+        """Count the event and post it."""
+        self.profiler.record_post(event)
+        super().post_boolean(event, *args, **kwargs)
+
+    def post_queue(self, event, *args, **kwargs):
+        """Count the event and post it."""
+        self.profiler.record_post(event)
+        super().post_queue(event, *args, **kwargs)
+
+    def post_relay(self, event, *args, **kwargs):
+        """Count the event and post it."""
+        self.profiler.record_post(event)
+        super().post_relay(event, *args, **kwargs)
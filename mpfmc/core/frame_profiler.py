@@ -0,0 +1,197 @@
+"""Per-frame profiling with an on-screen overlay and Chrome trace export."""
+import json
+import os
+import time
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+from kivy.clock import Clock
+from kivy.uix.label import Label
+
+MYPY = False
+if MYPY:   # pragma: no cover
+    from kivy.core.window import WindowBase
+
+
+class FrameProfiler:
+
+    """Records the phases and counters of every frame.
+
+    Instrumented code measures its phases (e.g. the event queue, BCP
+    commands, DMD renders, animations and drawing the window) with
+    start_phase() and end_phase() and adds to per-frame counters (e.g.
+    events processed, texture uploads) with count(). A frame starts with the
+    first clock callback of a Kivy frame and ends with the next one. The last
+    max_frames frames are kept for the overlay and for the trace export.
+    """
+
+    def __init__(self, max_frames: int = 1800) -> None:
+        self.frames = deque(maxlen=max_frames)  # type: deque
+        self.frame_count = 0
+        self._start_time = time.perf_counter()
+        self._frame_start = self._start_time
+        self._phases = []    # type: List[Tuple[str, float, float]]
+        self._counters = {}  # type: Dict[str, int]
+        self._draw_start = None     # type: Optional[float]
+        self._overlay = None        # type: Optional[FrameProfilerOverlay]
+        self._window = None         # type: Optional[WindowBase]
+        self._frame_ev = Clock.schedule_interval(self._next_frame, 0)
+
+    @staticmethod
+    def start_phase() -> float:
+        """Return the start timestamp of a phase."""
+        return time.perf_counter()
+
+    def end_phase(self, name: str, start: float) -> None:
+        """Record a phase of the current frame which started at start."""
+        self._phases.append((name, start, time.perf_counter() - start))
+
+    def count(self, name: str, value: int = 1) -> None:
+        """Add to a counter of the current frame."""
+        self._counters[name] = self._counters.get(name, 0) + value
+
+    def set_counter(self, name: str, value: int) -> None:
+        """Set a counter of the current frame (e.g. a queue depth)."""
+        self._counters[name] = value
+
+    def attach_window(self, window: "WindowBase") -> None:
+        """Measure drawing the window (from on_draw until the buffers are flipped)."""
+        self._window = window
+        window.fbind('on_draw', self._on_draw)
+        window.fbind('on_flip', self._on_flip)
+
+    def detach(self) -> None:
+        """Stop recording frames and remove the window bindings and the overlay (e.g. when the MC stops)."""
+        if self._frame_ev:
+            self._frame_ev.cancel()
+            self._frame_ev = None
+
+        if self._window is not None:
+            self._window.funbind('on_draw', self._on_draw)
+            self._window.funbind('on_flip', self._on_flip)
+            self._window = None
+
+        if self._overlay:
+            self._overlay.close()
+
+    def show_overlay(self, window: "WindowBase") -> None:
+        """Show frame statistics on top of the window."""
+        if not self._overlay:
+            self._overlay = FrameProfilerOverlay(self)
+        if self._overlay.parent:
+            self._overlay.parent.remove_widget(self._overlay)
+        window.add_widget(self._overlay)
+
+    def _on_draw(self, *args) -> None:
+        del args
+        self._draw_start = time.perf_counter()
+
+    def _on_flip(self, *args) -> None:
+        del args
+        if self._draw_start is not None:
+            self.end_phase('draw', self._draw_start)
+            self._draw_start = None
+            self.count('window_draws')
+
+    def _next_frame(self, dt) -> None:
+        del dt
+        now = time.perf_counter()
+        self.frames.append((self._frame_start, now - self._frame_start, self._phases, self._counters))
+        self.frame_count += 1
+        self._frame_start = now
+        self._phases = []
+        self._counters = {}
+
+    def get_stats(self, frames: int = 60) -> dict:
+        """Return statistics of the last frames."""
+        recent = list(self.frames)[-frames:]
+        if not recent:
+            return dict(frames=0, frame_time=0.0, max_frame_time=0.0, fps=0.0, phases={}, counters={})
+
+        durations = [frame[1] for frame in recent]
+        phases = {}     # type: Dict[str, float]
+        counters = {}   # type: Dict[str, float]
+        for _, _, frame_phases, frame_counters in recent:
+            for name, _, duration in frame_phases:
+                phases[name] = phases.get(name, 0.0) + duration
+            for name, value in frame_counters.items():
+                counters[name] = counters.get(name, 0) + value
+
+        frame_time = sum(durations) / len(recent)
+        return dict(frames=len(recent),
+                    frame_time=frame_time,
+                    max_frame_time=max(durations),
+                    fps=1 / frame_time if frame_time else 0.0,
+                    phases={name: value / len(recent) for name, value in phases.items()},
+                    counters={name: value / len(recent) for name, value in counters.items()})
+
+    def get_trace(self) -> dict:
+        """Return the recorded frames in the Chrome trace event format (which Perfetto opens as well)."""
+        def _us(timestamp):
+            return round((timestamp - self._start_time) * 1000000, 3)
+
+        events = [dict(name='process_name', ph='M', pid=1, tid=1, args=dict(name='mpf-mc')),
+                  dict(name='thread_name', ph='M', pid=1, tid=1, args=dict(name='main'))]
+        for start, duration, phases, counters in self.frames:
+            events.append(dict(name='frame', cat='frame', ph='X', pid=1, tid=1,
+                               ts=_us(start), dur=round(duration * 1000000, 3)))
+            for name, phase_start, phase_duration in phases:
+                events.append(dict(name=name, cat='phase', ph='X', pid=1, tid=1,
+                                   ts=_us(phase_start), dur=round(phase_duration * 1000000, 3)))
+            if counters:
+                events.append(dict(name='counters', ph='C', pid=1, tid=1, ts=_us(start), args=counters))
+
+        return dict(traceEvents=events, displayTimeUnit='ms')
+
+    def export_trace(self, filename: str) -> None:
+        """Write the recorded frames to a Chrome trace file."""
+        directory = os.path.dirname(filename)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        with open(filename, 'w') as f:
+            json.dump(self.get_trace(), f)
+
+
+class FrameProfilerOverlay(Label):
+
+    """Label which shows frame statistics in the top left corner of the window."""
+
+    update_interval = .5
+
+    def __init__(self, profiler: FrameProfiler, **kwargs) -> None:
+        super().__init__(size_hint=(None, None), font_size=12, halign='left', **kwargs)
+        self.profiler = profiler
+        self.bind(texture_size=self._reposition)
+        self._update_ev = Clock.schedule_interval(self._update, self.update_interval)
+
+    def close(self) -> None:
+        """Stop updating the overlay and remove it from the window."""
+        self._update_ev.cancel()
+        if self.parent:
+            self.parent.remove_widget(self)
+
+    def _reposition(self, *args) -> None:
+        del args
+        self.size = self.texture_size
+        if self.parent:
+            self.x = 5
+            self.top = self.parent.height - 5
+
+    def _update(self, dt) -> None:
+        del dt
+        if not self.parent:
+            return
+
+        stats = self.profiler.get_stats()
+        counters = stats['counters']
+        lines = ["frame {:.2f}ms (max {:.2f}ms) {:.0f}fps".format(
+            stats['frame_time'] * 1000, stats['max_frame_time'] * 1000, stats['fps'])]
+        lines.extend("{} {:.2f}ms".format(name, duration * 1000)
+                     for name, duration in sorted(stats['phases'].items()))
+        lines.append("bcp queue {:.0f}  events {:.1f}".format(
+            counters.get('bcp_queue', 0), counters.get('events', 0)))
+        lines.append("window draws {:.1f}  fbo draws {:.1f}  texture uploads {:.1f}".format(
+            counters.get('window_draws', 0), counters.get('fbo_draws', 0), counters.get('texture_uploads', 0)))
+        self.text = "\n".join(lines)
+        self._reposition()
@@ -0,0 +1,40 @@
+"""Headless (off-screen) rendering without a visible window."""
+import os
+
+HEADLESS_ENV_VAR = 'MPFMC_HEADLESS'
+"""Set this environment variable to 1 to run the media controller (and its tests) headless."""
+
+
+def is_headless() -> bool:
+    """Return true if the media controller renders headless."""
+    return os.environ.get(HEADLESS_ENV_VAR, '0') not in ('', '0')
+
+
+def enable_headless(software_gl: bool = True) -> None:
+    """Render all displays off-screen without a visible window.
+
+    The Kivy window is still created (displays, DMDs and RGB DMDs need its GL
+    context) but SDL renders it to an off-screen surface using its offscreen
+    video driver (EGL surfaceless) and the window is hidden. With software_gl
+    Mesa's software rasterizer is used, so no GPU is needed. Frames are not
+    limited by vsync or the fps setting and are rendered as fast as possible.
+
+    Has to be called before kivy.core.window is imported (which creates the
+    window), i.e. before MpfMc is imported. Settings from the
+    environment take priority, e.g. SDL_VIDEODRIVER=x11 to render with Xvfb
+    if SDL is too old for the offscreen driver.
+    """
+    os.environ[HEADLESS_ENV_VAR] = '1'
+    os.environ.setdefault('SDL_VIDEODRIVER', 'offscreen')
+    if software_gl:
+        os.environ.setdefault('LIBGL_ALWAYS_SOFTWARE', '1')
+
+    apply_headless_config()
+
+
+def apply_headless_config() -> None:
+    """Set the Kivy window config for headless rendering."""
+    from kivy.config import Config
+    Config.set('graphics', 'window_state', 'hidden')
+    Config.set('graphics', 'vsync', '0')
+    Config.set('graphics', 'maxfps', '0')
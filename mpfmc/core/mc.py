@@ -35,9 +35,16 @@ from mpfmc._version import __version__
 from mpfmc.assets.video import VideoAsset
 from mpfmc.core.bcp_processor import BcpProcessor
 from mpfmc.core.config_processor import ConfigProcessor
+from mpfmc.core.headless import is_headless, apply_headless_config
+from mpfmc.core.virtual_clock import VirtualClock
+from mpfmc.core.frame_profiler import FrameProfiler
+from mpfmc.core.event_profiler import EventProfiler, ProfilingEventManager
 from mpfmc.core.mode_controller import ModeController
+from mpfmc.uix.animation import AnimationScheduler
 from mpfmc.uix.transitions import TransitionManager
 from mpfmc.uix.effects import EffectsManager
+from mpfmc.uix.glyph_cache import GlyphCache
+from mpfmc.uix.label_texture_cache import LabelTextureCache
 from mpfmc.core.config_collection import create_config_collections
 from mpfmc.assets.image import ImageAsset
 from mpfmc.assets.bitmap_font import BitmapFontAsset
@@ -97,6 +104,13 @@ class MpfMc(App):
         self.machine_config = self._load_config()
 
         self.clock = Clock
+        self.virtual_clock = None
+        if self.options.get("virtual_time"):
+            # simulated timeline which advances one frame per loop as fast as possible
+            self.virtual_clock = VirtualClock(fps=self.machine_config['mpf-mc']['fps'])
+            self.virtual_clock.install()
+            self.virtual_clock.run_free()
+            self.log.info("Running on virtual time at %s frames per second", self.virtual_clock.fps)
         # pylint: disable-msg=protected-access
         self.log.info("Starting clock at %sHz", Clock._max_fps)
         self._boot_holds = set()
@@ -139,7 +153,12 @@ class MpfMc(App):
             self.thread_stopper = threading.Event()
 
         # Core components
-        self.events = EventManager(self)
+        if self.machine_config['mpf-mc']['event_profiler'] or self.options.get("event_report"):
+            self.event_profiler = EventProfiler()
+            self.events = ProfilingEventManager(self, self.event_profiler)
+        else:
+            self.event_profiler = None
+            self.events = EventManager(self)
         self.mode_controller = ModeController(self)
         create_config_collections(self, self.machine_config['mpf-mc']['config_collections'])
 
@@ -147,6 +166,24 @@ class MpfMc(App):
         self.transition_manager = TransitionManager(self)
         self.effects_manager = EffectsManager(self)
 
+        if self.machine_config['mpf-mc']['text_glyph_cache']:
+            self.glyph_cache = GlyphCache(self.machine_config['mpf-mc']['text_glyph_cache_max_fonts'])
+        else:
+            self.glyph_cache = None
+
+        if self.machine_config['mpf-mc']['label_texture_cache_size']:
+            self.label_texture_cache = LabelTextureCache(
+                self.machine_config['mpf-mc']['label_texture_cache_size'])
+        else:
+            self.label_texture_cache = None
+
+        if self.machine_config['mpf-mc']['frame_profiler'] or self.options.get("frame_trace"):
+            self.frame_profiler = FrameProfiler()
+        else:
+            self.frame_profiler = None
+        self.animation_scheduler = AnimationScheduler()
+        self.animation_scheduler.frame_profiler = self.frame_profiler
+
         self._set_machine_path()
 
         self._load_font_paths()
@@ -224,6 +261,12 @@ class MpfMc(App):
 
         self._preprocess_config(mpf_config)
 
+        if self.options.get("headless") or is_headless():
+            # headless mode is enabled by the mc command (or the test case) before the
+            # window is imported. keep the machine config from overriding its settings.
+            self.log.info("Rendering headless")
+            apply_headless_config()
+
         return mpf_config
 
     def _create_dmds(self, **kwargs):
@@ -420,6 +463,17 @@ class MpfMc(App):
                 children += 1
             self.log.info("Total children: %s", children)
         self.log.info("--- DEBUG DUMP DISPLAYS END ---")
+        if self.glyph_cache:
+            self.log.info("Glyph cache: %s", self.glyph_cache.get_stats())
+        if self.label_texture_cache:
+            self.log.info("Label texture cache: %s", self.label_texture_cache.get_stats())
+        if self.sound_system:
+            self.log.info("Audio: %s", self.sound_system.audio_interface.get_stats())
+        if self.frame_profiler:
+            self.log.info("Frames: %s", self.frame_profiler.get_stats())
+        if self.event_profiler:
+            for line in self.event_profiler.format_report():
+                self.log.info(line)
         gc.collect()
         if not self.options["production"]:
             self.log.info("--- DEBUG DUMP OBJECTS ---")
@@ -445,11 +499,29 @@ class MpfMc(App):
         self.events.post("shutdown")
         self.events.process_event_queue()
 
+        for display in self.displays:
+            display.disable_change_tracking()
+
+        self.animation_scheduler.clear()
+
         try:
             self.log.info("Loop rate %s Hz", round(self.ticks / (time.time() - self.start_time), 2))
         except ZeroDivisionError:
             pass
 
+        if self.frame_profiler and self.options.get("frame_trace"):
+            trace_file = os.path.join(self.machine_path, self.options["frame_trace"])
+            self.log.info("Writing frame trace to %s", trace_file)
+            self.frame_profiler.export_trace(trace_file)
+
+        if self.frame_profiler:
+            self.frame_profiler.detach()
+
+        if self.event_profiler and self.options.get("event_report"):
+            report_file = os.path.join(self.machine_path, self.options["event_report"])
+            self.log.info("Writing event report to %s", report_file)
+            self.event_profiler.write_report(report_file)
+
     def reset(self, **kwargs):
         del kwargs
         self.player = None
@@ -555,7 +627,14 @@ class MpfMc(App):
         """Process event queue."""
         del dt
         self.ticks += 1
+        if not self.frame_profiler:
+            self.events.process_event_queue()
+            return
+
+        start = self.frame_profiler.start_phase()
+        self.frame_profiler.count('events', len(self.events.event_queue))
         self.events.process_event_queue()
+        self.frame_profiler.end_phase('events', start)
 
     def _load_custom_code(self):
         if 'mc_scriptlets' in self.machine_config:
@@ -0,0 +1,111 @@
+"""Deterministic virtual-time clock for accelerated test and benchmark runs."""
+import os
+import time
+from typing import Callable, Optional
+
+from kivy.base import EventLoop
+from kivy.clock import Clock
+
+VIRTUAL_TIME_ENV_VAR = 'MPFMC_VIRTUAL_TIME'
+"""Set this environment variable to 1 to run the media controller on virtual time."""
+
+
+def is_virtual_time() -> bool:
+    """Return true if the media controller runs on virtual time."""
+    return os.environ.get(VIRTUAL_TIME_ENV_VAR, '0') not in ('', '0')
+
+
+class VirtualClock:
+
+    """Simulated timeline which replaces the time source of the Kivy clock.
+
+    Everything in the media controller is scheduled on the Kivy clock (slide
+    expiration, animations, transitions, asset loader and BCP queue polling,
+    DMD updates, audio ticks) so replacing its time source makes all of them
+    advance on a simulated timeline. Every frame advances the timeline by
+    exactly one frame duration and the clock never sleeps, so frames are
+    processed as fast as the CPU allows and runs are frame-accurate and
+    repeatable regardless of the machine's speed.
+
+    Use step() or advance() to drive frames manually (as the tests do) or
+    run_free() to let the Kivy event loop advance the timeline by itself.
+    Threads (asset loading, the BCP socket, the audio library) still run on
+    the wall clock.
+    """
+
+    def __init__(self, fps: int = 30, start_time: Optional[float] = None) -> None:
+        self.fps = fps if fps > 0 else 30
+        self.frame_duration = 1 / self.fps
+        self.current_time = time.time() if start_time is None else start_time
+        self.start_time = self.current_time
+        self.frames = 0
+        self._free_running_ev = None
+
+    def time(self) -> float:
+        """Return the current virtual time."""
+        return self.current_time
+
+    @property
+    def elapsed(self) -> float:
+        """Return the virtual time since the clock was created."""
+        return self.current_time - self.start_time
+
+    # pylint: disable-msg=protected-access
+    def install(self) -> None:
+        """Replace the time source of the Kivy clock with this clock.
+
+        Events which are already scheduled on the Kivy clock are kept. They
+        are moved to the virtual timeline, so they are due after the same
+        time as on the previous time source.
+        """
+        offset = self.current_time - Clock._last_tick
+        for event in Clock.get_events():
+            event._last_dt += offset
+
+        Clock._start_tick += offset
+        Clock._last_tick = self.current_time
+        Clock._last_fps_tick = None
+        Clock.time = self.time
+
+        # never sleep in the clock
+        Clock._max_fps = 0
+
+    def run_free(self) -> None:
+        """Advance the timeline by one frame after every frame of the Kivy event loop."""
+        if not self._free_running_ev:
+            self._free_running_ev = Clock.schedule_interval(self._advance_frame, 0)
+
+    def stop_free_running(self) -> None:
+        """Stop advancing the timeline from the Kivy event loop."""
+        if self._free_running_ev:
+            self._free_running_ev.cancel()
+            self._free_running_ev = None
+
+    def _advance_frame(self, dt) -> None:
+        del dt
+        self.current_time += self.frame_duration
+        self.frames += 1
+
+    def step(self, frames: int = 1) -> None:
+        """Process frames and advance the timeline by one frame duration after each of them."""
+        for _ in range(frames):
+            EventLoop.idle()
+            self._advance_frame(None)
+
+    def advance(self, secs: float) -> None:
+        """Process frames until the timeline advanced by secs."""
+        end = self.current_time + secs
+        while self.current_time < end:
+            self.step()
+
+    def run_until(self, condition: Callable[[], bool], timeout: float = 30) -> bool:
+        """Process frames until condition returns true or the virtual timeout passed.
+
+        Returns the last result of condition.
+        """
+        end = self.current_time + timeout
+        while not condition():
+            if self.current_time >= end:
+                return False
+            self.step()
+        return True
@@ -1,8 +1,9 @@
 from kivy.properties import ListProperty
-from kivy.uix.effectwidget import EffectBase
 
+from mpfmc.uix.effects import PixelEffect
 
-class ColorizeEffect(EffectBase):
+
+class ColorizeEffect(PixelEffect):
     """GLSL effect to apply a color tint to a texture."""
 
     tint_color = ListProperty([1, 0.4, 0, 0])
@@ -12,26 +13,21 @@ class ColorizeEffect(EffectBase):
     (1, 0.4, 1, 0)
     '''
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.do_glsl()
+    pixel_glsl = '''
+vec4 {name}(vec4 color, vec2 tex_coords)
+{{
+    return vec4(color.rgb * {prefix}tint_color, 1.0);
+}}
+'''
 
-    def on_tint_color(self, *args):
-        self.do_glsl()
+    uniform_types = (('tint_color', 'vec3'), )
 
-    def do_glsl(self):
-        self.glsl = colorize_glsl.format(float(self.tint_color[0]),
-                                         float(self.tint_color[1]),
-                                         float(self.tint_color[2]))
+    def on_tint_color(self, *args):
+        self.update_uniforms()
 
+    def get_uniforms(self):
+        return dict(tint_color=tuple(float(value) for value in self.tint_color[:3]))
 
-colorize_glsl = '''
-        vec4 effect(vec4 color, sampler2D texture, vec2 tex_coords, vec2 coords)
-        {{
-            vec4 c = vec4(color.x * {}, color.y * {}, color.z * {}, 1.0);
-            return c;
-        }}
-        '''
 
 effect_cls = ColorizeEffect
 name = 'colorize'
@@ -1,8 +1,9 @@
-from kivy.uix.effectwidget import EffectBase
 from kivy.properties import NumericProperty, ListProperty
 
+from mpfmc.uix.effects import PixelEffect
 
-class DotFilterEffect(EffectBase):
+
+class DotFilterEffect(PixelEffect):
 
     """GLSL effect to render an on-screen dot filter to look like individual round
     dots/pixels (simulating a DMD).
@@ -81,61 +82,57 @@ class DotFilterEffect(EffectBase):
     opaque).
     '''
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.do_glsl()
+    pixel_glsl = '''
+vec4 {name}(vec4 color, vec2 tex_coords)
+{{
+    vec2 texCoordsStep = 1.0/({prefix}size/{prefix}dot_size);
+    vec2 dotRegionCoords = fract(tex_coords.xy/texCoordsStep);
+
+    vec2 powers = pow(abs(dotRegionCoords - 0.5),vec2(2.0));
+    float radiusSqrd = pow({prefix}dot_radius,2.0);
+    float gradient = smoothstep(radiusSqrd-{prefix}blur, radiusSqrd+{prefix}blur, powers.x+powers.y);
+
+    return mix(color, {prefix}background_color, gradient);
+}}
+'''
+
+    uniform_types = (('blur', 'float'),
+                     ('dot_radius', 'float'),
+                     ('dot_size', 'float'),
+                     ('size', 'vec2'),
+                     ('background_color', 'vec4'))
+
+    # The dots are shaped inside every source pixel
+    output_resolution = True
 
     def on_width(self, *args):
-        self.do_glsl()
+        self.update_uniforms()
 
     def on_height(self, *args):
-        self.do_glsl()
+        self.update_uniforms()
 
     def on_dots_x(self, *args):
-        self.do_glsl()
+        self.update_uniforms()
 
     def on_dots_y(self, *args):
-        self.do_glsl()
+        self.update_uniforms()
 
     def on_blur(self, *args):
-        self.do_glsl()
+        self.update_uniforms()
 
     def on_dot_size(self, *args):
-        self.do_glsl()
+        self.update_uniforms()
 
     def on_background_color(self, *args):
-        self.do_glsl()
-
-    def do_glsl(self):
-        background_color = tuple(map(float, self.background_color))
-        dot_size = min(self.width / self.dots_x, self.height / self.dots_y)
-
-        self.glsl = dot_filter_glsl.format(float(self.blur),
-                                           self.dot_size / 2.0,
-                                           dot_size,
-                                           float(self.width),
-                                           float(self.height),
-                                           *background_color)
-
-
-dot_filter_glsl = '''
-        float blur = {};
-        float dotRadius = {};
-        float dotSize = {};
-
-        vec4 effect(vec4 color, sampler2D texture, vec2 tex_coords, vec2 coords)
-        {{
-            vec2 texCoordsStep = 1.0/(vec2({},{})/dotSize);
-            vec2 dotRegionCoords = fract(tex_coords.xy/texCoordsStep);
-
-            vec2 powers = pow(abs(dotRegionCoords - 0.5),vec2(2.0));
-            float radiusSqrd = pow(dotRadius,2.0);
-            float gradient = smoothstep(radiusSqrd-blur, radiusSqrd+blur, powers.x+powers.y);
-
-            vec4 newColor = mix(color, vec4({}, {}, {}, {}), gradient);
-            return newColor;
-        }}
-        '''
+        self.update_uniforms()
+
+    def get_uniforms(self):
+        return dict(blur=float(self.blur),
+                    dot_radius=self.dot_size / 2.0,
+                    dot_size=float(min(self.width / self.dots_x, self.height / self.dots_y)),
+                    size=(float(self.width), float(self.height)),
+                    background_color=tuple(map(float, self.background_color)))
+
 
 effect_cls = DotFilterEffect
 name = 'dot_filter'
@@ -1,8 +1,9 @@
-from kivy.uix.effectwidget import EffectBase
 from kivy.properties import NumericProperty
 
+from mpfmc.uix.effects import PixelEffect
 
-class GainEffect(EffectBase):
+
+class GainEffect(PixelEffect):
     """GLSL effect to apply apply a gain (brightness) adjustment to a texture.
 
     Args:
@@ -19,24 +20,21 @@ class GainEffect(EffectBase):
     defaults to 1.0 (which has no effect).
     '''
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.do_glsl()
+    pixel_glsl = '''
+vec4 {name}(vec4 color, vec2 tex_coords)
+{{
+    return vec4(color.rgb * {prefix}gain, 1.0);
+}}
+'''
 
-    def on_gain(self, *args):
-        self.do_glsl()
+    uniform_types = (('gain', 'float'), )
 
-    def do_glsl(self):
-        self.glsl = gain_glsl.format(float(self.gain))
+    def on_gain(self, *args):
+        self.update_uniforms()
 
+    def get_uniforms(self):
+        return dict(gain=float(self.gain))
 
-gain_glsl = '''
-vec4 effect(vec4 color, sampler2D texture, vec2 tex_coords, vec2 coords)
-{{
-vec4 outColor = vec4(color.x * {0}, color.y * {0}, color.z * {0}, 1.0);
-return outColor;
-}}
-'''
 
 effect_cls = GainEffect
 name = 'gain'
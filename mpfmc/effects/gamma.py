@@ -1,8 +1,9 @@
-from kivy.uix.effectwidget import EffectBase
 from kivy.properties import NumericProperty
 
+from mpfmc.uix.effects import PixelEffect
 
-class GammaEffect(EffectBase):
+
+class GammaEffect(PixelEffect):
     """GLSL effect to apply a gamma setting to a texture"""
 
     gamma = NumericProperty(1.0)
@@ -13,24 +14,21 @@ class GammaEffect(EffectBase):
     defaults to 1.0 (which has no effect).
     '''
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.do_glsl()
+    pixel_glsl = '''
+vec4 {name}(vec4 color, vec2 tex_coords)
+{{
+    return vec4(pow(color.rgb, vec3({prefix}gamma)), 1.0);
+}}
+'''
 
-    def on_gamma(self, *args):
-        self.do_glsl()
+    uniform_types = (('gamma', 'float'), )
 
-    def do_glsl(self):
-        self.glsl = gamma_glsl.format(float(self.gamma))
+    def on_gamma(self, *args):
+        self.update_uniforms()
 
+    def get_uniforms(self):
+        return dict(gamma=float(self.gamma))
 
-gamma_glsl = '''
-vec4 effect(vec4 color, sampler2D texture, vec2 tex_coords, vec2 coords)
-{{
-    vec4 outColor = vec4(pow(color.x, {0}), pow(color.y, {0}), pow(color.z, {0}), 1.0);
-    return outColor;
-}}
-'''
 
 effect_cls = GammaEffect
 name = 'gamma'
@@ -1,8 +1,9 @@
-from kivy.uix.effectwidget import EffectBase
 from kivy.properties import ListProperty
 
+from mpfmc.uix.effects import PixelEffect
 
-class MonochromeEffect(EffectBase):
+
+class MonochromeEffect(PixelEffect):
     """GLSL effect to convert the texture to monochrome.
 
     More information here:
@@ -18,26 +19,22 @@ class MonochromeEffect(EffectBase):
     (.299, .587, .114)
     '''
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.do_glsl()
-
-    def on_luminosity(self, *args):
-        self.do_glsl()
-
-    def do_glsl(self):
-        self.glsl = monochrome_glsl.format(float(self.luminosity[0]),
-                                           float(self.luminosity[1]),
-                                           float(self.luminosity[2]))
-
-
-monochrome_glsl = '''
-vec4 effect(vec4 color, sampler2D texture, vec2 tex_coords, vec2 coords)
+    pixel_glsl = '''
+vec4 {name}(vec4 color, vec2 tex_coords)
 {{
-    float lum = ((color.x * {}) + (color.y * {}) + (color.z * {}));
+    float lum = dot(color.rgb, {prefix}luminosity);
     return vec4(lum, lum, lum, 1.0);
 }}
 '''
 
+    uniform_types = (('luminosity', 'vec3'), )
+
+    def on_luminosity(self, *args):
+        self.update_uniforms()
+
+    def get_uniforms(self):
+        return dict(luminosity=tuple(float(value) for value in self.luminosity[:3]))
+
+
 effect_cls = MonochromeEffect
 name = 'monochrome'
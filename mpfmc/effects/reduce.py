@@ -1,8 +1,9 @@
-from kivy.uix.effectwidget import EffectBase
 from kivy.properties import NumericProperty
 
+from mpfmc.uix.effects import PixelEffect
 
-class ReduceEffect(EffectBase):
+
+class ReduceEffect(PixelEffect):
     """GLSL effect to reduce a texture to fewer bits per color channel."""
 
     shades = NumericProperty(16)
@@ -13,28 +14,20 @@ class ReduceEffect(EffectBase):
     defaults to 16.
     '''
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.do_glsl()
+    pixel_glsl = '''
+vec4 {name}(vec4 color, vec2 tex_coords)
+{{
+    return vec4(floor(color.rgb * {prefix}bit_depth) / {prefix}bit_depth, 1.0);
+}}
+'''
+
+    uniform_types = (('bit_depth', 'float'), )
 
     def on_shades(self, *args):
-        self.do_glsl()
-
-    def do_glsl(self):
-        self.glsl = reduce_glsl.format(abs(float(self.shades - 1)))
-
-
-reduce_glsl = '''
-        vec4 effect(vec4 color, sampler2D texture, vec2 tex_coords, vec2 coords)
-        {{
-        float bitDepth = {};
-        vec4 outColor = vec4(floor(color.x * bitDepth) / bitDepth,
-                             floor(color.y * bitDepth) / bitDepth,
-                             floor(color.z * bitDepth) / bitDepth,
-                             1.0);
-        return outColor;
-        }}
-        '''
+        self.update_uniforms()
+
+    def get_uniforms(self):
+        return dict(bit_depth=abs(float(self.shades - 1)))
 
 
 effect_cls = ReduceEffect
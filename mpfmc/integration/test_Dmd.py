@@ -22,3 +22,20 @@ class TestDMDs(MpfIntegrationTestCase, MpfSlideTestCase):
         self.advance_time_and_run(.1)
         self.assertEqual(bytearray([0x3, 0xe, 0x22] * 128 * 32), default.hw_device.data)
         self.assertEqual(bytearray([0xe, 0x3, 0x22] * 128 * 32), grb.hw_device.data)
+
+    def test_skip_unchanged_frames(self):
+        self.post_event("show_dmd_slide_1")
+        self.advance_time_and_run(.5)
+        dmd = self.mc.rgb_dmds[0]
+        frames_rendered = dmd.frames_rendered
+        self.assertGreater(frames_rendered, 0)
+
+        # nothing changes on the dmd display. no more frames are rendered
+        self.advance_time_and_run(1)
+        self.assertEqual(frames_rendered, dmd.frames_rendered)
+
+        # a change on the display renders it again
+        self.mc.displays['dmd'].current_slide.widgets[0].widget.color = [1, 0, 0, 1]
+        self.advance_time_and_run(.1)
+        self.assertGreater(dmd.frames_rendered, frames_rendered)
+        self.assertEqual(bytearray([0xff, 0, 0] * 128 * 32), self.machine.rgb_dmds["default"].hw_device.data)
@@ -8,6 +8,12 @@ if not verbose:
     os.environ['KIVY_NO_FILELOG'] = '1'
     os.environ['KIVY_NO_CONSOLELOG'] = '1'
 
+from mpfmc.core.headless import is_headless, enable_headless
+
+if is_headless():
+    # render off-screen (has to be done before the Kivy window is imported)
+    enable_headless()
+
 from kivy.graphics.opengl import glReadPixels, GL_RGB, GL_UNSIGNED_BYTE
 from kivy import Config, Logger
 from kivy.base import runTouchApp, stopTouchApp, EventLoop
@@ -22,7 +28,8 @@ if not verbose:
     Config.set('kivy', 'log_level', 'warning')
 
 from mpfmc.core.mc import MpfMc
-from time import time, sleep
+from mpfmc.core.virtual_clock import VirtualClock
+from time import sleep
 
 sys.stderr = sys.__stderr__
 
@@ -37,9 +44,11 @@ class MpfMcTestCase(unittest.TestCase):
         self.max_test_setup_secs = 30
 
         self._fps = 30
+        self.clock = None
 
-    def _mc_time(self):
-        return self._current_time
+    @property
+    def _current_time(self):
+        return self.clock.current_time
 
     def get_options(self):
         return dict(machine_path=self.get_machine_path(),
@@ -65,17 +74,14 @@ class MpfMcTestCase(unittest.TestCase):
         return os.path.join(os.path.abspath(os.curdir), path)
 
     def advance_time(self, secs=.1):
-        start = self._current_time
-        while self._current_time < start + secs:
-            EventLoop.idle()
-            self._current_time += 1 / self._fps
+        self.clock.advance(secs)
 
     def advance_real_time(self, secs=.1):
-        start = self._current_time
-        while self._current_time < start + secs:
-            EventLoop.idle()
-            sleep(1 / self._fps)
-            self._current_time += 1 / self._fps
+        # for tests which depend on threads running on the wall clock (e.g. audio)
+        end = self.clock.current_time + secs
+        while self.clock.current_time < end:
+            self.clock.step()
+            sleep(self.clock.frame_duration)
 
         EventLoop.idle()
 
@@ -125,16 +131,13 @@ class MpfMcTestCase(unittest.TestCase):
         # Most of the setup is done in run(). Explanation is there.
         Config._named_configs.pop('app', None)
 
-        self._start_time = time()
-        self._current_time = self._start_time
-        Clock._start_tick = self._start_time
-        Clock._last_tick = self._start_time
-        Clock.time = self._mc_time
+        # cancel the events the previous test left on the clock
+        for event in Clock.get_events():
+            event.cancel()
 
-        # prevent sleep in clock
-        Clock._max_fps = 0
-        # reset clock
-        Clock._root_event = None
+        # run on a simulated timeline which advances one frame at a time
+        self.clock = VirtualClock(fps=self._fps)
+        self.clock.install()
 
         from mpf.core.player import Player
         Player.monitor_enabled = False
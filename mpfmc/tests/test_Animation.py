@@ -1,4 +1,5 @@
 from mpfmc.tests.MpfMcTestCase import MpfMcTestCase
+from mpfmc.uix.animation import MpfAnimation
 
 
 class TestAnimation(MpfMcTestCase):
@@ -329,6 +330,51 @@ class TestAnimation(MpfMcTestCase):
         self.assertAlmostEqual(190, widget.x, delta=30)
         self.assertAlmostEqual(145, widget.y, delta=30)
 
+    def test_animation_scheduler(self):
+        self.mc.events.post('show_slide2')
+        self.advance_time()
+        widget = self.mc.targets['default'].current_slide.widgets[0].widget
+
+        self.mc.events.post('entrance2')
+        self.advance_time()
+        animation_scheduler = self.mc.animation_scheduler
+        ticks = animation_scheduler.get_stats()['ticks']
+
+        # the animation is advanced by the scheduler instead of its own clock event
+        self.assertIsInstance(widget.animation, MpfAnimation)
+        self.assertIsNone(widget.animation._update_ev)
+        self.assertIn(widget.animation, animation_scheduler._animations)
+
+        self.advance_time(.5)
+        self.assertGreater(animation_scheduler.get_stats()['ticks'], ticks)
+        self.assertAlmostEqual(190, widget.x, delta=30)
+
+        self.advance_time(1)
+        self.assertNotIn(widget.animation, animation_scheduler._animations)
+        self.assertEqual(0, widget.x)
+        self.assertEqual(0, widget.y)
+
+    def test_animation_scheduler_per_mc(self):
+        # a repeating animation is still running when the MC stops
+        self.mc.events.post('show_slide1')
+        self.advance_time()
+        animation_scheduler = self.mc.animation_scheduler
+        self.assertTrue(animation_scheduler._animations)
+        self.mc.stop()
+        self.assertFalse(animation_scheduler._animations)
+
+        # the animations of the next MC in this process are advanced
+        self.setUp()
+        self.assertIsNot(animation_scheduler, self.mc.animation_scheduler)
+        self.mc.events.post('show_slide1')
+        self.advance_time()
+        widget = self.mc.targets['default'].current_slide.widgets[0].widget
+        self.assertTrue(self.mc.animation_scheduler._animations)
+        x = widget.x
+        self.advance_time(.5)
+        self.assertNotEqual(x, widget.x)
+        self.assertGreater(self.mc.animation_scheduler.get_stats()['ticks'], 0)
+
     def test_named_animation(self):
         self.mc.events.post('show_slide3')
 
@@ -5,10 +5,11 @@ from unittest.mock import MagicMock, call, ANY
 
 try:
     from mpfmc.core.audio import SoundSystem
-    from mpfmc.assets.sound import SoundInstance, SoundStealingMethod, SoundPool, ModeEndAction
+    from mpfmc.assets.sound import SoundInstance, SoundInstancePool, SoundStealingMethod, SoundPool, ModeEndAction
 except ImportError:
     SoundSystem = None
     SoundInstance = None
+    SoundInstancePool = None
     SoundStealingMethod = None
     ModeEndAction = None
     SoundPool = None
@@ -136,6 +137,28 @@ class TestAudio(MpfMcTestCase):
         self.advance_real_time(1)
         self.assertTrue(track_sfx.sound_is_playing(self.mc.sounds['264828_text']))
 
+        # Check audio callback statistics (idle tracks are skipped by the mixer)
+        stats = interface.get_stats()
+        self.assertGreater(stats['callbacks'], 0)
+        self.assertGreater(stats['tracks_mixed'], 0)
+        self.assertGreater(stats['tracks_skipped'], 0)
+        self.assertGreaterEqual(stats['active_players']['sfx'], 1)
+        self.assertEqual(stats['active_players']['voice'], 0)
+        self.assertEqual(stats['notifications_dropped'], 0)
+        self.assertGreaterEqual(track_sfx.active_player_count, 1)
+
+        # Check the audio engine telemetry (callback load histogram and per-track counters)
+        telemetry = interface.get_telemetry()
+        self.assertGreater(telemetry['callbacks'], 0)
+        self.assertAlmostEqual(sum(telemetry['load_histogram']), telemetry['callbacks'], delta=1)
+        self.assertLessEqual(telemetry['load_p50'], telemetry['load_p99'])
+        self.assertGreaterEqual(telemetry['tracks']['sfx']['active_players_peak'], 1)
+        self.assertGreater(telemetry['tracks']['sfx']['mix_time_ms'], 0)
+        self.assertEqual(telemetry['tracks']['voice']['active_players_peak'], 0)
+        self.assertIn('audio_overruns', self.mc.sound_system.get_status_report())
+        interface.reset_telemetry()
+        self.assertLess(interface.get_telemetry()['callbacks'], telemetry['callbacks'])
+
         # Test two sounds at the same time on the voice track (only
         # 1 sound at a time max).  Second sound should be queued and
         # play immediately after the first one ends.
@@ -280,6 +303,35 @@ class TestAudio(MpfMcTestCase):
         self.assertIsNone(instance3.events_when_stopped)
         self.assertEqual(instance3.max_queue_time, 0.0)
 
+        # Instances without overridden parameters share the settings of the sound
+        instance4 = SoundInstance(self.mc.sounds['210871_synthping'], None, {'priority': 0})
+        self.assertIs(instance4._settings, instance1._settings)
+        self.assertIsNot(instance2._settings, instance1._settings)
+        self.assertEqual(instance1.priority, 1)
+        with self.assertRaises(AttributeError):
+            instance1.custom_attribute = True
+
+        # Finished instances are only reused once they are no longer referenced
+        pool = SoundInstancePool()
+        instance5 = pool.acquire(self.mc.sounds['210871_synthping'], 'mode1', {'priority': 2})
+        instance5.set_canceled()
+        instance6 = pool.acquire(self.mc.sounds['264828_text'])
+        self.assertIsNot(instance6, instance5)
+        self.assertEqual(instance5.priority, 2)
+        self.assertTrue(instance5.finished)
+        instance6.set_canceled()
+        instance6_id = instance6.id
+        del instance6
+        instance7 = pool.acquire(self.mc.sounds['210871_synthping'], 'mode2')
+        self.assertEqual(pool.get_stats()['reused'], 1)
+        # A reused instance gets a new id
+        self.assertGreater(instance7.id, instance6_id)
+        self.assertGreater(instance7.id, instance5.id)
+        self.assertEqual(instance7.context, 'mode2')
+        self.assertEqual(instance7.priority, 1)
+        self.assertEqual(instance7.name, '210871_synthping')
+        self.assertTrue(instance7.pending)
+
     def test_mode_sounds(self):
         """ Test the sound system using sounds specified in a mode """
 
@@ -449,6 +501,58 @@ class TestAudio(MpfMcTestCase):
         instance.stop(0.25)
         self.advance_real_time(0.3)
 
+    def test_sound_queue(self):
+        """Tests the priority queue used to hold sound instances waiting for a sound player"""
+
+        if SoundSystem is None or self.mc.sound_system is None:
+            log = logging.getLogger('TestAudio')
+            log.warning("Sound system is not enabled - skipping audio tests")
+            self.skipTest("Sound system is not enabled")
+
+        from mpfmc.core.audio.sound_queue import SoundQueue
+
+        queue = SoundQueue()
+        low = SoundInstance(self.mc.sounds['210871_synthping'], 'mode1', {'priority': 1, 'key': 'a'})
+        high = SoundInstance(self.mc.sounds['264828_text'], 'mode1', {'priority': 5, 'key': 'b'})
+        expiring = SoundInstance(self.mc.sounds['104457_moron_test'], 'mode2', {'priority': 5, 'key': 'a'})
+        expiring.exp_time = 1.0
+        for sound_instance in (low, expiring, high):
+            queue.push(sound_instance)
+
+        # Highest priority first, instances that never expire before instances that do
+        self.assertEqual(len(queue), 3)
+        self.assertIs(queue.peek(), high)
+        self.assertIs(queue.pop(), high)
+        self.assertNotIn(high, queue)
+        self.assertIs(queue.pop(), expiring)
+        self.assertIs(queue.pop(), low)
+        self.assertIsNone(queue.pop())
+
+        # Removed instances are skipped and may be queued again
+        for sound_instance in (low, expiring, high):
+            queue.push(sound_instance)
+        self.assertTrue(queue.remove(high))
+        self.assertFalse(queue.remove(high))
+        self.assertIs(queue.peek(), expiring)
+        queue.push(high)
+        self.assertIs(queue.peek(), high)
+        self.assertEqual(len(queue), 3)
+
+        # Bulk removals by key, context and sound
+        self.assertCountEqual(queue.remove_key('a'), [low, expiring])
+        self.assertEqual(len(queue), 1)
+        self.assertEqual(queue.remove_context('mode2'), [])
+        self.assertTrue(queue.contains_sound(self.mc.sounds['264828_text'].id))
+        self.assertEqual(queue.remove_sound(self.mc.sounds['264828_text'].id), [high])
+        self.assertFalse(queue.contains_sound(self.mc.sounds['264828_text'].id))
+        self.assertIsNone(queue.peek())
+
+        queue.push(low)
+        queue.push(expiring)
+        self.assertEqual(queue.remove_context('mode2'), [expiring])
+        self.assertEqual(queue.clear(), [low])
+        self.assertEqual(len(queue), 0)
+
     def test_sound_instance_management(self):
         """ Tests instance management of sounds"""
 
@@ -661,6 +765,151 @@ class TestAudio(MpfMcTestCase):
         self.assertIsNone(drum_group_instance4)
         self.assertIsNone(drum_group_instance5)
 
+    def test_sound_player_indexes(self):
+        """ Tests finding idle sound players and the sound player indexes of a standard track"""
+
+        if SoundSystem is None or self.mc.sound_system is None:
+            log = logging.getLogger('TestAudio')
+            log.warning("Sound system is not enabled - skipping audio tests")
+            self.skipTest("Sound system is not enabled")
+
+        interface = self.mc.sound_system.audio_interface
+        if interface is None:
+            log = logging.getLogger('TestAudio')
+            log.warning("Sound system audio interface could not be loaded - skipping audio tests")
+            self.skipTest("Sound system audio interface could not be loaded")
+
+        track_sfx = interface.get_track_by_name("sfx")
+        self.assertEqual(track_sfx.max_simultaneous_sounds, 8)
+        self.advance_real_time()
+
+        drum = self.mc.sounds['4832__zajo__drum07']
+        other_drum = self.mc.sounds['84480__zgump__drum-fx-4']
+        self.assertTrue(drum.loaded)
+        self.assertTrue(other_drum.loaded)
+
+        def player_instance_ids():
+            return [status['sound_instance_id'] if status['status'] != 'idle' else None
+                    for status in track_sfx.get_status()]
+
+        # Sounds are played on the lowest numbered idle players which are marked busy
+        instance1 = drum.play(settings={'loops': -1, 'priority': 2})
+        instance2 = drum.play(settings={'loops': -1, 'priority': 3})
+        instance3 = other_drum.play(settings={'loops': -1, 'priority': 4})
+        self.advance_real_time()
+        self.assertEqual([instance1.id, instance2.id, instance3.id, None, None, None, None, None],
+                         player_instance_ids())
+        self.assertEqual(3, track_sfx.get_sound_players_in_use_count())
+
+        # A stopped player is marked idle right away and is the next idle player
+        track_sfx.stop_sound_instance(instance2, fade_out=0)
+        self.assertFalse(track_sfx.sound_instance_is_playing(instance2))
+        self.assertTrue(track_sfx.sound_instance_is_playing(instance1))
+        self.assertTrue(track_sfx.sound_is_playing(drum))
+        self.assertEqual(2, track_sfx.get_sound_players_in_use_count())
+
+        instance4 = other_drum.play(settings={'loops': -1, 'priority': 5})
+        self.assertTrue(track_sfx.sound_instance_is_playing(instance4))
+        self.advance_real_time()
+        self.assertEqual([instance1.id, instance4.id, instance3.id, None, None, None, None, None],
+                         player_instance_ids())
+
+        # Stopping a sound only stops (and frees) the players playing it
+        track_sfx.stop_sound(other_drum)
+        self.advance_real_time()
+        self.assertEqual([instance1.id, None, None, None, None, None, None, None], player_instance_ids())
+        self.assertFalse(track_sfx.sound_is_playing(other_drum))
+        self.assertFalse(track_sfx.sound_instance_is_playing(instance3))
+        self.assertFalse(track_sfx.sound_instance_is_playing(instance4))
+        self.assertTrue(track_sfx.sound_is_playing(drum))
+
+        # With all players busy a higher priority sound steals the player playing the sound with
+        # the lowest priority
+        others = [drum.play(settings={'loops': -1, 'priority': 10 + i}) for i in range(7)]
+        self.advance_real_time()
+        self.assertEqual([instance1.id] + [sound_instance.id for sound_instance in others], player_instance_ids())
+        self.assertEqual(8, track_sfx.get_sound_players_in_use_count())
+
+        instance5 = other_drum.play(settings={'loops': -1, 'priority': 20})
+        self.advance_real_time()
+        self.assertEqual([instance5.id] + [sound_instance.id for sound_instance in others], player_instance_ids())
+        self.assertFalse(track_sfx.sound_instance_is_playing(instance1))
+        self.assertTrue(track_sfx.sound_instance_is_playing(instance5))
+        self.assertTrue(track_sfx.sound_is_playing(other_drum))
+
+        # The next steal uses the lowest priority of the remaining sounds
+        instance6 = other_drum.play(settings={'loops': -1, 'priority': 30})
+        self.advance_real_time()
+        self.assertEqual([instance5.id, instance6.id] + [sound_instance.id for sound_instance in others[1:]],
+                         player_instance_ids())
+        self.assertFalse(track_sfx.sound_instance_is_playing(others[0]))
+
+        # A sound with a lower priority than all playing sounds is queued
+        instance7 = drum.play(settings={'loops': -1, 'priority': 1})
+        self.assertTrue(track_sfx.sound_instance_is_in_queue(instance7))
+        self.assertFalse(track_sfx.sound_instance_is_playing(instance7))
+
+        track_sfx.stop_all_sounds()
+        self.advance_real_time()
+        self.assertEqual([None] * 8, player_instance_ids())
+        self.assertEqual(0, track_sfx.get_sound_players_in_use_count())
+        self.assertFalse(track_sfx.sound_is_playing(drum))
+        self.assertFalse(track_sfx.sound_is_playing(other_drum))
+
+    def test_sound_requests(self):
+        """ Tests sending more requests than fit into the request queue and stopping sounds on a paused track"""
+
+        if SoundSystem is None or self.mc.sound_system is None:
+            log = logging.getLogger('TestAudio')
+            log.warning("Sound system is not enabled - skipping audio tests")
+            self.skipTest("Sound system is not enabled")
+
+        interface = self.mc.sound_system.audio_interface
+        if interface is None:
+            log = logging.getLogger('TestAudio')
+            log.warning("Sound system audio interface could not be loaded - skipping audio tests")
+            self.skipTest("Sound system audio interface could not be loaded")
+
+        track_sfx = interface.get_track_by_name("sfx")
+        self.advance_real_time()
+
+        drum = self.mc.sounds['4832__zajo__drum07']
+        self.assertTrue(drum.loaded)
+
+        def player_instance_ids():
+            return [status['sound_instance_id'] if status['status'] != 'idle' else None
+                    for status in track_sfx.get_status()]
+
+        # Stop and play the sounds of all players again and again without giving the audio
+        # callback a chance to apply the requests (the request queue overflows)
+        instances = [drum.play(settings={'loops': -1}) for _ in range(8)]
+        for _ in range(10):
+            for player, sound_instance in enumerate(instances):
+                track_sfx.stop_sound_instance(sound_instance, fade_out=0)
+                instances[player] = drum.play(settings={'loops': -1})
+
+        self.assertEqual(8, track_sfx.get_sound_players_in_use_count())
+        for sound_instance in instances:
+            self.assertTrue(track_sfx.sound_instance_is_playing(sound_instance))
+
+        self.advance_real_time()
+        self.assertEqual([sound_instance.id for sound_instance in instances], player_instance_ids())
+        self.assertEqual(0, track_sfx.notifications_dropped)
+
+        # Sounds are stopped while the track is paused
+        track_sfx.pause()
+        track_sfx.stop_all_sounds()
+        self.assertEqual(0, track_sfx.get_sound_players_in_use_count())
+        self.advance_real_time()
+        self.assertEqual([None] * 8, player_instance_ids())
+        for sound_instance in instances:
+            self.assertTrue(sound_instance.finished)
+
+        track_sfx.play()
+        sound_instance = drum.play()
+        self.advance_real_time()
+        self.assertEqual([sound_instance.id] + [None] * 7, player_instance_ids())
+
     def test_sound_player_parameters(self):
         """ Tests sound parameters overridden in the sound_player"""
 
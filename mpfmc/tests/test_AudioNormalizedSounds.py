@@ -0,0 +1,149 @@
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+from mpfmc.tests.MpfMcTestCase import MpfMcTestCase
+
+try:
+    from mpfmc.core.audio import SoundSystem
+    from mpfmc.core.audio.sound_normalizer import NormalizedSoundCache, read_wav_format, WAVE_FORMAT_PCM
+except ImportError:
+    SoundSystem = None
+    logging.warning("mpfmc.core.audio library could not be loaded. Audio "
+                    "features will not be available")
+
+
+class TestAudioNormalizedSounds(MpfMcTestCase):
+    """
+    Tests normalizing sound files to the output format of the audio engine and loading
+    normalized files without conversion.
+    """
+
+    def get_machine_path(self):
+        return 'tests/machine_files/audio'
+
+    def get_config_file(self):
+        return 'test_audio.yaml'
+
+    def test_normalize_sound_file(self):
+        """ Tests normalizing a sound file and loading the normalized file """
+
+        if SoundSystem is None or self.mc.sound_system is None:
+            log = logging.getLogger('TestAudio')
+            log.warning("Sound system is not enabled - skipping audio tests")
+            self.skipTest("Sound system is not enabled")
+
+        interface = self.mc.sound_system.audio_interface
+        if interface is None:
+            log = logging.getLogger('TestAudio')
+            log.warning("Sound system audio interface could not be loaded - skipping audio tests")
+            self.skipTest("Sound system audio interface could not be loaded")
+
+        settings = interface.get_settings()
+        frame_bytes = 2 * settings['audio_channels']
+        source_file = self.mc.sounds['198361_sfx-028'].file
+        build_path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, build_path)
+        cache = NormalizedSoundCache(self.mc.machine_path, build_path,
+                                     settings['sample_rate'], settings['audio_channels'])
+
+        # Without a normalized file the source file is loaded
+        self.assertFalse(cache.is_up_to_date(source_file))
+        self.assertEqual(cache.get_file_name(source_file), source_file)
+
+        # Normalize the sound (an ogg file) to a WAV file in the output format
+        target_file = cache.target_file_name(source_file)
+        os.makedirs(os.path.dirname(target_file), exist_ok=True)
+        samples = interface.normalize_sound_file(source_file, target_file)
+        self.assertGreater(samples, 0)
+
+        wav_format = read_wav_format(target_file)
+        self.assertEqual(wav_format.format_tag, WAVE_FORMAT_PCM)
+        self.assertEqual(wav_format.sample_rate, settings['sample_rate'])
+        self.assertEqual(wav_format.channels, settings['audio_channels'])
+        self.assertEqual(wav_format.bits_per_sample, 16)
+
+        cache.add(source_file, target_file, samples)
+        cache.save()
+
+        # The manifest is reloaded and the normalized file is used while the source is unchanged
+        cache = NormalizedSoundCache(self.mc.machine_path, build_path,
+                                     settings['sample_rate'], settings['audio_channels'])
+        self.assertTrue(cache.is_up_to_date(source_file))
+        self.assertEqual(cache.get_file_name(source_file), target_file)
+        self.assertEqual(cache.get_stats()['hits'], 1)
+
+        # Normalized files are not used for a different output format
+        other_cache = NormalizedSoundCache(self.mc.machine_path, build_path,
+                                           settings['sample_rate'] // 2, settings['audio_channels'])
+        self.assertFalse(other_cache.is_up_to_date(source_file))
+
+        # The normalized file is loaded with a straight read and holds the same sample data
+        # length as the source file converted when loading
+        container = interface.load_sound_file_to_memory(target_file)
+        self.assertTrue(container.loaded)
+        self.assertAlmostEqual(container.duration, samples * frame_bytes / (settings['sample_rate'] * frame_bytes))
+        source_container = interface.load_sound_file_to_memory(source_file)
+        self.assertAlmostEqual(container.duration, source_container.duration, delta=0.05)
+        interface.unload_sound_file(container)
+        interface.unload_sound_file(source_container)
+
+        # A truncated normalized file is not used
+        with open(target_file, 'r+b') as wav_file:
+            wav_file.truncate(os.path.getsize(target_file) - frame_bytes)
+        self.assertFalse(cache.is_up_to_date(source_file))
+        self.assertEqual(cache.get_file_name(source_file), source_file)
+
+    @staticmethod
+    def _build_sounds(machine_path):
+        # The command opens its own (offline) audio interface and shuts SDL down when it is done,
+        # so it runs in a separate process like "mpf build_sounds" does
+        subprocess.run([sys.executable, '-c',
+                        'import sys; from mpfmc.commands.build_sounds import Command; '
+                        'Command(None, sys.argv[1], sys.argv[2:])',
+                        machine_path, '-c', 'test_audio'], check=True, stdout=subprocess.DEVNULL)
+
+    def test_build_sounds_command(self):
+        """ Tests normalizing the sounds of the audio test machine with the build_sounds command """
+
+        if SoundSystem is None or self.mc.sound_system is None:
+            log = logging.getLogger('TestAudio')
+            log.warning("Sound system is not enabled - skipping audio tests")
+            self.skipTest("Sound system is not enabled")
+
+        interface = self.mc.sound_system.audio_interface
+        if interface is None:
+            log = logging.getLogger('TestAudio')
+            log.warning("Sound system audio interface could not be loaded - skipping audio tests")
+            self.skipTest("Sound system audio interface could not be loaded")
+
+        # Run the command on a copy of the machine config and sound effects (the command writes
+        # to the machine folder)
+        machine_path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, machine_path)
+        shutil.copytree(os.path.join(self.mc.machine_path, 'config'), os.path.join(machine_path, 'config'))
+        shutil.copytree(os.path.join(self.mc.machine_path, 'sounds', 'sfx'),
+                        os.path.join(machine_path, 'sounds', 'sfx'))
+        source_files = sorted(os.path.join(machine_path, 'sounds', 'sfx', file_name)
+                              for file_name in os.listdir(os.path.join(machine_path, 'sounds', 'sfx'))
+                              if file_name.endswith(('.wav', '.ogg')))
+
+        self._build_sounds(machine_path)
+
+        # Every sound file is normalized to the output format in the config (44.1 kHz stereo)
+        cache = NormalizedSoundCache(machine_path, os.path.join(machine_path, 'build', 'sounds'), 44100, 2)
+        self.assertEqual(cache.get_stats()['entries'], len(source_files))
+        for source_file in source_files:
+            self.assertTrue(cache.is_up_to_date(source_file))
+            target_file = cache.get_file_name(source_file)
+            self.assertEqual(target_file, cache.target_file_name(source_file))
+            self.assertEqual(read_wav_format(target_file).sample_rate, 44100)
+
+        # Up to date files are skipped when the command runs again
+        mtimes = [os.path.getmtime(cache.target_file_name(source_file)) for source_file in source_files]
+        self._build_sounds(machine_path)
+        self.assertEqual(mtimes, [os.path.getmtime(cache.target_file_name(source_file))
+                                  for source_file in source_files])
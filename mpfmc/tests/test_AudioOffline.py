@@ -0,0 +1,81 @@
+import logging
+import os
+import tempfile
+import wave
+
+from mpfmc.tests.MpfMcTestCase import MpfMcTestCase
+
+try:
+    from mpfmc.core.audio import SoundSystem
+except ImportError:
+    SoundSystem = None
+    logging.warning("mpfmc.core.audio library could not be loaded. Audio "
+                    "features will not be available")
+
+
+class TestAudioOffline(MpfMcTestCase):
+    """
+    Tests rendering audio offline (the audio callback is driven by the audio interface
+    render function instead of the audio device).
+    """
+
+    def get_machine_path(self):
+        return 'tests/machine_files/audio'
+
+    def get_config_file(self):
+        return 'test_audio_offline.yaml'
+
+    def test_offline_render(self):
+        """ Tests rendering sounds offline into memory and a WAV file """
+
+        if SoundSystem is None or self.mc.sound_system is None:
+            log = logging.getLogger('TestAudio')
+            log.warning("Sound system is not enabled - skipping audio tests")
+            self.skipTest("Sound system is not enabled")
+
+        interface = self.mc.sound_system.audio_interface
+        if interface is None:
+            log = logging.getLogger('TestAudio')
+            log.warning("Sound system audio interface could not be loaded - skipping audio tests")
+            self.skipTest("Sound system audio interface could not be loaded")
+
+        self.assertTrue(interface.is_offline)
+        self.assertTrue(interface.enabled)
+        settings = interface.get_settings()
+        track_sfx = interface.get_track_by_name("sfx")
+        self.assertIsNotNone(track_sfx)
+
+        # Nothing is playing: the rendered audio is silent and the offline clock advances by
+        # whole buffers
+        callbacks = interface.get_stats()['callbacks']
+        silence = interface.render(0.1)
+        buffer_count = len(silence) // settings['buffer_size']
+        self.assertEqual(len(silence), buffer_count * settings['buffer_size'])
+        self.assertEqual(silence, bytes(len(silence)))
+        self.assertAlmostEqual(interface.rendered_time,
+                               buffer_count * settings['buffer_samples'] / settings['sample_rate'])
+        self.assertEqual(interface.get_stats()['callbacks'], callbacks + buffer_count)
+
+        # Render a sound into a WAV file sink
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        wav_file_name = os.path.join(temp_dir.name, 'offline.wav')
+        interface.open_wav_sink(wav_file_name)
+        instance = track_sfx.play_sound(self.mc.sounds['210871_synthping'])
+        self.assertIsNotNone(instance)
+        output = interface.render(0.5)
+        interface.close_wav_sink()
+
+        self.assertNotEqual(output, bytes(len(output)))
+        self.assertEqual(interface.get_stats()['dropouts'], 0)
+
+        with wave.open(wav_file_name, 'rb') as wav_file:
+            self.assertEqual(wav_file.getnchannels(), settings['audio_channels'])
+            self.assertEqual(wav_file.getframerate(), settings['sample_rate'])
+            self.assertEqual(wav_file.readframes(wav_file.getnframes()), output)
+
+        # Once the sound has finished the output is silent again
+        interface.render(self.mc.sounds['210871_synthping'].container.duration)
+        self.assertFalse(track_sfx.sound_is_playing(self.mc.sounds['210871_synthping']))
+        output = interface.render(0.1)
+        self.assertEqual(output, bytes(len(output)))
@@ -1,4 +1,5 @@
 import logging
+import os
 
 from mpfmc.tests.MpfMcTestCase import MpfMcTestCase
 from unittest.mock import MagicMock, ANY
@@ -110,4 +111,122 @@ class TestAudioGStreamer(MpfMcTestCase):
         self.assertTrue(track_music.sound_is_playing(self.mc.sounds['city_loop']))
         self.advance_real_time(1)
 
+        # Reloading a streaming sound reuses its pooled pipeline
+        self.mc.events.post('stop_city_loop')
+        self.advance_real_time(0.5)
+        pipeline_stats = interface.get_stats()['streaming_pipelines']
+        container = self.mc.sounds['city_loop'].container
+        container.unload()
+        self.assertFalse(container.loaded)
+        container.load()
+        self.assertTrue(container.loaded)
+        new_pipeline_stats = interface.get_stats()['streaming_pipelines']
+        self.assertEqual(new_pipeline_stats['constructed'], pipeline_stats['constructed'])
+        self.assertEqual(new_pipeline_stats['reused'], pipeline_stats['reused'] + 1)
+        self.assertEqual(new_pipeline_stats['pipelines'], pipeline_stats['pipelines'])
+        self.assertGreater(new_pipeline_stats['construction_time_saved'], 0)
+
+    def test_stream_decoding(self):
+        """ Tests decoding a streamed sound ahead of playback (using gstreamer) """
+
+        if SoundSystem is None or self.mc.sound_system is None:
+            log = logging.getLogger('TestAudio')
+            log.warning("Sound system is not enabled - skipping audio tests")
+            self.skipTest("Sound system is not enabled")
+
+        self.assertIsNotNone(self.mc.sound_system)
+        interface = self.mc.sound_system.audio_interface
+        if interface is None:
+            log = logging.getLogger('TestAudio')
+            log.warning("Sound system audio interface could not be loaded - skipping audio tests")
+            self.skipTest("Sound system audio interface could not be loaded")
+
+        self.assertIsNotNone(interface)
+        track_music = interface.get_track_by_name("music")
+        self.assertIsNotNone(track_music)
+
+        container = self.mc.sounds['city_loop'].container
+        self.assertTrue(container.loaded)
+        frame_bytes = 2 * interface.get_settings()['audio_channels']
+
+        # The beginning of the sound is decoded into the pre-roll buffer when it is loaded
+        prebuffer = container.prebuffer
+        self.assertGreater(len(prebuffer), 0)
+        self.assertEqual(len(prebuffer) % frame_bytes, 0)
+        self.assertTrue(any(prebuffer))
+        self.assertFalse(container.get_stream_status()['active'])
+
+        self.mc.events.post('play_city_loop')
+        self.advance_real_time(1)
+        self.assertTrue(track_music.sound_is_playing(self.mc.sounds['city_loop']))
+
+        # The decode worker has reset the stream and keeps decoding ahead of playback
+        status = container.get_stream_status()
+        self.assertTrue(status['active'])
+        self.assertFalse(status['reset_pending'])
+        self.assertFalse(status['eos'])
+        self.assertGreater(status['played'], len(prebuffer))
+        self.assertEqual(status['played'] % frame_bytes, 0)
+        self.assertGreaterEqual(status['decoded'], status['played'])
+        self.assertLessEqual(status['decoded'] - status['played'], status['ring_size'])
+
+        # Restarting the sound resets the stream to the pre-rolled data again
+        self.mc.events.post('stop_city_loop')
+        self.advance_real_time(0.5)
+        self.assertFalse(container.get_stream_status()['active'])
+        self.assertEqual(container.prebuffer, prebuffer)
 
+        self.mc.events.post('play_city_loop')
+        self.advance_real_time(1)
+        self.assertTrue(track_music.sound_is_playing(self.mc.sounds['city_loop']))
+        status = container.get_stream_status()
+        self.assertFalse(status['reset_pending'])
+        self.assertGreater(status['played'], len(prebuffer))
+        self.assertLess(status['played'], 2 * interface.get_settings()['sample_rate'] * frame_bytes)
+
+        # Streaming underruns are reported in the audio interface statistics
+        self.assertEqual(interface.get_stats()['stream_underruns'], container.underruns)
+
+    def test_reattach_stream_pipeline(self):
+        """ Tests playing a streamed sound whose pipeline was reassigned (using gstreamer) """
+
+        if SoundSystem is None or self.mc.sound_system is None:
+            log = logging.getLogger('TestAudio')
+            log.warning("Sound system is not enabled - skipping audio tests")
+            self.skipTest("Sound system is not enabled")
+
+        self.assertIsNotNone(self.mc.sound_system)
+        interface = self.mc.sound_system.audio_interface
+        if interface is None:
+            log = logging.getLogger('TestAudio')
+            log.warning("Sound system audio interface could not be loaded - skipping audio tests")
+            self.skipTest("Sound system audio interface could not be loaded")
+
+        track_music = interface.get_track_by_name("music")
+        container = self.mc.sounds['city_loop'].container
+        self.assertTrue(container.loaded)
+
+        # Loading another streaming sound takes the only pipeline from the sound that is not playing
+        other_container = interface.load_sound_file_for_streaming(
+            os.path.join(self.mc.machine_path, 'sounds', 'music', '263774_music.ogg'))
+        self.addCleanup(other_container.unload)
+        pipeline_stats = interface.get_stats()['streaming_pipelines']
+        self.assertEqual(pipeline_stats['pipelines'], 1)
+        self.assertEqual(pipeline_stats['reassigned'], 1)
+
+        # Playing the sound attaches a pipeline again in the background, the sound starts once the
+        # pipeline is ready
+        self.mc.events.post('play_city_loop')
+        self.advance_real_time(1)
+        self.assertTrue(track_music.sound_is_playing(self.mc.sounds['city_loop']))
+        self.assertEqual(interface.get_stats()['streaming_pipelines']['reassigned'], 2)
+        status = container.get_stream_status()
+        self.assertFalse(status['attaching'])
+        self.assertTrue(status['active'])
+        self.assertFalse(status['reset_pending'])
+        self.assertGreater(status['played'], 0)
+        self.assertEqual(interface.get_stats()['stream_underruns'], 0)
+
+        self.mc.events.post('stop_city_loop')
+        self.advance_real_time(0.5)
+        self.assertFalse(track_music.sound_is_playing(self.mc.sounds['city_loop']))
@@ -1,4 +1,5 @@
 from mpfmc.tests.MpfMcTestCase import MpfMcTestCase
+from mpfmc.uix.bitmap_font.bitmap_font import _SurfaceContainer
 
 
 class TestBitmapFonts(MpfMcTestCase):
@@ -93,3 +94,46 @@ class TestBitmapFonts(MpfMcTestCase):
         self.mc.events.post('static_text')
         self.advance_real_time(3)
 
+
+    def test_render_matches_python_path(self):
+        # render text in one go and glyph by glyph with the glyph positions
+        # calculated in Python from the font descriptor. both have to be equal.
+        for font_name, text in (('F1fuv', 'TEST 123'),
+                                ('test_font', 'STATIC TEXT'),
+                                ('test_font_2', 'AVATAR To Ay "T" @!$')):
+            for kerning in (True, False):
+                container = _FontContainer(self.mc.bitmap_fonts[font_name], kerning)
+                width, height = container.font.bitmap_font.get_extents(text, kerning)
+
+                rendered = _SurfaceContainer(width + 20, height + 20)
+                rendered.render(container, text, 10, 10)
+
+                expected = _SurfaceContainer(width + 20, height + 20)
+                characters = container.font.bitmap_font.get_characters()
+                kernings = container.font.bitmap_font.get_kernings()
+                x = 10
+                previous_char = -1
+                for text_char in text:
+                    current_char = ord(text_char)
+                    if current_char in characters:
+                        if kerning:
+                            x += kernings.get(previous_char, {}).get(current_char, 0)
+                        expected.render(container, text_char, x, 10)
+                        x += characters[current_char].xadvance
+                    previous_char = current_char
+
+                self.assertEqual(bytes(expected.get_data().data), bytes(rendered.get_data().data),
+                                 "{} kerning={}".format(font_name, kerning))
+                self.assertTrue(any(bytes(rendered.get_data().data)))
+
+
+class _FontContainer:
+
+    """Minimal stand-in for the label which is passed to _SurfaceContainer.render."""
+
+    def __init__(self, font, font_kerning):
+        self.font = font
+        self.options = {'font_kerning': font_kerning}
+
+    def get_font_asset(self):
+        return self.font
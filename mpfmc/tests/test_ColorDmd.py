@@ -1,4 +1,12 @@
+from kivy.uix.effectwidget import ScanlinesEffect
+
+from mpfmc.effects.dot_filter import DotFilterEffect
+from mpfmc.effects.gain import GainEffect
+from mpfmc.effects.monochrome import MonochromeEffect
 from mpfmc.tests.MpfMcTestCase import MpfMcTestCase
+from mpfmc.uix.display import NativeDisplayOutput
+from mpfmc.uix.effects import FusedEffect, fused_effect_glsl, split_native_effects
+from mpfmc.widgets.display import DisplayWidget
 
 
 class TestDmd(MpfMcTestCase):
@@ -23,3 +31,71 @@ class TestDmd(MpfMcTestCase):
         self.mc.events.post('slide2')
         self.mc.events.post('dmd_slide')
         self.advance_time(4)
+
+    def test_fused_effects(self):
+        self.advance_time()
+        self.mc.events.post('slide2')
+        self.advance_time()
+
+        # Consecutive pixel effects are rendered in a single shader pass
+        displays = [widget.widget for widget in self.mc.targets['default'].current_slide.widgets
+                    if isinstance(widget.widget, DisplayWidget)]
+        passes = sorted(len(display.effects.effects) for display in displays)
+        self.assertEqual([1, 1, 2], passes)
+
+        fused_effects = [effect for display in displays for effect in display.effects.effects
+                         if isinstance(effect, FusedEffect)]
+        self.assertEqual([3, 5], sorted(len(effect.effects) for effect in fused_effects))
+        for effect in fused_effects:
+            self.assertIn('e2_effect', effect.glsl)
+            self.assertIs(effect.effects[0].uniform_owner, effect)
+
+            # The generated shaders are cached by effect chain
+            self.assertEqual(fused_effect_glsl(tuple(member.__class__ for member in effect.effects)), effect.glsl)
+
+        self.assertGreater(fused_effect_glsl.cache_info().hits, 0)
+
+
+class TestNativeResolutionDmd(MpfMcTestCase):
+    def get_machine_path(self):
+        return 'tests/machine_files/dmd'
+
+    def get_config_file(self):
+        return 'test_color_dmd.yaml,test_color_dmd_native.yaml'
+
+    def test_native_resolution(self):
+        self.advance_time()
+        self.mc.events.post('slide2')
+        self.mc.events.post('dmd_slide')
+        self.advance_time()
+
+        displays = [widget.widget for widget in self.mc.targets['default'].current_slide.widgets
+                    if isinstance(widget.widget, DisplayWidget)]
+        native_outputs = [display.effects for display in displays
+                          if isinstance(display.effects, NativeDisplayOutput)]
+
+        # The dot filter comes first in the dmd effects so both effect chains are
+        # rendered in the output pass. Scanlines are no pixel effect.
+        self.assertEqual(2, len(native_outputs))
+        for output in native_outputs:
+            self.assertEqual([], output.native_effects)
+            self.assertEqual(1, len(output.native_fbos))
+            self.assertEqual((128, 32), output.texture.size)
+            self.assertEqual('nearest', output.texture.mag_filter)
+            self.assertIsInstance(output.output_effects[0], DotFilterEffect)
+            self.assertIs(output, output.output_effects[-1].uniform_owner)
+
+            # the display is scaled to the widget and centered
+            self.assertEqual([640, 160], list(output.rectangle.size))
+
+        self.advance_time(1)
+
+    def test_split_native_effects(self):
+        monochrome = MonochromeEffect()
+        dot_filter = DotFilterEffect()
+        gain = GainEffect()
+
+        self.assertEqual(([monochrome], [dot_filter, gain]),
+                         split_native_effects([monochrome, dot_filter, gain]))
+        self.assertEqual(([monochrome, gain], []), split_native_effects([monochrome, gain]))
+        self.assertIsNone(split_native_effects([ScanlinesEffect(), monochrome]))
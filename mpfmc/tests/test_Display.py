@@ -1,4 +1,4 @@
-from mpfmc.uix.display import Display, DisplayOutput
+from mpfmc.uix.display import Display, DisplayOutput, CachedDisplayOutput
 from mpfmc.tests.MpfMcTestCase import MpfMcTestCase
 
 
@@ -30,3 +30,58 @@ class TestDisplay(MpfMcTestCase):
 
         self.assertEqual(self.mc.displays['window'].current_slide_name, 'window_slide_1')
         self.assertEqual(self.mc.displays['dmd'].current_slide_name, 'asset_status')
+
+
+class TestCachedDisplay(MpfMcTestCase):
+    def get_machine_path(self):
+        return 'tests/machine_files/display'
+
+    def get_config_file(self):
+        return 'test_display.yaml,test_display_cache.yaml'
+
+    def test_cached_display(self):
+        # The window display is not cached, the nested dmd is
+        self.assertNotIsInstance(self.mc.displays['window'].parent, CachedDisplayOutput)
+        output = self.mc.displays['dmd'].parent
+        self.assertIsInstance(output, CachedDisplayOutput)
+        self.assertEqual(output.pos, (2, 0))
+        self.assertEqual((output.width, output.height), tuple(output.fbo.size))
+        self.advance_time()
+
+        # The cache is only rendered when the display changed
+        frames_rendered = output.frames_rendered
+        self.assertGreater(frames_rendered, 0)
+        self.advance_time(1)
+        self.assertEqual(frames_rendered, output.frames_rendered)
+
+        self.mc.displays['dmd'].current_slide.widgets[0].widget.update_text("LOADED")
+        self.advance_time()
+        self.assertEqual(frames_rendered + 1, output.frames_rendered)
+        self.advance_time(1)
+        self.assertEqual(frames_rendered + 1, output.frames_rendered)
+
+        # The cache is rendered from the change check of the display
+        display = self.mc.displays['dmd']
+        self.assertIn(output._update_cache, display._change_listeners)
+        output.remove_display_source(display)
+        self.assertNotIn(output._update_cache, display._change_listeners)
+        output.add_display_source(display)
+        self.assertIn(output._update_cache, display._change_listeners)
+
+    def test_disable_change_tracking(self):
+        display = self.mc.displays['dmd']
+        event = display._change_tracking_event
+        self.assertTrue(event.is_triggered)
+
+        # the per-frame change check is cancelled (e.g. when the MC stops)
+        display.disable_change_tracking()
+        self.assertFalse(event.is_triggered)
+        self.assertIsNone(display._change_tracking_event)
+
+        # and scheduled again when it is enabled
+        display.enable_change_tracking()
+        self.assertTrue(display._change_tracking_event.is_triggered)
+        change_count = display.change_count
+        display.current_slide.widgets[0].widget.update_text("LOADED")
+        self.advance_time()
+        self.assertGreater(display.change_count, change_count)
@@ -0,0 +1,60 @@
+import os
+import tempfile
+
+from mpfmc.core.event_profiler import ProfilingEventManager
+from mpfmc.tests.MpfMcTestCase import MpfMcTestCase
+
+
+class TestEventProfiler(MpfMcTestCase):
+
+    def get_machine_path(self):
+        return 'tests/machine_files/slide'
+
+    def get_config_file(self):
+        return 'test_slides.yaml,test_event_profiler.yaml'
+
+    def _handler(self, **kwargs):
+        del kwargs
+        self.calls += 1
+
+    def test_event_profiler(self):
+        self.assertIsInstance(self.mc.events, ProfilingEventManager)
+        profiler = self.mc.event_profiler
+        profiler.reset()
+        self.calls = 0
+
+        self.mc.events.add_handler('test_event', self._handler)
+        for _ in range(3):
+            self.mc.events.post('test_event')
+        self.advance_time()
+        self.assertEqual(3, self.calls)
+
+        report = profiler.get_report()
+        event = [entry for entry in report['events'] if entry['event'] == 'test_event'][0]
+        self.assertEqual(3, event['posts'])
+        self.assertEqual(1, event['handlers'])
+        self.assertEqual(3, event['calls'])
+
+        handler = [entry for entry in report['handlers'] if entry['event'] == 'test_event'][0]
+        self.assertIn('TestEventProfiler._handler', handler['handler'])
+        self.assertEqual(3, handler['calls'])
+        self.assertGreaterEqual(handler['total_time'], handler['max_time'])
+        self.assertGreater(handler['max_time'], 0)
+
+        # profiled handlers can still be removed
+        self.mc.events.remove_handler(self._handler)
+        self.mc.events.post('test_event')
+        self.advance_time()
+        self.assertEqual(3, self.calls)
+
+        # report is logged on debug_dump_stats and can be written to a file
+        self.mc.events.post('debug_dump_stats')
+        self.advance_time()
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'events.txt')
+            profiler.write_report(filename)
+            with open(filename) as f:
+                text = f.read()
+
+        self.assertIn('test_event', text)
+        self.assertIn('TestEventProfiler._handler', text)
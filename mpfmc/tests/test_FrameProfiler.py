@@ -0,0 +1,77 @@
+import json
+import os
+import tempfile
+
+from kivy.core.window import Window
+
+from mpfmc.core.frame_profiler import FrameProfilerOverlay
+from mpfmc.tests.MpfMcTestCase import MpfMcTestCase
+
+
+class TestFrameProfiler(MpfMcTestCase):
+
+    def get_machine_path(self):
+        return 'tests/machine_files/animation'
+
+    def get_config_file(self):
+        return 'test_animation.yaml,test_frame_profiler.yaml'
+
+    def test_frame_profiler(self):
+        profiler = self.mc.frame_profiler
+        self.assertIsNotNone(profiler)
+        self.assertTrue([child for child in Window.children if isinstance(child, FrameProfilerOverlay)])
+
+        frame_count = profiler.frame_count
+        self.mc.events.post('show_slide2')
+        self.advance_time()
+        self.mc.events.post('entrance2')
+        self.advance_time(.5)
+
+        # every frame is recorded with its phases and counters
+        self.assertGreaterEqual(profiler.frame_count - frame_count, 15)
+        stats = profiler.get_stats(profiler.frame_count - frame_count)
+        self.assertIn('events', stats['phases'])
+        self.assertIn('bcp', stats['phases'])
+        self.assertIn('animations', stats['phases'])
+        self.assertGreater(stats['counters']['events'], 0)
+        self.assertGreater(stats['counters']['animations'], 0)
+        self.assertGreater(stats['counters']['texture_uploads'], 0)
+
+        # the overlay shows the statistics
+        self.advance_time(1)
+        overlay = profiler._overlay
+        self.assertIn("texture uploads", overlay.text)
+
+        # export as Chrome trace
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'trace.json')
+            profiler.export_trace(filename)
+            with open(filename) as f:
+                trace = json.load(f)
+
+        events = trace['traceEvents']
+        frames = [event for event in events if event['name'] == 'frame']
+        self.assertEqual(len(profiler.frames), len(frames))
+        self.assertTrue(all(event['ph'] == 'X' and event['dur'] >= 0 for event in frames))
+        self.assertTrue([event for event in events if event['name'] == 'animations' and event['ph'] == 'X'])
+        self.assertTrue([event for event in events if event['ph'] == 'C' and 'events' in event['args']])
+
+    def test_detach_when_stopped(self):
+        profiler = self.mc.frame_profiler
+        overlay = profiler._overlay
+        self.assertIn(overlay, Window.children)
+        display_widgets = [child for child in Window.children if child is not overlay]
+
+        # the overlay and the window bindings are removed when the MC stops
+        self.mc.stop()
+        self.assertNotIn(overlay, Window.children)
+        profiler._phases.clear()
+        Window.dispatch('on_draw')
+        Window.dispatch('on_flip')
+        self.assertNotIn('draw', [phase[0] for phase in profiler._phases])
+
+        # the window only shows the display of the next MC in this process
+        self.setUp()
+        for widget in display_widgets:
+            self.assertNotIn(widget, Window.children)
+        self.assertIn(self.mc.frame_profiler._overlay, Window.children)
@@ -0,0 +1,65 @@
+import ctypes
+import os
+import unittest
+from unittest.mock import patch
+
+from mpfmc.core.headless import is_headless, enable_headless, HEADLESS_ENV_VAR
+from mpfmc.tests.MpfMcTestCase import MpfMcTestCase
+
+SDL_WINDOW_HIDDEN = 0x00000008
+
+
+class TestHeadless(unittest.TestCase):
+
+    def test_is_headless(self):
+        with patch.dict(os.environ, {HEADLESS_ENV_VAR: '1'}):
+            self.assertTrue(is_headless())
+        with patch.dict(os.environ, {HEADLESS_ENV_VAR: '0'}):
+            self.assertFalse(is_headless())
+
+    @patch('mpfmc.core.headless.apply_headless_config')
+    def test_enable_headless(self, apply_headless_config):
+        with patch.dict(os.environ, {'SDL_VIDEODRIVER': 'x11'}):
+            os.environ.pop(HEADLESS_ENV_VAR, None)
+            os.environ.pop('LIBGL_ALWAYS_SOFTWARE', None)
+            enable_headless()
+
+            self.assertTrue(is_headless())
+            self.assertEqual('1', os.environ['LIBGL_ALWAYS_SOFTWARE'])
+            # settings from the environment are kept
+            self.assertEqual('x11', os.environ['SDL_VIDEODRIVER'])
+            apply_headless_config.assert_called_once_with()
+
+
+class TestHeadlessWindow(MpfMcTestCase):
+
+    def get_machine_path(self):
+        return 'tests/machine_files/display'
+
+    def get_config_file(self):
+        return 'test_display.yaml'
+
+    def test_window_is_offscreen(self):
+        if not is_headless():
+            self.skipTest("Not running headless (set {}=1)".format(HEADLESS_ENV_VAR))
+
+        try:
+            from kivy.core.window import _window_sdl2
+        except ImportError:
+            self.skipTest("The window does not use SDL2")
+
+        # look up the SDL functions in the SDL library the window uses
+        sdl = ctypes.CDLL(_window_sdl2.__file__)
+        sdl.SDL_GetCurrentVideoDriver.restype = ctypes.c_char_p
+        sdl.SDL_GL_GetCurrentWindow.restype = ctypes.c_void_p
+        sdl.SDL_GetWindowFlags.argtypes = [ctypes.c_void_p]
+        sdl.SDL_GetWindowFlags.restype = ctypes.c_uint32
+
+        # the window was created with the headless video driver and is hidden
+        self.assertEqual(os.environ['SDL_VIDEODRIVER'].encode(), sdl.SDL_GetCurrentVideoDriver())
+        window = sdl.SDL_GL_GetCurrentWindow()
+        self.assertTrue(window)
+        self.assertTrue(sdl.SDL_GetWindowFlags(window) & SDL_WINDOW_HIDDEN)
+
+        # and displays are rendered
+        self.assertEqual(self.mc.displays['window'].current_slide_name, 'window_slide_1')
@@ -1,4 +1,8 @@
 from mpfmc.tests.MpfMcTestCase import MpfMcTestCase
+from mpfmc.widgets.text import compile_text_template, TEMPLATE_LITERAL, TEMPLATE_VAR, \
+    TEMPLATE_PLAYER_VAR, TEMPLATE_PLAYER_NUM_VAR, TEMPLATE_MACHINE_VAR
+from mpfmc.uix.glyph_cache import GlyphCache
+from mpfmc.uix.label_texture_cache import LabelTextureCache
 
 
 class TestText(MpfMcTestCase):
@@ -431,3 +435,146 @@ class TestText(MpfMcTestCase):
         self.mc.events.post('text_bad_line_break')
         self.advance_time()
         self.assertLess(self.get_widget().height, 30)
+
+    def test_compiled_text_template(self):
+        template = compile_text_template('HI (param1) (player|score)(player2|score)(machine|credits) $')
+        self.assertEqual(('param1', 'player|score', 'player2|score', 'machine|credits'), template.variables)
+        self.assertEqual([TEMPLATE_LITERAL, TEMPLATE_VAR, TEMPLATE_LITERAL, TEMPLATE_PLAYER_VAR,
+                          TEMPLATE_PLAYER_NUM_VAR, TEMPLATE_MACHINE_VAR, TEMPLATE_LITERAL],
+                         [segment[0] for segment in template.segments])
+        self.assertEqual(1, template.segments[4][3])
+
+        # parenthesis around placeholders stay literals
+        template = compile_text_template('((param1))')
+        self.assertEqual(['(', 'param1', ')'], [segment[1] for segment in template.segments])
+
+        # unchanged text does not re-render the label
+        self.mc.events.post('text_from_event_param1', param1='HELLO')
+        self.advance_time()
+        widget = self.get_widget()
+        texture = widget._label.texture
+        widget.update_kwargs(param1='HELLO')
+        self.assertIs(texture, widget._label.texture)
+        self.assertEqual('HELLO', widget.text)
+
+        # setting the text directly renders it and the template is rendered again afterwards
+        widget.text = 'OTHER'
+        self.assertEqual('OTHER', widget.text)
+        self.assertEqual('OTHER', widget._label.text)
+        widget.update_kwargs(param1='HELLO')
+        self.assertEqual('HELLO', widget.text)
+        self.assertEqual('HELLO', widget._label.text)
+
+    def test_glyph_cache(self):
+        self.mc.glyph_cache = GlyphCache()
+        self.mc.events.post('text_from_event_param1', param1='1 000')
+        self.advance_time()
+        widget = self.get_widget()
+        self.assertEqual('1 000', widget.text)
+        self.assertEqual(4, len(widget.glyph_rectangles))
+        self.assertIsNone(widget.rectangle)
+        self.assertGreater(widget.width, 0)
+        self.assertGreater(widget.height, 0)
+        self.assertEqual(3, self.mc.glyph_cache.get_stats()['glyphs'])
+
+        # only the changed glyph gets a new texture
+        first_texture = widget.glyph_rectangles[0].texture
+        old_width = widget.width
+        widget.update_kwargs(param1='1 001')
+        self.advance_time()
+        self.assertEqual('1 001', widget.text)
+        self.assertIs(first_texture, widget.glyph_rectangles[0].texture)
+        self.assertIs(first_texture, widget.glyph_rectangles[3].texture)
+        self.assertEqual(old_width, widget.width)
+
+        # multi-line text falls back to the label texture
+        widget.update_kwargs(param1='1\n2')
+        self.advance_time()
+        self.assertEqual([], widget.glyph_rectangles)
+        self.assertIsNotNone(widget.rectangle)
+
+        # lines and outlines span the whole text so they need the label texture
+        widget.update_kwargs(param1='1 002')
+        self.advance_time()
+        self.assertEqual(4, len(widget.glyph_rectangles))
+        widget._label.underline = True
+        self.advance_time()
+        self.assertEqual([], widget.glyph_rectangles)
+        self.assertIsNotNone(widget.rectangle)
+        self.assertEqual('1 002', widget.text)
+
+        # and switch back to glyphs once they are removed
+        widget._label.underline = False
+        self.advance_time()
+        self.assertEqual(4, len(widget.glyph_rectangles))
+        self.assertIsNone(widget.rectangle)
+
+        # kerning and hinting are part of the font key
+        font_keys = list(self.mc.glyph_cache._fonts)
+        self.assertEqual(7, len(font_keys[0]))
+
+    def test_glyph_cache_evicts_fonts(self):
+        self.mc.glyph_cache = GlyphCache(max_fonts=2)
+        self.mc.events.post('text_from_event_param1', param1='10')
+        self.advance_time()
+        font_key = list(self.mc.glyph_cache._fonts)[0]
+        larger_font_key = font_key[:1] + (font_key[1] + 10,) + font_key[2:]
+        smaller_font_key = font_key[:1] + (font_key[1] - 10,) + font_key[2:]
+
+        self.mc.glyph_cache.get_glyph(larger_font_key, '1')
+        self.mc.glyph_cache.get_glyph(font_key, '1')
+        self.assertEqual(0, self.mc.glyph_cache.get_stats()['evictions'])
+
+        # the least recently used font is evicted with its glyphs
+        self.mc.glyph_cache.get_glyph(smaller_font_key, '1')
+        stats = self.mc.glyph_cache.get_stats()
+        self.assertEqual(1, stats['evictions'])
+        self.assertEqual(2, stats['fonts'])
+        self.assertEqual([font_key, smaller_font_key], list(self.mc.glyph_cache._fonts))
+
+    def test_label_texture_cache(self):
+        self.mc.label_texture_cache = LabelTextureCache(max_size=100)
+        self.mc.events.post('text_from_event_param1', param1='TEXT FROM EVENT PARAMETER')
+        self.advance_time()
+
+        # both widgets render the same text with the same font settings
+        self.assertEqual(self.get_widget(0).text, self.get_widget(1).text)
+        self.assertIs(self.get_widget(0)._label.texture, self.get_widget(1)._label.texture)
+        self.assertGreater(self.mc.label_texture_cache.get_stats()['hits'], 0)
+
+        # changing one of them does not change the other one
+        shared_texture = self.get_widget(1)._label.texture
+        self.get_widget(0).update_kwargs(param1='OTHER')
+        self.advance_time()
+        self.assertIsNot(shared_texture, self.get_widget(0)._label.texture)
+        self.assertIs(shared_texture, self.get_widget(1)._label.texture)
+
+        # the shared texture keeps its own core label which rendered it
+        entry = self.mc.label_texture_cache._entries[self.get_widget(1)._label._texture_cache_key]
+        self.assertIs(shared_texture, entry[3].texture)
+        self.assertIsNot(entry[3], self.get_widget(1)._label._label)
+
+        # labels release their entries when they are garbage collected
+        label = self.get_widget(0)._label
+        in_use = self.mc.label_texture_cache.get_stats()['in_use']
+        label.__del__()
+        self.assertEqual(in_use - 1, self.mc.label_texture_cache.get_stats()['in_use'])
+
+    def test_label_texture_cache_eviction(self):
+        cache = LabelTextureCache(max_size=2)
+        cache.add('a', 'texture_a', False)
+        cache.add('b', 'texture_b', False)
+        cache.release('a')
+        cache.add('c', 'texture_c', True)
+
+        # a is unused and the least recently used entry
+        self.assertIsNone(cache.acquire('a'))
+        self.assertEqual(('texture_c', True), cache.acquire('c'))
+        self.assertEqual(1, cache.get_stats()['evictions'])
+
+        # entries in use are never evicted
+        cache.add('d', 'texture_d', False)
+        self.assertEqual(3, cache.get_stats()['entries'])
+        cache.release('b')
+        self.assertEqual(2, cache.get_stats()['entries'])
+        self.assertIsNone(cache.acquire('b'))
@@ -205,3 +205,58 @@ class TestTransitions(MpfMcTestCase):
     #     self.advance_time()
     #     self.mc.events.post('no_transition_3')
     #     self.advance_time(.5)
+
+    def test_transition_cache(self):
+        transition_manager = self.mc.transition_manager
+
+        # the transitions in the slide_player config are created (and the
+        # shaders of wipe and fade compiled) when the displays are initialized
+        stats = transition_manager.get_stats()
+        self.assertGreater(stats['prewarmed'], 0)
+        self.assertEqual(2, stats['shaders'])
+
+        self.mc.events.post('show_slide1')
+        self.advance_time()
+        self.mc.events.post('push_left')
+        self.advance_time()
+        transition = self.mc.targets['default'].transition
+        self.assertTrue(isinstance(transition, PushTransition))
+        created = transition_manager.created
+
+        # the transition is reused after it completed
+        self.advance_time(3)
+        self.mc.events.post('show_slide1')
+        self.advance_time()
+        self.mc.events.post('push_left')
+        self.advance_time()
+        self.assertIs(transition, self.mc.targets['default'].transition)
+        self.assertEqual(created, transition_manager.created)
+        self.assertGreater(transition_manager.reused, 0)
+        self.assertEqual(self.mc.targets['default'].current_slide_name, 'slide2')
+
+        # a transition which removed a slide is cached once it completed
+        # (without keeping the slides alive)
+        self.advance_time(3)
+        display = self.mc.targets['default']
+        transition_config = dict(type='push', direction='down', duration=.5)
+        display.remove_slide('slide2', transition_config)
+        transition = display.transition
+        self.assertTrue(isinstance(transition, PushTransition))
+        self.advance_time(1)
+        self.assertIsNot(transition, display.transition)
+        self.assertIn(transition, transition_manager._idle_transitions[
+            transition_manager._get_key(transition_config)])
+        self.assertIsNone(transition.screen_in)
+        self.assertIsNone(transition.screen_out)
+
+        # nested config values are frozen. configs which still can't be
+        # hashed are not cached
+        self.assertEqual(
+            ('push', ('direction', 'left'), ('offset', ((1, 2), (('x', 3),)))),
+            transition_manager._get_key(dict(type='push', direction='left', offset=[[1, 2], dict(x=3)])))
+        self.assertIsNone(transition_manager._get_key(dict(type='push', custom={'left'})))
+        created = transition_manager.created
+        transition = transition_manager.get_transition(dict(type='push', custom={'left'}))
+        transition_manager.release_transition(transition)
+        self.assertIsNot(transition, transition_manager.get_transition(dict(type='push', custom={'left'})))
+        self.assertEqual(created + 2, transition_manager.created)
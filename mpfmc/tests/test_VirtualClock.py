@@ -0,0 +1,58 @@
+from kivy.clock import Clock
+
+from mpfmc.core.virtual_clock import VirtualClock
+from mpfmc.tests.MpfMcTestCase import MpfMcTestCase
+
+
+class TestVirtualClock(MpfMcTestCase):
+
+    def get_machine_path(self):
+        return 'tests/machine_files/slide'
+
+    def get_config_file(self):
+        return 'test_slides.yaml'
+
+    def test_virtual_time(self):
+        self.assertEqual(self.clock.time, Clock.time)
+        self.assertEqual(self.clock.current_time, self.mc.clock.get_time())
+
+        # every frame advances the timeline by exactly one frame duration
+        frames = self.clock.frames
+        start = self.clock.current_time
+        self.clock.step(30)
+        self.assertEqual(frames + 30, self.clock.frames)
+        self.assertAlmostEqual(start + 1, self.clock.current_time)
+
+        # callbacks fire on the frame which reaches their virtual time
+        calls = []
+        Clock.schedule_once(lambda dt: calls.append(self.clock.current_time), 10)
+        self.advance_time(9.9)
+        self.assertEqual([], calls)
+        self.advance_time(.2)
+        self.assertEqual(1, len(calls))
+        self.assertAlmostEqual(start + 11, calls[0], delta=self.clock.frame_duration)
+
+        # run_until stops at the virtual timeout
+        start = self.clock.current_time
+        self.assertFalse(self.clock.run_until(lambda: False, timeout=5))
+        self.assertAlmostEqual(start + 5, self.clock.current_time, delta=self.clock.frame_duration)
+        self.assertTrue(self.clock.run_until(lambda: self.clock.current_time > start + 6))
+
+    def test_install_keeps_scheduled_events(self):
+        calls = []
+        event = Clock.schedule_once(lambda dt: calls.append(self.clock.current_time), 2)
+        self.advance_time(1)
+
+        # a new timeline (e.g. started later) keeps the event and its remaining time
+        self.clock = VirtualClock(fps=self._fps, start_time=self.clock.current_time + 1000)
+        self.clock.install()
+        self.assertIn(event, Clock.get_events())
+        start = self.clock.current_time
+        self.advance_time(.9)
+        self.assertEqual([], calls)
+        self.advance_time(.2)
+        self.assertEqual(1, len(calls))
+        self.assertAlmostEqual(start + 1, calls[0], delta=2 * self.clock.frame_duration)
+
+        # the MC runs on the new timeline
+        self.assertEqual(self.clock.current_time, self.mc.clock.get_time())
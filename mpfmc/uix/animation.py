@@ -0,0 +1,159 @@
+"""Widget animations which are advanced by a central scheduler."""
+from typing import Dict, List, Optional, Tuple
+
+from kivy.animation import Animation
+from kivy.clock import Clock
+from kivy.weakproxy import WeakProxy
+
+
+class AnimationScheduler:
+
+    """Advances all running widget animations of a media controller in a single clock callback.
+
+    Every Kivy animation installs its own clock callback, so a slide with 50
+    animated widgets runs 50 tickers. Animations of the media controller are
+    advanced by this scheduler instead. Per frame it calculates the progress
+    of all animations, evaluates every easing function once per distinct
+    progress value (animations started together share the evaluation),
+    calculates all property values and then writes them in one batch before
+    any on_progress or on_complete handler runs.
+    """
+
+    def __init__(self) -> None:
+        self._animations = dict()   # type: Dict[MpfAnimation, None]
+        self._update_ev = None
+        self.frame_profiler = None
+        self.ticks = 0
+        self.updates = 0
+        self.easing_evaluations = 0
+
+    def add(self, animation: "MpfAnimation") -> None:
+        """Advance an animation on every frame."""
+        self._animations[animation] = None
+        if self._update_ev is None or not self._update_ev.is_triggered:
+            # not scheduled yet (or the event has been removed from the clock)
+            self._update_ev = Clock.schedule_interval(self._update, 0)
+
+    def remove(self, animation: "MpfAnimation") -> None:
+        """Stop advancing an animation."""
+        self._animations.pop(animation, None)
+
+    def clear(self) -> None:
+        """Stop advancing all animations (e.g. when the media controller stops)."""
+        for animation in self._animations:
+            animation._clock_installed = False      # pylint: disable-msg=protected-access
+        self._animations.clear()
+        if self._update_ev:
+            self._update_ev.cancel()
+            self._update_ev = None
+
+    def get_stats(self) -> dict:
+        """Return scheduler statistics."""
+        return dict(animations=len(self._animations),
+                    ticks=self.ticks,
+                    updates=self.updates,
+                    easing_evaluations=self.easing_evaluations)
+
+    # pylint: disable-msg=protected-access
+    def _update(self, dt) -> None:
+        if not self._animations:
+            self._update_ev.cancel()
+            self._update_ev = None
+            return
+
+        self.ticks += 1
+        profiler = self.frame_profiler
+        if profiler:
+            start = profiler.start_phase()
+
+        # Calculate the progress of all animations
+        entries = list()    # type: List[Tuple[MpfAnimation, object, dict, float]]
+        for animation in list(self._animations):
+            for uid, anim in list(animation._widgets.items()):
+                widget = anim['widget']
+                if isinstance(widget, WeakProxy) and not len(dir(widget)):
+                    # empty proxy, widget is gone
+                    animation._widgets.pop(uid, None)
+                    animation._clock_uninstall()
+                    if not animation._widgets:
+                        animation._unregister()
+                    continue
+
+                if anim['time'] is None:
+                    anim['time'] = 0.
+                else:
+                    anim['time'] += dt
+
+                if animation._duration:
+                    progress = min(1., anim['time'] / animation._duration)
+                else:
+                    progress = 1
+                entries.append((animation, widget, anim, progress))
+
+        # Evaluate the easing functions and calculate all property values
+        eased = dict()
+        values = list()
+        for animation, widget, anim, progress in entries:
+            key = (animation._transition, progress)
+            try:
+                t = eased[key]
+            except KeyError:
+                t = eased[key] = animation._transition(progress)
+
+            calculate = animation._calculate
+            for name, (start, end) in anim['properties'].items():
+                values.append((widget, name, calculate(start, end, t)))
+
+        self.easing_evaluations += len(eased)
+        self.updates += len(entries)
+
+        # Write all properties in one batch
+        for widget, name, value in values:
+            setattr(widget, name, value)
+
+        for animation, widget, anim, progress in entries:
+            if animation._widgets.get(widget.uid) is not anim:
+                # canceled by a handler of another animation in this frame
+                continue
+
+            animation.dispatch('on_progress', widget, progress)
+            if progress >= 1.:
+                animation.stop(widget)
+
+        if profiler:
+            profiler.count('animations', len(entries))
+            profiler.end_phase('animations', start)
+
+
+class MpfAnimation(Animation):
+
+    """Kivy animation which is advanced by an animation scheduler instead of its own clock callback.
+
+    Animations without a scheduler use the clock callback of Kivy animations.
+    """
+
+    def __init__(self, scheduler: Optional[AnimationScheduler] = None, **kw) -> None:
+        super().__init__(**kw)
+        self._scheduler = scheduler
+
+    def _clock_install(self):
+        if self._scheduler is None:
+            super()._clock_install()
+            return
+
+        if self._clock_installed:
+            return
+
+        self._scheduler.add(self)
+        self._clock_installed = True
+
+    def _clock_uninstall(self):
+        if self._scheduler is None:
+            super()._clock_uninstall()
+            return
+
+        if self._widgets or not self._clock_installed:
+            return
+
+        self._clock_installed = False
+        self._scheduler.remove(self)
@@ -1,14 +1,16 @@
-/* Generated by Cython 0.29.10 */
+/* Generated by Cython 0.29.37 */
 
+#ifndef PY_SSIZE_T_CLEAN
 #define PY_SSIZE_T_CLEAN
+#endif /* PY_SSIZE_T_CLEAN */
 #include "Python.h"
 #ifndef Py_PYTHON_H
     #error Python headers needed to compile C extensions, please install development version of Python.
 #elif PY_VERSION_HEX < 0x02060000 || (0x03000000 <= PY_VERSION_HEX && PY_VERSION_HEX < 0x03030000)
     #error Cython requires Python 2.6+ or Python 3.3+.
 #else
-#define CYTHON_ABI "0_29_10"
-#define CYTHON_HEX_VERSION 0x001D0AF0
+#define CYTHON_ABI "0_29_37"
+#define CYTHON_HEX_VERSION 0x001D25F0
 #define CYTHON_FUTURE_DIVISION 1
 #include <stddef.h>
 #ifndef offsetof
@@ -47,6 +49,7 @@
   #define CYTHON_COMPILING_IN_PYPY 1
   #define CYTHON_COMPILING_IN_PYSTON 0
   #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
   #undef CYTHON_USE_TYPE_SLOTS
   #define CYTHON_USE_TYPE_SLOTS 0
   #undef CYTHON_USE_PYTYPE_LOOKUP
@@ -75,18 +78,26 @@
   #define CYTHON_FAST_THREAD_STATE 0
   #undef CYTHON_FAST_PYCALL
   #define CYTHON_FAST_PYCALL 0
-  #undef CYTHON_PEP489_MULTI_PHASE_INIT
-  #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #if PY_VERSION_HEX < 0x03090000
+    #undef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #elif !defined(CYTHON_PEP489_MULTI_PHASE_INIT)
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
   #undef CYTHON_USE_TP_FINALIZE
-  #define CYTHON_USE_TP_FINALIZE 0
+  #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1 && PYPY_VERSION_NUM >= 0x07030C00)
   #undef CYTHON_USE_DICT_VERSIONS
   #define CYTHON_USE_DICT_VERSIONS 0
   #undef CYTHON_USE_EXC_INFO_STACK
   #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
 #elif defined(PYSTON_VERSION)
   #define CYTHON_COMPILING_IN_PYPY 0
   #define CYTHON_COMPILING_IN_PYSTON 1
   #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
   #ifndef CYTHON_USE_TYPE_SLOTS
     #define CYTHON_USE_TYPE_SLOTS 1
   #endif
@@ -124,10 +135,59 @@
   #define CYTHON_USE_DICT_VERSIONS 0
   #undef CYTHON_USE_EXC_INFO_STACK
   #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+#elif defined(PY_NOGIL)
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 1
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #ifndef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE 1
+  #endif
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
 #else
   #define CYTHON_COMPILING_IN_PYPY 0
   #define CYTHON_COMPILING_IN_PYSTON 0
   #define CYTHON_COMPILING_IN_CPYTHON 1
+  #define CYTHON_COMPILING_IN_NOGIL 0
   #ifndef CYTHON_USE_TYPE_SLOTS
     #define CYTHON_USE_TYPE_SLOTS 1
   #endif
@@ -147,7 +207,7 @@
     #undef CYTHON_USE_PYLONG_INTERNALS
     #define CYTHON_USE_PYLONG_INTERNALS 0
   #elif !defined(CYTHON_USE_PYLONG_INTERNALS)
-    #define CYTHON_USE_PYLONG_INTERNALS 1
+    #define CYTHON_USE_PYLONG_INTERNALS (PY_VERSION_HEX < 0x030C00A5)
   #endif
   #ifndef CYTHON_USE_PYLIST_INTERNALS
     #define CYTHON_USE_PYLIST_INTERNALS 1
@@ -155,7 +215,7 @@
   #ifndef CYTHON_USE_UNICODE_INTERNALS
     #define CYTHON_USE_UNICODE_INTERNALS 1
   #endif
-  #if PY_VERSION_HEX < 0x030300F0
+  #if PY_VERSION_HEX < 0x030300F0 || PY_VERSION_HEX >= 0x030B00A2
     #undef CYTHON_USE_UNICODE_WRITER
     #define CYTHON_USE_UNICODE_WRITER 0
   #elif !defined(CYTHON_USE_UNICODE_WRITER)
@@ -170,11 +230,14 @@
   #ifndef CYTHON_UNPACK_METHODS
     #define CYTHON_UNPACK_METHODS 1
   #endif
-  #ifndef CYTHON_FAST_THREAD_STATE
+  #if PY_VERSION_HEX >= 0x030B00A4
+    #undef CYTHON_FAST_THREAD_STATE
+    #define CYTHON_FAST_THREAD_STATE 0
+  #elif !defined(CYTHON_FAST_THREAD_STATE)
     #define CYTHON_FAST_THREAD_STATE 1
   #endif
   #ifndef CYTHON_FAST_PYCALL
-    #define CYTHON_FAST_PYCALL 1
+    #define CYTHON_FAST_PYCALL (PY_VERSION_HEX < 0x030A0000)
   #endif
   #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
     #define CYTHON_PEP489_MULTI_PHASE_INIT (PY_VERSION_HEX >= 0x03050000)
@@ -183,17 +246,25 @@
     #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1)
   #endif
   #ifndef CYTHON_USE_DICT_VERSIONS
-    #define CYTHON_USE_DICT_VERSIONS (PY_VERSION_HEX >= 0x030600B1)
+    #define CYTHON_USE_DICT_VERSIONS ((PY_VERSION_HEX >= 0x030600B1) && (PY_VERSION_HEX < 0x030C00A5))
   #endif
-  #ifndef CYTHON_USE_EXC_INFO_STACK
+  #if PY_VERSION_HEX >= 0x030B00A4
+    #undef CYTHON_USE_EXC_INFO_STACK
+    #define CYTHON_USE_EXC_INFO_STACK 0
+  #elif !defined(CYTHON_USE_EXC_INFO_STACK)
     #define CYTHON_USE_EXC_INFO_STACK (PY_VERSION_HEX >= 0x030700A3)
   #endif
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 1
+  #endif
 #endif
 #if !defined(CYTHON_FAST_PYCCALL)
 #define CYTHON_FAST_PYCCALL  (CYTHON_FAST_PYCALL && PY_VERSION_HEX >= 0x030600B1)
 #endif
 #if CYTHON_USE_PYLONG_INTERNALS
-  #include "longintrepr.h"
+  #if PY_MAJOR_VERSION < 3
+    #include "longintrepr.h"
+  #endif
   #undef SHIFT
   #undef BASE
   #undef MASK
@@ -298,9 +369,6 @@
   #endif
 #endif
 
-#if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX < 0x02070600 && !defined(Py_OptimizeFlag)
-  #define Py_OptimizeFlag 0
-#endif
 #define __PYX_BUILD_PY_SSIZE_T "n"
 #define CYTHON_FORMAT_SSIZE_T "z"
 #if PY_MAJOR_VERSION < 3
@@ -310,15 +378,79 @@
   #define __Pyx_DefaultClassType PyClass_Type
 #else
   #define __Pyx_BUILTIN_MODULE_NAME "builtins"
-#if PY_VERSION_HEX < 0x030800A4
-  #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
-          PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+  #define __Pyx_DefaultClassType PyType_Type
+#if PY_VERSION_HEX >= 0x030B00A1
+    static CYTHON_INLINE PyCodeObject* __Pyx_PyCode_New(int a, int k, int l, int s, int f,
+                                                    PyObject *code, PyObject *c, PyObject* n, PyObject *v,
+                                                    PyObject *fv, PyObject *cell, PyObject* fn,
+                                                    PyObject *name, int fline, PyObject *lnos) {
+        PyObject *kwds=NULL, *argcount=NULL, *posonlyargcount=NULL, *kwonlyargcount=NULL;
+        PyObject *nlocals=NULL, *stacksize=NULL, *flags=NULL, *replace=NULL, *call_result=NULL, *empty=NULL;
+        const char *fn_cstr=NULL;
+        const char *name_cstr=NULL;
+        PyCodeObject* co=NULL;
+        PyObject *type, *value, *traceback;
+        PyErr_Fetch(&type, &value, &traceback);
+        if (!(kwds=PyDict_New())) goto end;
+        if (!(argcount=PyLong_FromLong(a))) goto end;
+        if (PyDict_SetItemString(kwds, "co_argcount", argcount) != 0) goto end;
+        if (!(posonlyargcount=PyLong_FromLong(0))) goto end;
+        if (PyDict_SetItemString(kwds, "co_posonlyargcount", posonlyargcount) != 0) goto end;
+        if (!(kwonlyargcount=PyLong_FromLong(k))) goto end;
+        if (PyDict_SetItemString(kwds, "co_kwonlyargcount", kwonlyargcount) != 0) goto end;
+        if (!(nlocals=PyLong_FromLong(l))) goto end;
+        if (PyDict_SetItemString(kwds, "co_nlocals", nlocals) != 0) goto end;
+        if (!(stacksize=PyLong_FromLong(s))) goto end;
+        if (PyDict_SetItemString(kwds, "co_stacksize", stacksize) != 0) goto end;
+        if (!(flags=PyLong_FromLong(f))) goto end;
+        if (PyDict_SetItemString(kwds, "co_flags", flags) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_code", code) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_consts", c) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_names", n) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_varnames", v) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_freevars", fv) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_cellvars", cell) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_linetable", lnos) != 0) goto end;
+        if (!(fn_cstr=PyUnicode_AsUTF8AndSize(fn, NULL))) goto end;
+        if (!(name_cstr=PyUnicode_AsUTF8AndSize(name, NULL))) goto end;
+        if (!(co = PyCode_NewEmpty(fn_cstr, name_cstr, fline))) goto end;
+        if (!(replace = PyObject_GetAttrString((PyObject*)co, "replace"))) goto cleanup_code_too;
+        if (!(empty = PyTuple_New(0))) goto cleanup_code_too; // unfortunately __pyx_empty_tuple isn't available here
+        if (!(call_result = PyObject_Call(replace, empty, kwds))) goto cleanup_code_too;
+        Py_XDECREF((PyObject*)co);
+        co = (PyCodeObject*)call_result;
+        call_result = NULL;
+        if (0) {
+            cleanup_code_too:
+            Py_XDECREF((PyObject*)co);
+            co = NULL;
+        }
+        end:
+        Py_XDECREF(kwds);
+        Py_XDECREF(argcount);
+        Py_XDECREF(posonlyargcount);
+        Py_XDECREF(kwonlyargcount);
+        Py_XDECREF(nlocals);
+        Py_XDECREF(stacksize);
+        Py_XDECREF(replace);
+        Py_XDECREF(call_result);
+        Py_XDECREF(empty);
+        if (type) {
+            PyErr_Restore(type, value, traceback);
+        }
+        return co;
+    }
 #else
   #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
-          PyCode_New(a, 0, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+          PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
 #endif
   #define __Pyx_DefaultClassType PyType_Type
 #endif
+#if PY_VERSION_HEX >= 0x030900F0 && !CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyObject_GC_IsFinalized(o) PyObject_GC_IsFinalized(o)
+#else
+  #define __Pyx_PyObject_GC_IsFinalized(o) _PyGC_FINALIZED(o)
+#endif
 #ifndef Py_TPFLAGS_CHECKTYPES
   #define Py_TPFLAGS_CHECKTYPES 0
 #endif
@@ -426,8 +558,12 @@ static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
 #endif
 #if PY_VERSION_HEX > 0x03030000 && defined(PyUnicode_KIND)
   #define CYTHON_PEP393_ENABLED 1
-  #define __Pyx_PyUnicode_READY(op)       (likely(PyUnicode_IS_READY(op)) ?\
-                                              0 : _PyUnicode_Ready((PyObject *)(op)))
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_READY(op)       (0)
+  #else
+    #define __Pyx_PyUnicode_READY(op)       (likely(PyUnicode_IS_READY(op)) ?\
+                                                0 : _PyUnicode_Ready((PyObject *)(op)))
+  #endif
   #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_LENGTH(u)
   #define __Pyx_PyUnicode_READ_CHAR(u, i) PyUnicode_READ_CHAR(u, i)
   #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   PyUnicode_MAX_CHAR_VALUE(u)
@@ -435,7 +571,15 @@ static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
   #define __Pyx_PyUnicode_DATA(u)         PyUnicode_DATA(u)
   #define __Pyx_PyUnicode_READ(k, d, i)   PyUnicode_READ(k, d, i)
   #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  PyUnicode_WRITE(k, d, i, ch)
-  #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : PyUnicode_GET_SIZE(u)))
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_LENGTH(u))
+  #else
+    #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x03090000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : ((PyCompactUnicodeObject *)(u))->wstr_length))
+    #else
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : PyUnicode_GET_SIZE(u)))
+    #endif
+  #endif
 #else
   #define CYTHON_PEP393_ENABLED 0
   #define PyUnicode_1BYTE_KIND  1
@@ -484,8 +628,10 @@ static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
   #define PyString_Type                PyUnicode_Type
   #define PyString_Check               PyUnicode_Check
   #define PyString_CheckExact          PyUnicode_CheckExact
+#ifndef PyObject_Unicode
   #define PyObject_Unicode             PyObject_Str
 #endif
+#endif
 #if PY_MAJOR_VERSION >= 3
   #define __Pyx_PyBaseString_Check(obj) PyUnicode_Check(obj)
   #define __Pyx_PyBaseString_CheckExact(obj) PyUnicode_CheckExact(obj)
@@ -496,6 +642,13 @@ static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
 #ifndef PySet_CheckExact
   #define PySet_CheckExact(obj)        (Py_TYPE(obj) == &PySet_Type)
 #endif
+#if PY_VERSION_HEX >= 0x030900A4
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_SET_REFCNT(obj, refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SET_SIZE(obj, size)
+#else
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_REFCNT(obj) = (refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SIZE(obj) = (size)
+#endif
 #if CYTHON_ASSUME_SAFE_MACROS
   #define __Pyx_PySequence_SIZE(seq)  Py_SIZE(seq)
 #else
@@ -529,13 +682,13 @@ static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
 #if PY_VERSION_HEX < 0x030200A4
   typedef long Py_hash_t;
   #define __Pyx_PyInt_FromHash_t PyInt_FromLong
-  #define __Pyx_PyInt_AsHash_t   PyInt_AsLong
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsHash_t
 #else
   #define __Pyx_PyInt_FromHash_t PyInt_FromSsize_t
-  #define __Pyx_PyInt_AsHash_t   PyInt_AsSsize_t
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsSsize_t
 #endif
 #if PY_MAJOR_VERSION >= 3
-  #define __Pyx_PyMethod_New(func, self, klass) ((self) ? PyMethod_New(func, self) : (Py_INCREF(func), func))
+  #define __Pyx_PyMethod_New(func, self, klass) ((self) ? ((void)(klass), PyMethod_New(func, self)) : __Pyx_NewRef(func))
 #else
   #define __Pyx_PyMethod_New(func, self, klass) PyMethod_New(func, self, klass)
 #endif
@@ -557,8 +710,10 @@ static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
     } __Pyx_PyAsyncMethodsStruct;
 #endif
 
-#if defined(WIN32) || defined(MS_WINDOWS)
-  #define _USE_MATH_DEFINES
+#if defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)
+  #if !defined(_USE_MATH_DEFINES)
+    #define _USE_MATH_DEFINES
+  #endif
 #endif
 #include <math.h>
 #ifdef NAN
@@ -576,11 +731,10 @@ static CYTHON_INLINE float __PYX_NAN() {
 #define __Pyx_truncl truncl
 #endif
 
-
+#define __PYX_MARK_ERR_POS(f_index, lineno) \
+    { __pyx_filename = __pyx_f[f_index]; (void)__pyx_filename; __pyx_lineno = lineno; (void)__pyx_lineno; __pyx_clineno = __LINE__; (void)__pyx_clineno; }
 #define __PYX_ERR(f_index, lineno, Ln_error) \
-{ \
-  __pyx_filename = __pyx_f[f_index]; __pyx_lineno = lineno; __pyx_clineno = __LINE__; goto Ln_error; \
-}
+    { __PYX_MARK_ERR_POS(f_index, lineno) goto Ln_error; }
 
 #ifndef __PYX_EXTERN_C
   #ifdef __cplusplus
@@ -610,7 +764,7 @@ typedef struct {PyObject **p; const char *s; const Py_ssize_t n; const char* enc
 #define __PYX_DEFAULT_STRING_ENCODING_IS_ASCII 0
 #define __PYX_DEFAULT_STRING_ENCODING_IS_UTF8 1
 #define __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT (PY_MAJOR_VERSION >= 3 && __PYX_DEFAULT_STRING_ENCODING_IS_UTF8)
-#define __PYX_DEFAULT_STRING_ENCODING "utf-8"
+#define __PYX_DEFAULT_STRING_ENCODING "utf8"
 #define __Pyx_PyObject_FromString __Pyx_PyBytes_FromString
 #define __Pyx_PyObject_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
 #define __Pyx_uchar_cast(c) ((unsigned char)c)
@@ -692,6 +846,7 @@ static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x);
     (likely(PyTuple_CheckExact(obj)) ? __Pyx_NewRef(obj) : PySequence_Tuple(obj))
 static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject*);
 static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t);
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject*);
 #if CYTHON_ASSUME_SAFE_MACROS
 #define __pyx_PyFloat_AsDouble(x) (PyFloat_CheckExact(x) ? PyFloat_AS_DOUBLE(x) : PyFloat_AsDouble(x))
 #else
@@ -805,15 +960,42 @@ static const char *__pyx_filename;
 
 static const char *__pyx_f[] = {
   "stringsource",
-  "mpfmc\\uix\\bitmap_font\\bitmap_font.pyx",
+  "mpfmc/uix/bitmap_font/bitmap_font.pyx",
 };
 
 /*--- Type declarations ---*/
 struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFontCharacter;
 struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont;
 struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer;
+struct __pyx_t_5mpfmc_3uix_11bitmap_font_11bitmap_font_GlyphInfo;
+
+/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":615
+ * 
+ * 
+ * cdef enum:             # <<<<<<<<<<<<<<
+ *     # Characters with ids below this value are stored in a flat glyph index array
+ *     GLYPH_INDEX_SIZE = 256
+ */
+enum  {
+  __pyx_e_5mpfmc_3uix_11bitmap_font_11bitmap_font_GLYPH_INDEX_SIZE = 0x100
+};
+
+/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":619
+ *     GLYPH_INDEX_SIZE = 256
+ * 
+ * cdef struct GlyphInfo:             # <<<<<<<<<<<<<<
+ *     SDL_Rect rect
+ *     int xoffset
+ */
+struct __pyx_t_5mpfmc_3uix_11bitmap_font_11bitmap_font_GlyphInfo {
+  struct SDL_Rect rect;
+  int xoffset;
+  int yoffset;
+  int xadvance;
+  int defined;
+};
 
-/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":614
+/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":627
  * 
  * 
  * cdef class BitmapFontCharacter:             # <<<<<<<<<<<<<<
@@ -830,7 +1012,7 @@ struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFontCharacter {
 };
 
 
-/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":632
+/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":645
  * 
  * 
  * cdef class BitmapFont:             # <<<<<<<<<<<<<<
@@ -839,6 +1021,7 @@ struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFontCharacter {
  */
 struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont {
   PyObject_HEAD
+  struct __pyx_vtabstruct_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont *__pyx_vtab;
   PyObject *face;
   int bold;
   int italic;
@@ -851,16 +1034,17 @@ struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont {
   int scale_h;
   PyObject *characters;
   PyObject *kernings;
+  struct __pyx_t_5mpfmc_3uix_11bitmap_font_11bitmap_font_GlyphInfo glyphs[__pyx_e_5mpfmc_3uix_11bitmap_font_11bitmap_font_GLYPH_INDEX_SIZE];
   struct SDL_Surface *image;
 };
 
 
-/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":913
+/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":1000
  * 
  * 
  * cdef class _SurfaceContainer:             # <<<<<<<<<<<<<<
- *     cdef SDL_Surface* surface
- *     cdef int w, h
+ *     """Pixel buffer bitmap font text is rendered into.
+ * 
  */
 struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer {
   PyObject_HEAD
@@ -870,6 +1054,23 @@ struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer {
 };
 
 
+
+/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":645
+ * 
+ * 
+ * cdef class BitmapFont:             # <<<<<<<<<<<<<<
+ *     cdef public str face
+ *     cdef public bint bold
+ */
+
+struct __pyx_vtabstruct_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont {
+  void (*_build_glyph_index)(struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont *);
+  int (*_get_glyph)(struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont *, int, struct __pyx_t_5mpfmc_3uix_11bitmap_font_11bitmap_font_GlyphInfo *);
+  int (*_get_kerning)(struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont *, int, int);
+  void (*render_text)(struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont *, struct SDL_Surface *, PyObject *, int, int, int);
+};
+static struct __pyx_vtabstruct_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont *__pyx_vtabptr_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont;
+
 /* --- Runtime support code (head) --- */
 /* Refnanny.proto */
 #ifndef CYTHON_REFNANNY
@@ -1039,18 +1240,18 @@ static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UIN
 
 /* GetModuleGlobalName.proto */
 #if CYTHON_USE_DICT_VERSIONS
-#define __Pyx_GetModuleGlobalName(var, name)  {\
+#define __Pyx_GetModuleGlobalName(var, name)  do {\
     static PY_UINT64_T __pyx_dict_version = 0;\
     static PyObject *__pyx_dict_cached_value = NULL;\
     (var) = (likely(__pyx_dict_version == __PYX_GET_DICT_VERSION(__pyx_d))) ?\
         (likely(__pyx_dict_cached_value) ? __Pyx_NewRef(__pyx_dict_cached_value) : __Pyx_GetBuiltinName(name)) :\
         __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
-}
-#define __Pyx_GetModuleGlobalNameUncached(var, name)  {\
+} while(0)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  do {\
     PY_UINT64_T __pyx_dict_version;\
     PyObject *__pyx_dict_cached_value;\
     (var) = __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
-}
+} while(0)
 static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value);
 #else
 #define __Pyx_GetModuleGlobalName(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
@@ -1070,7 +1271,7 @@ static CYTHON_INLINE PyObject *__Pyx_PyCFunction_FastCall(PyObject *func, PyObje
 #define __Pyx_PyFunction_FastCall(func, args, nargs)\
     __Pyx_PyFunction_FastCallDict((func), (args), (nargs), NULL)
 #if 1 || PY_VERSION_HEX < 0x030600B1
-static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, int nargs, PyObject *kwargs);
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs);
 #else
 #define __Pyx_PyFunction_FastCallDict(func, args, nargs, kwargs) _PyFunction_FastCallDict(func, args, nargs, kwargs)
 #endif
@@ -1079,13 +1280,21 @@ static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args,
 #ifndef Py_MEMBER_SIZE
 #define Py_MEMBER_SIZE(type, member) sizeof(((type *)0)->member)
 #endif
+#if CYTHON_FAST_PYCALL
   static size_t __pyx_pyframe_localsplus_offset = 0;
   #include "frameobject.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
   #define __Pxy_PyFrame_Initialize_Offsets()\
     ((void)__Pyx_BUILD_ASSERT_EXPR(sizeof(PyFrameObject) == offsetof(PyFrameObject, f_localsplus) + Py_MEMBER_SIZE(PyFrameObject, f_localsplus)),\
      (void)(__pyx_pyframe_localsplus_offset = ((size_t)PyFrame_Type.tp_basicsize) - Py_MEMBER_SIZE(PyFrameObject, f_localsplus)))
   #define __Pyx_PyFrame_GetLocalsplus(frame)\
     (assert(__pyx_pyframe_localsplus_offset), (PyObject **)(((char *)(frame)) + __pyx_pyframe_localsplus_offset))
+#endif // CYTHON_FAST_PYCALL
 #endif
 
 /* PyObjectCall2Args.proto */
@@ -1099,6 +1308,90 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject
 /* PyObjectCallOneArg.proto */
 static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg);
 
+/* IterFinish.proto */
+static CYTHON_INLINE int __Pyx_IterFinish(void);
+
+/* PyObjectCallNoArg.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func);
+#else
+#define __Pyx_PyObject_CallNoArg(func) __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL)
+#endif
+
+/* PyObjectGetMethod.proto */
+static int __Pyx_PyObject_GetMethod(PyObject *obj, PyObject *name, PyObject **method);
+
+/* PyObjectCallMethod0.proto */
+static PyObject* __Pyx_PyObject_CallMethod0(PyObject* obj, PyObject* method_name);
+
+/* RaiseNeedMoreValuesToUnpack.proto */
+static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index);
+
+/* RaiseTooManyValuesToUnpack.proto */
+static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected);
+
+/* UnpackItemEndCheck.proto */
+static int __Pyx_IternextUnpackEndCheck(PyObject *retval, Py_ssize_t expected);
+
+/* RaiseNoneIterError.proto */
+static CYTHON_INLINE void __Pyx_RaiseNoneNotIterableError(void);
+
+/* UnpackTupleError.proto */
+static void __Pyx_UnpackTupleError(PyObject *, Py_ssize_t index);
+
+/* UnpackTuple2.proto */
+#define __Pyx_unpack_tuple2(tuple, value1, value2, is_tuple, has_known_size, decref_tuple)\
+    (likely(is_tuple || PyTuple_Check(tuple)) ?\
+        (likely(has_known_size || PyTuple_GET_SIZE(tuple) == 2) ?\
+            __Pyx_unpack_tuple2_exact(tuple, value1, value2, decref_tuple) :\
+            (__Pyx_UnpackTupleError(tuple, 2), -1)) :\
+        __Pyx_unpack_tuple2_generic(tuple, value1, value2, has_known_size, decref_tuple))
+static CYTHON_INLINE int __Pyx_unpack_tuple2_exact(
+    PyObject* tuple, PyObject** value1, PyObject** value2, int decref_tuple);
+static int __Pyx_unpack_tuple2_generic(
+    PyObject* tuple, PyObject** value1, PyObject** value2, int has_known_size, int decref_tuple);
+
+/* dict_iter.proto */
+static CYTHON_INLINE PyObject* __Pyx_dict_iterator(PyObject* dict, int is_dict, PyObject* method_name,
+                                                   Py_ssize_t* p_orig_length, int* p_is_dict);
+static CYTHON_INLINE int __Pyx_dict_iter_next(PyObject* dict_or_iter, Py_ssize_t orig_length, Py_ssize_t* ppos,
+                                              PyObject** pkey, PyObject** pvalue, PyObject** pitem, int is_dict);
+
+/* ExtTypeTest.proto */
+static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type);
+
+/* dict_getitem_default.proto */
+static PyObject* __Pyx_PyDict_GetItemDefault(PyObject* d, PyObject* key, PyObject* default_value);
+
+/* UnpackUnboundCMethod.proto */
+typedef struct {
+    PyObject *type;
+    PyObject **method_name;
+    PyCFunction func;
+    PyObject *method;
+    int flag;
+} __Pyx_CachedCFunction;
+
+/* CallUnboundCMethod1.proto */
+static PyObject* __Pyx__CallUnboundCMethod1(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg);
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_CallUnboundCMethod1(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg);
+#else
+#define __Pyx_CallUnboundCMethod1(cfunc, self, arg)  __Pyx__CallUnboundCMethod1(cfunc, self, arg)
+#endif
+
+/* CallUnboundCMethod2.proto */
+static PyObject* __Pyx__CallUnboundCMethod2(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg1, PyObject* arg2);
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030600B1
+static CYTHON_INLINE PyObject *__Pyx_CallUnboundCMethod2(__Pyx_CachedCFunction *cfunc, PyObject *self, PyObject *arg1, PyObject *arg2);
+#else
+#define __Pyx_CallUnboundCMethod2(cfunc, self, arg1, arg2)  __Pyx__CallUnboundCMethod2(cfunc, self, arg1, arg2)
+#endif
+
+/* unicode_iter.proto */
+static CYTHON_INLINE int __Pyx_init_unicode_iteration(
+    PyObject* ustring, Py_ssize_t *length, void** data, int *kind);
+
 /* UnicodeAsUCS4.proto */
 static CYTHON_INLINE Py_UCS4 __Pyx_PyUnicode_AsPy_UCS4(PyObject*);
 
@@ -1117,13 +1410,6 @@ static CYTHON_INLINE int __Pyx_PyDict_ContainsTF(PyObject* item, PyObject* dict,
     return unlikely(result < 0) ? result : (result == (eq == Py_EQ));
 }
 
-/* PyObjectCallNoArg.proto */
-#if CYTHON_COMPILING_IN_CPYTHON
-static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func);
-#else
-#define __Pyx_PyObject_CallNoArg(func) __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL)
-#endif
-
 /* GetTopmostException.proto */
 #if CYTHON_USE_EXC_INFO_STACK
 static _PyErr_StackItem * __Pyx_PyErr_GetTopmostException(PyThreadState *tstate);
@@ -1214,32 +1500,6 @@ static int __Pyx__GetException(PyThreadState *tstate, PyObject **type, PyObject
 static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb);
 #endif
 
-/* unicode_iter.proto */
-static CYTHON_INLINE int __Pyx_init_unicode_iteration(
-    PyObject* ustring, Py_ssize_t *length, void** data, int *kind);
-
-/* GetItemInt.proto */
-#define __Pyx_GetItemInt(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
-    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
-    __Pyx_GetItemInt_Fast(o, (Py_ssize_t)i, is_list, wraparound, boundscheck) :\
-    (is_list ? (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL) :\
-               __Pyx_GetItemInt_Generic(o, to_py_func(i))))
-#define __Pyx_GetItemInt_List(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
-    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
-    __Pyx_GetItemInt_List_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
-    (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL))
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
-                                                              int wraparound, int boundscheck);
-#define __Pyx_GetItemInt_Tuple(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
-    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
-    __Pyx_GetItemInt_Tuple_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
-    (PyErr_SetString(PyExc_IndexError, "tuple index out of range"), (PyObject*)NULL))
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
-                                                              int wraparound, int boundscheck);
-static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j);
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i,
-                                                     int is_list, int wraparound, int boundscheck);
-
 /* PyErrExceptionMatches.proto */
 #if CYTHON_FAST_THREAD_STATE
 #define __Pyx_PyErr_ExceptionMatches(err) __Pyx_PyErr_ExceptionMatchesInState(__pyx_tstate, err)
@@ -1262,9 +1522,15 @@ static PyObject* __Pyx_PyObject_GenericGetAttr(PyObject* obj, PyObject* attr_nam
 #define __Pyx_PyObject_GenericGetAttr PyObject_GenericGetAttr
 #endif
 
+/* PyObjectGetAttrStrNoError.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name);
+
 /* SetupReduce.proto */
 static int __Pyx_setup_reduce(PyObject* type_obj);
 
+/* SetVTable.proto */
+static int __Pyx_SetVtable(PyObject *dict, void *vtable);
+
 /* Import.proto */
 static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level);
 
@@ -1306,15 +1572,17 @@ static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object);
 static void __Pyx_AddTraceback(const char *funcname, int c_line,
                                int py_line, const char *filename);
 
-/* CIntToPy.proto */
-static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value);
+/* GCCDiagnostics.proto */
+#if defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 6))
+#define __Pyx_HAS_GCC_DIAGNOSTIC
+#endif
 
 static PyObject* __pyx_convert__to_py_struct__SDL_Rect(struct SDL_Rect s);
 /* CIntFromPy.proto */
 static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
 
-/* CIntFromPy.proto */
-static CYTHON_INLINE size_t __Pyx_PyInt_As_size_t(PyObject *);
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value);
 
 /* CIntToPy.proto */
 static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
@@ -1328,9 +1596,15 @@ static int __Pyx_check_binary_version(void);
 /* InitStrings.proto */
 static int __Pyx_InitStrings(__Pyx_StringTabEntry *t);
 
+static void __pyx_f_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont__build_glyph_index(struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont *__pyx_v_self); /* proto*/
+static int __pyx_f_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont__get_glyph(struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont *__pyx_v_self, int __pyx_v_char_id, struct __pyx_t_5mpfmc_3uix_11bitmap_font_11bitmap_font_GlyphInfo *__pyx_v_glyph); /* proto*/
+static int __pyx_f_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont__get_kerning(struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont *__pyx_v_self, int __pyx_v_previous_char, int __pyx_v_current_char); /* proto*/
+static void __pyx_f_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_render_text(struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont *__pyx_v_self, struct SDL_Surface *__pyx_v_surface, PyObject *__pyx_v_text, int __pyx_v_x, int __pyx_v_y, int __pyx_v_use_kerning); /* proto*/
 
 /* Module declarations from 'cpython.pycapsule' */
 
+/* Module declarations from 'cpython.buffer' */
+
 /* Module declarations from 'libc.string' */
 
 /* Module declarations from 'mpfmc.uix.bitmap_font.bitmap_font' */
@@ -1357,6 +1631,7 @@ static const char __pyx_k_os[] = "os";
 static const char __pyx_k_re[] = "re";
 static const char __pyx_k_all[] = "__all__";
 static const char __pyx_k_doc[] = "__doc__";
+static const char __pyx_k_get[] = "get";
 static const char __pyx_k_base[] = "base";
 static const char __pyx_k_char[] = "char";
 static const char __pyx_k_exit[] = "__exit__";
@@ -1367,15 +1642,16 @@ static const char __pyx_k_main[] = "__main__";
 static const char __pyx_k_name[] = "__name__";
 static const char __pyx_k_open[] = "open";
 static const char __pyx_k_path[] = "path";
-static const char __pyx_k_rect[] = "rect";
 static const char __pyx_k_rgba[] = "rgba";
 static const char __pyx_k_test[] = "__test__";
 static const char __pyx_k_text[] = "text";
 static const char __pyx_k_chars[] = "chars";
+static const char __pyx_k_clear[] = "clear";
 static const char __pyx_k_enter[] = "__enter__";
 static const char __pyx_k_first[] = "first";
 static const char __pyx_k_flags[] = "flags";
 static const char __pyx_k_group[] = "group";
+static const char __pyx_k_items[] = "items";
 static const char __pyx_k_width[] = "width";
 static const char __pyx_k_amount[] = "amount";
 static const char __pyx_k_attrib[] = "attrib";
@@ -1403,7 +1679,6 @@ static const char __pyx_k_xadvance[] = "xadvance";
 static const char __pyx_k_ImageData[] = "ImageData";
 static const char __pyx_k_TypeError[] = "TypeError";
 static const char __pyx_k_container[] = "container";
-static const char __pyx_k_get_image[] = "get_image";
 static const char __pyx_k_metaclass[] = "__metaclass__";
 static const char __pyx_k_reduce_ex[] = "__reduce_ex__";
 static const char __pyx_k_BitmapFont[] = "BitmapFont";
@@ -1413,14 +1688,14 @@ static const char __pyx_k_ValueError[] = "ValueError";
 static const char __pyx_k_descriptor[] = "descriptor";
 static const char __pyx_k_image_file[] = "image_file";
 static const char __pyx_k_lineHeight[] = "lineHeight";
+static const char __pyx_k_memoryview[] = "memoryview";
+static const char __pyx_k_pyx_vtable[] = "__pyx_vtable__";
 static const char __pyx_k_startswith[] = "startswith";
 static const char __pyx_k_ElementTree[] = "ElementTree";
 static const char __pyx_k_bitmap_font[] = "bitmap_font";
 static const char __pyx_k_base_0_9_1_5[] = "base=([0-9]{1,5})";
 static const char __pyx_k_font_kerning[] = "font_kerning";
-static const char __pyx_k_get_kernings[] = "get_kernings";
 static const char __pyx_k_reduce_cython[] = "__reduce_cython__";
-static const char __pyx_k_get_characters[] = "get_characters";
 static const char __pyx_k_get_font_asset[] = "get_font_asset";
 static const char __pyx_k_kivy_core_image[] = "kivy.core.image";
 static const char __pyx_k_setstate_cython[] = "__setstate_cython__";
@@ -1481,6 +1756,7 @@ static PyObject *__pyx_n_s_bitmap_font;
 static PyObject *__pyx_n_u_char;
 static PyObject *__pyx_kp_u_char_s_id_P_id_0_9_1_4_s_x_P_x_0;
 static PyObject *__pyx_n_u_chars;
+static PyObject *__pyx_n_s_clear;
 static PyObject *__pyx_n_s_cline_in_traceback;
 static PyObject *__pyx_n_u_common;
 static PyObject *__pyx_n_s_container;
@@ -1495,10 +1771,8 @@ static PyObject *__pyx_n_u_first;
 static PyObject *__pyx_n_s_flags;
 static PyObject *__pyx_n_s_font_kerning;
 static PyObject *__pyx_n_u_font_kerning;
-static PyObject *__pyx_n_s_get_characters;
+static PyObject *__pyx_n_s_get;
 static PyObject *__pyx_n_s_get_font_asset;
-static PyObject *__pyx_n_s_get_image;
-static PyObject *__pyx_n_s_get_kernings;
 static PyObject *__pyx_n_s_getroot;
 static PyObject *__pyx_n_s_getstate;
 static PyObject *__pyx_n_s_group;
@@ -1509,6 +1783,7 @@ static PyObject *__pyx_n_s_image_file;
 static PyObject *__pyx_n_s_import;
 static PyObject *__pyx_n_u_info;
 static PyObject *__pyx_n_s_isfile;
+static PyObject *__pyx_n_s_items;
 static PyObject *__pyx_n_u_kerning;
 static PyObject *__pyx_kp_u_kerning_s_first_P_first_0_9_1_3;
 static PyObject *__pyx_n_u_kernings;
@@ -1519,6 +1794,7 @@ static PyObject *__pyx_n_s_load_descriptor_file;
 static PyObject *__pyx_n_s_load_descriptor_list;
 static PyObject *__pyx_n_s_load_descriptor_xml;
 static PyObject *__pyx_n_s_main;
+static PyObject *__pyx_n_s_memoryview;
 static PyObject *__pyx_n_s_metaclass;
 static PyObject *__pyx_n_s_module;
 static PyObject *__pyx_n_s_mpfmc_uix_bitmap_font_bitmap_fon;
@@ -1529,9 +1805,9 @@ static PyObject *__pyx_n_s_options;
 static PyObject *__pyx_n_s_os;
 static PyObject *__pyx_n_s_path;
 static PyObject *__pyx_n_s_prepare;
+static PyObject *__pyx_n_s_pyx_vtable;
 static PyObject *__pyx_n_s_qualname;
 static PyObject *__pyx_n_s_re;
-static PyObject *__pyx_n_s_rect;
 static PyObject *__pyx_n_s_reduce;
 static PyObject *__pyx_n_s_reduce_cython;
 static PyObject *__pyx_n_s_reduce_ex;
@@ -1547,14 +1823,11 @@ static PyObject *__pyx_n_s_w;
 static PyObject *__pyx_n_u_width;
 static PyObject *__pyx_n_s_x;
 static PyObject *__pyx_n_u_x;
-static PyObject *__pyx_n_s_xadvance;
 static PyObject *__pyx_n_u_xadvance;
 static PyObject *__pyx_n_s_xml_etree_ElementTree;
-static PyObject *__pyx_n_s_xoffset;
 static PyObject *__pyx_n_u_xoffset;
 static PyObject *__pyx_n_s_y;
 static PyObject *__pyx_n_u_y;
-static PyObject *__pyx_n_s_yoffset;
 static PyObject *__pyx_n_u_yoffset;
 static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_19BitmapFontCharacter___cinit__(struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFontCharacter *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v_args, CYTHON_UNUSED PyObject *__pyx_v_kw); /* proto */
 static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_19BitmapFontCharacter_2id___get__(struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFontCharacter *__pyx_v_self); /* proto */
@@ -1607,15 +1880,20 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_2
 static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer___cinit__(struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer *__pyx_v_self, PyObject *__pyx_v_w, PyObject *__pyx_v_h); /* proto */
 static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_2__init__(struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer *__pyx_v_self, PyObject *__pyx_v_w, PyObject *__pyx_v_h); /* proto */
 static void __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_4__dealloc__(struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_6render(struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer *__pyx_v_self, PyObject *__pyx_v_container, PyObject *__pyx_v_text, PyObject *__pyx_v_x, PyObject *__pyx_v_y); /* proto */
-static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_8get_data(struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_10__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_12__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
+static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_6__getbuffer__(struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer *__pyx_v_self, Py_buffer *__pyx_v_buffer, int __pyx_v_flags); /* proto */
+static void __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_8__releasebuffer__(CYTHON_UNUSED struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer *__pyx_v_self, CYTHON_UNUSED Py_buffer *__pyx_v_buffer); /* proto */
+static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_4size___get__(struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_10clear(struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_12render(struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer *__pyx_v_self, PyObject *__pyx_v_container, PyObject *__pyx_v_text, int __pyx_v_x, int __pyx_v_y); /* proto */
+static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_14get_data(struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_16__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_18__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
 static PyObject *__pyx_tp_new_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFontCharacter(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
 static PyObject *__pyx_tp_new_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
 static PyObject *__pyx_tp_new_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static __Pyx_CachedCFunction __pyx_umethod_PyDict_Type_get = {0, &__pyx_n_s_get, 0, 0, 0};
+static PyObject *__pyx_int_0;
 static PyObject *__pyx_int_1;
-static PyObject *__pyx_int_4;
 static PyObject *__pyx_tuple_;
 static PyObject *__pyx_tuple__2;
 static PyObject *__pyx_tuple__4;
@@ -1630,7 +1908,7 @@ static PyObject *__pyx_tuple__12;
 static PyObject *__pyx_tuple__13;
 /* Late includes */
 
-/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":621
+/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":634
  *     cdef public int xadvance
  * 
  *     def __cinit__(self, *args, **kw):             # <<<<<<<<<<<<<<
@@ -1663,7 +1941,7 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_19BitmapFontCharacte
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__cinit__", 0);
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":622
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":635
  * 
  *     def __cinit__(self, *args, **kw):
  *         self.id = 0             # <<<<<<<<<<<<<<
@@ -1672,7 +1950,7 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_19BitmapFontCharacte
  */
   __pyx_v_self->id = 0;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":623
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":636
  *     def __cinit__(self, *args, **kw):
  *         self.id = 0
  *         self.rect.x = 0             # <<<<<<<<<<<<<<
@@ -1681,7 +1959,7 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_19BitmapFontCharacte
  */
   __pyx_v_self->rect.x = 0;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":624
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":637
  *         self.id = 0
  *         self.rect.x = 0
  *         self.rect.y = 0             # <<<<<<<<<<<<<<
@@ -1690,7 +1968,7 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_19BitmapFontCharacte
  */
   __pyx_v_self->rect.y = 0;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":625
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":638
  *         self.rect.x = 0
  *         self.rect.y = 0
  *         self.rect.w = 0             # <<<<<<<<<<<<<<
@@ -1699,7 +1977,7 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_19BitmapFontCharacte
  */
   __pyx_v_self->rect.w = 0;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":626
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":639
  *         self.rect.y = 0
  *         self.rect.w = 0
  *         self.rect.h = 0             # <<<<<<<<<<<<<<
@@ -1708,7 +1986,7 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_19BitmapFontCharacte
  */
   __pyx_v_self->rect.h = 0;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":627
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":640
  *         self.rect.w = 0
  *         self.rect.h = 0
  *         self.xoffset = 0             # <<<<<<<<<<<<<<
@@ -1717,7 +1995,7 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_19BitmapFontCharacte
  */
   __pyx_v_self->xoffset = 0;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":628
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":641
  *         self.rect.h = 0
  *         self.xoffset = 0
  *         self.yoffset = 0             # <<<<<<<<<<<<<<
@@ -1726,7 +2004,7 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_19BitmapFontCharacte
  */
   __pyx_v_self->yoffset = 0;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":629
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":642
  *         self.xoffset = 0
  *         self.yoffset = 0
  *         self.xadvance = 0             # <<<<<<<<<<<<<<
@@ -1735,7 +2013,7 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_19BitmapFontCharacte
  */
   __pyx_v_self->xadvance = 0;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":621
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":634
  *     cdef public int xadvance
  * 
  *     def __cinit__(self, *args, **kw):             # <<<<<<<<<<<<<<
@@ -1749,7 +2027,7 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_19BitmapFontCharacte
   return __pyx_r;
 }
 
-/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":615
+/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":628
  * 
  * cdef class BitmapFontCharacter:
  *     cdef public int id             # <<<<<<<<<<<<<<
@@ -1774,9 +2052,12 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_19BitmapFontCh
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->id); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 615, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->id); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 628, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -1810,8 +2091,11 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_19BitmapFontCharacte
   int __pyx_r;
   __Pyx_RefNannyDeclarations
   int __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
-  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 615, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 628, __pyx_L1_error)
   __pyx_v_self->id = __pyx_t_1;
 
   /* function exit code */
@@ -1825,7 +2109,7 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_19BitmapFontCharacte
   return __pyx_r;
 }
 
-/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":616
+/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":629
  * cdef class BitmapFontCharacter:
  *     cdef public int id
  *     cdef public SDL_Rect rect             # <<<<<<<<<<<<<<
@@ -1850,9 +2134,12 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_19BitmapFontCh
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_convert__to_py_struct__SDL_Rect(__pyx_v_self->rect); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 616, __pyx_L1_error)
+  __pyx_t_1 = __pyx_convert__to_py_struct__SDL_Rect(__pyx_v_self->rect); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 629, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -1886,8 +2173,11 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_19BitmapFontCharacte
   int __pyx_r;
   __Pyx_RefNannyDeclarations
   struct SDL_Rect __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
-  __pyx_t_1 = __pyx_convert__from_py_struct__SDL_Rect(__pyx_v_value); if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 616, __pyx_L1_error)
+  __pyx_t_1 = __pyx_convert__from_py_struct__SDL_Rect(__pyx_v_value); if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 629, __pyx_L1_error)
   __pyx_v_self->rect = __pyx_t_1;
 
   /* function exit code */
@@ -1901,7 +2191,7 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_19BitmapFontCharacte
   return __pyx_r;
 }
 
-/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":617
+/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":630
  *     cdef public int id
  *     cdef public SDL_Rect rect
  *     cdef public int xoffset             # <<<<<<<<<<<<<<
@@ -1926,9 +2216,12 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_19BitmapFontCh
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->xoffset); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 617, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->xoffset); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 630, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -1962,8 +2255,11 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_19BitmapFontCharacte
   int __pyx_r;
   __Pyx_RefNannyDeclarations
   int __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
-  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 617, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 630, __pyx_L1_error)
   __pyx_v_self->xoffset = __pyx_t_1;
 
   /* function exit code */
@@ -1977,7 +2273,7 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_19BitmapFontCharacte
   return __pyx_r;
 }
 
-/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":618
+/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":631
  *     cdef public SDL_Rect rect
  *     cdef public int xoffset
  *     cdef public int yoffset             # <<<<<<<<<<<<<<
@@ -2002,9 +2298,12 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_19BitmapFontCh
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->yoffset); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 618, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->yoffset); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 631, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -2038,8 +2337,11 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_19BitmapFontCharacte
   int __pyx_r;
   __Pyx_RefNannyDeclarations
   int __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
-  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 618, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 631, __pyx_L1_error)
   __pyx_v_self->yoffset = __pyx_t_1;
 
   /* function exit code */
@@ -2053,7 +2355,7 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_19BitmapFontCharacte
   return __pyx_r;
 }
 
-/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":619
+/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":632
  *     cdef public int xoffset
  *     cdef public int yoffset
  *     cdef public int xadvance             # <<<<<<<<<<<<<<
@@ -2078,9 +2380,12 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_19BitmapFontCh
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->xadvance); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 619, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->xadvance); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 632, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -2114,8 +2419,11 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_19BitmapFontCharacte
   int __pyx_r;
   __Pyx_RefNannyDeclarations
   int __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
-  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 619, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 632, __pyx_L1_error)
   __pyx_v_self->xadvance = __pyx_t_1;
 
   /* function exit code */
@@ -2153,6 +2461,9 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_19BitmapFontCh
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__reduce_cython__", 0);
 
   /* "(tree fragment)":2
@@ -2208,6 +2519,9 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_19BitmapFontCh
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__setstate_cython__", 0);
 
   /* "(tree fragment)":4
@@ -2238,7 +2552,7 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_19BitmapFontCh
   return __pyx_r;
 }
 
-/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":650
+/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":665
  *     cdef SDL_Surface *image
  * 
  *     def __cinit__(self, *args, **kw):             # <<<<<<<<<<<<<<
@@ -2270,9 +2584,12 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont___cinit
   int __pyx_r;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__cinit__", 0);
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":651
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":666
  * 
  *     def __cinit__(self, *args, **kw):
  *         self.face = ""             # <<<<<<<<<<<<<<
@@ -2285,7 +2602,7 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont___cinit
   __Pyx_DECREF(__pyx_v_self->face);
   __pyx_v_self->face = __pyx_kp_u__3;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":652
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":667
  *     def __cinit__(self, *args, **kw):
  *         self.face = ""
  *         self.bold = False             # <<<<<<<<<<<<<<
@@ -2294,7 +2611,7 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont___cinit
  */
   __pyx_v_self->bold = 0;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":653
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":668
  *         self.face = ""
  *         self.bold = False
  *         self.italic = False             # <<<<<<<<<<<<<<
@@ -2303,7 +2620,7 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont___cinit
  */
   __pyx_v_self->italic = 0;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":654
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":669
  *         self.bold = False
  *         self.italic = False
  *         self.padding = 0             # <<<<<<<<<<<<<<
@@ -2312,7 +2629,7 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont___cinit
  */
   __pyx_v_self->padding = 0;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":655
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":670
  *         self.italic = False
  *         self.padding = 0
  *         self.spacing = 0             # <<<<<<<<<<<<<<
@@ -2321,7 +2638,7 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont___cinit
  */
   __pyx_v_self->spacing = 0;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":656
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":671
  *         self.padding = 0
  *         self.spacing = 0
  *         self.outline = 0             # <<<<<<<<<<<<<<
@@ -2330,7 +2647,7 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont___cinit
  */
   __pyx_v_self->outline = 0;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":658
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":673
  *         self.outline = 0
  * 
  *         self.line_height = 0             # <<<<<<<<<<<<<<
@@ -2339,7 +2656,7 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont___cinit
  */
   __pyx_v_self->line_height = 0;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":659
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":674
  * 
  *         self.line_height = 0
  *         self.base = 0             # <<<<<<<<<<<<<<
@@ -2348,7 +2665,7 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont___cinit
  */
   __pyx_v_self->base = 0;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":660
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":675
  *         self.line_height = 0
  *         self.base = 0
  *         self.scale_w = 0             # <<<<<<<<<<<<<<
@@ -2357,7 +2674,7 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont___cinit
  */
   __pyx_v_self->scale_w = 0;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":661
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":676
  *         self.base = 0
  *         self.scale_w = 0
  *         self.scale_h = 0             # <<<<<<<<<<<<<<
@@ -2366,14 +2683,14 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont___cinit
  */
   __pyx_v_self->scale_h = 0;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":663
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":678
  *         self.scale_h = 0
  * 
  *         self.characters = dict()             # <<<<<<<<<<<<<<
  *         self.kernings = dict()
- * 
+ *         memset(self.glyphs, 0, sizeof(self.glyphs))
  */
-  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 663, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 678, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_GIVEREF(__pyx_t_1);
   __Pyx_GOTREF(__pyx_v_self->characters);
@@ -2381,14 +2698,14 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont___cinit
   __pyx_v_self->characters = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":664
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":679
  * 
  *         self.characters = dict()
  *         self.kernings = dict()             # <<<<<<<<<<<<<<
+ *         memset(self.glyphs, 0, sizeof(self.glyphs))
  * 
- *         self.image = NULL
  */
-  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 664, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 679, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_GIVEREF(__pyx_t_1);
   __Pyx_GOTREF(__pyx_v_self->kernings);
@@ -2396,8 +2713,17 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont___cinit
   __pyx_v_self->kernings = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":666
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":680
+ *         self.characters = dict()
  *         self.kernings = dict()
+ *         memset(self.glyphs, 0, sizeof(self.glyphs))             # <<<<<<<<<<<<<<
+ * 
+ *         self.image = NULL
+ */
+  (void)(memset(__pyx_v_self->glyphs, 0, (sizeof(__pyx_v_self->glyphs))));
+
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":682
+ *         memset(self.glyphs, 0, sizeof(self.glyphs))
  * 
  *         self.image = NULL             # <<<<<<<<<<<<<<
  * 
@@ -2405,7 +2731,7 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont___cinit
  */
   __pyx_v_self->image = NULL;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":650
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":665
  *     cdef SDL_Surface *image
  * 
  *     def __cinit__(self, *args, **kw):             # <<<<<<<<<<<<<<
@@ -2425,7 +2751,7 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont___cinit
   return __pyx_r;
 }
 
-/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":668
+/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":684
  *         self.image = NULL
  * 
  *     def __init__(self, str image_file, object descriptor):             # <<<<<<<<<<<<<<
@@ -2438,6 +2764,9 @@ static int __pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_3__init
 static int __pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_3__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyObject *__pyx_v_image_file = 0;
   PyObject *__pyx_v_descriptor = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   int __pyx_r;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__init__ (wrapper)", 0);
@@ -2464,11 +2793,11 @@ static int __pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_3__init
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_descriptor)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 1, 2, 2, 1); __PYX_ERR(1, 668, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("__init__", 1, 2, 2, 1); __PYX_ERR(1, 684, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(1, 668, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(1, 684, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
       goto __pyx_L5_argtuple_error;
@@ -2481,13 +2810,13 @@ static int __pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_3__init
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__init__", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(1, 668, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("__init__", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(1, 684, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("mpfmc.uix.bitmap_font.bitmap_font.BitmapFont.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return -1;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_image_file), (&PyUnicode_Type), 1, "image_file", 1))) __PYX_ERR(1, 668, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_image_file), (&PyUnicode_Type), 1, "image_file", 1))) __PYX_ERR(1, 684, __pyx_L1_error)
   __pyx_r = __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_2__init__(((struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont *)__pyx_v_self), __pyx_v_image_file, __pyx_v_descriptor);
 
   /* function exit code */
@@ -2511,9 +2840,12 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_2__init
   PyObject *__pyx_t_5 = NULL;
   int __pyx_t_6;
   int __pyx_t_7;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__init__", 0);
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":671
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":687
  * 
  *         # Load the image file
  *         cdef bytes c_filename = image_file.encode('utf-8')             # <<<<<<<<<<<<<<
@@ -2522,14 +2854,14 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_2__init
  */
   if (unlikely(__pyx_v_image_file == Py_None)) {
     PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "encode");
-    __PYX_ERR(1, 671, __pyx_L1_error)
+    __PYX_ERR(1, 687, __pyx_L1_error)
   }
-  __pyx_t_1 = PyUnicode_AsUTF8String(__pyx_v_image_file); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 671, __pyx_L1_error)
+  __pyx_t_1 = PyUnicode_AsUTF8String(__pyx_v_image_file); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 687, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_v_c_filename = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":672
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":688
  *         # Load the image file
  *         cdef bytes c_filename = image_file.encode('utf-8')
  *         cdef SDL_Surface *image = IMG_Load(c_filename)             # <<<<<<<<<<<<<<
@@ -2538,12 +2870,12 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_2__init
  */
   if (unlikely(__pyx_v_c_filename == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "expected bytes, NoneType found");
-    __PYX_ERR(1, 672, __pyx_L1_error)
+    __PYX_ERR(1, 688, __pyx_L1_error)
   }
-  __pyx_t_2 = __Pyx_PyBytes_AsWritableString(__pyx_v_c_filename); if (unlikely((!__pyx_t_2) && PyErr_Occurred())) __PYX_ERR(1, 672, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyBytes_AsWritableString(__pyx_v_c_filename); if (unlikely((!__pyx_t_2) && PyErr_Occurred())) __PYX_ERR(1, 688, __pyx_L1_error)
   __pyx_v_image = IMG_Load(__pyx_t_2);
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":674
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":690
  *         cdef SDL_Surface *image = IMG_Load(c_filename)
  * 
  *         if image == NULL:             # <<<<<<<<<<<<<<
@@ -2553,14 +2885,14 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_2__init
   __pyx_t_3 = ((__pyx_v_image == NULL) != 0);
   if (unlikely(__pyx_t_3)) {
 
-    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":675
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":691
  * 
  *         if image == NULL:
  *             raise BitmapFontException("Could not load bitmap font image file")             # <<<<<<<<<<<<<<
  * 
  *         self.image = image
  */
-    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_BitmapFontException); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 675, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_BitmapFontException); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 691, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
     __pyx_t_5 = NULL;
     if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
@@ -2574,14 +2906,14 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_2__init
     }
     __pyx_t_1 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_5, __pyx_kp_u_Could_not_load_bitmap_font_image) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_kp_u_Could_not_load_bitmap_font_image);
     __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 675, __pyx_L1_error)
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 691, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_Raise(__pyx_t_1, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __PYX_ERR(1, 675, __pyx_L1_error)
+    __PYX_ERR(1, 691, __pyx_L1_error)
 
-    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":674
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":690
  *         cdef SDL_Surface *image = IMG_Load(c_filename)
  * 
  *         if image == NULL:             # <<<<<<<<<<<<<<
@@ -2590,7 +2922,7 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_2__init
  */
   }
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":677
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":693
  *             raise BitmapFontException("Could not load bitmap font image file")
  * 
  *         self.image = image             # <<<<<<<<<<<<<<
@@ -2599,7 +2931,7 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_2__init
  */
   __pyx_v_self->image = __pyx_v_image;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":678
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":694
  * 
  *         self.image = image
  *         self.scale_w = self.image.w             # <<<<<<<<<<<<<<
@@ -2609,7 +2941,7 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_2__init
   __pyx_t_6 = __pyx_v_self->image->w;
   __pyx_v_self->scale_w = __pyx_t_6;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":679
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":695
  *         self.image = image
  *         self.scale_w = self.image.w
  *         self.scale_h = self.image.h             # <<<<<<<<<<<<<<
@@ -2619,7 +2951,7 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_2__init
   __pyx_t_6 = __pyx_v_self->image->h;
   __pyx_v_self->scale_h = __pyx_t_6;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":681
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":697
  *         self.scale_h = self.image.h
  * 
  *         if isinstance(descriptor, list):             # <<<<<<<<<<<<<<
@@ -2630,14 +2962,14 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_2__init
   __pyx_t_7 = (__pyx_t_3 != 0);
   if (__pyx_t_7) {
 
-    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":682
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":698
  * 
  *         if isinstance(descriptor, list):
  *             self._load_descriptor_list(descriptor)             # <<<<<<<<<<<<<<
  *         elif isinstance(descriptor, str):
  *             self._load_descriptor_file(descriptor)
  */
-    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_load_descriptor_list); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 682, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_load_descriptor_list); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 698, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
     __pyx_t_5 = NULL;
     if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
@@ -2651,12 +2983,12 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_2__init
     }
     __pyx_t_1 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_5, __pyx_v_descriptor) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_v_descriptor);
     __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 682, __pyx_L1_error)
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 698, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":681
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":697
  *         self.scale_h = self.image.h
  * 
  *         if isinstance(descriptor, list):             # <<<<<<<<<<<<<<
@@ -2666,7 +2998,7 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_2__init
     goto __pyx_L4;
   }
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":683
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":699
  *         if isinstance(descriptor, list):
  *             self._load_descriptor_list(descriptor)
  *         elif isinstance(descriptor, str):             # <<<<<<<<<<<<<<
@@ -2677,14 +3009,14 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_2__init
   __pyx_t_3 = (__pyx_t_7 != 0);
   if (likely(__pyx_t_3)) {
 
-    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":684
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":700
  *             self._load_descriptor_list(descriptor)
  *         elif isinstance(descriptor, str):
  *             self._load_descriptor_file(descriptor)             # <<<<<<<<<<<<<<
  *         else:
  *             raise BitmapFontException("Illegal value in bitmap font descriptor")
  */
-    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_load_descriptor_file); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 684, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_load_descriptor_file); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 700, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
     __pyx_t_5 = NULL;
     if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
@@ -2698,12 +3030,12 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_2__init
     }
     __pyx_t_1 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_5, __pyx_v_descriptor) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_v_descriptor);
     __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 684, __pyx_L1_error)
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 700, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":683
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":699
  *         if isinstance(descriptor, list):
  *             self._load_descriptor_list(descriptor)
  *         elif isinstance(descriptor, str):             # <<<<<<<<<<<<<<
@@ -2713,15 +3045,15 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_2__init
     goto __pyx_L4;
   }
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":686
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":702
  *             self._load_descriptor_file(descriptor)
  *         else:
  *             raise BitmapFontException("Illegal value in bitmap font descriptor")             # <<<<<<<<<<<<<<
  * 
- *     def __dealloc__(self):
+ *         self._build_glyph_index()
  */
   /*else*/ {
-    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_BitmapFontException); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 686, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_BitmapFontException); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 702, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
     __pyx_t_5 = NULL;
     if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
@@ -2735,16 +3067,25 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_2__init
     }
     __pyx_t_1 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_5, __pyx_kp_u_Illegal_value_in_bitmap_font_des) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_kp_u_Illegal_value_in_bitmap_font_des);
     __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 686, __pyx_L1_error)
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 702, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_Raise(__pyx_t_1, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __PYX_ERR(1, 686, __pyx_L1_error)
+    __PYX_ERR(1, 702, __pyx_L1_error)
   }
   __pyx_L4:;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":668
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":704
+ *             raise BitmapFontException("Illegal value in bitmap font descriptor")
+ * 
+ *         self._build_glyph_index()             # <<<<<<<<<<<<<<
+ * 
+ *     def __dealloc__(self):
+ */
+  ((struct __pyx_vtabstruct_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont *)__pyx_v_self->__pyx_vtab)->_build_glyph_index(__pyx_v_self); if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 704, __pyx_L1_error)
+
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":684
  *         self.image = NULL
  * 
  *     def __init__(self, str image_file, object descriptor):             # <<<<<<<<<<<<<<
@@ -2767,8 +3108,8 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_2__init
   return __pyx_r;
 }
 
-/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":688
- *             raise BitmapFontException("Illegal value in bitmap font descriptor")
+/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":706
+ *         self._build_glyph_index()
  * 
  *     def __dealloc__(self):             # <<<<<<<<<<<<<<
  *         if self.image != NULL:
@@ -2791,7 +3132,7 @@ static void __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_4__dea
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("__dealloc__", 0);
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":689
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":707
  * 
  *     def __dealloc__(self):
  *         if self.image != NULL:             # <<<<<<<<<<<<<<
@@ -2801,7 +3142,7 @@ static void __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_4__dea
   __pyx_t_1 = ((__pyx_v_self->image != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":690
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":708
  *     def __dealloc__(self):
  *         if self.image != NULL:
  *             SDL_FreeSurface(self.image)             # <<<<<<<<<<<<<<
@@ -2810,7 +3151,7 @@ static void __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_4__dea
  */
     SDL_FreeSurface(__pyx_v_self->image);
 
-    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":691
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":709
  *         if self.image != NULL:
  *             SDL_FreeSurface(self.image)
  *             self.image = NULL             # <<<<<<<<<<<<<<
@@ -2819,7 +3160,7 @@ static void __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_4__dea
  */
     __pyx_v_self->image = NULL;
 
-    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":689
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":707
  * 
  *     def __dealloc__(self):
  *         if self.image != NULL:             # <<<<<<<<<<<<<<
@@ -2828,8 +3169,8 @@ static void __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_4__dea
  */
   }
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":688
- *             raise BitmapFontException("Illegal value in bitmap font descriptor")
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":706
+ *         self._build_glyph_index()
  * 
  *     def __dealloc__(self):             # <<<<<<<<<<<<<<
  *         if self.image != NULL:
@@ -2840,7 +3181,7 @@ static void __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_4__dea
   __Pyx_RefNannyFinishContext();
 }
 
-/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":693
+/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":711
  *             self.image = NULL
  * 
  *     def get_image(self):             # <<<<<<<<<<<<<<
@@ -2867,21 +3208,24 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_6
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("get_image", 0);
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":694
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":712
  * 
  *     def get_image(self):
  *         image_capsule = pycapsule.PyCapsule_New(self.image, NULL, NULL)             # <<<<<<<<<<<<<<
  *         return image_capsule
  * 
  */
-  __pyx_t_1 = PyCapsule_New(__pyx_v_self->image, NULL, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 694, __pyx_L1_error)
+  __pyx_t_1 = PyCapsule_New(__pyx_v_self->image, NULL, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 712, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_v_image_capsule = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":695
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":713
  *     def get_image(self):
  *         image_capsule = pycapsule.PyCapsule_New(self.image, NULL, NULL)
  *         return image_capsule             # <<<<<<<<<<<<<<
@@ -2893,7 +3237,7 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_6
   __pyx_r = __pyx_v_image_capsule;
   goto __pyx_L0;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":693
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":711
  *             self.image = NULL
  * 
  *     def get_image(self):             # <<<<<<<<<<<<<<
@@ -2913,7 +3257,7 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_6
   return __pyx_r;
 }
 
-/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":697
+/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":715
  *         return image_capsule
  * 
  *     def get_characters(self):             # <<<<<<<<<<<<<<
@@ -2940,7 +3284,7 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_8
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("get_characters", 0);
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":698
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":716
  * 
  *     def get_characters(self):
  *         return self.characters             # <<<<<<<<<<<<<<
@@ -2952,7 +3296,7 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_8
   __pyx_r = __pyx_v_self->characters;
   goto __pyx_L0;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":697
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":715
  *         return image_capsule
  * 
  *     def get_characters(self):             # <<<<<<<<<<<<<<
@@ -2967,7 +3311,7 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_8
   return __pyx_r;
 }
 
-/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":700
+/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":718
  *         return self.characters
  * 
  *     def get_kernings(self):             # <<<<<<<<<<<<<<
@@ -2994,19 +3338,19 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("get_kernings", 0);
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":701
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":719
  * 
  *     def get_kernings(self):
  *         return self.kernings             # <<<<<<<<<<<<<<
  * 
- *     def _load_descriptor_list(self, list descriptor_list):
+ *     cdef void _build_glyph_index(self) except *:
  */
   __Pyx_XDECREF(__pyx_r);
   __Pyx_INCREF(__pyx_v_self->kernings);
   __pyx_r = __pyx_v_self->kernings;
   goto __pyx_L0;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":700
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":718
  *         return self.characters
  * 
  *     def get_kernings(self):             # <<<<<<<<<<<<<<
@@ -3021,65 +3365,768 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
   return __pyx_r;
 }
 
-/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":703
+/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":721
  *         return self.kernings
  * 
- *     def _load_descriptor_list(self, list descriptor_list):             # <<<<<<<<<<<<<<
- *         """Load the descriptor from the supplied list."""
- *         cdef int x = 0
+ *     cdef void _build_glyph_index(self) except *:             # <<<<<<<<<<<<<<
+ *         """Copy the character definitions into the flat glyph index array
+ *         so rendering does not need any dict lookups for common characters."""
  */
 
-/* Python wrapper */
-static PyObject *__pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_13_load_descriptor_list(PyObject *__pyx_v_self, PyObject *__pyx_v_descriptor_list); /*proto*/
-static char __pyx_doc_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_12_load_descriptor_list[] = "BitmapFont._load_descriptor_list(self, list descriptor_list)\nLoad the descriptor from the supplied list.";
-static PyObject *__pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_13_load_descriptor_list(PyObject *__pyx_v_self, PyObject *__pyx_v_descriptor_list) {
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("_load_descriptor_list (wrapper)", 0);
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_descriptor_list), (&PyList_Type), 1, "descriptor_list", 1))) __PYX_ERR(1, 703, __pyx_L1_error)
-  __pyx_r = __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_12_load_descriptor_list(((struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont *)__pyx_v_self), ((PyObject*)__pyx_v_descriptor_list));
-
-  /* function exit code */
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_12_load_descriptor_list(struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont *__pyx_v_self, PyObject *__pyx_v_descriptor_list) {
-  int __pyx_v_x;
-  int __pyx_v_y;
-  int __pyx_v_row_height;
-  int __pyx_v_char_width;
-  int __pyx_v_char_id;
-  PyObject *__pyx_v_row = NULL;
-  PyObject *__pyx_v_text_char = NULL;
-  struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFontCharacter *__pyx_v_character = NULL;
-  PyObject *__pyx_r = NULL;
+static void __pyx_f_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont__build_glyph_index(struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont *__pyx_v_self) {
+  struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFontCharacter *__pyx_v_character = 0;
+  PyObject *__pyx_v_char_id = NULL;
   __Pyx_RefNannyDeclarations
-  Py_ssize_t __pyx_t_1;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  Py_ssize_t __pyx_t_4;
-  PyObject *(*__pyx_t_5)(PyObject *);
+  PyObject *__pyx_t_1 = NULL;
+  Py_ssize_t __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
   PyObject *__pyx_t_6 = NULL;
-  long __pyx_t_7;
+  int __pyx_t_7;
   int __pyx_t_8;
-  int __pyx_t_9;
-  __Pyx_RefNannySetupContext("_load_descriptor_list", 0);
+  struct SDL_Rect __pyx_t_9;
+  Py_ssize_t __pyx_t_10;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_build_glyph_index", 0);
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":705
- *     def _load_descriptor_list(self, list descriptor_list):
- *         """Load the descriptor from the supplied list."""
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":725
+ *         so rendering does not need any dict lookups for common characters."""
+ *         cdef BitmapFontCharacter character
+ *         memset(self.glyphs, 0, sizeof(self.glyphs))             # <<<<<<<<<<<<<<
+ * 
+ *         for char_id, character in self.characters.items():
+ */
+  (void)(memset(__pyx_v_self->glyphs, 0, (sizeof(__pyx_v_self->glyphs))));
+
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":727
+ *         memset(self.glyphs, 0, sizeof(self.glyphs))
+ * 
+ *         for char_id, character in self.characters.items():             # <<<<<<<<<<<<<<
+ *             if 0 <= char_id < GLYPH_INDEX_SIZE:
+ *                 self.glyphs[char_id].rect = character.rect
+ */
+  __pyx_t_2 = 0;
+  if (unlikely(__pyx_v_self->characters == Py_None)) {
+    PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "items");
+    __PYX_ERR(1, 727, __pyx_L1_error)
+  }
+  __pyx_t_5 = __Pyx_dict_iterator(__pyx_v_self->characters, 1, __pyx_n_s_items, (&__pyx_t_3), (&__pyx_t_4)); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 727, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_1);
+  __pyx_t_1 = __pyx_t_5;
+  __pyx_t_5 = 0;
+  while (1) {
+    __pyx_t_7 = __Pyx_dict_iter_next(__pyx_t_1, __pyx_t_3, &__pyx_t_2, &__pyx_t_5, &__pyx_t_6, NULL, __pyx_t_4);
+    if (unlikely(__pyx_t_7 == 0)) break;
+    if (unlikely(__pyx_t_7 == -1)) __PYX_ERR(1, 727, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_GOTREF(__pyx_t_6);
+    if (!(likely(((__pyx_t_6) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_6, __pyx_ptype_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFontCharacter))))) __PYX_ERR(1, 727, __pyx_L1_error)
+    __Pyx_XDECREF_SET(__pyx_v_char_id, __pyx_t_5);
+    __pyx_t_5 = 0;
+    __Pyx_XDECREF_SET(__pyx_v_character, ((struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFontCharacter *)__pyx_t_6));
+    __pyx_t_6 = 0;
+
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":728
+ * 
+ *         for char_id, character in self.characters.items():
+ *             if 0 <= char_id < GLYPH_INDEX_SIZE:             # <<<<<<<<<<<<<<
+ *                 self.glyphs[char_id].rect = character.rect
+ *                 self.glyphs[char_id].xoffset = character.xoffset
+ */
+    __pyx_t_6 = PyObject_RichCompare(__pyx_int_0, __pyx_v_char_id, Py_LE); __Pyx_XGOTREF(__pyx_t_6); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 728, __pyx_L1_error)
+    if (__Pyx_PyObject_IsTrue(__pyx_t_6)) {
+      __Pyx_DECREF(__pyx_t_6);
+      __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_e_5mpfmc_3uix_11bitmap_font_11bitmap_font_GLYPH_INDEX_SIZE); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 728, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_6 = PyObject_RichCompare(__pyx_v_char_id, __pyx_t_5, Py_LT); __Pyx_XGOTREF(__pyx_t_6); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 728, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    }
+    __pyx_t_8 = __Pyx_PyObject_IsTrue(__pyx_t_6); if (unlikely(__pyx_t_8 < 0)) __PYX_ERR(1, 728, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (__pyx_t_8) {
+
+      /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":729
+ *         for char_id, character in self.characters.items():
+ *             if 0 <= char_id < GLYPH_INDEX_SIZE:
+ *                 self.glyphs[char_id].rect = character.rect             # <<<<<<<<<<<<<<
+ *                 self.glyphs[char_id].xoffset = character.xoffset
+ *                 self.glyphs[char_id].yoffset = character.yoffset
+ */
+      __pyx_t_9 = __pyx_v_character->rect;
+      __pyx_t_10 = __Pyx_PyIndex_AsSsize_t(__pyx_v_char_id); if (unlikely((__pyx_t_10 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(1, 729, __pyx_L1_error)
+      (__pyx_v_self->glyphs[__pyx_t_10]).rect = __pyx_t_9;
+
+      /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":730
+ *             if 0 <= char_id < GLYPH_INDEX_SIZE:
+ *                 self.glyphs[char_id].rect = character.rect
+ *                 self.glyphs[char_id].xoffset = character.xoffset             # <<<<<<<<<<<<<<
+ *                 self.glyphs[char_id].yoffset = character.yoffset
+ *                 self.glyphs[char_id].xadvance = character.xadvance
+ */
+      __pyx_t_7 = __pyx_v_character->xoffset;
+      __pyx_t_10 = __Pyx_PyIndex_AsSsize_t(__pyx_v_char_id); if (unlikely((__pyx_t_10 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(1, 730, __pyx_L1_error)
+      (__pyx_v_self->glyphs[__pyx_t_10]).xoffset = __pyx_t_7;
+
+      /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":731
+ *                 self.glyphs[char_id].rect = character.rect
+ *                 self.glyphs[char_id].xoffset = character.xoffset
+ *                 self.glyphs[char_id].yoffset = character.yoffset             # <<<<<<<<<<<<<<
+ *                 self.glyphs[char_id].xadvance = character.xadvance
+ *                 self.glyphs[char_id].defined = True
+ */
+      __pyx_t_7 = __pyx_v_character->yoffset;
+      __pyx_t_10 = __Pyx_PyIndex_AsSsize_t(__pyx_v_char_id); if (unlikely((__pyx_t_10 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(1, 731, __pyx_L1_error)
+      (__pyx_v_self->glyphs[__pyx_t_10]).yoffset = __pyx_t_7;
+
+      /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":732
+ *                 self.glyphs[char_id].xoffset = character.xoffset
+ *                 self.glyphs[char_id].yoffset = character.yoffset
+ *                 self.glyphs[char_id].xadvance = character.xadvance             # <<<<<<<<<<<<<<
+ *                 self.glyphs[char_id].defined = True
+ * 
+ */
+      __pyx_t_7 = __pyx_v_character->xadvance;
+      __pyx_t_10 = __Pyx_PyIndex_AsSsize_t(__pyx_v_char_id); if (unlikely((__pyx_t_10 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(1, 732, __pyx_L1_error)
+      (__pyx_v_self->glyphs[__pyx_t_10]).xadvance = __pyx_t_7;
+
+      /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":733
+ *                 self.glyphs[char_id].yoffset = character.yoffset
+ *                 self.glyphs[char_id].xadvance = character.xadvance
+ *                 self.glyphs[char_id].defined = True             # <<<<<<<<<<<<<<
+ * 
+ *     cdef bint _get_glyph(self, int char_id, GlyphInfo *glyph) except *:
+ */
+      __pyx_t_10 = __Pyx_PyIndex_AsSsize_t(__pyx_v_char_id); if (unlikely((__pyx_t_10 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(1, 733, __pyx_L1_error)
+      (__pyx_v_self->glyphs[__pyx_t_10]).defined = 1;
+
+      /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":728
+ * 
+ *         for char_id, character in self.characters.items():
+ *             if 0 <= char_id < GLYPH_INDEX_SIZE:             # <<<<<<<<<<<<<<
+ *                 self.glyphs[char_id].rect = character.rect
+ *                 self.glyphs[char_id].xoffset = character.xoffset
+ */
+    }
+  }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":721
+ *         return self.kernings
+ * 
+ *     cdef void _build_glyph_index(self) except *:             # <<<<<<<<<<<<<<
+ *         """Copy the character definitions into the flat glyph index array
+ *         so rendering does not need any dict lookups for common characters."""
+ */
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("mpfmc.uix.bitmap_font.bitmap_font.BitmapFont._build_glyph_index", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_character);
+  __Pyx_XDECREF(__pyx_v_char_id);
+  __Pyx_RefNannyFinishContext();
+}
+
+/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":735
+ *                 self.glyphs[char_id].defined = True
+ * 
+ *     cdef bint _get_glyph(self, int char_id, GlyphInfo *glyph) except *:             # <<<<<<<<<<<<<<
+ *         """Fill in the glyph info for a character. Returns False if the font
+ *         does not contain the character."""
+ */
+
+static int __pyx_f_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont__get_glyph(struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont *__pyx_v_self, int __pyx_v_char_id, struct __pyx_t_5mpfmc_3uix_11bitmap_font_11bitmap_font_GlyphInfo *__pyx_v_glyph) {
+  struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFontCharacter *__pyx_v_character = 0;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  struct SDL_Rect __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_get_glyph", 0);
+
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":740
+ *         cdef BitmapFontCharacter character
+ * 
+ *         if 0 <= char_id < GLYPH_INDEX_SIZE:             # <<<<<<<<<<<<<<
+ *             glyph[0] = self.glyphs[char_id]
+ *             return glyph.defined
+ */
+  __pyx_t_1 = (0 <= __pyx_v_char_id);
+  if (__pyx_t_1) {
+    __pyx_t_1 = (__pyx_v_char_id < __pyx_e_5mpfmc_3uix_11bitmap_font_11bitmap_font_GLYPH_INDEX_SIZE);
+  }
+  __pyx_t_2 = (__pyx_t_1 != 0);
+  if (__pyx_t_2) {
+
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":741
+ * 
+ *         if 0 <= char_id < GLYPH_INDEX_SIZE:
+ *             glyph[0] = self.glyphs[char_id]             # <<<<<<<<<<<<<<
+ *             return glyph.defined
+ * 
+ */
+    (__pyx_v_glyph[0]) = (__pyx_v_self->glyphs[__pyx_v_char_id]);
+
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":742
+ *         if 0 <= char_id < GLYPH_INDEX_SIZE:
+ *             glyph[0] = self.glyphs[char_id]
+ *             return glyph.defined             # <<<<<<<<<<<<<<
+ * 
+ *         character = self.characters.get(char_id)
+ */
+    __pyx_r = __pyx_v_glyph->defined;
+    goto __pyx_L0;
+
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":740
+ *         cdef BitmapFontCharacter character
+ * 
+ *         if 0 <= char_id < GLYPH_INDEX_SIZE:             # <<<<<<<<<<<<<<
+ *             glyph[0] = self.glyphs[char_id]
+ *             return glyph.defined
+ */
+  }
+
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":744
+ *             return glyph.defined
+ * 
+ *         character = self.characters.get(char_id)             # <<<<<<<<<<<<<<
+ *         if character is None:
+ *             return False
+ */
+  if (unlikely(__pyx_v_self->characters == Py_None)) {
+    PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "get");
+    __PYX_ERR(1, 744, __pyx_L1_error)
+  }
+  __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_char_id); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 744, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = __Pyx_PyDict_GetItemDefault(__pyx_v_self->characters, __pyx_t_3, Py_None); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 744, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (!(likely(((__pyx_t_4) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_4, __pyx_ptype_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFontCharacter))))) __PYX_ERR(1, 744, __pyx_L1_error)
+  __pyx_v_character = ((struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFontCharacter *)__pyx_t_4);
+  __pyx_t_4 = 0;
+
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":745
+ * 
+ *         character = self.characters.get(char_id)
+ *         if character is None:             # <<<<<<<<<<<<<<
+ *             return False
+ * 
+ */
+  __pyx_t_2 = (((PyObject *)__pyx_v_character) == Py_None);
+  __pyx_t_1 = (__pyx_t_2 != 0);
+  if (__pyx_t_1) {
+
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":746
+ *         character = self.characters.get(char_id)
+ *         if character is None:
+ *             return False             # <<<<<<<<<<<<<<
+ * 
+ *         glyph.rect = character.rect
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":745
+ * 
+ *         character = self.characters.get(char_id)
+ *         if character is None:             # <<<<<<<<<<<<<<
+ *             return False
+ * 
+ */
+  }
+
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":748
+ *             return False
+ * 
+ *         glyph.rect = character.rect             # <<<<<<<<<<<<<<
+ *         glyph.xoffset = character.xoffset
+ *         glyph.yoffset = character.yoffset
+ */
+  __pyx_t_5 = __pyx_v_character->rect;
+  __pyx_v_glyph->rect = __pyx_t_5;
+
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":749
+ * 
+ *         glyph.rect = character.rect
+ *         glyph.xoffset = character.xoffset             # <<<<<<<<<<<<<<
+ *         glyph.yoffset = character.yoffset
+ *         glyph.xadvance = character.xadvance
+ */
+  __pyx_t_6 = __pyx_v_character->xoffset;
+  __pyx_v_glyph->xoffset = __pyx_t_6;
+
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":750
+ *         glyph.rect = character.rect
+ *         glyph.xoffset = character.xoffset
+ *         glyph.yoffset = character.yoffset             # <<<<<<<<<<<<<<
+ *         glyph.xadvance = character.xadvance
+ *         glyph.defined = True
+ */
+  __pyx_t_6 = __pyx_v_character->yoffset;
+  __pyx_v_glyph->yoffset = __pyx_t_6;
+
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":751
+ *         glyph.xoffset = character.xoffset
+ *         glyph.yoffset = character.yoffset
+ *         glyph.xadvance = character.xadvance             # <<<<<<<<<<<<<<
+ *         glyph.defined = True
+ *         return True
+ */
+  __pyx_t_6 = __pyx_v_character->xadvance;
+  __pyx_v_glyph->xadvance = __pyx_t_6;
+
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":752
+ *         glyph.yoffset = character.yoffset
+ *         glyph.xadvance = character.xadvance
+ *         glyph.defined = True             # <<<<<<<<<<<<<<
+ *         return True
+ * 
+ */
+  __pyx_v_glyph->defined = 1;
+
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":753
+ *         glyph.xadvance = character.xadvance
+ *         glyph.defined = True
+ *         return True             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int _get_kerning(self, int previous_char, int current_char) except? -1:
+ */
+  __pyx_r = 1;
+  goto __pyx_L0;
+
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":735
+ *                 self.glyphs[char_id].defined = True
+ * 
+ *     cdef bint _get_glyph(self, int char_id, GlyphInfo *glyph) except *:             # <<<<<<<<<<<<<<
+ *         """Fill in the glyph info for a character. Returns False if the font
+ *         does not contain the character."""
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("mpfmc.uix.bitmap_font.bitmap_font.BitmapFont._get_glyph", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_character);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":755
+ *         return True
+ * 
+ *     cdef int _get_kerning(self, int previous_char, int current_char) except? -1:             # <<<<<<<<<<<<<<
+ *         cdef dict first_kernings
+ *         if not self.kernings:
+ */
+
+static int __pyx_f_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont__get_kerning(struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont *__pyx_v_self, int __pyx_v_previous_char, int __pyx_v_current_char) {
+  PyObject *__pyx_v_first_kernings = 0;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_get_kerning", 0);
+
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":757
+ *     cdef int _get_kerning(self, int previous_char, int current_char) except? -1:
+ *         cdef dict first_kernings
+ *         if not self.kernings:             # <<<<<<<<<<<<<<
+ *             return 0
+ * 
+ */
+  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_self->kernings); if (unlikely(__pyx_t_1 < 0)) __PYX_ERR(1, 757, __pyx_L1_error)
+  __pyx_t_2 = ((!__pyx_t_1) != 0);
+  if (__pyx_t_2) {
+
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":758
+ *         cdef dict first_kernings
+ *         if not self.kernings:
+ *             return 0             # <<<<<<<<<<<<<<
+ * 
+ *         first_kernings = self.kernings.get(previous_char)
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":757
+ *     cdef int _get_kerning(self, int previous_char, int current_char) except? -1:
+ *         cdef dict first_kernings
+ *         if not self.kernings:             # <<<<<<<<<<<<<<
+ *             return 0
+ * 
+ */
+  }
+
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":760
+ *             return 0
+ * 
+ *         first_kernings = self.kernings.get(previous_char)             # <<<<<<<<<<<<<<
+ *         if first_kernings is None:
+ *             return 0
+ */
+  if (unlikely(__pyx_v_self->kernings == Py_None)) {
+    PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "get");
+    __PYX_ERR(1, 760, __pyx_L1_error)
+  }
+  __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_previous_char); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 760, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = __Pyx_PyDict_GetItemDefault(__pyx_v_self->kernings, __pyx_t_3, Py_None); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 760, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (!(likely(PyDict_CheckExact(__pyx_t_4))||((__pyx_t_4) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "dict", Py_TYPE(__pyx_t_4)->tp_name), 0))) __PYX_ERR(1, 760, __pyx_L1_error)
+  __pyx_v_first_kernings = ((PyObject*)__pyx_t_4);
+  __pyx_t_4 = 0;
+
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":761
+ * 
+ *         first_kernings = self.kernings.get(previous_char)
+ *         if first_kernings is None:             # <<<<<<<<<<<<<<
+ *             return 0
+ * 
+ */
+  __pyx_t_2 = (__pyx_v_first_kernings == ((PyObject*)Py_None));
+  __pyx_t_1 = (__pyx_t_2 != 0);
+  if (__pyx_t_1) {
+
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":762
+ *         first_kernings = self.kernings.get(previous_char)
+ *         if first_kernings is None:
+ *             return 0             # <<<<<<<<<<<<<<
+ * 
+ *         return first_kernings.get(current_char, 0)
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":761
+ * 
+ *         first_kernings = self.kernings.get(previous_char)
+ *         if first_kernings is None:             # <<<<<<<<<<<<<<
+ *             return 0
+ * 
+ */
+  }
+
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":764
+ *             return 0
+ * 
+ *         return first_kernings.get(current_char, 0)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef void render_text(self, SDL_Surface *surface, str text, int x, int y, bint use_kerning) except *:
+ */
+  if (unlikely(__pyx_v_first_kernings == Py_None)) {
+    PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "get");
+    __PYX_ERR(1, 764, __pyx_L1_error)
+  }
+  __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_current_char); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 764, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_3 = __Pyx_PyDict_GetItemDefault(__pyx_v_first_kernings, __pyx_t_4, __pyx_int_0); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 764, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_5 = __Pyx_PyInt_As_int(__pyx_t_3); if (unlikely((__pyx_t_5 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 764, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_r = __pyx_t_5;
+  goto __pyx_L0;
+
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":755
+ *         return True
+ * 
+ *     cdef int _get_kerning(self, int previous_char, int current_char) except? -1:             # <<<<<<<<<<<<<<
+ *         cdef dict first_kernings
+ *         if not self.kernings:
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("mpfmc.uix.bitmap_font.bitmap_font.BitmapFont._get_kerning", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_first_kernings);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":766
+ *         return first_kernings.get(current_char, 0)
+ * 
+ *     cdef void render_text(self, SDL_Surface *surface, str text, int x, int y, bint use_kerning) except *:             # <<<<<<<<<<<<<<
+ *         """Blit the text from the font atlas into the surface."""
+ *         cdef SDL_Rect source_rect
+ */
+
+static void __pyx_f_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_render_text(struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont *__pyx_v_self, struct SDL_Surface *__pyx_v_surface, PyObject *__pyx_v_text, int __pyx_v_x, int __pyx_v_y, int __pyx_v_use_kerning) {
+  struct SDL_Rect __pyx_v_source_rect;
+  struct SDL_Rect __pyx_v_dest_rect;
+  struct __pyx_t_5mpfmc_3uix_11bitmap_font_11bitmap_font_GlyphInfo __pyx_v_glyph;
+  int __pyx_v_previous_char;
+  int __pyx_v_current_char;
+  Py_UCS4 __pyx_v_text_char;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  Py_ssize_t __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  void *__pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  Py_ssize_t __pyx_t_7;
+  int __pyx_t_8;
+  int __pyx_t_9;
+  struct SDL_Rect __pyx_t_10;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("render_text", 0);
+
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":771
+ *         cdef SDL_Rect dest_rect
+ *         cdef GlyphInfo glyph
+ *         cdef int previous_char = -1             # <<<<<<<<<<<<<<
+ *         cdef int current_char
+ *         cdef Py_UCS4 text_char
+ */
+  __pyx_v_previous_char = -1;
+
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":775
+ *         cdef Py_UCS4 text_char
+ * 
+ *         for text_char in text:             # <<<<<<<<<<<<<<
+ *             current_char = text_char
+ *             if self._get_glyph(current_char, &glyph):
+ */
+  if (unlikely(__pyx_v_text == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' is not iterable");
+    __PYX_ERR(1, 775, __pyx_L1_error)
+  }
+  __Pyx_INCREF(__pyx_v_text);
+  __pyx_t_1 = __pyx_v_text;
+  __pyx_t_6 = __Pyx_init_unicode_iteration(__pyx_t_1, (&__pyx_t_3), (&__pyx_t_4), (&__pyx_t_5)); if (unlikely(__pyx_t_6 == ((int)-1))) __PYX_ERR(1, 775, __pyx_L1_error)
+  for (__pyx_t_7 = 0; __pyx_t_7 < __pyx_t_3; __pyx_t_7++) {
+    __pyx_t_2 = __pyx_t_7;
+    __pyx_v_text_char = __Pyx_PyUnicode_READ(__pyx_t_5, __pyx_t_4, __pyx_t_2);
+
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":776
+ * 
+ *         for text_char in text:
+ *             current_char = text_char             # <<<<<<<<<<<<<<
+ *             if self._get_glyph(current_char, &glyph):
+ *                 if use_kerning:
+ */
+    __pyx_v_current_char = __pyx_v_text_char;
+
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":777
+ *         for text_char in text:
+ *             current_char = text_char
+ *             if self._get_glyph(current_char, &glyph):             # <<<<<<<<<<<<<<
+ *                 if use_kerning:
+ *                     x += self._get_kerning(previous_char, current_char)
+ */
+    __pyx_t_8 = ((struct __pyx_vtabstruct_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont *)__pyx_v_self->__pyx_vtab)->_get_glyph(__pyx_v_self, __pyx_v_current_char, (&__pyx_v_glyph)); if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 777, __pyx_L1_error)
+    __pyx_t_9 = (__pyx_t_8 != 0);
+    if (__pyx_t_9) {
+
+      /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":778
+ *             current_char = text_char
+ *             if self._get_glyph(current_char, &glyph):
+ *                 if use_kerning:             # <<<<<<<<<<<<<<
+ *                     x += self._get_kerning(previous_char, current_char)
+ * 
+ */
+      __pyx_t_9 = (__pyx_v_use_kerning != 0);
+      if (__pyx_t_9) {
+
+        /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":779
+ *             if self._get_glyph(current_char, &glyph):
+ *                 if use_kerning:
+ *                     x += self._get_kerning(previous_char, current_char)             # <<<<<<<<<<<<<<
+ * 
+ *                 source_rect = glyph.rect
+ */
+        __pyx_t_6 = ((struct __pyx_vtabstruct_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont *)__pyx_v_self->__pyx_vtab)->_get_kerning(__pyx_v_self, __pyx_v_previous_char, __pyx_v_current_char); if (unlikely(__pyx_t_6 == ((int)-1) && PyErr_Occurred())) __PYX_ERR(1, 779, __pyx_L1_error)
+        __pyx_v_x = (__pyx_v_x + __pyx_t_6);
+
+        /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":778
+ *             current_char = text_char
+ *             if self._get_glyph(current_char, &glyph):
+ *                 if use_kerning:             # <<<<<<<<<<<<<<
+ *                     x += self._get_kerning(previous_char, current_char)
+ * 
+ */
+      }
+
+      /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":781
+ *                     x += self._get_kerning(previous_char, current_char)
+ * 
+ *                 source_rect = glyph.rect             # <<<<<<<<<<<<<<
+ *                 dest_rect.x = x + glyph.xoffset
+ *                 dest_rect.y = y + glyph.yoffset
+ */
+      __pyx_t_10 = __pyx_v_glyph.rect;
+      __pyx_v_source_rect = __pyx_t_10;
+
+      /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":782
+ * 
+ *                 source_rect = glyph.rect
+ *                 dest_rect.x = x + glyph.xoffset             # <<<<<<<<<<<<<<
+ *                 dest_rect.y = y + glyph.yoffset
+ *                 SDL_BlitSurface(self.image, &source_rect, surface, &dest_rect)
+ */
+      __pyx_v_dest_rect.x = (__pyx_v_x + __pyx_v_glyph.xoffset);
+
+      /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":783
+ *                 source_rect = glyph.rect
+ *                 dest_rect.x = x + glyph.xoffset
+ *                 dest_rect.y = y + glyph.yoffset             # <<<<<<<<<<<<<<
+ *                 SDL_BlitSurface(self.image, &source_rect, surface, &dest_rect)
+ *                 x += glyph.xadvance
+ */
+      __pyx_v_dest_rect.y = (__pyx_v_y + __pyx_v_glyph.yoffset);
+
+      /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":784
+ *                 dest_rect.x = x + glyph.xoffset
+ *                 dest_rect.y = y + glyph.yoffset
+ *                 SDL_BlitSurface(self.image, &source_rect, surface, &dest_rect)             # <<<<<<<<<<<<<<
+ *                 x += glyph.xadvance
+ * 
+ */
+      (void)(SDL_BlitSurface(__pyx_v_self->image, (&__pyx_v_source_rect), __pyx_v_surface, (&__pyx_v_dest_rect)));
+
+      /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":785
+ *                 dest_rect.y = y + glyph.yoffset
+ *                 SDL_BlitSurface(self.image, &source_rect, surface, &dest_rect)
+ *                 x += glyph.xadvance             # <<<<<<<<<<<<<<
+ * 
+ *             previous_char = current_char
+ */
+      __pyx_v_x = (__pyx_v_x + __pyx_v_glyph.xadvance);
+
+      /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":777
+ *         for text_char in text:
+ *             current_char = text_char
+ *             if self._get_glyph(current_char, &glyph):             # <<<<<<<<<<<<<<
+ *                 if use_kerning:
+ *                     x += self._get_kerning(previous_char, current_char)
+ */
+    }
+
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":787
+ *                 x += glyph.xadvance
+ * 
+ *             previous_char = current_char             # <<<<<<<<<<<<<<
+ * 
+ *     def _load_descriptor_list(self, list descriptor_list):
+ */
+    __pyx_v_previous_char = __pyx_v_current_char;
+  }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":766
+ *         return first_kernings.get(current_char, 0)
+ * 
+ *     cdef void render_text(self, SDL_Surface *surface, str text, int x, int y, bint use_kerning) except *:             # <<<<<<<<<<<<<<
+ *         """Blit the text from the font atlas into the surface."""
+ *         cdef SDL_Rect source_rect
+ */
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("mpfmc.uix.bitmap_font.bitmap_font.BitmapFont.render_text", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+}
+
+/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":789
+ *             previous_char = current_char
+ * 
+ *     def _load_descriptor_list(self, list descriptor_list):             # <<<<<<<<<<<<<<
+ *         """Load the descriptor from the supplied list."""
+ *         cdef int x = 0
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_13_load_descriptor_list(PyObject *__pyx_v_self, PyObject *__pyx_v_descriptor_list); /*proto*/
+static char __pyx_doc_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_12_load_descriptor_list[] = "BitmapFont._load_descriptor_list(self, list descriptor_list)\nLoad the descriptor from the supplied list.";
+static PyObject *__pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_13_load_descriptor_list(PyObject *__pyx_v_self, PyObject *__pyx_v_descriptor_list) {
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("_load_descriptor_list (wrapper)", 0);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_descriptor_list), (&PyList_Type), 1, "descriptor_list", 1))) __PYX_ERR(1, 789, __pyx_L1_error)
+  __pyx_r = __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_12_load_descriptor_list(((struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont *)__pyx_v_self), ((PyObject*)__pyx_v_descriptor_list));
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_12_load_descriptor_list(struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont *__pyx_v_self, PyObject *__pyx_v_descriptor_list) {
+  int __pyx_v_x;
+  int __pyx_v_y;
+  int __pyx_v_row_height;
+  int __pyx_v_char_width;
+  int __pyx_v_char_id;
+  PyObject *__pyx_v_row = NULL;
+  PyObject *__pyx_v_text_char = NULL;
+  struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFontCharacter *__pyx_v_character = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  Py_ssize_t __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  Py_ssize_t __pyx_t_4;
+  PyObject *(*__pyx_t_5)(PyObject *);
+  PyObject *__pyx_t_6 = NULL;
+  long __pyx_t_7;
+  int __pyx_t_8;
+  int __pyx_t_9;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_load_descriptor_list", 0);
+
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":791
+ *     def _load_descriptor_list(self, list descriptor_list):
+ *         """Load the descriptor from the supplied list."""
  *         cdef int x = 0             # <<<<<<<<<<<<<<
  *         cdef int y = 0
  *         cdef int row_height = int(self.scale_h / len(descriptor_list))
  */
   __pyx_v_x = 0;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":706
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":792
  *         """Load the descriptor from the supplied list."""
  *         cdef int x = 0
  *         cdef int y = 0             # <<<<<<<<<<<<<<
@@ -3088,7 +4135,7 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
  */
   __pyx_v_y = 0;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":707
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":793
  *         cdef int x = 0
  *         cdef int y = 0
  *         cdef int row_height = int(self.scale_h / len(descriptor_list))             # <<<<<<<<<<<<<<
@@ -3097,16 +4144,16 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
  */
   if (unlikely(__pyx_v_descriptor_list == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
-    __PYX_ERR(1, 707, __pyx_L1_error)
+    __PYX_ERR(1, 793, __pyx_L1_error)
   }
-  __pyx_t_1 = PyList_GET_SIZE(__pyx_v_descriptor_list); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(1, 707, __pyx_L1_error)
+  __pyx_t_1 = PyList_GET_SIZE(__pyx_v_descriptor_list); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(1, 793, __pyx_L1_error)
   if (unlikely(__pyx_t_1 == 0)) {
     PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-    __PYX_ERR(1, 707, __pyx_L1_error)
+    __PYX_ERR(1, 793, __pyx_L1_error)
   }
   __pyx_v_row_height = ((int)(((double)__pyx_v_self->scale_h) / ((double)__pyx_t_1)));
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":710
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":796
  *         cdef int char_width
  *         cdef int char_id
  *         self.line_height = row_height             # <<<<<<<<<<<<<<
@@ -3115,7 +4162,7 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
  */
   __pyx_v_self->line_height = __pyx_v_row_height;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":711
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":797
  *         cdef int char_id
  *         self.line_height = row_height
  *         self.base = row_height             # <<<<<<<<<<<<<<
@@ -3124,7 +4171,7 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
  */
   __pyx_v_self->base = __pyx_v_row_height;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":714
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":800
  * 
  *         # Loop over all the rows in the descriptor list
  *         for row in descriptor_list:             # <<<<<<<<<<<<<<
@@ -3133,35 +4180,35 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
  */
   if (unlikely(__pyx_v_descriptor_list == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
-    __PYX_ERR(1, 714, __pyx_L1_error)
+    __PYX_ERR(1, 800, __pyx_L1_error)
   }
   __pyx_t_2 = __pyx_v_descriptor_list; __Pyx_INCREF(__pyx_t_2); __pyx_t_1 = 0;
   for (;;) {
     if (__pyx_t_1 >= PyList_GET_SIZE(__pyx_t_2)) break;
     #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-    __pyx_t_3 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_1); __Pyx_INCREF(__pyx_t_3); __pyx_t_1++; if (unlikely(0 < 0)) __PYX_ERR(1, 714, __pyx_L1_error)
+    __pyx_t_3 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_1); __Pyx_INCREF(__pyx_t_3); __pyx_t_1++; if (unlikely(0 < 0)) __PYX_ERR(1, 800, __pyx_L1_error)
     #else
-    __pyx_t_3 = PySequence_ITEM(__pyx_t_2, __pyx_t_1); __pyx_t_1++; if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 714, __pyx_L1_error)
+    __pyx_t_3 = PySequence_ITEM(__pyx_t_2, __pyx_t_1); __pyx_t_1++; if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 800, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     #endif
     __Pyx_XDECREF_SET(__pyx_v_row, __pyx_t_3);
     __pyx_t_3 = 0;
 
-    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":715
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":801
  *         # Loop over all the rows in the descriptor list
  *         for row in descriptor_list:
  *             char_width = int(self.scale_w / len(row))             # <<<<<<<<<<<<<<
  *             x = 0
  * 
  */
-    __pyx_t_4 = PyObject_Length(__pyx_v_row); if (unlikely(__pyx_t_4 == ((Py_ssize_t)-1))) __PYX_ERR(1, 715, __pyx_L1_error)
+    __pyx_t_4 = PyObject_Length(__pyx_v_row); if (unlikely(__pyx_t_4 == ((Py_ssize_t)-1))) __PYX_ERR(1, 801, __pyx_L1_error)
     if (unlikely(__pyx_t_4 == 0)) {
       PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-      __PYX_ERR(1, 715, __pyx_L1_error)
+      __PYX_ERR(1, 801, __pyx_L1_error)
     }
     __pyx_v_char_width = ((int)(((double)__pyx_v_self->scale_w) / ((double)__pyx_t_4)));
 
-    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":716
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":802
  *         for row in descriptor_list:
  *             char_width = int(self.scale_w / len(row))
  *             x = 0             # <<<<<<<<<<<<<<
@@ -3170,7 +4217,7 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
  */
     __pyx_v_x = 0;
 
-    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":719
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":805
  * 
  *             # Loop over all characters in the row
  *             for text_char in row:             # <<<<<<<<<<<<<<
@@ -3181,26 +4228,26 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
       __pyx_t_3 = __pyx_v_row; __Pyx_INCREF(__pyx_t_3); __pyx_t_4 = 0;
       __pyx_t_5 = NULL;
     } else {
-      __pyx_t_4 = -1; __pyx_t_3 = PyObject_GetIter(__pyx_v_row); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 719, __pyx_L1_error)
+      __pyx_t_4 = -1; __pyx_t_3 = PyObject_GetIter(__pyx_v_row); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 805, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_5 = Py_TYPE(__pyx_t_3)->tp_iternext; if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 719, __pyx_L1_error)
+      __pyx_t_5 = Py_TYPE(__pyx_t_3)->tp_iternext; if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 805, __pyx_L1_error)
     }
     for (;;) {
       if (likely(!__pyx_t_5)) {
         if (likely(PyList_CheckExact(__pyx_t_3))) {
           if (__pyx_t_4 >= PyList_GET_SIZE(__pyx_t_3)) break;
           #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-          __pyx_t_6 = PyList_GET_ITEM(__pyx_t_3, __pyx_t_4); __Pyx_INCREF(__pyx_t_6); __pyx_t_4++; if (unlikely(0 < 0)) __PYX_ERR(1, 719, __pyx_L1_error)
+          __pyx_t_6 = PyList_GET_ITEM(__pyx_t_3, __pyx_t_4); __Pyx_INCREF(__pyx_t_6); __pyx_t_4++; if (unlikely(0 < 0)) __PYX_ERR(1, 805, __pyx_L1_error)
           #else
-          __pyx_t_6 = PySequence_ITEM(__pyx_t_3, __pyx_t_4); __pyx_t_4++; if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 719, __pyx_L1_error)
+          __pyx_t_6 = PySequence_ITEM(__pyx_t_3, __pyx_t_4); __pyx_t_4++; if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 805, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_6);
           #endif
         } else {
           if (__pyx_t_4 >= PyTuple_GET_SIZE(__pyx_t_3)) break;
           #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-          __pyx_t_6 = PyTuple_GET_ITEM(__pyx_t_3, __pyx_t_4); __Pyx_INCREF(__pyx_t_6); __pyx_t_4++; if (unlikely(0 < 0)) __PYX_ERR(1, 719, __pyx_L1_error)
+          __pyx_t_6 = PyTuple_GET_ITEM(__pyx_t_3, __pyx_t_4); __Pyx_INCREF(__pyx_t_6); __pyx_t_4++; if (unlikely(0 < 0)) __PYX_ERR(1, 805, __pyx_L1_error)
           #else
-          __pyx_t_6 = PySequence_ITEM(__pyx_t_3, __pyx_t_4); __pyx_t_4++; if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 719, __pyx_L1_error)
+          __pyx_t_6 = PySequence_ITEM(__pyx_t_3, __pyx_t_4); __pyx_t_4++; if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 805, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_6);
           #endif
         }
@@ -3210,7 +4257,7 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
           PyObject* exc_type = PyErr_Occurred();
           if (exc_type) {
             if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-            else __PYX_ERR(1, 719, __pyx_L1_error)
+            else __PYX_ERR(1, 805, __pyx_L1_error)
           }
           break;
         }
@@ -3219,47 +4266,47 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
       __Pyx_XDECREF_SET(__pyx_v_text_char, __pyx_t_6);
       __pyx_t_6 = 0;
 
-      /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":720
+      /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":806
  *             # Loop over all characters in the row
  *             for text_char in row:
  *                 char_id = ord(text_char)             # <<<<<<<<<<<<<<
  * 
  *                 # Do not add duplicate character definitions (only use the first instance)
  */
-      __pyx_t_7 = __Pyx_PyObject_Ord(__pyx_v_text_char); if (unlikely(__pyx_t_7 == ((long)(long)(Py_UCS4)-1))) __PYX_ERR(1, 720, __pyx_L1_error)
+      __pyx_t_7 = __Pyx_PyObject_Ord(__pyx_v_text_char); if (unlikely(__pyx_t_7 == ((long)(long)(Py_UCS4)-1))) __PYX_ERR(1, 806, __pyx_L1_error)
       __pyx_v_char_id = __pyx_t_7;
 
-      /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":723
+      /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":809
  * 
  *                 # Do not add duplicate character definitions (only use the first instance)
  *                 if char_id not in self.characters:             # <<<<<<<<<<<<<<
  * 
  *                     # Create character definition
  */
-      __pyx_t_6 = __Pyx_PyInt_From_int(__pyx_v_char_id); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 723, __pyx_L1_error)
+      __pyx_t_6 = __Pyx_PyInt_From_int(__pyx_v_char_id); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 809, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_6);
       if (unlikely(__pyx_v_self->characters == Py_None)) {
         PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
-        __PYX_ERR(1, 723, __pyx_L1_error)
+        __PYX_ERR(1, 809, __pyx_L1_error)
       }
-      __pyx_t_8 = (__Pyx_PyDict_ContainsTF(__pyx_t_6, __pyx_v_self->characters, Py_NE)); if (unlikely(__pyx_t_8 < 0)) __PYX_ERR(1, 723, __pyx_L1_error)
+      __pyx_t_8 = (__Pyx_PyDict_ContainsTF(__pyx_t_6, __pyx_v_self->characters, Py_NE)); if (unlikely(__pyx_t_8 < 0)) __PYX_ERR(1, 809, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
       __pyx_t_9 = (__pyx_t_8 != 0);
       if (__pyx_t_9) {
 
-        /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":726
+        /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":812
  * 
  *                     # Create character definition
  *                     character = BitmapFontCharacter()             # <<<<<<<<<<<<<<
  *                     character.id = char_id
  *                     character.rect.x = x
  */
-        __pyx_t_6 = __Pyx_PyObject_CallNoArg(((PyObject *)__pyx_ptype_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFontCharacter)); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 726, __pyx_L1_error)
+        __pyx_t_6 = __Pyx_PyObject_CallNoArg(((PyObject *)__pyx_ptype_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFontCharacter)); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 812, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_6);
         __Pyx_XDECREF_SET(__pyx_v_character, ((struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFontCharacter *)__pyx_t_6));
         __pyx_t_6 = 0;
 
-        /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":727
+        /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":813
  *                     # Create character definition
  *                     character = BitmapFontCharacter()
  *                     character.id = char_id             # <<<<<<<<<<<<<<
@@ -3268,7 +4315,7 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
  */
         __pyx_v_character->id = __pyx_v_char_id;
 
-        /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":728
+        /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":814
  *                     character = BitmapFontCharacter()
  *                     character.id = char_id
  *                     character.rect.x = x             # <<<<<<<<<<<<<<
@@ -3277,7 +4324,7 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
  */
         __pyx_v_character->rect.x = __pyx_v_x;
 
-        /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":729
+        /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":815
  *                     character.id = char_id
  *                     character.rect.x = x
  *                     character.rect.y = y             # <<<<<<<<<<<<<<
@@ -3286,7 +4333,7 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
  */
         __pyx_v_character->rect.y = __pyx_v_y;
 
-        /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":730
+        /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":816
  *                     character.rect.x = x
  *                     character.rect.y = y
  *                     character.rect.w = char_width             # <<<<<<<<<<<<<<
@@ -3295,7 +4342,7 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
  */
         __pyx_v_character->rect.w = __pyx_v_char_width;
 
-        /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":731
+        /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":817
  *                     character.rect.y = y
  *                     character.rect.w = char_width
  *                     character.rect.h = row_height             # <<<<<<<<<<<<<<
@@ -3304,7 +4351,7 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
  */
         __pyx_v_character->rect.h = __pyx_v_row_height;
 
-        /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":732
+        /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":818
  *                     character.rect.w = char_width
  *                     character.rect.h = row_height
  *                     character.xadvance = char_width             # <<<<<<<<<<<<<<
@@ -3313,7 +4360,7 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
  */
         __pyx_v_character->xadvance = __pyx_v_char_width;
 
-        /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":734
+        /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":820
  *                     character.xadvance = char_width
  * 
  *                     self.characters[character.id] = character             # <<<<<<<<<<<<<<
@@ -3322,14 +4369,14 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
  */
         if (unlikely(__pyx_v_self->characters == Py_None)) {
           PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-          __PYX_ERR(1, 734, __pyx_L1_error)
+          __PYX_ERR(1, 820, __pyx_L1_error)
         }
-        __pyx_t_6 = __Pyx_PyInt_From_int(__pyx_v_character->id); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 734, __pyx_L1_error)
+        __pyx_t_6 = __Pyx_PyInt_From_int(__pyx_v_character->id); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 820, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_6);
-        if (unlikely(PyDict_SetItem(__pyx_v_self->characters, __pyx_t_6, ((PyObject *)__pyx_v_character)) < 0)) __PYX_ERR(1, 734, __pyx_L1_error)
+        if (unlikely(PyDict_SetItem(__pyx_v_self->characters, __pyx_t_6, ((PyObject *)__pyx_v_character)) < 0)) __PYX_ERR(1, 820, __pyx_L1_error)
         __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
 
-        /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":735
+        /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":821
  * 
  *                     self.characters[character.id] = character
  *                     x += char_width             # <<<<<<<<<<<<<<
@@ -3338,7 +4385,7 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
  */
         __pyx_v_x = (__pyx_v_x + __pyx_v_char_width);
 
-        /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":723
+        /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":809
  * 
  *                 # Do not add duplicate character definitions (only use the first instance)
  *                 if char_id not in self.characters:             # <<<<<<<<<<<<<<
@@ -3347,7 +4394,7 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
  */
       }
 
-      /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":719
+      /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":805
  * 
  *             # Loop over all characters in the row
  *             for text_char in row:             # <<<<<<<<<<<<<<
@@ -3357,7 +4404,7 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
     }
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":737
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":823
  *                     x += char_width
  * 
  *             y += row_height             # <<<<<<<<<<<<<<
@@ -3366,7 +4413,7 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
  */
     __pyx_v_y = (__pyx_v_y + __pyx_v_row_height);
 
-    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":714
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":800
  * 
  *         # Loop over all the rows in the descriptor list
  *         for row in descriptor_list:             # <<<<<<<<<<<<<<
@@ -3376,8 +4423,8 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
   }
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":703
- *         return self.kernings
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":789
+ *             previous_char = current_char
  * 
  *     def _load_descriptor_list(self, list descriptor_list):             # <<<<<<<<<<<<<<
  *         """Load the descriptor from the supplied list."""
@@ -3402,7 +4449,7 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
   return __pyx_r;
 }
 
-/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":739
+/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":825
  *             y += row_height
  * 
  *     def _load_descriptor_file(self, str descriptor_file):             # <<<<<<<<<<<<<<
@@ -3414,10 +4461,13 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
 static PyObject *__pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_15_load_descriptor_file(PyObject *__pyx_v_self, PyObject *__pyx_v_descriptor_file); /*proto*/
 static char __pyx_doc_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_14_load_descriptor_file[] = "BitmapFont._load_descriptor_file(self, unicode descriptor_file)\nLoad the descriptor from the specified file.  Both XML and text\n        formats are supported (not binary currently).\n\n        The standard bitmap font descriptor file format can be found at:\n        http://www.angelcode.com/products/bmfont/doc/file_format.html\n        ";
 static PyObject *__pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_15_load_descriptor_file(PyObject *__pyx_v_self, PyObject *__pyx_v_descriptor_file) {
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("_load_descriptor_file (wrapper)", 0);
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_descriptor_file), (&PyUnicode_Type), 1, "descriptor_file", 1))) __PYX_ERR(1, 739, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_descriptor_file), (&PyUnicode_Type), 1, "descriptor_file", 1))) __PYX_ERR(1, 825, __pyx_L1_error)
   __pyx_r = __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_14_load_descriptor_file(((struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont *)__pyx_v_self), ((PyObject*)__pyx_v_descriptor_file));
 
   /* function exit code */
@@ -3456,18 +4506,21 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
   PyObject *__pyx_t_14 = NULL;
   PyObject *__pyx_t_15 = NULL;
   PyObject *__pyx_t_16 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("_load_descriptor_file", 0);
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":750
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":836
  *         cdef int second
  * 
  *         if not path.isfile(descriptor_file):             # <<<<<<<<<<<<<<
  *             raise BitmapFontException('Could not locate the bitmap font descriptor file ' +
  *                                       descriptor_file)
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_path); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 750, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_path); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 836, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_isfile); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 750, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_isfile); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 836, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_t_2 = NULL;
@@ -3482,32 +4535,32 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
   }
   __pyx_t_1 = (__pyx_t_2) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_2, __pyx_v_descriptor_file) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_v_descriptor_file);
   __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 750, __pyx_L1_error)
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 836, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_4 < 0)) __PYX_ERR(1, 750, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_4 < 0)) __PYX_ERR(1, 836, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_t_5 = ((!__pyx_t_4) != 0);
   if (unlikely(__pyx_t_5)) {
 
-    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":751
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":837
  * 
  *         if not path.isfile(descriptor_file):
  *             raise BitmapFontException('Could not locate the bitmap font descriptor file ' +             # <<<<<<<<<<<<<<
  *                                       descriptor_file)
  * 
  */
-    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_BitmapFontException); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 751, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_BitmapFontException); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 837, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
 
-    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":752
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":838
  *         if not path.isfile(descriptor_file):
  *             raise BitmapFontException('Could not locate the bitmap font descriptor file ' +
  *                                       descriptor_file)             # <<<<<<<<<<<<<<
  * 
  *         # Attempt to parse the file as an XML file
  */
-    __pyx_t_2 = __Pyx_PyUnicode_ConcatSafe(__pyx_kp_u_Could_not_locate_the_bitmap_font, __pyx_v_descriptor_file); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 751, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyUnicode_ConcatSafe(__pyx_kp_u_Could_not_locate_the_bitmap_font, __pyx_v_descriptor_file); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 837, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_t_6 = NULL;
     if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
@@ -3522,14 +4575,14 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
     __pyx_t_1 = (__pyx_t_6) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_6, __pyx_t_2) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_2);
     __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 751, __pyx_L1_error)
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 837, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_Raise(__pyx_t_1, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __PYX_ERR(1, 751, __pyx_L1_error)
+    __PYX_ERR(1, 837, __pyx_L1_error)
 
-    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":750
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":836
  *         cdef int second
  * 
  *         if not path.isfile(descriptor_file):             # <<<<<<<<<<<<<<
@@ -3538,7 +4591,7 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
  */
   }
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":755
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":841
  * 
  *         # Attempt to parse the file as an XML file
  *         try:             # <<<<<<<<<<<<<<
@@ -3554,33 +4607,33 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
     __Pyx_XGOTREF(__pyx_t_9);
     /*try:*/ {
 
-      /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":756
+      /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":842
  *         # Attempt to parse the file as an XML file
  *         try:
  *             xml_tree = ElementTree(file=descriptor_file)             # <<<<<<<<<<<<<<
  *             self._load_descriptor_xml(xml_tree)
  *         except ParseError:
  */
-      __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_ElementTree); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 756, __pyx_L4_error)
+      __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_ElementTree); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 842, __pyx_L4_error)
       __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_3 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 756, __pyx_L4_error)
+      __pyx_t_3 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 842, __pyx_L4_error)
       __Pyx_GOTREF(__pyx_t_3);
-      if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_file, __pyx_v_descriptor_file) < 0) __PYX_ERR(1, 756, __pyx_L4_error)
-      __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_empty_tuple, __pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 756, __pyx_L4_error)
+      if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_file, __pyx_v_descriptor_file) < 0) __PYX_ERR(1, 842, __pyx_L4_error)
+      __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_empty_tuple, __pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 842, __pyx_L4_error)
       __Pyx_GOTREF(__pyx_t_2);
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       __pyx_v_xml_tree = __pyx_t_2;
       __pyx_t_2 = 0;
 
-      /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":757
+      /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":843
  *         try:
  *             xml_tree = ElementTree(file=descriptor_file)
  *             self._load_descriptor_xml(xml_tree)             # <<<<<<<<<<<<<<
  *         except ParseError:
  *             pass
  */
-      __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_load_descriptor_xml); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 757, __pyx_L4_error)
+      __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_load_descriptor_xml); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 843, __pyx_L4_error)
       __Pyx_GOTREF(__pyx_t_3);
       __pyx_t_1 = NULL;
       if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
@@ -3594,12 +4647,12 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
       }
       __pyx_t_2 = (__pyx_t_1) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_1, __pyx_v_xml_tree) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_v_xml_tree);
       __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-      if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 757, __pyx_L4_error)
+      if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 843, __pyx_L4_error)
       __Pyx_GOTREF(__pyx_t_2);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-      /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":755
+      /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":841
  * 
  *         # Attempt to parse the file as an XML file
  *         try:             # <<<<<<<<<<<<<<
@@ -3617,7 +4670,7 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
     __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
 
-    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":758
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":844
  *             xml_tree = ElementTree(file=descriptor_file)
  *             self._load_descriptor_xml(xml_tree)
  *         except ParseError:             # <<<<<<<<<<<<<<
@@ -3625,7 +4678,7 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
  * 
  */
     __Pyx_ErrFetch(&__pyx_t_2, &__pyx_t_3, &__pyx_t_1);
-    __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_ParseError); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 758, __pyx_L6_except_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_ParseError); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 844, __pyx_L6_except_error)
     __Pyx_GOTREF(__pyx_t_6);
     __pyx_t_10 = __Pyx_PyErr_GivenExceptionMatches(__pyx_t_2, __pyx_t_6);
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
@@ -3638,7 +4691,7 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
     goto __pyx_L6_except_error;
     __pyx_L6_except_error:;
 
-    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":755
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":841
  * 
  *         # Attempt to parse the file as an XML file
  *         try:             # <<<<<<<<<<<<<<
@@ -3658,7 +4711,7 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
     __pyx_L9_try_end:;
   }
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":764
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":850
  * 
  *         # Open the descriptor file
  *         with open(descriptor_file) as text_file:             # <<<<<<<<<<<<<<
@@ -3666,11 +4719,11 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
  *             # Loop over all the rows in the descriptor file
  */
   /*with:*/ {
-    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_builtin_open, __pyx_v_descriptor_file); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 764, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_builtin_open, __pyx_v_descriptor_file); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 850, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_9 = __Pyx_PyObject_LookupSpecial(__pyx_t_1, __pyx_n_s_exit); if (unlikely(!__pyx_t_9)) __PYX_ERR(1, 764, __pyx_L1_error)
+    __pyx_t_9 = __Pyx_PyObject_LookupSpecial(__pyx_t_1, __pyx_n_s_exit); if (unlikely(!__pyx_t_9)) __PYX_ERR(1, 850, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_9);
-    __pyx_t_2 = __Pyx_PyObject_LookupSpecial(__pyx_t_1, __pyx_n_s_enter); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 764, __pyx_L10_error)
+    __pyx_t_2 = __Pyx_PyObject_LookupSpecial(__pyx_t_1, __pyx_n_s_enter); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 850, __pyx_L10_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_t_6 = NULL;
     if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
@@ -3684,7 +4737,7 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
     }
     __pyx_t_3 = (__pyx_t_6) ? __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_6) : __Pyx_PyObject_CallNoArg(__pyx_t_2);
     __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-    if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 764, __pyx_L10_error)
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 850, __pyx_L10_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __pyx_t_2 = __pyx_t_3;
@@ -3702,7 +4755,7 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
           __pyx_v_text_file = __pyx_t_2;
           __pyx_t_2 = 0;
 
-          /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":767
+          /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":853
  * 
  *             # Loop over all the rows in the descriptor file
  *             for line in text_file:             # <<<<<<<<<<<<<<
@@ -3713,26 +4766,26 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
             __pyx_t_2 = __pyx_v_text_file; __Pyx_INCREF(__pyx_t_2); __pyx_t_12 = 0;
             __pyx_t_13 = NULL;
           } else {
-            __pyx_t_12 = -1; __pyx_t_2 = PyObject_GetIter(__pyx_v_text_file); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 767, __pyx_L14_error)
+            __pyx_t_12 = -1; __pyx_t_2 = PyObject_GetIter(__pyx_v_text_file); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 853, __pyx_L14_error)
             __Pyx_GOTREF(__pyx_t_2);
-            __pyx_t_13 = Py_TYPE(__pyx_t_2)->tp_iternext; if (unlikely(!__pyx_t_13)) __PYX_ERR(1, 767, __pyx_L14_error)
+            __pyx_t_13 = Py_TYPE(__pyx_t_2)->tp_iternext; if (unlikely(!__pyx_t_13)) __PYX_ERR(1, 853, __pyx_L14_error)
           }
           for (;;) {
             if (likely(!__pyx_t_13)) {
               if (likely(PyList_CheckExact(__pyx_t_2))) {
                 if (__pyx_t_12 >= PyList_GET_SIZE(__pyx_t_2)) break;
                 #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-                __pyx_t_1 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_12); __Pyx_INCREF(__pyx_t_1); __pyx_t_12++; if (unlikely(0 < 0)) __PYX_ERR(1, 767, __pyx_L14_error)
+                __pyx_t_1 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_12); __Pyx_INCREF(__pyx_t_1); __pyx_t_12++; if (unlikely(0 < 0)) __PYX_ERR(1, 853, __pyx_L14_error)
                 #else
-                __pyx_t_1 = PySequence_ITEM(__pyx_t_2, __pyx_t_12); __pyx_t_12++; if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 767, __pyx_L14_error)
+                __pyx_t_1 = PySequence_ITEM(__pyx_t_2, __pyx_t_12); __pyx_t_12++; if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 853, __pyx_L14_error)
                 __Pyx_GOTREF(__pyx_t_1);
                 #endif
               } else {
                 if (__pyx_t_12 >= PyTuple_GET_SIZE(__pyx_t_2)) break;
                 #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-                __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_2, __pyx_t_12); __Pyx_INCREF(__pyx_t_1); __pyx_t_12++; if (unlikely(0 < 0)) __PYX_ERR(1, 767, __pyx_L14_error)
+                __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_2, __pyx_t_12); __Pyx_INCREF(__pyx_t_1); __pyx_t_12++; if (unlikely(0 < 0)) __PYX_ERR(1, 853, __pyx_L14_error)
                 #else
-                __pyx_t_1 = PySequence_ITEM(__pyx_t_2, __pyx_t_12); __pyx_t_12++; if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 767, __pyx_L14_error)
+                __pyx_t_1 = PySequence_ITEM(__pyx_t_2, __pyx_t_12); __pyx_t_12++; if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 853, __pyx_L14_error)
                 __Pyx_GOTREF(__pyx_t_1);
                 #endif
               }
@@ -3742,7 +4795,7 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
                 PyObject* exc_type = PyErr_Occurred();
                 if (exc_type) {
                   if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-                  else __PYX_ERR(1, 767, __pyx_L14_error)
+                  else __PYX_ERR(1, 853, __pyx_L14_error)
                 }
                 break;
               }
@@ -3751,14 +4804,14 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
             __Pyx_XDECREF_SET(__pyx_v_line, __pyx_t_1);
             __pyx_t_1 = 0;
 
-            /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":768
+            /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":854
  *             # Loop over all the rows in the descriptor file
  *             for line in text_file:
  *                 if line.startswith("info"):             # <<<<<<<<<<<<<<
  *                     pass
  * 
  */
-            __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_line, __pyx_n_s_startswith); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 768, __pyx_L14_error)
+            __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_line, __pyx_n_s_startswith); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 854, __pyx_L14_error)
             __Pyx_GOTREF(__pyx_t_3);
             __pyx_t_6 = NULL;
             if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
@@ -3772,23 +4825,23 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
             }
             __pyx_t_1 = (__pyx_t_6) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_6, __pyx_n_u_info) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_n_u_info);
             __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-            if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 768, __pyx_L14_error)
+            if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 854, __pyx_L14_error)
             __Pyx_GOTREF(__pyx_t_1);
             __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-            __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_5 < 0)) __PYX_ERR(1, 768, __pyx_L14_error)
+            __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_5 < 0)) __PYX_ERR(1, 854, __pyx_L14_error)
             __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
             if (__pyx_t_5) {
               goto __pyx_L22;
             }
 
-            /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":771
+            /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":857
  *                     pass
  * 
  *                 elif line.startswith("common"):             # <<<<<<<<<<<<<<
  *                     m = re.search(r"lineHeight=([0-9]{1,5})", line, flags=re.IGNORECASE)
  *                     if m:
  */
-            __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_line, __pyx_n_s_startswith); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 771, __pyx_L14_error)
+            __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_line, __pyx_n_s_startswith); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 857, __pyx_L14_error)
             __Pyx_GOTREF(__pyx_t_3);
             __pyx_t_6 = NULL;
             if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
@@ -3802,26 +4855,26 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
             }
             __pyx_t_1 = (__pyx_t_6) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_6, __pyx_n_u_common) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_n_u_common);
             __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-            if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 771, __pyx_L14_error)
+            if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 857, __pyx_L14_error)
             __Pyx_GOTREF(__pyx_t_1);
             __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-            __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_5 < 0)) __PYX_ERR(1, 771, __pyx_L14_error)
+            __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_5 < 0)) __PYX_ERR(1, 857, __pyx_L14_error)
             __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
             if (__pyx_t_5) {
 
-              /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":772
+              /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":858
  * 
  *                 elif line.startswith("common"):
  *                     m = re.search(r"lineHeight=([0-9]{1,5})", line, flags=re.IGNORECASE)             # <<<<<<<<<<<<<<
  *                     if m:
  *                         self.line_height = int(m.group(1))
  */
-              __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_re); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 772, __pyx_L14_error)
+              __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_re); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 858, __pyx_L14_error)
               __Pyx_GOTREF(__pyx_t_1);
-              __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_search); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 772, __pyx_L14_error)
+              __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_search); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 858, __pyx_L14_error)
               __Pyx_GOTREF(__pyx_t_3);
               __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-              __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 772, __pyx_L14_error)
+              __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 858, __pyx_L14_error)
               __Pyx_GOTREF(__pyx_t_1);
               __Pyx_INCREF(__pyx_kp_u_lineHeight_0_9_1_5);
               __Pyx_GIVEREF(__pyx_kp_u_lineHeight_0_9_1_5);
@@ -3829,16 +4882,16 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
               __Pyx_INCREF(__pyx_v_line);
               __Pyx_GIVEREF(__pyx_v_line);
               PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_v_line);
-              __pyx_t_6 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 772, __pyx_L14_error)
+              __pyx_t_6 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 858, __pyx_L14_error)
               __Pyx_GOTREF(__pyx_t_6);
-              __Pyx_GetModuleGlobalName(__pyx_t_14, __pyx_n_s_re); if (unlikely(!__pyx_t_14)) __PYX_ERR(1, 772, __pyx_L14_error)
+              __Pyx_GetModuleGlobalName(__pyx_t_14, __pyx_n_s_re); if (unlikely(!__pyx_t_14)) __PYX_ERR(1, 858, __pyx_L14_error)
               __Pyx_GOTREF(__pyx_t_14);
-              __pyx_t_15 = __Pyx_PyObject_GetAttrStr(__pyx_t_14, __pyx_n_s_IGNORECASE); if (unlikely(!__pyx_t_15)) __PYX_ERR(1, 772, __pyx_L14_error)
+              __pyx_t_15 = __Pyx_PyObject_GetAttrStr(__pyx_t_14, __pyx_n_s_IGNORECASE); if (unlikely(!__pyx_t_15)) __PYX_ERR(1, 858, __pyx_L14_error)
               __Pyx_GOTREF(__pyx_t_15);
               __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
-              if (PyDict_SetItem(__pyx_t_6, __pyx_n_s_flags, __pyx_t_15) < 0) __PYX_ERR(1, 772, __pyx_L14_error)
+              if (PyDict_SetItem(__pyx_t_6, __pyx_n_s_flags, __pyx_t_15) < 0) __PYX_ERR(1, 858, __pyx_L14_error)
               __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
-              __pyx_t_15 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_1, __pyx_t_6); if (unlikely(!__pyx_t_15)) __PYX_ERR(1, 772, __pyx_L14_error)
+              __pyx_t_15 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_1, __pyx_t_6); if (unlikely(!__pyx_t_15)) __PYX_ERR(1, 858, __pyx_L14_error)
               __Pyx_GOTREF(__pyx_t_15);
               __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
               __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
@@ -3846,24 +4899,24 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
               __Pyx_XDECREF_SET(__pyx_v_m, __pyx_t_15);
               __pyx_t_15 = 0;
 
-              /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":773
+              /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":859
  *                 elif line.startswith("common"):
  *                     m = re.search(r"lineHeight=([0-9]{1,5})", line, flags=re.IGNORECASE)
  *                     if m:             # <<<<<<<<<<<<<<
  *                         self.line_height = int(m.group(1))
  *                     else:
  */
-              __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_v_m); if (unlikely(__pyx_t_5 < 0)) __PYX_ERR(1, 773, __pyx_L14_error)
+              __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_v_m); if (unlikely(__pyx_t_5 < 0)) __PYX_ERR(1, 859, __pyx_L14_error)
               if (likely(__pyx_t_5)) {
 
-                /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":774
+                /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":860
  *                     m = re.search(r"lineHeight=([0-9]{1,5})", line, flags=re.IGNORECASE)
  *                     if m:
  *                         self.line_height = int(m.group(1))             # <<<<<<<<<<<<<<
  *                     else:
  *                         raise BitmapFontException("Bitmap font descriptor file invalid format")
  */
-                __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_m, __pyx_n_s_group); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 774, __pyx_L14_error)
+                __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_m, __pyx_n_s_group); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 860, __pyx_L14_error)
                 __Pyx_GOTREF(__pyx_t_6);
                 __pyx_t_1 = NULL;
                 if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_6))) {
@@ -3877,17 +4930,17 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
                 }
                 __pyx_t_15 = (__pyx_t_1) ? __Pyx_PyObject_Call2Args(__pyx_t_6, __pyx_t_1, __pyx_int_1) : __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_int_1);
                 __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-                if (unlikely(!__pyx_t_15)) __PYX_ERR(1, 774, __pyx_L14_error)
+                if (unlikely(!__pyx_t_15)) __PYX_ERR(1, 860, __pyx_L14_error)
                 __Pyx_GOTREF(__pyx_t_15);
                 __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-                __pyx_t_6 = __Pyx_PyNumber_Int(__pyx_t_15); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 774, __pyx_L14_error)
+                __pyx_t_6 = __Pyx_PyNumber_Int(__pyx_t_15); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 860, __pyx_L14_error)
                 __Pyx_GOTREF(__pyx_t_6);
                 __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
-                __pyx_t_10 = __Pyx_PyInt_As_int(__pyx_t_6); if (unlikely((__pyx_t_10 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 774, __pyx_L14_error)
+                __pyx_t_10 = __Pyx_PyInt_As_int(__pyx_t_6); if (unlikely((__pyx_t_10 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 860, __pyx_L14_error)
                 __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
                 __pyx_v_self->line_height = __pyx_t_10;
 
-                /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":773
+                /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":859
  *                 elif line.startswith("common"):
  *                     m = re.search(r"lineHeight=([0-9]{1,5})", line, flags=re.IGNORECASE)
  *                     if m:             # <<<<<<<<<<<<<<
@@ -3897,7 +4950,7 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
                 goto __pyx_L23;
               }
 
-              /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":776
+              /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":862
  *                         self.line_height = int(m.group(1))
  *                     else:
  *                         raise BitmapFontException("Bitmap font descriptor file invalid format")             # <<<<<<<<<<<<<<
@@ -3905,7 +4958,7 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
  *                     m = re.search(r"base=([0-9]{1,5})", line, flags=re.IGNORECASE)
  */
               /*else*/ {
-                __Pyx_GetModuleGlobalName(__pyx_t_15, __pyx_n_s_BitmapFontException); if (unlikely(!__pyx_t_15)) __PYX_ERR(1, 776, __pyx_L14_error)
+                __Pyx_GetModuleGlobalName(__pyx_t_15, __pyx_n_s_BitmapFontException); if (unlikely(!__pyx_t_15)) __PYX_ERR(1, 862, __pyx_L14_error)
                 __Pyx_GOTREF(__pyx_t_15);
                 __pyx_t_1 = NULL;
                 if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_15))) {
@@ -3919,28 +4972,28 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
                 }
                 __pyx_t_6 = (__pyx_t_1) ? __Pyx_PyObject_Call2Args(__pyx_t_15, __pyx_t_1, __pyx_kp_u_Bitmap_font_descriptor_file_inva) : __Pyx_PyObject_CallOneArg(__pyx_t_15, __pyx_kp_u_Bitmap_font_descriptor_file_inva);
                 __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-                if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 776, __pyx_L14_error)
+                if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 862, __pyx_L14_error)
                 __Pyx_GOTREF(__pyx_t_6);
                 __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
                 __Pyx_Raise(__pyx_t_6, 0, 0, 0);
                 __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-                __PYX_ERR(1, 776, __pyx_L14_error)
+                __PYX_ERR(1, 862, __pyx_L14_error)
               }
               __pyx_L23:;
 
-              /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":778
+              /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":864
  *                         raise BitmapFontException("Bitmap font descriptor file invalid format")
  * 
  *                     m = re.search(r"base=([0-9]{1,5})", line, flags=re.IGNORECASE)             # <<<<<<<<<<<<<<
  *                     if m:
  *                         self.base = int(m.group(1))
  */
-              __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_re); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 778, __pyx_L14_error)
+              __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_re); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 864, __pyx_L14_error)
               __Pyx_GOTREF(__pyx_t_6);
-              __pyx_t_15 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_search); if (unlikely(!__pyx_t_15)) __PYX_ERR(1, 778, __pyx_L14_error)
+              __pyx_t_15 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_search); if (unlikely(!__pyx_t_15)) __PYX_ERR(1, 864, __pyx_L14_error)
               __Pyx_GOTREF(__pyx_t_15);
               __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-              __pyx_t_6 = PyTuple_New(2); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 778, __pyx_L14_error)
+              __pyx_t_6 = PyTuple_New(2); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 864, __pyx_L14_error)
               __Pyx_GOTREF(__pyx_t_6);
               __Pyx_INCREF(__pyx_kp_u_base_0_9_1_5);
               __Pyx_GIVEREF(__pyx_kp_u_base_0_9_1_5);
@@ -3948,16 +5001,16 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
               __Pyx_INCREF(__pyx_v_line);
               __Pyx_GIVEREF(__pyx_v_line);
               PyTuple_SET_ITEM(__pyx_t_6, 1, __pyx_v_line);
-              __pyx_t_1 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 778, __pyx_L14_error)
+              __pyx_t_1 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 864, __pyx_L14_error)
               __Pyx_GOTREF(__pyx_t_1);
-              __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_re); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 778, __pyx_L14_error)
+              __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_re); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 864, __pyx_L14_error)
               __Pyx_GOTREF(__pyx_t_3);
-              __pyx_t_14 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_IGNORECASE); if (unlikely(!__pyx_t_14)) __PYX_ERR(1, 778, __pyx_L14_error)
+              __pyx_t_14 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_IGNORECASE); if (unlikely(!__pyx_t_14)) __PYX_ERR(1, 864, __pyx_L14_error)
               __Pyx_GOTREF(__pyx_t_14);
               __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-              if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_flags, __pyx_t_14) < 0) __PYX_ERR(1, 778, __pyx_L14_error)
+              if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_flags, __pyx_t_14) < 0) __PYX_ERR(1, 864, __pyx_L14_error)
               __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
-              __pyx_t_14 = __Pyx_PyObject_Call(__pyx_t_15, __pyx_t_6, __pyx_t_1); if (unlikely(!__pyx_t_14)) __PYX_ERR(1, 778, __pyx_L14_error)
+              __pyx_t_14 = __Pyx_PyObject_Call(__pyx_t_15, __pyx_t_6, __pyx_t_1); if (unlikely(!__pyx_t_14)) __PYX_ERR(1, 864, __pyx_L14_error)
               __Pyx_GOTREF(__pyx_t_14);
               __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
               __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
@@ -3965,24 +5018,24 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
               __Pyx_DECREF_SET(__pyx_v_m, __pyx_t_14);
               __pyx_t_14 = 0;
 
-              /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":779
+              /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":865
  * 
  *                     m = re.search(r"base=([0-9]{1,5})", line, flags=re.IGNORECASE)
  *                     if m:             # <<<<<<<<<<<<<<
  *                         self.base = int(m.group(1))
  *                     else:
  */
-              __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_v_m); if (unlikely(__pyx_t_5 < 0)) __PYX_ERR(1, 779, __pyx_L14_error)
+              __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_v_m); if (unlikely(__pyx_t_5 < 0)) __PYX_ERR(1, 865, __pyx_L14_error)
               if (likely(__pyx_t_5)) {
 
-                /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":780
+                /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":866
  *                     m = re.search(r"base=([0-9]{1,5})", line, flags=re.IGNORECASE)
  *                     if m:
  *                         self.base = int(m.group(1))             # <<<<<<<<<<<<<<
  *                     else:
  *                         raise BitmapFontException("Bitmap font descriptor file invalid format")
  */
-                __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_m, __pyx_n_s_group); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 780, __pyx_L14_error)
+                __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_m, __pyx_n_s_group); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 866, __pyx_L14_error)
                 __Pyx_GOTREF(__pyx_t_1);
                 __pyx_t_6 = NULL;
                 if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
@@ -3996,17 +5049,17 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
                 }
                 __pyx_t_14 = (__pyx_t_6) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_6, __pyx_int_1) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_int_1);
                 __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-                if (unlikely(!__pyx_t_14)) __PYX_ERR(1, 780, __pyx_L14_error)
+                if (unlikely(!__pyx_t_14)) __PYX_ERR(1, 866, __pyx_L14_error)
                 __Pyx_GOTREF(__pyx_t_14);
                 __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-                __pyx_t_1 = __Pyx_PyNumber_Int(__pyx_t_14); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 780, __pyx_L14_error)
+                __pyx_t_1 = __Pyx_PyNumber_Int(__pyx_t_14); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 866, __pyx_L14_error)
                 __Pyx_GOTREF(__pyx_t_1);
                 __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
-                __pyx_t_10 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_10 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 780, __pyx_L14_error)
+                __pyx_t_10 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_10 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 866, __pyx_L14_error)
                 __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
                 __pyx_v_self->base = __pyx_t_10;
 
-                /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":779
+                /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":865
  * 
  *                     m = re.search(r"base=([0-9]{1,5})", line, flags=re.IGNORECASE)
  *                     if m:             # <<<<<<<<<<<<<<
@@ -4016,7 +5069,7 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
                 goto __pyx_L24;
               }
 
-              /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":782
+              /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":868
  *                         self.base = int(m.group(1))
  *                     else:
  *                         raise BitmapFontException("Bitmap font descriptor file invalid format")             # <<<<<<<<<<<<<<
@@ -4024,7 +5077,7 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
  *                 elif line.startswith("chars"):
  */
               /*else*/ {
-                __Pyx_GetModuleGlobalName(__pyx_t_14, __pyx_n_s_BitmapFontException); if (unlikely(!__pyx_t_14)) __PYX_ERR(1, 782, __pyx_L14_error)
+                __Pyx_GetModuleGlobalName(__pyx_t_14, __pyx_n_s_BitmapFontException); if (unlikely(!__pyx_t_14)) __PYX_ERR(1, 868, __pyx_L14_error)
                 __Pyx_GOTREF(__pyx_t_14);
                 __pyx_t_6 = NULL;
                 if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_14))) {
@@ -4038,16 +5091,16 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
                 }
                 __pyx_t_1 = (__pyx_t_6) ? __Pyx_PyObject_Call2Args(__pyx_t_14, __pyx_t_6, __pyx_kp_u_Bitmap_font_descriptor_file_inva) : __Pyx_PyObject_CallOneArg(__pyx_t_14, __pyx_kp_u_Bitmap_font_descriptor_file_inva);
                 __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-                if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 782, __pyx_L14_error)
+                if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 868, __pyx_L14_error)
                 __Pyx_GOTREF(__pyx_t_1);
                 __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
                 __Pyx_Raise(__pyx_t_1, 0, 0, 0);
                 __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-                __PYX_ERR(1, 782, __pyx_L14_error)
+                __PYX_ERR(1, 868, __pyx_L14_error)
               }
               __pyx_L24:;
 
-              /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":771
+              /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":857
  *                     pass
  * 
  *                 elif line.startswith("common"):             # <<<<<<<<<<<<<<
@@ -4057,14 +5110,14 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
               goto __pyx_L22;
             }
 
-            /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":784
+            /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":870
  *                         raise BitmapFontException("Bitmap font descriptor file invalid format")
  * 
  *                 elif line.startswith("chars"):             # <<<<<<<<<<<<<<
  *                     pass
  * 
  */
-            __pyx_t_14 = __Pyx_PyObject_GetAttrStr(__pyx_v_line, __pyx_n_s_startswith); if (unlikely(!__pyx_t_14)) __PYX_ERR(1, 784, __pyx_L14_error)
+            __pyx_t_14 = __Pyx_PyObject_GetAttrStr(__pyx_v_line, __pyx_n_s_startswith); if (unlikely(!__pyx_t_14)) __PYX_ERR(1, 870, __pyx_L14_error)
             __Pyx_GOTREF(__pyx_t_14);
             __pyx_t_6 = NULL;
             if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_14))) {
@@ -4078,23 +5131,23 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
             }
             __pyx_t_1 = (__pyx_t_6) ? __Pyx_PyObject_Call2Args(__pyx_t_14, __pyx_t_6, __pyx_n_u_chars) : __Pyx_PyObject_CallOneArg(__pyx_t_14, __pyx_n_u_chars);
             __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-            if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 784, __pyx_L14_error)
+            if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 870, __pyx_L14_error)
             __Pyx_GOTREF(__pyx_t_1);
             __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
-            __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_5 < 0)) __PYX_ERR(1, 784, __pyx_L14_error)
+            __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_5 < 0)) __PYX_ERR(1, 870, __pyx_L14_error)
             __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
             if (__pyx_t_5) {
               goto __pyx_L22;
             }
 
-            /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":787
+            /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":873
  *                     pass
  * 
  *                 elif line.startswith("char"):             # <<<<<<<<<<<<<<
  *                     m = re.search(r"char\s+id=(?P<id>[0-9]{1,4})\s+x=(?P<x>[0-9]{1,4})\s+y=(?P<y>[0-9]{1,4})"
  *                                   r"\s+width=(?P<width>[0-9]{1,3})\s+height=(?P<height>[0-9]{1,3})"
  */
-            __pyx_t_14 = __Pyx_PyObject_GetAttrStr(__pyx_v_line, __pyx_n_s_startswith); if (unlikely(!__pyx_t_14)) __PYX_ERR(1, 787, __pyx_L14_error)
+            __pyx_t_14 = __Pyx_PyObject_GetAttrStr(__pyx_v_line, __pyx_n_s_startswith); if (unlikely(!__pyx_t_14)) __PYX_ERR(1, 873, __pyx_L14_error)
             __Pyx_GOTREF(__pyx_t_14);
             __pyx_t_6 = NULL;
             if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_14))) {
@@ -4108,34 +5161,34 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
             }
             __pyx_t_1 = (__pyx_t_6) ? __Pyx_PyObject_Call2Args(__pyx_t_14, __pyx_t_6, __pyx_n_u_char) : __Pyx_PyObject_CallOneArg(__pyx_t_14, __pyx_n_u_char);
             __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-            if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 787, __pyx_L14_error)
+            if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 873, __pyx_L14_error)
             __Pyx_GOTREF(__pyx_t_1);
             __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
-            __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_5 < 0)) __PYX_ERR(1, 787, __pyx_L14_error)
+            __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_5 < 0)) __PYX_ERR(1, 873, __pyx_L14_error)
             __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
             if (__pyx_t_5) {
 
-              /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":788
+              /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":874
  * 
  *                 elif line.startswith("char"):
  *                     m = re.search(r"char\s+id=(?P<id>[0-9]{1,4})\s+x=(?P<x>[0-9]{1,4})\s+y=(?P<y>[0-9]{1,4})"             # <<<<<<<<<<<<<<
  *                                   r"\s+width=(?P<width>[0-9]{1,3})\s+height=(?P<height>[0-9]{1,3})"
  *                                   r"\s+xoffset=(?P<xoffset>-?[0-9]{1,3})\s+yoffset=(?P<yoffset>-?[0-9]{1,3})"
  */
-              __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_re); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 788, __pyx_L14_error)
+              __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_re); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 874, __pyx_L14_error)
               __Pyx_GOTREF(__pyx_t_1);
-              __pyx_t_14 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_search); if (unlikely(!__pyx_t_14)) __PYX_ERR(1, 788, __pyx_L14_error)
+              __pyx_t_14 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_search); if (unlikely(!__pyx_t_14)) __PYX_ERR(1, 874, __pyx_L14_error)
               __Pyx_GOTREF(__pyx_t_14);
               __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-              /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":792
+              /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":878
  *                                   r"\s+xoffset=(?P<xoffset>-?[0-9]{1,3})\s+yoffset=(?P<yoffset>-?[0-9]{1,3})"
  *                                   r"\s+xadvance=(?P<xadvance>[0-9]{1,3})\s+page=(?P<page>[0-9]{1,2})"
  *                                   r"\s+chnl=(?P<chnl>[0-9]{1,3})", line, flags=re.IGNORECASE)             # <<<<<<<<<<<<<<
  *                     if not m:
  *                         raise BitmapFontException("Bitmap font descriptor file invalid format")
  */
-              __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 788, __pyx_L14_error)
+              __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 874, __pyx_L14_error)
               __Pyx_GOTREF(__pyx_t_1);
               __Pyx_INCREF(__pyx_kp_u_char_s_id_P_id_0_9_1_4_s_x_P_x_0);
               __Pyx_GIVEREF(__pyx_kp_u_char_s_id_P_id_0_9_1_4_s_x_P_x_0);
@@ -4143,24 +5196,24 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
               __Pyx_INCREF(__pyx_v_line);
               __Pyx_GIVEREF(__pyx_v_line);
               PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_v_line);
-              __pyx_t_6 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 792, __pyx_L14_error)
+              __pyx_t_6 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 878, __pyx_L14_error)
               __Pyx_GOTREF(__pyx_t_6);
-              __Pyx_GetModuleGlobalName(__pyx_t_15, __pyx_n_s_re); if (unlikely(!__pyx_t_15)) __PYX_ERR(1, 792, __pyx_L14_error)
+              __Pyx_GetModuleGlobalName(__pyx_t_15, __pyx_n_s_re); if (unlikely(!__pyx_t_15)) __PYX_ERR(1, 878, __pyx_L14_error)
               __Pyx_GOTREF(__pyx_t_15);
-              __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_15, __pyx_n_s_IGNORECASE); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 792, __pyx_L14_error)
+              __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_15, __pyx_n_s_IGNORECASE); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 878, __pyx_L14_error)
               __Pyx_GOTREF(__pyx_t_3);
               __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
-              if (PyDict_SetItem(__pyx_t_6, __pyx_n_s_flags, __pyx_t_3) < 0) __PYX_ERR(1, 792, __pyx_L14_error)
+              if (PyDict_SetItem(__pyx_t_6, __pyx_n_s_flags, __pyx_t_3) < 0) __PYX_ERR(1, 878, __pyx_L14_error)
               __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-              /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":788
+              /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":874
  * 
  *                 elif line.startswith("char"):
  *                     m = re.search(r"char\s+id=(?P<id>[0-9]{1,4})\s+x=(?P<x>[0-9]{1,4})\s+y=(?P<y>[0-9]{1,4})"             # <<<<<<<<<<<<<<
  *                                   r"\s+width=(?P<width>[0-9]{1,3})\s+height=(?P<height>[0-9]{1,3})"
  *                                   r"\s+xoffset=(?P<xoffset>-?[0-9]{1,3})\s+yoffset=(?P<yoffset>-?[0-9]{1,3})"
  */
-              __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_14, __pyx_t_1, __pyx_t_6); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 788, __pyx_L14_error)
+              __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_14, __pyx_t_1, __pyx_t_6); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 874, __pyx_L14_error)
               __Pyx_GOTREF(__pyx_t_3);
               __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
               __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
@@ -4168,25 +5221,25 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
               __Pyx_XDECREF_SET(__pyx_v_m, __pyx_t_3);
               __pyx_t_3 = 0;
 
-              /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":793
+              /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":879
  *                                   r"\s+xadvance=(?P<xadvance>[0-9]{1,3})\s+page=(?P<page>[0-9]{1,2})"
  *                                   r"\s+chnl=(?P<chnl>[0-9]{1,3})", line, flags=re.IGNORECASE)
  *                     if not m:             # <<<<<<<<<<<<<<
  *                         raise BitmapFontException("Bitmap font descriptor file invalid format")
  * 
  */
-              __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_v_m); if (unlikely(__pyx_t_5 < 0)) __PYX_ERR(1, 793, __pyx_L14_error)
+              __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_v_m); if (unlikely(__pyx_t_5 < 0)) __PYX_ERR(1, 879, __pyx_L14_error)
               __pyx_t_4 = ((!__pyx_t_5) != 0);
               if (unlikely(__pyx_t_4)) {
 
-                /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":794
+                /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":880
  *                                   r"\s+chnl=(?P<chnl>[0-9]{1,3})", line, flags=re.IGNORECASE)
  *                     if not m:
  *                         raise BitmapFontException("Bitmap font descriptor file invalid format")             # <<<<<<<<<<<<<<
  * 
  *                     char_id = int(m.group("id"))
  */
-                __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_BitmapFontException); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 794, __pyx_L14_error)
+                __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_BitmapFontException); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 880, __pyx_L14_error)
                 __Pyx_GOTREF(__pyx_t_6);
                 __pyx_t_1 = NULL;
                 if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_6))) {
@@ -4200,14 +5253,14 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
                 }
                 __pyx_t_3 = (__pyx_t_1) ? __Pyx_PyObject_Call2Args(__pyx_t_6, __pyx_t_1, __pyx_kp_u_Bitmap_font_descriptor_file_inva) : __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_kp_u_Bitmap_font_descriptor_file_inva);
                 __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-                if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 794, __pyx_L14_error)
+                if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 880, __pyx_L14_error)
                 __Pyx_GOTREF(__pyx_t_3);
                 __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
                 __Pyx_Raise(__pyx_t_3, 0, 0, 0);
                 __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-                __PYX_ERR(1, 794, __pyx_L14_error)
+                __PYX_ERR(1, 880, __pyx_L14_error)
 
-                /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":793
+                /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":879
  *                                   r"\s+xadvance=(?P<xadvance>[0-9]{1,3})\s+page=(?P<page>[0-9]{1,2})"
  *                                   r"\s+chnl=(?P<chnl>[0-9]{1,3})", line, flags=re.IGNORECASE)
  *                     if not m:             # <<<<<<<<<<<<<<
@@ -4216,14 +5269,14 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
  */
               }
 
-              /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":796
+              /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":882
  *                         raise BitmapFontException("Bitmap font descriptor file invalid format")
  * 
  *                     char_id = int(m.group("id"))             # <<<<<<<<<<<<<<
  *                     if char_id > 256:
  *                         continue
  */
-              __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_m, __pyx_n_s_group); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 796, __pyx_L14_error)
+              __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_m, __pyx_n_s_group); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 882, __pyx_L14_error)
               __Pyx_GOTREF(__pyx_t_6);
               __pyx_t_1 = NULL;
               if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_6))) {
@@ -4237,17 +5290,17 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
               }
               __pyx_t_3 = (__pyx_t_1) ? __Pyx_PyObject_Call2Args(__pyx_t_6, __pyx_t_1, __pyx_n_u_id) : __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_n_u_id);
               __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-              if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 796, __pyx_L14_error)
+              if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 882, __pyx_L14_error)
               __Pyx_GOTREF(__pyx_t_3);
               __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-              __pyx_t_6 = __Pyx_PyNumber_Int(__pyx_t_3); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 796, __pyx_L14_error)
+              __pyx_t_6 = __Pyx_PyNumber_Int(__pyx_t_3); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 882, __pyx_L14_error)
               __Pyx_GOTREF(__pyx_t_6);
               __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-              __pyx_t_10 = __Pyx_PyInt_As_int(__pyx_t_6); if (unlikely((__pyx_t_10 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 796, __pyx_L14_error)
+              __pyx_t_10 = __Pyx_PyInt_As_int(__pyx_t_6); if (unlikely((__pyx_t_10 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 882, __pyx_L14_error)
               __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
               __pyx_v_char_id = __pyx_t_10;
 
-              /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":797
+              /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":883
  * 
  *                     char_id = int(m.group("id"))
  *                     if char_id > 256:             # <<<<<<<<<<<<<<
@@ -4257,7 +5310,7 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
               __pyx_t_4 = ((__pyx_v_char_id > 0x100) != 0);
               if (__pyx_t_4) {
 
-                /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":798
+                /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":884
  *                     char_id = int(m.group("id"))
  *                     if char_id > 256:
  *                         continue             # <<<<<<<<<<<<<<
@@ -4266,7 +5319,7 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
  */
                 goto __pyx_L20_continue;
 
-                /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":797
+                /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":883
  * 
  *                     char_id = int(m.group("id"))
  *                     if char_id > 256:             # <<<<<<<<<<<<<<
@@ -4275,37 +5328,37 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
  */
               }
 
-              /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":801
+              /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":887
  * 
  *                     # Do not add duplicate character definitions (only use the first instance)
  *                     if char_id not in self.characters:             # <<<<<<<<<<<<<<
  * 
  *                         # Create character definition
  */
-              __pyx_t_6 = __Pyx_PyInt_From_int(__pyx_v_char_id); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 801, __pyx_L14_error)
+              __pyx_t_6 = __Pyx_PyInt_From_int(__pyx_v_char_id); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 887, __pyx_L14_error)
               __Pyx_GOTREF(__pyx_t_6);
               if (unlikely(__pyx_v_self->characters == Py_None)) {
                 PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
-                __PYX_ERR(1, 801, __pyx_L14_error)
+                __PYX_ERR(1, 887, __pyx_L14_error)
               }
-              __pyx_t_4 = (__Pyx_PyDict_ContainsTF(__pyx_t_6, __pyx_v_self->characters, Py_NE)); if (unlikely(__pyx_t_4 < 0)) __PYX_ERR(1, 801, __pyx_L14_error)
+              __pyx_t_4 = (__Pyx_PyDict_ContainsTF(__pyx_t_6, __pyx_v_self->characters, Py_NE)); if (unlikely(__pyx_t_4 < 0)) __PYX_ERR(1, 887, __pyx_L14_error)
               __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
               __pyx_t_5 = (__pyx_t_4 != 0);
               if (__pyx_t_5) {
 
-                /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":804
+                /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":890
  * 
  *                         # Create character definition
  *                         character = BitmapFontCharacter()             # <<<<<<<<<<<<<<
  *                         character.id = char_id
  *                         character.rect.x = int(m.group("x"))
  */
-                __pyx_t_6 = __Pyx_PyObject_CallNoArg(((PyObject *)__pyx_ptype_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFontCharacter)); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 804, __pyx_L14_error)
+                __pyx_t_6 = __Pyx_PyObject_CallNoArg(((PyObject *)__pyx_ptype_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFontCharacter)); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 890, __pyx_L14_error)
                 __Pyx_GOTREF(__pyx_t_6);
                 __Pyx_XDECREF_SET(__pyx_v_character, ((struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFontCharacter *)__pyx_t_6));
                 __pyx_t_6 = 0;
 
-                /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":805
+                /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":891
  *                         # Create character definition
  *                         character = BitmapFontCharacter()
  *                         character.id = char_id             # <<<<<<<<<<<<<<
@@ -4314,14 +5367,14 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
  */
                 __pyx_v_character->id = __pyx_v_char_id;
 
-                /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":806
+                /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":892
  *                         character = BitmapFontCharacter()
  *                         character.id = char_id
  *                         character.rect.x = int(m.group("x"))             # <<<<<<<<<<<<<<
  *                         character.rect.y = int(m.group("y"))
  *                         character.rect.w = int(m.group("width"))
  */
-                __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_m, __pyx_n_s_group); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 806, __pyx_L14_error)
+                __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_m, __pyx_n_s_group); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 892, __pyx_L14_error)
                 __Pyx_GOTREF(__pyx_t_3);
                 __pyx_t_1 = NULL;
                 if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
@@ -4335,24 +5388,24 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
                 }
                 __pyx_t_6 = (__pyx_t_1) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_1, __pyx_n_u_x) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_n_u_x);
                 __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-                if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 806, __pyx_L14_error)
+                if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 892, __pyx_L14_error)
                 __Pyx_GOTREF(__pyx_t_6);
                 __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-                __pyx_t_3 = __Pyx_PyNumber_Int(__pyx_t_6); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 806, __pyx_L14_error)
+                __pyx_t_3 = __Pyx_PyNumber_Int(__pyx_t_6); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 892, __pyx_L14_error)
                 __Pyx_GOTREF(__pyx_t_3);
                 __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-                __pyx_t_10 = __Pyx_PyInt_As_int(__pyx_t_3); if (unlikely((__pyx_t_10 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 806, __pyx_L14_error)
+                __pyx_t_10 = __Pyx_PyInt_As_int(__pyx_t_3); if (unlikely((__pyx_t_10 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 892, __pyx_L14_error)
                 __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
                 __pyx_v_character->rect.x = __pyx_t_10;
 
-                /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":807
+                /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":893
  *                         character.id = char_id
  *                         character.rect.x = int(m.group("x"))
  *                         character.rect.y = int(m.group("y"))             # <<<<<<<<<<<<<<
  *                         character.rect.w = int(m.group("width"))
  *                         character.rect.h = int(m.group("height"))
  */
-                __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_m, __pyx_n_s_group); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 807, __pyx_L14_error)
+                __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_m, __pyx_n_s_group); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 893, __pyx_L14_error)
                 __Pyx_GOTREF(__pyx_t_6);
                 __pyx_t_1 = NULL;
                 if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_6))) {
@@ -4366,24 +5419,24 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
                 }
                 __pyx_t_3 = (__pyx_t_1) ? __Pyx_PyObject_Call2Args(__pyx_t_6, __pyx_t_1, __pyx_n_u_y) : __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_n_u_y);
                 __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-                if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 807, __pyx_L14_error)
+                if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 893, __pyx_L14_error)
                 __Pyx_GOTREF(__pyx_t_3);
                 __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-                __pyx_t_6 = __Pyx_PyNumber_Int(__pyx_t_3); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 807, __pyx_L14_error)
+                __pyx_t_6 = __Pyx_PyNumber_Int(__pyx_t_3); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 893, __pyx_L14_error)
                 __Pyx_GOTREF(__pyx_t_6);
                 __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-                __pyx_t_10 = __Pyx_PyInt_As_int(__pyx_t_6); if (unlikely((__pyx_t_10 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 807, __pyx_L14_error)
+                __pyx_t_10 = __Pyx_PyInt_As_int(__pyx_t_6); if (unlikely((__pyx_t_10 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 893, __pyx_L14_error)
                 __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
                 __pyx_v_character->rect.y = __pyx_t_10;
 
-                /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":808
+                /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":894
  *                         character.rect.x = int(m.group("x"))
  *                         character.rect.y = int(m.group("y"))
  *                         character.rect.w = int(m.group("width"))             # <<<<<<<<<<<<<<
  *                         character.rect.h = int(m.group("height"))
  *                         character.xoffset = int(m.group("xoffset"))
  */
-                __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_m, __pyx_n_s_group); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 808, __pyx_L14_error)
+                __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_m, __pyx_n_s_group); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 894, __pyx_L14_error)
                 __Pyx_GOTREF(__pyx_t_3);
                 __pyx_t_1 = NULL;
                 if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
@@ -4397,24 +5450,24 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
                 }
                 __pyx_t_6 = (__pyx_t_1) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_1, __pyx_n_u_width) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_n_u_width);
                 __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-                if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 808, __pyx_L14_error)
+                if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 894, __pyx_L14_error)
                 __Pyx_GOTREF(__pyx_t_6);
                 __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-                __pyx_t_3 = __Pyx_PyNumber_Int(__pyx_t_6); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 808, __pyx_L14_error)
+                __pyx_t_3 = __Pyx_PyNumber_Int(__pyx_t_6); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 894, __pyx_L14_error)
                 __Pyx_GOTREF(__pyx_t_3);
                 __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-                __pyx_t_10 = __Pyx_PyInt_As_int(__pyx_t_3); if (unlikely((__pyx_t_10 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 808, __pyx_L14_error)
+                __pyx_t_10 = __Pyx_PyInt_As_int(__pyx_t_3); if (unlikely((__pyx_t_10 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 894, __pyx_L14_error)
                 __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
                 __pyx_v_character->rect.w = __pyx_t_10;
 
-                /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":809
+                /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":895
  *                         character.rect.y = int(m.group("y"))
  *                         character.rect.w = int(m.group("width"))
  *                         character.rect.h = int(m.group("height"))             # <<<<<<<<<<<<<<
  *                         character.xoffset = int(m.group("xoffset"))
  *                         character.yoffset = int(m.group("yoffset"))
  */
-                __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_m, __pyx_n_s_group); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 809, __pyx_L14_error)
+                __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_m, __pyx_n_s_group); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 895, __pyx_L14_error)
                 __Pyx_GOTREF(__pyx_t_6);
                 __pyx_t_1 = NULL;
                 if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_6))) {
@@ -4428,24 +5481,24 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
                 }
                 __pyx_t_3 = (__pyx_t_1) ? __Pyx_PyObject_Call2Args(__pyx_t_6, __pyx_t_1, __pyx_n_u_height) : __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_n_u_height);
                 __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-                if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 809, __pyx_L14_error)
+                if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 895, __pyx_L14_error)
                 __Pyx_GOTREF(__pyx_t_3);
                 __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-                __pyx_t_6 = __Pyx_PyNumber_Int(__pyx_t_3); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 809, __pyx_L14_error)
+                __pyx_t_6 = __Pyx_PyNumber_Int(__pyx_t_3); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 895, __pyx_L14_error)
                 __Pyx_GOTREF(__pyx_t_6);
                 __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-                __pyx_t_10 = __Pyx_PyInt_As_int(__pyx_t_6); if (unlikely((__pyx_t_10 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 809, __pyx_L14_error)
+                __pyx_t_10 = __Pyx_PyInt_As_int(__pyx_t_6); if (unlikely((__pyx_t_10 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 895, __pyx_L14_error)
                 __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
                 __pyx_v_character->rect.h = __pyx_t_10;
 
-                /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":810
+                /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":896
  *                         character.rect.w = int(m.group("width"))
  *                         character.rect.h = int(m.group("height"))
  *                         character.xoffset = int(m.group("xoffset"))             # <<<<<<<<<<<<<<
  *                         character.yoffset = int(m.group("yoffset"))
  *                         character.xadvance = int(m.group("xadvance"))
  */
-                __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_m, __pyx_n_s_group); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 810, __pyx_L14_error)
+                __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_m, __pyx_n_s_group); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 896, __pyx_L14_error)
                 __Pyx_GOTREF(__pyx_t_3);
                 __pyx_t_1 = NULL;
                 if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
@@ -4459,24 +5512,24 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
                 }
                 __pyx_t_6 = (__pyx_t_1) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_1, __pyx_n_u_xoffset) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_n_u_xoffset);
                 __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-                if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 810, __pyx_L14_error)
+                if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 896, __pyx_L14_error)
                 __Pyx_GOTREF(__pyx_t_6);
                 __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-                __pyx_t_3 = __Pyx_PyNumber_Int(__pyx_t_6); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 810, __pyx_L14_error)
+                __pyx_t_3 = __Pyx_PyNumber_Int(__pyx_t_6); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 896, __pyx_L14_error)
                 __Pyx_GOTREF(__pyx_t_3);
                 __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-                __pyx_t_10 = __Pyx_PyInt_As_int(__pyx_t_3); if (unlikely((__pyx_t_10 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 810, __pyx_L14_error)
+                __pyx_t_10 = __Pyx_PyInt_As_int(__pyx_t_3); if (unlikely((__pyx_t_10 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 896, __pyx_L14_error)
                 __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
                 __pyx_v_character->xoffset = __pyx_t_10;
 
-                /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":811
+                /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":897
  *                         character.rect.h = int(m.group("height"))
  *                         character.xoffset = int(m.group("xoffset"))
  *                         character.yoffset = int(m.group("yoffset"))             # <<<<<<<<<<<<<<
  *                         character.xadvance = int(m.group("xadvance"))
  * 
  */
-                __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_m, __pyx_n_s_group); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 811, __pyx_L14_error)
+                __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_m, __pyx_n_s_group); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 897, __pyx_L14_error)
                 __Pyx_GOTREF(__pyx_t_6);
                 __pyx_t_1 = NULL;
                 if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_6))) {
@@ -4490,24 +5543,24 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
                 }
                 __pyx_t_3 = (__pyx_t_1) ? __Pyx_PyObject_Call2Args(__pyx_t_6, __pyx_t_1, __pyx_n_u_yoffset) : __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_n_u_yoffset);
                 __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-                if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 811, __pyx_L14_error)
+                if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 897, __pyx_L14_error)
                 __Pyx_GOTREF(__pyx_t_3);
                 __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-                __pyx_t_6 = __Pyx_PyNumber_Int(__pyx_t_3); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 811, __pyx_L14_error)
+                __pyx_t_6 = __Pyx_PyNumber_Int(__pyx_t_3); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 897, __pyx_L14_error)
                 __Pyx_GOTREF(__pyx_t_6);
                 __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-                __pyx_t_10 = __Pyx_PyInt_As_int(__pyx_t_6); if (unlikely((__pyx_t_10 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 811, __pyx_L14_error)
+                __pyx_t_10 = __Pyx_PyInt_As_int(__pyx_t_6); if (unlikely((__pyx_t_10 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 897, __pyx_L14_error)
                 __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
                 __pyx_v_character->yoffset = __pyx_t_10;
 
-                /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":812
+                /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":898
  *                         character.xoffset = int(m.group("xoffset"))
  *                         character.yoffset = int(m.group("yoffset"))
  *                         character.xadvance = int(m.group("xadvance"))             # <<<<<<<<<<<<<<
  * 
  *                         self.characters[character.id] = character
  */
-                __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_m, __pyx_n_s_group); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 812, __pyx_L14_error)
+                __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_m, __pyx_n_s_group); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 898, __pyx_L14_error)
                 __Pyx_GOTREF(__pyx_t_3);
                 __pyx_t_1 = NULL;
                 if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
@@ -4521,17 +5574,17 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
                 }
                 __pyx_t_6 = (__pyx_t_1) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_1, __pyx_n_u_xadvance) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_n_u_xadvance);
                 __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-                if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 812, __pyx_L14_error)
+                if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 898, __pyx_L14_error)
                 __Pyx_GOTREF(__pyx_t_6);
                 __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-                __pyx_t_3 = __Pyx_PyNumber_Int(__pyx_t_6); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 812, __pyx_L14_error)
+                __pyx_t_3 = __Pyx_PyNumber_Int(__pyx_t_6); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 898, __pyx_L14_error)
                 __Pyx_GOTREF(__pyx_t_3);
                 __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-                __pyx_t_10 = __Pyx_PyInt_As_int(__pyx_t_3); if (unlikely((__pyx_t_10 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 812, __pyx_L14_error)
+                __pyx_t_10 = __Pyx_PyInt_As_int(__pyx_t_3); if (unlikely((__pyx_t_10 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 898, __pyx_L14_error)
                 __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
                 __pyx_v_character->xadvance = __pyx_t_10;
 
-                /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":814
+                /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":900
  *                         character.xadvance = int(m.group("xadvance"))
  * 
  *                         self.characters[character.id] = character             # <<<<<<<<<<<<<<
@@ -4540,14 +5593,14 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
  */
                 if (unlikely(__pyx_v_self->characters == Py_None)) {
                   PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-                  __PYX_ERR(1, 814, __pyx_L14_error)
+                  __PYX_ERR(1, 900, __pyx_L14_error)
                 }
-                __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_character->id); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 814, __pyx_L14_error)
+                __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_character->id); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 900, __pyx_L14_error)
                 __Pyx_GOTREF(__pyx_t_3);
-                if (unlikely(PyDict_SetItem(__pyx_v_self->characters, __pyx_t_3, ((PyObject *)__pyx_v_character)) < 0)) __PYX_ERR(1, 814, __pyx_L14_error)
+                if (unlikely(PyDict_SetItem(__pyx_v_self->characters, __pyx_t_3, ((PyObject *)__pyx_v_character)) < 0)) __PYX_ERR(1, 900, __pyx_L14_error)
                 __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-                /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":801
+                /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":887
  * 
  *                     # Do not add duplicate character definitions (only use the first instance)
  *                     if char_id not in self.characters:             # <<<<<<<<<<<<<<
@@ -4556,7 +5609,7 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
  */
               }
 
-              /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":787
+              /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":873
  *                     pass
  * 
  *                 elif line.startswith("char"):             # <<<<<<<<<<<<<<
@@ -4566,14 +5619,14 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
               goto __pyx_L22;
             }
 
-            /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":816
+            /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":902
  *                         self.characters[character.id] = character
  * 
  *                 elif line.startswith("kernings"):             # <<<<<<<<<<<<<<
  *                     pass
  * 
  */
-            __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_line, __pyx_n_s_startswith); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 816, __pyx_L14_error)
+            __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_line, __pyx_n_s_startswith); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 902, __pyx_L14_error)
             __Pyx_GOTREF(__pyx_t_6);
             __pyx_t_1 = NULL;
             if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_6))) {
@@ -4587,23 +5640,23 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
             }
             __pyx_t_3 = (__pyx_t_1) ? __Pyx_PyObject_Call2Args(__pyx_t_6, __pyx_t_1, __pyx_n_u_kernings) : __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_n_u_kernings);
             __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-            if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 816, __pyx_L14_error)
+            if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 902, __pyx_L14_error)
             __Pyx_GOTREF(__pyx_t_3);
             __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-            __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_5 < 0)) __PYX_ERR(1, 816, __pyx_L14_error)
+            __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_5 < 0)) __PYX_ERR(1, 902, __pyx_L14_error)
             __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
             if (__pyx_t_5) {
               goto __pyx_L22;
             }
 
-            /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":819
+            /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":905
  *                     pass
  * 
  *                 elif line.startswith("kerning"):             # <<<<<<<<<<<<<<
  *                     m = re.search(r"kerning\s+first=(?P<first>[0-9]{1,3})\s+second=(?P<second>[0-9]{1,3})"
  *                                   r"\s+amount=(?P<amount>-?[0-9]{1,3})", line, flags=re.IGNORECASE)
  */
-            __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_line, __pyx_n_s_startswith); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 819, __pyx_L14_error)
+            __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_line, __pyx_n_s_startswith); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 905, __pyx_L14_error)
             __Pyx_GOTREF(__pyx_t_6);
             __pyx_t_1 = NULL;
             if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_6))) {
@@ -4617,34 +5670,34 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
             }
             __pyx_t_3 = (__pyx_t_1) ? __Pyx_PyObject_Call2Args(__pyx_t_6, __pyx_t_1, __pyx_n_u_kerning) : __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_n_u_kerning);
             __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-            if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 819, __pyx_L14_error)
+            if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 905, __pyx_L14_error)
             __Pyx_GOTREF(__pyx_t_3);
             __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-            __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_5 < 0)) __PYX_ERR(1, 819, __pyx_L14_error)
+            __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_5 < 0)) __PYX_ERR(1, 905, __pyx_L14_error)
             __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
             if (__pyx_t_5) {
 
-              /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":820
+              /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":906
  * 
  *                 elif line.startswith("kerning"):
  *                     m = re.search(r"kerning\s+first=(?P<first>[0-9]{1,3})\s+second=(?P<second>[0-9]{1,3})"             # <<<<<<<<<<<<<<
  *                                   r"\s+amount=(?P<amount>-?[0-9]{1,3})", line, flags=re.IGNORECASE)
  *                     if not m:
  */
-              __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_re); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 820, __pyx_L14_error)
+              __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_re); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 906, __pyx_L14_error)
               __Pyx_GOTREF(__pyx_t_3);
-              __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_search); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 820, __pyx_L14_error)
+              __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_search); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 906, __pyx_L14_error)
               __Pyx_GOTREF(__pyx_t_6);
               __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-              /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":821
+              /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":907
  *                 elif line.startswith("kerning"):
  *                     m = re.search(r"kerning\s+first=(?P<first>[0-9]{1,3})\s+second=(?P<second>[0-9]{1,3})"
  *                                   r"\s+amount=(?P<amount>-?[0-9]{1,3})", line, flags=re.IGNORECASE)             # <<<<<<<<<<<<<<
  *                     if not m:
  *                         raise BitmapFontException("Bitmap font descriptor file invalid format")
  */
-              __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 820, __pyx_L14_error)
+              __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 906, __pyx_L14_error)
               __Pyx_GOTREF(__pyx_t_3);
               __Pyx_INCREF(__pyx_kp_u_kerning_s_first_P_first_0_9_1_3);
               __Pyx_GIVEREF(__pyx_kp_u_kerning_s_first_P_first_0_9_1_3);
@@ -4652,24 +5705,24 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
               __Pyx_INCREF(__pyx_v_line);
               __Pyx_GIVEREF(__pyx_v_line);
               PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_v_line);
-              __pyx_t_1 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 821, __pyx_L14_error)
+              __pyx_t_1 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 907, __pyx_L14_error)
               __Pyx_GOTREF(__pyx_t_1);
-              __Pyx_GetModuleGlobalName(__pyx_t_14, __pyx_n_s_re); if (unlikely(!__pyx_t_14)) __PYX_ERR(1, 821, __pyx_L14_error)
+              __Pyx_GetModuleGlobalName(__pyx_t_14, __pyx_n_s_re); if (unlikely(!__pyx_t_14)) __PYX_ERR(1, 907, __pyx_L14_error)
               __Pyx_GOTREF(__pyx_t_14);
-              __pyx_t_15 = __Pyx_PyObject_GetAttrStr(__pyx_t_14, __pyx_n_s_IGNORECASE); if (unlikely(!__pyx_t_15)) __PYX_ERR(1, 821, __pyx_L14_error)
+              __pyx_t_15 = __Pyx_PyObject_GetAttrStr(__pyx_t_14, __pyx_n_s_IGNORECASE); if (unlikely(!__pyx_t_15)) __PYX_ERR(1, 907, __pyx_L14_error)
               __Pyx_GOTREF(__pyx_t_15);
               __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
-              if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_flags, __pyx_t_15) < 0) __PYX_ERR(1, 821, __pyx_L14_error)
+              if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_flags, __pyx_t_15) < 0) __PYX_ERR(1, 907, __pyx_L14_error)
               __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
 
-              /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":820
+              /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":906
  * 
  *                 elif line.startswith("kerning"):
  *                     m = re.search(r"kerning\s+first=(?P<first>[0-9]{1,3})\s+second=(?P<second>[0-9]{1,3})"             # <<<<<<<<<<<<<<
  *                                   r"\s+amount=(?P<amount>-?[0-9]{1,3})", line, flags=re.IGNORECASE)
  *                     if not m:
  */
-              __pyx_t_15 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_t_3, __pyx_t_1); if (unlikely(!__pyx_t_15)) __PYX_ERR(1, 820, __pyx_L14_error)
+              __pyx_t_15 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_t_3, __pyx_t_1); if (unlikely(!__pyx_t_15)) __PYX_ERR(1, 906, __pyx_L14_error)
               __Pyx_GOTREF(__pyx_t_15);
               __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
               __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -4677,25 +5730,25 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
               __Pyx_XDECREF_SET(__pyx_v_m, __pyx_t_15);
               __pyx_t_15 = 0;
 
-              /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":822
+              /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":908
  *                     m = re.search(r"kerning\s+first=(?P<first>[0-9]{1,3})\s+second=(?P<second>[0-9]{1,3})"
  *                                   r"\s+amount=(?P<amount>-?[0-9]{1,3})", line, flags=re.IGNORECASE)
  *                     if not m:             # <<<<<<<<<<<<<<
  *                         raise BitmapFontException("Bitmap font descriptor file invalid format")
  * 
  */
-              __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_v_m); if (unlikely(__pyx_t_5 < 0)) __PYX_ERR(1, 822, __pyx_L14_error)
+              __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_v_m); if (unlikely(__pyx_t_5 < 0)) __PYX_ERR(1, 908, __pyx_L14_error)
               __pyx_t_4 = ((!__pyx_t_5) != 0);
               if (unlikely(__pyx_t_4)) {
 
-                /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":823
+                /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":909
  *                                   r"\s+amount=(?P<amount>-?[0-9]{1,3})", line, flags=re.IGNORECASE)
  *                     if not m:
  *                         raise BitmapFontException("Bitmap font descriptor file invalid format")             # <<<<<<<<<<<<<<
  * 
  *                     first = int(m.group("first"))
  */
-                __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_BitmapFontException); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 823, __pyx_L14_error)
+                __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_BitmapFontException); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 909, __pyx_L14_error)
                 __Pyx_GOTREF(__pyx_t_1);
                 __pyx_t_3 = NULL;
                 if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_1))) {
@@ -4709,14 +5762,14 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
                 }
                 __pyx_t_15 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_3, __pyx_kp_u_Bitmap_font_descriptor_file_inva) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_kp_u_Bitmap_font_descriptor_file_inva);
                 __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-                if (unlikely(!__pyx_t_15)) __PYX_ERR(1, 823, __pyx_L14_error)
+                if (unlikely(!__pyx_t_15)) __PYX_ERR(1, 909, __pyx_L14_error)
                 __Pyx_GOTREF(__pyx_t_15);
                 __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
                 __Pyx_Raise(__pyx_t_15, 0, 0, 0);
                 __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
-                __PYX_ERR(1, 823, __pyx_L14_error)
+                __PYX_ERR(1, 909, __pyx_L14_error)
 
-                /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":822
+                /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":908
  *                     m = re.search(r"kerning\s+first=(?P<first>[0-9]{1,3})\s+second=(?P<second>[0-9]{1,3})"
  *                                   r"\s+amount=(?P<amount>-?[0-9]{1,3})", line, flags=re.IGNORECASE)
  *                     if not m:             # <<<<<<<<<<<<<<
@@ -4725,14 +5778,14 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
  */
               }
 
-              /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":825
+              /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":911
  *                         raise BitmapFontException("Bitmap font descriptor file invalid format")
  * 
  *                     first = int(m.group("first"))             # <<<<<<<<<<<<<<
  *                     second = int(m.group("second"))
  * 
  */
-              __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_m, __pyx_n_s_group); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 825, __pyx_L14_error)
+              __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_m, __pyx_n_s_group); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 911, __pyx_L14_error)
               __Pyx_GOTREF(__pyx_t_1);
               __pyx_t_3 = NULL;
               if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
@@ -4746,24 +5799,24 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
               }
               __pyx_t_15 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_3, __pyx_n_u_first) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_n_u_first);
               __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-              if (unlikely(!__pyx_t_15)) __PYX_ERR(1, 825, __pyx_L14_error)
+              if (unlikely(!__pyx_t_15)) __PYX_ERR(1, 911, __pyx_L14_error)
               __Pyx_GOTREF(__pyx_t_15);
               __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-              __pyx_t_1 = __Pyx_PyNumber_Int(__pyx_t_15); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 825, __pyx_L14_error)
+              __pyx_t_1 = __Pyx_PyNumber_Int(__pyx_t_15); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 911, __pyx_L14_error)
               __Pyx_GOTREF(__pyx_t_1);
               __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
-              __pyx_t_10 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_10 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 825, __pyx_L14_error)
+              __pyx_t_10 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_10 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 911, __pyx_L14_error)
               __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
               __pyx_v_first = __pyx_t_10;
 
-              /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":826
+              /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":912
  * 
  *                     first = int(m.group("first"))
  *                     second = int(m.group("second"))             # <<<<<<<<<<<<<<
  * 
  *                     if first not in self.kernings:
  */
-              __pyx_t_15 = __Pyx_PyObject_GetAttrStr(__pyx_v_m, __pyx_n_s_group); if (unlikely(!__pyx_t_15)) __PYX_ERR(1, 826, __pyx_L14_error)
+              __pyx_t_15 = __Pyx_PyObject_GetAttrStr(__pyx_v_m, __pyx_n_s_group); if (unlikely(!__pyx_t_15)) __PYX_ERR(1, 912, __pyx_L14_error)
               __Pyx_GOTREF(__pyx_t_15);
               __pyx_t_3 = NULL;
               if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_15))) {
@@ -4777,54 +5830,54 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
               }
               __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_15, __pyx_t_3, __pyx_n_u_second) : __Pyx_PyObject_CallOneArg(__pyx_t_15, __pyx_n_u_second);
               __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-              if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 826, __pyx_L14_error)
+              if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 912, __pyx_L14_error)
               __Pyx_GOTREF(__pyx_t_1);
               __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
-              __pyx_t_15 = __Pyx_PyNumber_Int(__pyx_t_1); if (unlikely(!__pyx_t_15)) __PYX_ERR(1, 826, __pyx_L14_error)
+              __pyx_t_15 = __Pyx_PyNumber_Int(__pyx_t_1); if (unlikely(!__pyx_t_15)) __PYX_ERR(1, 912, __pyx_L14_error)
               __Pyx_GOTREF(__pyx_t_15);
               __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-              __pyx_t_10 = __Pyx_PyInt_As_int(__pyx_t_15); if (unlikely((__pyx_t_10 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 826, __pyx_L14_error)
+              __pyx_t_10 = __Pyx_PyInt_As_int(__pyx_t_15); if (unlikely((__pyx_t_10 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 912, __pyx_L14_error)
               __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
               __pyx_v_second = __pyx_t_10;
 
-              /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":828
+              /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":914
  *                     second = int(m.group("second"))
  * 
  *                     if first not in self.kernings:             # <<<<<<<<<<<<<<
  *                         self.kernings[first] = {}
  * 
  */
-              __pyx_t_15 = __Pyx_PyInt_From_int(__pyx_v_first); if (unlikely(!__pyx_t_15)) __PYX_ERR(1, 828, __pyx_L14_error)
+              __pyx_t_15 = __Pyx_PyInt_From_int(__pyx_v_first); if (unlikely(!__pyx_t_15)) __PYX_ERR(1, 914, __pyx_L14_error)
               __Pyx_GOTREF(__pyx_t_15);
               if (unlikely(__pyx_v_self->kernings == Py_None)) {
                 PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
-                __PYX_ERR(1, 828, __pyx_L14_error)
+                __PYX_ERR(1, 914, __pyx_L14_error)
               }
-              __pyx_t_4 = (__Pyx_PyDict_ContainsTF(__pyx_t_15, __pyx_v_self->kernings, Py_NE)); if (unlikely(__pyx_t_4 < 0)) __PYX_ERR(1, 828, __pyx_L14_error)
+              __pyx_t_4 = (__Pyx_PyDict_ContainsTF(__pyx_t_15, __pyx_v_self->kernings, Py_NE)); if (unlikely(__pyx_t_4 < 0)) __PYX_ERR(1, 914, __pyx_L14_error)
               __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
               __pyx_t_5 = (__pyx_t_4 != 0);
               if (__pyx_t_5) {
 
-                /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":829
+                /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":915
  * 
  *                     if first not in self.kernings:
  *                         self.kernings[first] = {}             # <<<<<<<<<<<<<<
  * 
  *                     if second not in self.kernings[first]:
  */
-                __pyx_t_15 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_15)) __PYX_ERR(1, 829, __pyx_L14_error)
+                __pyx_t_15 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_15)) __PYX_ERR(1, 915, __pyx_L14_error)
                 __Pyx_GOTREF(__pyx_t_15);
                 if (unlikely(__pyx_v_self->kernings == Py_None)) {
                   PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-                  __PYX_ERR(1, 829, __pyx_L14_error)
+                  __PYX_ERR(1, 915, __pyx_L14_error)
                 }
-                __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_first); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 829, __pyx_L14_error)
+                __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_first); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 915, __pyx_L14_error)
                 __Pyx_GOTREF(__pyx_t_1);
-                if (unlikely(PyDict_SetItem(__pyx_v_self->kernings, __pyx_t_1, __pyx_t_15) < 0)) __PYX_ERR(1, 829, __pyx_L14_error)
+                if (unlikely(PyDict_SetItem(__pyx_v_self->kernings, __pyx_t_1, __pyx_t_15) < 0)) __PYX_ERR(1, 915, __pyx_L14_error)
                 __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
                 __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
 
-                /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":828
+                /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":914
  *                     second = int(m.group("second"))
  * 
  *                     if first not in self.kernings:             # <<<<<<<<<<<<<<
@@ -4833,38 +5886,38 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
  */
               }
 
-              /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":831
+              /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":917
  *                         self.kernings[first] = {}
  * 
  *                     if second not in self.kernings[first]:             # <<<<<<<<<<<<<<
  *                         self.kernings[first][second] = int(m.group("amount"))
  * 
  */
-              __pyx_t_15 = __Pyx_PyInt_From_int(__pyx_v_second); if (unlikely(!__pyx_t_15)) __PYX_ERR(1, 831, __pyx_L14_error)
+              __pyx_t_15 = __Pyx_PyInt_From_int(__pyx_v_second); if (unlikely(!__pyx_t_15)) __PYX_ERR(1, 917, __pyx_L14_error)
               __Pyx_GOTREF(__pyx_t_15);
               if (unlikely(__pyx_v_self->kernings == Py_None)) {
                 PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-                __PYX_ERR(1, 831, __pyx_L14_error)
+                __PYX_ERR(1, 917, __pyx_L14_error)
               }
-              __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_first); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 831, __pyx_L14_error)
+              __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_first); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 917, __pyx_L14_error)
               __Pyx_GOTREF(__pyx_t_1);
-              __pyx_t_3 = __Pyx_PyDict_GetItem(__pyx_v_self->kernings, __pyx_t_1); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 831, __pyx_L14_error)
+              __pyx_t_3 = __Pyx_PyDict_GetItem(__pyx_v_self->kernings, __pyx_t_1); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 917, __pyx_L14_error)
               __Pyx_GOTREF(__pyx_t_3);
               __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-              __pyx_t_5 = (__Pyx_PySequence_ContainsTF(__pyx_t_15, __pyx_t_3, Py_NE)); if (unlikely(__pyx_t_5 < 0)) __PYX_ERR(1, 831, __pyx_L14_error)
+              __pyx_t_5 = (__Pyx_PySequence_ContainsTF(__pyx_t_15, __pyx_t_3, Py_NE)); if (unlikely(__pyx_t_5 < 0)) __PYX_ERR(1, 917, __pyx_L14_error)
               __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
               __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
               __pyx_t_4 = (__pyx_t_5 != 0);
               if (__pyx_t_4) {
 
-                /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":832
+                /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":918
  * 
  *                     if second not in self.kernings[first]:
  *                         self.kernings[first][second] = int(m.group("amount"))             # <<<<<<<<<<<<<<
  * 
  *     def _load_descriptor_xml(self, xml_tree: ElementTree):
  */
-                __pyx_t_15 = __Pyx_PyObject_GetAttrStr(__pyx_v_m, __pyx_n_s_group); if (unlikely(!__pyx_t_15)) __PYX_ERR(1, 832, __pyx_L14_error)
+                __pyx_t_15 = __Pyx_PyObject_GetAttrStr(__pyx_v_m, __pyx_n_s_group); if (unlikely(!__pyx_t_15)) __PYX_ERR(1, 918, __pyx_L14_error)
                 __Pyx_GOTREF(__pyx_t_15);
                 __pyx_t_1 = NULL;
                 if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_15))) {
@@ -4878,26 +5931,26 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
                 }
                 __pyx_t_3 = (__pyx_t_1) ? __Pyx_PyObject_Call2Args(__pyx_t_15, __pyx_t_1, __pyx_n_u_amount) : __Pyx_PyObject_CallOneArg(__pyx_t_15, __pyx_n_u_amount);
                 __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-                if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 832, __pyx_L14_error)
+                if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 918, __pyx_L14_error)
                 __Pyx_GOTREF(__pyx_t_3);
                 __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
-                __pyx_t_15 = __Pyx_PyNumber_Int(__pyx_t_3); if (unlikely(!__pyx_t_15)) __PYX_ERR(1, 832, __pyx_L14_error)
+                __pyx_t_15 = __Pyx_PyNumber_Int(__pyx_t_3); if (unlikely(!__pyx_t_15)) __PYX_ERR(1, 918, __pyx_L14_error)
                 __Pyx_GOTREF(__pyx_t_15);
                 __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
                 if (unlikely(__pyx_v_self->kernings == Py_None)) {
                   PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-                  __PYX_ERR(1, 832, __pyx_L14_error)
+                  __PYX_ERR(1, 918, __pyx_L14_error)
                 }
-                __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_first); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 832, __pyx_L14_error)
+                __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_first); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 918, __pyx_L14_error)
                 __Pyx_GOTREF(__pyx_t_3);
-                __pyx_t_1 = __Pyx_PyDict_GetItem(__pyx_v_self->kernings, __pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 832, __pyx_L14_error)
+                __pyx_t_1 = __Pyx_PyDict_GetItem(__pyx_v_self->kernings, __pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 918, __pyx_L14_error)
                 __Pyx_GOTREF(__pyx_t_1);
                 __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-                if (unlikely(__Pyx_SetItemInt(__pyx_t_1, __pyx_v_second, __pyx_t_15, int, 1, __Pyx_PyInt_From_int, 0, 1, 1) < 0)) __PYX_ERR(1, 832, __pyx_L14_error)
+                if (unlikely(__Pyx_SetItemInt(__pyx_t_1, __pyx_v_second, __pyx_t_15, int, 1, __Pyx_PyInt_From_int, 0, 1, 1) < 0)) __PYX_ERR(1, 918, __pyx_L14_error)
                 __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
                 __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
 
-                /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":831
+                /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":917
  *                         self.kernings[first] = {}
  * 
  *                     if second not in self.kernings[first]:             # <<<<<<<<<<<<<<
@@ -4906,7 +5959,7 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
  */
               }
 
-              /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":819
+              /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":905
  *                     pass
  * 
  *                 elif line.startswith("kerning"):             # <<<<<<<<<<<<<<
@@ -4916,7 +5969,7 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
             }
             __pyx_L22:;
 
-            /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":767
+            /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":853
  * 
  *             # Loop over all the rows in the descriptor file
  *             for line in text_file:             # <<<<<<<<<<<<<<
@@ -4927,7 +5980,7 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
           }
           __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-          /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":764
+          /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":850
  * 
  *         # Open the descriptor file
  *         with open(descriptor_file) as text_file:             # <<<<<<<<<<<<<<
@@ -4948,20 +6001,20 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
         __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
         /*except:*/ {
           __Pyx_AddTraceback("mpfmc.uix.bitmap_font.bitmap_font.BitmapFont._load_descriptor_file", __pyx_clineno, __pyx_lineno, __pyx_filename);
-          if (__Pyx_GetException(&__pyx_t_2, &__pyx_t_15, &__pyx_t_1) < 0) __PYX_ERR(1, 764, __pyx_L16_except_error)
+          if (__Pyx_GetException(&__pyx_t_2, &__pyx_t_15, &__pyx_t_1) < 0) __PYX_ERR(1, 850, __pyx_L16_except_error)
           __Pyx_GOTREF(__pyx_t_2);
           __Pyx_GOTREF(__pyx_t_15);
           __Pyx_GOTREF(__pyx_t_1);
-          __pyx_t_3 = PyTuple_Pack(3, __pyx_t_2, __pyx_t_15, __pyx_t_1); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 764, __pyx_L16_except_error)
+          __pyx_t_3 = PyTuple_Pack(3, __pyx_t_2, __pyx_t_15, __pyx_t_1); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 850, __pyx_L16_except_error)
           __Pyx_GOTREF(__pyx_t_3);
           __pyx_t_16 = __Pyx_PyObject_Call(__pyx_t_9, __pyx_t_3, NULL);
           __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
           __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-          if (unlikely(!__pyx_t_16)) __PYX_ERR(1, 764, __pyx_L16_except_error)
+          if (unlikely(!__pyx_t_16)) __PYX_ERR(1, 850, __pyx_L16_except_error)
           __Pyx_GOTREF(__pyx_t_16);
           __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_16);
           __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
-          if (__pyx_t_4 < 0) __PYX_ERR(1, 764, __pyx_L16_except_error)
+          if (__pyx_t_4 < 0) __PYX_ERR(1, 850, __pyx_L16_except_error)
           __pyx_t_5 = ((!(__pyx_t_4 != 0)) != 0);
           if (__pyx_t_5) {
             __Pyx_GIVEREF(__pyx_t_2);
@@ -4969,7 +6022,7 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
             __Pyx_XGIVEREF(__pyx_t_1);
             __Pyx_ErrRestoreWithState(__pyx_t_2, __pyx_t_15, __pyx_t_1);
             __pyx_t_2 = 0; __pyx_t_15 = 0; __pyx_t_1 = 0; 
-            __PYX_ERR(1, 764, __pyx_L16_except_error)
+            __PYX_ERR(1, 850, __pyx_L16_except_error)
           }
           __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
           __Pyx_XDECREF(__pyx_t_15); __pyx_t_15 = 0;
@@ -4995,7 +6048,7 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
         if (__pyx_t_9) {
           __pyx_t_11 = __Pyx_PyObject_Call(__pyx_t_9, __pyx_tuple__4, NULL);
           __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-          if (unlikely(!__pyx_t_11)) __PYX_ERR(1, 764, __pyx_L1_error)
+          if (unlikely(!__pyx_t_11)) __PYX_ERR(1, 850, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_11);
           __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
         }
@@ -5010,7 +6063,7 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
     __pyx_L34:;
   }
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":739
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":825
  *             y += row_height
  * 
  *     def _load_descriptor_file(self, str descriptor_file):             # <<<<<<<<<<<<<<
@@ -5041,7 +6094,7 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
   return __pyx_r;
 }
 
-/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":834
+/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":920
  *                         self.kernings[first][second] = int(m.group("amount"))
  * 
  *     def _load_descriptor_xml(self, xml_tree: ElementTree):             # <<<<<<<<<<<<<<
@@ -5085,9 +6138,12 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
   Py_ssize_t __pyx_t_7;
   PyObject *(*__pyx_t_8)(PyObject *);
   PyObject *__pyx_t_9 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("_load_descriptor_xml", 0);
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":837
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":923
  *         """Loads the descriptor information from the XML tree."""
  * 
  *         cdef int first = 0             # <<<<<<<<<<<<<<
@@ -5096,7 +6152,7 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
  */
   __pyx_v_first = 0;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":838
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":924
  * 
  *         cdef int first = 0
  *         cdef int second = 0             # <<<<<<<<<<<<<<
@@ -5105,14 +6161,14 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
  */
   __pyx_v_second = 0;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":839
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":925
  *         cdef int first = 0
  *         cdef int second = 0
  *         root = xml_tree.getroot()             # <<<<<<<<<<<<<<
  *         if root is None:
  *             raise BitmapFontException("Bitmap font descriptor file invalid XML format")
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_xml_tree, __pyx_n_s_getroot); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 839, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_xml_tree, __pyx_n_s_getroot); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 925, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_t_3 = NULL;
   if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
@@ -5126,13 +6182,13 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
   }
   __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3) : __Pyx_PyObject_CallNoArg(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 839, __pyx_L1_error)
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 925, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_v_root = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":840
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":926
  *         cdef int second = 0
  *         root = xml_tree.getroot()
  *         if root is None:             # <<<<<<<<<<<<<<
@@ -5143,14 +6199,14 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
   __pyx_t_5 = (__pyx_t_4 != 0);
   if (unlikely(__pyx_t_5)) {
 
-    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":841
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":927
  *         root = xml_tree.getroot()
  *         if root is None:
  *             raise BitmapFontException("Bitmap font descriptor file invalid XML format")             # <<<<<<<<<<<<<<
  * 
  *         # info
  */
-    __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_BitmapFontException); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 841, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_BitmapFontException); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 927, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_t_3 = NULL;
     if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_2))) {
@@ -5164,14 +6220,14 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
     }
     __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_kp_u_Bitmap_font_descriptor_file_inva_2) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_kp_u_Bitmap_font_descriptor_file_inva_2);
     __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 841, __pyx_L1_error)
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 927, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_Raise(__pyx_t_1, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __PYX_ERR(1, 841, __pyx_L1_error)
+    __PYX_ERR(1, 927, __pyx_L1_error)
 
-    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":840
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":926
  *         cdef int second = 0
  *         root = xml_tree.getroot()
  *         if root is None:             # <<<<<<<<<<<<<<
@@ -5180,14 +6236,14 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
  */
   }
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":844
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":930
  * 
  *         # info
  *         info = root.find('info')             # <<<<<<<<<<<<<<
  *         if info is None:
  *             raise BitmapFontException("Bitmap font descriptor file invalid XML format")
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_root, __pyx_n_s_find); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 844, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_root, __pyx_n_s_find); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 930, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_t_3 = NULL;
   if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
@@ -5201,13 +6257,13 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
   }
   __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_n_u_info) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_n_u_info);
   __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 844, __pyx_L1_error)
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 930, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_v_info = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":845
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":931
  *         # info
  *         info = root.find('info')
  *         if info is None:             # <<<<<<<<<<<<<<
@@ -5218,14 +6274,14 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
   __pyx_t_4 = (__pyx_t_5 != 0);
   if (unlikely(__pyx_t_4)) {
 
-    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":846
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":932
  *         info = root.find('info')
  *         if info is None:
  *             raise BitmapFontException("Bitmap font descriptor file invalid XML format")             # <<<<<<<<<<<<<<
  * 
  *         # common
  */
-    __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_BitmapFontException); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 846, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_BitmapFontException); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 932, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_t_3 = NULL;
     if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_2))) {
@@ -5239,14 +6295,14 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
     }
     __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_kp_u_Bitmap_font_descriptor_file_inva_2) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_kp_u_Bitmap_font_descriptor_file_inva_2);
     __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 846, __pyx_L1_error)
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 932, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_Raise(__pyx_t_1, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __PYX_ERR(1, 846, __pyx_L1_error)
+    __PYX_ERR(1, 932, __pyx_L1_error)
 
-    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":845
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":931
  *         # info
  *         info = root.find('info')
  *         if info is None:             # <<<<<<<<<<<<<<
@@ -5255,14 +6311,14 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
  */
   }
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":849
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":935
  * 
  *         # common
  *         common = root.find('common')             # <<<<<<<<<<<<<<
  *         if common is None:
  *             raise BitmapFontException("Bitmap font descriptor file invalid XML format")
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_root, __pyx_n_s_find); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 849, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_root, __pyx_n_s_find); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 935, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_t_3 = NULL;
   if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
@@ -5276,13 +6332,13 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
   }
   __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_n_u_common) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_n_u_common);
   __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 849, __pyx_L1_error)
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 935, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_v_common = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":850
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":936
  *         # common
  *         common = root.find('common')
  *         if common is None:             # <<<<<<<<<<<<<<
@@ -5293,14 +6349,14 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
   __pyx_t_5 = (__pyx_t_4 != 0);
   if (unlikely(__pyx_t_5)) {
 
-    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":851
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":937
  *         common = root.find('common')
  *         if common is None:
  *             raise BitmapFontException("Bitmap font descriptor file invalid XML format")             # <<<<<<<<<<<<<<
  * 
  *         self.line_height = int(common.attrib["lineHeight"])
  */
-    __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_BitmapFontException); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 851, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_BitmapFontException); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 937, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_t_3 = NULL;
     if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_2))) {
@@ -5314,14 +6370,14 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
     }
     __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_kp_u_Bitmap_font_descriptor_file_inva_2) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_kp_u_Bitmap_font_descriptor_file_inva_2);
     __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 851, __pyx_L1_error)
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 937, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_Raise(__pyx_t_1, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __PYX_ERR(1, 851, __pyx_L1_error)
+    __PYX_ERR(1, 937, __pyx_L1_error)
 
-    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":850
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":936
  *         # common
  *         common = root.find('common')
  *         if common is None:             # <<<<<<<<<<<<<<
@@ -5330,52 +6386,52 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
  */
   }
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":853
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":939
  *             raise BitmapFontException("Bitmap font descriptor file invalid XML format")
  * 
  *         self.line_height = int(common.attrib["lineHeight"])             # <<<<<<<<<<<<<<
  *         self.base = int(common.attrib["base"])
  * 
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_common, __pyx_n_s_attrib); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 853, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_common, __pyx_n_s_attrib); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 939, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_Dict_GetItem(__pyx_t_1, __pyx_n_u_lineHeight); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 853, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_Dict_GetItem(__pyx_t_1, __pyx_n_u_lineHeight); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 939, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_PyNumber_Int(__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 853, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyNumber_Int(__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 939, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_6 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 853, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 939, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_v_self->line_height = __pyx_t_6;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":854
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":940
  * 
  *         self.line_height = int(common.attrib["lineHeight"])
  *         self.base = int(common.attrib["base"])             # <<<<<<<<<<<<<<
  * 
  *         # characters
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_common, __pyx_n_s_attrib); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 854, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_common, __pyx_n_s_attrib); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 940, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_Dict_GetItem(__pyx_t_1, __pyx_n_u_base); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 854, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_Dict_GetItem(__pyx_t_1, __pyx_n_u_base); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 940, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_PyNumber_Int(__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 854, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyNumber_Int(__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 940, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_6 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 854, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 940, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_v_self->base = __pyx_t_6;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":857
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":943
  * 
  *         # characters
  *         chars = root.find('chars')             # <<<<<<<<<<<<<<
  *         if chars is None:
  *             raise BitmapFontException("Bitmap font descriptor file invalid XML format")
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_root, __pyx_n_s_find); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 857, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_root, __pyx_n_s_find); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 943, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_t_3 = NULL;
   if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
@@ -5389,13 +6445,13 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
   }
   __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_n_u_chars) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_n_u_chars);
   __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 857, __pyx_L1_error)
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 943, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_v_chars = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":858
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":944
  *         # characters
  *         chars = root.find('chars')
  *         if chars is None:             # <<<<<<<<<<<<<<
@@ -5406,14 +6462,14 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
   __pyx_t_4 = (__pyx_t_5 != 0);
   if (unlikely(__pyx_t_4)) {
 
-    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":859
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":945
  *         chars = root.find('chars')
  *         if chars is None:
  *             raise BitmapFontException("Bitmap font descriptor file invalid XML format")             # <<<<<<<<<<<<<<
  * 
  *         for text_char in chars.findall('char'):
  */
-    __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_BitmapFontException); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 859, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_BitmapFontException); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 945, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_t_3 = NULL;
     if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_2))) {
@@ -5427,14 +6483,14 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
     }
     __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_kp_u_Bitmap_font_descriptor_file_inva_2) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_kp_u_Bitmap_font_descriptor_file_inva_2);
     __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 859, __pyx_L1_error)
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 945, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_Raise(__pyx_t_1, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __PYX_ERR(1, 859, __pyx_L1_error)
+    __PYX_ERR(1, 945, __pyx_L1_error)
 
-    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":858
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":944
  *         # characters
  *         chars = root.find('chars')
  *         if chars is None:             # <<<<<<<<<<<<<<
@@ -5443,14 +6499,14 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
  */
   }
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":861
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":947
  *             raise BitmapFontException("Bitmap font descriptor file invalid XML format")
  * 
  *         for text_char in chars.findall('char'):             # <<<<<<<<<<<<<<
  *             character = BitmapFontCharacter()
  *             character.id = int(text_char.attrib["id"])
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_chars, __pyx_n_s_findall); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 861, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_chars, __pyx_n_s_findall); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 947, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_t_3 = NULL;
   if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
@@ -5464,16 +6520,16 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
   }
   __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_n_u_char) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_n_u_char);
   __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 861, __pyx_L1_error)
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 947, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   if (likely(PyList_CheckExact(__pyx_t_1)) || PyTuple_CheckExact(__pyx_t_1)) {
     __pyx_t_2 = __pyx_t_1; __Pyx_INCREF(__pyx_t_2); __pyx_t_7 = 0;
     __pyx_t_8 = NULL;
   } else {
-    __pyx_t_7 = -1; __pyx_t_2 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 861, __pyx_L1_error)
+    __pyx_t_7 = -1; __pyx_t_2 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 947, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_8 = Py_TYPE(__pyx_t_2)->tp_iternext; if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 861, __pyx_L1_error)
+    __pyx_t_8 = Py_TYPE(__pyx_t_2)->tp_iternext; if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 947, __pyx_L1_error)
   }
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   for (;;) {
@@ -5481,17 +6537,17 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
       if (likely(PyList_CheckExact(__pyx_t_2))) {
         if (__pyx_t_7 >= PyList_GET_SIZE(__pyx_t_2)) break;
         #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_1 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_7); __Pyx_INCREF(__pyx_t_1); __pyx_t_7++; if (unlikely(0 < 0)) __PYX_ERR(1, 861, __pyx_L1_error)
+        __pyx_t_1 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_7); __Pyx_INCREF(__pyx_t_1); __pyx_t_7++; if (unlikely(0 < 0)) __PYX_ERR(1, 947, __pyx_L1_error)
         #else
-        __pyx_t_1 = PySequence_ITEM(__pyx_t_2, __pyx_t_7); __pyx_t_7++; if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 861, __pyx_L1_error)
+        __pyx_t_1 = PySequence_ITEM(__pyx_t_2, __pyx_t_7); __pyx_t_7++; if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 947, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_1);
         #endif
       } else {
         if (__pyx_t_7 >= PyTuple_GET_SIZE(__pyx_t_2)) break;
         #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_2, __pyx_t_7); __Pyx_INCREF(__pyx_t_1); __pyx_t_7++; if (unlikely(0 < 0)) __PYX_ERR(1, 861, __pyx_L1_error)
+        __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_2, __pyx_t_7); __Pyx_INCREF(__pyx_t_1); __pyx_t_7++; if (unlikely(0 < 0)) __PYX_ERR(1, 947, __pyx_L1_error)
         #else
-        __pyx_t_1 = PySequence_ITEM(__pyx_t_2, __pyx_t_7); __pyx_t_7++; if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 861, __pyx_L1_error)
+        __pyx_t_1 = PySequence_ITEM(__pyx_t_2, __pyx_t_7); __pyx_t_7++; if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 947, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_1);
         #endif
       }
@@ -5501,7 +6557,7 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
         PyObject* exc_type = PyErr_Occurred();
         if (exc_type) {
           if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-          else __PYX_ERR(1, 861, __pyx_L1_error)
+          else __PYX_ERR(1, 947, __pyx_L1_error)
         }
         break;
       }
@@ -5510,171 +6566,171 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
     __Pyx_XDECREF_SET(__pyx_v_text_char, __pyx_t_1);
     __pyx_t_1 = 0;
 
-    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":862
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":948
  * 
  *         for text_char in chars.findall('char'):
  *             character = BitmapFontCharacter()             # <<<<<<<<<<<<<<
  *             character.id = int(text_char.attrib["id"])
  *             character.rect.x = int(text_char.attrib["x"])
  */
-    __pyx_t_1 = __Pyx_PyObject_CallNoArg(((PyObject *)__pyx_ptype_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFontCharacter)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 862, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_CallNoArg(((PyObject *)__pyx_ptype_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFontCharacter)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 948, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_XDECREF_SET(__pyx_v_character, ((struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFontCharacter *)__pyx_t_1));
     __pyx_t_1 = 0;
 
-    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":863
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":949
  *         for text_char in chars.findall('char'):
  *             character = BitmapFontCharacter()
  *             character.id = int(text_char.attrib["id"])             # <<<<<<<<<<<<<<
  *             character.rect.x = int(text_char.attrib["x"])
  *             character.rect.y = int(text_char.attrib["y"])
  */
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_text_char, __pyx_n_s_attrib); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 863, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_text_char, __pyx_n_s_attrib); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 949, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_3 = __Pyx_PyObject_Dict_GetItem(__pyx_t_1, __pyx_n_u_id); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 863, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_Dict_GetItem(__pyx_t_1, __pyx_n_u_id); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 949, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_1 = __Pyx_PyNumber_Int(__pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 863, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyNumber_Int(__pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 949, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_t_6 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 863, __pyx_L1_error)
+    __pyx_t_6 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 949, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     __pyx_v_character->id = __pyx_t_6;
 
-    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":864
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":950
  *             character = BitmapFontCharacter()
  *             character.id = int(text_char.attrib["id"])
  *             character.rect.x = int(text_char.attrib["x"])             # <<<<<<<<<<<<<<
  *             character.rect.y = int(text_char.attrib["y"])
  *             character.rect.w = int(text_char.attrib["width"])
  */
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_text_char, __pyx_n_s_attrib); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 864, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_text_char, __pyx_n_s_attrib); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 950, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_3 = __Pyx_PyObject_Dict_GetItem(__pyx_t_1, __pyx_n_u_x); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 864, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_Dict_GetItem(__pyx_t_1, __pyx_n_u_x); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 950, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_1 = __Pyx_PyNumber_Int(__pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 864, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyNumber_Int(__pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 950, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_t_6 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 864, __pyx_L1_error)
+    __pyx_t_6 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 950, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     __pyx_v_character->rect.x = __pyx_t_6;
 
-    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":865
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":951
  *             character.id = int(text_char.attrib["id"])
  *             character.rect.x = int(text_char.attrib["x"])
  *             character.rect.y = int(text_char.attrib["y"])             # <<<<<<<<<<<<<<
  *             character.rect.w = int(text_char.attrib["width"])
  *             character.rect.h = int(text_char.attrib["height"])
  */
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_text_char, __pyx_n_s_attrib); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 865, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_text_char, __pyx_n_s_attrib); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 951, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_3 = __Pyx_PyObject_Dict_GetItem(__pyx_t_1, __pyx_n_u_y); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 865, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_Dict_GetItem(__pyx_t_1, __pyx_n_u_y); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 951, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_1 = __Pyx_PyNumber_Int(__pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 865, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyNumber_Int(__pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 951, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_t_6 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 865, __pyx_L1_error)
+    __pyx_t_6 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 951, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     __pyx_v_character->rect.y = __pyx_t_6;
 
-    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":866
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":952
  *             character.rect.x = int(text_char.attrib["x"])
  *             character.rect.y = int(text_char.attrib["y"])
  *             character.rect.w = int(text_char.attrib["width"])             # <<<<<<<<<<<<<<
  *             character.rect.h = int(text_char.attrib["height"])
  *             character.xadvance = int(text_char.attrib["xadvance"])
  */
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_text_char, __pyx_n_s_attrib); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 866, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_text_char, __pyx_n_s_attrib); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 952, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_3 = __Pyx_PyObject_Dict_GetItem(__pyx_t_1, __pyx_n_u_width); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 866, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_Dict_GetItem(__pyx_t_1, __pyx_n_u_width); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 952, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_1 = __Pyx_PyNumber_Int(__pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 866, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyNumber_Int(__pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 952, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_t_6 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 866, __pyx_L1_error)
+    __pyx_t_6 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 952, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     __pyx_v_character->rect.w = __pyx_t_6;
 
-    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":867
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":953
  *             character.rect.y = int(text_char.attrib["y"])
  *             character.rect.w = int(text_char.attrib["width"])
  *             character.rect.h = int(text_char.attrib["height"])             # <<<<<<<<<<<<<<
  *             character.xadvance = int(text_char.attrib["xadvance"])
  *             character.xoffset = int(text_char.attrib["xoffset"])
  */
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_text_char, __pyx_n_s_attrib); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 867, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_text_char, __pyx_n_s_attrib); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 953, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_3 = __Pyx_PyObject_Dict_GetItem(__pyx_t_1, __pyx_n_u_height); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 867, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_Dict_GetItem(__pyx_t_1, __pyx_n_u_height); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 953, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_1 = __Pyx_PyNumber_Int(__pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 867, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyNumber_Int(__pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 953, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_t_6 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 867, __pyx_L1_error)
+    __pyx_t_6 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 953, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     __pyx_v_character->rect.h = __pyx_t_6;
 
-    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":868
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":954
  *             character.rect.w = int(text_char.attrib["width"])
  *             character.rect.h = int(text_char.attrib["height"])
  *             character.xadvance = int(text_char.attrib["xadvance"])             # <<<<<<<<<<<<<<
  *             character.xoffset = int(text_char.attrib["xoffset"])
  *             character.yoffset = int(text_char.attrib["yoffset"])
  */
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_text_char, __pyx_n_s_attrib); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 868, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_text_char, __pyx_n_s_attrib); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 954, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_3 = __Pyx_PyObject_Dict_GetItem(__pyx_t_1, __pyx_n_u_xadvance); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 868, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_Dict_GetItem(__pyx_t_1, __pyx_n_u_xadvance); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 954, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_1 = __Pyx_PyNumber_Int(__pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 868, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyNumber_Int(__pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 954, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_t_6 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 868, __pyx_L1_error)
+    __pyx_t_6 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 954, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     __pyx_v_character->xadvance = __pyx_t_6;
 
-    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":869
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":955
  *             character.rect.h = int(text_char.attrib["height"])
  *             character.xadvance = int(text_char.attrib["xadvance"])
  *             character.xoffset = int(text_char.attrib["xoffset"])             # <<<<<<<<<<<<<<
  *             character.yoffset = int(text_char.attrib["yoffset"])
  * 
  */
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_text_char, __pyx_n_s_attrib); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 869, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_text_char, __pyx_n_s_attrib); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 955, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_3 = __Pyx_PyObject_Dict_GetItem(__pyx_t_1, __pyx_n_u_xoffset); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 869, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_Dict_GetItem(__pyx_t_1, __pyx_n_u_xoffset); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 955, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_1 = __Pyx_PyNumber_Int(__pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 869, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyNumber_Int(__pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 955, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_t_6 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 869, __pyx_L1_error)
+    __pyx_t_6 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 955, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     __pyx_v_character->xoffset = __pyx_t_6;
 
-    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":870
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":956
  *             character.xadvance = int(text_char.attrib["xadvance"])
  *             character.xoffset = int(text_char.attrib["xoffset"])
  *             character.yoffset = int(text_char.attrib["yoffset"])             # <<<<<<<<<<<<<<
  * 
  *             self.characters[character.id] = character
  */
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_text_char, __pyx_n_s_attrib); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 870, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_text_char, __pyx_n_s_attrib); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 956, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_3 = __Pyx_PyObject_Dict_GetItem(__pyx_t_1, __pyx_n_u_yoffset); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 870, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_Dict_GetItem(__pyx_t_1, __pyx_n_u_yoffset); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 956, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_1 = __Pyx_PyNumber_Int(__pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 870, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyNumber_Int(__pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 956, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_t_6 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 870, __pyx_L1_error)
+    __pyx_t_6 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 956, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     __pyx_v_character->yoffset = __pyx_t_6;
 
-    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":872
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":958
  *             character.yoffset = int(text_char.attrib["yoffset"])
  * 
  *             self.characters[character.id] = character             # <<<<<<<<<<<<<<
@@ -5683,14 +6739,14 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
  */
     if (unlikely(__pyx_v_self->characters == Py_None)) {
       PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-      __PYX_ERR(1, 872, __pyx_L1_error)
+      __PYX_ERR(1, 958, __pyx_L1_error)
     }
-    __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_character->id); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 872, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_character->id); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 958, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    if (unlikely(PyDict_SetItem(__pyx_v_self->characters, __pyx_t_1, ((PyObject *)__pyx_v_character)) < 0)) __PYX_ERR(1, 872, __pyx_L1_error)
+    if (unlikely(PyDict_SetItem(__pyx_v_self->characters, __pyx_t_1, ((PyObject *)__pyx_v_character)) < 0)) __PYX_ERR(1, 958, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":861
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":947
  *             raise BitmapFontException("Bitmap font descriptor file invalid XML format")
  * 
  *         for text_char in chars.findall('char'):             # <<<<<<<<<<<<<<
@@ -5700,14 +6756,14 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
   }
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":875
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":961
  * 
  *         # kerning
  *         kernings = root.find('kernings')             # <<<<<<<<<<<<<<
  *         if kernings is not None:
  *             for kerning in kernings.findall('kerning'):
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_root, __pyx_n_s_find); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 875, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_root, __pyx_n_s_find); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 961, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_t_3 = NULL;
   if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
@@ -5721,13 +6777,13 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
   }
   __pyx_t_2 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_3, __pyx_n_u_kernings) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_n_u_kernings);
   __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 875, __pyx_L1_error)
+  if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 961, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_v_kernings = __pyx_t_2;
   __pyx_t_2 = 0;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":876
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":962
  *         # kerning
  *         kernings = root.find('kernings')
  *         if kernings is not None:             # <<<<<<<<<<<<<<
@@ -5738,14 +6794,14 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
   __pyx_t_5 = (__pyx_t_4 != 0);
   if (__pyx_t_5) {
 
-    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":877
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":963
  *         kernings = root.find('kernings')
  *         if kernings is not None:
  *             for kerning in kernings.findall('kerning'):             # <<<<<<<<<<<<<<
  *                 first = int(kerning.attrib["first"])
  *                 second = int(kerning.attrib["second"])
  */
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_kernings, __pyx_n_s_findall); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 877, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_kernings, __pyx_n_s_findall); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 963, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __pyx_t_3 = NULL;
     if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
@@ -5759,16 +6815,16 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
     }
     __pyx_t_2 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_3, __pyx_n_u_kerning) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_n_u_kerning);
     __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-    if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 877, __pyx_L1_error)
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 963, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     if (likely(PyList_CheckExact(__pyx_t_2)) || PyTuple_CheckExact(__pyx_t_2)) {
       __pyx_t_1 = __pyx_t_2; __Pyx_INCREF(__pyx_t_1); __pyx_t_7 = 0;
       __pyx_t_8 = NULL;
     } else {
-      __pyx_t_7 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 877, __pyx_L1_error)
+      __pyx_t_7 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 963, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_8 = Py_TYPE(__pyx_t_1)->tp_iternext; if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 877, __pyx_L1_error)
+      __pyx_t_8 = Py_TYPE(__pyx_t_1)->tp_iternext; if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 963, __pyx_L1_error)
     }
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     for (;;) {
@@ -5776,17 +6832,17 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
         if (likely(PyList_CheckExact(__pyx_t_1))) {
           if (__pyx_t_7 >= PyList_GET_SIZE(__pyx_t_1)) break;
           #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-          __pyx_t_2 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_7); __Pyx_INCREF(__pyx_t_2); __pyx_t_7++; if (unlikely(0 < 0)) __PYX_ERR(1, 877, __pyx_L1_error)
+          __pyx_t_2 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_7); __Pyx_INCREF(__pyx_t_2); __pyx_t_7++; if (unlikely(0 < 0)) __PYX_ERR(1, 963, __pyx_L1_error)
           #else
-          __pyx_t_2 = PySequence_ITEM(__pyx_t_1, __pyx_t_7); __pyx_t_7++; if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 877, __pyx_L1_error)
+          __pyx_t_2 = PySequence_ITEM(__pyx_t_1, __pyx_t_7); __pyx_t_7++; if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 963, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_2);
           #endif
         } else {
           if (__pyx_t_7 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
           #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-          __pyx_t_2 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_7); __Pyx_INCREF(__pyx_t_2); __pyx_t_7++; if (unlikely(0 < 0)) __PYX_ERR(1, 877, __pyx_L1_error)
+          __pyx_t_2 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_7); __Pyx_INCREF(__pyx_t_2); __pyx_t_7++; if (unlikely(0 < 0)) __PYX_ERR(1, 963, __pyx_L1_error)
           #else
-          __pyx_t_2 = PySequence_ITEM(__pyx_t_1, __pyx_t_7); __pyx_t_7++; if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 877, __pyx_L1_error)
+          __pyx_t_2 = PySequence_ITEM(__pyx_t_1, __pyx_t_7); __pyx_t_7++; if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 963, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_2);
           #endif
         }
@@ -5796,7 +6852,7 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
           PyObject* exc_type = PyErr_Occurred();
           if (exc_type) {
             if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-            else __PYX_ERR(1, 877, __pyx_L1_error)
+            else __PYX_ERR(1, 963, __pyx_L1_error)
           }
           break;
         }
@@ -5805,82 +6861,82 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
       __Pyx_XDECREF_SET(__pyx_v_kerning, __pyx_t_2);
       __pyx_t_2 = 0;
 
-      /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":878
+      /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":964
  *         if kernings is not None:
  *             for kerning in kernings.findall('kerning'):
  *                 first = int(kerning.attrib["first"])             # <<<<<<<<<<<<<<
  *                 second = int(kerning.attrib["second"])
  * 
  */
-      __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_kerning, __pyx_n_s_attrib); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 878, __pyx_L1_error)
+      __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_kerning, __pyx_n_s_attrib); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 964, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_3 = __Pyx_PyObject_Dict_GetItem(__pyx_t_2, __pyx_n_u_first); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 878, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyObject_Dict_GetItem(__pyx_t_2, __pyx_n_u_first); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 964, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __pyx_t_2 = __Pyx_PyNumber_Int(__pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 878, __pyx_L1_error)
+      __pyx_t_2 = __Pyx_PyNumber_Int(__pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 964, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_6 = __Pyx_PyInt_As_int(__pyx_t_2); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 878, __pyx_L1_error)
+      __pyx_t_6 = __Pyx_PyInt_As_int(__pyx_t_2); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 964, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
       __pyx_v_first = __pyx_t_6;
 
-      /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":879
+      /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":965
  *             for kerning in kernings.findall('kerning'):
  *                 first = int(kerning.attrib["first"])
  *                 second = int(kerning.attrib["second"])             # <<<<<<<<<<<<<<
  * 
  *                 if first not in self.kernings:
  */
-      __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_kerning, __pyx_n_s_attrib); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 879, __pyx_L1_error)
+      __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_kerning, __pyx_n_s_attrib); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 965, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_3 = __Pyx_PyObject_Dict_GetItem(__pyx_t_2, __pyx_n_u_second); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 879, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyObject_Dict_GetItem(__pyx_t_2, __pyx_n_u_second); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 965, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __pyx_t_2 = __Pyx_PyNumber_Int(__pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 879, __pyx_L1_error)
+      __pyx_t_2 = __Pyx_PyNumber_Int(__pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 965, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_6 = __Pyx_PyInt_As_int(__pyx_t_2); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 879, __pyx_L1_error)
+      __pyx_t_6 = __Pyx_PyInt_As_int(__pyx_t_2); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 965, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
       __pyx_v_second = __pyx_t_6;
 
-      /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":881
+      /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":967
  *                 second = int(kerning.attrib["second"])
  * 
  *                 if first not in self.kernings:             # <<<<<<<<<<<<<<
  *                     self.kernings[first] = {}
  * 
  */
-      __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_first); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 881, __pyx_L1_error)
+      __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_first); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 967, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
       if (unlikely(__pyx_v_self->kernings == Py_None)) {
         PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
-        __PYX_ERR(1, 881, __pyx_L1_error)
+        __PYX_ERR(1, 967, __pyx_L1_error)
       }
-      __pyx_t_5 = (__Pyx_PyDict_ContainsTF(__pyx_t_2, __pyx_v_self->kernings, Py_NE)); if (unlikely(__pyx_t_5 < 0)) __PYX_ERR(1, 881, __pyx_L1_error)
+      __pyx_t_5 = (__Pyx_PyDict_ContainsTF(__pyx_t_2, __pyx_v_self->kernings, Py_NE)); if (unlikely(__pyx_t_5 < 0)) __PYX_ERR(1, 967, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
       __pyx_t_4 = (__pyx_t_5 != 0);
       if (__pyx_t_4) {
 
-        /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":882
+        /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":968
  * 
  *                 if first not in self.kernings:
  *                     self.kernings[first] = {}             # <<<<<<<<<<<<<<
  * 
  *                 self.kernings[first][second] = int(kerning.attrib["amount"])
  */
-        __pyx_t_2 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 882, __pyx_L1_error)
+        __pyx_t_2 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 968, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_2);
         if (unlikely(__pyx_v_self->kernings == Py_None)) {
           PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-          __PYX_ERR(1, 882, __pyx_L1_error)
+          __PYX_ERR(1, 968, __pyx_L1_error)
         }
-        __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_first); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 882, __pyx_L1_error)
+        __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_first); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 968, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_3);
-        if (unlikely(PyDict_SetItem(__pyx_v_self->kernings, __pyx_t_3, __pyx_t_2) < 0)) __PYX_ERR(1, 882, __pyx_L1_error)
+        if (unlikely(PyDict_SetItem(__pyx_v_self->kernings, __pyx_t_3, __pyx_t_2) < 0)) __PYX_ERR(1, 968, __pyx_L1_error)
         __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
         __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-        /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":881
+        /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":967
  *                 second = int(kerning.attrib["second"])
  * 
  *                 if first not in self.kernings:             # <<<<<<<<<<<<<<
@@ -5889,35 +6945,35 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
  */
       }
 
-      /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":884
+      /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":970
  *                     self.kernings[first] = {}
  * 
  *                 self.kernings[first][second] = int(kerning.attrib["amount"])             # <<<<<<<<<<<<<<
  * 
  * 
  */
-      __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_kerning, __pyx_n_s_attrib); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 884, __pyx_L1_error)
+      __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_kerning, __pyx_n_s_attrib); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 970, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_3 = __Pyx_PyObject_Dict_GetItem(__pyx_t_2, __pyx_n_u_amount); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 884, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyObject_Dict_GetItem(__pyx_t_2, __pyx_n_u_amount); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 970, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __pyx_t_2 = __Pyx_PyNumber_Int(__pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 884, __pyx_L1_error)
+      __pyx_t_2 = __Pyx_PyNumber_Int(__pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 970, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       if (unlikely(__pyx_v_self->kernings == Py_None)) {
         PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-        __PYX_ERR(1, 884, __pyx_L1_error)
+        __PYX_ERR(1, 970, __pyx_L1_error)
       }
-      __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_first); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 884, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_first); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 970, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_9 = __Pyx_PyDict_GetItem(__pyx_v_self->kernings, __pyx_t_3); if (unlikely(!__pyx_t_9)) __PYX_ERR(1, 884, __pyx_L1_error)
+      __pyx_t_9 = __Pyx_PyDict_GetItem(__pyx_v_self->kernings, __pyx_t_3); if (unlikely(!__pyx_t_9)) __PYX_ERR(1, 970, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_9);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      if (unlikely(__Pyx_SetItemInt(__pyx_t_9, __pyx_v_second, __pyx_t_2, int, 1, __Pyx_PyInt_From_int, 0, 1, 1) < 0)) __PYX_ERR(1, 884, __pyx_L1_error)
+      if (unlikely(__Pyx_SetItemInt(__pyx_t_9, __pyx_v_second, __pyx_t_2, int, 1, __Pyx_PyInt_From_int, 0, 1, 1) < 0)) __PYX_ERR(1, 970, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-      /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":877
+      /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":963
  *         kernings = root.find('kernings')
  *         if kernings is not None:
  *             for kerning in kernings.findall('kerning'):             # <<<<<<<<<<<<<<
@@ -5927,7 +6983,7 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
     }
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":876
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":962
  *         # kerning
  *         kernings = root.find('kernings')
  *         if kernings is not None:             # <<<<<<<<<<<<<<
@@ -5936,7 +6992,7 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
  */
   }
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":834
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":920
  *                         self.kernings[first][second] = int(m.group("amount"))
  * 
  *     def _load_descriptor_xml(self, xml_tree: ElementTree):             # <<<<<<<<<<<<<<
@@ -5968,7 +7024,7 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
   return __pyx_r;
 }
 
-/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":887
+/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":973
  * 
  * 
  *     def get_descent(self):             # <<<<<<<<<<<<<<
@@ -5994,9 +7050,12 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("get_descent", 0);
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":888
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":974
  * 
  *     def get_descent(self):
  *         return self.base - self.line_height             # <<<<<<<<<<<<<<
@@ -6004,13 +7063,13 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
  *     def get_ascent(self):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_int((__pyx_v_self->base - __pyx_v_self->line_height)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 888, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_int((__pyx_v_self->base - __pyx_v_self->line_height)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 974, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":887
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":973
  * 
  * 
  *     def get_descent(self):             # <<<<<<<<<<<<<<
@@ -6029,7 +7088,7 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
   return __pyx_r;
 }
 
-/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":890
+/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":976
  *         return self.base - self.line_height
  * 
  *     def get_ascent(self):             # <<<<<<<<<<<<<<
@@ -6055,9 +7114,12 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_2
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("get_ascent", 0);
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":891
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":977
  * 
  *     def get_ascent(self):
  *         return self.base             # <<<<<<<<<<<<<<
@@ -6065,13 +7127,13 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_2
  *     def get_extents(self, str text, font_kerning=True):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->base); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 891, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->base); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 977, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":890
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":976
  *         return self.base - self.line_height
  * 
  *     def get_ascent(self):             # <<<<<<<<<<<<<<
@@ -6090,7 +7152,7 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_2
   return __pyx_r;
 }
 
-/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":893
+/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":979
  *         return self.base
  * 
  *     def get_extents(self, str text, font_kerning=True):             # <<<<<<<<<<<<<<
@@ -6104,6 +7166,9 @@ static char __pyx_doc_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_22get
 static PyObject *__pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_23get_extents(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyObject *__pyx_v_text = 0;
   PyObject *__pyx_v_font_kerning = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("get_extents (wrapper)", 0);
@@ -6135,7 +7200,7 @@ static PyObject *__pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_2
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "get_extents") < 0)) __PYX_ERR(1, 893, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "get_extents") < 0)) __PYX_ERR(1, 979, __pyx_L3_error)
       }
     } else {
       switch (PyTuple_GET_SIZE(__pyx_args)) {
@@ -6151,13 +7216,13 @@ static PyObject *__pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_2
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("get_extents", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(1, 893, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("get_extents", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(1, 979, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("mpfmc.uix.bitmap_font.bitmap_font.BitmapFont.get_extents", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_text), (&PyUnicode_Type), 1, "text", 1))) __PYX_ERR(1, 893, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_text), (&PyUnicode_Type), 1, "text", 1))) __PYX_ERR(1, 979, __pyx_L1_error)
   __pyx_r = __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_22get_extents(((struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont *)__pyx_v_self), __pyx_v_text, __pyx_v_font_kerning);
 
   /* function exit code */
@@ -6174,8 +7239,8 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_2
   int __pyx_v_previous_char;
   int __pyx_v_current_char;
   int __pyx_v_use_kerning;
+  struct __pyx_t_5mpfmc_3uix_11bitmap_font_11bitmap_font_GlyphInfo __pyx_v_glyph;
   Py_UCS4 __pyx_v_text_char;
-  PyObject *__pyx_v_char_info = NULL;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   int __pyx_t_1;
@@ -6186,14 +7251,16 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_2
   int __pyx_t_6;
   int __pyx_t_7;
   Py_ssize_t __pyx_t_8;
-  PyObject *__pyx_t_9 = NULL;
-  int __pyx_t_10;
+  int __pyx_t_9;
+  PyObject *__pyx_t_10 = NULL;
   PyObject *__pyx_t_11 = NULL;
   PyObject *__pyx_t_12 = NULL;
-  int __pyx_t_13;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("get_extents", 0);
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":894
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":980
  * 
  *     def get_extents(self, str text, font_kerning=True):
  *         cdef int width = 0             # <<<<<<<<<<<<<<
@@ -6202,7 +7269,7 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_2
  */
   __pyx_v_width = 0;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":895
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":981
  *     def get_extents(self, str text, font_kerning=True):
  *         cdef int width = 0
  *         cdef int previous_char = -1             # <<<<<<<<<<<<<<
@@ -6211,194 +7278,103 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_2
  */
   __pyx_v_previous_char = -1;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":897
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":983
  *         cdef int previous_char = -1
  *         cdef int current_char
  *         cdef bint use_kerning = font_kerning             # <<<<<<<<<<<<<<
- * 
- *         for text_char in text:
+ *         cdef GlyphInfo glyph
+ *         cdef Py_UCS4 text_char
  */
-  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_font_kerning); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 897, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_font_kerning); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 983, __pyx_L1_error)
   __pyx_v_use_kerning = __pyx_t_1;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":899
- *         cdef bint use_kerning = font_kerning
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":987
+ *         cdef Py_UCS4 text_char
  * 
  *         for text_char in text:             # <<<<<<<<<<<<<<
- *             current_char = ord(text_char)
- *             if current_char in self.characters:
+ *             current_char = text_char
+ *             if self._get_glyph(current_char, &glyph):
  */
   if (unlikely(__pyx_v_text == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "'NoneType' is not iterable");
-    __PYX_ERR(1, 899, __pyx_L1_error)
+    __PYX_ERR(1, 987, __pyx_L1_error)
   }
   __Pyx_INCREF(__pyx_v_text);
   __pyx_t_2 = __pyx_v_text;
-  __pyx_t_7 = __Pyx_init_unicode_iteration(__pyx_t_2, (&__pyx_t_4), (&__pyx_t_5), (&__pyx_t_6)); if (unlikely(__pyx_t_7 == ((int)-1))) __PYX_ERR(1, 899, __pyx_L1_error)
+  __pyx_t_7 = __Pyx_init_unicode_iteration(__pyx_t_2, (&__pyx_t_4), (&__pyx_t_5), (&__pyx_t_6)); if (unlikely(__pyx_t_7 == ((int)-1))) __PYX_ERR(1, 987, __pyx_L1_error)
   for (__pyx_t_8 = 0; __pyx_t_8 < __pyx_t_4; __pyx_t_8++) {
     __pyx_t_3 = __pyx_t_8;
     __pyx_v_text_char = __Pyx_PyUnicode_READ(__pyx_t_6, __pyx_t_5, __pyx_t_3);
 
-    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":900
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":988
  * 
  *         for text_char in text:
- *             current_char = ord(text_char)             # <<<<<<<<<<<<<<
- *             if current_char in self.characters:
- *                 char_info = self.characters[current_char]
+ *             current_char = text_char             # <<<<<<<<<<<<<<
+ *             if self._get_glyph(current_char, &glyph):
+ *                 width += glyph.xadvance
  */
-    __pyx_v_current_char = ((long)__pyx_v_text_char);
+    __pyx_v_current_char = __pyx_v_text_char;
 
-    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":901
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":989
  *         for text_char in text:
- *             current_char = ord(text_char)
- *             if current_char in self.characters:             # <<<<<<<<<<<<<<
- *                 char_info = self.characters[current_char]
- *                 width += char_info.xadvance
- */
-    __pyx_t_9 = __Pyx_PyInt_From_int(__pyx_v_current_char); if (unlikely(!__pyx_t_9)) __PYX_ERR(1, 901, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_9);
-    if (unlikely(__pyx_v_self->characters == Py_None)) {
-      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
-      __PYX_ERR(1, 901, __pyx_L1_error)
-    }
-    __pyx_t_1 = (__Pyx_PyDict_ContainsTF(__pyx_t_9, __pyx_v_self->characters, Py_EQ)); if (unlikely(__pyx_t_1 < 0)) __PYX_ERR(1, 901, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-    __pyx_t_10 = (__pyx_t_1 != 0);
-    if (__pyx_t_10) {
-
-      /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":902
- *             current_char = ord(text_char)
- *             if current_char in self.characters:
- *                 char_info = self.characters[current_char]             # <<<<<<<<<<<<<<
- *                 width += char_info.xadvance
+ *             current_char = text_char
+ *             if self._get_glyph(current_char, &glyph):             # <<<<<<<<<<<<<<
+ *                 width += glyph.xadvance
  * 
  */
-      if (unlikely(__pyx_v_self->characters == Py_None)) {
-        PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-        __PYX_ERR(1, 902, __pyx_L1_error)
-      }
-      __pyx_t_9 = __Pyx_PyInt_From_int(__pyx_v_current_char); if (unlikely(!__pyx_t_9)) __PYX_ERR(1, 902, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_9);
-      __pyx_t_11 = __Pyx_PyDict_GetItem(__pyx_v_self->characters, __pyx_t_9); if (unlikely(!__pyx_t_11)) __PYX_ERR(1, 902, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_11);
-      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-      __Pyx_XDECREF_SET(__pyx_v_char_info, __pyx_t_11);
-      __pyx_t_11 = 0;
+    __pyx_t_1 = ((struct __pyx_vtabstruct_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont *)__pyx_v_self->__pyx_vtab)->_get_glyph(__pyx_v_self, __pyx_v_current_char, (&__pyx_v_glyph)); if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 989, __pyx_L1_error)
+    __pyx_t_9 = (__pyx_t_1 != 0);
+    if (__pyx_t_9) {
 
-      /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":903
- *             if current_char in self.characters:
- *                 char_info = self.characters[current_char]
- *                 width += char_info.xadvance             # <<<<<<<<<<<<<<
+      /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":990
+ *             current_char = text_char
+ *             if self._get_glyph(current_char, &glyph):
+ *                 width += glyph.xadvance             # <<<<<<<<<<<<<<
  * 
- *                 if use_kerning and previous_char in self.kernings and current_char in self.kernings[previous_char]:
+ *                 if use_kerning:
  */
-      __pyx_t_11 = __Pyx_PyInt_From_int(__pyx_v_width); if (unlikely(!__pyx_t_11)) __PYX_ERR(1, 903, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_11);
-      __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_v_char_info, __pyx_n_s_xadvance); if (unlikely(!__pyx_t_9)) __PYX_ERR(1, 903, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_9);
-      __pyx_t_12 = PyNumber_InPlaceAdd(__pyx_t_11, __pyx_t_9); if (unlikely(!__pyx_t_12)) __PYX_ERR(1, 903, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_12);
-      __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
-      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-      __pyx_t_7 = __Pyx_PyInt_As_int(__pyx_t_12); if (unlikely((__pyx_t_7 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 903, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
-      __pyx_v_width = __pyx_t_7;
+      __pyx_v_width = (__pyx_v_width + __pyx_v_glyph.xadvance);
 
-      /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":905
- *                 width += char_info.xadvance
+      /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":992
+ *                 width += glyph.xadvance
  * 
- *                 if use_kerning and previous_char in self.kernings and current_char in self.kernings[previous_char]:             # <<<<<<<<<<<<<<
- *                     width += self.kernings[previous_char][current_char]
+ *                 if use_kerning:             # <<<<<<<<<<<<<<
+ *                     width += self._get_kerning(previous_char, current_char)
  * 
  */
-      __pyx_t_1 = (__pyx_v_use_kerning != 0);
-      if (__pyx_t_1) {
-      } else {
-        __pyx_t_10 = __pyx_t_1;
-        goto __pyx_L7_bool_binop_done;
-      }
-      __pyx_t_12 = __Pyx_PyInt_From_int(__pyx_v_previous_char); if (unlikely(!__pyx_t_12)) __PYX_ERR(1, 905, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_12);
-      if (unlikely(__pyx_v_self->kernings == Py_None)) {
-        PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
-        __PYX_ERR(1, 905, __pyx_L1_error)
-      }
-      __pyx_t_1 = (__Pyx_PyDict_ContainsTF(__pyx_t_12, __pyx_v_self->kernings, Py_EQ)); if (unlikely(__pyx_t_1 < 0)) __PYX_ERR(1, 905, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
-      __pyx_t_13 = (__pyx_t_1 != 0);
-      if (__pyx_t_13) {
-      } else {
-        __pyx_t_10 = __pyx_t_13;
-        goto __pyx_L7_bool_binop_done;
-      }
-      __pyx_t_12 = __Pyx_PyInt_From_int(__pyx_v_current_char); if (unlikely(!__pyx_t_12)) __PYX_ERR(1, 905, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_12);
-      if (unlikely(__pyx_v_self->kernings == Py_None)) {
-        PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-        __PYX_ERR(1, 905, __pyx_L1_error)
-      }
-      __pyx_t_9 = __Pyx_PyInt_From_int(__pyx_v_previous_char); if (unlikely(!__pyx_t_9)) __PYX_ERR(1, 905, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_9);
-      __pyx_t_11 = __Pyx_PyDict_GetItem(__pyx_v_self->kernings, __pyx_t_9); if (unlikely(!__pyx_t_11)) __PYX_ERR(1, 905, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_11);
-      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-      __pyx_t_13 = (__Pyx_PySequence_ContainsTF(__pyx_t_12, __pyx_t_11, Py_EQ)); if (unlikely(__pyx_t_13 < 0)) __PYX_ERR(1, 905, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
-      __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
-      __pyx_t_1 = (__pyx_t_13 != 0);
-      __pyx_t_10 = __pyx_t_1;
-      __pyx_L7_bool_binop_done:;
-      if (__pyx_t_10) {
+      __pyx_t_9 = (__pyx_v_use_kerning != 0);
+      if (__pyx_t_9) {
 
-        /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":906
+        /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":993
  * 
- *                 if use_kerning and previous_char in self.kernings and current_char in self.kernings[previous_char]:
- *                     width += self.kernings[previous_char][current_char]             # <<<<<<<<<<<<<<
+ *                 if use_kerning:
+ *                     width += self._get_kerning(previous_char, current_char)             # <<<<<<<<<<<<<<
  * 
  *             previous_char = current_char
  */
-        __pyx_t_11 = __Pyx_PyInt_From_int(__pyx_v_width); if (unlikely(!__pyx_t_11)) __PYX_ERR(1, 906, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_11);
-        if (unlikely(__pyx_v_self->kernings == Py_None)) {
-          PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-          __PYX_ERR(1, 906, __pyx_L1_error)
-        }
-        __pyx_t_12 = __Pyx_PyInt_From_int(__pyx_v_previous_char); if (unlikely(!__pyx_t_12)) __PYX_ERR(1, 906, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_12);
-        __pyx_t_9 = __Pyx_PyDict_GetItem(__pyx_v_self->kernings, __pyx_t_12); if (unlikely(!__pyx_t_9)) __PYX_ERR(1, 906, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_9);
-        __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
-        __pyx_t_12 = __Pyx_GetItemInt(__pyx_t_9, __pyx_v_current_char, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(!__pyx_t_12)) __PYX_ERR(1, 906, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_12);
-        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-        __pyx_t_9 = PyNumber_InPlaceAdd(__pyx_t_11, __pyx_t_12); if (unlikely(!__pyx_t_9)) __PYX_ERR(1, 906, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_9);
-        __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
-        __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
-        __pyx_t_7 = __Pyx_PyInt_As_int(__pyx_t_9); if (unlikely((__pyx_t_7 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 906, __pyx_L1_error)
-        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-        __pyx_v_width = __pyx_t_7;
-
-        /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":905
- *                 width += char_info.xadvance
- * 
- *                 if use_kerning and previous_char in self.kernings and current_char in self.kernings[previous_char]:             # <<<<<<<<<<<<<<
- *                     width += self.kernings[previous_char][current_char]
+        __pyx_t_7 = ((struct __pyx_vtabstruct_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont *)__pyx_v_self->__pyx_vtab)->_get_kerning(__pyx_v_self, __pyx_v_previous_char, __pyx_v_current_char); if (unlikely(__pyx_t_7 == ((int)-1) && PyErr_Occurred())) __PYX_ERR(1, 993, __pyx_L1_error)
+        __pyx_v_width = (__pyx_v_width + __pyx_t_7);
+
+        /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":992
+ *                 width += glyph.xadvance
+ * 
+ *                 if use_kerning:             # <<<<<<<<<<<<<<
+ *                     width += self._get_kerning(previous_char, current_char)
  * 
  */
       }
 
-      /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":901
+      /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":989
  *         for text_char in text:
- *             current_char = ord(text_char)
- *             if current_char in self.characters:             # <<<<<<<<<<<<<<
- *                 char_info = self.characters[current_char]
- *                 width += char_info.xadvance
+ *             current_char = text_char
+ *             if self._get_glyph(current_char, &glyph):             # <<<<<<<<<<<<<<
+ *                 width += glyph.xadvance
+ * 
  */
     }
 
-    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":908
- *                     width += self.kernings[previous_char][current_char]
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":995
+ *                     width += self._get_kerning(previous_char, current_char)
  * 
  *             previous_char = current_char             # <<<<<<<<<<<<<<
  * 
@@ -6408,7 +7384,7 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_2
   }
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":910
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":997
  *             previous_char = current_char
  * 
  *         return width, self.line_height             # <<<<<<<<<<<<<<
@@ -6416,23 +7392,23 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_2
  * 
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_9 = __Pyx_PyInt_From_int(__pyx_v_width); if (unlikely(!__pyx_t_9)) __PYX_ERR(1, 910, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_9);
-  __pyx_t_12 = __Pyx_PyInt_From_int(__pyx_v_self->line_height); if (unlikely(!__pyx_t_12)) __PYX_ERR(1, 910, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_12);
-  __pyx_t_11 = PyTuple_New(2); if (unlikely(!__pyx_t_11)) __PYX_ERR(1, 910, __pyx_L1_error)
+  __pyx_t_10 = __Pyx_PyInt_From_int(__pyx_v_width); if (unlikely(!__pyx_t_10)) __PYX_ERR(1, 997, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_10);
+  __pyx_t_11 = __Pyx_PyInt_From_int(__pyx_v_self->line_height); if (unlikely(!__pyx_t_11)) __PYX_ERR(1, 997, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_11);
-  __Pyx_GIVEREF(__pyx_t_9);
-  PyTuple_SET_ITEM(__pyx_t_11, 0, __pyx_t_9);
-  __Pyx_GIVEREF(__pyx_t_12);
-  PyTuple_SET_ITEM(__pyx_t_11, 1, __pyx_t_12);
-  __pyx_t_9 = 0;
-  __pyx_t_12 = 0;
-  __pyx_r = __pyx_t_11;
+  __pyx_t_12 = PyTuple_New(2); if (unlikely(!__pyx_t_12)) __PYX_ERR(1, 997, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_12);
+  __Pyx_GIVEREF(__pyx_t_10);
+  PyTuple_SET_ITEM(__pyx_t_12, 0, __pyx_t_10);
+  __Pyx_GIVEREF(__pyx_t_11);
+  PyTuple_SET_ITEM(__pyx_t_12, 1, __pyx_t_11);
+  __pyx_t_10 = 0;
   __pyx_t_11 = 0;
+  __pyx_r = __pyx_t_12;
+  __pyx_t_12 = 0;
   goto __pyx_L0;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":893
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":979
  *         return self.base
  * 
  *     def get_extents(self, str text, font_kerning=True):             # <<<<<<<<<<<<<<
@@ -6443,19 +7419,18 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_2
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_10);
   __Pyx_XDECREF(__pyx_t_11);
   __Pyx_XDECREF(__pyx_t_12);
   __Pyx_AddTraceback("mpfmc.uix.bitmap_font.bitmap_font.BitmapFont.get_extents", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_char_info);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":633
+/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":646
  * 
  * cdef class BitmapFont:
  *     cdef public str face             # <<<<<<<<<<<<<<
@@ -6509,8 +7484,11 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_4face_2
   int __pyx_r;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
-  if (!(likely(PyUnicode_CheckExact(__pyx_v_value))||((__pyx_v_value) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "unicode", Py_TYPE(__pyx_v_value)->tp_name), 0))) __PYX_ERR(1, 633, __pyx_L1_error)
+  if (!(likely(PyUnicode_CheckExact(__pyx_v_value))||((__pyx_v_value) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "unicode", Py_TYPE(__pyx_v_value)->tp_name), 0))) __PYX_ERR(1, 646, __pyx_L1_error)
   __pyx_t_1 = __pyx_v_value;
   __Pyx_INCREF(__pyx_t_1);
   __Pyx_GIVEREF(__pyx_t_1);
@@ -6560,7 +7538,7 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_4face_4
   return __pyx_r;
 }
 
-/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":634
+/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":647
  * cdef class BitmapFont:
  *     cdef public str face
  *     cdef public bint bold             # <<<<<<<<<<<<<<
@@ -6585,9 +7563,12 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_4
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyBool_FromLong(__pyx_v_self->bold); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 634, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyBool_FromLong(__pyx_v_self->bold); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 647, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -6621,8 +7602,11 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_4bold_2
   int __pyx_r;
   __Pyx_RefNannyDeclarations
   int __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
-  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 634, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 647, __pyx_L1_error)
   __pyx_v_self->bold = __pyx_t_1;
 
   /* function exit code */
@@ -6636,7 +7620,7 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_4bold_2
   return __pyx_r;
 }
 
-/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":635
+/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":648
  *     cdef public str face
  *     cdef public bint bold
  *     cdef public bint italic             # <<<<<<<<<<<<<<
@@ -6661,9 +7645,12 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_6
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyBool_FromLong(__pyx_v_self->italic); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 635, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyBool_FromLong(__pyx_v_self->italic); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 648, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -6697,8 +7684,11 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_6italic
   int __pyx_r;
   __Pyx_RefNannyDeclarations
   int __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
-  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 635, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 648, __pyx_L1_error)
   __pyx_v_self->italic = __pyx_t_1;
 
   /* function exit code */
@@ -6712,7 +7702,7 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_6italic
   return __pyx_r;
 }
 
-/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":636
+/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":649
  *     cdef public bint bold
  *     cdef public bint italic
  *     cdef public int padding             # <<<<<<<<<<<<<<
@@ -6737,9 +7727,12 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_7
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->padding); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 636, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->padding); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 649, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -6773,8 +7766,11 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_7paddin
   int __pyx_r;
   __Pyx_RefNannyDeclarations
   int __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
-  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 636, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 649, __pyx_L1_error)
   __pyx_v_self->padding = __pyx_t_1;
 
   /* function exit code */
@@ -6788,7 +7784,7 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_7paddin
   return __pyx_r;
 }
 
-/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":637
+/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":650
  *     cdef public bint italic
  *     cdef public int padding
  *     cdef public int spacing             # <<<<<<<<<<<<<<
@@ -6813,9 +7809,12 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_7
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->spacing); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 637, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->spacing); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 650, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -6849,8 +7848,11 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_7spacin
   int __pyx_r;
   __Pyx_RefNannyDeclarations
   int __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
-  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 637, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 650, __pyx_L1_error)
   __pyx_v_self->spacing = __pyx_t_1;
 
   /* function exit code */
@@ -6864,7 +7866,7 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_7spacin
   return __pyx_r;
 }
 
-/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":638
+/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":651
  *     cdef public int padding
  *     cdef public int spacing
  *     cdef public int outline             # <<<<<<<<<<<<<<
@@ -6889,9 +7891,12 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_7
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->outline); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 638, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->outline); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 651, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -6925,8 +7930,11 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_7outlin
   int __pyx_r;
   __Pyx_RefNannyDeclarations
   int __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
-  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 638, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 651, __pyx_L1_error)
   __pyx_v_self->outline = __pyx_t_1;
 
   /* function exit code */
@@ -6940,7 +7948,7 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_7outlin
   return __pyx_r;
 }
 
-/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":640
+/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":653
  *     cdef public int outline
  * 
  *     cdef public int line_height             # <<<<<<<<<<<<<<
@@ -6965,9 +7973,12 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_1
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->line_height); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 640, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->line_height); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 653, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -7001,8 +8012,11 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_11line_
   int __pyx_r;
   __Pyx_RefNannyDeclarations
   int __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
-  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 640, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 653, __pyx_L1_error)
   __pyx_v_self->line_height = __pyx_t_1;
 
   /* function exit code */
@@ -7016,7 +8030,7 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_11line_
   return __pyx_r;
 }
 
-/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":641
+/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":654
  * 
  *     cdef public int line_height
  *     cdef public int base             # <<<<<<<<<<<<<<
@@ -7041,9 +8055,12 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_4
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->base); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 641, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->base); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 654, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -7077,8 +8094,11 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_4base_2
   int __pyx_r;
   __Pyx_RefNannyDeclarations
   int __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
-  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 641, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 654, __pyx_L1_error)
   __pyx_v_self->base = __pyx_t_1;
 
   /* function exit code */
@@ -7092,7 +8112,7 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_4base_2
   return __pyx_r;
 }
 
-/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":642
+/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":655
  *     cdef public int line_height
  *     cdef public int base
  *     cdef public int scale_w             # <<<<<<<<<<<<<<
@@ -7117,9 +8137,12 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_7
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->scale_w); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 642, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->scale_w); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 655, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -7153,8 +8176,11 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_7scale_
   int __pyx_r;
   __Pyx_RefNannyDeclarations
   int __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
-  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 642, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 655, __pyx_L1_error)
   __pyx_v_self->scale_w = __pyx_t_1;
 
   /* function exit code */
@@ -7168,7 +8194,7 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_7scale_
   return __pyx_r;
 }
 
-/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":643
+/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":656
  *     cdef public int base
  *     cdef public int scale_w
  *     cdef public int scale_h             # <<<<<<<<<<<<<<
@@ -7193,9 +8219,12 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_7
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->scale_h); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 643, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->scale_h); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 656, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -7229,8 +8258,11 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_7scale_
   int __pyx_r;
   __Pyx_RefNannyDeclarations
   int __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
-  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 643, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 656, __pyx_L1_error)
   __pyx_v_self->scale_h = __pyx_t_1;
 
   /* function exit code */
@@ -7268,6 +8300,9 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_2
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__reduce_cython__", 0);
 
   /* "(tree fragment)":2
@@ -7323,6 +8358,9 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_2
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__setstate_cython__", 0);
 
   /* "(tree fragment)":4
@@ -7353,7 +8391,7 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_2
   return __pyx_r;
 }
 
-/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":917
+/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":1010
  *     cdef int w, h
  * 
  *     def __cinit__(self, w, h):             # <<<<<<<<<<<<<<
@@ -7366,6 +8404,9 @@ static int __pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_
 static int __pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_1__cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyObject *__pyx_v_w = 0;
   PyObject *__pyx_v_h = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   int __pyx_r;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__cinit__ (wrapper)", 0);
@@ -7392,11 +8433,11 @@ static int __pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_h)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 2, 2, 1); __PYX_ERR(1, 917, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 2, 2, 1); __PYX_ERR(1, 1010, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__cinit__") < 0)) __PYX_ERR(1, 917, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__cinit__") < 0)) __PYX_ERR(1, 1010, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
       goto __pyx_L5_argtuple_error;
@@ -7409,7 +8450,7 @@ static int __pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(1, 917, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(1, 1010, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("mpfmc.uix.bitmap_font.bitmap_font._SurfaceContainer.__cinit__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
@@ -7426,9 +8467,12 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_
   int __pyx_r;
   __Pyx_RefNannyDeclarations
   int __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__cinit__", 0);
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":918
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":1011
  * 
  *     def __cinit__(self, w, h):
  *         self.surface = NULL             # <<<<<<<<<<<<<<
@@ -7437,27 +8481,27 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_
  */
   __pyx_v_self->surface = NULL;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":919
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":1012
  *     def __cinit__(self, w, h):
  *         self.surface = NULL
  *         self.w = w             # <<<<<<<<<<<<<<
  *         self.h = h
  * 
  */
-  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_w); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 919, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_w); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 1012, __pyx_L1_error)
   __pyx_v_self->w = __pyx_t_1;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":920
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":1013
  *         self.surface = NULL
  *         self.w = w
  *         self.h = h             # <<<<<<<<<<<<<<
  * 
  *     def __init__(self, w, h):
  */
-  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_h); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 920, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_h); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 1013, __pyx_L1_error)
   __pyx_v_self->h = __pyx_t_1;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":917
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":1010
  *     cdef int w, h
  * 
  *     def __cinit__(self, w, h):             # <<<<<<<<<<<<<<
@@ -7476,7 +8520,7 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_
   return __pyx_r;
 }
 
-/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":922
+/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":1015
  *         self.h = h
  * 
  *     def __init__(self, w, h):             # <<<<<<<<<<<<<<
@@ -7489,6 +8533,9 @@ static int __pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_
 static int __pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_3__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyObject *__pyx_v_w = 0;
   PyObject *__pyx_v_h = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   int __pyx_r;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__init__ (wrapper)", 0);
@@ -7515,11 +8562,11 @@ static int __pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_h)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 1, 2, 2, 1); __PYX_ERR(1, 922, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("__init__", 1, 2, 2, 1); __PYX_ERR(1, 1015, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(1, 922, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(1, 1015, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
       goto __pyx_L5_argtuple_error;
@@ -7532,7 +8579,7 @@ static int __pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__init__", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(1, 922, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("__init__", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(1, 1015, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("mpfmc.uix.bitmap_font.bitmap_font._SurfaceContainer.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
@@ -7552,20 +8599,23 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_
   int __pyx_t_2;
   PyObject *__pyx_t_3 = NULL;
   PyObject *__pyx_t_4 = NULL;
-  size_t __pyx_t_5;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__init__", 0);
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":926
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":1019
  *         # here.
  *         self.surface = SDL_CreateRGBSurface(0,
  *             w, h, 32,             # <<<<<<<<<<<<<<
  *             0x000000ff, 0x0000ff00, 0x00ff0000, 0xff000000)
- *         memset(self.surface.pixels, 0, w * h * 4)
+ *         self.clear()
  */
-  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_w); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 926, __pyx_L1_error)
-  __pyx_t_2 = __Pyx_PyInt_As_int(__pyx_v_h); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 926, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_w); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 1019, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyInt_As_int(__pyx_v_h); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 1019, __pyx_L1_error)
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":925
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":1018
  *         # XXX check on OSX to see if little endian/big endian make a difference
  *         # here.
  *         self.surface = SDL_CreateRGBSurface(0,             # <<<<<<<<<<<<<<
@@ -7574,23 +8624,33 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_
  */
   __pyx_v_self->surface = SDL_CreateRGBSurface(0, __pyx_t_1, __pyx_t_2, 32, 0x000000ff, 0x0000ff00, 0x00ff0000, 0xff000000);
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":928
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":1021
  *             w, h, 32,
  *             0x000000ff, 0x0000ff00, 0x00ff0000, 0xff000000)
- *         memset(self.surface.pixels, 0, w * h * 4)             # <<<<<<<<<<<<<<
+ *         self.clear()             # <<<<<<<<<<<<<<
  * 
  *     def __dealloc__(self):
  */
-  __pyx_t_3 = PyNumber_Multiply(__pyx_v_w, __pyx_v_h); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 928, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = PyNumber_Multiply(__pyx_t_3, __pyx_int_4); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 928, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_clear); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 1021, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_5 = __Pyx_PyInt_As_size_t(__pyx_t_4); if (unlikely((__pyx_t_5 == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(1, 928, __pyx_L1_error)
+  __pyx_t_5 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
+    if (likely(__pyx_t_5)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_4, function);
+    }
+  }
+  __pyx_t_3 = (__pyx_t_5) ? __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_5) : __Pyx_PyObject_CallNoArg(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 1021, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  (void)(memset(__pyx_v_self->surface->pixels, 0, __pyx_t_5));
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":922
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":1015
  *         self.h = h
  * 
  *     def __init__(self, w, h):             # <<<<<<<<<<<<<<
@@ -7604,6 +8664,7 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
   __Pyx_AddTraceback("mpfmc.uix.bitmap_font.bitmap_font._SurfaceContainer.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = -1;
   __pyx_L0:;
@@ -7611,8 +8672,8 @@ static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_
   return __pyx_r;
 }
 
-/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":930
- *         memset(self.surface.pixels, 0, w * h * 4)
+/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":1023
+ *         self.clear()
  * 
  *     def __dealloc__(self):             # <<<<<<<<<<<<<<
  *         if self.surface != NULL:
@@ -7635,7 +8696,7 @@ static void __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("__dealloc__", 0);
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":931
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":1024
  * 
  *     def __dealloc__(self):
  *         if self.surface != NULL:             # <<<<<<<<<<<<<<
@@ -7645,61 +8706,293 @@ static void __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer
   __pyx_t_1 = ((__pyx_v_self->surface != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":932
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":1025
  *     def __dealloc__(self):
  *         if self.surface != NULL:
  *             SDL_FreeSurface(self.surface)             # <<<<<<<<<<<<<<
  *             self.surface = NULL
  * 
  */
-    SDL_FreeSurface(__pyx_v_self->surface);
+    SDL_FreeSurface(__pyx_v_self->surface);
+
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":1026
+ *         if self.surface != NULL:
+ *             SDL_FreeSurface(self.surface)
+ *             self.surface = NULL             # <<<<<<<<<<<<<<
+ * 
+ *     def __getbuffer__(self, Py_buffer *buffer, int flags):
+ */
+    __pyx_v_self->surface = NULL;
+
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":1024
+ * 
+ *     def __dealloc__(self):
+ *         if self.surface != NULL:             # <<<<<<<<<<<<<<
+ *             SDL_FreeSurface(self.surface)
+ *             self.surface = NULL
+ */
+  }
+
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":1023
+ *         self.clear()
+ * 
+ *     def __dealloc__(self):             # <<<<<<<<<<<<<<
+ *         if self.surface != NULL:
+ *             SDL_FreeSurface(self.surface)
+ */
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+}
+
+/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":1028
+ *             self.surface = NULL
+ * 
+ *     def __getbuffer__(self, Py_buffer *buffer, int flags):             # <<<<<<<<<<<<<<
+ *         PyBuffer_FillInfo(buffer, self, self.surface.pixels,
+ *                           self.surface.w * self.surface.h * 4, 1, flags)
+ */
+
+/* Python wrapper */
+static CYTHON_UNUSED int __pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_7__getbuffer__(PyObject *__pyx_v_self, Py_buffer *__pyx_v_buffer, int __pyx_v_flags); /*proto*/
+static CYTHON_UNUSED int __pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_7__getbuffer__(PyObject *__pyx_v_self, Py_buffer *__pyx_v_buffer, int __pyx_v_flags) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__getbuffer__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_6__getbuffer__(((struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer *)__pyx_v_self), ((Py_buffer *)__pyx_v_buffer), ((int)__pyx_v_flags));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_6__getbuffer__(struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer *__pyx_v_self, Py_buffer *__pyx_v_buffer, int __pyx_v_flags) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  if (__pyx_v_buffer == NULL) {
+    PyErr_SetString(PyExc_BufferError, "PyObject_GetBuffer: view==NULL argument is obsolete");
+    return -1;
+  }
+  __Pyx_RefNannySetupContext("__getbuffer__", 0);
+  __pyx_v_buffer->obj = Py_None; __Pyx_INCREF(Py_None);
+  __Pyx_GIVEREF(__pyx_v_buffer->obj);
+
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":1029
+ * 
+ *     def __getbuffer__(self, Py_buffer *buffer, int flags):
+ *         PyBuffer_FillInfo(buffer, self, self.surface.pixels,             # <<<<<<<<<<<<<<
+ *                           self.surface.w * self.surface.h * 4, 1, flags)
+ * 
+ */
+  __pyx_t_1 = PyBuffer_FillInfo(__pyx_v_buffer, ((PyObject *)__pyx_v_self), __pyx_v_self->surface->pixels, ((__pyx_v_self->surface->w * __pyx_v_self->surface->h) * 4), 1, __pyx_v_flags); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(1, 1029, __pyx_L1_error)
+
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":1028
+ *             self.surface = NULL
+ * 
+ *     def __getbuffer__(self, Py_buffer *buffer, int flags):             # <<<<<<<<<<<<<<
+ *         PyBuffer_FillInfo(buffer, self, self.surface.pixels,
+ *                           self.surface.w * self.surface.h * 4, 1, flags)
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("mpfmc.uix.bitmap_font.bitmap_font._SurfaceContainer.__getbuffer__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  if (__pyx_v_buffer->obj != NULL) {
+    __Pyx_GOTREF(__pyx_v_buffer->obj);
+    __Pyx_DECREF(__pyx_v_buffer->obj); __pyx_v_buffer->obj = 0;
+  }
+  goto __pyx_L2;
+  __pyx_L0:;
+  if (__pyx_v_buffer->obj == Py_None) {
+    __Pyx_GOTREF(__pyx_v_buffer->obj);
+    __Pyx_DECREF(__pyx_v_buffer->obj); __pyx_v_buffer->obj = 0;
+  }
+  __pyx_L2:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":1032
+ *                           self.surface.w * self.surface.h * 4, 1, flags)
+ * 
+ *     def __releasebuffer__(self, Py_buffer *buffer):             # <<<<<<<<<<<<<<
+ *         pass
+ * 
+ */
+
+/* Python wrapper */
+static CYTHON_UNUSED void __pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_9__releasebuffer__(PyObject *__pyx_v_self, Py_buffer *__pyx_v_buffer); /*proto*/
+static CYTHON_UNUSED void __pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_9__releasebuffer__(PyObject *__pyx_v_self, Py_buffer *__pyx_v_buffer) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__releasebuffer__ (wrapper)", 0);
+  __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_8__releasebuffer__(((struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer *)__pyx_v_self), ((Py_buffer *)__pyx_v_buffer));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+}
+
+static void __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_8__releasebuffer__(CYTHON_UNUSED struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer *__pyx_v_self, CYTHON_UNUSED Py_buffer *__pyx_v_buffer) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__releasebuffer__", 0);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+}
+
+/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":1036
+ * 
+ *     @property
+ *     def size(self):             # <<<<<<<<<<<<<<
+ *         return self.w, self.h
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_4size_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_4size_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_4size___get__(((struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_4size___get__(struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__get__", 0);
+
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":1037
+ *     @property
+ *     def size(self):
+ *         return self.w, self.h             # <<<<<<<<<<<<<<
+ * 
+ *     def clear(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->w); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 1037, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_self->h); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 1037, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 1037, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_2);
+  __pyx_t_1 = 0;
+  __pyx_t_2 = 0;
+  __pyx_r = __pyx_t_3;
+  __pyx_t_3 = 0;
+  goto __pyx_L0;
+
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":1036
+ * 
+ *     @property
+ *     def size(self):             # <<<<<<<<<<<<<<
+ *         return self.w, self.h
+ * 
+ */
 
-    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":933
- *         if self.surface != NULL:
- *             SDL_FreeSurface(self.surface)
- *             self.surface = NULL             # <<<<<<<<<<<<<<
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("mpfmc.uix.bitmap_font.bitmap_font._SurfaceContainer.size.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":1039
+ *         return self.w, self.h
  * 
- *     def render(self, container, text, x, y):
+ *     def clear(self):             # <<<<<<<<<<<<<<
+ *         """Clear all pixels (fully transparent)."""
+ *         memset(self.surface.pixels, 0, self.w * self.h * 4)
  */
-    __pyx_v_self->surface = NULL;
 
-    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":931
+/* Python wrapper */
+static PyObject *__pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_11clear(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_10clear[] = "_SurfaceContainer.clear(self)\nClear all pixels (fully transparent).";
+static PyObject *__pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_11clear(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("clear (wrapper)", 0);
+  __pyx_r = __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_10clear(((struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_10clear(struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("clear", 0);
+
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":1041
+ *     def clear(self):
+ *         """Clear all pixels (fully transparent)."""
+ *         memset(self.surface.pixels, 0, self.w * self.h * 4)             # <<<<<<<<<<<<<<
  * 
- *     def __dealloc__(self):
- *         if self.surface != NULL:             # <<<<<<<<<<<<<<
- *             SDL_FreeSurface(self.surface)
- *             self.surface = NULL
+ *     def render(self, container, str text, int x, int y):
  */
-  }
+  (void)(memset(__pyx_v_self->surface->pixels, 0, ((__pyx_v_self->w * __pyx_v_self->h) * 4)));
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":930
- *         memset(self.surface.pixels, 0, w * h * 4)
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":1039
+ *         return self.w, self.h
  * 
- *     def __dealloc__(self):             # <<<<<<<<<<<<<<
- *         if self.surface != NULL:
- *             SDL_FreeSurface(self.surface)
+ *     def clear(self):             # <<<<<<<<<<<<<<
+ *         """Clear all pixels (fully transparent)."""
+ *         memset(self.surface.pixels, 0, self.w * self.h * 4)
  */
 
   /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
+  return __pyx_r;
 }
 
-/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":935
- *             self.surface = NULL
+/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":1043
+ *         memset(self.surface.pixels, 0, self.w * self.h * 4)
  * 
- *     def render(self, container, text, x, y):             # <<<<<<<<<<<<<<
+ *     def render(self, container, str text, int x, int y):             # <<<<<<<<<<<<<<
  *         """Render the text at the specified location."""
- *         cdef SDL_Rect cursor_rect
+ *         cdef BitmapFont font
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_7render(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_6render[] = "_SurfaceContainer.render(self, container, text, x, y)\nRender the text at the specified location.";
-static PyObject *__pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_7render(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_13render(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_12render[] = "_SurfaceContainer.render(self, container, unicode text, int x, int y)\nRender the text at the specified location.";
+static PyObject *__pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_13render(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyObject *__pyx_v_container = 0;
   PyObject *__pyx_v_text = 0;
-  PyObject *__pyx_v_x = 0;
-  PyObject *__pyx_v_y = 0;
+  int __pyx_v_x;
+  int __pyx_v_y;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("render (wrapper)", 0);
@@ -7730,340 +9023,81 @@ static PyObject *__pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceCont
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_text)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("render", 1, 4, 4, 1); __PYX_ERR(1, 935, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("render", 1, 4, 4, 1); __PYX_ERR(1, 1043, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
         if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_x)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("render", 1, 4, 4, 2); __PYX_ERR(1, 935, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("render", 1, 4, 4, 2); __PYX_ERR(1, 1043, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  3:
         if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_y)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("render", 1, 4, 4, 3); __PYX_ERR(1, 935, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("render", 1, 4, 4, 3); __PYX_ERR(1, 1043, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "render") < 0)) __PYX_ERR(1, 935, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "render") < 0)) __PYX_ERR(1, 1043, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 4) {
       goto __pyx_L5_argtuple_error;
     } else {
-      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
-    }
-    __pyx_v_container = values[0];
-    __pyx_v_text = values[1];
-    __pyx_v_x = values[2];
-    __pyx_v_y = values[3];
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("render", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(1, 935, __pyx_L3_error)
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("mpfmc.uix.bitmap_font.bitmap_font._SurfaceContainer.render", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_6render(((struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer *)__pyx_v_self), __pyx_v_container, __pyx_v_text, __pyx_v_x, __pyx_v_y);
-
-  /* function exit code */
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_6render(struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer *__pyx_v_self, PyObject *__pyx_v_container, PyObject *__pyx_v_text, PyObject *__pyx_v_x, PyObject *__pyx_v_y) {
-  struct SDL_Rect __pyx_v_cursor_rect;
-  struct SDL_Rect __pyx_v_source_rect;
-  struct SDL_Rect __pyx_v_dest_rect;
-  struct SDL_Surface *__pyx_v_source_image;
-  PyObject *__pyx_v_characters = 0;
-  PyObject *__pyx_v_kernings = 0;
-  int __pyx_v_use_kerning;
-  int __pyx_v_previous_char;
-  int __pyx_v_current_char;
-  PyObject *__pyx_v_asset = NULL;
-  PyObject *__pyx_v_font = NULL;
-  PyObject *__pyx_v_text_char = NULL;
-  PyObject *__pyx_v_char_info = NULL;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  int __pyx_t_4;
-  int __pyx_t_5;
-  void *__pyx_t_6;
-  int __pyx_t_7;
-  Py_ssize_t __pyx_t_8;
-  PyObject *(*__pyx_t_9)(PyObject *);
-  long __pyx_t_10;
-  int __pyx_t_11;
-  PyObject *__pyx_t_12 = NULL;
-  struct SDL_Rect __pyx_t_13;
-  __Pyx_RefNannySetupContext("render", 0);
-
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":941
- *         cdef SDL_Rect dest_rect
- *         cdef SDL_Surface *source_image
- *         cdef dict characters = dict()             # <<<<<<<<<<<<<<
- *         cdef dict kernings = dict()
- *         cdef bint use_kerning = True
- */
-  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 941, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_v_characters = ((PyObject*)__pyx_t_1);
-  __pyx_t_1 = 0;
-
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":942
- *         cdef SDL_Surface *source_image
- *         cdef dict characters = dict()
- *         cdef dict kernings = dict()             # <<<<<<<<<<<<<<
- *         cdef bint use_kerning = True
- *         cdef int previous_char = -1
- */
-  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 942, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_v_kernings = ((PyObject*)__pyx_t_1);
-  __pyx_t_1 = 0;
-
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":943
- *         cdef dict characters = dict()
- *         cdef dict kernings = dict()
- *         cdef bint use_kerning = True             # <<<<<<<<<<<<<<
- *         cdef int previous_char = -1
- *         cdef int current_char
- */
-  __pyx_v_use_kerning = 1;
-
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":944
- *         cdef dict kernings = dict()
- *         cdef bint use_kerning = True
- *         cdef int previous_char = -1             # <<<<<<<<<<<<<<
- *         cdef int current_char
- * 
- */
-  __pyx_v_previous_char = -1;
-
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":947
- *         cdef int current_char
- * 
- *         asset = container.get_font_asset()             # <<<<<<<<<<<<<<
- *         if asset is None:
- *             return
- */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_container, __pyx_n_s_get_font_asset); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 947, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = NULL;
-  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
-    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
-    if (likely(__pyx_t_3)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-      __Pyx_INCREF(__pyx_t_3);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_2, function);
-    }
-  }
-  __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3) : __Pyx_PyObject_CallNoArg(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 947, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_v_asset = __pyx_t_1;
-  __pyx_t_1 = 0;
-
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":948
- * 
- *         asset = container.get_font_asset()
- *         if asset is None:             # <<<<<<<<<<<<<<
- *             return
- * 
- */
-  __pyx_t_4 = (__pyx_v_asset == Py_None);
-  __pyx_t_5 = (__pyx_t_4 != 0);
-  if (__pyx_t_5) {
-
-    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":949
- *         asset = container.get_font_asset()
- *         if asset is None:
- *             return             # <<<<<<<<<<<<<<
- * 
- *         font = asset.bitmap_font
- */
-    __Pyx_XDECREF(__pyx_r);
-    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-    goto __pyx_L0;
-
-    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":948
- * 
- *         asset = container.get_font_asset()
- *         if asset is None:             # <<<<<<<<<<<<<<
- *             return
- * 
- */
-  }
-
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":951
- *             return
- * 
- *         font = asset.bitmap_font             # <<<<<<<<<<<<<<
- *         if font is None:
- *             return
- */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_asset, __pyx_n_s_bitmap_font); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 951, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_v_font = __pyx_t_1;
-  __pyx_t_1 = 0;
-
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":952
- * 
- *         font = asset.bitmap_font
- *         if font is None:             # <<<<<<<<<<<<<<
- *             return
- * 
- */
-  __pyx_t_5 = (__pyx_v_font == Py_None);
-  __pyx_t_4 = (__pyx_t_5 != 0);
-  if (__pyx_t_4) {
-
-    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":953
- *         font = asset.bitmap_font
- *         if font is None:
- *             return             # <<<<<<<<<<<<<<
- * 
- *         source_image = <SDL_Surface*>pycapsule.PyCapsule_GetPointer(font.get_image(), NULL)
- */
-    __Pyx_XDECREF(__pyx_r);
-    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-    goto __pyx_L0;
-
-    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":952
- * 
- *         font = asset.bitmap_font
- *         if font is None:             # <<<<<<<<<<<<<<
- *             return
- * 
- */
-  }
-
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":955
- *             return
- * 
- *         source_image = <SDL_Surface*>pycapsule.PyCapsule_GetPointer(font.get_image(), NULL)             # <<<<<<<<<<<<<<
- *         if source_image == NULL:
- *             return
- */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_font, __pyx_n_s_get_image); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 955, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = NULL;
-  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
-    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
-    if (likely(__pyx_t_3)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-      __Pyx_INCREF(__pyx_t_3);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_2, function);
-    }
-  }
-  __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3) : __Pyx_PyObject_CallNoArg(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 955, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_6 = PyCapsule_GetPointer(__pyx_t_1, NULL); if (unlikely(__pyx_t_6 == ((void *)NULL) && PyErr_Occurred())) __PYX_ERR(1, 955, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_v_source_image = ((struct SDL_Surface *)__pyx_t_6);
-
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":956
- * 
- *         source_image = <SDL_Surface*>pycapsule.PyCapsule_GetPointer(font.get_image(), NULL)
- *         if source_image == NULL:             # <<<<<<<<<<<<<<
- *             return
- * 
- */
-  __pyx_t_4 = ((__pyx_v_source_image == NULL) != 0);
-  if (__pyx_t_4) {
-
-    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":957
- *         source_image = <SDL_Surface*>pycapsule.PyCapsule_GetPointer(font.get_image(), NULL)
- *         if source_image == NULL:
- *             return             # <<<<<<<<<<<<<<
- * 
- *         cursor_rect.x = x
- */
-    __Pyx_XDECREF(__pyx_r);
-    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-    goto __pyx_L0;
-
-    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":956
- * 
- *         source_image = <SDL_Surface*>pycapsule.PyCapsule_GetPointer(font.get_image(), NULL)
- *         if source_image == NULL:             # <<<<<<<<<<<<<<
- *             return
- * 
- */
-  }
-
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":959
- *             return
- * 
- *         cursor_rect.x = x             # <<<<<<<<<<<<<<
- *         cursor_rect.y = y
- * 
- */
-  __pyx_t_7 = __Pyx_PyInt_As_int(__pyx_v_x); if (unlikely((__pyx_t_7 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 959, __pyx_L1_error)
-  __pyx_v_cursor_rect.x = __pyx_t_7;
-
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":960
- * 
- *         cursor_rect.x = x
- *         cursor_rect.y = y             # <<<<<<<<<<<<<<
- * 
- *         characters = font.get_characters()
- */
-  __pyx_t_7 = __Pyx_PyInt_As_int(__pyx_v_y); if (unlikely((__pyx_t_7 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 960, __pyx_L1_error)
-  __pyx_v_cursor_rect.y = __pyx_t_7;
-
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":962
- *         cursor_rect.y = y
- * 
- *         characters = font.get_characters()             # <<<<<<<<<<<<<<
- *         kernings = font.get_kernings()
- *         use_kerning = container.options['font_kerning']
- */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_font, __pyx_n_s_get_characters); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 962, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = NULL;
-  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
-    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
-    if (likely(__pyx_t_3)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-      __Pyx_INCREF(__pyx_t_3);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_2, function);
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
     }
+    __pyx_v_container = values[0];
+    __pyx_v_text = ((PyObject*)values[1]);
+    __pyx_v_x = __Pyx_PyInt_As_int(values[2]); if (unlikely((__pyx_v_x == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 1043, __pyx_L3_error)
+    __pyx_v_y = __Pyx_PyInt_As_int(values[3]); if (unlikely((__pyx_v_y == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 1043, __pyx_L3_error)
   }
-  __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3) : __Pyx_PyObject_CallNoArg(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 962, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (!(likely(PyDict_CheckExact(__pyx_t_1))||((__pyx_t_1) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "dict", Py_TYPE(__pyx_t_1)->tp_name), 0))) __PYX_ERR(1, 962, __pyx_L1_error)
-  __Pyx_DECREF_SET(__pyx_v_characters, ((PyObject*)__pyx_t_1));
-  __pyx_t_1 = 0;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("render", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(1, 1043, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("mpfmc.uix.bitmap_font.bitmap_font._SurfaceContainer.render", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_text), (&PyUnicode_Type), 1, "text", 1))) __PYX_ERR(1, 1043, __pyx_L1_error)
+  __pyx_r = __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_12render(((struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer *)__pyx_v_self), __pyx_v_container, __pyx_v_text, __pyx_v_x, __pyx_v_y);
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":963
- * 
- *         characters = font.get_characters()
- *         kernings = font.get_kernings()             # <<<<<<<<<<<<<<
- *         use_kerning = container.options['font_kerning']
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_12render(struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer *__pyx_v_self, PyObject *__pyx_v_container, PyObject *__pyx_v_text, int __pyx_v_x, int __pyx_v_y) {
+  struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont *__pyx_v_font = 0;
+  PyObject *__pyx_v_asset = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("render", 0);
+
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":1047
+ *         cdef BitmapFont font
  * 
+ *         asset = container.get_font_asset()             # <<<<<<<<<<<<<<
+ *         if asset is None:
+ *             return
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_font, __pyx_n_s_get_kernings); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 963, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_container, __pyx_n_s_get_font_asset); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 1047, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_t_3 = NULL;
   if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
@@ -8077,322 +9111,117 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceCont
   }
   __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3) : __Pyx_PyObject_CallNoArg(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 963, __pyx_L1_error)
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 1047, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (!(likely(PyDict_CheckExact(__pyx_t_1))||((__pyx_t_1) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "dict", Py_TYPE(__pyx_t_1)->tp_name), 0))) __PYX_ERR(1, 963, __pyx_L1_error)
-  __Pyx_DECREF_SET(__pyx_v_kernings, ((PyObject*)__pyx_t_1));
+  __pyx_v_asset = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":964
- *         characters = font.get_characters()
- *         kernings = font.get_kernings()
- *         use_kerning = container.options['font_kerning']             # <<<<<<<<<<<<<<
- * 
- *         # Copy each character in the text string from the bitmap font atlas to
- */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_container, __pyx_n_s_options); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 964, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_Dict_GetItem(__pyx_t_1, __pyx_n_u_font_kerning); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 964, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 964, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_v_use_kerning = __pyx_t_4;
-
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":968
- *         # Copy each character in the text string from the bitmap font atlas to
- *         # the output texture/surface
- *         for text_char in text:             # <<<<<<<<<<<<<<
- *             current_char = ord(text_char)
- *             if current_char in characters:
- */
-  if (likely(PyList_CheckExact(__pyx_v_text)) || PyTuple_CheckExact(__pyx_v_text)) {
-    __pyx_t_2 = __pyx_v_text; __Pyx_INCREF(__pyx_t_2); __pyx_t_8 = 0;
-    __pyx_t_9 = NULL;
-  } else {
-    __pyx_t_8 = -1; __pyx_t_2 = PyObject_GetIter(__pyx_v_text); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 968, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_9 = Py_TYPE(__pyx_t_2)->tp_iternext; if (unlikely(!__pyx_t_9)) __PYX_ERR(1, 968, __pyx_L1_error)
-  }
-  for (;;) {
-    if (likely(!__pyx_t_9)) {
-      if (likely(PyList_CheckExact(__pyx_t_2))) {
-        if (__pyx_t_8 >= PyList_GET_SIZE(__pyx_t_2)) break;
-        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_1 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_8); __Pyx_INCREF(__pyx_t_1); __pyx_t_8++; if (unlikely(0 < 0)) __PYX_ERR(1, 968, __pyx_L1_error)
-        #else
-        __pyx_t_1 = PySequence_ITEM(__pyx_t_2, __pyx_t_8); __pyx_t_8++; if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 968, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_1);
-        #endif
-      } else {
-        if (__pyx_t_8 >= PyTuple_GET_SIZE(__pyx_t_2)) break;
-        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_2, __pyx_t_8); __Pyx_INCREF(__pyx_t_1); __pyx_t_8++; if (unlikely(0 < 0)) __PYX_ERR(1, 968, __pyx_L1_error)
-        #else
-        __pyx_t_1 = PySequence_ITEM(__pyx_t_2, __pyx_t_8); __pyx_t_8++; if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 968, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_1);
-        #endif
-      }
-    } else {
-      __pyx_t_1 = __pyx_t_9(__pyx_t_2);
-      if (unlikely(!__pyx_t_1)) {
-        PyObject* exc_type = PyErr_Occurred();
-        if (exc_type) {
-          if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-          else __PYX_ERR(1, 968, __pyx_L1_error)
-        }
-        break;
-      }
-      __Pyx_GOTREF(__pyx_t_1);
-    }
-    __Pyx_XDECREF_SET(__pyx_v_text_char, __pyx_t_1);
-    __pyx_t_1 = 0;
-
-    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":969
- *         # the output texture/surface
- *         for text_char in text:
- *             current_char = ord(text_char)             # <<<<<<<<<<<<<<
- *             if current_char in characters:
- *                 char_info = characters[current_char]
- */
-    __pyx_t_10 = __Pyx_PyObject_Ord(__pyx_v_text_char); if (unlikely(__pyx_t_10 == ((long)(long)(Py_UCS4)-1))) __PYX_ERR(1, 969, __pyx_L1_error)
-    __pyx_v_current_char = __pyx_t_10;
-
-    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":970
- *         for text_char in text:
- *             current_char = ord(text_char)
- *             if current_char in characters:             # <<<<<<<<<<<<<<
- *                 char_info = characters[current_char]
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":1048
  * 
- */
-    __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_current_char); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 970, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    if (unlikely(__pyx_v_characters == Py_None)) {
-      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
-      __PYX_ERR(1, 970, __pyx_L1_error)
-    }
-    __pyx_t_4 = (__Pyx_PyDict_ContainsTF(__pyx_t_1, __pyx_v_characters, Py_EQ)); if (unlikely(__pyx_t_4 < 0)) __PYX_ERR(1, 970, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_5 = (__pyx_t_4 != 0);
-    if (__pyx_t_5) {
-
-      /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":971
- *             current_char = ord(text_char)
- *             if current_char in characters:
- *                 char_info = characters[current_char]             # <<<<<<<<<<<<<<
+ *         asset = container.get_font_asset()
+ *         if asset is None:             # <<<<<<<<<<<<<<
+ *             return
  * 
- *                 if use_kerning and previous_char in kernings and current_char in kernings[previous_char]:
  */
-      if (unlikely(__pyx_v_characters == Py_None)) {
-        PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-        __PYX_ERR(1, 971, __pyx_L1_error)
-      }
-      __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_current_char); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 971, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_3 = __Pyx_PyDict_GetItem(__pyx_v_characters, __pyx_t_1); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 971, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_3);
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __Pyx_XDECREF_SET(__pyx_v_char_info, __pyx_t_3);
-      __pyx_t_3 = 0;
+  __pyx_t_4 = (__pyx_v_asset == Py_None);
+  __pyx_t_5 = (__pyx_t_4 != 0);
+  if (__pyx_t_5) {
 
-      /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":973
- *                 char_info = characters[current_char]
- * 
- *                 if use_kerning and previous_char in kernings and current_char in kernings[previous_char]:             # <<<<<<<<<<<<<<
- *                     cursor_rect.x += kernings[previous_char][current_char]
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":1049
+ *         asset = container.get_font_asset()
+ *         if asset is None:
+ *             return             # <<<<<<<<<<<<<<
  * 
+ *         font = asset.bitmap_font
  */
-      __pyx_t_4 = (__pyx_v_use_kerning != 0);
-      if (__pyx_t_4) {
-      } else {
-        __pyx_t_5 = __pyx_t_4;
-        goto __pyx_L10_bool_binop_done;
-      }
-      __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_previous_char); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 973, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_3);
-      if (unlikely(__pyx_v_kernings == Py_None)) {
-        PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
-        __PYX_ERR(1, 973, __pyx_L1_error)
-      }
-      __pyx_t_4 = (__Pyx_PyDict_ContainsTF(__pyx_t_3, __pyx_v_kernings, Py_EQ)); if (unlikely(__pyx_t_4 < 0)) __PYX_ERR(1, 973, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_11 = (__pyx_t_4 != 0);
-      if (__pyx_t_11) {
-      } else {
-        __pyx_t_5 = __pyx_t_11;
-        goto __pyx_L10_bool_binop_done;
-      }
-      __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_current_char); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 973, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_3);
-      if (unlikely(__pyx_v_kernings == Py_None)) {
-        PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-        __PYX_ERR(1, 973, __pyx_L1_error)
-      }
-      __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_previous_char); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 973, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_12 = __Pyx_PyDict_GetItem(__pyx_v_kernings, __pyx_t_1); if (unlikely(!__pyx_t_12)) __PYX_ERR(1, 973, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_12);
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __pyx_t_11 = (__Pyx_PySequence_ContainsTF(__pyx_t_3, __pyx_t_12, Py_EQ)); if (unlikely(__pyx_t_11 < 0)) __PYX_ERR(1, 973, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
-      __pyx_t_4 = (__pyx_t_11 != 0);
-      __pyx_t_5 = __pyx_t_4;
-      __pyx_L10_bool_binop_done:;
-      if (__pyx_t_5) {
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
 
-        /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":974
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":1048
  * 
- *                 if use_kerning and previous_char in kernings and current_char in kernings[previous_char]:
- *                     cursor_rect.x += kernings[previous_char][current_char]             # <<<<<<<<<<<<<<
+ *         asset = container.get_font_asset()
+ *         if asset is None:             # <<<<<<<<<<<<<<
+ *             return
  * 
- *                 source_rect = char_info.rect
  */
-        __pyx_t_12 = __Pyx_PyInt_From_int(__pyx_v_cursor_rect.x); if (unlikely(!__pyx_t_12)) __PYX_ERR(1, 974, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_12);
-        if (unlikely(__pyx_v_kernings == Py_None)) {
-          PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-          __PYX_ERR(1, 974, __pyx_L1_error)
-        }
-        __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_previous_char); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 974, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_3);
-        __pyx_t_1 = __Pyx_PyDict_GetItem(__pyx_v_kernings, __pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 974, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_1);
-        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-        __pyx_t_3 = __Pyx_GetItemInt(__pyx_t_1, __pyx_v_current_char, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 974, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_3);
-        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-        __pyx_t_1 = PyNumber_InPlaceAdd(__pyx_t_12, __pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 974, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_1);
-        __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
-        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-        __pyx_t_7 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_7 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 974, __pyx_L1_error)
-        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-        __pyx_v_cursor_rect.x = __pyx_t_7;
+  }
 
-        /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":973
- *                 char_info = characters[current_char]
- * 
- *                 if use_kerning and previous_char in kernings and current_char in kernings[previous_char]:             # <<<<<<<<<<<<<<
- *                     cursor_rect.x += kernings[previous_char][current_char]
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":1051
+ *             return
  * 
+ *         font = asset.bitmap_font             # <<<<<<<<<<<<<<
+ *         if font is None or font.image == NULL:
+ *             return
  */
-      }
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_asset, __pyx_n_s_bitmap_font); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 1051, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont))))) __PYX_ERR(1, 1051, __pyx_L1_error)
+  __pyx_v_font = ((struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont *)__pyx_t_1);
+  __pyx_t_1 = 0;
 
-      /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":976
- *                     cursor_rect.x += kernings[previous_char][current_char]
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":1052
  * 
- *                 source_rect = char_info.rect             # <<<<<<<<<<<<<<
- *                 dest_rect.x = cursor_rect.x + char_info.xoffset
- *                 dest_rect.y = cursor_rect.y + char_info.yoffset
- */
-      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_char_info, __pyx_n_s_rect); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 976, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_13 = __pyx_convert__from_py_struct__SDL_Rect(__pyx_t_1); if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 976, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __pyx_v_source_rect = __pyx_t_13;
-
-      /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":977
+ *         font = asset.bitmap_font
+ *         if font is None or font.image == NULL:             # <<<<<<<<<<<<<<
+ *             return
  * 
- *                 source_rect = char_info.rect
- *                 dest_rect.x = cursor_rect.x + char_info.xoffset             # <<<<<<<<<<<<<<
- *                 dest_rect.y = cursor_rect.y + char_info.yoffset
- *                 SDL_BlitSurface(source_image, &source_rect, self.surface, &dest_rect)
  */
-      __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_cursor_rect.x); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 977, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_char_info, __pyx_n_s_xoffset); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 977, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_12 = PyNumber_Add(__pyx_t_1, __pyx_t_3); if (unlikely(!__pyx_t_12)) __PYX_ERR(1, 977, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_12);
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_7 = __Pyx_PyInt_As_int(__pyx_t_12); if (unlikely((__pyx_t_7 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 977, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
-      __pyx_v_dest_rect.x = __pyx_t_7;
-
-      /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":978
- *                 source_rect = char_info.rect
- *                 dest_rect.x = cursor_rect.x + char_info.xoffset
- *                 dest_rect.y = cursor_rect.y + char_info.yoffset             # <<<<<<<<<<<<<<
- *                 SDL_BlitSurface(source_image, &source_rect, self.surface, &dest_rect)
- *                 cursor_rect.x += char_info.xadvance
- */
-      __pyx_t_12 = __Pyx_PyInt_From_int(__pyx_v_cursor_rect.y); if (unlikely(!__pyx_t_12)) __PYX_ERR(1, 978, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_12);
-      __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_char_info, __pyx_n_s_yoffset); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 978, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_1 = PyNumber_Add(__pyx_t_12, __pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 978, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_7 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_7 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 978, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __pyx_v_dest_rect.y = __pyx_t_7;
+  __pyx_t_4 = (((PyObject *)__pyx_v_font) == Py_None);
+  __pyx_t_6 = (__pyx_t_4 != 0);
+  if (!__pyx_t_6) {
+  } else {
+    __pyx_t_5 = __pyx_t_6;
+    goto __pyx_L5_bool_binop_done;
+  }
+  __pyx_t_6 = ((__pyx_v_font->image == NULL) != 0);
+  __pyx_t_5 = __pyx_t_6;
+  __pyx_L5_bool_binop_done:;
+  if (__pyx_t_5) {
 
-      /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":979
- *                 dest_rect.x = cursor_rect.x + char_info.xoffset
- *                 dest_rect.y = cursor_rect.y + char_info.yoffset
- *                 SDL_BlitSurface(source_image, &source_rect, self.surface, &dest_rect)             # <<<<<<<<<<<<<<
- *                 cursor_rect.x += char_info.xadvance
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":1053
+ *         font = asset.bitmap_font
+ *         if font is None or font.image == NULL:
+ *             return             # <<<<<<<<<<<<<<
  * 
+ *         font.render_text(self.surface, text, x, y, container.options['font_kerning'])
  */
-      (void)(SDL_BlitSurface(__pyx_v_source_image, (&__pyx_v_source_rect), __pyx_v_self->surface, (&__pyx_v_dest_rect)));
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
 
-      /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":980
- *                 dest_rect.y = cursor_rect.y + char_info.yoffset
- *                 SDL_BlitSurface(source_image, &source_rect, self.surface, &dest_rect)
- *                 cursor_rect.x += char_info.xadvance             # <<<<<<<<<<<<<<
+    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":1052
  * 
- *             previous_char = current_char
- */
-      __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_cursor_rect.x); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 980, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_char_info, __pyx_n_s_xadvance); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 980, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_12 = PyNumber_InPlaceAdd(__pyx_t_1, __pyx_t_3); if (unlikely(!__pyx_t_12)) __PYX_ERR(1, 980, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_12);
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_7 = __Pyx_PyInt_As_int(__pyx_t_12); if (unlikely((__pyx_t_7 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 980, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
-      __pyx_v_cursor_rect.x = __pyx_t_7;
-
-      /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":970
- *         for text_char in text:
- *             current_char = ord(text_char)
- *             if current_char in characters:             # <<<<<<<<<<<<<<
- *                 char_info = characters[current_char]
+ *         font = asset.bitmap_font
+ *         if font is None or font.image == NULL:             # <<<<<<<<<<<<<<
+ *             return
  * 
  */
-    }
+  }
 
-    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":982
- *                 cursor_rect.x += char_info.xadvance
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":1055
+ *             return
  * 
- *             previous_char = current_char             # <<<<<<<<<<<<<<
+ *         font.render_text(self.surface, text, x, y, container.options['font_kerning'])             # <<<<<<<<<<<<<<
  * 
  *     def get_data(self):
  */
-    __pyx_v_previous_char = __pyx_v_current_char;
-
-    /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":968
- *         # Copy each character in the text string from the bitmap font atlas to
- *         # the output texture/surface
- *         for text_char in text:             # <<<<<<<<<<<<<<
- *             current_char = ord(text_char)
- *             if current_char in characters:
- */
-  }
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_container, __pyx_n_s_options); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 1055, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_Dict_GetItem(__pyx_t_1, __pyx_n_u_font_kerning); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 1055, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_5 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 1055, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  ((struct __pyx_vtabstruct_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont *)__pyx_v_font->__pyx_vtab)->render_text(__pyx_v_font, __pyx_v_self->surface, __pyx_v_text, __pyx_v_x, __pyx_v_y, __pyx_t_5); if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 1055, __pyx_L1_error)
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":935
- *             self.surface = NULL
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":1043
+ *         memset(self.surface.pixels, 0, self.w * self.h * 4)
  * 
- *     def render(self, container, text, x, y):             # <<<<<<<<<<<<<<
+ *     def render(self, container, str text, int x, int y):             # <<<<<<<<<<<<<<
  *         """Render the text at the specified location."""
- *         cdef SDL_Rect cursor_rect
+ *         cdef BitmapFont font
  */
 
   /* function exit code */
@@ -8402,47 +9231,39 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceCont
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_12);
   __Pyx_AddTraceback("mpfmc.uix.bitmap_font.bitmap_font._SurfaceContainer.render", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_characters);
-  __Pyx_XDECREF(__pyx_v_kernings);
+  __Pyx_XDECREF((PyObject *)__pyx_v_font);
   __Pyx_XDECREF(__pyx_v_asset);
-  __Pyx_XDECREF(__pyx_v_font);
-  __Pyx_XDECREF(__pyx_v_text_char);
-  __Pyx_XDECREF(__pyx_v_char_info);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":984
- *             previous_char = current_char
+/* "mpfmc/uix/bitmap_font/bitmap_font.pyx":1057
+ *         font.render_text(self.surface, text, x, y, container.options['font_kerning'])
  * 
  *     def get_data(self):             # <<<<<<<<<<<<<<
  *         """Return the bitmap font surface as ImageData (pixels)."""
- *         cdef int datalen = self.surface.w * self.surface.h * 4
+ *         return ImageData(self.w, self.h, 'rgba', memoryview(self))
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_9get_data(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static char __pyx_doc_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_8get_data[] = "_SurfaceContainer.get_data(self)\nReturn the bitmap font surface as ImageData (pixels).";
-static PyObject *__pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_9get_data(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_15get_data(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_14get_data[] = "_SurfaceContainer.get_data(self)\nReturn the bitmap font surface as ImageData (pixels).";
+static PyObject *__pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_15get_data(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("get_data (wrapper)", 0);
-  __pyx_r = __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_8get_data(((struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer *)__pyx_v_self));
+  __pyx_r = __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_14get_data(((struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_8get_data(struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer *__pyx_v_self) {
-  int __pyx_v_datalen;
-  PyObject *__pyx_v_pixels = 0;
-  PyObject *__pyx_v_data = NULL;
+static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_14get_data(struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -8450,45 +9271,33 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceCont
   PyObject *__pyx_t_3 = NULL;
   PyObject *__pyx_t_4 = NULL;
   PyObject *__pyx_t_5 = NULL;
-  int __pyx_t_6;
-  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("get_data", 0);
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":986
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":1059
  *     def get_data(self):
  *         """Return the bitmap font surface as ImageData (pixels)."""
- *         cdef int datalen = self.surface.w * self.surface.h * 4             # <<<<<<<<<<<<<<
- *         cdef bytes pixels = (<char *>self.surface.pixels)[:datalen]
- *         data = ImageData(self.w, self.h, 'rgba', pixels)
- */
-  __pyx_v_datalen = ((__pyx_v_self->surface->w * __pyx_v_self->surface->h) * 4);
-
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":987
- *         """Return the bitmap font surface as ImageData (pixels)."""
- *         cdef int datalen = self.surface.w * self.surface.h * 4
- *         cdef bytes pixels = (<char *>self.surface.pixels)[:datalen]             # <<<<<<<<<<<<<<
- *         data = ImageData(self.w, self.h, 'rgba', pixels)
- *         return data
- */
-  __pyx_t_1 = __Pyx_PyBytes_FromStringAndSize(((char *)__pyx_v_self->surface->pixels) + 0, __pyx_v_datalen - 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 987, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_v_pixels = ((PyObject*)__pyx_t_1);
-  __pyx_t_1 = 0;
-
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":988
- *         cdef int datalen = self.surface.w * self.surface.h * 4
- *         cdef bytes pixels = (<char *>self.surface.pixels)[:datalen]
- *         data = ImageData(self.w, self.h, 'rgba', pixels)             # <<<<<<<<<<<<<<
- *         return data
+ *         return ImageData(self.w, self.h, 'rgba', memoryview(self))             # <<<<<<<<<<<<<<
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_ImageData); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 988, __pyx_L1_error)
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_ImageData); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 1059, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_self->w); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 988, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_self->w); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 1059, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_self->h); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 988, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_self->h); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 1059, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_memoryview); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 1059, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = __Pyx_PyObject_CallOneArg(__pyx_t_5, ((PyObject *)__pyx_v_self)); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 1059, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   __pyx_t_5 = NULL;
-  __pyx_t_6 = 0;
+  __pyx_t_7 = 0;
   if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_2))) {
     __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_2);
     if (likely(__pyx_t_5)) {
@@ -8496,71 +9305,64 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceCont
       __Pyx_INCREF(__pyx_t_5);
       __Pyx_INCREF(function);
       __Pyx_DECREF_SET(__pyx_t_2, function);
-      __pyx_t_6 = 1;
+      __pyx_t_7 = 1;
     }
   }
   #if CYTHON_FAST_PYCALL
   if (PyFunction_Check(__pyx_t_2)) {
-    PyObject *__pyx_temp[5] = {__pyx_t_5, __pyx_t_3, __pyx_t_4, __pyx_n_u_rgba, __pyx_v_pixels};
-    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_6, 4+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 988, __pyx_L1_error)
+    PyObject *__pyx_temp[5] = {__pyx_t_5, __pyx_t_3, __pyx_t_4, __pyx_n_u_rgba, __pyx_t_6};
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_7, 4+__pyx_t_7); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 1059, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
   } else
   #endif
   #if CYTHON_FAST_PYCCALL
   if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
-    PyObject *__pyx_temp[5] = {__pyx_t_5, __pyx_t_3, __pyx_t_4, __pyx_n_u_rgba, __pyx_v_pixels};
-    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_6, 4+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 988, __pyx_L1_error)
+    PyObject *__pyx_temp[5] = {__pyx_t_5, __pyx_t_3, __pyx_t_4, __pyx_n_u_rgba, __pyx_t_6};
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_7, 4+__pyx_t_7); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 1059, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
   } else
   #endif
   {
-    __pyx_t_7 = PyTuple_New(4+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 988, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_7);
+    __pyx_t_8 = PyTuple_New(4+__pyx_t_7); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 1059, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
     if (__pyx_t_5) {
-      __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_5); __pyx_t_5 = NULL;
+      __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_5); __pyx_t_5 = NULL;
     }
     __Pyx_GIVEREF(__pyx_t_3);
-    PyTuple_SET_ITEM(__pyx_t_7, 0+__pyx_t_6, __pyx_t_3);
+    PyTuple_SET_ITEM(__pyx_t_8, 0+__pyx_t_7, __pyx_t_3);
     __Pyx_GIVEREF(__pyx_t_4);
-    PyTuple_SET_ITEM(__pyx_t_7, 1+__pyx_t_6, __pyx_t_4);
+    PyTuple_SET_ITEM(__pyx_t_8, 1+__pyx_t_7, __pyx_t_4);
     __Pyx_INCREF(__pyx_n_u_rgba);
     __Pyx_GIVEREF(__pyx_n_u_rgba);
-    PyTuple_SET_ITEM(__pyx_t_7, 2+__pyx_t_6, __pyx_n_u_rgba);
-    __Pyx_INCREF(__pyx_v_pixels);
-    __Pyx_GIVEREF(__pyx_v_pixels);
-    PyTuple_SET_ITEM(__pyx_t_7, 3+__pyx_t_6, __pyx_v_pixels);
+    PyTuple_SET_ITEM(__pyx_t_8, 2+__pyx_t_7, __pyx_n_u_rgba);
+    __Pyx_GIVEREF(__pyx_t_6);
+    PyTuple_SET_ITEM(__pyx_t_8, 3+__pyx_t_7, __pyx_t_6);
     __pyx_t_3 = 0;
     __pyx_t_4 = 0;
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_7, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 988, __pyx_L1_error)
+    __pyx_t_6 = 0;
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_8, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 1059, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
   }
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_v_data = __pyx_t_1;
+  __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
-
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":989
- *         cdef bytes pixels = (<char *>self.surface.pixels)[:datalen]
- *         data = ImageData(self.w, self.h, 'rgba', pixels)
- *         return data             # <<<<<<<<<<<<<<
- */
-  __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(__pyx_v_data);
-  __pyx_r = __pyx_v_data;
   goto __pyx_L0;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":984
- *             previous_char = current_char
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":1057
+ *         font.render_text(self.surface, text, x, y, container.options['font_kerning'])
  * 
  *     def get_data(self):             # <<<<<<<<<<<<<<
  *         """Return the bitmap font surface as ImageData (pixels)."""
- *         cdef int datalen = self.surface.w * self.surface.h * 4
+ *         return ImageData(self.w, self.h, 'rgba', memoryview(self))
  */
 
   /* function exit code */
@@ -8570,12 +9372,11 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceCont
   __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4);
   __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_8);
   __Pyx_AddTraceback("mpfmc.uix.bitmap_font.bitmap_font._SurfaceContainer.get_data", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_pixels);
-  __Pyx_XDECREF(__pyx_v_data);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
@@ -8588,23 +9389,26 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceCont
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_11__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static char __pyx_doc_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_10__reduce_cython__[] = "_SurfaceContainer.__reduce_cython__(self)";
-static PyObject *__pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_11__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_17__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_16__reduce_cython__[] = "_SurfaceContainer.__reduce_cython__(self)";
+static PyObject *__pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_17__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
-  __pyx_r = __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_10__reduce_cython__(((struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer *)__pyx_v_self));
+  __pyx_r = __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_16__reduce_cython__(((struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_10__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer *__pyx_v_self) {
+static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_16__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__reduce_cython__", 0);
 
   /* "(tree fragment)":2
@@ -8643,23 +9447,26 @@ static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceCont
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_13__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
-static char __pyx_doc_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_12__setstate_cython__[] = "_SurfaceContainer.__setstate_cython__(self, __pyx_state)";
-static PyObject *__pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_13__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+static PyObject *__pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_19__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
+static char __pyx_doc_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_18__setstate_cython__[] = "_SurfaceContainer.__setstate_cython__(self, __pyx_state)";
+static PyObject *__pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_19__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
-  __pyx_r = __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_12__setstate_cython__(((struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
+  __pyx_r = __pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_18__setstate_cython__(((struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_12__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
+static PyObject *__pyx_pf_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_18__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__setstate_cython__", 0);
 
   /* "(tree fragment)":4
@@ -8712,6 +9519,9 @@ static struct SDL_Rect __pyx_convert__from_py_struct__SDL_Rect(PyObject *__pyx_v
   PyObject *__pyx_t_7 = NULL;
   PyObject *__pyx_t_8 = NULL;
   PyObject *__pyx_t_9 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__pyx_convert__from_py_struct__SDL_Rect", 0);
 
   /* "FromPyStructUtility":13
@@ -9198,7 +10008,7 @@ static PyObject *__pyx_tp_new_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont
 
 static void __pyx_tp_dealloc_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFontCharacter(PyObject *o) {
   #if CYTHON_USE_TP_FINALIZE
-  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && (!PyType_IS_GC(Py_TYPE(o)) || !_PyGC_FINALIZED(o))) {
+  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && (!PyType_IS_GC(Py_TYPE(o)) || !__Pyx_PyObject_GC_IsFinalized(o))) {
     if (PyObject_CallFinalizerFromDealloc(o)) return;
   }
   #endif
@@ -9296,7 +10106,12 @@ static PyTypeObject __pyx_type_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFon
   sizeof(struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFontCharacter), /*tp_basicsize*/
   0, /*tp_itemsize*/
   __pyx_tp_dealloc_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFontCharacter, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
   0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
   0, /*tp_getattr*/
   0, /*tp_setattr*/
   #if PY_MAJOR_VERSION < 3
@@ -9346,10 +10161,17 @@ static PyTypeObject __pyx_type_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFon
   #if PY_VERSION_HEX >= 0x030400a1
   0, /*tp_finalize*/
   #endif
-  #if PY_VERSION_HEX >= 0x030800b1
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
   0, /*tp_vectorcall*/
   #endif
+  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+  0, /*tp_print*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
 };
+static struct __pyx_vtabstruct_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont __pyx_vtable_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont;
 
 static PyObject *__pyx_tp_new_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont(PyTypeObject *t, PyObject *a, PyObject *k) {
   struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont *p;
@@ -9361,6 +10183,7 @@ static PyObject *__pyx_tp_new_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont
   }
   if (unlikely(!o)) return 0;
   p = ((struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont *)o);
+  p->__pyx_vtab = __pyx_vtabptr_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont;
   p->face = ((PyObject*)Py_None); Py_INCREF(Py_None);
   p->characters = ((PyObject*)Py_None); Py_INCREF(Py_None);
   p->kernings = ((PyObject*)Py_None); Py_INCREF(Py_None);
@@ -9374,7 +10197,7 @@ static PyObject *__pyx_tp_new_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont
 static void __pyx_tp_dealloc_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont(PyObject *o) {
   struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont *p = (struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont *)o;
   #if CYTHON_USE_TP_FINALIZE
-  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && !_PyGC_FINALIZED(o)) {
+  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && !__Pyx_PyObject_GC_IsFinalized(o)) {
     if (PyObject_CallFinalizerFromDealloc(o)) return;
   }
   #endif
@@ -9382,9 +10205,9 @@ static void __pyx_tp_dealloc_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont(
   {
     PyObject *etype, *eval, *etb;
     PyErr_Fetch(&etype, &eval, &etb);
-    ++Py_REFCNT(o);
+    __Pyx_SET_REFCNT(o, Py_REFCNT(o) + 1);
     __pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_5__dealloc__(o);
-    --Py_REFCNT(o);
+    __Pyx_SET_REFCNT(o, Py_REFCNT(o) - 1);
     PyErr_Restore(etype, eval, etb);
   }
   Py_CLEAR(p->face);
@@ -9591,7 +10414,12 @@ static PyTypeObject __pyx_type_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFon
   sizeof(struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont), /*tp_basicsize*/
   0, /*tp_itemsize*/
   __pyx_tp_dealloc_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
   0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
   0, /*tp_getattr*/
   0, /*tp_setattr*/
   #if PY_MAJOR_VERSION < 3
@@ -9641,9 +10469,15 @@ static PyTypeObject __pyx_type_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFon
   #if PY_VERSION_HEX >= 0x030400a1
   0, /*tp_finalize*/
   #endif
-  #if PY_VERSION_HEX >= 0x030800b1
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
   0, /*tp_vectorcall*/
   #endif
+  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+  0, /*tp_print*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
 };
 
 static PyObject *__pyx_tp_new_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer(PyTypeObject *t, PyObject *a, PyObject *k) {
@@ -9663,36 +10497,68 @@ static PyObject *__pyx_tp_new_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceCo
 
 static void __pyx_tp_dealloc_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer(PyObject *o) {
   #if CYTHON_USE_TP_FINALIZE
-  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && (!PyType_IS_GC(Py_TYPE(o)) || !_PyGC_FINALIZED(o))) {
+  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && (!PyType_IS_GC(Py_TYPE(o)) || !__Pyx_PyObject_GC_IsFinalized(o))) {
     if (PyObject_CallFinalizerFromDealloc(o)) return;
   }
   #endif
   {
     PyObject *etype, *eval, *etb;
     PyErr_Fetch(&etype, &eval, &etb);
-    ++Py_REFCNT(o);
+    __Pyx_SET_REFCNT(o, Py_REFCNT(o) + 1);
     __pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_5__dealloc__(o);
-    --Py_REFCNT(o);
+    __Pyx_SET_REFCNT(o, Py_REFCNT(o) - 1);
     PyErr_Restore(etype, eval, etb);
   }
   (*Py_TYPE(o)->tp_free)(o);
 }
 
+static PyObject *__pyx_getprop_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_size(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_4size_1__get__(o);
+}
+
 static PyMethodDef __pyx_methods_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer[] = {
-  {"render", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_7render, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_6render},
-  {"get_data", (PyCFunction)__pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_9get_data, METH_NOARGS, __pyx_doc_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_8get_data},
-  {"__reduce_cython__", (PyCFunction)__pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_11__reduce_cython__, METH_NOARGS, __pyx_doc_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_10__reduce_cython__},
-  {"__setstate_cython__", (PyCFunction)__pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_13__setstate_cython__, METH_O, __pyx_doc_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_12__setstate_cython__},
+  {"clear", (PyCFunction)__pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_11clear, METH_NOARGS, __pyx_doc_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_10clear},
+  {"render", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_13render, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_12render},
+  {"get_data", (PyCFunction)__pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_15get_data, METH_NOARGS, __pyx_doc_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_14get_data},
+  {"__reduce_cython__", (PyCFunction)__pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_17__reduce_cython__, METH_NOARGS, __pyx_doc_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_16__reduce_cython__},
+  {"__setstate_cython__", (PyCFunction)__pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_19__setstate_cython__, METH_O, __pyx_doc_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_18__setstate_cython__},
   {0, 0, 0, 0}
 };
 
+static struct PyGetSetDef __pyx_getsets_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer[] = {
+  {(char *)"size", __pyx_getprop_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_size, 0, (char *)0, 0},
+  {0, 0, 0, 0, 0}
+};
+
+static PyBufferProcs __pyx_tp_as_buffer__SurfaceContainer = {
+  #if PY_MAJOR_VERSION < 3
+  0, /*bf_getreadbuffer*/
+  #endif
+  #if PY_MAJOR_VERSION < 3
+  0, /*bf_getwritebuffer*/
+  #endif
+  #if PY_MAJOR_VERSION < 3
+  0, /*bf_getsegcount*/
+  #endif
+  #if PY_MAJOR_VERSION < 3
+  0, /*bf_getcharbuffer*/
+  #endif
+  __pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_7__getbuffer__, /*bf_getbuffer*/
+  __pyx_pw_5mpfmc_3uix_11bitmap_font_11bitmap_font_17_SurfaceContainer_9__releasebuffer__, /*bf_releasebuffer*/
+};
+
 static PyTypeObject __pyx_type_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer = {
   PyVarObject_HEAD_INIT(0, 0)
   "mpfmc.uix.bitmap_font.bitmap_font._SurfaceContainer", /*tp_name*/
   sizeof(struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer), /*tp_basicsize*/
   0, /*tp_itemsize*/
   __pyx_tp_dealloc_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
   0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
   0, /*tp_getattr*/
   0, /*tp_setattr*/
   #if PY_MAJOR_VERSION < 3
@@ -9710,9 +10576,9 @@ static PyTypeObject __pyx_type_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceC
   0, /*tp_str*/
   0, /*tp_getattro*/
   0, /*tp_setattro*/
-  0, /*tp_as_buffer*/
+  &__pyx_tp_as_buffer__SurfaceContainer, /*tp_as_buffer*/
   Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE, /*tp_flags*/
-  "_SurfaceContainer(w, h)", /*tp_doc*/
+  "_SurfaceContainer(w, h)\nPixel buffer bitmap font text is rendered into.\n\n    The container exposes its pixels via the buffer protocol, so the texture\n    upload reads them directly without copying them into a bytes object. It\n    can be reused for multiple renders of the same size (see clear()).\n    ", /*tp_doc*/
   0, /*tp_traverse*/
   0, /*tp_clear*/
   0, /*tp_richcompare*/
@@ -9721,7 +10587,7 @@ static PyTypeObject __pyx_type_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceC
   0, /*tp_iternext*/
   __pyx_methods_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer, /*tp_methods*/
   0, /*tp_members*/
-  0, /*tp_getset*/
+  __pyx_getsets_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer, /*tp_getset*/
   0, /*tp_base*/
   0, /*tp_dict*/
   0, /*tp_descr_get*/
@@ -9742,9 +10608,15 @@ static PyTypeObject __pyx_type_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceC
   #if PY_VERSION_HEX >= 0x030400a1
   0, /*tp_finalize*/
   #endif
-  #if PY_VERSION_HEX >= 0x030800b1
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
   0, /*tp_vectorcall*/
   #endif
+  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+  0, /*tp_print*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
 };
 
 static PyMethodDef __pyx_methods[] = {
@@ -9827,6 +10699,7 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_u_char, __pyx_k_char, sizeof(__pyx_k_char), 0, 1, 0, 1},
   {&__pyx_kp_u_char_s_id_P_id_0_9_1_4_s_x_P_x_0, __pyx_k_char_s_id_P_id_0_9_1_4_s_x_P_x_0, sizeof(__pyx_k_char_s_id_P_id_0_9_1_4_s_x_P_x_0), 0, 1, 0, 0},
   {&__pyx_n_u_chars, __pyx_k_chars, sizeof(__pyx_k_chars), 0, 1, 0, 1},
+  {&__pyx_n_s_clear, __pyx_k_clear, sizeof(__pyx_k_clear), 0, 0, 1, 1},
   {&__pyx_n_s_cline_in_traceback, __pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 0, 1, 1},
   {&__pyx_n_u_common, __pyx_k_common, sizeof(__pyx_k_common), 0, 1, 0, 1},
   {&__pyx_n_s_container, __pyx_k_container, sizeof(__pyx_k_container), 0, 0, 1, 1},
@@ -9841,10 +10714,8 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_flags, __pyx_k_flags, sizeof(__pyx_k_flags), 0, 0, 1, 1},
   {&__pyx_n_s_font_kerning, __pyx_k_font_kerning, sizeof(__pyx_k_font_kerning), 0, 0, 1, 1},
   {&__pyx_n_u_font_kerning, __pyx_k_font_kerning, sizeof(__pyx_k_font_kerning), 0, 1, 0, 1},
-  {&__pyx_n_s_get_characters, __pyx_k_get_characters, sizeof(__pyx_k_get_characters), 0, 0, 1, 1},
+  {&__pyx_n_s_get, __pyx_k_get, sizeof(__pyx_k_get), 0, 0, 1, 1},
   {&__pyx_n_s_get_font_asset, __pyx_k_get_font_asset, sizeof(__pyx_k_get_font_asset), 0, 0, 1, 1},
-  {&__pyx_n_s_get_image, __pyx_k_get_image, sizeof(__pyx_k_get_image), 0, 0, 1, 1},
-  {&__pyx_n_s_get_kernings, __pyx_k_get_kernings, sizeof(__pyx_k_get_kernings), 0, 0, 1, 1},
   {&__pyx_n_s_getroot, __pyx_k_getroot, sizeof(__pyx_k_getroot), 0, 0, 1, 1},
   {&__pyx_n_s_getstate, __pyx_k_getstate, sizeof(__pyx_k_getstate), 0, 0, 1, 1},
   {&__pyx_n_s_group, __pyx_k_group, sizeof(__pyx_k_group), 0, 0, 1, 1},
@@ -9855,6 +10726,7 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_import, __pyx_k_import, sizeof(__pyx_k_import), 0, 0, 1, 1},
   {&__pyx_n_u_info, __pyx_k_info, sizeof(__pyx_k_info), 0, 1, 0, 1},
   {&__pyx_n_s_isfile, __pyx_k_isfile, sizeof(__pyx_k_isfile), 0, 0, 1, 1},
+  {&__pyx_n_s_items, __pyx_k_items, sizeof(__pyx_k_items), 0, 0, 1, 1},
   {&__pyx_n_u_kerning, __pyx_k_kerning, sizeof(__pyx_k_kerning), 0, 1, 0, 1},
   {&__pyx_kp_u_kerning_s_first_P_first_0_9_1_3, __pyx_k_kerning_s_first_P_first_0_9_1_3, sizeof(__pyx_k_kerning_s_first_P_first_0_9_1_3), 0, 1, 0, 0},
   {&__pyx_n_u_kernings, __pyx_k_kernings, sizeof(__pyx_k_kernings), 0, 1, 0, 1},
@@ -9865,6 +10737,7 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_load_descriptor_list, __pyx_k_load_descriptor_list, sizeof(__pyx_k_load_descriptor_list), 0, 0, 1, 1},
   {&__pyx_n_s_load_descriptor_xml, __pyx_k_load_descriptor_xml, sizeof(__pyx_k_load_descriptor_xml), 0, 0, 1, 1},
   {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
+  {&__pyx_n_s_memoryview, __pyx_k_memoryview, sizeof(__pyx_k_memoryview), 0, 0, 1, 1},
   {&__pyx_n_s_metaclass, __pyx_k_metaclass, sizeof(__pyx_k_metaclass), 0, 0, 1, 1},
   {&__pyx_n_s_module, __pyx_k_module, sizeof(__pyx_k_module), 0, 0, 1, 1},
   {&__pyx_n_s_mpfmc_uix_bitmap_font_bitmap_fon, __pyx_k_mpfmc_uix_bitmap_font_bitmap_fon, sizeof(__pyx_k_mpfmc_uix_bitmap_font_bitmap_fon), 0, 0, 1, 1},
@@ -9875,9 +10748,9 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_os, __pyx_k_os, sizeof(__pyx_k_os), 0, 0, 1, 1},
   {&__pyx_n_s_path, __pyx_k_path, sizeof(__pyx_k_path), 0, 0, 1, 1},
   {&__pyx_n_s_prepare, __pyx_k_prepare, sizeof(__pyx_k_prepare), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_vtable, __pyx_k_pyx_vtable, sizeof(__pyx_k_pyx_vtable), 0, 0, 1, 1},
   {&__pyx_n_s_qualname, __pyx_k_qualname, sizeof(__pyx_k_qualname), 0, 0, 1, 1},
   {&__pyx_n_s_re, __pyx_k_re, sizeof(__pyx_k_re), 0, 0, 1, 1},
-  {&__pyx_n_s_rect, __pyx_k_rect, sizeof(__pyx_k_rect), 0, 0, 1, 1},
   {&__pyx_n_s_reduce, __pyx_k_reduce, sizeof(__pyx_k_reduce), 0, 0, 1, 1},
   {&__pyx_n_s_reduce_cython, __pyx_k_reduce_cython, sizeof(__pyx_k_reduce_cython), 0, 0, 1, 1},
   {&__pyx_n_s_reduce_ex, __pyx_k_reduce_ex, sizeof(__pyx_k_reduce_ex), 0, 0, 1, 1},
@@ -9893,20 +10766,17 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_u_width, __pyx_k_width, sizeof(__pyx_k_width), 0, 1, 0, 1},
   {&__pyx_n_s_x, __pyx_k_x, sizeof(__pyx_k_x), 0, 0, 1, 1},
   {&__pyx_n_u_x, __pyx_k_x, sizeof(__pyx_k_x), 0, 1, 0, 1},
-  {&__pyx_n_s_xadvance, __pyx_k_xadvance, sizeof(__pyx_k_xadvance), 0, 0, 1, 1},
   {&__pyx_n_u_xadvance, __pyx_k_xadvance, sizeof(__pyx_k_xadvance), 0, 1, 0, 1},
   {&__pyx_n_s_xml_etree_ElementTree, __pyx_k_xml_etree_ElementTree, sizeof(__pyx_k_xml_etree_ElementTree), 0, 0, 1, 1},
-  {&__pyx_n_s_xoffset, __pyx_k_xoffset, sizeof(__pyx_k_xoffset), 0, 0, 1, 1},
   {&__pyx_n_u_xoffset, __pyx_k_xoffset, sizeof(__pyx_k_xoffset), 0, 1, 0, 1},
   {&__pyx_n_s_y, __pyx_k_y, sizeof(__pyx_k_y), 0, 0, 1, 1},
   {&__pyx_n_u_y, __pyx_k_y, sizeof(__pyx_k_y), 0, 1, 0, 1},
-  {&__pyx_n_s_yoffset, __pyx_k_yoffset, sizeof(__pyx_k_yoffset), 0, 0, 1, 1},
   {&__pyx_n_u_yoffset, __pyx_k_yoffset, sizeof(__pyx_k_yoffset), 0, 1, 0, 1},
   {0, 0, 0, 0, 0, 0, 0}
 };
 static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
   __pyx_builtin_TypeError = __Pyx_GetBuiltinName(__pyx_n_s_TypeError); if (!__pyx_builtin_TypeError) __PYX_ERR(0, 2, __pyx_L1_error)
-  __pyx_builtin_open = __Pyx_GetBuiltinName(__pyx_n_s_open); if (!__pyx_builtin_open) __PYX_ERR(1, 764, __pyx_L1_error)
+  __pyx_builtin_open = __Pyx_GetBuiltinName(__pyx_n_s_open); if (!__pyx_builtin_open) __PYX_ERR(1, 850, __pyx_L1_error)
   __pyx_builtin_KeyError = __Pyx_GetBuiltinName(__pyx_n_s_KeyError); if (!__pyx_builtin_KeyError) __PYX_ERR(0, 18, __pyx_L1_error)
   __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(0, 19, __pyx_L1_error)
   return 0;
@@ -9937,14 +10807,14 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
   __Pyx_GOTREF(__pyx_tuple__2);
   __Pyx_GIVEREF(__pyx_tuple__2);
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":764
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":850
  * 
  *         # Open the descriptor file
  *         with open(descriptor_file) as text_file:             # <<<<<<<<<<<<<<
  * 
  *             # Loop over all the rows in the descriptor file
  */
-  __pyx_tuple__4 = PyTuple_Pack(3, Py_None, Py_None, Py_None); if (unlikely(!__pyx_tuple__4)) __PYX_ERR(1, 764, __pyx_L1_error)
+  __pyx_tuple__4 = PyTuple_Pack(3, Py_None, Py_None, Py_None); if (unlikely(!__pyx_tuple__4)) __PYX_ERR(1, 850, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__4);
   __Pyx_GIVEREF(__pyx_tuple__4);
 
@@ -10048,9 +10918,10 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
 }
 
 static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void) {
-  if (__Pyx_InitStrings(__pyx_string_tab) < 0) __PYX_ERR(1, 1, __pyx_L1_error);
+  __pyx_umethod_PyDict_Type_get.type = (PyObject*)&PyDict_Type;
+  if (__Pyx_InitStrings(__pyx_string_tab) < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  __pyx_int_0 = PyInt_FromLong(0); if (unlikely(!__pyx_int_0)) __PYX_ERR(1, 1, __pyx_L1_error)
   __pyx_int_1 = PyInt_FromLong(1); if (unlikely(!__pyx_int_1)) __PYX_ERR(1, 1, __pyx_L1_error)
-  __pyx_int_4 = PyInt_FromLong(4); if (unlikely(!__pyx_int_4)) __PYX_ERR(1, 1, __pyx_L1_error)
   return 0;
   __pyx_L1_error:;
   return -1;
@@ -10090,37 +10961,46 @@ static int __Pyx_modinit_function_export_code(void) {
 
 static int __Pyx_modinit_type_init_code(void) {
   __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__Pyx_modinit_type_init_code", 0);
   /*--- Type init code ---*/
-  if (PyType_Ready(&__pyx_type_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFontCharacter) < 0) __PYX_ERR(1, 614, __pyx_L1_error)
+  if (PyType_Ready(&__pyx_type_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFontCharacter) < 0) __PYX_ERR(1, 627, __pyx_L1_error)
   #if PY_VERSION_HEX < 0x030800B1
   __pyx_type_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFontCharacter.tp_print = 0;
   #endif
   if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFontCharacter.tp_dictoffset && __pyx_type_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFontCharacter.tp_getattro == PyObject_GenericGetAttr)) {
     __pyx_type_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFontCharacter.tp_getattro = __Pyx_PyObject_GenericGetAttr;
   }
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_BitmapFontCharacter, (PyObject *)&__pyx_type_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFontCharacter) < 0) __PYX_ERR(1, 614, __pyx_L1_error)
-  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFontCharacter) < 0) __PYX_ERR(1, 614, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_BitmapFontCharacter, (PyObject *)&__pyx_type_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFontCharacter) < 0) __PYX_ERR(1, 627, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFontCharacter) < 0) __PYX_ERR(1, 627, __pyx_L1_error)
   __pyx_ptype_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFontCharacter = &__pyx_type_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFontCharacter;
-  if (PyType_Ready(&__pyx_type_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont) < 0) __PYX_ERR(1, 632, __pyx_L1_error)
+  __pyx_vtabptr_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont = &__pyx_vtable_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont;
+  __pyx_vtable_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont._build_glyph_index = (void (*)(struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont *))__pyx_f_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont__build_glyph_index;
+  __pyx_vtable_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont._get_glyph = (int (*)(struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont *, int, struct __pyx_t_5mpfmc_3uix_11bitmap_font_11bitmap_font_GlyphInfo *))__pyx_f_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont__get_glyph;
+  __pyx_vtable_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont._get_kerning = (int (*)(struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont *, int, int))__pyx_f_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont__get_kerning;
+  __pyx_vtable_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont.render_text = (void (*)(struct __pyx_obj_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont *, struct SDL_Surface *, PyObject *, int, int, int))__pyx_f_5mpfmc_3uix_11bitmap_font_11bitmap_font_10BitmapFont_render_text;
+  if (PyType_Ready(&__pyx_type_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont) < 0) __PYX_ERR(1, 645, __pyx_L1_error)
   #if PY_VERSION_HEX < 0x030800B1
   __pyx_type_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont.tp_print = 0;
   #endif
   if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont.tp_dictoffset && __pyx_type_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont.tp_getattro == PyObject_GenericGetAttr)) {
     __pyx_type_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont.tp_getattro = __Pyx_PyObject_GenericGetAttr;
   }
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_BitmapFont, (PyObject *)&__pyx_type_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont) < 0) __PYX_ERR(1, 632, __pyx_L1_error)
-  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont) < 0) __PYX_ERR(1, 632, __pyx_L1_error)
+  if (__Pyx_SetVtable(__pyx_type_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont.tp_dict, __pyx_vtabptr_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont) < 0) __PYX_ERR(1, 645, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_BitmapFont, (PyObject *)&__pyx_type_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont) < 0) __PYX_ERR(1, 645, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont) < 0) __PYX_ERR(1, 645, __pyx_L1_error)
   __pyx_ptype_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont = &__pyx_type_5mpfmc_3uix_11bitmap_font_11bitmap_font_BitmapFont;
-  if (PyType_Ready(&__pyx_type_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer) < 0) __PYX_ERR(1, 913, __pyx_L1_error)
+  if (PyType_Ready(&__pyx_type_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer) < 0) __PYX_ERR(1, 1000, __pyx_L1_error)
   #if PY_VERSION_HEX < 0x030800B1
   __pyx_type_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer.tp_print = 0;
   #endif
   if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer.tp_dictoffset && __pyx_type_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer.tp_getattro == PyObject_GenericGetAttr)) {
     __pyx_type_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer.tp_getattro = __Pyx_PyObject_GenericGetAttr;
   }
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_SurfaceContainer, (PyObject *)&__pyx_type_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer) < 0) __PYX_ERR(1, 913, __pyx_L1_error)
-  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer) < 0) __PYX_ERR(1, 913, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_SurfaceContainer, (PyObject *)&__pyx_type_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer) < 0) __PYX_ERR(1, 1000, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer) < 0) __PYX_ERR(1, 1000, __pyx_L1_error)
   __pyx_ptype_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer = &__pyx_type_5mpfmc_3uix_11bitmap_font_11bitmap_font__SurfaceContainer;
   __Pyx_RefNannyFinishContext();
   return 0;
@@ -10154,17 +11034,19 @@ static int __Pyx_modinit_function_import_code(void) {
 }
 
 
-#if PY_MAJOR_VERSION < 3
-#ifdef CYTHON_NO_PYINIT_EXPORT
-#define __Pyx_PyMODINIT_FUNC void
-#else
+#ifndef CYTHON_NO_PYINIT_EXPORT
 #define __Pyx_PyMODINIT_FUNC PyMODINIT_FUNC
+#elif PY_MAJOR_VERSION < 3
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" void
+#else
+#define __Pyx_PyMODINIT_FUNC void
 #endif
 #else
-#ifdef CYTHON_NO_PYINIT_EXPORT
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" PyObject *
+#else
 #define __Pyx_PyMODINIT_FUNC PyObject *
-#else
-#define __Pyx_PyMODINIT_FUNC PyMODINIT_FUNC
 #endif
 #endif
 
@@ -10249,6 +11131,9 @@ static CYTHON_SMALL_CODE int __pyx_pymod_exec_bitmap_font(PyObject *__pyx_pyinit
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
   PyObject *__pyx_t_4 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannyDeclarations
   #if CYTHON_PEP489_MULTI_PHASE_INIT
   if (__pyx_m) {
@@ -10296,11 +11181,9 @@ if (!__Pyx_RefNanny) {
   #endif
   /*--- Library function declarations ---*/
   /*--- Threads initialization code ---*/
-  #if defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
-  #ifdef WITH_THREAD /* Python build with threading support? */
+  #if defined(WITH_THREAD) && PY_VERSION_HEX < 0x030700F0 && defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
   PyEval_InitThreads();
   #endif
-  #endif
   /*--- Module creation code ---*/
   #if CYTHON_PEP489_MULTI_PHASE_INIT
   __pyx_m = __pyx_pyinit_module;
@@ -10319,7 +11202,7 @@ if (!__Pyx_RefNanny) {
   Py_INCREF(__pyx_b);
   __pyx_cython_runtime = PyImport_AddModule((char *) "cython_runtime"); if (unlikely(!__pyx_cython_runtime)) __PYX_ERR(1, 1, __pyx_L1_error)
   Py_INCREF(__pyx_cython_runtime);
-  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) __PYX_ERR(1, 1, __pyx_L1_error);
+  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) __PYX_ERR(1, 1, __pyx_L1_error)
   /*--- Initialize various global constants etc. ---*/
   if (__Pyx_InitGlobals() < 0) __PYX_ERR(1, 1, __pyx_L1_error)
   #if PY_MAJOR_VERSION < 3 && (__PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT)
@@ -10344,7 +11227,7 @@ if (!__Pyx_RefNanny) {
   (void)__Pyx_modinit_global_init_code();
   (void)__Pyx_modinit_variable_export_code();
   (void)__Pyx_modinit_function_export_code();
-  if (unlikely(__Pyx_modinit_type_init_code() != 0)) goto __pyx_L1_error;
+  if (unlikely(__Pyx_modinit_type_init_code() < 0)) __PYX_ERR(1, 1, __pyx_L1_error)
   (void)__Pyx_modinit_type_import_code();
   (void)__Pyx_modinit_variable_import_code();
   (void)__Pyx_modinit_function_import_code();
@@ -10362,47 +11245,47 @@ if (!__Pyx_RefNanny) {
  */
   if (PyDict_SetItem(__pyx_d, __pyx_n_s_all, __pyx_tuple__13) < 0) __PYX_ERR(1, 4, __pyx_L1_error)
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":11
- * cimport cpython.pycapsule as pycapsule
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":12
+ * from cpython.buffer cimport PyBuffer_FillInfo
  * 
  * import re             # <<<<<<<<<<<<<<
  * from os import path
  * from xml.etree.ElementTree import ElementTree, ParseError
  */
-  __pyx_t_1 = __Pyx_Import(__pyx_n_s_re, 0, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 11, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_Import(__pyx_n_s_re, 0, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_re, __pyx_t_1) < 0) __PYX_ERR(1, 11, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_re, __pyx_t_1) < 0) __PYX_ERR(1, 12, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":12
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":13
  * 
  * import re
  * from os import path             # <<<<<<<<<<<<<<
  * from xml.etree.ElementTree import ElementTree, ParseError
  * from libc.string cimport memset
  */
-  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
+  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 13, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_INCREF(__pyx_n_s_path);
   __Pyx_GIVEREF(__pyx_n_s_path);
   PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_path);
-  __pyx_t_2 = __Pyx_Import(__pyx_n_s_os, __pyx_t_1, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 12, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_Import(__pyx_n_s_os, __pyx_t_1, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 13, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_path); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_path); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 13, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_path, __pyx_t_1) < 0) __PYX_ERR(1, 12, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_path, __pyx_t_1) < 0) __PYX_ERR(1, 13, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":13
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":14
  * import re
  * from os import path
  * from xml.etree.ElementTree import ElementTree, ParseError             # <<<<<<<<<<<<<<
  * from libc.string cimport memset
  * from kivy.core.image import ImageData
  */
-  __pyx_t_2 = PyList_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 13, __pyx_L1_error)
+  __pyx_t_2 = PyList_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 14, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_INCREF(__pyx_n_s_ElementTree);
   __Pyx_GIVEREF(__pyx_n_s_ElementTree);
@@ -10410,59 +11293,59 @@ if (!__Pyx_RefNanny) {
   __Pyx_INCREF(__pyx_n_s_ParseError);
   __Pyx_GIVEREF(__pyx_n_s_ParseError);
   PyList_SET_ITEM(__pyx_t_2, 1, __pyx_n_s_ParseError);
-  __pyx_t_1 = __Pyx_Import(__pyx_n_s_xml_etree_ElementTree, __pyx_t_2, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 13, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_Import(__pyx_n_s_xml_etree_ElementTree, __pyx_t_2, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 14, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_1, __pyx_n_s_ElementTree); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 13, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_1, __pyx_n_s_ElementTree); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 14, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_ElementTree, __pyx_t_2) < 0) __PYX_ERR(1, 13, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_ElementTree, __pyx_t_2) < 0) __PYX_ERR(1, 14, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_1, __pyx_n_s_ParseError); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 13, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_1, __pyx_n_s_ParseError); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 14, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_ParseError, __pyx_t_2) < 0) __PYX_ERR(1, 13, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_ParseError, __pyx_t_2) < 0) __PYX_ERR(1, 14, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":15
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":16
  * from xml.etree.ElementTree import ElementTree, ParseError
  * from libc.string cimport memset
  * from kivy.core.image import ImageData             # <<<<<<<<<<<<<<
  * 
  * 
  */
-  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 15, __pyx_L1_error)
+  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 16, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_INCREF(__pyx_n_s_ImageData);
   __Pyx_GIVEREF(__pyx_n_s_ImageData);
   PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_ImageData);
-  __pyx_t_2 = __Pyx_Import(__pyx_n_s_kivy_core_image, __pyx_t_1, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 15, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_Import(__pyx_n_s_kivy_core_image, __pyx_t_1, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 16, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_ImageData); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 15, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_ImageData); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 16, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_ImageData, __pyx_t_1) < 0) __PYX_ERR(1, 15, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_ImageData, __pyx_t_1) < 0) __PYX_ERR(1, 16, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":609
+  /* "mpfmc/uix/bitmap_font/bitmap_font.pyx":610
  * 
  * 
  * class BitmapFontException(Exception):             # <<<<<<<<<<<<<<
  *     """Exception returned by the bitmap font module"""
  *     pass
  */
-  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 609, __pyx_L1_error)
+  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 610, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_INCREF(((PyObject *)(&((PyTypeObject*)PyExc_Exception)[0])));
   __Pyx_GIVEREF(((PyObject *)(&((PyTypeObject*)PyExc_Exception)[0])));
   PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)(&((PyTypeObject*)PyExc_Exception)[0])));
-  __pyx_t_1 = __Pyx_CalculateMetaclass(NULL, __pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 609, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_CalculateMetaclass(NULL, __pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 610, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_3 = __Pyx_Py3MetaclassPrepare(__pyx_t_1, __pyx_t_2, __pyx_n_s_BitmapFontException, __pyx_n_s_BitmapFontException, (PyObject *) NULL, __pyx_n_s_mpfmc_uix_bitmap_font_bitmap_fon, __pyx_kp_s_Exception_returned_by_the_bitmap); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 609, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_Py3MetaclassPrepare(__pyx_t_1, __pyx_t_2, __pyx_n_s_BitmapFontException, __pyx_n_s_BitmapFontException, (PyObject *) NULL, __pyx_n_s_mpfmc_uix_bitmap_font_bitmap_fon, __pyx_kp_s_Exception_returned_by_the_bitmap); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 610, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = __Pyx_Py3ClassCreate(__pyx_t_1, __pyx_n_s_BitmapFontException, __pyx_t_2, __pyx_t_3, NULL, 0, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 609, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_Py3ClassCreate(__pyx_t_1, __pyx_n_s_BitmapFontException, __pyx_t_2, __pyx_t_3, NULL, 0, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 610, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_BitmapFontException, __pyx_t_4) < 0) __PYX_ERR(1, 609, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_BitmapFontException, __pyx_t_4) < 0) __PYX_ERR(1, 610, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
@@ -10603,7 +11486,7 @@ invalid_keyword:
 #if CYTHON_COMPILING_IN_CPYTHON
 static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw) {
     PyObject *result;
-    ternaryfunc call = func->ob_type->tp_call;
+    ternaryfunc call = Py_TYPE(func)->tp_call;
     if (unlikely(!call))
         return PyObject_Call(func, arg, kw);
     if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
@@ -10780,13 +11663,7 @@ static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject
     }
     PyErr_SetObject(type, value);
     if (tb) {
-#if CYTHON_COMPILING_IN_PYPY
-        PyObject *tmp_type, *tmp_value, *tmp_tb;
-        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
-        Py_INCREF(tb);
-        PyErr_Restore(tmp_type, tmp_value, tb);
-        Py_XDECREF(tmp_tb);
-#else
+#if CYTHON_FAST_THREAD_STATE
         PyThreadState *tstate = __Pyx_PyThreadState_Current;
         PyObject* tmp_tb = tstate->curexc_traceback;
         if (tb != tmp_tb) {
@@ -10794,6 +11671,12 @@ static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject
             tstate->curexc_traceback = tb;
             Py_XDECREF(tmp_tb);
         }
+#else
+        PyObject *tmp_type, *tmp_value, *tmp_tb;
+        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
+        Py_INCREF(tb);
+        PyErr_Restore(tmp_type, tmp_value, tb);
+        Py_XDECREF(tmp_tb);
 #endif
     }
 bad:
@@ -10864,7 +11747,7 @@ static int __Pyx_ParseOptionalKeywords(
         }
         name = first_kw_arg;
         #if PY_MAJOR_VERSION < 3
-        if (likely(PyString_CheckExact(key)) || likely(PyString_Check(key))) {
+        if (likely(PyString_Check(key))) {
             while (*name) {
                 if ((CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**name) == PyString_GET_SIZE(key))
                         && _PyString_Eq(**name, key)) {
@@ -10891,7 +11774,7 @@ static int __Pyx_ParseOptionalKeywords(
             while (*name) {
                 int cmp = (**name == key) ? 0 :
                 #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
-                    (PyUnicode_GET_SIZE(**name) != PyUnicode_GET_SIZE(key)) ? 1 :
+                    (__Pyx_PyUnicode_GET_LENGTH(**name) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
                 #endif
                     PyUnicode_Compare(**name, key);
                 if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
@@ -10907,7 +11790,7 @@ static int __Pyx_ParseOptionalKeywords(
                 while (argname != first_kw_arg) {
                     int cmp = (**argname == key) ? 0 :
                     #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
-                        (PyUnicode_GET_SIZE(**argname) != PyUnicode_GET_SIZE(key)) ? 1 :
+                        (__Pyx_PyUnicode_GET_LENGTH(**argname) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
                     #endif
                         PyUnicode_Compare(**argname, key);
                     if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
@@ -11080,7 +11963,7 @@ static PyObject* __Pyx_PyFunction_FastCallNoKw(PyCodeObject *co, PyObject **args
     return result;
 }
 #if 1 || PY_VERSION_HEX < 0x030600B1
-static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, int nargs, PyObject *kwargs) {
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs) {
     PyCodeObject *co = (PyCodeObject *)PyFunction_GET_CODE(func);
     PyObject *globals = PyFunction_GET_GLOBALS(func);
     PyObject *argdefs = PyFunction_GET_DEFAULTS(func);
@@ -11141,121 +12024,681 @@ static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args,
 #if PY_MAJOR_VERSION >= 3
     kwdefs = PyFunction_GET_KW_DEFAULTS(func);
 #endif
-    if (argdefs != NULL) {
-        d = &PyTuple_GET_ITEM(argdefs, 0);
-        nd = Py_SIZE(argdefs);
+    if (argdefs != NULL) {
+        d = &PyTuple_GET_ITEM(argdefs, 0);
+        nd = Py_SIZE(argdefs);
+    }
+    else {
+        d = NULL;
+        nd = 0;
+    }
+#if PY_MAJOR_VERSION >= 3
+    result = PyEval_EvalCodeEx((PyObject*)co, globals, (PyObject *)NULL,
+                               args, (int)nargs,
+                               k, (int)nk,
+                               d, (int)nd, kwdefs, closure);
+#else
+    result = PyEval_EvalCodeEx(co, globals, (PyObject *)NULL,
+                               args, (int)nargs,
+                               k, (int)nk,
+                               d, (int)nd, closure);
+#endif
+    Py_XDECREF(kwtuple);
+done:
+    Py_LeaveRecursiveCall();
+    return result;
+}
+#endif
+#endif
+
+/* PyObjectCall2Args */
+static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2) {
+    PyObject *args, *result = NULL;
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(function)) {
+        PyObject *args[2] = {arg1, arg2};
+        return __Pyx_PyFunction_FastCall(function, args, 2);
+    }
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(function)) {
+        PyObject *args[2] = {arg1, arg2};
+        return __Pyx_PyCFunction_FastCall(function, args, 2);
+    }
+    #endif
+    args = PyTuple_New(2);
+    if (unlikely(!args)) goto done;
+    Py_INCREF(arg1);
+    PyTuple_SET_ITEM(args, 0, arg1);
+    Py_INCREF(arg2);
+    PyTuple_SET_ITEM(args, 1, arg2);
+    Py_INCREF(function);
+    result = __Pyx_PyObject_Call(function, args, NULL);
+    Py_DECREF(args);
+    Py_DECREF(function);
+done:
+    return result;
+}
+
+/* PyObjectCallMethO */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg) {
+    PyObject *self, *result;
+    PyCFunction cfunc;
+    cfunc = PyCFunction_GET_FUNCTION(func);
+    self = PyCFunction_GET_SELF(func);
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    result = cfunc(self, arg);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* PyObjectCallOneArg */
+#if CYTHON_COMPILING_IN_CPYTHON
+static PyObject* __Pyx__PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *result;
+    PyObject *args = PyTuple_New(1);
+    if (unlikely(!args)) return NULL;
+    Py_INCREF(arg);
+    PyTuple_SET_ITEM(args, 0, arg);
+    result = __Pyx_PyObject_Call(func, args, NULL);
+    Py_DECREF(args);
+    return result;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+#if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(func)) {
+        return __Pyx_PyFunction_FastCall(func, &arg, 1);
+    }
+#endif
+    if (likely(PyCFunction_Check(func))) {
+        if (likely(PyCFunction_GET_FLAGS(func) & METH_O)) {
+            return __Pyx_PyObject_CallMethO(func, arg);
+#if CYTHON_FAST_PYCCALL
+        } else if (__Pyx_PyFastCFunction_Check(func)) {
+            return __Pyx_PyCFunction_FastCall(func, &arg, 1);
+#endif
+        }
+    }
+    return __Pyx__PyObject_CallOneArg(func, arg);
+}
+#else
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *result;
+    PyObject *args = PyTuple_Pack(1, arg);
+    if (unlikely(!args)) return NULL;
+    result = __Pyx_PyObject_Call(func, args, NULL);
+    Py_DECREF(args);
+    return result;
+}
+#endif
+
+/* IterFinish */
+static CYTHON_INLINE int __Pyx_IterFinish(void) {
+#if CYTHON_FAST_THREAD_STATE
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject* exc_type = tstate->curexc_type;
+    if (unlikely(exc_type)) {
+        if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) {
+            PyObject *exc_value, *exc_tb;
+            exc_value = tstate->curexc_value;
+            exc_tb = tstate->curexc_traceback;
+            tstate->curexc_type = 0;
+            tstate->curexc_value = 0;
+            tstate->curexc_traceback = 0;
+            Py_DECREF(exc_type);
+            Py_XDECREF(exc_value);
+            Py_XDECREF(exc_tb);
+            return 0;
+        } else {
+            return -1;
+        }
+    }
+    return 0;
+#else
+    if (unlikely(PyErr_Occurred())) {
+        if (likely(PyErr_ExceptionMatches(PyExc_StopIteration))) {
+            PyErr_Clear();
+            return 0;
+        } else {
+            return -1;
+        }
+    }
+    return 0;
+#endif
+}
+
+/* PyObjectCallNoArg */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func) {
+#if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(func)) {
+        return __Pyx_PyFunction_FastCall(func, NULL, 0);
+    }
+#endif
+#if defined(__Pyx_CyFunction_USED) && defined(NDEBUG)
+    if (likely(PyCFunction_Check(func) || __Pyx_CyFunction_Check(func)))
+#else
+    if (likely(PyCFunction_Check(func)))
+#endif
+    {
+        if (likely(PyCFunction_GET_FLAGS(func) & METH_NOARGS)) {
+            return __Pyx_PyObject_CallMethO(func, NULL);
+        }
+    }
+    return __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL);
+}
+#endif
+
+/* PyObjectGetMethod */
+static int __Pyx_PyObject_GetMethod(PyObject *obj, PyObject *name, PyObject **method) {
+    PyObject *attr;
+#if CYTHON_UNPACK_METHODS && CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_PYTYPE_LOOKUP
+    PyTypeObject *tp = Py_TYPE(obj);
+    PyObject *descr;
+    descrgetfunc f = NULL;
+    PyObject **dictptr, *dict;
+    int meth_found = 0;
+    assert (*method == NULL);
+    if (unlikely(tp->tp_getattro != PyObject_GenericGetAttr)) {
+        attr = __Pyx_PyObject_GetAttrStr(obj, name);
+        goto try_unpack;
+    }
+    if (unlikely(tp->tp_dict == NULL) && unlikely(PyType_Ready(tp) < 0)) {
+        return 0;
+    }
+    descr = _PyType_Lookup(tp, name);
+    if (likely(descr != NULL)) {
+        Py_INCREF(descr);
+#if PY_MAJOR_VERSION >= 3
+        #ifdef __Pyx_CyFunction_USED
+        if (likely(PyFunction_Check(descr) || (Py_TYPE(descr) == &PyMethodDescr_Type) || __Pyx_CyFunction_Check(descr)))
+        #else
+        if (likely(PyFunction_Check(descr) || (Py_TYPE(descr) == &PyMethodDescr_Type)))
+        #endif
+#else
+        #ifdef __Pyx_CyFunction_USED
+        if (likely(PyFunction_Check(descr) || __Pyx_CyFunction_Check(descr)))
+        #else
+        if (likely(PyFunction_Check(descr)))
+        #endif
+#endif
+        {
+            meth_found = 1;
+        } else {
+            f = Py_TYPE(descr)->tp_descr_get;
+            if (f != NULL && PyDescr_IsData(descr)) {
+                attr = f(descr, obj, (PyObject *)Py_TYPE(obj));
+                Py_DECREF(descr);
+                goto try_unpack;
+            }
+        }
+    }
+    dictptr = _PyObject_GetDictPtr(obj);
+    if (dictptr != NULL && (dict = *dictptr) != NULL) {
+        Py_INCREF(dict);
+        attr = __Pyx_PyDict_GetItemStr(dict, name);
+        if (attr != NULL) {
+            Py_INCREF(attr);
+            Py_DECREF(dict);
+            Py_XDECREF(descr);
+            goto try_unpack;
+        }
+        Py_DECREF(dict);
+    }
+    if (meth_found) {
+        *method = descr;
+        return 1;
+    }
+    if (f != NULL) {
+        attr = f(descr, obj, (PyObject *)Py_TYPE(obj));
+        Py_DECREF(descr);
+        goto try_unpack;
+    }
+    if (descr != NULL) {
+        *method = descr;
+        return 0;
+    }
+    PyErr_Format(PyExc_AttributeError,
+#if PY_MAJOR_VERSION >= 3
+                 "'%.50s' object has no attribute '%U'",
+                 tp->tp_name, name);
+#else
+                 "'%.50s' object has no attribute '%.400s'",
+                 tp->tp_name, PyString_AS_STRING(name));
+#endif
+    return 0;
+#else
+    attr = __Pyx_PyObject_GetAttrStr(obj, name);
+    goto try_unpack;
+#endif
+try_unpack:
+#if CYTHON_UNPACK_METHODS
+    if (likely(attr) && PyMethod_Check(attr) && likely(PyMethod_GET_SELF(attr) == obj)) {
+        PyObject *function = PyMethod_GET_FUNCTION(attr);
+        Py_INCREF(function);
+        Py_DECREF(attr);
+        *method = function;
+        return 1;
+    }
+#endif
+    *method = attr;
+    return 0;
+}
+
+/* PyObjectCallMethod0 */
+static PyObject* __Pyx_PyObject_CallMethod0(PyObject* obj, PyObject* method_name) {
+    PyObject *method = NULL, *result = NULL;
+    int is_method = __Pyx_PyObject_GetMethod(obj, method_name, &method);
+    if (likely(is_method)) {
+        result = __Pyx_PyObject_CallOneArg(method, obj);
+        Py_DECREF(method);
+        return result;
+    }
+    if (unlikely(!method)) goto bad;
+    result = __Pyx_PyObject_CallNoArg(method);
+    Py_DECREF(method);
+bad:
+    return result;
+}
+
+/* RaiseNeedMoreValuesToUnpack */
+static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index) {
+    PyErr_Format(PyExc_ValueError,
+                 "need more than %" CYTHON_FORMAT_SSIZE_T "d value%.1s to unpack",
+                 index, (index == 1) ? "" : "s");
+}
+
+/* RaiseTooManyValuesToUnpack */
+static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected) {
+    PyErr_Format(PyExc_ValueError,
+                 "too many values to unpack (expected %" CYTHON_FORMAT_SSIZE_T "d)", expected);
+}
+
+/* UnpackItemEndCheck */
+static int __Pyx_IternextUnpackEndCheck(PyObject *retval, Py_ssize_t expected) {
+    if (unlikely(retval)) {
+        Py_DECREF(retval);
+        __Pyx_RaiseTooManyValuesError(expected);
+        return -1;
+    }
+    return __Pyx_IterFinish();
+}
+
+/* RaiseNoneIterError */
+static CYTHON_INLINE void __Pyx_RaiseNoneNotIterableError(void) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
+}
+
+/* UnpackTupleError */
+static void __Pyx_UnpackTupleError(PyObject *t, Py_ssize_t index) {
+    if (t == Py_None) {
+      __Pyx_RaiseNoneNotIterableError();
+    } else if (PyTuple_GET_SIZE(t) < index) {
+      __Pyx_RaiseNeedMoreValuesError(PyTuple_GET_SIZE(t));
+    } else {
+      __Pyx_RaiseTooManyValuesError(index);
+    }
+}
+
+/* UnpackTuple2 */
+static CYTHON_INLINE int __Pyx_unpack_tuple2_exact(
+        PyObject* tuple, PyObject** pvalue1, PyObject** pvalue2, int decref_tuple) {
+    PyObject *value1 = NULL, *value2 = NULL;
+#if CYTHON_COMPILING_IN_PYPY
+    value1 = PySequence_ITEM(tuple, 0);  if (unlikely(!value1)) goto bad;
+    value2 = PySequence_ITEM(tuple, 1);  if (unlikely(!value2)) goto bad;
+#else
+    value1 = PyTuple_GET_ITEM(tuple, 0);  Py_INCREF(value1);
+    value2 = PyTuple_GET_ITEM(tuple, 1);  Py_INCREF(value2);
+#endif
+    if (decref_tuple) {
+        Py_DECREF(tuple);
+    }
+    *pvalue1 = value1;
+    *pvalue2 = value2;
+    return 0;
+#if CYTHON_COMPILING_IN_PYPY
+bad:
+    Py_XDECREF(value1);
+    Py_XDECREF(value2);
+    if (decref_tuple) { Py_XDECREF(tuple); }
+    return -1;
+#endif
+}
+static int __Pyx_unpack_tuple2_generic(PyObject* tuple, PyObject** pvalue1, PyObject** pvalue2,
+                                       int has_known_size, int decref_tuple) {
+    Py_ssize_t index;
+    PyObject *value1 = NULL, *value2 = NULL, *iter = NULL;
+    iternextfunc iternext;
+    iter = PyObject_GetIter(tuple);
+    if (unlikely(!iter)) goto bad;
+    if (decref_tuple) { Py_DECREF(tuple); tuple = NULL; }
+    iternext = Py_TYPE(iter)->tp_iternext;
+    value1 = iternext(iter); if (unlikely(!value1)) { index = 0; goto unpacking_failed; }
+    value2 = iternext(iter); if (unlikely(!value2)) { index = 1; goto unpacking_failed; }
+    if (!has_known_size && unlikely(__Pyx_IternextUnpackEndCheck(iternext(iter), 2))) goto bad;
+    Py_DECREF(iter);
+    *pvalue1 = value1;
+    *pvalue2 = value2;
+    return 0;
+unpacking_failed:
+    if (!has_known_size && __Pyx_IterFinish() == 0)
+        __Pyx_RaiseNeedMoreValuesError(index);
+bad:
+    Py_XDECREF(iter);
+    Py_XDECREF(value1);
+    Py_XDECREF(value2);
+    if (decref_tuple) { Py_XDECREF(tuple); }
+    return -1;
+}
+
+/* dict_iter */
+static CYTHON_INLINE PyObject* __Pyx_dict_iterator(PyObject* iterable, int is_dict, PyObject* method_name,
+                                                   Py_ssize_t* p_orig_length, int* p_source_is_dict) {
+    is_dict = is_dict || likely(PyDict_CheckExact(iterable));
+    *p_source_is_dict = is_dict;
+    if (is_dict) {
+#if !CYTHON_COMPILING_IN_PYPY
+        *p_orig_length = PyDict_Size(iterable);
+        Py_INCREF(iterable);
+        return iterable;
+#elif PY_MAJOR_VERSION >= 3
+        static PyObject *py_items = NULL, *py_keys = NULL, *py_values = NULL;
+        PyObject **pp = NULL;
+        if (method_name) {
+            const char *name = PyUnicode_AsUTF8(method_name);
+            if (strcmp(name, "iteritems") == 0) pp = &py_items;
+            else if (strcmp(name, "iterkeys") == 0) pp = &py_keys;
+            else if (strcmp(name, "itervalues") == 0) pp = &py_values;
+            if (pp) {
+                if (!*pp) {
+                    *pp = PyUnicode_FromString(name + 4);
+                    if (!*pp)
+                        return NULL;
+                }
+                method_name = *pp;
+            }
+        }
+#endif
+    }
+    *p_orig_length = 0;
+    if (method_name) {
+        PyObject* iter;
+        iterable = __Pyx_PyObject_CallMethod0(iterable, method_name);
+        if (!iterable)
+            return NULL;
+#if !CYTHON_COMPILING_IN_PYPY
+        if (PyTuple_CheckExact(iterable) || PyList_CheckExact(iterable))
+            return iterable;
+#endif
+        iter = PyObject_GetIter(iterable);
+        Py_DECREF(iterable);
+        return iter;
+    }
+    return PyObject_GetIter(iterable);
+}
+static CYTHON_INLINE int __Pyx_dict_iter_next(
+        PyObject* iter_obj, CYTHON_NCP_UNUSED Py_ssize_t orig_length, CYTHON_NCP_UNUSED Py_ssize_t* ppos,
+        PyObject** pkey, PyObject** pvalue, PyObject** pitem, int source_is_dict) {
+    PyObject* next_item;
+#if !CYTHON_COMPILING_IN_PYPY
+    if (source_is_dict) {
+        PyObject *key, *value;
+        if (unlikely(orig_length != PyDict_Size(iter_obj))) {
+            PyErr_SetString(PyExc_RuntimeError, "dictionary changed size during iteration");
+            return -1;
+        }
+        if (unlikely(!PyDict_Next(iter_obj, ppos, &key, &value))) {
+            return 0;
+        }
+        if (pitem) {
+            PyObject* tuple = PyTuple_New(2);
+            if (unlikely(!tuple)) {
+                return -1;
+            }
+            Py_INCREF(key);
+            Py_INCREF(value);
+            PyTuple_SET_ITEM(tuple, 0, key);
+            PyTuple_SET_ITEM(tuple, 1, value);
+            *pitem = tuple;
+        } else {
+            if (pkey) {
+                Py_INCREF(key);
+                *pkey = key;
+            }
+            if (pvalue) {
+                Py_INCREF(value);
+                *pvalue = value;
+            }
+        }
+        return 1;
+    } else if (PyTuple_CheckExact(iter_obj)) {
+        Py_ssize_t pos = *ppos;
+        if (unlikely(pos >= PyTuple_GET_SIZE(iter_obj))) return 0;
+        *ppos = pos + 1;
+        next_item = PyTuple_GET_ITEM(iter_obj, pos);
+        Py_INCREF(next_item);
+    } else if (PyList_CheckExact(iter_obj)) {
+        Py_ssize_t pos = *ppos;
+        if (unlikely(pos >= PyList_GET_SIZE(iter_obj))) return 0;
+        *ppos = pos + 1;
+        next_item = PyList_GET_ITEM(iter_obj, pos);
+        Py_INCREF(next_item);
+    } else
+#endif
+    {
+        next_item = PyIter_Next(iter_obj);
+        if (unlikely(!next_item)) {
+            return __Pyx_IterFinish();
+        }
     }
-    else {
-        d = NULL;
-        nd = 0;
+    if (pitem) {
+        *pitem = next_item;
+    } else if (pkey && pvalue) {
+        if (__Pyx_unpack_tuple2(next_item, pkey, pvalue, source_is_dict, source_is_dict, 1))
+            return -1;
+    } else if (pkey) {
+        *pkey = next_item;
+    } else {
+        *pvalue = next_item;
     }
-#if PY_MAJOR_VERSION >= 3
-    result = PyEval_EvalCodeEx((PyObject*)co, globals, (PyObject *)NULL,
-                               args, nargs,
-                               k, (int)nk,
-                               d, (int)nd, kwdefs, closure);
-#else
-    result = PyEval_EvalCodeEx(co, globals, (PyObject *)NULL,
-                               args, nargs,
-                               k, (int)nk,
-                               d, (int)nd, closure);
-#endif
-    Py_XDECREF(kwtuple);
-done:
-    Py_LeaveRecursiveCall();
-    return result;
+    return 1;
 }
-#endif
-#endif
 
-/* PyObjectCall2Args */
-static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2) {
-    PyObject *args, *result = NULL;
-    #if CYTHON_FAST_PYCALL
-    if (PyFunction_Check(function)) {
-        PyObject *args[2] = {arg1, arg2};
-        return __Pyx_PyFunction_FastCall(function, args, 2);
+/* ExtTypeTest */
+static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type) {
+    if (unlikely(!type)) {
+        PyErr_SetString(PyExc_SystemError, "Missing type object");
+        return 0;
     }
+    if (likely(__Pyx_TypeCheck(obj, type)))
+        return 1;
+    PyErr_Format(PyExc_TypeError, "Cannot convert %.200s to %.200s",
+                 Py_TYPE(obj)->tp_name, type->tp_name);
+    return 0;
+}
+
+/* UnpackUnboundCMethod */
+static int __Pyx_TryUnpackUnboundCMethod(__Pyx_CachedCFunction* target) {
+    PyObject *method;
+    method = __Pyx_PyObject_GetAttrStr(target->type, *target->method_name);
+    if (unlikely(!method))
+        return -1;
+    target->method = method;
+#if CYTHON_COMPILING_IN_CPYTHON
+    #if PY_MAJOR_VERSION >= 3
+    if (likely(__Pyx_TypeCheck(method, &PyMethodDescr_Type)))
     #endif
-    #if CYTHON_FAST_PYCCALL
-    if (__Pyx_PyFastCFunction_Check(function)) {
-        PyObject *args[2] = {arg1, arg2};
-        return __Pyx_PyCFunction_FastCall(function, args, 2);
+    {
+        PyMethodDescrObject *descr = (PyMethodDescrObject*) method;
+        target->func = descr->d_method->ml_meth;
+        target->flag = descr->d_method->ml_flags & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_STACKLESS);
     }
-    #endif
-    args = PyTuple_New(2);
-    if (unlikely(!args)) goto done;
-    Py_INCREF(arg1);
-    PyTuple_SET_ITEM(args, 0, arg1);
-    Py_INCREF(arg2);
-    PyTuple_SET_ITEM(args, 1, arg2);
-    Py_INCREF(function);
-    result = __Pyx_PyObject_Call(function, args, NULL);
-    Py_DECREF(args);
-    Py_DECREF(function);
-done:
-    return result;
+#endif
+    return 0;
 }
 
-/* PyObjectCallMethO */
+/* CallUnboundCMethod1 */
 #if CYTHON_COMPILING_IN_CPYTHON
-static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg) {
-    PyObject *self, *result;
-    PyCFunction cfunc;
-    cfunc = PyCFunction_GET_FUNCTION(func);
-    self = PyCFunction_GET_SELF(func);
-    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
-        return NULL;
-    result = cfunc(self, arg);
-    Py_LeaveRecursiveCall();
-    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
-        PyErr_SetString(
-            PyExc_SystemError,
-            "NULL result without error in PyObject_Call");
+static CYTHON_INLINE PyObject* __Pyx_CallUnboundCMethod1(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg) {
+    if (likely(cfunc->func)) {
+        int flag = cfunc->flag;
+        if (flag == METH_O) {
+            return (*(cfunc->func))(self, arg);
+        } else if (PY_VERSION_HEX >= 0x030600B1 && flag == METH_FASTCALL) {
+            #if PY_VERSION_HEX >= 0x030700A0
+                return (*(__Pyx_PyCFunctionFast)(void*)(PyCFunction)cfunc->func)(self, &arg, 1);
+            #else
+                return (*(__Pyx_PyCFunctionFastWithKeywords)(void*)(PyCFunction)cfunc->func)(self, &arg, 1, NULL);
+            #endif
+        } else if (PY_VERSION_HEX >= 0x030700A0 && flag == (METH_FASTCALL | METH_KEYWORDS)) {
+            return (*(__Pyx_PyCFunctionFastWithKeywords)(void*)(PyCFunction)cfunc->func)(self, &arg, 1, NULL);
+        }
     }
-    return result;
+    return __Pyx__CallUnboundCMethod1(cfunc, self, arg);
 }
 #endif
-
-/* PyObjectCallOneArg */
+static PyObject* __Pyx__CallUnboundCMethod1(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg){
+    PyObject *args, *result = NULL;
+    if (unlikely(!cfunc->func && !cfunc->method) && unlikely(__Pyx_TryUnpackUnboundCMethod(cfunc) < 0)) return NULL;
 #if CYTHON_COMPILING_IN_CPYTHON
-static PyObject* __Pyx__PyObject_CallOneArg(PyObject *func, PyObject *arg) {
-    PyObject *result;
-    PyObject *args = PyTuple_New(1);
-    if (unlikely(!args)) return NULL;
-    Py_INCREF(arg);
-    PyTuple_SET_ITEM(args, 0, arg);
-    result = __Pyx_PyObject_Call(func, args, NULL);
-    Py_DECREF(args);
+    if (cfunc->func && (cfunc->flag & METH_VARARGS)) {
+        args = PyTuple_New(1);
+        if (unlikely(!args)) goto bad;
+        Py_INCREF(arg);
+        PyTuple_SET_ITEM(args, 0, arg);
+        if (cfunc->flag & METH_KEYWORDS)
+            result = (*(PyCFunctionWithKeywords)(void*)(PyCFunction)cfunc->func)(self, args, NULL);
+        else
+            result = (*cfunc->func)(self, args);
+    } else {
+        args = PyTuple_New(2);
+        if (unlikely(!args)) goto bad;
+        Py_INCREF(self);
+        PyTuple_SET_ITEM(args, 0, self);
+        Py_INCREF(arg);
+        PyTuple_SET_ITEM(args, 1, arg);
+        result = __Pyx_PyObject_Call(cfunc->method, args, NULL);
+    }
+#else
+    args = PyTuple_Pack(2, self, arg);
+    if (unlikely(!args)) goto bad;
+    result = __Pyx_PyObject_Call(cfunc->method, args, NULL);
+#endif
+bad:
+    Py_XDECREF(args);
     return result;
 }
-static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
-#if CYTHON_FAST_PYCALL
-    if (PyFunction_Check(func)) {
-        return __Pyx_PyFunction_FastCall(func, &arg, 1);
+
+/* CallUnboundCMethod2 */
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030600B1
+static CYTHON_INLINE PyObject *__Pyx_CallUnboundCMethod2(__Pyx_CachedCFunction *cfunc, PyObject *self, PyObject *arg1, PyObject *arg2) {
+    if (likely(cfunc->func)) {
+        PyObject *args[2] = {arg1, arg2};
+        if (cfunc->flag == METH_FASTCALL) {
+            #if PY_VERSION_HEX >= 0x030700A0
+            return (*(__Pyx_PyCFunctionFast)(void*)(PyCFunction)cfunc->func)(self, args, 2);
+            #else
+            return (*(__Pyx_PyCFunctionFastWithKeywords)(void*)(PyCFunction)cfunc->func)(self, args, 2, NULL);
+            #endif
+        }
+        #if PY_VERSION_HEX >= 0x030700A0
+        if (cfunc->flag == (METH_FASTCALL | METH_KEYWORDS))
+            return (*(__Pyx_PyCFunctionFastWithKeywords)(void*)(PyCFunction)cfunc->func)(self, args, 2, NULL);
+        #endif
     }
+    return __Pyx__CallUnboundCMethod2(cfunc, self, arg1, arg2);
+}
 #endif
-    if (likely(PyCFunction_Check(func))) {
-        if (likely(PyCFunction_GET_FLAGS(func) & METH_O)) {
-            return __Pyx_PyObject_CallMethO(func, arg);
-#if CYTHON_FAST_PYCCALL
-        } else if (PyCFunction_GET_FLAGS(func) & METH_FASTCALL) {
-            return __Pyx_PyCFunction_FastCall(func, &arg, 1);
+static PyObject* __Pyx__CallUnboundCMethod2(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg1, PyObject* arg2){
+    PyObject *args, *result = NULL;
+    if (unlikely(!cfunc->func && !cfunc->method) && unlikely(__Pyx_TryUnpackUnboundCMethod(cfunc) < 0)) return NULL;
+#if CYTHON_COMPILING_IN_CPYTHON
+    if (cfunc->func && (cfunc->flag & METH_VARARGS)) {
+        args = PyTuple_New(2);
+        if (unlikely(!args)) goto bad;
+        Py_INCREF(arg1);
+        PyTuple_SET_ITEM(args, 0, arg1);
+        Py_INCREF(arg2);
+        PyTuple_SET_ITEM(args, 1, arg2);
+        if (cfunc->flag & METH_KEYWORDS)
+            result = (*(PyCFunctionWithKeywords)(void*)(PyCFunction)cfunc->func)(self, args, NULL);
+        else
+            result = (*cfunc->func)(self, args);
+    } else {
+        args = PyTuple_New(3);
+        if (unlikely(!args)) goto bad;
+        Py_INCREF(self);
+        PyTuple_SET_ITEM(args, 0, self);
+        Py_INCREF(arg1);
+        PyTuple_SET_ITEM(args, 1, arg1);
+        Py_INCREF(arg2);
+        PyTuple_SET_ITEM(args, 2, arg2);
+        result = __Pyx_PyObject_Call(cfunc->method, args, NULL);
+    }
+#else
+    args = PyTuple_Pack(3, self, arg1, arg2);
+    if (unlikely(!args)) goto bad;
+    result = __Pyx_PyObject_Call(cfunc->method, args, NULL);
 #endif
+bad:
+    Py_XDECREF(args);
+    return result;
+}
+
+/* dict_getitem_default */
+static PyObject* __Pyx_PyDict_GetItemDefault(PyObject* d, PyObject* key, PyObject* default_value) {
+    PyObject* value;
+#if PY_MAJOR_VERSION >= 3 && !CYTHON_COMPILING_IN_PYPY
+    value = PyDict_GetItemWithError(d, key);
+    if (unlikely(!value)) {
+        if (unlikely(PyErr_Occurred()))
+            return NULL;
+        value = default_value;
+    }
+    Py_INCREF(value);
+    if ((1));
+#else
+    if (PyString_CheckExact(key) || PyUnicode_CheckExact(key) || PyInt_CheckExact(key)) {
+        value = PyDict_GetItem(d, key);
+        if (unlikely(!value)) {
+            value = default_value;
         }
+        Py_INCREF(value);
     }
-    return __Pyx__PyObject_CallOneArg(func, arg);
+#endif
+    else {
+        if (default_value == Py_None)
+            value = __Pyx_CallUnboundCMethod1(&__pyx_umethod_PyDict_Type_get, d, key);
+        else
+            value = __Pyx_CallUnboundCMethod2(&__pyx_umethod_PyDict_Type_get, d, key, default_value);
+    }
+    return value;
 }
+
+/* unicode_iter */
+static CYTHON_INLINE int __Pyx_init_unicode_iteration(
+    PyObject* ustring, Py_ssize_t *length, void** data, int *kind) {
+#if CYTHON_PEP393_ENABLED
+    if (unlikely(__Pyx_PyUnicode_READY(ustring) < 0)) return -1;
+    *kind   = PyUnicode_KIND(ustring);
+    *length = PyUnicode_GET_LENGTH(ustring);
+    *data   = PyUnicode_DATA(ustring);
 #else
-static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
-    PyObject *result;
-    PyObject *args = PyTuple_Pack(1, arg);
-    if (unlikely(!args)) return NULL;
-    result = __Pyx_PyObject_Call(func, args, NULL);
-    Py_DECREF(args);
-    return result;
-}
+    *kind   = 0;
+    *length = PyUnicode_GET_SIZE(ustring);
+    *data   = (void*)PyUnicode_AS_UNICODE(ustring);
 #endif
+    return 0;
+}
 
 /* UnicodeAsUCS4 */
 static CYTHON_INLINE Py_UCS4 __Pyx_PyUnicode_AsPy_UCS4(PyObject* x) {
@@ -11309,7 +12752,7 @@ static long __Pyx__PyObject_Ord(PyObject* c) {
 #endif
     } else {
         PyErr_Format(PyExc_TypeError,
-            "ord() expected string of length 1, but %.200s found", c->ob_type->tp_name);
+            "ord() expected string of length 1, but %.200s found", Py_TYPE(c)->tp_name);
         return (long)(Py_UCS4)-1;
     }
     PyErr_Format(PyExc_TypeError,
@@ -11317,28 +12760,6 @@ static long __Pyx__PyObject_Ord(PyObject* c) {
     return (long)(Py_UCS4)-1;
 }
 
-/* PyObjectCallNoArg */
-#if CYTHON_COMPILING_IN_CPYTHON
-static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func) {
-#if CYTHON_FAST_PYCALL
-    if (PyFunction_Check(func)) {
-        return __Pyx_PyFunction_FastCall(func, NULL, 0);
-    }
-#endif
-#ifdef __Pyx_CyFunction_USED
-    if (likely(PyCFunction_Check(func) || __Pyx_CyFunction_Check(func)))
-#else
-    if (likely(PyCFunction_Check(func)))
-#endif
-    {
-        if (likely(PyCFunction_GET_FLAGS(func) & METH_NOARGS)) {
-            return __Pyx_PyObject_CallMethO(func, NULL);
-        }
-    }
-    return __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL);
-}
-#endif
-
 /* GetTopmostException */
 #if CYTHON_USE_EXC_INFO_STACK
 static _PyErr_StackItem *
@@ -11617,132 +13038,29 @@ static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb)
         exc_info->exc_value = local_value;
         exc_info->exc_traceback = local_tb;
     }
-    #else
-    tmp_type = tstate->exc_type;
-    tmp_value = tstate->exc_value;
-    tmp_tb = tstate->exc_traceback;
-    tstate->exc_type = local_type;
-    tstate->exc_value = local_value;
-    tstate->exc_traceback = local_tb;
-    #endif
-    Py_XDECREF(tmp_type);
-    Py_XDECREF(tmp_value);
-    Py_XDECREF(tmp_tb);
-#else
-    PyErr_SetExcInfo(local_type, local_value, local_tb);
-#endif
-    return 0;
-bad:
-    *type = 0;
-    *value = 0;
-    *tb = 0;
-    Py_XDECREF(local_type);
-    Py_XDECREF(local_value);
-    Py_XDECREF(local_tb);
-    return -1;
-}
-
-/* unicode_iter */
-static CYTHON_INLINE int __Pyx_init_unicode_iteration(
-    PyObject* ustring, Py_ssize_t *length, void** data, int *kind) {
-#if CYTHON_PEP393_ENABLED
-    if (unlikely(__Pyx_PyUnicode_READY(ustring) < 0)) return -1;
-    *kind   = PyUnicode_KIND(ustring);
-    *length = PyUnicode_GET_LENGTH(ustring);
-    *data   = PyUnicode_DATA(ustring);
-#else
-    *kind   = 0;
-    *length = PyUnicode_GET_SIZE(ustring);
-    *data   = (void*)PyUnicode_AS_UNICODE(ustring);
-#endif
-    return 0;
-}
-
-/* GetItemInt */
-static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j) {
-    PyObject *r;
-    if (!j) return NULL;
-    r = PyObject_GetItem(o, j);
-    Py_DECREF(j);
-    return r;
-}
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
-                                                              CYTHON_NCP_UNUSED int wraparound,
-                                                              CYTHON_NCP_UNUSED int boundscheck) {
-#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-    Py_ssize_t wrapped_i = i;
-    if (wraparound & unlikely(i < 0)) {
-        wrapped_i += PyList_GET_SIZE(o);
-    }
-    if ((!boundscheck) || likely(__Pyx_is_valid_index(wrapped_i, PyList_GET_SIZE(o)))) {
-        PyObject *r = PyList_GET_ITEM(o, wrapped_i);
-        Py_INCREF(r);
-        return r;
-    }
-    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
-#else
-    return PySequence_GetItem(o, i);
-#endif
-}
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
-                                                              CYTHON_NCP_UNUSED int wraparound,
-                                                              CYTHON_NCP_UNUSED int boundscheck) {
-#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-    Py_ssize_t wrapped_i = i;
-    if (wraparound & unlikely(i < 0)) {
-        wrapped_i += PyTuple_GET_SIZE(o);
-    }
-    if ((!boundscheck) || likely(__Pyx_is_valid_index(wrapped_i, PyTuple_GET_SIZE(o)))) {
-        PyObject *r = PyTuple_GET_ITEM(o, wrapped_i);
-        Py_INCREF(r);
-        return r;
-    }
-    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
-#else
-    return PySequence_GetItem(o, i);
-#endif
-}
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i, int is_list,
-                                                     CYTHON_NCP_UNUSED int wraparound,
-                                                     CYTHON_NCP_UNUSED int boundscheck) {
-#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS && CYTHON_USE_TYPE_SLOTS
-    if (is_list || PyList_CheckExact(o)) {
-        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyList_GET_SIZE(o);
-        if ((!boundscheck) || (likely(__Pyx_is_valid_index(n, PyList_GET_SIZE(o))))) {
-            PyObject *r = PyList_GET_ITEM(o, n);
-            Py_INCREF(r);
-            return r;
-        }
-    }
-    else if (PyTuple_CheckExact(o)) {
-        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyTuple_GET_SIZE(o);
-        if ((!boundscheck) || likely(__Pyx_is_valid_index(n, PyTuple_GET_SIZE(o)))) {
-            PyObject *r = PyTuple_GET_ITEM(o, n);
-            Py_INCREF(r);
-            return r;
-        }
-    } else {
-        PySequenceMethods *m = Py_TYPE(o)->tp_as_sequence;
-        if (likely(m && m->sq_item)) {
-            if (wraparound && unlikely(i < 0) && likely(m->sq_length)) {
-                Py_ssize_t l = m->sq_length(o);
-                if (likely(l >= 0)) {
-                    i += l;
-                } else {
-                    if (!PyErr_ExceptionMatches(PyExc_OverflowError))
-                        return NULL;
-                    PyErr_Clear();
-                }
-            }
-            return m->sq_item(o, i);
-        }
-    }
+    #else
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = local_type;
+    tstate->exc_value = local_value;
+    tstate->exc_traceback = local_tb;
+    #endif
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
 #else
-    if (is_list || PySequence_Check(o)) {
-        return PySequence_GetItem(o, i);
-    }
+    PyErr_SetExcInfo(local_type, local_value, local_tb);
 #endif
-    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+    return 0;
+bad:
+    *type = 0;
+    *value = 0;
+    *tb = 0;
+    Py_XDECREF(local_type);
+    Py_XDECREF(local_value);
+    Py_XDECREF(local_tb);
+    return -1;
 }
 
 /* PyErrExceptionMatches */
@@ -11820,6 +13138,28 @@ static PyObject* __Pyx_PyObject_GenericGetAttr(PyObject* obj, PyObject* attr_nam
 }
 #endif
 
+/* PyObjectGetAttrStrNoError */
+static void __Pyx_PyObject_GetAttrStr_ClearAttributeError(void) {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    if (likely(__Pyx_PyErr_ExceptionMatches(PyExc_AttributeError)))
+        __Pyx_PyErr_Clear();
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name) {
+    PyObject *result;
+#if CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_TYPE_SLOTS && PY_VERSION_HEX >= 0x030700B1
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro == PyObject_GenericGetAttr)) {
+        return _PyObject_GenericGetAttrWithDict(obj, attr_name, NULL, 1);
+    }
+#endif
+    result = __Pyx_PyObject_GetAttrStr(obj, attr_name);
+    if (unlikely(!result)) {
+        __Pyx_PyObject_GetAttrStr_ClearAttributeError();
+    }
+    return result;
+}
+
 /* SetupReduce */
 static int __Pyx_setup_reduce_is_named(PyObject* meth, PyObject* name) {
   int ret;
@@ -11840,53 +13180,81 @@ static int __Pyx_setup_reduce_is_named(PyObject* meth, PyObject* name) {
 static int __Pyx_setup_reduce(PyObject* type_obj) {
     int ret = 0;
     PyObject *object_reduce = NULL;
+    PyObject *object_getstate = NULL;
     PyObject *object_reduce_ex = NULL;
     PyObject *reduce = NULL;
     PyObject *reduce_ex = NULL;
     PyObject *reduce_cython = NULL;
     PyObject *setstate = NULL;
     PyObject *setstate_cython = NULL;
+    PyObject *getstate = NULL;
+#if CYTHON_USE_PYTYPE_LOOKUP
+    getstate = _PyType_Lookup((PyTypeObject*)type_obj, __pyx_n_s_getstate);
+#else
+    getstate = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_getstate);
+    if (!getstate && PyErr_Occurred()) {
+        goto __PYX_BAD;
+    }
+#endif
+    if (getstate) {
 #if CYTHON_USE_PYTYPE_LOOKUP
-    if (_PyType_Lookup((PyTypeObject*)type_obj, __pyx_n_s_getstate)) goto GOOD;
+        object_getstate = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_getstate);
 #else
-    if (PyObject_HasAttr(type_obj, __pyx_n_s_getstate)) goto GOOD;
+        object_getstate = __Pyx_PyObject_GetAttrStrNoError((PyObject*)&PyBaseObject_Type, __pyx_n_s_getstate);
+        if (!object_getstate && PyErr_Occurred()) {
+            goto __PYX_BAD;
+        }
 #endif
+        if (object_getstate != getstate) {
+            goto __PYX_GOOD;
+        }
+    }
 #if CYTHON_USE_PYTYPE_LOOKUP
-    object_reduce_ex = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_reduce_ex); if (!object_reduce_ex) goto BAD;
+    object_reduce_ex = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_reduce_ex); if (!object_reduce_ex) goto __PYX_BAD;
 #else
-    object_reduce_ex = __Pyx_PyObject_GetAttrStr((PyObject*)&PyBaseObject_Type, __pyx_n_s_reduce_ex); if (!object_reduce_ex) goto BAD;
+    object_reduce_ex = __Pyx_PyObject_GetAttrStr((PyObject*)&PyBaseObject_Type, __pyx_n_s_reduce_ex); if (!object_reduce_ex) goto __PYX_BAD;
 #endif
-    reduce_ex = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce_ex); if (unlikely(!reduce_ex)) goto BAD;
+    reduce_ex = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce_ex); if (unlikely(!reduce_ex)) goto __PYX_BAD;
     if (reduce_ex == object_reduce_ex) {
 #if CYTHON_USE_PYTYPE_LOOKUP
-        object_reduce = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_reduce); if (!object_reduce) goto BAD;
+        object_reduce = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_reduce); if (!object_reduce) goto __PYX_BAD;
 #else
-        object_reduce = __Pyx_PyObject_GetAttrStr((PyObject*)&PyBaseObject_Type, __pyx_n_s_reduce); if (!object_reduce) goto BAD;
+        object_reduce = __Pyx_PyObject_GetAttrStr((PyObject*)&PyBaseObject_Type, __pyx_n_s_reduce); if (!object_reduce) goto __PYX_BAD;
 #endif
-        reduce = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce); if (unlikely(!reduce)) goto BAD;
+        reduce = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce); if (unlikely(!reduce)) goto __PYX_BAD;
         if (reduce == object_reduce || __Pyx_setup_reduce_is_named(reduce, __pyx_n_s_reduce_cython)) {
-            reduce_cython = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce_cython); if (unlikely(!reduce_cython)) goto BAD;
-            ret = PyDict_SetItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_reduce, reduce_cython); if (unlikely(ret < 0)) goto BAD;
-            ret = PyDict_DelItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_reduce_cython); if (unlikely(ret < 0)) goto BAD;
+            reduce_cython = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_reduce_cython);
+            if (likely(reduce_cython)) {
+                ret = PyDict_SetItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_reduce, reduce_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                ret = PyDict_DelItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_reduce_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+            } else if (reduce == object_reduce || PyErr_Occurred()) {
+                goto __PYX_BAD;
+            }
             setstate = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_setstate);
             if (!setstate) PyErr_Clear();
             if (!setstate || __Pyx_setup_reduce_is_named(setstate, __pyx_n_s_setstate_cython)) {
-                setstate_cython = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_setstate_cython); if (unlikely(!setstate_cython)) goto BAD;
-                ret = PyDict_SetItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_setstate, setstate_cython); if (unlikely(ret < 0)) goto BAD;
-                ret = PyDict_DelItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_setstate_cython); if (unlikely(ret < 0)) goto BAD;
+                setstate_cython = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_setstate_cython);
+                if (likely(setstate_cython)) {
+                    ret = PyDict_SetItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_setstate, setstate_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                    ret = PyDict_DelItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_setstate_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                } else if (!setstate || PyErr_Occurred()) {
+                    goto __PYX_BAD;
+                }
             }
             PyType_Modified((PyTypeObject*)type_obj);
         }
     }
-    goto GOOD;
-BAD:
+    goto __PYX_GOOD;
+__PYX_BAD:
     if (!PyErr_Occurred())
         PyErr_Format(PyExc_RuntimeError, "Unable to initialize pickling for %s", ((PyTypeObject*)type_obj)->tp_name);
     ret = -1;
-GOOD:
+__PYX_GOOD:
 #if !CYTHON_USE_PYTYPE_LOOKUP
     Py_XDECREF(object_reduce);
     Py_XDECREF(object_reduce_ex);
+    Py_XDECREF(object_getstate);
+    Py_XDECREF(getstate);
 #endif
     Py_XDECREF(reduce);
     Py_XDECREF(reduce_ex);
@@ -11896,6 +13264,24 @@ GOOD:
     return ret;
 }
 
+/* SetVTable */
+static int __Pyx_SetVtable(PyObject *dict, void *vtable) {
+#if PY_VERSION_HEX >= 0x02070000
+    PyObject *ob = PyCapsule_New(vtable, 0, 0);
+#else
+    PyObject *ob = PyCObject_FromVoidPtr(vtable, 0);
+#endif
+    if (!ob)
+        goto bad;
+    if (PyDict_SetItem(dict, __pyx_n_s_pyx_vtable, ob) < 0)
+        goto bad;
+    Py_DECREF(ob);
+    return 0;
+bad:
+    Py_XDECREF(ob);
+    return -1;
+}
+
 /* Import */
 static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level) {
     PyObject *empty_list = 0;
@@ -11926,7 +13312,7 @@ static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level) {
     {
         #if PY_MAJOR_VERSION >= 3
         if (level == -1) {
-            if (strchr(__Pyx_MODULE_NAME, '.')) {
+            if ((1) && (strchr(__Pyx_MODULE_NAME, '.'))) {
                 module = PyImport_ImportModuleLevelObject(
                     name, global_dict, empty_dict, list, 1);
                 if (!module) {
@@ -12083,7 +13469,7 @@ static PyObject *__Pyx_Py3ClassCreate(PyObject *metaclass, PyObject *name, PyObj
 
 /* CLineInTraceback */
 #ifndef CYTHON_CLINE_IN_TRACEBACK
-static int __Pyx_CLineForTraceback(PyThreadState *tstate, int c_line) {
+static int __Pyx_CLineForTraceback(CYTHON_UNUSED PyThreadState *tstate, int c_line) {
     PyObject *use_cline;
     PyObject *ptype, *pvalue, *ptraceback;
 #if CYTHON_COMPILING_IN_CPYTHON
@@ -12113,7 +13499,7 @@ static int __Pyx_CLineForTraceback(PyThreadState *tstate, int c_line) {
     }
     if (!use_cline) {
         c_line = 0;
-        PyObject_SetAttr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback, Py_False);
+        (void) PyObject_SetAttr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback, Py_False);
     }
     else if (use_cline == Py_False || (use_cline != Py_True && PyObject_Not(use_cline) != 0)) {
         c_line = 0;
@@ -12187,7 +13573,7 @@ static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object) {
     if (__pyx_code_cache.count == __pyx_code_cache.max_count) {
         int new_max = __pyx_code_cache.max_count + 64;
         entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Realloc(
-            __pyx_code_cache.entries, (size_t)new_max*sizeof(__Pyx_CodeObjectCacheEntry));
+            __pyx_code_cache.entries, ((size_t)new_max) * sizeof(__Pyx_CodeObjectCacheEntry));
         if (unlikely(!entries)) {
             return;
         }
@@ -12207,33 +13593,40 @@ static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object) {
 #include "compile.h"
 #include "frameobject.h"
 #include "traceback.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
 static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
             const char *funcname, int c_line,
             int py_line, const char *filename) {
-    PyCodeObject *py_code = 0;
-    PyObject *py_srcfile = 0;
-    PyObject *py_funcname = 0;
+    PyCodeObject *py_code = NULL;
+    PyObject *py_funcname = NULL;
     #if PY_MAJOR_VERSION < 3
+    PyObject *py_srcfile = NULL;
     py_srcfile = PyString_FromString(filename);
-    #else
-    py_srcfile = PyUnicode_FromString(filename);
-    #endif
     if (!py_srcfile) goto bad;
+    #endif
     if (c_line) {
         #if PY_MAJOR_VERSION < 3
         py_funcname = PyString_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
         #else
         py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        funcname = PyUnicode_AsUTF8(py_funcname);
+        if (!funcname) goto bad;
         #endif
     }
     else {
         #if PY_MAJOR_VERSION < 3
         py_funcname = PyString_FromString(funcname);
-        #else
-        py_funcname = PyUnicode_FromString(funcname);
+        if (!py_funcname) goto bad;
         #endif
     }
-    if (!py_funcname) goto bad;
+    #if PY_MAJOR_VERSION < 3
     py_code = __Pyx_PyCode_New(
         0,
         0,
@@ -12252,11 +13645,16 @@ static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
         __pyx_empty_bytes  /*PyObject *lnotab*/
     );
     Py_DECREF(py_srcfile);
-    Py_DECREF(py_funcname);
+    #else
+    py_code = PyCode_NewEmpty(filename, funcname, py_line);
+    #endif
+    Py_XDECREF(py_funcname);  // XDECREF since it's only set on Py3 if cline
     return py_code;
 bad:
-    Py_XDECREF(py_srcfile);
     Py_XDECREF(py_funcname);
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(py_srcfile);
+    #endif
     return NULL;
 }
 static void __Pyx_AddTraceback(const char *funcname, int c_line,
@@ -12264,14 +13662,24 @@ static void __Pyx_AddTraceback(const char *funcname, int c_line,
     PyCodeObject *py_code = 0;
     PyFrameObject *py_frame = 0;
     PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject *ptype, *pvalue, *ptraceback;
     if (c_line) {
         c_line = __Pyx_CLineForTraceback(tstate, c_line);
     }
     py_code = __pyx_find_code_object(c_line ? -c_line : py_line);
     if (!py_code) {
+        __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
         py_code = __Pyx_CreateCodeObjectForTraceback(
             funcname, c_line, py_line, filename);
-        if (!py_code) goto bad;
+        if (!py_code) {
+            /* If the code object creation fails, then we should clear the
+               fetched exception references and propagate the new exception */
+            Py_XDECREF(ptype);
+            Py_XDECREF(pvalue);
+            Py_XDECREF(ptraceback);
+            goto bad;
+        }
+        __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
         __pyx_insert_code_object(c_line ? -c_line : py_line, py_code);
     }
     py_frame = PyFrame_New(
@@ -12288,37 +13696,6 @@ bad:
     Py_XDECREF(py_frame);
 }
 
-/* CIntToPy */
-static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
-    const int neg_one = (int) ((int) 0 - (int) 1), const_zero = (int) 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (is_unsigned) {
-        if (sizeof(int) < sizeof(long)) {
-            return PyInt_FromLong((long) value);
-        } else if (sizeof(int) <= sizeof(unsigned long)) {
-            return PyLong_FromUnsignedLong((unsigned long) value);
-#ifdef HAVE_LONG_LONG
-        } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
-            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
-#endif
-        }
-    } else {
-        if (sizeof(int) <= sizeof(long)) {
-            return PyInt_FromLong((long) value);
-#ifdef HAVE_LONG_LONG
-        } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
-            return PyLong_FromLongLong((PY_LONG_LONG) value);
-#endif
-        }
-    }
-    {
-        int one = 1; int little = (int)*(unsigned char *)&one;
-        unsigned char *bytes = (unsigned char *)&value;
-        return _PyLong_FromByteArray(bytes, sizeof(int),
-                                     little, !is_unsigned);
-    }
-}
-
 /* CIntFromPyVerify */
 #define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
     __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 0)
@@ -12365,7 +13742,14 @@ static PyObject* __pyx_convert__to_py_struct__SDL_Rect(struct SDL_Rect s) {
 }
 /* CIntFromPy */
 static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
-    const int neg_one = (int) ((int) 0 - (int) 1), const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
     const int is_unsigned = neg_one > const_zero;
 #if PY_MAJOR_VERSION < 3
     if (likely(PyInt_Check(x))) {
@@ -12416,7 +13800,7 @@ static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
                     break;
             }
 #endif
-#if CYTHON_COMPILING_IN_CPYTHON
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
             if (unlikely(Py_SIZE(x) < 0)) {
                 goto raise_neg_overflow;
             }
@@ -12552,198 +13936,54 @@ raise_neg_overflow:
     return (int) -1;
 }
 
-/* CIntFromPy */
-static CYTHON_INLINE size_t __Pyx_PyInt_As_size_t(PyObject *x) {
-    const size_t neg_one = (size_t) ((size_t) 0 - (size_t) 1), const_zero = (size_t) 0;
-    const int is_unsigned = neg_one > const_zero;
-#if PY_MAJOR_VERSION < 3
-    if (likely(PyInt_Check(x))) {
-        if (sizeof(size_t) < sizeof(long)) {
-            __PYX_VERIFY_RETURN_INT(size_t, long, PyInt_AS_LONG(x))
-        } else {
-            long val = PyInt_AS_LONG(x);
-            if (is_unsigned && unlikely(val < 0)) {
-                goto raise_neg_overflow;
-            }
-            return (size_t) val;
-        }
-    } else
-#endif
-    if (likely(PyLong_Check(x))) {
-        if (is_unsigned) {
-#if CYTHON_USE_PYLONG_INTERNALS
-            const digit* digits = ((PyLongObject*)x)->ob_digit;
-            switch (Py_SIZE(x)) {
-                case  0: return (size_t) 0;
-                case  1: __PYX_VERIFY_RETURN_INT(size_t, digit, digits[0])
-                case 2:
-                    if (8 * sizeof(size_t) > 1 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(size_t) >= 2 * PyLong_SHIFT) {
-                            return (size_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
-                        }
-                    }
-                    break;
-                case 3:
-                    if (8 * sizeof(size_t) > 2 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(size_t) >= 3 * PyLong_SHIFT) {
-                            return (size_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
-                        }
-                    }
-                    break;
-                case 4:
-                    if (8 * sizeof(size_t) > 3 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(size_t) >= 4 * PyLong_SHIFT) {
-                            return (size_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
-                        }
-                    }
-                    break;
-            }
-#endif
-#if CYTHON_COMPILING_IN_CPYTHON
-            if (unlikely(Py_SIZE(x) < 0)) {
-                goto raise_neg_overflow;
-            }
-#else
-            {
-                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
-                if (unlikely(result < 0))
-                    return (size_t) -1;
-                if (unlikely(result == 1))
-                    goto raise_neg_overflow;
-            }
-#endif
-            if (sizeof(size_t) <= sizeof(unsigned long)) {
-                __PYX_VERIFY_RETURN_INT_EXC(size_t, unsigned long, PyLong_AsUnsignedLong(x))
-#ifdef HAVE_LONG_LONG
-            } else if (sizeof(size_t) <= sizeof(unsigned PY_LONG_LONG)) {
-                __PYX_VERIFY_RETURN_INT_EXC(size_t, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
 #endif
-            }
-        } else {
-#if CYTHON_USE_PYLONG_INTERNALS
-            const digit* digits = ((PyLongObject*)x)->ob_digit;
-            switch (Py_SIZE(x)) {
-                case  0: return (size_t) 0;
-                case -1: __PYX_VERIFY_RETURN_INT(size_t, sdigit, (sdigit) (-(sdigit)digits[0]))
-                case  1: __PYX_VERIFY_RETURN_INT(size_t,  digit, +digits[0])
-                case -2:
-                    if (8 * sizeof(size_t) - 1 > 1 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(size_t, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(size_t) - 1 > 2 * PyLong_SHIFT) {
-                            return (size_t) (((size_t)-1)*(((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
-                        }
-                    }
-                    break;
-                case 2:
-                    if (8 * sizeof(size_t) > 1 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(size_t) - 1 > 2 * PyLong_SHIFT) {
-                            return (size_t) ((((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
-                        }
-                    }
-                    break;
-                case -3:
-                    if (8 * sizeof(size_t) - 1 > 2 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(size_t, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(size_t) - 1 > 3 * PyLong_SHIFT) {
-                            return (size_t) (((size_t)-1)*(((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
-                        }
-                    }
-                    break;
-                case 3:
-                    if (8 * sizeof(size_t) > 2 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(size_t) - 1 > 3 * PyLong_SHIFT) {
-                            return (size_t) ((((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
-                        }
-                    }
-                    break;
-                case -4:
-                    if (8 * sizeof(size_t) - 1 > 3 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(size_t, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(size_t) - 1 > 4 * PyLong_SHIFT) {
-                            return (size_t) (((size_t)-1)*(((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
-                        }
-                    }
-                    break;
-                case 4:
-                    if (8 * sizeof(size_t) > 3 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(size_t) - 1 > 4 * PyLong_SHIFT) {
-                            return (size_t) ((((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
-                        }
-                    }
-                    break;
-            }
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
 #endif
-            if (sizeof(size_t) <= sizeof(long)) {
-                __PYX_VERIFY_RETURN_INT_EXC(size_t, long, PyLong_AsLong(x))
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(int) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(int) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
 #ifdef HAVE_LONG_LONG
-            } else if (sizeof(size_t) <= sizeof(PY_LONG_LONG)) {
-                __PYX_VERIFY_RETURN_INT_EXC(size_t, PY_LONG_LONG, PyLong_AsLongLong(x))
+        } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
 #endif
-            }
         }
-        {
-#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
-            PyErr_SetString(PyExc_RuntimeError,
-                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
-#else
-            size_t val;
-            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
- #if PY_MAJOR_VERSION < 3
-            if (likely(v) && !PyLong_Check(v)) {
-                PyObject *tmp = v;
-                v = PyNumber_Long(tmp);
-                Py_DECREF(tmp);
-            }
- #endif
-            if (likely(v)) {
-                int one = 1; int is_little = (int)*(unsigned char *)&one;
-                unsigned char *bytes = (unsigned char *)&val;
-                int ret = _PyLong_AsByteArray((PyLongObject *)v,
-                                              bytes, sizeof(val),
-                                              is_little, !is_unsigned);
-                Py_DECREF(v);
-                if (likely(!ret))
-                    return val;
-            }
+    } else {
+        if (sizeof(int) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
 #endif
-            return (size_t) -1;
         }
-    } else {
-        size_t val;
-        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
-        if (!tmp) return (size_t) -1;
-        val = __Pyx_PyInt_As_size_t(tmp);
-        Py_DECREF(tmp);
-        return val;
     }
-raise_overflow:
-    PyErr_SetString(PyExc_OverflowError,
-        "value too large to convert to size_t");
-    return (size_t) -1;
-raise_neg_overflow:
-    PyErr_SetString(PyExc_OverflowError,
-        "can't convert negative value to size_t");
-    return (size_t) -1;
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(int),
+                                     little, !is_unsigned);
+    }
 }
 
 /* CIntToPy */
 static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
-    const long neg_one = (long) ((long) 0 - (long) 1), const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
     const int is_unsigned = neg_one > const_zero;
     if (is_unsigned) {
         if (sizeof(long) < sizeof(long)) {
@@ -12774,7 +14014,14 @@ static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
 
 /* CIntFromPy */
 static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
-    const long neg_one = (long) ((long) 0 - (long) 1), const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
     const int is_unsigned = neg_one > const_zero;
 #if PY_MAJOR_VERSION < 3
     if (likely(PyInt_Check(x))) {
@@ -12825,7 +14072,7 @@ static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
                     break;
             }
 #endif
-#if CYTHON_COMPILING_IN_CPYTHON
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
             if (unlikely(Py_SIZE(x) < 0)) {
                 goto raise_neg_overflow;
             }
@@ -12963,11 +14210,33 @@ raise_neg_overflow:
 
 /* CheckBinaryVersion */
 static int __Pyx_check_binary_version(void) {
-    char ctversion[4], rtversion[4];
-    PyOS_snprintf(ctversion, 4, "%d.%d", PY_MAJOR_VERSION, PY_MINOR_VERSION);
-    PyOS_snprintf(rtversion, 4, "%s", Py_GetVersion());
-    if (ctversion[0] != rtversion[0] || ctversion[2] != rtversion[2]) {
+    char ctversion[5];
+    int same=1, i, found_dot;
+    const char* rt_from_call = Py_GetVersion();
+    PyOS_snprintf(ctversion, 5, "%d.%d", PY_MAJOR_VERSION, PY_MINOR_VERSION);
+    found_dot = 0;
+    for (i = 0; i < 4; i++) {
+        if (!ctversion[i]) {
+            same = (rt_from_call[i] < '0' || rt_from_call[i] > '9');
+            break;
+        }
+        if (rt_from_call[i] != ctversion[i]) {
+            same = 0;
+            break;
+        }
+    }
+    if (!same) {
+        char rtversion[5] = {'\0'};
         char message[200];
+        for (i=0; i<4; ++i) {
+            if (rt_from_call[i] == '.') {
+                if (found_dot) break;
+                found_dot = 1;
+            } else if (rt_from_call[i] < '0' || rt_from_call[i] > '9') {
+                break;
+            }
+            rtversion[i] = rt_from_call[i];
+        }
         PyOS_snprintf(message, sizeof(message),
                       "compiletime version %s of module '%.100s' "
                       "does not match runtime version %s",
@@ -13225,6 +14494,23 @@ static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
   Py_DECREF(x);
   return ival;
 }
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject* o) {
+  if (sizeof(Py_hash_t) == sizeof(Py_ssize_t)) {
+    return (Py_hash_t) __Pyx_PyIndex_AsSsize_t(o);
+#if PY_MAJOR_VERSION < 3
+  } else if (likely(PyInt_CheckExact(o))) {
+    return PyInt_AS_LONG(o);
+#endif
+  } else {
+    Py_ssize_t ival;
+    PyObject *x;
+    x = PyNumber_Index(o);
+    if (!x) return -1;
+    ival = PyInt_AsLong(x);
+    Py_DECREF(x);
+    return ival;
+  }
+}
 static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b) {
   return b ? __Pyx_NewRef(Py_True) : __Pyx_NewRef(Py_False);
 }
@@ -7,6 +7,7 @@ __all__ = ('BitmapFont',
            )
 
 cimport cpython.pycapsule as pycapsule
+from cpython.buffer cimport PyBuffer_FillInfo
 
 import re
 from os import path
@@ -611,6 +612,18 @@ class BitmapFontException(Exception):
     pass
 
 
+cdef enum:
+    # Characters with ids below this value are stored in a flat glyph index array
+    GLYPH_INDEX_SIZE = 256
+
+cdef struct GlyphInfo:
+    SDL_Rect rect
+    int xoffset
+    int yoffset
+    int xadvance
+    bint defined
+
+
 cdef class BitmapFontCharacter:
     cdef public int id
     cdef public SDL_Rect rect
@@ -645,6 +658,8 @@ cdef class BitmapFont:
     cdef dict characters
     cdef dict kernings
 
+    cdef GlyphInfo glyphs[GLYPH_INDEX_SIZE]
+
     cdef SDL_Surface *image
 
     def __cinit__(self, *args, **kw):
@@ -662,6 +677,7 @@ cdef class BitmapFont:
 
         self.characters = dict()
         self.kernings = dict()
+        memset(self.glyphs, 0, sizeof(self.glyphs))
 
         self.image = NULL
 
@@ -685,6 +701,8 @@ cdef class BitmapFont:
         else:
             raise BitmapFontException("Illegal value in bitmap font descriptor")
 
+        self._build_glyph_index()
+
     def __dealloc__(self):
         if self.image != NULL:
             SDL_FreeSurface(self.image)
@@ -700,6 +718,74 @@ cdef class BitmapFont:
     def get_kernings(self):
         return self.kernings
 
+    cdef void _build_glyph_index(self) except *:
+        """Copy the character definitions into the flat glyph index array
+        so rendering does not need any dict lookups for common characters."""
+        cdef BitmapFontCharacter character
+        memset(self.glyphs, 0, sizeof(self.glyphs))
+
+        for char_id, character in self.characters.items():
+            if 0 <= char_id < GLYPH_INDEX_SIZE:
+                self.glyphs[char_id].rect = character.rect
+                self.glyphs[char_id].xoffset = character.xoffset
+                self.glyphs[char_id].yoffset = character.yoffset
+                self.glyphs[char_id].xadvance = character.xadvance
+                self.glyphs[char_id].defined = True
+
+    cdef bint _get_glyph(self, int char_id, GlyphInfo *glyph) except *:
+        """Fill in the glyph info for a character. Returns False if the font
+        does not contain the character."""
+        cdef BitmapFontCharacter character
+
+        if 0 <= char_id < GLYPH_INDEX_SIZE:
+            glyph[0] = self.glyphs[char_id]
+            return glyph.defined
+
+        character = self.characters.get(char_id)
+        if character is None:
+            return False
+
+        glyph.rect = character.rect
+        glyph.xoffset = character.xoffset
+        glyph.yoffset = character.yoffset
+        glyph.xadvance = character.xadvance
+        glyph.defined = True
+        return True
+
+    cdef int _get_kerning(self, int previous_char, int current_char) except? -1:
+        cdef dict first_kernings
+        if not self.kernings:
+            return 0
+
+        first_kernings = self.kernings.get(previous_char)
+        if first_kernings is None:
+            return 0
+
+        return first_kernings.get(current_char, 0)
+
+    cdef void render_text(self, SDL_Surface *surface, str text, int x, int y, bint use_kerning) except *:
+        """Blit the text from the font atlas into the surface."""
+        cdef SDL_Rect source_rect
+        cdef SDL_Rect dest_rect
+        cdef GlyphInfo glyph
+        cdef int previous_char = -1
+        cdef int current_char
+        cdef Py_UCS4 text_char
+
+        for text_char in text:
+            current_char = text_char
+            if self._get_glyph(current_char, &glyph):
+                if use_kerning:
+                    x += self._get_kerning(previous_char, current_char)
+
+                source_rect = glyph.rect
+                dest_rect.x = x + glyph.xoffset
+                dest_rect.y = y + glyph.yoffset
+                SDL_BlitSurface(self.image, &source_rect, surface, &dest_rect)
+                x += glyph.xadvance
+
+            previous_char = current_char
+
     def _load_descriptor_list(self, list descriptor_list):
         """Load the descriptor from the supplied list."""
         cdef int x = 0
@@ -895,15 +981,16 @@ cdef class BitmapFont:
         cdef int previous_char = -1
         cdef int current_char
         cdef bint use_kerning = font_kerning
+        cdef GlyphInfo glyph
+        cdef Py_UCS4 text_char
 
         for text_char in text:
-            current_char = ord(text_char)
-            if current_char in self.characters:
-                char_info = self.characters[current_char]
-                width += char_info.xadvance
+            current_char = text_char
+            if self._get_glyph(current_char, &glyph):
+                width += glyph.xadvance
 
-                if use_kerning and previous_char in self.kernings and current_char in self.kernings[previous_char]:
-                    width += self.kernings[previous_char][current_char]
+                if use_kerning:
+                    width += self._get_kerning(previous_char, current_char)
 
             previous_char = current_char
 
@@ -911,6 +998,12 @@ cdef class BitmapFont:
 
 
 cdef class _SurfaceContainer:
+    """Pixel buffer bitmap font text is rendered into.
+
+    The container exposes its pixels via the buffer protocol, so the texture
+    upload reads them directly without copying them into a bytes object. It
+    can be reused for multiple renders of the same size (see clear()).
+    """
     cdef SDL_Surface* surface
     cdef int w, h
 
@@ -925,65 +1018,42 @@ cdef class _SurfaceContainer:
         self.surface = SDL_CreateRGBSurface(0,
             w, h, 32,
             0x000000ff, 0x0000ff00, 0x00ff0000, 0xff000000)
-        memset(self.surface.pixels, 0, w * h * 4)
+        self.clear()
 
     def __dealloc__(self):
         if self.surface != NULL:
             SDL_FreeSurface(self.surface)
             self.surface = NULL
 
-    def render(self, container, text, x, y):
+    def __getbuffer__(self, Py_buffer *buffer, int flags):
+        PyBuffer_FillInfo(buffer, self, self.surface.pixels,
+                          self.surface.w * self.surface.h * 4, 1, flags)
+
+    def __releasebuffer__(self, Py_buffer *buffer):
+        pass
+
+    @property
+    def size(self):
+        return self.w, self.h
+
+    def clear(self):
+        """Clear all pixels (fully transparent)."""
+        memset(self.surface.pixels, 0, self.w * self.h * 4)
+
+    def render(self, container, str text, int x, int y):
         """Render the text at the specified location."""
-        cdef SDL_Rect cursor_rect
-        cdef SDL_Rect source_rect
-        cdef SDL_Rect dest_rect
-        cdef SDL_Surface *source_image
-        cdef dict characters = dict()
-        cdef dict kernings = dict()
-        cdef bint use_kerning = True
-        cdef int previous_char = -1
-        cdef int current_char
+        cdef BitmapFont font
 
         asset = container.get_font_asset()
         if asset is None:
             return
 
         font = asset.bitmap_font
-        if font is None:
+        if font is None or font.image == NULL:
             return
 
-        source_image = <SDL_Surface*>pycapsule.PyCapsule_GetPointer(font.get_image(), NULL)
-        if source_image == NULL:
-            return
-
-        cursor_rect.x = x
-        cursor_rect.y = y
-
-        characters = font.get_characters()
-        kernings = font.get_kernings()
-        use_kerning = container.options['font_kerning']
-
-        # Copy each character in the text string from the bitmap font atlas to
-        # the output texture/surface
-        for text_char in text:
-            current_char = ord(text_char)
-            if current_char in characters:
-                char_info = characters[current_char]
-
-                if use_kerning and previous_char in kernings and current_char in kernings[previous_char]:
-                    cursor_rect.x += kernings[previous_char][current_char]
-
-                source_rect = char_info.rect
-                dest_rect.x = cursor_rect.x + char_info.xoffset
-                dest_rect.y = cursor_rect.y + char_info.yoffset
-                SDL_BlitSurface(source_image, &source_rect, self.surface, &dest_rect)
-                cursor_rect.x += char_info.xadvance
-
-            previous_char = current_char
+        font.render_text(self.surface, text, x, y, container.options['font_kerning'])
 
     def get_data(self):
         """Return the bitmap font surface as ImageData (pixels)."""
-        cdef int datalen = self.surface.w * self.surface.h * 4
-        cdef bytes pixels = (<char *>self.surface.pixels)[:datalen]
-        data = ImageData(self.w, self.h, 'rgba', pixels)
-        return data
+        return ImageData(self.w, self.h, 'rgba', memoryview(self))
@@ -41,7 +41,11 @@ class LabelBitmapFont(LabelBase):
         return bitmap_font.get_ascent()
 
     def _render_begin(self):
-        self._surface = _SurfaceContainer(self.size[0], self.size[1])
+        # reuse the pixel buffer of the last render if the size did not change
+        if self._surface is not None and self._surface.size == tuple(self.size):
+            self._surface.clear()
+        else:
+            self._surface = _SurfaceContainer(self.size[0], self.size[1])
 
     def _render_text(self, text, x, y):
         self._surface.render(self, text, x, y)
@@ -1,5 +1,5 @@
 """Contains the Display base class, which is a logical display in the mpf-mc."""
-from typing import List, Union, Optional
+from typing import Callable, List, Union, Optional
 from math import floor
 
 from kivy.uix.floatlayout import FloatLayout
@@ -12,10 +12,13 @@ from kivy.uix.screenmanager import (ScreenManager, NoTransition,
                                     ScreenManagerException)
 from kivy.uix.widget import Widget as KivyWidget, WidgetException as KivyWidgetException
 from kivy.uix.scatter import Scatter
+from kivy.uix.effectwidget import EffectFbo, shader_header, shader_footer_effect
 from kivy.graphics import (
-    Translate, Fbo, ClearColor, ClearBuffers, Scale)
+    Translate, Fbo, ClearColor, ClearBuffers, Scale, RenderContext, Callback,
+    Color, Rectangle, PushMatrix, PopMatrix)
 from kivy.properties import ObjectProperty
 
+from mpfmc.uix.effects import compile_effects, fused_effect_glsl
 from mpfmc.uix.widget import WidgetContainer, Widget
 from mpfmc.uix.slide import Slide
 
@@ -23,6 +26,7 @@ from mpfmc.uix.slide import Slide
 MYPY = False
 if MYPY:   # pragma: no cover
     from mpfmc.core.mc import MpfMc
+    from mpfmc.uix.effects import PixelEffect
 
 
 transition_map = dict(none=NoTransition,
@@ -67,6 +71,11 @@ class Display(ScreenManager):
 
         self.transition = NoTransition()
 
+        self.change_count = 0
+        self._change_listeners = []     # type: List[Callable[[int], None]]
+        self._change_tracking_trigger = None
+        self._change_tracking_event = None
+
         self._blank_slide_name = '{}_blank'.format(self.name)
 
         super().__init__()
@@ -118,6 +127,64 @@ class Display(ScreenManager):
         """Return true if display is ready."""
         return self._ready
 
+    def enable_change_tracking(self) -> None:
+        """Check this display for changes at the end of every frame.
+
+        Used by consumers which render this display on their own (e.g. DMDs)
+        to skip rendering while nothing changed. See check_for_changes().
+        """
+        if self._change_tracking_trigger:
+            return
+
+        # This has to run before the window is drawn because drawing the
+        # display clears the change flags of its canvas.
+        self._change_tracking_trigger = Clock.create_trigger(self.check_for_changes, -1)
+        self._change_tracking_event = Clock.schedule_interval(self._schedule_change_check, 0)
+
+    def disable_change_tracking(self) -> None:
+        """Stop checking this display for changes (e.g. when the display is stopped)."""
+        if self._change_tracking_event:
+            self._change_tracking_event.cancel()
+            self._change_tracking_event = None
+        if self._change_tracking_trigger:
+            self._change_tracking_trigger.cancel()
+            self._change_tracking_trigger = None
+
+    def add_change_listener(self, callback: Callable[[int], None]) -> None:
+        """Call callback with the new change count whenever the display content changed.
+
+        Enables change tracking, so listeners are called from the per-frame
+        change check (before the window is drawn).
+        """
+        self.enable_change_tracking()
+        if callback not in self._change_listeners:
+            self._change_listeners.append(callback)
+
+    def remove_change_listener(self, callback: Callable[[int], None]) -> None:
+        """Remove a callback added with add_change_listener()."""
+        if callback in self._change_listeners:
+            self._change_listeners.remove(callback)
+
+    def _schedule_change_check(self, dt) -> None:
+        del dt
+        self._change_tracking_trigger()
+
+    def check_for_changes(self, *args) -> int:
+        """Return a counter which increases whenever the display content changed.
+
+        Kivy flags canvas instructions when widget properties, animations or
+        (video) textures change them and clears the flags once the canvas has
+        been drawn, so this has to be called before every draw of the display.
+        The change listeners are called whenever the counter increases.
+        """
+        del args
+        if self.container.canvas.needs_redraw:
+            self.change_count += 1
+            for callback in list(self._change_listeners):
+                callback(self.change_count)
+
+        return self.change_count
+
     @property
     def parent_widgets(self) -> List["WidgetContainer"]:
         """The list of all widgets owned by the display parent."""
@@ -374,7 +441,7 @@ class Display(ScreenManager):
             # Have to set a transition even if there's not one because we have
             # to remove whatever transition was last used
             self.transition.stop()
-            self.transition = self.mc.transition_manager.get_transition(transition)
+            self._set_transition(transition)
 
             self._set_current_slide(slide)
             return True
@@ -468,13 +535,11 @@ class Display(ScreenManager):
                 self.transition.stop()
 
             if transition_config:
-                self.transition = self.mc.transition_manager.get_transition(
-                    transition_config)
+                self._set_transition(transition_config)
             elif self.current_slide.transition_out:
-                self.transition = self.mc.transition_manager.get_transition(
-                    self.current_slide.transition_out)
+                self._set_transition(self.current_slide.transition_out)
             else:
-                self.transition = NoTransition()
+                self._set_transition(None)
 
             self.transition.bind(on_complete=self._remove_transition)
         else:
@@ -493,7 +558,14 @@ class Display(ScreenManager):
     def _remove_transition(self, transition):
         """Remove transition if done."""
         if self.transition == transition:
-            self.transition = NoTransition()
+            self._set_transition(None)
+
+    def _set_transition(self, transition_config: Optional[dict]) -> None:
+        """Replace the current transition with a (cached) transition for a config."""
+        previous_transition = self.transition
+        self.transition = self.mc.transition_manager.get_transition(transition_config)
+        previous_transition.unbind(on_complete=self._remove_transition)
+        self.mc.transition_manager.release_transition(previous_transition)
 
     def _set_current_slide(self, slide: "Slide"):
         # slide frame requires at least one slide, so if you try to set current
@@ -625,6 +697,9 @@ class DisplayOutput(Scatter):
         # instructions needed to draw the widgets.
         self.display = display
 
+        # The canvas the display canvas is added to
+        self.source_canvas = self.canvas
+
         parent.bind(size=self.on_parent_resize)
         self._fit_to_parent()
 
@@ -651,8 +726,7 @@ class DisplayOutput(Scatter):
         widget.parent = self
         widget.parents.append(self)
 
-        canvas = self.canvas
-        canvas.add(widget.container.canvas)
+        self.source_canvas.add(widget.container.canvas)
 
     def remove_display_source(self, widget):
         """Remove a display."""
@@ -662,7 +736,7 @@ class DisplayOutput(Scatter):
                 ' of the Display class.')
         widget.parents.remove(self)
         widget.parent = None
-        self.canvas.remove(widget.container.canvas)
+        self.source_canvas.remove(widget.container.canvas)
 
     def __repr__(self) -> str:  # pragma: no cover
         try:
@@ -686,3 +760,170 @@ class DisplayOutput(Scatter):
             self.height = floor(self.scale * self.display.height)
             self.x = (self.parent.width - self.width) // 2
             self.y = (self.parent.height - self.height) // 2
+
+
+class CachedDisplayOutput(DisplayOutput):
+
+    """Show a display as a single textured quad.
+
+    The display is rendered to an fbo at the size of this output which is only
+    re-rendered when the content of the display changed. Nested and mirrored
+    displays therefore only cost one textured quad per frame while they are
+    static.
+    """
+
+    def __init__(self, parent: "KivyWidget", display: "Display", **kwargs) -> None:
+        self.fbo = None
+        super().__init__(parent, display, **kwargs)
+
+        self.frames_rendered = 0
+
+        with self.canvas:
+            self.fbo = Fbo(size=display.native_size, with_stencilbuffer=True)
+            Color(1, 1, 1, 1)
+            self.rectangle = Rectangle(size=display.native_size, texture=self.fbo.texture)
+        with self.fbo.before:
+            PushMatrix()
+            self._fbo_scale = Scale(1, 1, 1)
+        with self.fbo:
+            ClearColor(0, 0, 0, 0)
+            ClearBuffers()
+        with self.fbo.after:
+            PopMatrix()
+
+        self.source_canvas = self.fbo
+        self._fit_to_parent()
+
+    def __repr__(self) -> str:  # pragma: no cover
+        try:
+            return '<CachedDisplayOutput size={}, pos={}, source={}>'.format(
+                self.size, self.pos, self.display.name)
+        except AttributeError:
+            return '<CachedDisplayOutput size={}, source=(none)>'.format(self.size)
+
+    def add_display_source(self, widget):
+        """Add a display and render it whenever it changed."""
+        super().add_display_source(widget)
+        widget.add_change_listener(self._update_cache)
+        self._update_cache(widget.change_count)
+
+    def remove_display_source(self, widget):
+        """Remove a display."""
+        super().remove_display_source(widget)
+        widget.remove_change_listener(self._update_cache)
+
+    def _update_cache(self, change_count: int) -> None:
+        """Render the display again (called by the display whenever it changed)."""
+        del change_count
+        self.frames_rendered += 1
+        self.fbo.ask_update()
+
+    def _fit_to_parent(self, *args):
+        """Center and scale display output and resize the fbo to the output size."""
+        super()._fit_to_parent(*args)
+        if self.fbo is None:
+            return
+
+        # Render the display at the size it is shown at
+        width = max(1, floor(self.scale * self.display.width))
+        height = max(1, floor(self.scale * self.display.height))
+        self.fbo.size = (width, height)
+        self._fbo_scale.xyz = (width / float(self.display.width), height / float(self.display.height), 1)
+        self.rectangle.texture = self.fbo.texture
+        self.fbo.ask_update()
+
+
+class NativeDisplayOutput(KivyWidget):
+
+    """Show a display which is rendered at its native size and scaled to the widget in a single pass.
+
+    The display and its native effects are rendered to textures of the native
+    size of the display (e.g. 128x32 dots for a DMD). The result is scaled to
+    the widget in a single pass using nearest filtering, so every source pixel
+    stays a sharp block. That pass also applies the output effects, which are
+    pixel effects that need the output resolution (such as the dot filter).
+    """
+
+    def __init__(self, display: "Display", native_effects: List["PixelEffect"],
+                 output_effects: List["PixelEffect"], **kwargs) -> None:
+        self.canvas = RenderContext(use_parent_projection=True,
+                                    use_parent_modelview=True,
+                                    use_parent_frag_modelview=True)
+        super().__init__(**kwargs)
+
+        self.key = None
+        self.display = display
+        self.native_effects = compile_effects(native_effects)
+        self.output_effects = output_effects
+
+        # The display output is not part of the widget tree. It renders the
+        # display at its native size and position into the first fbo.
+        self.display_output = DisplayOutput(self, display)
+        with self.display_output.canvas.after:
+            Callback(self._propagate_updates)
+
+        with self.canvas:
+            display_fbo = Fbo(size=display.native_size, with_stencilbuffer=True)
+        with display_fbo:
+            ClearColor(0, 0, 0, 0)
+            ClearBuffers()
+        display_fbo.add(self.display_output.canvas)
+        self.native_fbos = [display_fbo]
+
+        for effect in self.native_effects:
+            with self.canvas:
+                effect_fbo = EffectFbo(size=display.native_size)
+            with effect_fbo:
+                ClearColor(0, 0, 0, 0)
+                ClearBuffers()
+                Color(1, 1, 1, 1)
+                effect_fbo.texture_rectangle = Rectangle(size=display.native_size,
+                                                         texture=self.native_fbos[-1].texture)
+            effect.fbo = effect_fbo
+            self.native_fbos.append(effect_fbo)
+
+        self.texture = self.native_fbos[-1].texture
+        self.texture.mag_filter = 'nearest'
+
+        with self.canvas:
+            Color(1, 1, 1, 1)
+            self.rectangle = Rectangle(texture=self.texture)
+
+        if output_effects:
+            for index, effect in enumerate(output_effects):
+                effect.uniform_owner = self
+                effect.uniform_prefix = 'e{}_'.format(index)
+
+            self.canvas.shader.fs = shader_header + fused_effect_glsl(
+                tuple(effect.__class__ for effect in output_effects)) + shader_footer_effect
+            for effect in output_effects:
+                effect.update_uniforms()
+
+        self.bind(pos=self._fit_to_widget, size=self._fit_to_widget)
+        self._fit_to_widget()
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return '<NativeDisplayOutput size={}, pos={}, source={}>'.format(
+            self.size, self.pos, self.display.name)
+
+    @property
+    def fbo(self) -> RenderContext:
+        """The render context of the output pass (the output effects set their uniforms on it)."""
+        return self.canvas
+
+    def _propagate_updates(self, *args) -> None:
+        """Render the native effects whenever the display has been rendered."""
+        del args
+        for fbo in self.native_fbos[1:]:
+            fbo.ask_update()
+
+    def _fit_to_widget(self, *args) -> None:
+        """Center and scale the native texture in this widget."""
+        del args
+        scale = min(self.width / float(self.display.width),
+                    self.height / float(self.display.height))
+        width = floor(scale * self.display.width)
+        height = floor(scale * self.display.height)
+        self.rectangle.pos = (self.x + (self.width - width) // 2,
+                              self.y + (self.height - height) // 2)
+        self.rectangle.size = (width, height)
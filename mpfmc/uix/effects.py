@@ -1,6 +1,7 @@
 import importlib
 import abc
-from typing import Optional, List, Union
+from functools import lru_cache
+from typing import Optional, List, Tuple, Union
 
 from kivy.event import EventDispatcher
 from kivy.uix.effectwidget import (MonochromeEffect, InvertEffect,
@@ -114,3 +115,147 @@ class EffectsChain(EventDispatcher, metaclass=abc.ABCMeta):
     def get_effects(self) -> List["EffectBase"]:
         """Return the list of effects in this chain."""
         raise NotImplementedError('get_effects method must be defined to use this base class')
+
+
+class PixelEffect(EffectBase):
+
+    """Base class for effects which calculate each pixel only from the color of the
+    same source pixel (and its texture coordinates).
+
+    The settings of a pixel effect are passed to its shader as uniforms, so the
+    shader source only depends on the effect classes. Consecutive pixel effects
+    are fused into a single shader pass by compile_effects().
+    """
+
+    pixel_glsl = ''
+    '''GLSL function which applies the effect to a color. It is formatted with the
+    function name (name) and the prefix of the effect uniforms (prefix) and must
+    have the signature vec4 {name}(vec4 color, vec2 tex_coords).
+    '''
+
+    uniform_types = tuple()     # type: Tuple[Tuple[str, str], ...]
+    '''The (name, GLSL type) pairs of the effect uniforms.'''
+
+    output_resolution = False
+    '''Whether the effect has to be rendered at the output resolution (e.g. because
+    it draws shapes inside every source pixel). Effects which don't can be rendered
+    at the native size of a display. See split_native_effects().
+    '''
+
+    def __init__(self, *args, **kwargs):
+        # The uniforms are set on the fbo of the effect that renders this effect
+        # (a FusedEffect if the effect is part of a fused pass)
+        self.uniform_owner = self
+        self.uniform_prefix = 'e0_'
+        super().__init__(*args, **kwargs)
+        self.glsl = fused_effect_glsl((self.__class__, ))
+        self.fbind('fbo', self.update_uniforms)
+
+    def get_uniforms(self) -> dict:
+        """Return the values of the effect uniforms."""
+        raise NotImplementedError
+
+    def update_uniforms(self, *args) -> None:
+        """Pass the current effect settings to the shader."""
+        del args
+        fbo = self.uniform_owner.fbo
+        if fbo is None:
+            return
+
+        for name, value in self.get_uniforms().items():
+            fbo[self.uniform_prefix + name] = value
+
+
+class FusedEffect(EffectBase):
+
+    """A chain of pixel effects which is rendered in a single shader pass."""
+
+    def __init__(self, effects: List[PixelEffect], **kwargs) -> None:
+        self.effects = effects
+        super().__init__(**kwargs)
+
+        for index, effect in enumerate(effects):
+            effect.uniform_owner = self
+            effect.uniform_prefix = 'e{}_'.format(index)
+
+        self.glsl = fused_effect_glsl(tuple(effect.__class__ for effect in effects))
+        self.fbind('fbo', self.update_uniforms)
+
+    def update_uniforms(self, *args) -> None:
+        """Pass the current settings of all effects to the shader."""
+        del args
+        for effect in self.effects:
+            effect.update_uniforms()
+
+
+@lru_cache(maxsize=None)
+def fused_effect_glsl(effect_classes: Tuple[type, ...]) -> str:
+    """Return the GLSL source of a shader which applies a chain of pixel effects.
+
+    The source is cached by the effect classes in the chain. The result of each
+    effect is clamped like it would be when it is written to an fbo texture.
+    """
+    lines = list()
+    calls = list()
+    for index, effect_cls in enumerate(effect_classes):
+        prefix = 'e{}_'.format(index)
+        function_name = prefix + 'effect'
+        lines.extend('uniform {} {}{};'.format(glsl_type, prefix, name)
+                     for name, glsl_type in effect_cls.uniform_types)
+        lines.append(effect_cls.pixel_glsl.format(name=function_name, prefix=prefix))
+        calls.append('    color = clamp({}(color, tex_coords), 0.0, 1.0);'.format(function_name))
+
+    lines.append('vec4 effect(vec4 color, sampler2D texture, vec2 tex_coords, vec2 coords)')
+    lines.append('{')
+    lines.extend(calls)
+    lines.append('    return color;')
+    lines.append('}')
+    return '\n'.join(lines)
+
+
+def compile_effects(effects: List[EffectBase]) -> List[EffectBase]:
+    """Fuse consecutive pixel effects in a list of effects into single shader passes.
+
+    Every effect in an effect widget is rendered in a separate full size fbo pass.
+    Effects which sample other pixels of the texture (such as blur, pixelate or
+    flip_vertical) stay separate passes.
+    """
+    compiled = list()
+    pixel_effects = list()
+    for effect in effects:
+        if isinstance(effect, PixelEffect):
+            pixel_effects.append(effect)
+            continue
+
+        compiled.extend(_fuse(pixel_effects))
+        pixel_effects = list()
+        compiled.append(effect)
+
+    compiled.extend(_fuse(pixel_effects))
+    return compiled
+
+
+def _fuse(pixel_effects: List[PixelEffect]) -> List[EffectBase]:
+    if len(pixel_effects) < 2:
+        return pixel_effects
+
+    return [FusedEffect(pixel_effects)]
+
+
+def split_native_effects(effects: List[EffectBase]) -> Optional[Tuple[List[PixelEffect], List[PixelEffect]]]:
+    """Split a list of effects into the effects which can be rendered at the native
+    size of a display and the effects which need the output resolution.
+
+    Only the effects before the first effect which needs the output resolution
+    are rendered at the native size because the effects do not commute. Returns
+    None if the list contains effects which are no pixel effects (the result of
+    e.g. a blur depends on the resolution it is rendered at).
+    """
+    if not all(isinstance(effect, PixelEffect) for effect in effects):
+        return None
+
+    for index, effect in enumerate(effects):
+        if effect.output_resolution:
+            return effects[:index], effects[index:]
+
+    return effects, []
@@ -0,0 +1,124 @@
+"""Glyph cache used to compose TrueType text from pre-rendered glyphs."""
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from kivy.core.text import Label as CoreLabel
+from kivy.graphics.texture import Texture
+
+
+class GlyphCache:
+
+    """Caches one white texture per glyph and font.
+
+    Glyphs are rasterized once per font key (font_name, font_size, bold,
+    italic, font_hinting, font_blended, font_kerning) by the core text
+    provider. Text widgets then compose strings from these textures and tint
+    them with their color instruction, so changing a few characters of a
+    string does not re-rasterize the whole line. With font_kerning the
+    kerning of every pair of glyphs is measured once and applied to the
+    layout.
+
+    At most max_fonts font keys are kept. Once more fonts are used, the least
+    recently used font is evicted together with its glyph textures, kerning
+    pairs and measure label. Widgets which still show glyphs of an evicted
+    font keep their textures until they render new text.
+    """
+
+    def __init__(self, max_fonts: int = 16) -> None:
+        self.max_fonts = max_fonts
+        self._fonts = OrderedDict()     # type: OrderedDict  # font key -> {char: (texture, advance)} in LRU order
+        self._kerning = dict()  # type: Dict[Tuple, Dict[Tuple[str, str], int]]
+        self._measure_labels = dict()   # type: Dict[Tuple, CoreLabel]
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_glyph(self, font_key: Tuple, char: str) -> Tuple[Optional[Texture], int]:
+        """Return (texture, advance width) of a char in a font.
+
+        The glyph is rasterized on first use. The texture is None for glyphs
+        which do not produce any pixels (e.g. spaces).
+        """
+        try:
+            glyphs = self._fonts[font_key]
+        except KeyError:
+            glyphs = self._fonts[font_key] = dict()
+            self._evict()
+        else:
+            self._fonts.move_to_end(font_key)
+
+        try:
+            glyph = glyphs[char]
+        except KeyError:
+            self.misses += 1
+            glyph = glyphs[char] = self._render_glyph(font_key, char)
+        else:
+            self.hits += 1
+
+        return glyph
+
+    def get_kerning(self, font_key: Tuple, previous_char: str, char: str) -> int:
+        """Return the kerning adjustment between two glyphs of a font."""
+        if not font_key[6]:
+            # font_kerning is disabled
+            return 0
+
+        try:
+            pairs = self._kerning[font_key]
+        except KeyError:
+            pairs = self._kerning[font_key] = dict()
+
+        try:
+            return pairs[(previous_char, char)]
+        except KeyError:
+            pass
+
+        label = self._get_measure_label(font_key)
+        kerning = (label.get_extents(previous_char + char)[0] - label.get_extents(previous_char)[0] -
+                   label.get_extents(char)[0])
+        pairs[(previous_char, char)] = kerning
+        return kerning
+
+    def _evict(self) -> None:
+        while len(self._fonts) > self.max_fonts:
+            font_key, _ = self._fonts.popitem(last=False)
+            self._kerning.pop(font_key, None)
+            self._measure_labels.pop(font_key, None)
+            self.evictions += 1
+
+    def _get_measure_label(self, font_key: Tuple) -> CoreLabel:
+        try:
+            return self._measure_labels[font_key]
+        except KeyError:
+            label = self._measure_labels[font_key] = self._create_label(font_key, '')
+            return label
+
+    @staticmethod
+    def _create_label(font_key: Tuple, text: str) -> CoreLabel:
+        font_name, font_size, bold, italic, font_hinting, font_blended, font_kerning = font_key
+        return CoreLabel(text=text, font_name=font_name, font_size=font_size,
+                         bold=bold, italic=italic, font_hinting=font_hinting,
+                         font_blended=font_blended, font_kerning=font_kerning,
+                         color=(1, 1, 1, 1))
+
+    def _render_glyph(self, font_key: Tuple, char: str) -> Tuple[Optional[Texture], int]:
+        label = self._create_label(font_key, char)
+        label.refresh()
+        if label.texture:
+            return label.texture, label.texture.width
+
+        return None, label.get_extents(char)[0]
+
+    def clear(self) -> None:
+        """Remove all cached glyphs."""
+        self._fonts = OrderedDict()
+        self._kerning = dict()
+        self._measure_labels = dict()
+
+    def get_stats(self) -> dict:
+        """Return cache statistics."""
+        return dict(fonts=len(self._fonts),
+                    glyphs=sum(len(glyphs) for glyphs in self._fonts.values()),
+                    hits=self.hits,
+                    misses=self.misses,
+                    evictions=self.evictions)
@@ -0,0 +1,98 @@
+"""Texture cache shared by text labels which render identical content."""
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from kivy.graphics.texture import Texture
+
+
+class LabelTextureCache:
+
+    """Reference counted LRU cache of rendered label textures.
+
+    Entries are keyed by the full set of label font properties plus the text,
+    so identical labels (e.g. "BALL" or "CREDITS" on many slides) are only
+    rasterized once. Entries which are in use by a label are never evicted.
+    Unused entries are kept in least recently used order and are evicted
+    oldest first once the cache holds more than max_size entries.
+
+    Every entry keeps the core label which rendered its texture. The texture
+    is filled and (after a GL context reload) re-rendered by that core label,
+    which is not used for any other text.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._entries = dict()          # type: Dict[Hashable, List]  # key -> [texture, is_shortened, refcount, renderer]
+        self._unused = OrderedDict()    # type: OrderedDict  # keys of entries without references in LRU order
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def acquire(self, key: Hashable) -> Optional[Tuple[Texture, bool]]:
+        """Return (texture, is_shortened) for a key and add a reference.
+
+        Returns None if the key is not in the cache. The caller is expected to
+        render the texture and add it via add() in that case.
+        """
+        try:
+            entry = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        if not entry[2]:
+            del self._unused[key]
+        entry[2] += 1
+        return entry[0], entry[1]
+
+    def add(self, key: Hashable, texture: Texture, is_shortened: bool, renderer: Any = None) -> None:
+        """Add a freshly rendered texture with one reference.
+
+        renderer is the core label which rendered the texture. It is kept
+        alive as long as the entry exists.
+        """
+        entry = self._entries.get(key)
+        if entry:
+            # rendered by two labels at the same time. keep the existing texture.
+            if not entry[2]:
+                del self._unused[key]
+            entry[2] += 1
+            return
+
+        self._entries[key] = [texture, is_shortened, 1, renderer]
+        self._evict()
+
+    def release(self, key: Hashable) -> None:
+        """Remove a reference to an entry."""
+        try:
+            entry = self._entries[key]
+        except KeyError:
+            return
+
+        entry[2] -= 1
+        if not entry[2]:
+            self._unused[key] = None
+            self._evict()
+
+    def _evict(self) -> None:
+        while len(self._entries) > self.max_size and self._unused:
+            key, _ = self._unused.popitem(last=False)
+            del self._entries[key]
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Remove all entries which are not in use."""
+        for key in self._unused:
+            del self._entries[key]
+        self._unused.clear()
+
+    def get_stats(self) -> dict:
+        """Return cache statistics."""
+        lookups = self.hits + self.misses
+        return dict(entries=len(self._entries),
+                    in_use=len(self._entries) - len(self._unused),
+                    hits=self.hits,
+                    misses=self.misses,
+                    evictions=self.evictions,
+                    hit_rate=self.hits / lookups if lookups else 0.0)
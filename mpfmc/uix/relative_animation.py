@@ -1,9 +1,9 @@
-from kivy.animation import Animation
+from mpfmc.uix.animation import MpfAnimation
 
 
-class RelativeAnimation(Animation):
+class RelativeAnimation(MpfAnimation):
 
-    """Class that extends the Kivy Animation base class to add relative animation property target values.
+    """Class that extends the animation base class to add relative animation property target values.
 
     Those are calculated when the animation starts.
     """
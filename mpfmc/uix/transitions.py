@@ -1,8 +1,15 @@
 import importlib
+import logging
+import time
+import weakref
+from functools import partial
+from typing import Dict, List, Optional
 
 from kivy.animation import AnimationTransition
+from kivy.clock import Clock
+from kivy.graphics import RenderContext
 from kivy.properties import StringProperty
-from kivy.uix.screenmanager import TransitionBase
+from kivy.uix.screenmanager import TransitionBase, ShaderTransition
 from kivy.uix.screenmanager import (WipeTransition, SwapTransition,
                                     FadeTransition, FallOutTransition,
                                     RiseInTransition, CardTransition,
@@ -10,11 +17,35 @@ from kivy.uix.screenmanager import (WipeTransition, SwapTransition,
 
 
 class TransitionManager:
+
+    """Creates the slide transitions.
+
+    Transition objects are cached by their type and settings and are reused
+    once they completed. Transitions referenced by slide_player and slide
+    configs are prewarmed (created and their shaders compiled) when the
+    displays are initialized so the first slide switch does not hitch.
+    """
+
+    max_idle_transitions = 4
+    """Number of idle transition objects which are kept per type and settings."""
+
     def __init__(self, mc):
         self.mc = mc
+        self.log = logging.getLogger('TransitionManager')
         self._transitions = dict()
+        self._idle_transitions = dict()     # type: Dict[tuple, List[TransitionBase]]
+        self._transition_keys = weakref.WeakKeyDictionary()
+        self._prewarm_keys = set()
+        self._pending_prewarm_configs = list()  # type: List[dict]
+        self._shaders = dict()              # type: Dict[tuple, RenderContext]
+        self._displays_initialized = False
+        self.created = 0
+        self.reused = 0
+        self.prewarmed = 0
+        self.create_time = 0.0
         self._register_mpf_transitions()
         self._register_kivy_transitions()
+        self.mc.events.add_handler('displays_initialized', self._prewarm_pending_transitions)
 
     @property
     def transitions(self):
@@ -24,13 +55,152 @@ class TransitionManager:
         self._transitions[name] = transition_cls
 
     def get_transition(self, transition_config=None):
+        """Return an idle transition for a transition config (or create one).
+
+        Pass the transition to release_transition() once it is not used anymore.
+        """
+        key = self._get_key(transition_config)
+        idle_transitions = self._idle_transitions.get(key)
+        if idle_transitions:
+            self.reused += 1
+            return idle_transitions.pop()
+
+        return self._create_transition(key, transition_config)
+
+    def release_transition(self, transition: TransitionBase, defer: bool = True) -> None:
+        """Return a transition which is not used anymore to the cache.
+
+        A transition which is released from its own on_complete handler is
+        still completing. It is returned to the cache in the next frame.
+        """
+        key = self._transition_keys.get(transition)
+        if key is None:
+            return
+
+        idle_transitions = self._idle_transitions.setdefault(key, [])
+        if transition in idle_transitions or len(idle_transitions) >= self.max_idle_transitions:
+            return
+
+        if transition.is_active:
+            # still running. Will not be reused.
+            return
+
+        # pylint: disable-msg=protected-access
+        if transition._anim:
+            # completing right now (kivy clears the animation after the
+            # on_complete handlers ran)
+            if defer:
+                Clock.schedule_once(partial(self._release_completed_transition, transition), 0)
+            return
+
+        # do not keep the slides of the last run alive
+        transition.screen_in = None
+        transition.screen_out = None
+        idle_transitions.append(transition)
+
+    def _release_completed_transition(self, transition: TransitionBase, dt) -> None:
+        del dt
+        self.release_transition(transition, defer=False)
+
+    def prewarm_transition(self, transition_config: Optional[dict]) -> None:
+        """Create a transition (and compile its shader) before it is used the first time."""
+        if not transition_config:
+            return
+
+        key = self._get_key(transition_config)
+        if key is None or key in self._prewarm_keys:
+            return
+
+        self._prewarm_keys.add(key)
+        if not self._displays_initialized:
+            # shaders can only be compiled once the window exists
+            self._pending_prewarm_configs.append(transition_config)
+            return
+
+        if not self._idle_transitions.get(key):
+            self._idle_transitions.setdefault(key, []).append(
+                self._create_transition(key, transition_config))
+            self.prewarmed += 1
+
+    def get_stats(self) -> dict:
+        """Return transition cache statistics."""
+        return dict(created=self.created,
+                    reused=self.reused,
+                    prewarmed=self.prewarmed,
+                    idle=sum(len(transitions) for transitions in self._idle_transitions.values()),
+                    shaders=len(self._shaders),
+                    create_time=self.create_time)
+
+    def _prewarm_pending_transitions(self, **kwargs):
+        del kwargs
+        self._displays_initialized = True
+        pending_configs = self._pending_prewarm_configs
+        self._pending_prewarm_configs = list()
+        for transition_config in pending_configs:
+            self._prewarm_keys.discard(self._get_key(transition_config))
+            self.prewarm_transition(transition_config)
+
+    def _create_transition(self, key, transition_config):
+        start = time.perf_counter()
         if transition_config:
             # The kivy shader transitions can't accept unexpected kwargs
             kwargs = transition_config.copy()
             kwargs.pop('type')
-            return self._transitions[transition_config['type']](**kwargs)
+            transition = self._transitions[transition_config['type']](**kwargs)
         else:
-            return NoTransition()
+            transition = NoTransition()
+
+        self._compile_shader(transition)
+        if key is not None:
+            self._transition_keys[transition] = key
+
+        duration = time.perf_counter() - start
+        self.created += 1
+        self.create_time += duration
+        self.log.debug("Created %s transition in %.3fms",
+                       transition_config['type'] if transition_config else 'none', duration * 1000)
+        return transition
+
+    def _compile_shader(self, transition):
+        """Compile the shader of a shader transition.
+
+        Kivy keeps compiled shader sources in its shader cache. The render
+        context is kept to keep the shader of every transition alive.
+        """
+        if not isinstance(transition, ShaderTransition) or not self._displays_initialized:
+            return
+
+        shader_key = (transition.vs, transition.fs)
+        if shader_key not in self._shaders:
+            self._shaders[shader_key] = RenderContext(vs=transition.vs, fs=transition.fs)
+
+    @classmethod
+    def _get_key(cls, transition_config):
+        """Return the cache key of a transition config.
+
+        Returns None for configs which contain values that can not be hashed.
+        Transitions for those configs are created every time.
+        """
+        if not transition_config:
+            return 'none',
+
+        key = (transition_config['type'], ) + tuple(
+            (name, cls._freeze(value))
+            for name, value in sorted(transition_config.items()) if name != 'type')
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    @classmethod
+    def _freeze(cls, value):
+        """Convert (nested) lists and dicts of a config value into tuples."""
+        if isinstance(value, (list, tuple)):
+            return tuple(cls._freeze(item) for item in value)
+        if isinstance(value, dict):
+            return tuple((name, cls._freeze(item)) for name, item in sorted(value.items()))
+        return value
 
     def _register_mpf_transitions(self):
         for t in self.mc.machine_config['mpf-mc']['mpf_transition_modules']:
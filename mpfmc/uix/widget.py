@@ -14,6 +14,7 @@ from kivy.properties import (NumericProperty, ReferenceListProperty,
 
 from mpf.core.rgba_color import RGBAColor
 
+from mpfmc.uix.animation import MpfAnimation
 from mpfmc.uix.relative_animation import RelativeAnimation
 from mpfmc.core.utils import percent_to_float
 
@@ -563,13 +564,15 @@ class Widget(KivyWidget):
 
             # Create the animation object
             if settings['relative']:
-                animation = RelativeAnimation(duration=settings['duration'],
+                animation = RelativeAnimation(scheduler=self.mc.animation_scheduler,
+                                              duration=settings['duration'],
                                               transition=settings['easing'],
                                               **prop_dict)
             else:
-                animation = Animation(duration=settings['duration'],
-                                      transition=settings['easing'],
-                                      **prop_dict)
+                animation = MpfAnimation(scheduler=self.mc.animation_scheduler,
+                                         duration=settings['duration'],
+                                         transition=settings['easing'],
+                                         **prop_dict)
 
             # Determine if this animation should be performed in sequence or in parallel
             # with the previous animation.
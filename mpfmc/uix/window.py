@@ -17,7 +17,7 @@ class Window:
         # Clean up any existing objects in the window
         KivyWindow.clear()
 
-        for widget in KivyWindow.children:
+        for widget in list(KivyWindow.children):
             KivyWindow.remove_widget(widget)
 
         # Add the new display to the window
@@ -57,10 +57,16 @@ class Window:
         if 'effects' in mc.machine_config['window']:
             config['effects'] = mc.effects_manager.validate_effects(mc.machine_config['window']['effects'])
 
-        display_widget = DisplayWidget(mc, config=config)
+        # The window shows the whole display tree anyway so it is not cached
+        display_widget = DisplayWidget(mc, config=config, cache=False)
         display_widget.parent.remove_widget(display_widget)
         Window.set_source_display(display_widget)
 
+        if mc.frame_profiler:
+            mc.frame_profiler.attach_window(KivyWindow)
+            if mc.machine_config['mpf-mc']['frame_profiler_overlay']:
+                mc.frame_profiler.show_overlay(KivyWindow)
+
         if (display.width / display.height !=
                 KivyWindow.width / KivyWindow.height):
             mc.log.warning(
@@ -5,7 +5,8 @@ from kivy.uix.effectwidget import EffectWidget
 from kivy.uix.relativelayout import RelativeLayout
 
 from mpfmc.uix.widget import Widget
-from mpfmc.uix.display import DisplayOutput
+from mpfmc.uix.display import DisplayOutput, CachedDisplayOutput, NativeDisplayOutput
+from mpfmc.uix.effects import compile_effects, split_native_effects
 
 MYPY = False
 if MYPY:   # pragma: no cover
@@ -20,22 +21,41 @@ class DisplayWidget(Widget, RelativeLayout):
     widget_type_name = 'Display'
     animation_properties = ('x', 'y', 'pos')
 
-    def __init__(self, mc: "MpfMc", config: dict, key: Optional[str] = None, **kwargs) -> None:
+    def __init__(self, mc: "MpfMc", config: dict, key: Optional[str] = None,
+                 cache: Optional[bool] = None, **kwargs) -> None:
         del kwargs
         self.display = mc.displays[config['source_display']]
 
+        # Cache the display in an fbo which is only re-rendered when the display changed
+        if cache is None:
+            cache = mc.machine_config['mpf-mc']['cache_nested_displays']
+
         super().__init__(mc=mc, config=config, key=key)
 
-        if 'effects' in self.config and self.config['effects']:
-            self.effects = EffectWidget(pos=self.pos, size_hint=(1, 1))
-            self.effects.key = None
-            self._add_effects(self.config['effects'])
+        effects_list = self._get_effects(self.config.get('effects'))
+        native_effects = None
+        if effects_list and self.mc.machine_config['mpf-mc']['display_native_resolution']:
+            native_effects = split_native_effects(effects_list)
+
+        if native_effects:
+            # Render the display at its native size and scale it in a single pass
+            self.effects = NativeDisplayOutput(self.display, *native_effects,
+                                               pos=self.pos, size_hint=(1, 1))
+            self.display_output = self.effects.display_output
         else:
-            self.effects = RelativeLayout(pos=self.pos, size_hint=(1, 1))
+            if effects_list:
+                self.effects = EffectWidget(pos=self.pos, size_hint=(1, 1))
+                self.effects.key = None
+                # Consecutive per-pixel effects are rendered in a single shader pass
+                self.effects.effects = compile_effects(effects_list)
+            else:
+                self.effects = RelativeLayout(pos=self.pos, size_hint=(1, 1))
+
+            output_cls = CachedDisplayOutput if cache else DisplayOutput
+            self.display_output = output_cls(self.effects, self.display)
+            self.effects.add_widget(self.display_output)
 
         # Establish link between display and this display widget
-        self.display_output = DisplayOutput(self.effects, self.display)
-        self.effects.add_widget(self.display_output)
         self.add_widget(self.effects)
         self.display_output.add_display_source(self.display)
 
@@ -56,16 +76,16 @@ class DisplayWidget(Widget, RelativeLayout):
         del instance
         self.effects.pos = pos
 
-    def _add_effects(self, config: Optional[list]) -> None:
-        """Adds any effects specified in the config for this display widget."""
+    def _get_effects(self, config: Optional[list]) -> list:
+        """Return the effects specified in the config for this display widget."""
+        effects_list = list()
         if config:
-            effects_list = list()
             for effect_config in config:
                 effect_config['width'] = self.width
                 effect_config['height'] = self.height
                 effects_list.extend(self.mc.effects_manager.get_effect(effect_config))
 
-            self.effects.effects = effects_list
+        return effects_list
 
     def get_display(self):
         """List display."""
@@ -1,11 +1,12 @@
 """A text widget on a slide."""
 import re
-from typing import Optional
+from collections import namedtuple
+from typing import List, Optional
 
 from kivy.uix.label import Label
 from kivy.properties import AliasProperty, NumericProperty, BooleanProperty, \
     ReferenceListProperty, ListProperty
-from kivy.graphics import Rectangle, Color, Rotate, Scale
+from kivy.graphics import Rectangle, Color, Rotate, Scale, Translate
 
 from mpfmc.uix.widget import Widget
 from mpfmc.uix.bitmap_font.label_bitmap_font import LabelBitmapFont
@@ -15,8 +16,89 @@ if MYPY:   # pragma: no cover
     from mpfmc.core.mc import MpfMc
 
 
+def _freeze(value):
+    """Return a hashable version of a label property value."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    return value
+
+
+class CachedTextureLabel(Label):
+
+    """Label which shares its rendered texture with identical labels.
+
+    If texture_cache is set, labels with the same class, font properties and
+    text use the same texture from the LabelTextureCache instead of
+    rasterizing their own one.
+    """
+
+    def __init__(self, **kwargs):
+        self.texture_cache = None
+        self.frame_profiler = None
+        self._texture_cache_key = None
+        super().__init__(**kwargs)
+
+    def _get_texture_cache_key(self) -> tuple:
+        return ((self.__class__, self.disabled) +
+                tuple(_freeze(getattr(self, name)) for name in Label._font_properties))
+
+    def texture_update(self, *largs):
+        """Update the texture from the cache or render it."""
+        cache = self.texture_cache
+        if cache is None or self.markup or not self.text:
+            # markup labels need the core label to calculate refs and anchors
+            self.release_cached_texture()
+            super().texture_update(*largs)
+            if self.frame_profiler and self.texture is not None:
+                self.frame_profiler.count('texture_uploads')
+            return
+
+        key = self._get_texture_cache_key()
+        if key == self._texture_cache_key:
+            # texture is already up to date
+            return
+
+        self.release_cached_texture()
+        cached = cache.acquire(key)
+        if cached:
+            texture, is_shortened = cached
+            self.texture = texture
+            self.texture_size = list(texture.size)
+            self.is_shortened = is_shortened
+            self._texture_cache_key = key
+            return
+
+        super().texture_update(*largs)
+        if self.texture is None:
+            return
+
+        if self.frame_profiler:
+            self.frame_profiler.count('texture_uploads')
+
+        # The core label fills the texture when it is first drawn, re-renders
+        # it after a GL context reload and would render its next text into
+        # the same texture if it has the same size. Hand it over to the cache
+        # entry with the texture and render the next text with a new one.
+        cache.add(key, self.texture, self.is_shortened, self._label)
+        self._texture_cache_key = key
+        self._label = None
+        self._create_label()
+
+    def release_cached_texture(self):
+        """Release the texture cache entry used by this label."""
+        if self._texture_cache_key is not None:
+            self.texture_cache.release(self._texture_cache_key)
+            self._texture_cache_key = None
+
+    def __del__(self):
+        # labels which were not removed via prepare_for_removal
+        self.release_cached_texture()
+
+
 # pylint: disable-msg=too-many-instance-attributes
-class McFontLabel(Label):
+class McFontLabel(CachedTextureLabel):
 
     """Normal label."""
 
@@ -24,9 +106,13 @@ class McFontLabel(Label):
         """Return the label."""
         return self._label
 
+    def cancel_texture_update(self):
+        """Cancel a pending texture update."""
+        self._trigger_texture.cancel()
+
 
 # pylint: disable-msg=too-many-instance-attributes
-class BitmapFontLabel(Label):
+class BitmapFontLabel(CachedTextureLabel):
 
     """Injects a font or bitmap font into a text widget."""
 
@@ -43,15 +129,75 @@ class BitmapFontLabel(Label):
         """Return the label."""
         return self._label
 
+    def cancel_texture_update(self):
+        """Cancel a pending texture update."""
+        self._trigger_texture.cancel()
+
     def _create_label(self):
         d = Label._font_properties
         dkw = dict(list(zip(d, [getattr(self, x) for x in d])))
         self._label = LabelBitmapFont(self.mc, **dkw)
 
 
-var_finder = re.compile(r"(?<=\()[a-zA-Z_0-9|]+(?=\))")
+var_finder = re.compile(r"\(([a-zA-Z_0-9|]+)\)")
 string_finder = re.compile(r"(?<=\$)[a-zA-Z_0-9]+")
 
+TEMPLATE_LITERAL = 0
+TEMPLATE_VAR = 1
+TEMPLATE_PLAYER_VAR = 2
+TEMPLATE_PLAYER_NUM_VAR = 3
+TEMPLATE_MACHINE_VAR = 4
+
+TextTemplate = namedtuple('TextTemplate', 'source segments variables')
+
+
+def compile_text_template(text: str) -> TextTemplate:
+    """Parse a text template once into a list of segments.
+
+    Each segment is a tuple of (kind, var_string, var_name, player_index).
+    Literal segments hold their text in var_string. Variable segments keep the
+    full placeholder name in var_string so they can still be looked up in the
+    event kwargs. Text strings ($name) are already resolved when the widget is
+    created so they end up in the literals.
+    """
+    segments = []
+    variables = []
+    literal = ''
+    pos = 0
+
+    for match in var_finder.finditer(text):
+        literal += text[pos:match.start()]
+        pos = match.end()
+        var_string = match.group(1)
+
+        if literal:
+            segments.append((TEMPLATE_LITERAL, literal, None, None))
+            literal = ''
+
+        if var_string not in variables:
+            variables.append(var_string)
+
+        if '|' not in var_string:
+            segments.append((TEMPLATE_VAR, var_string, var_string, None))
+            continue
+
+        source, var_name = var_string.split('|', 1)
+        if source == 'machine':
+            segments.append((TEMPLATE_MACHINE_VAR, var_string, var_name, None))
+        elif source == 'player':
+            segments.append((TEMPLATE_PLAYER_VAR, var_string, var_name, None))
+        elif source.startswith('player') and source[6:].isdigit():
+            segments.append((TEMPLATE_PLAYER_NUM_VAR, var_string, var_name,
+                             int(source[6:]) - 1))
+        else:
+            segments.append((TEMPLATE_VAR, var_string, var_string, None))
+
+    literal += text[pos:]
+    if literal:
+        segments.append((TEMPLATE_LITERAL, literal, None, None))
+
+    return TextTemplate(text, tuple(segments), tuple(variables))
+
 
 class Text(Widget):
 
@@ -73,14 +219,29 @@ class Text(Widget):
             self._label = BitmapFontLabel(mc, config['font_name'])
         else:
             self._label = McFontLabel()
+        self._label.texture_cache = mc.label_texture_cache
+        self._label.frame_profiler = mc.frame_profiler
         self._label.fbind('texture', self.on_label_texture)
         self.color_instruction = None
         self.rectangle = None
         self.rotate = None
         self.scale_instruction = None
+        self.glyph_translate = None
+        self.glyph_rectangles = list()
+        self._drawn_mode = None
+        self._glyph_layout = None
+        self._glyph_layout_changed = False
+        self._glyph_cache = None
+        self._template = None   # type: Optional[TextTemplate]
+        self._rendered_text = None  # type: Optional[str]
 
         super().__init__(mc=mc, config=config, key=key)
 
+        if mc.glyph_cache:
+            self._update_glyph_cache_use()
+            for name in self._glyph_incompatible_properties:
+                self._label.fbind(name, self._update_glyph_cache_use)
+
         # Special handling for baseline anchor
         if self.config['anchor_y'] == 'baseline':
             self.anchor_y = 'bottom'
@@ -118,6 +279,42 @@ class Text(Widget):
         else:
             return '<Text Widget text=None>'
 
+    # label properties which prevent composing the text from cached glyphs
+    _glyph_incompatible_properties = ('markup', 'text_size', 'padding_x', 'padding_y', 'line_height',
+                                      'outline_width', 'underline', 'strikethrough')
+
+    def _can_use_glyph_cache(self) -> bool:
+        """Return true if this text can be composed from cached glyphs.
+
+        This is only the case for single line TrueType text without markup,
+        padding, a constrained text box, outlines or underline/strikethrough
+        lines (which span the whole text).
+        """
+        label = self._label
+        return bool(self.mc.glyph_cache and
+                    isinstance(label, McFontLabel) and
+                    not label.markup and
+                    label.text_size[0] is None and
+                    label.text_size[1] is None and
+                    not label.padding_x and
+                    not label.padding_y and
+                    label.line_height == 1.0 and
+                    not label.outline_width and
+                    not label.underline and
+                    not label.strikethrough)
+
+    def _update_glyph_cache_use(self, *args) -> None:
+        """Switch between the glyph cache and the label texture when label properties changed."""
+        del args
+        glyph_cache = self.mc.glyph_cache if self._can_use_glyph_cache() else None
+        if glyph_cache is self._glyph_cache:
+            return
+
+        self._glyph_cache = glyph_cache
+        if self._template is not None:
+            # render the current text with the other method
+            self._show_text(self._label.text)
+
     def _draw_widget(self, *args):
         """Draws the image (draws a rectangle using the image texture)."""
         del args
@@ -128,20 +325,33 @@ class Text(Widget):
         # changes don't introduce gradual shifts in position.
         pos = self.calculate_rounded_position(anchor)
 
-        if (self._label.text and not self.rectangle) or (self.rectangle and not self._label.text):
+        if not self._label.text:
+            mode = None
+        elif self._glyph_layout is not None:
+            mode = 'glyphs'
+        else:
+            mode = 'texture'
+
+        if mode != self._drawn_mode:
             # only create instructions once
             # unfortunately, we also have to redo it when the text becomes empty or non-empty
+            self._drawn_mode = mode
             self.canvas.clear()
+            self.rectangle = None
+            self.glyph_translate = None
+            self.glyph_rectangles = list()
             with self.canvas:
                 self.color_instruction = Color(*self.color)
                 self.rotate = Rotate(angle=self.rotation, origin=anchor)
                 self.scale_instruction = Scale(self.scale)
                 self.scale_instruction.origin = anchor
 
-                if self._label.text:
+                if mode == 'texture':
                     self.rectangle = Rectangle(pos=pos, size=self.size, texture=self._label.texture)
-                else:
-                    self.rectangle = None
+                elif mode == 'glyphs':
+                    # glyphs are positioned relative to the widget
+                    self.glyph_translate = Translate(pos[0], pos[1])
+                    self._glyph_layout_changed = True
 
         if self.rotate:
             self.rotate.origin = anchor
@@ -155,11 +365,66 @@ class Text(Widget):
             self.rectangle.pos = pos
             self.rectangle.size = self.size
             self.rectangle.texture = self._label.texture
+        if self.glyph_translate:
+            self.glyph_translate.xy = pos
+            if self._glyph_layout_changed:
+                self._update_glyph_rectangles()
         if self.color_instruction:
             self.color_instruction.rgba = self.color
 
+    def _update_glyph_rectangles(self) -> None:
+        """Update only the glyph rectangles which changed since the last layout."""
+        self._glyph_layout_changed = False
+        rectangles = self.glyph_rectangles
+        for index, (texture, x) in enumerate(self._glyph_layout):
+            if index < len(rectangles):
+                rectangle = rectangles[index]
+                if rectangle.texture is not texture:
+                    rectangle.texture = texture
+                    rectangle.size = texture.size
+                if rectangle.pos[0] != x:
+                    rectangle.pos = (x, 0)
+            else:
+                rectangle = Rectangle(pos=(x, 0), size=texture.size, texture=texture)
+                self.canvas.add(rectangle)
+                rectangles.append(rectangle)
+
+        for rectangle in rectangles[len(self._glyph_layout):]:
+            self.canvas.remove(rectangle)
+        del rectangles[len(self._glyph_layout):]
+
+    def _layout_glyphs(self, text: str) -> None:
+        """Compose the text from cached glyph textures."""
+        label = self._label
+        font_key = (label.font_name, label.font_size, label.bold, label.italic,
+                    label.font_hinting, label.font_blended, label.font_kerning)
+        layout = list()
+        width = 0
+        height = 0
+        previous_char = None
+        for char in text:
+            if previous_char is not None:
+                width += self._glyph_cache.get_kerning(font_key, previous_char, char)
+            previous_char = char
+            texture, advance = self._glyph_cache.get_glyph(font_key, char)
+            if texture:
+                layout.append((texture, width))
+                height = max(height, texture.height)
+            width += advance
+
+        self._glyph_layout = layout
+        self._glyph_layout_changed = True
+        if text:
+            self.size = (width, height)
+
     def on_label_texture(self, instance, texture):
         del instance
+        if self._glyph_layout is not None:
+            # font settings changed. relayout the glyphs using the new font
+            self._layout_glyphs(self._label.text)
+            self._draw_widget()
+            return
+
         if texture:
             self.size = texture.size
 
@@ -187,62 +452,69 @@ class Text(Widget):
             # if the text string is not found, put the $ back on
             return '${}'.format(text_string)
 
-    @staticmethod
-    def _get_text_vars(text: str):
-        return var_finder.findall(text)
-
     def _process_text(self, text: str) -> None:
-        for var_string in self._get_text_vars(text):
-            if var_string in self.event_replacements:
-                text = text.replace('({})'.format(var_string),
-                                    str(self.event_replacements[var_string]))
+        self._template = compile_text_template(text)
 
-        if self._get_text_vars(text):
-            # monitors won't be added twice, so it's ok to blindly call this
-            self._setup_variable_monitors(text)
+        # monitors won't be added twice, so it's ok to blindly call this
+        self._setup_variable_monitors(
+            [var_string for var_string in self._template.variables
+             if var_string not in self.event_replacements])
 
-        self.update_vars_in_text(text)
+        self._render_template(kwargs_first=True)
 
     def update_vars_in_text(self, text: str) -> None:
-        for var_string in self._get_text_vars(text):
-            if var_string.startswith('machine|'):
-                try:
-                    text = text.replace('(' + var_string + ')',
-                                        str(self.mc.machine_vars[var_string.split('|')[1]]))
-                except KeyError:
-                    text = text.replace('(' + var_string + ')', '')
-
-            elif self.mc.player:
-                if var_string.startswith('player|'):
-                    text = text.replace('(' + var_string + ')',
-                                        str(self.mc.player[var_string.split('|')[1]]))
-                    continue
-                elif var_string.startswith('player') and '|' in var_string:
-                    player_num, var_name = var_string.lstrip('player').split('|')
-                    try:
-                        value = self.mc.player_list[int(player_num) - 1][
-                            var_name]
-
-                        if value is not None:
-                            text = text.replace('(' + var_string + ')',
-                                                str(value))
-                        else:
-                            text = text.replace('(' + var_string + ')', '')
-                    except IndexError:
-                        text = text.replace('(' + var_string + ')', '')
-                    continue
-                elif self.mc.player.is_player_var(var_string):
-                    text = text.replace('(' + var_string + ')',
-                                        str(self.mc.player[var_string]))
-                    continue
-
-            if var_string in self.event_replacements:
-                text = text.replace('({})'.format(var_string),
-                                    str(self.event_replacements[var_string]))
+        if text != self._template.source:
+            self._template = compile_text_template(text)
+
+        self._render_template(kwargs_first=False)
+
+    def _render_template(self, kwargs_first: bool) -> None:
+        """Render the compiled template and update the label if it changed."""
+        text = ''.join([self._resolve_segment(segment, kwargs_first)
+                        for segment in self._template.segments])
+
+        if text == self._rendered_text:
+            return
 
         self.update_text(text)
+        self._rendered_text = text
+
+    def _resolve_segment(self, segment: tuple, kwargs_first: bool) -> str:
+        kind, var_string, var_name, player_index = segment
+
+        if kind == TEMPLATE_LITERAL:
+            return var_string
+
+        if kwargs_first and var_string in self.event_replacements:
+            return str(self.event_replacements[var_string])
+
+        if kind == TEMPLATE_MACHINE_VAR:
+            try:
+                return str(self.mc.machine_vars[var_name])
+            except KeyError:
+                return ''
+
+        if self.mc.player:
+            if kind == TEMPLATE_PLAYER_VAR:
+                return str(self.mc.player[var_name])
+            elif kind == TEMPLATE_PLAYER_NUM_VAR:
+                try:
+                    value = self.mc.player_list[player_index][var_name]
+                except IndexError:
+                    return ''
+                return str(value) if value is not None else ''
+            elif self.mc.player.is_player_var(var_name):
+                return str(self.mc.player[var_name])
+
+        if var_string in self.event_replacements:
+            return str(self.event_replacements[var_string])
+
+        return '(' + var_string + ')'
 
     def update_text(self, text: str) -> None:
+        # the label may no longer show the last rendered template
+        self._rendered_text = None
+
         if text:
             if self.config['min_digits']:
                 text = text.zfill(self.config['min_digits'])
@@ -260,20 +532,33 @@ class Text(Widget):
             if self.config.get('casing', None) in ('lower', 'upper', 'title', 'capitalize'):
                 text = getattr(text, self.config['casing'])()
 
+        self._show_text(text)
+
+    def _show_text(self, text: str) -> None:
+        """Render the text in the label (or from the glyph cache) and redraw the widget."""
         self._label.text = text
-        self._label.texture_update()
+        if self._glyph_cache and '\n' not in text:
+            # the label does not need to rasterize the text at all
+            self._label.cancel_texture_update()
+            self._layout_glyphs(text)
+        else:
+            self._glyph_layout = None
+            self._label.texture_update()
+            # the text change above also scheduled a texture update for the
+            # next frame which would rasterize the same text again
+            self._label.cancel_texture_update()
         self._draw_widget()
 
     def _player_var_change(self, **kwargs) -> None:
         del kwargs
-        self.update_vars_in_text(self.original_text)
+        self._render_template(kwargs_first=False)
 
     def _machine_var_change(self, **kwargs) -> None:
         del kwargs
-        self.update_vars_in_text(self.original_text)
+        self._render_template(kwargs_first=False)
 
-    def _setup_variable_monitors(self, text: str) -> None:
-        for var_string in self._get_text_vars(text):
+    def _setup_variable_monitors(self, variables: List[str]) -> None:
+        for var_string in variables:
             if '|' not in var_string:
                 self.add_player_var_handler(name=var_string)
                 self.add_current_player_handler()
@@ -305,6 +590,7 @@ class Text(Widget):
         super().prepare_for_removal()
         self.mc.events.remove_handler(self._player_var_change)
         self.mc.events.remove_handler(self._machine_var_change)
+        self._label.release_cached_texture()
 
     @staticmethod
     def group_digits(text: str, separator: str = ',', group_size: int = 3) -> str:
@@ -350,7 +636,14 @@ class Text(Widget):
         return self._label.text
 
     def _set_text(self, text: str) -> None:
-        self._label.text = text
+        # the label no longer shows the last rendered template
+        self._rendered_text = None
+        if self._template is None:
+            # the widget is initializing and renders its template afterwards
+            self._label.text = text
+            return
+
+        self._show_text(text)
 
     text = AliasProperty(_get_text, _set_text)
     '''Text of the label.